@@ -32,11 +32,16 @@ class Config:
     RATELIMIT_DEFAULT = "100 per minute"
     RATELIMIT_STORAGE_URL = "memory://"
 
+    # Key status cache TTL in seconds (CHG-20261016-008)
+    KEY_STATUS_CACHE_TTL = float(os.environ.get("KEYDRIVE_KEY_STATUS_CACHE_TTL", "5"))
+
     # CORS
     CORS_ORIGINS = os.environ.get("KEYDRIVE_CORS_ORIGINS", "*").split(",")
 
     # Update distribution
     UPDATES_DIR = Path(os.environ.get("KEYDRIVE_UPDATES_DIR", str(BASE_DIR / "updates")))
+    # Versioned packages are immutable (CHG-20261016-009; same variable as the Django server)
+    UPDATE_PACKAGE_MAX_AGE = int(os.environ.get("KEYDRIVE_UPDATE_PACKAGE_MAX_AGE", str(365 * 24 * 3600)))
 
     @classmethod
     def validate(cls) -> list[str]:
@@ -29,6 +29,20 @@ CREATE TABLE IF NOT EXISTS seeds (
 CREATE INDEX IF NOT EXISTS idx_seeds_device_id_hash ON seeds(device_id_hash);
 CREATE INDEX IF NOT EXISTS idx_seeds_locked ON seeds(locked);
 
+-- Seed to hardware key association (CHG-20261016-006)
+-- Normalized copy of seeds.key_fingerprints for indexed lockout/unlock
+CREATE TABLE IF NOT EXISTS seed_keys (
+    seed_id INTEGER NOT NULL REFERENCES seeds(id) ON DELETE CASCADE,
+    fingerprint VARCHAR(64) NOT NULL,
+    PRIMARY KEY (seed_id, fingerprint)
+);
+
+CREATE INDEX IF NOT EXISTS ix_seed_keys_fingerprint ON seed_keys(fingerprint);
+
+-- One-time migration from the JSON column (idempotent)
+INSERT OR IGNORE INTO seed_keys (seed_id, fingerprint)
+    SELECT seeds.id, json_each.value FROM seeds, json_each(seeds.key_fingerprints);
+
 -- Hardware key status tracking
 CREATE TABLE IF NOT EXISTS keys (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -81,3 +95,18 @@ CREATE TRIGGER IF NOT EXISTS ensure_single_current_update
 BEGIN
     UPDATE updates SET is_current = 0 WHERE is_current = 1 AND id != NEW.id;
 END;
+
+-- Delta packages between releases (CHG-20261016-010)
+CREATE TABLE IF NOT EXISTS update_deltas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    from_version VARCHAR(32) NOT NULL,
+    to_version VARCHAR(32) NOT NULL,
+    package_filename VARCHAR(256) NOT NULL,
+    package_hash VARCHAR(128) NOT NULL,  -- SHA-512 hash
+    package_size INTEGER NOT NULL,  -- Size in bytes
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (from_version, to_version)
+);
+
+CREATE INDEX IF NOT EXISTS idx_update_deltas_from ON update_deltas(from_version);
+CREATE INDEX IF NOT EXISTS idx_update_deltas_to ON update_deltas(to_version);
@@ -0,0 +1,102 @@
+"""Cached hardware key status lookups.
+
+CHG-20261016-008: Seed store/retrieve checked key status with one query per
+fingerprint. KeyStatusCache resolves all of a request's fingerprints with a
+single IN (...) query for the ones not already cached, and keeps results for
+a short TTL. The keys blueprint invalidates entries when it changes a key's
+status, so this process never serves a stale status after its own writes;
+other worker processes converge within KEY_STATUS_CACHE_TTL seconds.
+
+Development-only component - not deployed to KeyDrive devices.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterable
+
+from flask import current_app
+
+from models import Key
+
+# Default status for fingerprints without a Key record
+DEFAULT_STATUS = "active"
+
+# Entry count above which expired entries are swept on insert
+MAX_ENTRIES = 10000
+
+
+class KeyStatusCache:
+    """Per-app fingerprint -> status cache with TTL and explicit invalidation."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0  # Bumped on invalidation; discards in-flight lookups
+
+    def statuses(self, fingerprints: Iterable[str]) -> dict[str, str]:
+        """
+        Return the status of each fingerprint (one query for all cache misses).
+
+        Args:
+            fingerprints: Fingerprints to look up
+
+        Returns:
+            {fingerprint: status}; unknown keys are DEFAULT_STATUS
+        """
+        wanted = list(dict.fromkeys(fingerprints))
+        now = time.monotonic()
+        result: dict[str, str] = {}
+        missing: list[str] = []
+
+        with self._lock:
+            generation = self._generation
+            for fp in wanted:
+                entry = self._entries.get(fp)
+                if entry is not None and entry[1] > now:
+                    result[fp] = entry[0]
+                else:
+                    missing.append(fp)
+
+        if missing:
+            found = dict(
+                Key.query.with_entities(Key.fingerprint, Key.status).filter(Key.fingerprint.in_(missing)).all()
+            )
+            expires = time.monotonic() + self.ttl
+            with self._lock:
+                store = generation == self._generation
+                if store and len(self._entries) > MAX_ENTRIES:
+                    self._entries = {k: v for k, v in self._entries.items() if v[1] > now}
+                for fp in missing:
+                    status = found.get(fp, DEFAULT_STATUS)
+                    if store:
+                        self._entries[fp] = (status, expires)
+                    result[fp] = status
+
+        return result
+
+    def first_with_status(self, fingerprints: Iterable[str], status: str) -> str | None:
+        """Return the first fingerprint (in input order) whose key has the given status."""
+        fingerprints = list(fingerprints)
+        statuses = self.statuses(fingerprints)
+        return next((fp for fp in fingerprints if statuses.get(fp) == status), None)
+
+    def invalidate(self, fingerprint: str | None = None) -> None:
+        """Drop one fingerprint (or everything) from the cache."""
+        with self._lock:
+            self._generation += 1
+            if fingerprint is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(fingerprint, None)
+
+
+def get_key_status_cache() -> KeyStatusCache:
+    """Return the current app's key status cache, creating it on first use."""
+    cache = current_app.extensions.get("key_status_cache")
+    if cache is None:
+        cache = KeyStatusCache(ttl=current_app.config.get("KEY_STATUS_CACHE_TTL", 5))
+        current_app.extensions["key_status_cache"] = cache
+    return cache
@@ -4,9 +4,14 @@ Django Admin configuration for KeyDrive Server.
 CHG-20251221-013: Admin site for all models.
 """
 
+import json
+
+from django import forms
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
 
+from . import key_status
 from .models import Device, Key, Seed, Update, VerificationLog
 
 
@@ -56,10 +61,26 @@ class DeviceAdmin(admin.ModelAdmin):
         self.message_user(request, f"{count} device(s) unlocked.")
 
 
+class SeedAdminForm(forms.ModelForm):
+    """Seed form that validates key_fingerprints as a JSON array of strings."""
+
+    class Meta:
+        model = Seed
+        fields = "__all__"
+
+    def clean_key_fingerprints(self):
+        try:
+            return Seed.parse_fingerprints(self.cleaned_data["key_fingerprints"])
+        except ValueError as e:
+            raise forms.ValidationError(str(e))
+
+
 @admin.register(Seed)
 class SeedAdmin(admin.ModelAdmin):
     """Admin for Seed model."""
 
+    form = SeedAdminForm
+
     list_display = [
         "id",
         "device_hash_short",
@@ -88,6 +109,14 @@ class SeedAdmin(admin.ModelAdmin):
 
     fingerprints_short.short_description = "Key Fingerprints"
 
+    def save_model(self, request, obj, form, change):
+        """CHG-20261016-007: Route key_fingerprints through set_fingerprints (SeedKey rows)."""
+        fingerprints = form.cleaned_data.get("key_fingerprints", [])
+        with transaction.atomic():
+            obj.key_fingerprints = json.dumps(fingerprints)
+            super().save_model(request, obj, form, change)
+            obj.set_fingerprints(fingerprints)
+
     def locked_display(self, obj):
         """Display lock status with color."""
         if obj.locked:
@@ -158,25 +187,29 @@ class KeyAdmin(admin.ModelAdmin):
     def mark_lost(self, request, queryset):
         from django.utils import timezone
 
+        fingerprints = list(queryset.values_list("fingerprint", flat=True))
         count = queryset.update(status="lost", reported_at=timezone.now())
+        key_status.invalidate(*fingerprints)  # Bulk update bypasses post_save
         # Lock seeds using these keys
-        for key in queryset:
-            Seed.objects.filter(key_fingerprints__contains=key.fingerprint).update(locked=True)
+        Seed.objects.filter(key_links__fingerprint__in=fingerprints).update(locked=True)
         self.message_user(request, f"{count} key(s) marked as lost.")
 
     @admin.action(description="❌ Mark as REVOKED")
     def mark_revoked(self, request, queryset):
         from django.utils import timezone
 
+        fingerprints = list(queryset.values_list("fingerprint", flat=True))
         count = queryset.update(status="revoked", reported_at=timezone.now())
+        key_status.invalidate(*fingerprints)  # Bulk update bypasses post_save
         # Lock seeds using these keys
-        for key in queryset:
-            Seed.objects.filter(key_fingerprints__contains=key.fingerprint).update(locked=True)
+        Seed.objects.filter(key_links__fingerprint__in=fingerprints).update(locked=True)
         self.message_user(request, f"{count} key(s) revoked.")
 
     @admin.action(description="✓ Mark as ACTIVE")
     def mark_active(self, request, queryset):
+        fingerprints = list(queryset.values_list("fingerprint", flat=True))
         count = queryset.update(status="active", reported_at=None)
+        key_status.invalidate(*fingerprints)  # Bulk update bypasses post_save
         self.message_user(request, f"{count} key(s) marked as active.")
 
 
@@ -9,3 +9,13 @@ class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api"
     verbose_name = "KeyDrive API"
+
+    def ready(self):
+        """Publish key status invalidations (CHG-20261016-008)."""
+        from django.db.models.signals import post_delete, post_save
+
+        from .key_status import _on_key_changed
+        from .models import Key
+
+        post_save.connect(_on_key_changed, sender=Key, dispatch_uid="key_status_post_save")
+        post_delete.connect(_on_key_changed, sender=Key, dispatch_uid="key_status_post_delete")
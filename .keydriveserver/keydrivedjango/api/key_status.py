@@ -0,0 +1,101 @@
+"""
+Cached hardware key status lookups.
+
+CHG-20261016-008: Seed create/retrieve checked key status with one query per
+fingerprint. Statuses are now resolved with a single fingerprint__in query for
+cache misses and kept in the Django cache for KEY_STATUS_CACHE_TTL seconds.
+Entries are invalidated from Key post_save/post_delete signals (see
+ApiConfig.ready) and explicitly after bulk queryset updates, which bypass
+signals.
+
+Invalidation is race-free within one cache backend, as in the Flask
+KeyStatusCache:
+- It runs on transaction commit (transaction.on_commit), never while the
+  writing transaction can still be read as the old row.
+- Every cache key carries a generation number read before the database
+  query; invalidation bumps the generation, so a lookup that read the old
+  row before the commit stores its result under a key nobody reads again.
+
+Multiple workers: the default cache (CACHES in settings.py) is
+LocMemCache, which is per process. Invalidation then only reaches the
+worker that changed the key; other workers may keep serving the previous
+status for up to KEY_STATUS_CACHE_TTL seconds. Deployments with several
+workers must configure a shared cache backend (DJANGO_CACHE_BACKEND /
+DJANGO_CACHE_LOCATION, e.g. Redis or Memcached).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Key
+
+CACHE_PREFIX = "keydrive:key_status:"
+GENERATION_KEY = f"{CACHE_PREFIX}generation"
+DEFAULT_STATUS = "active"
+
+
+def _cache_key(generation: int, fingerprint: str) -> str:
+    return f"{CACHE_PREFIX}{generation}:{fingerprint}"
+
+
+def _generation() -> int:
+    return cache.get(GENERATION_KEY, 0)
+
+
+def _bump_generation() -> None:
+    if cache.add(GENERATION_KEY, 1, timeout=None):
+        return
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:  # Evicted between add() and incr()
+        cache.add(GENERATION_KEY, 1, timeout=None)
+
+
+def key_statuses(fingerprints) -> dict:
+    """
+    Return {fingerprint: status}; unknown keys are DEFAULT_STATUS.
+
+    At most one database query per call.
+    """
+    wanted = list(dict.fromkeys(fingerprints))
+    # Read before the query: results of a lookup that raced an invalidation are never visible
+    generation = _generation()
+    keys = {fp: _cache_key(generation, fp) for fp in wanted}
+    cached = cache.get_many(list(keys.values()))
+    result = {fp: cached[keys[fp]] for fp in wanted if keys[fp] in cached}
+
+    missing = [fp for fp in wanted if fp not in result]
+    if missing:
+        found = dict(Key.objects.filter(fingerprint__in=missing).values_list("fingerprint", "status"))
+        fresh = {fp: found.get(fp, DEFAULT_STATUS) for fp in missing}
+        cache.set_many(
+            {keys[fp]: value for fp, value in fresh.items()},
+            timeout=getattr(settings, "KEY_STATUS_CACHE_TTL", 5),
+        )
+        result.update(fresh)
+
+    return result
+
+
+def first_with_status(fingerprints, status: str):
+    """Return the first fingerprint (in input order) whose key has the given status, or None."""
+    fingerprints = list(fingerprints)
+    statuses = key_statuses(fingerprints)
+    return next((fp for fp in fingerprints if statuses.get(fp) == status), None)
+
+
+def invalidate(*fingerprints: str) -> None:
+    """
+    Drop cached statuses once the current transaction commits.
+
+    Bumping the generation drops every cached status, not only the given
+    fingerprints; key status changes are rare and entries live seconds.
+    """
+    if fingerprints:
+        transaction.on_commit(_bump_generation)
+
+
+def _on_key_changed(sender, instance, **kwargs):
+    """Signal receiver: invalidate a saved or deleted key."""
+    invalidate(instance.fingerprint)
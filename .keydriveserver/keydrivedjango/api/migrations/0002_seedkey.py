@@ -0,0 +1,50 @@
+# CHG-20261016-007: Indexed seed-to-key association with data migration
+
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_seed_keys(apps, schema_editor):
+    """Populate SeedKey rows from the legacy Seed.key_fingerprints JSON column."""
+    Seed = apps.get_model("api", "Seed")
+    SeedKey = apps.get_model("api", "SeedKey")
+
+    batch = []
+    for seed_id, raw in Seed.objects.values_list("id", "key_fingerprints").iterator():
+        try:
+            fingerprints = json.loads(raw) if raw else []
+        except (ValueError, TypeError):
+            continue
+        for fp in dict.fromkeys(fp for fp in fingerprints if isinstance(fp, str)):
+            batch.append(SeedKey(seed_id=seed_id, fingerprint=fp))
+        if len(batch) >= 1000:
+            SeedKey.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        SeedKey.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeedKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(db_index=True, max_length=64)),
+                ('seed', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='key_links', to='api.seed')),
+            ],
+            options={
+                'verbose_name': 'Seed Key',
+                'verbose_name_plural': 'Seed Keys',
+                'constraints': [models.UniqueConstraint(fields=('seed', 'fingerprint'), name='unique_seed_fingerprint')],
+            },
+        ),
+        migrations.RunPython(backfill_seed_keys, migrations.RunPython.noop),
+    ]
@@ -6,11 +6,14 @@ CHG-20251221-013: Django ORM models migrated from SQLAlchemy.
 Models:
 - Device: Device registration and verification tracking
 - Seed: GPG-encrypted seed storage
+- SeedKey: Indexed seed-to-key association
 - Key: Hardware key status tracking
 - VerificationLog: Audit log of verification attempts
 - Update: Software update metadata
 """
 
+import json
+
 from django.db import models
 
 
@@ -56,6 +59,62 @@ class Seed(models.Model):
     def __str__(self) -> str:
         return f"Seed for {self.device.device_id_hash[:8]}..."
 
+    @staticmethod
+    def parse_fingerprints(value) -> list:
+        """
+        Normalize key fingerprints given as a list or a JSON array string.
+
+        Raises:
+            ValueError: value is not a list of strings
+        """
+        if isinstance(value, str):
+            try:
+                value = json.loads(value) if value.strip() else []
+            except ValueError:
+                raise ValueError("key_fingerprints must be a JSON array of strings")
+        if not isinstance(value, list) or not all(isinstance(fp, str) for fp in value):
+            raise ValueError("key_fingerprints must be a JSON array of strings")
+        return value
+
+    def set_fingerprints(self, fingerprints) -> None:
+        """
+        Replace this seed's key fingerprints (JSON column and SeedKey rows).
+
+        The seed must already be saved. This is the only supported way to
+        change key_fingerprints: key lockout queries SeedKey, not the column.
+        """
+        fingerprints = list(dict.fromkeys(fingerprints))
+        self.key_fingerprints = json.dumps(fingerprints)
+        self.save(update_fields=["key_fingerprints"])
+        self.key_links.exclude(fingerprint__in=fingerprints).delete()
+        SeedKey.objects.bulk_create(
+            [SeedKey(seed=self, fingerprint=fp) for fp in fingerprints],
+            ignore_conflicts=True,
+        )
+
+
+class SeedKey(models.Model):
+    """
+    Seed to hardware key association.
+
+    CHG-20261016-007: Normalized copy of Seed.key_fingerprints, indexed on
+    fingerprint. Replaces key_fingerprints__contains (LIKE '%...%' scans that
+    could also match one fingerprint inside another) for key lockout.
+    """
+
+    seed = models.ForeignKey(Seed, on_delete=models.CASCADE, related_name="key_links")
+    fingerprint = models.CharField(max_length=64, db_index=True)
+
+    class Meta:
+        verbose_name = "Seed Key"
+        verbose_name_plural = "Seed Keys"
+        constraints = [
+            models.UniqueConstraint(fields=["seed", "fingerprint"], name="unique_seed_fingerprint"),
+        ]
+
+    def __str__(self) -> str:
+        return f"SeedKey {self.fingerprint[:8]}... -> seed {self.seed_id}"
+
 
 class Key(models.Model):
     """Hardware key status tracking."""
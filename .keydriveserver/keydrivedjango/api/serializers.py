@@ -4,6 +4,7 @@ DRF Serializers for KeyDrive Server API.
 CHG-20251221-013: Serializers for API endpoints.
 """
 
+from django.db import transaction
 from rest_framework import serializers
 
 from .models import Device, Key, Seed, Update, VerificationLog
@@ -25,10 +26,28 @@ class DeviceSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "first_seen"]
 
 
+class FingerprintListField(serializers.Field):
+    """
+    Seed.key_fingerprints: accepts a list or a JSON array string, renders the stored JSON.
+
+    CHG-20261016-007: Validated into a list so writes go through Seed.set_fingerprints.
+    """
+
+    def to_representation(self, value):
+        return value
+
+    def to_internal_value(self, data):
+        try:
+            return Seed.parse_fingerprints(data)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+
 class SeedSerializer(serializers.ModelSerializer):
     """Serializer for Seed model."""
 
     device_id_hash = serializers.CharField(source="device.device_id_hash", read_only=True)
+    key_fingerprints = FingerprintListField(required=False)
 
     class Meta:
         model = Seed
@@ -43,6 +62,15 @@ class SeedSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at"]
 
+    def update(self, instance, validated_data):
+        """CHG-20261016-007: Keep the indexed SeedKey rows in sync with key_fingerprints."""
+        fingerprints = validated_data.pop("key_fingerprints", None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if fingerprints is not None:
+                instance.set_fingerprints(fingerprints)
+        return instance
+
 
 class SeedCreateSerializer(serializers.Serializer):
     """Serializer for creating seeds."""
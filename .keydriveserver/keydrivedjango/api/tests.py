@@ -0,0 +1,137 @@
+"""
+Tests for seed fingerprints, key lockout and the key status cache.
+
+CHG-20261016-007: report-lost/revoke find seeds through the indexed SeedKey
+rows, so every write to Seed.key_fingerprints must go through
+Seed.set_fingerprints (API create/update and the admin).
+
+CHG-20261016-008: Key status invalidation runs on commit and discards
+lookups that raced it.
+"""
+
+import json
+from unittest.mock import patch
+
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from . import key_status
+from .admin import SeedAdmin, SeedAdminForm
+from .models import Device, Key, Seed
+
+FP_A = "A" * 40
+FP_B = "B" * 40
+
+
+class SeedFingerprintLockoutTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def _store(self, fingerprints):
+        response = self.client.post(
+            "/api/seeds/",
+            {"device_id": "d" * 64, "encrypted_seed": "blob", "key_fingerprints": fingerprints, "salt": "s"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        return Seed.objects.get(device__device_id_hash="d" * 64)
+
+    def _report(self, action, fingerprint):
+        response = self.client.post(f"/api/keys/{action}/", {"fingerprint": fingerprint}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["seeds_locked"]
+
+    def test_report_lost_locks_stored_seed(self):
+        seed = self._store([FP_A])
+        self.assertEqual(self._report("report-lost", FP_A), 1)
+        seed.refresh_from_db()
+        self.assertTrue(seed.locked)
+
+    def test_patch_fingerprints_updates_lockout_links(self):
+        seed = self._store([FP_A])
+        response = self.client.patch(f"/api/seeds/{seed.pk}/", {"key_fingerprints": [FP_B]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.json()["key_fingerprints"]), [FP_B])
+
+        self.assertEqual(self._report("report-lost", FP_A), 0)
+        self.assertEqual(self._report("revoke", FP_B), 1)
+        seed.refresh_from_db()
+        self.assertTrue(seed.locked)
+
+    def test_patch_accepts_json_string_and_rejects_garbage(self):
+        seed = self._store([FP_A])
+        response = self.client.patch(f"/api/seeds/{seed.pk}/", {"key_fingerprints": json.dumps([FP_B])}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(seed.key_links.values_list("fingerprint", flat=True)), [FP_B])
+
+        response = self.client.patch(f"/api/seeds/{seed.pk}/", {"key_fingerprints": "not json"}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(seed.key_links.values_list("fingerprint", flat=True)), [FP_B])
+
+    def test_admin_save_syncs_lockout_links(self):
+        seed = self._store([FP_A])
+        form = SeedAdminForm(
+            instance=seed,
+            data={
+                "device": seed.device.device_id_hash,
+                "encrypted_seed": seed.encrypted_seed,
+                "key_fingerprints": json.dumps([FP_A, FP_B]),
+                "salt": seed.salt,
+            },
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        SeedAdmin(Seed, AdminSite()).save_model(None, form.save(commit=False), form, change=True)
+
+        self.assertEqual(self._report("revoke", FP_B), 1)
+        seed.refresh_from_db()
+        self.assertEqual(json.loads(seed.key_fingerprints), [FP_A, FP_B])
+
+    def test_admin_form_rejects_invalid_fingerprints(self):
+        device = Device.objects.create(device_id_hash="e" * 64)
+        form = SeedAdminForm(
+            data={"device": device.device_id_hash, "encrypted_seed": "blob", "key_fingerprints": "{}", "salt": "s"}
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("key_fingerprints", form.errors)
+
+
+class KeyStatusCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_invalidated_on_commit_only(self):
+        key = Key.objects.create(fingerprint=FP_A)
+        self.assertIsNone(key_status.first_with_status([FP_A], "lost"))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            key.status = "lost"
+            key.save()
+            # Not committed yet: the cached status stays until commit
+            self.assertIsNone(key_status.first_with_status([FP_A], "lost"))
+        self.assertTrue(callbacks)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(key_status.first_with_status([FP_A], "lost"), FP_A)
+
+    def test_lookup_racing_an_invalidation_is_not_cached(self):
+        key = Key.objects.create(fingerprint=FP_A)
+        real_filter = Key.objects.filter
+
+        def stale_filter(**kwargs):
+            # The lookup reads the old row, then the change commits before it caches
+            rows = list(real_filter(**kwargs).values_list("fingerprint", "status"))
+            real_filter(pk=key.pk).update(status="lost")
+            key_status._bump_generation()
+            return _Rows(rows)
+
+        with patch.object(key_status.Key.objects, "filter", side_effect=stale_filter):
+            self.assertEqual(key_status.key_statuses([FP_A]), {FP_A: "active"})
+        self.assertEqual(key_status.key_statuses([FP_A]), {FP_A: "lost"})
+
+
+class _Rows(list):
+    def values_list(self, *fields):
+        return self
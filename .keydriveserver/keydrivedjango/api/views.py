@@ -9,13 +9,16 @@ from datetime import datetime
 from pathlib import Path
 
 from django.conf import settings
-from django.http import FileResponse, Http404
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
 from rest_framework import status, viewsets
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from . import key_status
 from .models import Device, Key, Seed, Update, VerificationLog
 from .serializers import (
     DeviceSerializer,
@@ -230,14 +233,7 @@ class UpdateViewSet(viewsets.ReadOnlyModelViewSet):
         if not file_path.exists():
             raise Http404(f"Update package file not found: {update.package_filename}")
 
-        response = FileResponse(
-            open(file_path, "rb"),
-            content_type="application/zip",
-        )
-        response["Content-Disposition"] = f'attachment; filename="{update.package_filename}"'
-        response["Content-Length"] = update.package_size
-        response["X-Package-Hash"] = update.package_hash
-        return response
+        return package_response(self.request, update, file_path, immutable=self.action != "download_latest")
 
     def _version_less_than(self, v1: str, v2: str) -> bool:
         """Compare version strings (semver-like)."""
@@ -249,6 +245,107 @@ class UpdateViewSet(viewsets.ReadOnlyModelViewSet):
             return False
 
 
+# =============================================================================
+# Update package responses
+# =============================================================================
+
+RANGE_CHUNK_SIZE = 256 * 1024
+
+
+def _parse_range(header: str, size: int):
+    """
+    Parse a single "bytes=start-end" range.
+
+    Returns:
+        (start, end_inclusive), None if absent/multi-range, or "unsatisfiable"
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_s, _, end_s = header[len("bytes=") :].strip().partition("-")
+    try:
+        if start_s:
+            start = int(start_s)
+            end = min(int(end_s), size - 1) if end_s else size - 1
+        else:
+            # Suffix range: last N bytes
+            start, end = max(size - int(end_s), 0), size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        return "unsatisfiable"
+    return (start, end)
+
+
+def _iter_file_range(path: Path, start: int, length: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(RANGE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def package_response(request, update: Update, package_path: Path, immutable: bool = True):
+    """
+    Serve an update package with a strong ETag, Range and conditional GET.
+
+    CHG-20261016-009: The stored SHA-512 is the ETag. If-None-Match answers
+    304; a single Range (guarded by If-Range) answers 206 so interrupted
+    client downloads resume instead of restarting.
+
+    Args:
+        request: Incoming request
+        update: Update record being served
+        package_path: Package file on disk
+        immutable: True for version-addressed URLs (long-lived caching)
+    """
+    etag = f'"{update.package_hash}"'
+    size = package_path.stat().st_size
+
+    conditional = get_conditional_response(request, etag=etag)
+    if conditional is not None:
+        response = conditional
+    else:
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if if_range is None or if_range == etag:
+            byte_range = _parse_range(request.headers.get("Range", ""), size)
+
+        if byte_range == "unsatisfiable":
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+        elif byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                _iter_file_range(package_path, start, end - start + 1),
+                status=206,
+                content_type="application/zip",
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = end - start + 1
+        else:
+            response = FileResponse(
+                open(package_path, "rb"),
+                as_attachment=True,
+                filename=update.package_filename,
+                content_type="application/zip",
+            )
+            response["Content-Length"] = size
+
+    if response.status_code == 206:
+        response["Content-Disposition"] = f'attachment; filename="{update.package_filename}"'
+    response["ETag"] = etag
+    response["Accept-Ranges"] = "bytes"
+    response["X-Package-Hash"] = update.package_hash
+    if immutable:
+        patch_cache_control(response, public=True, max_age=getattr(settings, "UPDATE_PACKAGE_MAX_AGE", 31536000), immutable=True)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
 # =============================================================================
 # Seed Views
 # =============================================================================
@@ -287,35 +384,35 @@ class SeedViewSet(viewsets.ModelViewSet):
 
         # Check key fingerprints for lost status
         fingerprints = key_fingerprints_data if isinstance(key_fingerprints_data, list) else []
-        for fp in fingerprints:
-            key = Key.objects.filter(fingerprint=fp).first()
-            if key and key.status == "lost":
-                return Response(
-                    {"success": False, "message": f"Key {fp[:8]}... is marked as lost", "locked": True},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        fp = key_status.first_with_status(fingerprints, "lost")
+        if fp:
+            return Response(
+                {"success": False, "message": f"Key {fp[:8]}... is marked as lost", "locked": True},
+                status=status.HTTP_403_FORBIDDEN,
+            )
         
         # Get or create device
         device, _ = Device.objects.get_or_create(device_id_hash=device_id_hash)
         
-        # Convert list to JSON string for storage
-        key_fingerprints_json = json.dumps(fingerprints)
-
-        # Check if seed already exists for this device (update or create)
-        existing_seed = Seed.objects.filter(device=device).first()
-        if existing_seed:
-            existing_seed.encrypted_seed = encrypted_seed
-            existing_seed.key_fingerprints = key_fingerprints_json
-            existing_seed.salt = salt
-            existing_seed.locked = False
-            existing_seed.save()
-        else:
-            seed = Seed.objects.create(
-                device=device,
-                encrypted_seed=encrypted_seed,
-                key_fingerprints=key_fingerprints_json,
-                salt=salt,
-            )
+        with transaction.atomic():
+            # Check if seed already exists for this device (update or create)
+            existing_seed = Seed.objects.filter(device=device).first()
+            if existing_seed:
+                existing_seed.encrypted_seed = encrypted_seed
+                existing_seed.salt = salt
+                existing_seed.locked = False
+                existing_seed.save()
+                seed = existing_seed
+            else:
+                seed = Seed.objects.create(
+                    device=device,
+                    encrypted_seed=encrypted_seed,
+                    key_fingerprints="[]",
+                    salt=salt,
+                )
+
+            # Stores the JSON column and the indexed SeedKey rows
+            seed.set_fingerprints(fingerprints)
 
         return Response(
             {"success": True, "message": "Seed stored"},
@@ -345,13 +442,12 @@ class SeedViewSet(viewsets.ModelViewSet):
 
         # Check if any associated keys are locked
         fingerprints = json.loads(seed.key_fingerprints) if seed.key_fingerprints else []
-        for fp in fingerprints:
-            key = Key.objects.filter(fingerprint=fp).first()
-            if key and key.status == "lost":
-                return Response(
-                    {"error": f"Associated key {fp[:8]}... is locked", "locked": True},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        fp = key_status.first_with_status(fingerprints, "lost")
+        if fp:
+            return Response(
+                {"error": f"Associated key {fp[:8]}... is locked", "locked": True},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
         return Response(
             {
@@ -467,9 +563,8 @@ class KeyViewSet(viewsets.ModelViewSet):
         key.reason = reason
         key.save()
 
-        # Lock all seeds that use this key
-        affected_seeds = Seed.objects.filter(key_fingerprints__contains=fingerprint)
-        seeds_locked = affected_seeds.update(locked=True)
+        # Lock all seeds that use this key (CHG-20261016-007: indexed SeedKey lookup)
+        seeds_locked = Seed.objects.filter(key_links__fingerprint=fingerprint).update(locked=True)
 
         return Response(
             {
@@ -496,9 +591,8 @@ class KeyViewSet(viewsets.ModelViewSet):
         key.reason = reason
         key.save()
 
-        # Lock all seeds that use this key
-        affected_seeds = Seed.objects.filter(key_fingerprints__contains=fingerprint)
-        seeds_locked = affected_seeds.update(locked=True)
+        # Lock all seeds that use this key (CHG-20261016-007: indexed SeedKey lookup)
+        seeds_locked = Seed.objects.filter(key_links__fingerprint=fingerprint).update(locked=True)
 
         return Response(
             {
@@ -719,12 +813,7 @@ class UpdateViewSet(viewsets.ModelViewSet):
             return Response({"error": "Update package not found"}, status=status.HTTP_404_NOT_FOUND)
 
         try:
-            return FileResponse(
-                open(package_path, "rb"),
-                as_attachment=True,
-                filename=update.package_filename,
-                content_type="application/zip",
-            )
+            return package_response(self.request, update, package_path, immutable=self.action != "download_latest")
         except Exception as e:
             return Response({"error": f"Error serving file: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -131,3 +131,20 @@ CORS_ALLOW_ALL_ORIGINS = DEBUG  # Allow all origins in development
 UPDATES_DIR = BASE_DIR.parent / "updates"  # Points to .keydriveserver/updates
 TRUSTED_SIGNERS = os.environ.get("TRUSTED_SIGNERS", "").split(",")
 EXPECTED_HASHES = {}  # Populated at runtime from manifest
+
+# CHG-20261016-009: Cache lifetime of versioned (immutable) update packages in seconds;
+# same variable as the Flask server's UPDATE_PACKAGE_MAX_AGE
+UPDATE_PACKAGE_MAX_AGE = int(os.environ.get("KEYDRIVE_UPDATE_PACKAGE_MAX_AGE", str(365 * 24 * 3600)))
+
+# CHG-20261016-008: Key status cache TTL in seconds (default cache backend)
+KEY_STATUS_CACHE_TTL = int(os.environ.get("KEY_STATUS_CACHE_TTL", "5"))
+
+# CHG-20261016-008: LocMemCache is per process. With several workers, point this at a
+# shared backend (Redis, Memcached, database) so key status invalidations reach all of
+# them; otherwise other workers can serve a stale status for KEY_STATUS_CACHE_TTL seconds.
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", ""),
+    }
+}
@@ -6,8 +6,9 @@ Development-only component - not deployed to KeyDrive devices.
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from flask_sqlalchemy import SQLAlchemy
 
@@ -22,6 +23,26 @@ def init_db(app: Flask) -> None:
     db.init_app(app)
     with app.app_context():
         db.create_all()
+        migrate_seed_keys()
+
+
+def migrate_seed_keys() -> int:
+    """
+    Backfill seed_keys from the legacy Seed.key_fingerprints JSON column.
+
+    CHG-20261016-006: Idempotent; only seeds without any seed_keys rows are
+    touched, so this is a no-op on every start after the first.
+
+    Returns:
+        Number of seeds migrated
+    """
+    unmigrated = Seed.query.filter(~Seed.key_links.any(), Seed.key_fingerprints.notin_(["", "[]"])).all()
+    for seed in unmigrated:
+        fingerprints = json.loads(seed.key_fingerprints) if seed.key_fingerprints else []
+        seed.set_fingerprints(fingerprints)
+    if unmigrated:
+        db.session.commit()
+    return len(unmigrated)
 
 
 class Device(db.Model):
@@ -59,11 +80,39 @@ class Seed(db.Model):
 
     # Relationships
     device = db.relationship("Device", back_populates="seeds")
+    key_links = db.relationship("SeedKey", back_populates="seed", cascade="all, delete-orphan")
+
+    def set_fingerprints(self, fingerprints: Iterable[str]) -> None:
+        """Set key fingerprints (JSON column and indexed seed_keys rows)."""
+        fingerprints = list(dict.fromkeys(fingerprints))
+        self.key_fingerprints = json.dumps(fingerprints)
+        self.key_links = [SeedKey(fingerprint=fp) for fp in fingerprints]
 
     def __repr__(self) -> str:
         return f"<Seed device={self.device_id_hash[:8]}... locked={self.locked}>"
 
 
+class SeedKey(db.Model):
+    """
+    Seed to hardware key association.
+
+    CHG-20261016-006: Normalized copy of Seed.key_fingerprints, indexed on
+    fingerprint, so key lockout and unlock are set-based UPDATEs instead of
+    decoding every seed's JSON in Python.
+    """
+
+    __tablename__ = "seed_keys"
+
+    seed_id = db.Column(db.Integer, db.ForeignKey("seeds.id", ondelete="CASCADE"), primary_key=True)
+    fingerprint = db.Column(db.String(64), primary_key=True, index=True)
+
+    # Relationships
+    seed = db.relationship("Seed", back_populates="key_links")
+
+    def __repr__(self) -> str:
+        return f"<SeedKey seed={self.seed_id} key={self.fingerprint[:8]}...>"
+
+
 class Key(db.Model):
     """Hardware key status tracking."""
 
@@ -118,3 +167,26 @@ class Update(db.Model):
 
     def __repr__(self) -> str:
         return f"<Update {self.version} current={self.is_current}>"
+
+
+class UpdateDelta(db.Model):
+    """
+    Delta package between two releases.
+
+    CHG-20261016-010: Built by tools/create_update_package.py from the release
+    manifests; carries only changed/added files plus a delete list.
+    """
+
+    __tablename__ = "update_deltas"
+    __table_args__ = (db.UniqueConstraint("from_version", "to_version", name="uq_update_delta_versions"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    from_version = db.Column(db.String(32), nullable=False, index=True)
+    to_version = db.Column(db.String(32), nullable=False, index=True)
+    package_filename = db.Column(db.String(256), nullable=False)
+    package_hash = db.Column(db.String(128), nullable=False)  # SHA-512 hash
+    package_size = db.Column(db.Integer, nullable=False)  # Size in bytes
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<UpdateDelta {self.from_version} -> {self.to_version}>"
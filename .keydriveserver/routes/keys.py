@@ -9,12 +9,13 @@ When a key is marked as lost, all associated devices/seeds are blocked.
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 
 from flask import current_app, jsonify, request
+from sqlalchemy import select
 
-from models import Device, Key, Seed, db
+from key_status import get_key_status_cache
+from models import Device, Key, Seed, SeedKey, db
 from routes import keys_bp
 
 
@@ -68,21 +69,18 @@ def report_key_lost():
     key.reported_at = datetime.utcnow()
     key.reason = reason
 
-    # Lock all seeds that use this key
-    affected_devices = 0
-    seeds = Seed.query.all()
-    for seed in seeds:
-        fingerprints = json.loads(seed.key_fingerprints) if seed.key_fingerprints else []
-        if fingerprint in fingerprints:
-            seed.locked = True
-            affected_devices += 1
-
-            # Also lock the device
-            device = Device.query.filter_by(device_id_hash=seed.device_id_hash).first()
-            if device:
-                device.locked = True
+    # Lock all seeds that use this key, and their devices
+    # CHG-20261016-006: Set-based UPDATEs driven by the seed_keys fingerprint index
+    seed_ids = select(SeedKey.seed_id).where(SeedKey.fingerprint == fingerprint)
+    affected_devices = Seed.query.filter(Seed.id.in_(seed_ids)).update(
+        {Seed.locked: True}, synchronize_session=False
+    )
+    Device.query.filter(
+        Device.device_id_hash.in_(select(Seed.device_id_hash).where(Seed.id.in_(seed_ids)))
+    ).update({Device.locked: True}, synchronize_session=False)
 
     db.session.commit()
+    get_key_status_cache().invalidate(fingerprint)
 
     return jsonify({"success": True, "message": "Key marked as lost", "affected_devices": affected_devices})
 
@@ -164,30 +162,27 @@ def unlock_key():
     key.status = "active"
     key.reason = f"Unlocked on {datetime.utcnow().isoformat()}"
 
-    # Unlock seeds that ONLY use this key (seeds with multiple keys stay locked if any key is lost)
-    affected_devices = 0
-    seeds = Seed.query.filter_by(locked=True).all()
-    for seed in seeds:
-        fingerprints = json.loads(seed.key_fingerprints) if seed.key_fingerprints else []
-
-        # Check if all keys for this seed are now active
-        all_active = True
-        for fp in fingerprints:
-            other_key = Key.query.filter_by(fingerprint=fp).first()
-            if other_key and other_key.status != "active":
-                all_active = False
-                break
-
-        if all_active:
-            seed.locked = False
-            affected_devices += 1
-
-            # Also unlock the device
-            device = Device.query.filter_by(device_id_hash=seed.device_id_hash).first()
-            if device:
-                device.locked = False
+    # Unlock locked seeds using this key whose keys are now all active
+    # (seeds with multiple keys stay locked if any other key is still lost)
+    # CHG-20261016-006: Set-based UPDATEs; devices first, while the seeds are still locked
+    db.session.flush()
+    still_blocked = (
+        select(SeedKey.seed_id).join(Key, Key.fingerprint == SeedKey.fingerprint).where(Key.status != "active")
+    )
+    seed_ids = select(SeedKey.seed_id).where(
+        SeedKey.fingerprint == fingerprint, SeedKey.seed_id.not_in(still_blocked)
+    )
+    Device.query.filter(
+        Device.device_id_hash.in_(
+            select(Seed.device_id_hash).where(Seed.locked.is_(True), Seed.id.in_(seed_ids))
+        )
+    ).update({Device.locked: False}, synchronize_session=False)
+    affected_devices = Seed.query.filter(Seed.locked.is_(True), Seed.id.in_(seed_ids)).update(
+        {Seed.locked: False}, synchronize_session=False
+    )
 
     db.session.commit()
+    get_key_status_cache().invalidate(fingerprint)
 
     return jsonify({"success": True, "message": "Key unlocked", "affected_devices": affected_devices})
 
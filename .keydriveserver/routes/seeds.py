@@ -13,7 +13,8 @@ from datetime import datetime
 
 from flask import current_app, jsonify, request
 
-from models import Device, Key, Seed, db
+from key_status import get_key_status_cache
+from models import Device, Seed, db
 from routes import seeds_bp
 
 
@@ -51,11 +52,10 @@ def store_seed():
     if not salt:
         return jsonify({"success": False, "message": "Missing salt"}), 400
 
-    # Check if any associated keys are locked
-    for fp in key_fingerprints:
-        key = Key.query.filter_by(fingerprint=fp).first()
-        if key and key.status == "lost":
-            return jsonify({"success": False, "message": f"Key {fp[:8]}... is marked as lost", "locked": True}), 403
+    # Check if any associated keys are locked (one batched, cached lookup)
+    fp = get_key_status_cache().first_with_status(key_fingerprints, "lost")
+    if fp:
+        return jsonify({"success": False, "message": f"Key {fp[:8]}... is marked as lost", "locked": True}), 403
 
     # Get or create device record
     device = Device.query.filter_by(device_id_hash=device_id_hash).first()
@@ -69,7 +69,7 @@ def store_seed():
     if existing_seed:
         # Update existing seed
         existing_seed.encrypted_seed = encrypted_seed
-        existing_seed.key_fingerprints = json.dumps(key_fingerprints)
+        existing_seed.set_fingerprints(key_fingerprints)
         existing_seed.salt = salt
         existing_seed.created_at = datetime.utcnow()
         existing_seed.locked = False
@@ -78,9 +78,9 @@ def store_seed():
         seed = Seed(
             device_id_hash=device_id_hash,
             encrypted_seed=encrypted_seed,
-            key_fingerprints=json.dumps(key_fingerprints),
             salt=salt,
         )
+        seed.set_fingerprints(key_fingerprints)
         db.session.add(seed)
 
     db.session.commit()
@@ -116,10 +116,9 @@ def get_seed(device_id: str):
 
     # Check if any associated keys are locked
     fingerprints = json.loads(seed.key_fingerprints) if seed.key_fingerprints else []
-    for fp in fingerprints:
-        key = Key.query.filter_by(fingerprint=fp).first()
-        if key and key.status == "lost":
-            return jsonify({"error": f"Associated key {fp[:8]}... is locked", "locked": True}), 403
+    fp = get_key_status_cache().first_with_status(fingerprints, "lost")
+    if fp:
+        return jsonify({"error": f"Associated key {fp[:8]}... is locked", "locked": True}), 403
 
     return jsonify(
         {
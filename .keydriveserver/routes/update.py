@@ -10,7 +10,7 @@ from pathlib import Path
 
 from flask import current_app, jsonify, send_from_directory
 
-from models import Update
+from models import Update, UpdateDelta
 from routes import update_bp
 
 
@@ -59,8 +59,16 @@ def check_for_update(current_version: str):
             "update_available": true/false,
             "latest_version": "1.0.0",
             "can_upgrade": true/false,
-            "download_url": "/api/update/download/<version>"
+            "download_url": "/api/update/download/<version>",
+            "package_type": "full" | "delta",
+            "package_hash": "sha512 hash of the advertised package",
+            "package_size": 12345,
+            "full_download_url": "/api/update/download/<version>"
         }
+
+    CHG-20261016-010: When a delta from current_version to the latest release
+    exists and is smaller than the full package, download_url points at it.
+    full_download_url always names the full package (fallback).
     """
     latest = Update.query.filter_by(is_current=True).first()
 
@@ -75,12 +83,40 @@ def check_for_update(current_version: str):
     if latest.min_version:
         can_upgrade = _version_gte(current_version, latest.min_version)
 
+    if not update_available:
+        return jsonify(
+            {
+                "update_available": False,
+                "latest_version": latest.version,
+                "can_upgrade": can_upgrade,
+                "download_url": None,
+            }
+        )
+
+    full_url = f"/api/update/download/{latest.version}"
+    package = {
+        "package_type": "full",
+        "download_url": full_url,
+        "package_hash": latest.package_hash,
+        "package_size": latest.package_size,
+    }
+
+    delta = UpdateDelta.query.filter_by(from_version=current_version, to_version=latest.version).first()
+    if delta and delta.package_size < latest.package_size:
+        package = {
+            "package_type": "delta",
+            "download_url": f"/api/update/delta/{delta.from_version}/{delta.to_version}",
+            "package_hash": delta.package_hash,
+            "package_size": delta.package_size,
+        }
+
     return jsonify(
         {
-            "update_available": update_available,
+            "update_available": True,
             "latest_version": latest.version,
             "can_upgrade": can_upgrade,
-            "download_url": f"/api/update/download/{latest.version}" if update_available else None,
+            "full_download_url": full_url,
+            **package,
         }
     )
 
@@ -111,7 +147,8 @@ def download_latest_update():
     if not package_path.exists():
         return jsonify({"error": "Update package not found"}), 404
 
-    return send_from_directory(str(updates_dir), latest.package_filename, as_attachment=True)
+    # "latest" changes over time: cacheable, but always revalidated via ETag
+    return _send_package(updates_dir, latest.package_filename, latest.package_hash, immutable=False)
 
 
 @update_bp.route("/download/<version>", methods=["GET"])
@@ -140,7 +177,35 @@ def download_update(version: str):
     if not package_path.exists():
         return jsonify({"error": "Update package not found"}), 404
 
-    return send_from_directory(str(updates_dir), update.package_filename, as_attachment=True)
+    return _send_package(updates_dir, update.package_filename, update.package_hash, immutable=True)
+
+
+@update_bp.route("/delta/<from_version>/<to_version>", methods=["GET"])
+def download_delta(from_version: str, to_version: str):
+    """
+    Download a delta package between two releases.
+
+    CHG-20261016-010: Contains only files changed or added since from_version
+    plus delta.json (base hashes and delete list) for client-side verification.
+
+    Args:
+        from_version: Version installed on the client
+        to_version: Target version
+
+    Returns:
+        The delta package file
+    """
+    delta = UpdateDelta.query.filter_by(from_version=from_version, to_version=to_version).first()
+
+    if not delta:
+        return jsonify({"error": f"No delta from {from_version} to {to_version}"}), 404
+
+    updates_dir = Path(current_app.config.get("UPDATES_DIR", "updates"))
+
+    if not (updates_dir / delta.package_filename).exists():
+        return jsonify({"error": "Delta package not found"}), 404
+
+    return _send_package(updates_dir, delta.package_filename, delta.package_hash, immutable=True)
 
 
 @update_bp.route("/history", methods=["GET"])
@@ -169,6 +234,36 @@ def get_update_history():
     )
 
 
+def _send_package(updates_dir: Path, package_filename: str, package_hash: str, immutable: bool):
+    """
+    Send an update package with HTTP caching and range support.
+
+    CHG-20261016-009: The stored SHA-512 is the strong ETag. Werkzeug's
+    conditional handling answers If-None-Match with 304 and Range/If-Range
+    with 206, so interrupted client downloads resume instead of restarting.
+
+    Args:
+        updates_dir: Directory holding update packages
+        package_filename: Package file inside updates_dir
+        package_hash: SHA-512 of the package (strong ETag)
+        immutable: True for version-addressed URLs (content never changes)
+    """
+    response = send_from_directory(
+        str(updates_dir),
+        package_filename,
+        as_attachment=True,
+        conditional=True,
+        etag=package_hash,
+        max_age=current_app.config.get("UPDATE_PACKAGE_MAX_AGE", 31536000) if immutable else 0,
+    )
+    response.headers["X-Package-Hash"] = package_hash
+    if immutable:
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+
 def _version_gte(version_a: str, version_b: str) -> bool:
     """Check if version_a >= version_b (simple semver comparison)."""
     try:
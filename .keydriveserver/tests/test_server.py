@@ -6,6 +6,7 @@ Development-only component - not deployed to KeyDrive devices.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sys
 from pathlib import Path
@@ -16,7 +17,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from server import create_app
-from models import db, Device, Seed, Key, Update
+from models import db, Device, Seed, Key, Update, UpdateDelta
 
 
 @pytest.fixture
@@ -214,6 +215,63 @@ class TestKeysEndpoint:
         assert data["locked"] is True
 
 
+    def test_unlock_keeps_seed_locked_while_other_key_lost(self, client, init_database):
+        """Test unlock only releases seeds whose keys are all active again."""
+        for device, fingerprints in (("dev_a", ["key_a", "key_b"]), ("dev_b", ["key_a"])):
+            client.post(
+                "/api/seeds",
+                json={"device_id": device, "encrypted_seed": "data", "key_fingerprints": fingerprints, "salt": "s"},
+                content_type="application/json",
+            )
+        for fp in ("key_a", "key_b"):
+            client.post(
+                "/api/keys/report-lost",
+                json={"fingerprint": fp, "reason": "Lost", "admin_token": "test-admin-token"},
+                content_type="application/json",
+            )
+
+        response = client.post(
+            "/api/keys/unlock",
+            json={"fingerprint": "key_a", "admin_token": "test-admin-token"},
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+        assert response.get_json()["affected_devices"] == 1
+        assert Seed.query.filter_by(device_id_hash="dev_a").first().locked is True
+        assert Seed.query.filter_by(device_id_hash="dev_b").first().locked is False
+        assert Device.query.filter_by(device_id_hash="dev_b").first().locked is False
+
+    def test_seed_keys_backfilled_from_json(self, client, init_database):
+        """Test migrate_seed_keys() indexes legacy JSON fingerprints."""
+        from models import SeedKey, migrate_seed_keys
+
+        db.session.add(Device(device_id_hash="legacy_dev"))
+        db.session.add(
+            Seed(device_id_hash="legacy_dev", encrypted_seed="d", key_fingerprints='["fp1", "fp2"]', salt="s")
+        )
+        db.session.commit()
+
+        assert migrate_seed_keys() == 1
+        assert migrate_seed_keys() == 0
+        assert sorted(k.fingerprint for k in SeedKey.query.all()) == ["fp1", "fp2"]
+
+    def test_store_seed_rejected_after_key_lost(self, client, init_database):
+        """Test the key status cache is invalidated when a key is reported lost."""
+        seed = {"encrypted_seed": "data", "key_fingerprints": ["cached_key"], "salt": "s"}
+        response = client.post("/api/seeds", json={"device_id": "dev_1", **seed}, content_type="application/json")
+        assert response.status_code == 200  # cached_key now cached as active
+
+        client.post(
+            "/api/keys/report-lost",
+            json={"fingerprint": "cached_key", "reason": "Lost", "admin_token": "test-admin-token"},
+            content_type="application/json",
+        )
+
+        response = client.post("/api/seeds", json={"device_id": "dev_2", **seed}, content_type="application/json")
+        assert response.status_code == 403
+        assert response.get_json()["locked"] is True
+
+
 class TestUpdateEndpoint:
     """Test update distribution endpoints."""
 
@@ -242,6 +300,81 @@ class TestUpdateEndpoint:
         assert data["update_available"] is True
         assert data["latest_version"] == "1.0.0"
 
+    def test_download_etag_range_and_conditional(self, client, init_database, app, tmp_path):
+        """Test package downloads send a strong ETag and honour Range / If-None-Match."""
+        payload = bytes(range(256)) * 40
+        package_hash = hashlib.sha512(payload).hexdigest()
+        (tmp_path / "update-2.0.0.zip").write_bytes(payload)
+        app.config["UPDATES_DIR"] = tmp_path
+        db.session.add(
+            Update(
+                version="2.0.0",
+                package_filename="update-2.0.0.zip",
+                package_hash=package_hash,
+                package_size=len(payload),
+                is_current=True,
+            )
+        )
+        db.session.commit()
+
+        response = client.get("/api/update/download/2.0.0")
+        assert response.status_code == 200
+        assert response.headers["ETag"] == f'"{package_hash}"'
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert "immutable" in response.headers["Cache-Control"]
+        assert response.data == payload
+
+        response = client.get("/api/update/download/2.0.0", headers={"If-None-Match": f'"{package_hash}"'})
+        assert response.status_code == 304
+
+        response = client.get(
+            "/api/update/download/2.0.0", headers={"Range": "bytes=1000-", "If-Range": f'"{package_hash}"'}
+        )
+        assert response.status_code == 206
+        assert response.data == payload[1000:]
+
+        response = client.get("/api/update/download/latest")
+        assert response.status_code == 200
+        assert "no-cache" in response.headers["Cache-Control"]
+
+    def test_check_advertises_smaller_delta(self, client, init_database, app, tmp_path):
+        """Test check offers a delta from the client's version and serves it."""
+        (tmp_path / "delta.zip").write_bytes(b"delta")
+        app.config["UPDATES_DIR"] = tmp_path
+        db.session.add(
+            Update(
+                version="2.0.0",
+                package_filename="update-2.0.0.zip",
+                package_hash="full",
+                package_size=100000,
+                is_current=True,
+            )
+        )
+        db.session.add(
+            UpdateDelta(
+                from_version="1.0.0",
+                to_version="2.0.0",
+                package_filename="delta.zip",
+                package_hash="d" * 128,
+                package_size=5,
+            )
+        )
+        db.session.commit()
+
+        data = client.get("/api/update/check/1.0.0").get_json()
+        assert data["package_type"] == "delta"
+        assert data["download_url"] == "/api/update/delta/1.0.0/2.0.0"
+        assert data["full_download_url"] == "/api/update/download/2.0.0"
+
+        data = client.get("/api/update/check/1.5.0").get_json()
+        assert data["package_type"] == "full"
+        assert data["download_url"] == "/api/update/download/2.0.0"
+
+        response = client.get("/api/update/delta/1.0.0/2.0.0")
+        assert response.status_code == 200
+        assert response.data == b"delta"
+        assert response.headers["X-Package-Hash"] == "d" * 128
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
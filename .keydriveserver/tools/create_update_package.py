@@ -10,6 +10,8 @@ This script:
 3. Calculates SHA-512 hash
 4. Registers the update in the server database
 5. Stores the package in the server's updates/ directory
+6. Writes a per-file manifest (SHA-256) next to the package and builds delta
+   packages from every earlier release manifest (CHG-20261016-010)
 
 Usage:
     python create_update_package.py --version 1.0.0 --changelog "Initial release"
@@ -20,6 +22,7 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import json
 import os
 import shutil
 import sqlite3
@@ -28,7 +31,7 @@ import zipfile
 from datetime import datetime
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Set, Tuple
 
 # Determine paths
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -38,6 +41,20 @@ SMARTDRIVE_ROOT = PROJECT_ROOT / ".smartdrive"
 UPDATES_DIR = SERVER_ROOT / "updates"
 DATABASE_PATH = SERVER_ROOT / "keydrive.db"
 
+# Root-level files deployed alongside .smartdrive/
+ROOT_FILES = [
+    "constants.py",
+    "variables.py",
+    "README.md",
+    "GUI_README.md",
+    "requirements.txt",
+]
+
+# Delta packages (CHG-20261016-010) - format shared with .smartdrive/core/update_delta.py
+MANIFEST_SUFFIX = ".manifest.json"
+DELTA_META_NAME = "delta.json"
+DELTA_SCHEMA_VERSION = 1
+
 
 # =============================================================================
 # DEPLOYMENT_EXCLUDE_PATTERNS from SSOT
@@ -175,10 +192,29 @@ def collect_files(source_dir: Path) -> List[Path]:
     return files
 
 
+def package_entries(source_dir: Path) -> List[Tuple[Path, str]]:
+    """
+    List the files of an update package with their archive names.
+
+    Args:
+        source_dir: Root directory containing .smartdrive
+
+    Returns:
+        List of (file path, POSIX archive name)
+    """
+    entries = [(f, f.relative_to(source_dir).as_posix()) for f in collect_files(source_dir / ".smartdrive")]
+    for fname in ROOT_FILES:
+        fpath = source_dir / fname
+        if fpath.exists():
+            entries.append((fpath, fname))
+    return entries
+
+
 def create_zip_package(
     source_dir: Path,
     output_path: Path,
     version: str,
+    entries: List[Tuple[Path, str]] | None = None,
 ) -> tuple[int, int]:
     """
     Create a zip package with proper structure.
@@ -187,11 +223,13 @@ def create_zip_package(
         source_dir: Root directory containing .smartdrive
         output_path: Path for output zip file
         version: Version string for logging
+        entries: Precomputed package_entries(source_dir)
     
     Returns:
         Tuple of (total_files, total_size_bytes)
     """
-    files = collect_files(source_dir / ".smartdrive")
+    if entries is None:
+        entries = package_entries(source_dir)
     total_files = 0
     total_size = 0
     
@@ -200,33 +238,89 @@ def create_zip_package(
     print(f"Output: {output_path}")
     
     with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Add .smartdrive directory contents
-        for file_path in files:
-            rel_path = file_path.relative_to(source_dir)
-            zf.write(file_path, rel_path)
+        for file_path, arcname in entries:
+            zf.write(file_path, arcname)
             total_files += 1
             total_size += file_path.stat().st_size
-            
-        # Add root-level files that should be deployed
-        root_files = [
-            "constants.py",
-            "variables.py", 
-            "README.md",
-            "GUI_README.md",
-            "requirements.txt",
-        ]
-        
-        for fname in root_files:
-            fpath = source_dir / fname
-            if fpath.exists():
-                zf.write(fpath, fname)
-                total_files += 1
-                total_size += fpath.stat().st_size
     
     print(f"  Included {total_files} files ({total_size / 1024:.1f} KB)")
     return total_files, total_size
 
 
+def build_manifest(version: str, entries: List[Tuple[Path, str]]) -> dict:
+    """
+    Build the per-file manifest of a release.
+
+    Returns:
+        {"version": ..., "files": {arcname: {"sha256": ..., "size": ...}}}
+    """
+    files = {}
+    for file_path, arcname in entries:
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                sha256.update(chunk)
+        files[arcname] = {"sha256": sha256.hexdigest(), "size": file_path.stat().st_size}
+    return {"version": version, "files": files}
+
+
+def manifest_path(output_dir: Path, version: str) -> Path:
+    """Manifest file written next to keydrive-update-<version>.zip."""
+    return output_dir / f"keydrive-update-{version}{MANIFEST_SUFFIX}"
+
+
+def load_previous_manifests(output_dir: Path, version: str) -> List[dict]:
+    """Load manifests of all other releases in output_dir."""
+    manifests = []
+    for path in sorted(output_dir.glob(f"keydrive-update-*{MANIFEST_SUFFIX}")):
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"  WARNING: Skipping unreadable manifest {path.name}: {e}")
+            continue
+        if manifest.get("version") and manifest["version"] != version:
+            manifests.append(manifest)
+    return manifests
+
+
+def create_delta_package(
+    old_manifest: dict,
+    new_manifest: dict,
+    entries: List[Tuple[Path, str]],
+    output_path: Path,
+) -> Tuple[int, int]:
+    """
+    Create a delta zip from old_manifest's release to new_manifest's release.
+
+    The zip carries changed/added files plus DELTA_META_NAME with the SHA-256
+    of every unchanged file (the base the client must already have), of every
+    carried file, and the list of files to delete.
+
+    Returns:
+        Tuple of (changed_files, deleted_files)
+    """
+    old_files = {a: m["sha256"] for a, m in old_manifest["files"].items()}
+    new_files = {a: m["sha256"] for a, m in new_manifest["files"].items()}
+
+    changed = {a: h for a, h in new_files.items() if old_files.get(a) != h}
+    meta = {
+        "schema_version": DELTA_SCHEMA_VERSION,
+        "from_version": old_manifest["version"],
+        "to_version": new_manifest["version"],
+        "base": {a: h for a, h in new_files.items() if a not in changed},
+        "files": changed,
+        "delete": sorted(set(old_files) - set(new_files)),
+    }
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for file_path, arcname in entries:
+            if arcname in changed:
+                zf.write(file_path, arcname)
+        zf.writestr(DELTA_META_NAME, json.dumps(meta, indent=2, sort_keys=True))
+
+    return len(changed), len(meta["delete"])
+
+
 def calculate_hash(file_path: Path) -> str:
     """Calculate SHA-512 hash of a file."""
     sha512 = hashlib.sha512()
@@ -312,6 +406,83 @@ def register_update(
     print(f"  Registered in database (is_current={set_current})")
 
 
+def register_delta(
+    db_path: Path,
+    from_version: str,
+    to_version: str,
+    package_filename: str,
+    package_hash: str,
+    package_size: int,
+) -> None:
+    """Register a delta package in the database (replacing an older build)."""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS update_deltas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            from_version TEXT NOT NULL,
+            to_version TEXT NOT NULL,
+            package_filename TEXT NOT NULL,
+            package_hash TEXT NOT NULL,
+            package_size INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            UNIQUE (from_version, to_version)
+        )
+    """)
+    cursor.execute(
+        """
+        INSERT OR REPLACE INTO update_deltas (from_version, to_version, package_filename,
+                                              package_hash, package_size, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (from_version, to_version, package_filename, package_hash, package_size, datetime.utcnow().isoformat()),
+    )
+
+    conn.commit()
+    conn.close()
+
+
+def create_deltas(
+    output_dir: Path,
+    db_path: Path,
+    new_manifest: dict,
+    entries: List[Tuple[Path, str]],
+    full_size: int,
+) -> int:
+    """
+    Build and register delta packages from every earlier release manifest.
+
+    Deltas that are not smaller than the full package are discarded.
+
+    Returns:
+        Number of deltas registered
+    """
+    version = new_manifest["version"]
+    created = 0
+
+    for old_manifest in load_previous_manifests(output_dir, version):
+        old_version = old_manifest["version"]
+        delta_filename = f"keydrive-delta-{old_version}-to-{version}.zip"
+        delta_path = output_dir / delta_filename
+
+        changed, deleted = create_delta_package(old_manifest, new_manifest, entries, delta_path)
+        delta_size = delta_path.stat().st_size
+        if delta_size >= full_size:
+            delta_path.unlink()
+            print(f"  Delta {old_version} -> {version}: not smaller than full package, skipped")
+            continue
+
+        register_delta(db_path, old_version, version, delta_filename, calculate_hash(delta_path), delta_size)
+        created += 1
+        print(
+            f"  Delta {old_version} -> {version}: {changed} changed, {deleted} deleted "
+            f"({delta_size / 1024:.1f} KB)"
+        )
+
+    return created
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Create update package for KeyDrive server",
@@ -362,6 +533,11 @@ Examples:
         default=DATABASE_PATH,
         help=f"Path to server database (default: {DATABASE_PATH})",
     )
+    parser.add_argument(
+        "--no-deltas",
+        action="store_true",
+        help="Do not build delta packages from earlier releases",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -391,13 +567,18 @@ Examples:
         print(f"Would create: {output_path}")
         files = collect_files(args.source / ".smartdrive")
         print(f"Would include {len(files)} files from .smartdrive/")
+        if not args.no_deltas:
+            previous = load_previous_manifests(args.output_dir, args.version)
+            print(f"Would build {len(previous)} delta package(s)")
         return
     
     # Create zip package
+    entries = package_entries(args.source)
     total_files, total_size = create_zip_package(
         args.source,
         output_path,
         args.version,
+        entries,
     )
     
     # Calculate hash
@@ -417,10 +598,16 @@ Examples:
         args.min_version,
         args.set_current,
     )
+
+    # Manifest and deltas from earlier releases
+    manifest = build_manifest(args.version, entries)
+    deltas = 0 if args.no_deltas else create_deltas(args.output_dir, args.database, manifest, entries, package_size)
+    manifest_path(args.output_dir, args.version).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
     
     print(f"\n✅ Update package created successfully!")
     print(f"   File: {output_path}")
     print(f"   Version: {args.version}")
+    print(f"   Deltas: {deltas}")
     if args.set_current:
         print(f"   Status: CURRENT (will be served at /api/update/download/latest)")
 
@@ -1,15 +1,21 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import glob
+import os
+
 # Import constants for configurable naming
 GUI_EXE_NAME = 'KeyDriveGUI'
 
+# Translation catalogs are imported by name on first use of a language
+LOCALE_MODULES = ['locales.' + os.path.basename(p)[:-3] for p in glob.glob('locales/*_*.py')]
+
 
 a = Analysis(
     ['gui_launcher.py'],
     pathex=['scripts'],
     binaries=[],
     datas=[('static', 'static'), ('scripts', 'scripts')],
-    hiddenimports=['PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets'],
+    hiddenimports=['PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets'] + LOCALE_MODULES,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
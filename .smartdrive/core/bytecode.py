@@ -0,0 +1,361 @@
+# core/bytecode.py - SINGLE SOURCE OF TRUTH for precompiled bytecode bundles
+"""
+Precompiled bytecode bundles for cold starts from the drive.
+
+CHG-20261016-016: Deployments ship only .py sources (__pycache__ is in
+DEPLOYMENT_EXCLUDE_PATTERNS), so every launch compiled gui.py, gui_i18n.py,
+setup.py and core/* again - and on read-only or slow media usually could not
+write the cache back.
+
+deploy/update now build one bundle per interpreter (cache tag) covering
+core/, scripts/ and the locales/ translation catalogs (CHG-20261016-019) in
+FileNames.BYTECODE_DIR:
+
+    bytecode/bytecode-cpython-311.zip    marshalled code objects (stored, not deflated)
+    bytecode/bytecode-cpython-311.json   bundle SHA-256, magic number, source digests
+
+Launchers call install_bundle(). The bundle is used only if:
+- it was built for this interpreter (cache tag and bytecode magic),
+- its SHA-256 matches the record, and
+- the integrity manifest, when present, lists the same SHA-256 (a signed
+  manifest therefore covers the code that actually runs).
+
+Modules are still found through the normal path finder, so __file__ and
+tracebacks point at the real sources; only compilation is skipped. Each
+module's source is checked against the recorded digest (stat key first,
+same racy-clean rule as core/integrity.py); a changed source is compiled
+normally.
+
+Usage:
+    from core.bytecode import build_bundles, install_bundle
+
+    build_bundles(deploy_root)          # deploy/update
+    install_bundle(deploy_root)         # launcher, before importing the GUI
+"""
+
+import hashlib
+import importlib.machinery
+import importlib.util
+import io
+import json
+import logging
+import marshal
+import os
+import subprocess
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.constants import FileNames
+from core.limits import Limits
+
+logger = logging.getLogger("SmartDrive.bytecode")
+
+BYTECODE_SCHEMA_VERSION = 1
+
+# Source trees compiled into the bundle (relative to the deploy root);
+# locales/ holds the per-language catalogs loaded by gui_i18n
+BUNDLED_TREES = ("core", "scripts", "locales")
+
+
+def bundle_name(cache_tag: Optional[str] = None) -> str:
+    """Bundle file name for an interpreter cache tag (default: this interpreter)."""
+    return f"bytecode-{cache_tag or sys.implementation.cache_tag}.zip"
+
+
+def bundle_path(deploy_root: Path, cache_tag: Optional[str] = None) -> Path:
+    return Path(deploy_root) / FileNames.BYTECODE_DIR / bundle_name(cache_tag)
+
+
+def _record_path(bundle: Path) -> Path:
+    return bundle.with_suffix(".json")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _stat_key(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _sources(deploy_root: Path) -> Dict[str, Path]:
+    """rel POSIX path -> source file for every bundled module."""
+    sources = {}
+    for tree in BUNDLED_TREES:
+        base = deploy_root / tree
+        if not base.is_dir():
+            continue
+        for path in base.rglob("*.py"):
+            rel = path.relative_to(deploy_root)
+            if "__pycache__" in rel.parts:
+                continue
+            sources[rel.as_posix()] = path
+    return sources
+
+
+def _load_record(bundle: Path) -> Optional[dict]:
+    try:
+        record = json.loads(_record_path(bundle).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or record.get("schema_version") != BYTECODE_SCHEMA_VERSION:
+        return None
+    return record
+
+
+# ============================================================
+# Build
+# ============================================================
+
+
+def build_bundle(deploy_root: Path) -> Path:
+    """
+    Compile the BUNDLED_TREES (core/, scripts/, locales/) under deploy_root for this interpreter.
+
+    Code for sources whose digest is unchanged since the previous bundle
+    is reused; only changed sources are compiled. Sources that do not
+    compile are left out (imported from source as before).
+
+    Returns:
+        Path of the bundle
+    """
+    from core.config import write_file_atomic
+
+    deploy_root = Path(deploy_root)
+    bundle = bundle_path(deploy_root)
+    magic = importlib.util.MAGIC_NUMBER.hex()
+
+    previous_code: Dict[str, bytes] = {}
+    previous = _load_record(bundle)
+    if previous and previous.get("magic") == magic:
+        try:
+            with zipfile.ZipFile(bundle) as zf:
+                previous_code = {name: zf.read(name) for name in zf.namelist()}
+        except (OSError, zipfile.BadZipFile):
+            previous_code = {}
+
+    started = time.perf_counter()
+    compiled = 0
+    entries: Dict[str, dict] = {}
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+        for rel, path in sorted(_sources(deploy_root).items()):
+            source = path.read_bytes()
+            digest = _sha256(source)
+            member = rel + "c"
+            old = (previous or {}).get("sources", {}).get(rel)
+            data = previous_code.get(member) if old and old.get("sha256") == digest else None
+            if data is None:
+                try:
+                    code = compile(source, str(path), "exec", dont_inherit=True)
+                except (SyntaxError, ValueError) as e:
+                    logger.warning(f"Not bundled (does not compile): {rel}: {e}")
+                    continue
+                data = marshal.dumps(code)
+                compiled += 1
+            zf.writestr(member, data)
+            entries[rel] = {"sha256": digest, "stat": _stat_key(path)}
+
+    data = buffer.getvalue()
+    bundle.parent.mkdir(parents=True, exist_ok=True)
+    write_file_atomic(bundle, data)
+    record = {
+        "schema_version": BYTECODE_SCHEMA_VERSION,
+        "cache_tag": sys.implementation.cache_tag,
+        "magic": magic,
+        "bundle_sha256": _sha256(data),
+        "written_ns": time.time_ns(),
+        "sources": entries,
+    }
+    write_file_atomic(_record_path(bundle), json.dumps(record, indent=1, sort_keys=True))
+    logger.info(
+        f"Bytecode bundle {bundle.name}: {len(entries)} modules ({compiled} compiled) "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return bundle
+
+
+def _venv_pythons(deploy_root: Path) -> List[Path]:
+    """Interpreters of the drive's virtual environments that run on this OS."""
+    candidates = []
+    for venv in (FileNames.VENV_DIR_WIN, FileNames.VENV_DIR_LINUX, FileNames.VENV_DIR_MAC, FileNames.VENV_DIR_LEGACY):
+        if os.name == "nt":
+            candidates.append(deploy_root / venv / "Scripts" / "python.exe")
+        else:
+            candidates.append(deploy_root / venv / "bin" / "python")
+    return [p for p in candidates if p.exists()]
+
+
+def build_bundles(deploy_root: Path) -> List[Path]:
+    """
+    Build the bundle for this interpreter and for each drive venv interpreter.
+
+    Failures are logged, never raised: without a bundle the launchers
+    simply compile from source.
+
+    Returns:
+        Paths of the bundles built
+    """
+    deploy_root = Path(deploy_root)
+    built = []
+    try:
+        built.append(build_bundle(deploy_root))
+    except OSError as e:
+        logger.warning(f"Bytecode bundle not built: {e}")
+
+    snippet = (
+        "import sys; sys.path.insert(0, sys.argv[1]); "
+        "from core.bytecode import build_bundle; print(build_bundle(sys.argv[1]))"
+    )
+    for python in _venv_pythons(deploy_root):
+        try:
+            result = subprocess.run(
+                [str(python), "-c", snippet, str(deploy_root)],
+                capture_output=True,
+                text=True,
+                timeout=Limits.BYTECODE_BUILD_TIMEOUT,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Bytecode bundle not built with {python}: {e}")
+            continue
+        path = Path(result.stdout.strip()) if result.returncode == 0 else None
+        if path and path not in built:
+            built.append(path)
+        elif result.returncode != 0:
+            logger.warning(f"Bytecode bundle not built with {python}: {result.stderr.strip()[-200:]}")
+    return built
+
+
+# ============================================================
+# Load
+# ============================================================
+
+
+class BytecodeBundle:
+    """A verified bundle: code objects by source path."""
+
+    def __init__(self, deploy_root: Path, record: dict, code: Dict[str, bytes]):
+        self.deploy_root = Path(deploy_root).resolve()
+        self.record = record
+        self._code = code
+
+    def code_for(self, origin: str) -> Optional[bytes]:
+        """Marshalled code for a source file, or None if not bundled or the source changed."""
+        try:
+            rel = Path(origin).resolve().relative_to(self.deploy_root).as_posix()
+        except ValueError:
+            return None
+        entry = self.record["sources"].get(rel)
+        data = self._code.get(rel + "c")
+        if entry is None or data is None:
+            return None
+
+        key = _stat_key(Path(origin))
+        racy = key is not None and key[1] >= self.record.get("written_ns", 0) - Limits.INTEGRITY_INDEX_RACY_WINDOW_NS
+        if key is None or key != entry.get("stat") or racy:
+            try:
+                if _sha256(Path(origin).read_bytes()) != entry["sha256"]:
+                    return None
+            except OSError:
+                return None
+        return data
+
+
+class _BundleLoader(importlib.machinery.SourceFileLoader):
+    """Source loader that takes code from the bundle instead of compiling."""
+
+    def __init__(self, fullname: str, path: str, data: bytes):
+        super().__init__(fullname, path)
+        self._data = data
+
+    def get_code(self, fullname):
+        code = marshal.loads(self._data)
+        try:
+            import _imp
+
+            _imp._fix_co_filename(code, self.path)  # Drive letter may differ from build time
+        except (ImportError, AttributeError):
+            pass
+        return code
+
+
+class BundleFinder:
+    """Meta path finder: normal path lookup, bundled code for bundled sources."""
+
+    def __init__(self, bundle: BytecodeBundle):
+        self.bundle = bundle
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is None or not isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+            return spec
+        data = self.bundle.code_for(spec.origin)
+        if data is not None:
+            spec.loader = _BundleLoader(fullname, spec.origin, data)
+        return spec
+
+    def invalidate_caches(self):
+        pass
+
+
+def load_bundle(deploy_root: Path) -> Optional[BytecodeBundle]:
+    """
+    Load and verify this interpreter's bundle.
+
+    Returns:
+        BytecodeBundle, or None if absent, stale, corrupt or not covered by
+        the integrity manifest
+    """
+    deploy_root = Path(deploy_root)
+    bundle = bundle_path(deploy_root)
+    record = _load_record(bundle)
+    if record is None:
+        return None
+    if record.get("magic") != importlib.util.MAGIC_NUMBER.hex():
+        logger.info(f"Bytecode bundle {bundle.name} was built for another interpreter build")
+        return None
+    try:
+        data = bundle.read_bytes()
+    except OSError:
+        return None
+    digest = _sha256(data)
+    if digest != record.get("bundle_sha256"):
+        logger.warning(f"Bytecode bundle {bundle.name} does not match its record; ignored")
+        return None
+
+    from core.integrity import Integrity
+
+    launcher_root = deploy_root.parent
+    signed = Integrity.manifest_entries(launcher_root)
+    if signed is not None and signed.get(f"{FileNames.BYTECODE_DIR}/{bundle.name}") != digest:
+        logger.info(f"Bytecode bundle {bundle.name} is not covered by the integrity manifest; ignored")
+        return None
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            code = {name: zf.read(name) for name in zf.namelist()}
+    except zipfile.BadZipFile:
+        return None
+    return BytecodeBundle(deploy_root, record, code)
+
+
+def install_bundle(deploy_root: Path) -> Optional[BytecodeBundle]:
+    """Load the bundle and route imports of bundled sources through it (once per process)."""
+    root = Path(deploy_root).resolve()
+    for finder in sys.meta_path:
+        if isinstance(finder, BundleFinder) and finder.bundle.deploy_root == root:
+            return finder.bundle
+    bundle = load_bundle(deploy_root)
+    if bundle is None:
+        return None
+    sys.meta_path.insert(0, BundleFinder(bundle))
+    logger.debug(f"Bytecode bundle active: {len(bundle.record['sources'])} modules")
+    return bundle
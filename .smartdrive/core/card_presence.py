@@ -0,0 +1,262 @@
+# core/card_presence.py - SINGLE SOURCE OF TRUTH for smartcard (YubiKey) presence
+"""
+Cached smartcard presence and identity, invalidated by USB hotplug.
+
+CHG-20261016-022: secrets._check_yubikey_presence, veracrypt_cli's CPW gate,
+setup.detect_yubikey/get_inserted_card_identity and mount.py's readiness
+check each spawned `gpg --card-status` (1-2 s), sometimes back to back, and
+every CPW in the on-demand secrets loop paid a full round trip. They now
+share one cached answer:
+
+- One `gpg --no-tty --with-colons --card-status` probe fills the cache with
+  presence, serial and subkey fingerprints. Concurrent callers share it.
+- Linux: a NETLINK_KOBJECT_UEVENT socket delivers kernel USB add/remove
+  events; any USB hotplug invalidates the cache, so a present card stays
+  cached until a device changes.
+- Elsewhere (or without netlink): a present card is trusted for
+  CARD_PRESENCE_CACHE_TTL seconds.
+- An absent card is never cached: it is the error path, and re-probing
+  notices an inserted key (or a recovered scdaemon) at once.
+
+Usage:
+    from core.card_presence import get_card_presence
+
+    status = get_card_presence().status()
+    if status.present:
+        print(status.serial, status.enc_fpr)
+"""
+
+import logging
+import socket
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from core.limits import Limits
+
+# Logger for card presence operations
+_card_logger = logging.getLogger("SmartDrive.card_presence")
+
+# linux/netlink.h: kernel uevents, multicast group 1 = events from the kernel
+NETLINK_KOBJECT_UEVENT = 15
+_UEVENT_KERNEL_GROUP = 1
+
+# Hotplug actions that may add or remove a smartcard
+_HOTPLUG_ACTIONS = {"add", "remove", "bind", "unbind"}
+
+
+@dataclass(frozen=True)
+class CardStatus:
+    """Result of one `gpg --card-status` probe."""
+
+    present: bool
+    error: str = ""
+    serial: Optional[str] = None
+    sig_fpr: Optional[str] = None
+    enc_fpr: Optional[str] = None
+    auth_fpr: Optional[str] = None
+    checked_at: float = 0.0  # time.monotonic() of the probe
+
+
+def parse_card_status_colons(output: str) -> Tuple[Optional[str], Tuple[Optional[str], ...]]:
+    """
+    Parse `gpg --with-colons --card-status` output.
+
+    Returns:
+        (serial, (sig_fpr, enc_fpr, auth_fpr)); missing values are None
+    """
+    serial = None
+    fingerprints = []
+    for line in output.split("\n"):
+        parts = line.split(":")
+        record_type = parts[0]
+        # serial:34397658:
+        if record_type == "serial" and len(parts) > 1:
+            serial = parts[1].strip() or None
+        # fpr:SIG_FPR:ENC_FPR:AUTH_FPR:
+        elif record_type == "fpr" and len(parts) > 1:
+            for i in range(1, min(4, len(parts))):
+                fpr = parts[i].strip().upper()
+                if fpr and len(fpr) >= 32:
+                    fingerprints.append(fpr)
+    fingerprints += [None] * (3 - len(fingerprints))
+    return serial, tuple(fingerprints[:3])
+
+
+def probe_card_status() -> CardStatus:
+    """Run `gpg --card-status` once (BUG-20251218-007: always with --no-tty)."""
+    now = time.monotonic()
+    try:
+        result = subprocess.run(
+            ["gpg", "--no-tty", "--with-colons", "--card-status"],
+            capture_output=True,
+            timeout=Limits.GPG_CARD_STATUS_TIMEOUT,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    except FileNotFoundError:
+        return CardStatus(False, "GPG not installed or not in PATH", checked_at=now)
+    except subprocess.TimeoutExpired:
+        return CardStatus(False, "GPG card status timed out (YubiKey may be unresponsive)", checked_at=now)
+    except Exception as e:
+        return CardStatus(False, f"Error checking YubiKey: {e}", checked_at=now)
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        if "no card" in stderr.lower() or "card error" in stderr.lower():
+            return CardStatus(False, "No YubiKey/smartcard detected", checked_at=now)
+        return CardStatus(False, f"GPG card status failed: {stderr[:100]}", checked_at=now)
+
+    serial, (sig_fpr, enc_fpr, auth_fpr) = parse_card_status_colons(result.stdout.decode("utf-8", errors="replace"))
+    return CardStatus(True, "", serial, sig_fpr, enc_fpr, auth_fpr, checked_at=now)
+
+
+def _is_usb_hotplug(message: bytes) -> bool:
+    """True if a kernel uevent is a USB device add/remove."""
+    fields = dict(item.split("=", 1) for item in message.decode("utf-8", errors="replace").split("\0") if "=" in item)
+    return fields.get("SUBSYSTEM") == "usb" and fields.get("ACTION") in _HOTPLUG_ACTIONS
+
+
+class CardPresenceService:
+    """
+    Caches the inserted card's status; USB hotplug invalidates it.
+
+    The hotplug watcher starts with the first query. status() returns the
+    cached answer when it is still valid and probes otherwise.
+    """
+
+    def __init__(self, probe=probe_card_status, use_netlink: Optional[bool] = None):
+        """
+        Initialize card presence service.
+
+        Args:
+            probe: Probe function returning a CardStatus (tests)
+            use_netlink: Force the hotplug backend on/off (default: Linux only)
+        """
+        self._probe = probe
+        self._use_netlink = hasattr(socket, "AF_NETLINK") if use_netlink is None else use_netlink
+        self._lock = threading.Lock()  # Serializes probes: concurrent callers share one
+        self._status: Optional[CardStatus] = None
+        self._generation = 0  # Bumped by every invalidation
+        self._watcher: Optional[threading.Thread] = None
+        self._hotplug_active = False
+        self._stop_event = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def backend(self) -> str:
+        """Cache invalidation backend: "netlink" (USB hotplug events) or "poll" (TTL)."""
+        return "netlink" if self._hotplug_active else "poll"
+
+    def status(self, refresh: bool = False) -> CardStatus:
+        """
+        Return the card status, probing only if the cache is not valid.
+
+        Args:
+            refresh: Ignore the cache and probe now
+        """
+        self._ensure_watcher()
+        if not refresh:
+            cached = self._valid_status()
+            if cached is not None:
+                return cached
+
+        with self._lock:
+            # Another caller may have probed while we waited for the lock
+            if not refresh:
+                cached = self._valid_status()
+                if cached is not None:
+                    return cached
+            generation = self._generation
+            status = self._probe()
+            # Drop the result if a hotplug event arrived during the probe
+            if generation == self._generation:
+                self._status = status
+            return status
+
+    def is_present(self) -> Tuple[bool, str]:
+        """(present, error_message), the shape of the legacy presence checks."""
+        status = self.status()
+        return status.present, status.error
+
+    def invalidate(self) -> None:
+        """Forget the cached status (hotplug, agent restart, card operations)."""
+        self._generation += 1
+        self._status = None
+
+    def stop(self) -> None:
+        """Stop the hotplug watcher."""
+        self._stop_event.set()
+        self._hotplug_active = False
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _valid_status(self) -> Optional[CardStatus]:
+        status = self._status
+        if status is None or not status.present:
+            return None
+        if self._hotplug_active:
+            return status
+        # Polling fallback: trust a present card briefly
+        if time.monotonic() - status.checked_at < Limits.CARD_PRESENCE_CACHE_TTL:
+            return status
+        return None
+
+    def _ensure_watcher(self) -> None:
+        if self._watcher is not None or not self._use_netlink:
+            return
+        with self._lock:
+            if self._watcher is not None:
+                return
+            try:
+                sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+                sock.bind((0, _UEVENT_KERNEL_GROUP))
+                sock.settimeout(Limits.CARD_PRESENCE_NETLINK_TIMEOUT)
+            except (OSError, AttributeError) as e:
+                _card_logger.debug(f"USB hotplug events unavailable, using polling fallback: {e}")
+                self._use_netlink = False
+                return
+            self._hotplug_active = True
+            self._watcher = threading.Thread(target=self._watch, args=(sock,), name="CardHotplug", daemon=True)
+            self._watcher.start()
+
+    def _watch(self, sock: socket.socket) -> None:
+        """Invalidate the cache on every USB add/remove uevent."""
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    message = sock.recv(8192)
+                except socket.timeout:
+                    continue
+                if _is_usb_hotplug(message):
+                    _card_logger.debug("USB hotplug event, card status invalidated")
+                    self.invalidate()
+        except OSError as e:
+            _card_logger.warning(f"USB hotplug watcher failed, using polling fallback: {e}")
+        finally:
+            self._hotplug_active = False
+            self.invalidate()
+            sock.close()
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+_service: Optional[CardPresenceService] = None
+_service_lock = threading.Lock()
+
+
+def get_card_presence() -> CardPresenceService:
+    """Return the process-wide card presence service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = CardPresenceService()
+        return _service
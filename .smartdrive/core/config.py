@@ -23,6 +23,7 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+from core import startup_profile
 from core.constants import ConfigKeys, Defaults
 from core.limits import Limits
 
@@ -371,6 +372,7 @@ def load_config(config_path: Path) -> Tuple[Dict[str, Any], ConfigMigrationResul
         _config_logger.info(f"Config migration required, writing changes")
         write_config_atomic(config_path, migrated_config)
 
+    startup_profile.mark_once(startup_profile.MILESTONE_CONFIG)
     return migrated_config, result
 
 
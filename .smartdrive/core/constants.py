@@ -532,6 +532,18 @@ class FileNames:
     HASH_FILE = "scripts.sha256"
     SIGNATURE_FILE = "scripts.sha256.sig"
 
+    # CHG-20261016-011: Incremental sync manifest (in the deployed .smartdrive root)
+    SYNC_MANIFEST_JSON = ".sync_manifest.json"
+
+    # CHG-20261016-014: Rollback snapshot store (in the deployed .smartdrive root)
+    SNAPSHOT_DIR = "_snapshots"
+
+    # CHG-20261016-016: Precompiled bytecode bundles (in the deployed .smartdrive root)
+    BYTECODE_DIR = "bytecode"
+
+    # CHG-20261016-023: Tool discovery cache (in the deployed .smartdrive root)
+    TOOL_CACHE_JSON = ".tool_cache.json"
+
     # Keyfile names
     KEYFILE_BIN = "keyfile.bin"
     KEYFILE_PLAIN = "keyfile.vc"
@@ -590,6 +602,7 @@ class FileNames:
     # python file names
     MOUNT_PY = "mount.py"
     UNMOUNT_PY = "unmount.py"
+    MOUNT_SERVICE_PY = "mount_service.py"  # CHG-20261016-015: Persistent mount/unmount engine
     REKEY_PY = "rekey.py"
     KEYFILE_PY = "keyfile.py"
     GUI_LAUNCHER_PY = "gui_launcher.py"
@@ -646,6 +659,7 @@ class FileNames:
     REQUIRED_SCRIPTS_FOR_DEPLOYMENT = [
         MOUNT_PY,
         UNMOUNT_PY,
+        MOUNT_SERVICE_PY,
         RECOVERY_PY,
         RECOVERY_CONTAINER_PY,
         VERACRYPT_CLI_PY,
@@ -667,6 +681,7 @@ class FileNames:
         KEYDRIVE_PY,
         MOUNT_PY,
         UNMOUNT_PY,
+        MOUNT_SERVICE_PY,
         REKEY_PY,
         KEYFILE_PY,
         GUI_LAUNCHER_PY,
@@ -692,8 +707,13 @@ class FileNames:
         "challenges.json",
         "e2e_result.txt",
         "hash_database.json",
+        "hash_server.db",  # CHG-20261016-005: hash_server.py store (+ WAL files)
+        "hash_server.db-shm",
+        "hash_server.db-wal",
         "hash_server.py",
+        "hash_store.py",
         "obsolete",  # Obsolete files directory
+        SNAPSHOT_DIR,  # CHG-20261016-014: Rollback snapshots
     }
 
     # CHG-20251221-004: Deployment exclusion patterns
@@ -744,6 +764,10 @@ class FileNames:
         "config.json",  # User configuration (SSOT)
         # BUG-20260102-004: Exclude update temp directory to prevent recursion
         "_update_tmp",  # Temporary update staging directory
+        "_update_download",  # CHG-20261016-009: Resumable update download cache
+        "_snapshots",  # CHG-20261016-014: Rollback snapshot store
+        "bytecode",  # CHG-20261016-016: Bytecode bundles are built on the target
+        ".tool_cache.json",  # CHG-20261016-023: Per-host tool discovery cache
     ]
 
 
@@ -0,0 +1,177 @@
+# core/copier.py - SINGLE SOURCE OF TRUTH for bulk file copies onto drives
+"""
+Parallel copy pipeline with grouped sync barriers.
+
+CHG-20261016-012: Used by core/sync.apply_sync() (update.perform_update and
+deploy.deploy_to_drive). Removable FAT32/exFAT media have a high per-operation
+latency, so copying small files one by one on the main thread, each followed
+by its own flush, leaves the device idle most of the time.
+
+- Copies run on a bounded worker pool (file reads/writes release the GIL).
+- Each file is copied with one large reusable buffer per thread and its
+  metadata (mtime) is preserved like shutil.copy2; no per-file fsync.
+- When the last file of a directory finishes, one sync barrier makes the
+  whole directory batch durable: each file of the batch is fsynced after all
+  of them were written, then (POSIX) the directory itself. Only this copy's
+  files are flushed - never the whole system's dirty pages (os.sync()).
+- Per-file byte counts and durations are reported to the caller, which logs
+  them through its structured events.
+
+Usage:
+    from core.copier import CopyScheduler
+
+    scheduler = CopyScheduler()
+    scheduler.run([(key, src, dst), ...], on_done=callback)
+"""
+
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from core.limits import Limits
+
+logger = logging.getLogger("SmartDrive.copier")
+
+# Copy function: (src, dst) -> None
+CopyFunc = Callable[[Path, Path], object]
+
+# Completion callback: (key, stats or None, error or None)
+DoneCallback = Callable[[Hashable, Optional["CopyStats"], Optional[BaseException]], None]
+
+# Per-thread reusable copy buffer
+_buffers = threading.local()
+
+
+@dataclass(frozen=True)
+class CopyStats:
+    """Size and duration of one completed copy."""
+
+    bytes: int
+    seconds: float
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds > 0 else 0.0
+
+
+def _copy_buffer() -> memoryview:
+    buf = getattr(_buffers, "buf", None)
+    if buf is None:
+        buf = memoryview(bytearray(Limits.COPY_BUFFER_SIZE))
+        _buffers.buf = buf
+    return buf
+
+
+def copy_file(src: Path, dst: Path) -> int:
+    """
+    Copy contents and metadata (like shutil.copy2) without fsync.
+
+    Returns:
+        Bytes copied
+    """
+    buf = _copy_buffer()
+    total = 0
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        while True:
+            n = fin.readinto(buf)
+            if not n:
+                break
+            fout.write(buf[:n])
+            total += n
+    shutil.copystat(src, dst)
+    return total
+
+
+def sync_barrier(directory: Path, files: Iterable[Path]) -> None:
+    """
+    Make a directory batch of freshly written files durable.
+
+    Each file of the batch is fsynced here, after all of them were written,
+    instead of inside every copy. On POSIX the directory is fsynced last so
+    the new entries are persisted too.
+    """
+    # Windows flushes (FlushFileBuffers) only through a writable handle
+    mode = "rb" if os.name == "posix" else "rb+"
+    for path in files:
+        try:
+            with open(path, mode) as f:
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.debug(f"Flush failed for {path}: {e}")
+
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Some filesystems (e.g. vfat via FUSE) reject fsync on directories
+    finally:
+        os.close(fd)
+
+
+def default_workers() -> int:
+    """Copy worker count (bounded; a USB stick saturates with a few outstanding writes)."""
+    return max(1, min(Limits.COPY_MAX_WORKERS, (os.cpu_count() or 1) + 2))
+
+
+class CopyScheduler:
+    """
+    Bounded-pool copier with one sync barrier per destination directory.
+
+    Completion callbacks run on the calling thread, in completion order.
+    """
+
+    def __init__(self, workers: Optional[int] = None, copy: CopyFunc = copy_file, barrier: bool = True):
+        self.workers = workers or default_workers()
+        self.copy = copy
+        self.barrier = barrier
+
+    def _copy_one(self, src: Path, dst: Path) -> CopyStats:
+        start = time.perf_counter()
+        self.copy(src, dst)
+        return CopyStats(Path(dst).stat().st_size, time.perf_counter() - start)
+
+    def run(self, jobs: Iterable[Tuple[Hashable, Path, Path]], on_done: Optional[DoneCallback] = None) -> None:
+        """
+        Copy all jobs.
+
+        Args:
+            jobs: (key, src, dst); destination parents must exist
+            on_done: Called once per job with stats, or with the error
+        """
+        jobs = list(jobs)
+        pending_in_dir: Dict[Path, int] = {}
+        written_in_dir: Dict[Path, List[Path]] = {}
+        for _, _, dst in jobs:
+            parent = Path(dst).parent
+            pending_in_dir[parent] = pending_in_dir.get(parent, 0) + 1
+            written_in_dir.setdefault(parent, [])
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="copier") as pool:
+            futures = {pool.submit(self._copy_one, Path(src), Path(dst)): (key, Path(dst)) for key, src, dst in jobs}
+            not_done = set(futures)
+            while not_done:
+                done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, dst = futures[future]
+                    error = future.exception()
+                    stats = None if error else future.result()
+                    if error is None:
+                        written_in_dir[dst.parent].append(dst)
+
+                    pending_in_dir[dst.parent] -= 1
+                    if pending_in_dir[dst.parent] == 0 and self.barrier and written_in_dir[dst.parent]:
+                        sync_barrier(dst.parent, written_in_dir[dst.parent])
+
+                    if on_done:
+                        on_done(key, stats, error)
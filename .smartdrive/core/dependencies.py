@@ -196,31 +196,33 @@ def is_tool_installed(tool_name: str) -> bool:
     """
     Check if a system tool is available in PATH.
 
+    CHG-20261016-023: Resolved through the persistent tool cache, so a tool
+    found by an earlier process costs one stat instead of a PATH search.
+
     Args:
         tool_name: Name of the tool to check (e.g., "gpg", "veracrypt")
 
     Returns:
         True if tool is found in PATH, False otherwise
     """
+    from core.tool_cache import which_tool
+
     # Special case for VeraCrypt on Windows - use centralized path detection
     if tool_name == "veracrypt" and _get_platform_name() == "Windows":
-        # Check PATH first
-        if shutil.which("veracrypt") or shutil.which("VeraCrypt"):
-            return True
 
-        # Use Paths SSOT for common installation paths
-        try:
-            from core.paths import Paths
+        def _install_locations():
+            # Use Paths SSOT for common installation paths
+            try:
+                from core.paths import Paths
 
-            vc_path = Paths.veracrypt_exe()
-            if vc_path and vc_path.exists():
-                return True
-        except (ImportError, RuntimeError):
-            pass
+                return [Paths.veracrypt_exe()]
+            except (ImportError, RuntimeError):
+                return []
 
-        return False
+        # Check PATH first (both spellings), then the standard install paths
+        return which_tool("veracrypt") is not None or which_tool("VeraCrypt", fallbacks=_install_locations) is not None
 
-    return shutil.which(tool_name) is not None
+    return which_tool(tool_name) is not None
 
 
 def get_platform_instructions(dep: DependencyInfo) -> str:
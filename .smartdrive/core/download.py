@@ -0,0 +1,291 @@
+# core/download.py - SINGLE SOURCE OF TRUTH for update package downloads
+"""
+Resumable, verifying HTTP downloads.
+
+CHG-20261016-009: Replaces urllib.request.urlretrieve() for update packages.
+
+- Partial data is kept in "<dest>.part" next to a small "<dest>.part.json"
+  recording the URL and the server's ETag. A later attempt (same run or a
+  later run) resumes with "Range: bytes=N-" guarded by "If-Range: <etag>", so
+  a package that changed on the server is re-downloaded from zero.
+- The SHA-512 is computed while streaming (resumes first re-hash the bytes
+  already on disk). The expected digest comes from the caller, from a strong
+  ETag that is a SHA-512 hex digest (what the KeyDrive servers send), or from
+  the X-Package-Hash header. A mismatch discards the partial file.
+- Transient network errors are retried with exponential back-off.
+- CHG-20261016-013: stream_extract() extracts a zip straight from the HTTP
+  response (core/zipstream.py) while hashing it; no temporary archive is
+  written, at the cost of resumability.
+
+Usage:
+    from core.download import download_resumable
+
+    digest = download_resumable(url, dest_path)
+"""
+
+import hashlib
+import http.client
+import json
+import logging
+import os
+import re
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Callable, Optional, Tuple
+
+from core.limits import Limits
+
+if TYPE_CHECKING:
+    from core.zipstream import ExtractResult
+
+logger = logging.getLogger("SmartDrive.download")
+
+# SHA-512 hex digest (ETag / X-Package-Hash)
+_SHA512_HEX = re.compile(r"^[0-9a-fA-F]{128}$")
+
+# Progress callback: (bytes_done, total_bytes_or_None)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class DownloadError(Exception):
+    """Download failed after all retries or with a non-retryable response."""
+
+
+class HashMismatchError(DownloadError):
+    """Downloaded content does not match the expected SHA-512."""
+
+
+def _strong_etag(etag: Optional[str]) -> Optional[str]:
+    """Return a strong ETag unchanged, or None for missing/weak ETags."""
+    if not etag or etag.startswith("W/"):
+        return None
+    return etag
+
+
+def _etag_digest(etag: Optional[str]) -> Optional[str]:
+    """SHA-512 hex digest carried in a strong ETag, if any."""
+    etag = _strong_etag(etag)
+    if etag is None:
+        return None
+    value = etag.strip('"')
+    return value.lower() if _SHA512_HEX.match(value) else None
+
+
+def _paths(dest: Path):
+    return dest.with_name(dest.name + ".part"), dest.with_name(dest.name + ".part.json")
+
+
+def _load_state(meta_path: Path, url: str) -> dict:
+    """Load resume state; state for a different URL is ignored."""
+    try:
+        state = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) and state.get("url") == url else {}
+
+
+def _discard(*paths: Path) -> None:
+    for p in paths:
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _hash_existing(path: Path, hasher) -> None:
+    """Feed bytes already downloaded into the running hash."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(Limits.DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+
+
+def _attempt(
+    url: str, dest: Path, expected: Optional[str], timeout: float, progress: Optional[ProgressCallback]
+) -> str:
+    """One download attempt (resuming if possible). Returns the SHA-512 hex digest."""
+    part_path, meta_path = _paths(dest)
+    state = _load_state(meta_path, url)
+
+    offset = part_path.stat().st_size if (part_path.exists() and state.get("etag")) else 0
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+        request.add_header("If-Range", state["etag"])
+
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code == 416 and offset:
+            # Partial is already complete (or stale) - restart cleanly next attempt
+            _discard(part_path, meta_path)
+            raise ConnectionError("Range not satisfiable; restarting download") from e
+        raise
+
+    with response:
+        etag = _strong_etag(response.headers.get("ETag"))
+        expected = expected or _etag_digest(etag) or (response.headers.get("X-Package-Hash") or "").lower() or None
+
+        hasher = hashlib.sha512()
+        if response.status == 206 and offset:
+            _hash_existing(part_path, hasher)
+            mode = "ab"
+            logger.info(f"Resuming download at byte {offset}")
+        else:
+            offset = 0
+            mode = "wb"
+
+        # Remember the validator before writing so an interrupted transfer can resume
+        if etag:
+            meta_path.write_text(json.dumps({"url": url, "etag": etag}), encoding="utf-8")
+        else:
+            _discard(meta_path)
+
+        length = response.headers.get("Content-Length")
+        total = offset + int(length) if length and length.isdigit() else None
+
+        done = offset
+        with open(part_path, mode) as f:
+            while True:
+                chunk = response.read(Limits.DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                hasher.update(chunk)
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+            f.flush()
+            os.fsync(f.fileno())
+
+    if total is not None and done < total:
+        raise ConnectionError(f"Connection closed after {done} of {total} bytes")
+
+    digest = hasher.hexdigest()
+    if expected and digest != expected:
+        _discard(part_path, meta_path)
+        raise HashMismatchError(f"SHA-512 mismatch: expected {expected[:16]}..., got {digest[:16]}...")
+
+    os.replace(part_path, dest)
+    _discard(meta_path)
+    return digest
+
+
+def download_resumable(
+    url: str,
+    dest: Path,
+    expected_sha512: Optional[str] = None,
+    timeout: float = Limits.HTTP_REQUEST_TIMEOUT,
+    retries: int = Limits.DOWNLOAD_MAX_RETRIES,
+    progress: Optional[ProgressCallback] = None,
+) -> str:
+    """
+    Download a URL to dest, resuming partial downloads and verifying SHA-512.
+
+    Args:
+        url: Source URL
+        dest: Destination file (partial data lives beside it until complete)
+        expected_sha512: Expected hex digest (default: from ETag / X-Package-Hash)
+        timeout: Socket timeout per attempt
+        retries: Retries after transient errors
+        progress: Optional callback(bytes_done, total_bytes_or_None)
+
+    Returns:
+        SHA-512 hex digest of the downloaded file
+
+    Raises:
+        HashMismatchError: Content does not match the expected digest
+        DownloadError: Non-retryable HTTP error or retries exhausted
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    expected = expected_sha512.lower() if expected_sha512 else None
+
+    attempt = 0
+    while True:
+        try:
+            return _attempt(url, dest, expected, timeout, progress)
+        except HashMismatchError:
+            raise
+        except urllib.error.HTTPError as e:
+            if e.code < 500 and e.code not in (408, 429):
+                raise DownloadError(f"HTTP {e.code} downloading {url}") from e
+            error = e
+        except (urllib.error.URLError, http.client.HTTPException, ConnectionError, TimeoutError, OSError) as e:
+            error = e
+
+        attempt += 1
+        if attempt > retries:
+            raise DownloadError(f"Download failed after {retries} retries: {error}") from error
+        delay = min(Limits.DOWNLOAD_RETRY_BASE_DELAY * (2 ** (attempt - 1)), Limits.DOWNLOAD_RETRY_MAX_DELAY)
+        logger.warning(f"Download interrupted ({error}); retry {attempt}/{retries} in {delay:.0f}s")
+        time.sleep(delay)
+
+
+class _HashingReader:
+    """File-like wrapper feeding every byte read into a hash."""
+
+    def __init__(self, stream: BinaryIO, hasher):
+        self._stream = stream
+        self._hasher = hasher
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._stream.read(n)
+        self._hasher.update(data)
+        return data
+
+
+def stream_extract(
+    url: str,
+    dest_dir: Path,
+    exclude=None,
+    expected_sha512: Optional[str] = None,
+    timeout: float = Limits.HTTP_REQUEST_TIMEOUT,
+) -> Tuple["ExtractResult", str]:
+    """
+    Extract a zip package directly from its HTTP response.
+
+    The SHA-512 of the whole response is verified at the end (expected digest
+    from the caller, the ETag, or X-Package-Hash). dest_dir must be a staging
+    directory: on any error its contents are incomplete and must be discarded.
+
+    Args:
+        url: Package URL
+        dest_dir: Staging directory
+        exclude: Member filter (see core.zipstream.ExcludeFunc)
+        expected_sha512: Expected hex digest
+
+    Returns:
+        (ExtractResult, SHA-512 hex digest)
+
+    Raises:
+        HashMismatchError: Content does not match the expected digest
+        DownloadError: HTTP/network failure or corrupt archive
+    """
+    from core.zipstream import ZipStreamError, extract_stream
+
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    hasher = hashlib.sha512()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            etag = _strong_etag(response.headers.get("ETag"))
+            expected = (
+                (expected_sha512 or "").lower()
+                or _etag_digest(etag)
+                or (response.headers.get("X-Package-Hash") or "").lower()
+                or None
+            )
+            result = extract_stream(_HashingReader(response, hasher), Path(dest_dir), exclude)
+    except ZipStreamError as e:
+        raise DownloadError(f"Corrupt update stream: {e}") from e
+    except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+        raise DownloadError(f"Streaming download failed: {e}") from e
+
+    digest = hasher.hexdigest()
+    if expected and digest != expected:
+        raise HashMismatchError(f"SHA-512 mismatch: expected {expected[:16]}..., got {digest[:16]}...")
+    return result, digest
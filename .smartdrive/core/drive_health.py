@@ -0,0 +1,340 @@
+# core/drive_health.py - SINGLE SOURCE OF TRUTH for remote-drive health checks
+"""
+Background drive-health monitor with bounded filesystem probes.
+
+CHG-20261016-020: Remote mode used to call Path.exists() on the remote root
+and its config.json every 5 seconds on the Qt main thread. On a USB or
+network drive that half-disconnects a single stat() can block for many
+seconds, freezing the whole UI. Probes now run here, off the GUI thread:
+
+- Each path is probed with os.stat() in a worker thread and waited on for at
+  most DRIVE_HEALTH_PROBE_TIMEOUT. A probe that is still hung from an earlier
+  cycle is not duplicated; it keeps counting as a timeout.
+- A path that definitively does not exist (ENOENT) is a disconnect at once.
+  Timeouts and other OSErrors are retried with exponential backoff and only
+  DRIVE_HEALTH_FAILURE_THRESHOLD consecutive failures declare a disconnect.
+- After a disconnect the drive keeps being probed (backed off up to
+  DRIVE_HEALTH_MAX_INTERVAL) so a reconnect is reported too.
+- status() returns the cached result of the last cycle; it never touches
+  the filesystem.
+
+Consumers:
+- GUI: create_qt_health_signal() exposes drive_connected()/drive_disconnected(str)
+  Qt signals (queued across threads)
+
+Usage:
+    from core.drive_health import DriveHealthMonitor
+
+    monitor = DriveHealthMonitor([remote_root, remote_config_path])
+    monitor.add_listener(lambda connected, reason: print(connected, reason))
+    monitor.start()
+    ...
+    monitor.stop(timeout=0)  # Never blocks on a hung probe
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.limits import Limits
+
+# Logger for drive health operations
+_health_logger = logging.getLogger("SmartDrive.drive_health")
+
+# Probe outcomes
+PROBE_OK = "ok"
+PROBE_MISSING = "missing"
+PROBE_ERROR = "error"
+PROBE_TIMEOUT = "timeout"
+
+# Listener signature: called with (connected, reason) on every transition
+HealthListener = Callable[[bool, str], None]
+
+# Probe signature: path -> one of PROBE_OK / PROBE_MISSING / PROBE_ERROR
+ProbeFunc = Callable[[str], str]
+
+
+def probe_path(path: str) -> str:
+    """
+    Stat a path once.
+
+    Returns:
+        PROBE_OK, PROBE_MISSING (path does not exist) or PROBE_ERROR
+        (any other OSError, e.g. EIO from a dying drive)
+    """
+    try:
+        os.stat(path)
+        return PROBE_OK
+    except (FileNotFoundError, NotADirectoryError):
+        return PROBE_MISSING
+    except OSError as e:
+        _health_logger.debug(f"Probe of {path} failed: {e}")
+        return PROBE_ERROR
+
+
+@dataclass(frozen=True)
+class DriveHealth:
+    """Cached result of the last health-check cycle."""
+
+    connected: Optional[bool]  # None until the first cycle completes
+    consecutive_failures: int = 0
+    results: Dict[str, str] = field(default_factory=dict)  # path -> probe outcome
+    checked_at: float = 0.0  # time.monotonic() of the last cycle
+
+
+class _PendingProbe:
+    """One probe running in its own daemon thread."""
+
+    def __init__(self, path: str, probe: ProbeFunc):
+        self.path = path
+        self.result = PROBE_ERROR
+        self._done = threading.Event()
+        self._probe = probe
+        self._thread = threading.Thread(target=self._run, name="DriveHealthProbe", daemon=True)
+        self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        try:
+            self.result = self._probe(self.path)
+        except Exception as e:
+            _health_logger.debug(f"Probe of {self.path} raised: {e}")
+            self.result = PROBE_ERROR
+        finally:
+            self._done.set()
+
+
+class DriveHealthMonitor:
+    """
+    Periodically checks that a set of paths on one drive is reachable.
+
+    Listeners are invoked from the monitor thread on connected/disconnected
+    transitions; the initial "connected" result is not a transition.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable,
+        probe: ProbeFunc = probe_path,
+        interval: float = Limits.DRIVE_HEALTH_INTERVAL,
+        probe_timeout: float = Limits.DRIVE_HEALTH_PROBE_TIMEOUT,
+        failure_threshold: int = Limits.DRIVE_HEALTH_FAILURE_THRESHOLD,
+    ):
+        """
+        Initialize drive health monitor.
+
+        Args:
+            paths: Paths that must stay reachable (e.g. drive root, config.json)
+            probe: Probe function (tests)
+            interval: Seconds between checks while healthy
+            probe_timeout: Seconds to wait for one probe before counting a timeout
+            failure_threshold: Consecutive failed cycles that declare a disconnect
+        """
+        self.paths: Tuple[str, ...] = tuple(str(Path(p)) for p in paths)
+        self.interval = interval
+        self.probe_timeout = probe_timeout
+        self.failure_threshold = max(1, failure_threshold)
+        self._probe = probe
+
+        self._listeners: List[HealthListener] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+        self._pending: Dict[str, _PendingProbe] = {}
+        self._status = DriveHealth(connected=None)
+        self._retry_delay = Limits.DRIVE_HEALTH_RETRY_MIN_INTERVAL
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        """True while the background checker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_listener(self, listener: HealthListener) -> None:
+        """Register a callback invoked with (connected, reason) on every transition."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: HealthListener) -> None:
+        """Unregister a previously added callback."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def status(self) -> DriveHealth:
+        """Return the cached result of the last cycle (no I/O)."""
+        return self._status
+
+    def is_connected(self) -> Optional[bool]:
+        """Cached connection state; None until the first cycle completes."""
+        return self._status.connected
+
+    def check_now(self) -> DriveHealth:
+        """
+        Run one health-check cycle in the calling thread.
+
+        Blocks for at most probe_timeout per path, never on a hung probe.
+        """
+        results = {path: self._probe_bounded(path) for path in self.paths}
+        previous = self._status
+
+        if all(result == PROBE_OK for result in results.values()):
+            connected, failures, reason = True, 0, ""
+        else:
+            failures = previous.consecutive_failures + 1
+            missing = [p for p, r in results.items() if r == PROBE_MISSING]
+            if missing:
+                connected, reason = False, f"{missing[0]} is missing"
+            else:
+                path, result = next((p, r) for p, r in results.items() if r != PROBE_OK)
+                reason = f"{path}: probe {result}"
+                # Transient until enough consecutive cycles have failed
+                connected = False if failures >= self.failure_threshold else previous.connected
+            if connected is not False:
+                _health_logger.info(f"Drive health check failed ({failures}/{self.failure_threshold}): {reason}")
+
+        status = DriveHealth(
+            connected=connected,
+            consecutive_failures=failures,
+            results=results,
+            checked_at=time.monotonic(),
+        )
+        self._update_status(status, reason)
+        return status
+
+    def start(self) -> None:
+        """Start the background checker thread (idempotent, does not probe inline)."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="DriveHealthMonitor", daemon=True)
+        self._thread.start()
+        _health_logger.info(f"Drive health monitor started for {len(self.paths)} path(s)")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop the background checker thread.
+
+        No listener is notified after stop() returns. Pass timeout=0 from the
+        GUI thread: a probe hung in the kernel must not be waited for.
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            if timeout > 0:
+                self._thread.join(timeout)
+            self._thread = None
+        _health_logger.info("Drive health monitor stopped")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _probe_bounded(self, path: str) -> str:
+        """Probe a path, reusing a probe that is still running from an earlier cycle."""
+        pending = self._pending.get(path)
+        if pending is None or pending.done:
+            pending = _PendingProbe(path, self._probe)
+            self._pending[path] = pending
+        if not pending.wait(self.probe_timeout):
+            return PROBE_TIMEOUT
+        del self._pending[path]
+        return pending.result
+
+    def _update_status(self, status: DriveHealth, reason: str) -> None:
+        """Store status and notify listeners on connected/disconnected transitions."""
+        with self._lock:
+            previous = self._status.connected
+            self._status = status
+            transition = status.connected is not None and status.connected != previous
+            # The first successful check is not a reconnect
+            if status.connected and previous is None:
+                transition = False
+            listeners = list(self._listeners) if transition and not self._stop_event.is_set() else []
+
+        if transition:
+            if status.connected:
+                _health_logger.info(f"Drive reconnected: {self.paths[0] if self.paths else ''}")
+            else:
+                _health_logger.warning(f"Drive disconnected: {reason}")
+
+        for listener in listeners:
+            try:
+                listener(bool(status.connected), reason)
+            except Exception as e:
+                _health_logger.warning(f"Drive health listener failed: {e}")
+
+    def _next_delay(self, status: DriveHealth) -> float:
+        """Regular interval while healthy; exponential backoff while failing."""
+        if status.consecutive_failures == 0:
+            self._retry_delay = Limits.DRIVE_HEALTH_RETRY_MIN_INTERVAL
+            return self.interval
+        delay = self._retry_delay
+        self._retry_delay = min(self._retry_delay * Limits.DRIVE_HEALTH_BACKOFF, Limits.DRIVE_HEALTH_MAX_INTERVAL)
+        return delay
+
+    def _run(self) -> None:
+        """Checker loop: one cycle, then wait for the next delay or stop()."""
+        while not self._stop_event.is_set():
+            status = self.check_now()
+            self._wake_event.wait(self._next_delay(status))
+            self._wake_event.clear()
+
+
+# =============================================================================
+# Qt bridge
+# =============================================================================
+
+_qt_signal_class = None
+
+
+def create_qt_health_signal(monitor: DriveHealthMonitor, parent=None):
+    """
+    Create a QObject exposing `drive_connected()` and `drive_disconnected(str)`.
+
+    Listener callbacks run on the monitor thread; emitting a Qt signal from
+    there is delivered to slots in the receiver's thread (queued connection).
+
+    Args:
+        monitor: DriveHealthMonitor to bridge
+        parent: Optional QObject parent
+
+    Returns:
+        QObject with `drive_connected` and `drive_disconnected` pyqtSignals
+    """
+    global _qt_signal_class
+    if _qt_signal_class is None:
+        from PyQt6.QtCore import QObject, pyqtSignal
+
+        class DriveHealthSignal(QObject):
+            """Qt signal source for drive connect/disconnect transitions."""
+
+            drive_connected = pyqtSignal()
+            drive_disconnected = pyqtSignal(str)
+
+            def on_transition(self, connected: bool, reason: str) -> None:
+                if connected:
+                    self.drive_connected.emit()
+                else:
+                    self.drive_disconnected.emit(reason)
+
+        _qt_signal_class = DriveHealthSignal
+
+    bridge = _qt_signal_class(parent)
+    monitor.add_listener(bridge.on_transition)
+    return bridge
@@ -0,0 +1,181 @@
+# core/ephemeral_keyfile.py - SINGLE SOURCE OF TRUTH for decrypted keyfiles handed to VeraCrypt
+"""
+Ephemeral keyfiles that never touch a block device where the OS allows it.
+
+CHG-20261016-025: mount.py wrote the decrypted keyfile to /dev/shm or /tmp
+with an fsync, then overwrote it twice (two more fsyncs) and spawned `shred`;
+rekey.py, setup.py and core/secrets.py each had their own variant. All of
+them now use this module:
+
+- Linux: the keyfile lives in an anonymous memfd_create() file, sealed
+  against writes. VeraCrypt (run as the same user, or as root via pkexec)
+  opens it through /proc/<pid>/fd/<n>. The pid is explicit, not
+  /proc/self, because the path is opened by another process; pkexec/sudo
+  close inherited descriptors, so the fd is not passed down either.
+  Discarding the keyfile just closes the fd - there is no file to shred.
+- Elsewhere (or without memfd/procfs): a 0600 temp file in the RAM-backed
+  temp dir when there is one, else the system temp dir. Discarding
+  overwrites it once, syncs and unlinks it.
+
+Callers keep passing Path objects: the returned path is what VeraCrypt
+(or shutil.copy2, gpg, ...) reads, and discard_ephemeral_keyfile() accepts
+either kind.
+
+Usage:
+    from core.ephemeral_keyfile import create_ephemeral_keyfile, discard_ephemeral_keyfile
+
+    keyfile = create_ephemeral_keyfile(keyfile_bytes)
+    try:
+        mount(volume, keyfiles=[keyfile])
+    finally:
+        discard_ephemeral_keyfile(keyfile)
+"""
+
+import logging
+import os
+import platform
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from core.constants import FileNames
+from core.paths import Paths
+
+# Logger for ephemeral keyfile operations
+_keyfile_logger = logging.getLogger("SmartDrive.ephemeral_keyfile")
+
+# Seals applied once the memfd is written: contents and size are final
+_MEMFD_SEALS = ("F_SEAL_WRITE", "F_SEAL_GROW", "F_SEAL_SHRINK", "F_SEAL_SEAL")
+
+# Open memfd keyfiles: /proc path -> fd
+_memfds: Dict[str, int] = {}
+_memfds_lock = threading.Lock()
+
+
+def memfd_supported() -> bool:
+    """True if keyfiles can be kept in memfd files (Linux with procfs)."""
+    return hasattr(os, "memfd_create") and os.path.isdir(f"/proc/{os.getpid()}/fd")
+
+
+def _seal(fd: int) -> None:
+    """Make the memfd read-only for everyone, including later openers."""
+    try:
+        import fcntl
+    except ImportError:
+        return
+    seals = 0
+    for name in _MEMFD_SEALS:
+        seals |= getattr(fcntl, name, 0)
+    add_seals = getattr(fcntl, "F_ADD_SEALS", None)
+    if add_seals is None or not seals:
+        return
+    try:
+        fcntl.fcntl(fd, add_seals, seals)
+    except OSError as e:
+        _keyfile_logger.debug(f"memfd sealing unavailable: {e}")
+
+
+def _create_memfd(data: bytes, name: str) -> Path:
+    flags = getattr(os, "MFD_CLOEXEC", 0) | getattr(os, "MFD_ALLOW_SEALING", 0)
+    fd = os.memfd_create(name, flags)
+    try:
+        os.fchmod(fd, 0o600)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        _seal(fd)
+        path = Path(f"/proc/{os.getpid()}/fd/{fd}")
+        if not path.exists():
+            raise OSError(f"{path} is not accessible")
+    except Exception:
+        os.close(fd)
+        raise
+    with _memfds_lock:
+        _memfds[str(path)] = fd
+    return path
+
+
+def _ram_temp_dir() -> Path:
+    """RAM-backed temp dir if available, else system temp."""
+    system = platform.system()
+    ram_dir = {"Linux": Paths.LINUX_RAM_TEMP, "Darwin": Paths.MACOS_RAM_TEMP}.get(system)
+    if ram_dir and os.path.isdir(ram_dir) and os.access(ram_dir, os.W_OK):
+        return Path(ram_dir)
+    return Path(tempfile.gettempdir())
+
+
+def _create_temp_file(data: bytes, prefix: str) -> Path:
+    # mkstemp creates the file 0600 (owner only)
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix=".key", dir=str(_ram_temp_dir()))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return Path(tmp_path)
+
+
+def create_ephemeral_keyfile(data: bytes, prefix: str = "", use_memfd: Optional[bool] = None) -> Path:
+    """
+    Store keyfile bytes where VeraCrypt can read them for this process's lifetime.
+
+    Args:
+        data: Keyfile contents
+        prefix: Name prefix (memfd name or temp file prefix)
+        use_memfd: Force the memfd backend on/off (default: when supported)
+
+    Returns:
+        Path to pass to VeraCrypt; release it with discard_ephemeral_keyfile()
+    """
+    prefix = prefix or f"{FileNames.TMP_FILE_PREFIX}key_"
+    if use_memfd is None:
+        use_memfd = memfd_supported()
+    if use_memfd:
+        try:
+            return _create_memfd(data, prefix.rstrip("_") or "keyfile")
+        except OSError as e:
+            _keyfile_logger.debug(f"memfd keyfile unavailable, using temp file: {e}")
+    return _create_temp_file(data, prefix)
+
+
+def is_memfd_keyfile(path: Optional[Path]) -> bool:
+    """True if path is an open memfd keyfile created by this process."""
+    with _memfds_lock:
+        return path is not None and str(path) in _memfds
+
+
+def discard_ephemeral_keyfile(path: Optional[Path]) -> None:
+    """
+    Release a keyfile from create_ephemeral_keyfile() (or a legacy temp file).
+
+    memfd: closes the fd, which frees the memory. Temp file: one zero
+    overwrite, synced, then unlinked. Best effort; never raises.
+    """
+    if not path:
+        return
+    with _memfds_lock:
+        fd = _memfds.pop(str(path), None)
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        return
+
+    path = Path(path)
+    try:
+        size = path.stat().st_size
+        if size > 0:
+            with path.open("r+b") as f:
+                f.write(b"\x00" * size)
+                f.flush()
+                os.fsync(f.fileno())
+    except OSError as e:
+        _keyfile_logger.debug(f"Keyfile overwrite skipped ({path}): {e}")
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        _keyfile_logger.warning(f"Keyfile could not be removed ({path}): {e}")
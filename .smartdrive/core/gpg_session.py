@@ -0,0 +1,270 @@
+# core/gpg_session.py - SINGLE SOURCE OF TRUTH for gpg-agent/scdaemon readiness
+"""
+Background warm-up and readiness tracking for gpg-agent and scdaemon.
+
+CHG-20261016-021: The first GPG decrypt after boot used to fail with an
+agent IPC error, sleep a hard-coded 3 seconds and retry, and
+check_gpg_yubikey_readiness() slept another 2 seconds after starting the
+agent itself. Both sleeps sat on the mount path.
+
+GpgSession starts the daemons as soon as the GUI or CLI launches:
+
+    1. gpgconf --launch gpg-agent
+    2. gpg-connect-agent "GETINFO version" /bye    (agent answers on its socket)
+    3. gpg-connect-agent "SCD GETINFO version" /bye (agent starts scdaemon)
+
+Readiness is state plus a threading.Event. Decrypt calls wait on the event
+(returning at once when the daemons are already warm) instead of sleeping,
+and an IPC error observed later triggers restart(), which re-runs the
+warm-up and is waited on the same way.
+
+The agent is a per-user daemon, so warming it from the GUI process also
+benefits a mount that runs in a separate process.
+
+Usage:
+    from core.gpg_session import get_gpg_session, warm_up_for_mode
+
+    warm_up_for_mode(cfg.get("mode"))      # At launch; returns immediately
+    ...
+    if get_gpg_session().wait_ready(Limits.GPG_SESSION_READY_TIMEOUT):
+        subprocess.run(["gpg", "--decrypt", ...])
+"""
+
+import json
+import logging
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from core.limits import Limits
+
+# Logger for GPG session operations
+_session_logger = logging.getLogger("SmartDrive.gpg_session")
+
+# Session states
+STATE_IDLE = "idle"  # Warm-up not started
+STATE_WARMING = "warming"  # Warm-up thread running
+STATE_READY = "ready"  # gpg-agent answers on its socket
+STATE_FAILED = "failed"  # Agent could not be started or does not answer
+STATE_UNAVAILABLE = "unavailable"  # GnuPG tools are not installed
+
+
+def _run_gpg_tool(args: List[str], timeout: float) -> Tuple[int, str]:
+    """
+    Run a GnuPG helper without a console window.
+
+    Returns:
+        (returncode, stdout + stderr)
+
+    Raises:
+        FileNotFoundError: If the tool is not installed
+        subprocess.TimeoutExpired: If it does not finish in time
+    """
+    result = subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="ignore",
+        timeout=timeout,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+    return result.returncode, (result.stdout or "") + (result.stderr or "")
+
+
+def _assuan_ok(returncode: int, output: str) -> bool:
+    """True if a gpg-connect-agent command got an OK (not ERR) reply."""
+    lines = [line.strip() for line in output.splitlines()]
+    return returncode == 0 and "OK" in lines and not any(line.startswith("ERR") for line in lines)
+
+
+class GpgSession:
+    """
+    Tracks whether gpg-agent (and scdaemon) are up and answering.
+
+    warm_up() and restart() never block; wait_ready() blocks on the
+    readiness event for at most the given timeout.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._state = STATE_IDLE
+        self._scdaemon_ready = False
+        self._error = ""
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def state(self) -> str:
+        """Current session state (STATE_* constant)."""
+        return self._state
+
+    @property
+    def agent_ready(self) -> bool:
+        """True once gpg-agent answered a round trip."""
+        return self._state == STATE_READY
+
+    @property
+    def scdaemon_ready(self) -> bool:
+        """True once scdaemon answered through the agent."""
+        return self._scdaemon_ready
+
+    @property
+    def error(self) -> str:
+        """Last warm-up error (empty when ready)."""
+        return self._error
+
+    def warm_up(self) -> None:
+        """Start the background warm-up unless it is running or already done."""
+        with self._lock:
+            if self._state in (STATE_WARMING, STATE_READY, STATE_UNAVAILABLE):
+                return
+            self._start_locked()
+
+    def restart(self) -> None:
+        """
+        Re-run the warm-up after an agent/IPC error was observed.
+
+        Clears readiness so wait_ready() waits for the new round trip.
+        """
+        with self._lock:
+            if self._state == STATE_WARMING:
+                return
+            self._start_locked()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the warm-up has finished (starting it if needed).
+
+        Args:
+            timeout: Seconds to wait (None = GPG_SESSION_READY_TIMEOUT)
+
+        Returns:
+            True if gpg-agent is ready
+        """
+        self.warm_up()
+        if timeout is None:
+            timeout = Limits.GPG_SESSION_READY_TIMEOUT
+        self._ready_event.wait(timeout)
+        return self.agent_ready
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _start_locked(self) -> None:
+        self._state = STATE_WARMING
+        self._ready_event.clear()
+        self._thread = threading.Thread(target=self._warm, name="GpgSessionWarmUp", daemon=True)
+        self._thread.start()
+
+    def _finish(self, state: str, error: str = "") -> None:
+        with self._lock:
+            self._state = state
+            self._error = error
+        self._ready_event.set()
+
+    def _warm(self) -> None:
+        """Launch gpg-agent, confirm it answers, then bring up scdaemon."""
+        started = time.monotonic()
+        timeout = Limits.GPG_AGENT_START_TIMEOUT
+        try:
+            # gpgconf --launch is a no-op when the agent already runs
+            try:
+                _run_gpg_tool(["gpgconf", "--launch", "gpg-agent"], timeout)
+            except FileNotFoundError:
+                pass  # GnuPG < 2.1 or gpgconf missing: gpg-connect-agent autostarts
+
+            deadline = started + Limits.GPG_SESSION_READY_TIMEOUT
+            delay = Limits.GPG_SESSION_RETRY_MIN_DELAY
+            while True:
+                returncode, output = _run_gpg_tool(["gpg-connect-agent", "GETINFO version", "/bye"], timeout)
+                if _assuan_ok(returncode, output):
+                    break
+                if time.monotonic() + delay > deadline:
+                    self._scdaemon_ready = False
+                    self._finish(STATE_FAILED, output.strip()[:200] or "gpg-agent did not answer")
+                    _session_logger.warning(f"gpg-agent not ready: {self._error}")
+                    return
+                # Agent socket not accepting yet; this wait is off the mount path
+                time.sleep(delay)
+                delay = min(delay * 2, Limits.GPG_SESSION_RETRY_MAX_DELAY)
+
+            # Agent answers; starting scdaemon may take a moment more
+            try:
+                returncode, output = _run_gpg_tool(["gpg-connect-agent", "SCD GETINFO version", "/bye"], timeout)
+                self._scdaemon_ready = _assuan_ok(returncode, output)
+                if not self._scdaemon_ready:
+                    _session_logger.info(f"scdaemon not available: {output.strip()[:200]}")
+            except subprocess.TimeoutExpired:
+                self._scdaemon_ready = False
+                _session_logger.info("scdaemon did not answer in time")
+
+            self._finish(STATE_READY)
+            _session_logger.info(
+                f"GPG session ready in {time.monotonic() - started:.2f}s (scdaemon={self._scdaemon_ready})"
+            )
+        except FileNotFoundError:
+            self._scdaemon_ready = False
+            self._finish(STATE_UNAVAILABLE, "GnuPG (gpg-connect-agent) is not installed or not in PATH")
+        except subprocess.TimeoutExpired:
+            self._scdaemon_ready = False
+            self._finish(STATE_FAILED, "gpg-agent did not respond in time")
+            _session_logger.warning(self._error)
+        except Exception as e:
+            self._scdaemon_ready = False
+            self._finish(STATE_FAILED, str(e))
+            _session_logger.warning(f"GPG session warm-up failed: {e}")
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+_session: Optional[GpgSession] = None
+_session_lock = threading.Lock()
+
+
+def get_gpg_session() -> GpgSession:
+    """Return the process-wide GPG session."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = GpgSession()
+        return _session
+
+
+def warm_up_for_mode(mode: Optional[str]) -> bool:
+    """
+    Start warming the GPG session if a security mode uses the YubiKey.
+
+    Returns:
+        True if a warm-up was started (or is already running/done)
+    """
+    from core.modes import SecurityMode
+
+    try:
+        requires_yubikey = bool(mode) and SecurityMode.from_config(mode).requires_yubikey
+    except ValueError:
+        return False
+    if requires_yubikey:
+        get_gpg_session().warm_up()
+    return requires_yubikey
+
+
+def warm_up_for_config(config_file: Path) -> bool:
+    """Read the security mode from config.json and call warm_up_for_mode()."""
+    from core.constants import ConfigKeys
+
+    try:
+        with open(config_file, "r", encoding="utf-8") as f:
+            mode = json.load(f).get(ConfigKeys.MODE)
+    except (OSError, ValueError, AttributeError):
+        return False
+    return warm_up_for_mode(mode)
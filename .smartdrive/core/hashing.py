@@ -0,0 +1,411 @@
+# core/hashing.py - SINGLE SOURCE OF TRUTH for directory hashing
+"""
+Parallel, streaming directory hasher.
+
+CHG-20261016-003: Shared by hash_server.py (reference tree) and the smartdrive
+CLI (challenge hash of the deployed scripts directory). Previously both kept
+their own copy of a single-threaded walker reading 8 KiB at a time.
+
+Modes:
+- MODE_COMPAT: byte-for-byte the legacy digest:
+      sha256( for each file in sorted order: relpath \\0 contents \\0 )
+  Files are read ahead on a thread pool (hashlib and file reads release the
+  GIL) while the calling thread feeds the single running hash in order.
+  Large files are streamed with a reusable buffer or mmap.
+- MODE_MERKLE: every file gets an independent leaf digest
+      leaf = sha256(b"leaf\\0" relpath \\0 contents)
+  computed fully in parallel; the root is sha256(b"root\\0" + leaves...).
+  Leaves can be compared individually to locate changed files.
+
+Usage:
+    from core.hashing import hash_directory
+
+    digest = hash_directory(scripts_dir)                      # legacy-compatible
+    digest = hash_directory(scripts_dir, mode=MODE_MERKLE)    # leaf/root
+"""
+
+import bisect
+import hashlib
+import mmap
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from core.limits import Limits
+
+# Hash modes
+MODE_COMPAT = "compat"
+MODE_MERKLE = "merkle"
+
+# Directories never descended into (matches the legacy walkers)
+DEFAULT_SKIP_DIRS = ("__pycache__", ".git")
+
+# File-name filter: return True to include a file (name only, not path)
+FileFilter = Callable[[str], bool]
+
+# Per-thread reusable read buffer
+_buffers = threading.local()
+
+
+def _read_buffer() -> memoryview:
+    """Return this thread's reusable read buffer."""
+    buf = getattr(_buffers, "buf", None)
+    if buf is None:
+        buf = memoryview(bytearray(Limits.HASH_READ_BUFFER_SIZE))
+        _buffers.buf = buf
+    return buf
+
+
+def default_workers() -> int:
+    """Worker count for I/O overlap (bounded; USB sticks gain little beyond a few)."""
+    return max(1, min(Limits.HASH_MAX_WORKERS, (os.cpu_count() or 1) + 2))
+
+
+# =============================================================================
+# File enumeration
+# =============================================================================
+
+
+def collect_files(
+    dir_path: Path,
+    file_filter: Optional[FileFilter] = None,
+    skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+) -> List[Tuple[str, str]]:
+    """
+    Enumerate files under a directory in the legacy deterministic order.
+
+    Args:
+        dir_path: Root directory
+        file_filter: Optional predicate on the file name
+        skip_dirs: Directory names to prune
+
+    Returns:
+        List of (relative_path, absolute_path) sorted by absolute path string
+    """
+    skip = set(skip_dirs)
+    all_files = []
+    for root, dirs, files in os.walk(dir_path):
+        dirs[:] = [d for d in dirs if d not in skip]
+        for name in files:
+            if file_filter is None or file_filter(name):
+                all_files.append(str(Path(root) / name))
+
+    all_files.sort()
+    return [(os.path.relpath(p, dir_path), p) for p in all_files]
+
+
+# =============================================================================
+# Low-level readers
+# =============================================================================
+
+
+def _stream_into(hasher, path: str) -> None:
+    """Feed a file into a hasher using mmap (large files) or a reusable buffer."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= Limits.HASH_MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+                return
+            except (OSError, ValueError):
+                f.seek(0)  # mmap unsupported on this filesystem - fall through
+
+        buf = _read_buffer()
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hasher.update(buf[:n])
+
+
+def _prefetch(path: str):
+    """
+    Worker: read a small file whole, or defer a large one to streaming.
+
+    Returns:
+        ("data", bytes) | ("stream", None) | ("error", OSError)
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > Limits.HASH_PREFETCH_MAX_FILE_SIZE:
+                return ("stream", None)
+            return ("data", f.read())
+    except (OSError, IOError) as e:
+        return ("error", e)
+
+
+# =============================================================================
+# Hashing
+# =============================================================================
+
+
+def _hash_ordered(entries: List[Tuple[str, str, Optional[bytes]]], workers: Optional[int] = None) -> str:
+    """
+    Legacy-compatible aggregate over pre-ordered entries.
+
+    Args:
+        entries: (relative_path, absolute_path, in_memory_contents_or_None)
+        workers: Thread pool size (default: default_workers())
+
+    Returns:
+        Hex-encoded SHA256 digest
+    """
+    hasher = hashlib.sha256()
+    pool_size = workers or default_workers()
+
+    with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="hash") as pool:
+        # Bounded read-ahead window keeps memory flat while reads overlap hashing
+        pending = deque()
+        it = iter(entries)
+        window = pool_size * 2
+
+        def _fill():
+            while len(pending) < window:
+                try:
+                    rel, abs_p, content = next(it)
+                except StopIteration:
+                    return
+                if content is not None:
+                    pending.append((rel, abs_p, None, ("data", content)))
+                else:
+                    pending.append((rel, abs_p, pool.submit(_prefetch, abs_p), None))
+
+        _fill()
+        while pending:
+            rel, abs_p, fut, ready = pending.popleft()
+            _fill()
+            kind, payload = ready if fut is None else fut.result()
+
+            # Include relative path in hash to detect file moves
+            hasher.update(rel.encode("utf-8"))
+            hasher.update(b"\x00")  # Separator
+
+            if kind == "data":
+                hasher.update(payload)
+            elif kind == "stream":
+                try:
+                    _stream_into(hasher, abs_p)
+                except (OSError, IOError) as e:
+                    hasher.update(f"[ERROR: {e}]".encode("utf-8"))
+            else:
+                # Unreadable files contribute their error text (legacy behaviour)
+                hasher.update(f"[ERROR: {payload}]".encode("utf-8"))
+
+            hasher.update(b"\x00")  # File separator
+
+    return hasher.hexdigest()
+
+
+def hash_file_list(files: List[Tuple[str, str]], workers: Optional[int] = None) -> str:
+    """
+    Legacy-compatible aggregate over an explicit, ordered file list.
+
+    Args:
+        files: (relative_path, absolute_path) pairs in hashing order
+        workers: Thread pool size
+
+    Returns:
+        Hex-encoded SHA256 digest
+    """
+    return _hash_ordered([(rel, abs_p, None) for rel, abs_p in files], workers)
+
+
+def _leaf(rel: str, abs_p: Optional[str], content: Optional[bytes]) -> bytes:
+    """Merkle leaf digest for one file."""
+    h = hashlib.sha256()
+    h.update(b"leaf\x00")
+    h.update(rel.encode("utf-8"))
+    h.update(b"\x00")
+    if content is not None:
+        h.update(content)
+    else:
+        try:
+            _stream_into(h, abs_p)
+        except (OSError, IOError) as e:
+            h.update(f"[ERROR: {e}]".encode("utf-8"))
+    return h.digest()
+
+
+def hash_leaves(
+    files: List[Tuple[str, str]],
+    extra_files: Optional[Mapping[str, bytes]] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Compute Merkle leaf digests for each file in parallel.
+
+    Returns:
+        {relative_path: leaf_hex} (insertion order = sorted relative path)
+    """
+    # Leaves use "/" separators so client and server agree across platforms
+    extra_files = {rel.replace(os.sep, "/"): content for rel, content in (extra_files or {}).items()}
+    jobs = [(rel.replace(os.sep, "/"), abs_p, None) for rel, abs_p in files]
+    jobs = [j for j in jobs if j[0] not in extra_files]
+    jobs.extend((rel, None, content) for rel, content in extra_files.items())
+    jobs.sort(key=lambda j: j[0])
+
+    with ThreadPoolExecutor(max_workers=workers or default_workers(), thread_name_prefix="hash") as pool:
+        digests = pool.map(lambda j: _leaf(*j), jobs)
+        return {rel: d.hex() for (rel, _, _), d in zip(jobs, digests)}
+
+
+def merkle_root(leaves: Mapping[str, str]) -> str:
+    """Combine leaf digests (sorted by relative path) into the root digest."""
+    h = hashlib.sha256()
+    h.update(b"root\x00")
+    for rel in sorted(leaves):
+        h.update(bytes.fromhex(leaves[rel]))
+    return h.hexdigest()
+
+
+def hash_directory(
+    dir_path: Path,
+    mode: str = MODE_COMPAT,
+    file_filter: Optional[FileFilter] = None,
+    extra_files: Optional[Mapping[str, bytes]] = None,
+    workers: Optional[int] = None,
+) -> str:
+    """
+    Hash an entire directory recursively.
+
+    Args:
+        dir_path: Directory to hash
+        mode: MODE_COMPAT (legacy digest) or MODE_MERKLE (leaf/root)
+        file_filter: Optional predicate on file names
+        extra_files: In-memory files merged into the tree (e.g. a challenge salt)
+        workers: Thread pool size
+
+    Returns:
+        Hex-encoded SHA256 digest
+    """
+    dir_path = Path(dir_path)
+    files = collect_files(dir_path, file_filter=file_filter)
+
+    if mode == MODE_MERKLE:
+        return merkle_root(hash_leaves(files, extra_files=extra_files, workers=workers))
+    if mode != MODE_COMPAT:
+        raise ValueError(f"Unknown hash mode: {mode}")
+
+    entries = [(rel, abs_p, None) for rel, abs_p in files]
+    if extra_files:
+        # In-memory files take the sort position they would have on disk
+        entries = [e for e in entries if e[0] not in extra_files]
+        for rel, content in extra_files.items():
+            entries.append((rel, str(dir_path / rel), bytes(content)))
+        entries.sort(key=lambda e: e[1])
+    return _hash_ordered(entries, workers)
+
+
+# =============================================================================
+# Precomputed reference trees
+# =============================================================================
+
+
+class PrecomputedTree:
+    """
+    In-memory, sorted manifest of a directory for repeated salted digests.
+
+    CHG-20261016-004: The verification server hashes the same reference tree
+    with a different in-memory salt file per challenge. The tree is read once;
+    running hash states are checkpointed at every entry boundary, so a digest
+    costs one state copy plus SHA-256 over the cached bytes after the insertion
+    point. Nothing is written to disk and instances are immutable after build,
+    so concurrent requests need no locking.
+    """
+
+    def __init__(self, dir_path: Path, file_filter: Optional[FileFilter] = None):
+        """
+        Read and index a directory.
+
+        Args:
+            dir_path: Directory to snapshot
+            file_filter: Optional predicate on file names
+        """
+        self.dir_path = Path(dir_path)
+        self._sort_keys: List[str] = []
+        self._rels: List[str] = []
+        self._payloads: List[bytes] = []
+
+        files = collect_files(self.dir_path, file_filter=file_filter)
+        pool_size = default_workers()
+        with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="hash") as pool:
+            results = pool.map(self._read_payload, [abs_p for _, abs_p in files])
+            for (rel, abs_p), payload in zip(files, results):
+                self._sort_keys.append(abs_p)
+                self._rels.append(rel)
+                self._payloads.append(payload)
+
+        # _states[i] = running hash over entries [0, i)
+        self._states = [hashlib.sha256()]
+        for rel, payload in zip(self._rels, self._payloads):
+            h = self._states[-1].copy()
+            h.update(rel.encode("utf-8") + b"\x00" + payload + b"\x00")
+            self._states.append(h)
+
+        self.digest = self._states[-1].hexdigest()
+        self.signature = tree_signature(self.dir_path, file_filter)
+
+    @staticmethod
+    def _read_payload(path: str) -> bytes:
+        """File contents, or the legacy error marker for unreadable files."""
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except (OSError, IOError) as e:
+            return f"[ERROR: {e}]".encode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._rels)
+
+    def leaves(self) -> Dict[str, str]:
+        """Per-file SHA-256 of the cached payloads, keyed by relative path."""
+        return {rel: hashlib.sha256(p).hexdigest() for rel, p in zip(self._rels, self._payloads)}
+
+    def digest_with(self, extra_files: Mapping[str, bytes]) -> str:
+        """
+        Compat-mode digest of the tree plus in-memory files.
+
+        Equals hash_directory(dir_path, extra_files=extra_files) for the tree
+        as it was when this snapshot was built.
+        """
+        if not extra_files:
+            return self.digest
+
+        inserts = sorted((str(self.dir_path / rel), rel, bytes(c)) for rel, c in extra_files.items())
+        replaced = {rel for _, rel, _ in inserts}
+
+        start = bisect.bisect_left(self._sort_keys, inserts[0][0])
+        h = self._states[start].copy()
+
+        i = start
+        for key, rel, content in inserts:
+            while i < len(self._sort_keys) and self._sort_keys[i] < key:
+                if self._rels[i] not in replaced:
+                    h.update(self._rels[i].encode("utf-8") + b"\x00" + self._payloads[i] + b"\x00")
+                i += 1
+            h.update(rel.encode("utf-8") + b"\x00" + content + b"\x00")
+        for j in range(i, len(self._sort_keys)):
+            if self._rels[j] not in replaced:
+                h.update(self._rels[j].encode("utf-8") + b"\x00" + self._payloads[j] + b"\x00")
+        return h.hexdigest()
+
+
+def tree_signature(dir_path: Path, file_filter: Optional[FileFilter] = None) -> str:
+    """
+    Cheap change detector for a tree: digest of (relpath, size, mtime_ns).
+
+    Stats every file but reads none; used to decide when a PrecomputedTree
+    must be rebuilt.
+    """
+    h = hashlib.sha256()
+    for rel, abs_p in collect_files(Path(dir_path), file_filter=file_filter):
+        try:
+            st = os.stat(abs_p)
+            h.update(f"{rel}\x00{st.st_size}\x00{st.st_mtime_ns}\n".encode("utf-8"))
+        except OSError:
+            h.update(f"{rel}\x00missing\n".encode("utf-8"))
+    return h.hexdigest()
@@ -4,6 +4,7 @@ Integrity validation for scripts and modules.
 
 This module provides:
 - Script hash calculation (deterministic)
+- Incremental hashing via an on-drive digest index (CHG-20261016-002)
 - Manifest validation
 - GPG signature verification (optional)
 - Integrity gate for setup/GUI entry
@@ -18,11 +19,14 @@ Usage:
 """
 
 import hashlib
+import json
+import os
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from core.constants import FileNames
 from core.limits import Limits
@@ -77,36 +81,181 @@ class Integrity:
         FileNames.VERACRYPT_CLI_PY,  # VeraCrypt CLI wrapper
     ]
 
+    # CHG-20261016-002: Digest index (relative to integrity dir)
+    # Records per-file (stat key, sha256) by relative path, so unchanged files are
+    # verified without reading them.
+    INDEX_FILE = "scripts.index.json"
+    SIGNED_INDEX_FILE = "scripts.index.signed.json"
+    INDEX_SCHEMA_VERSION = 3
+
     @classmethod
-    def calculate_scripts_hash(cls, scripts_dir: Path) -> str:
+    def calculate_scripts_hash(
+        cls, scripts_dir: Path, index_file: Optional[Path] = None, paranoid: bool = False
+    ) -> str:
         """
         Calculate deterministic SHA256 hash of all scripts.
 
         Hash is computed over sorted file list to ensure determinism.
-        Each file's name and contents are included to detect renames.
+        Each file's name and content digest are included to detect renames.
 
         Args:
             scripts_dir: Path to scripts directory
+            index_file: Optional digest index; reused when no file changed
+            paranoid: If True, ignore the index and re-read every file
 
         Returns:
             Hex-encoded SHA256 hash
         """
-        hasher = hashlib.sha256()
+        return cls.hash_files(scripts_dir, cls.HASHED_SCRIPTS, index_file=index_file, paranoid=paranoid)
+
+    @classmethod
+    def hash_files(
+        cls,
+        directory: Path,
+        names: Sequence[str],
+        index_file: Optional[Path] = None,
+        paranoid: bool = False,
+    ) -> str:
+        """
+        Aggregate SHA256 over (path, SHA256(contents)) of the given files in sorted order.
+
+        CHG-20261016-002: The aggregate is folded from per-file digests, so only
+        files whose stat key changed (or that are racy) are re-read; the other
+        digests come from the index, keyed by path relative to ``directory``
+        (POSIX separators). paranoid=True re-reads every file.
+
+        Args:
+            directory: Directory containing the files
+            names: File paths relative to directory (missing files are skipped)
+            index_file: Optional digest index path (None = no caching)
+            paranoid: If True, always re-read every file
 
-        # Process in deterministic order (sorted)
-        for script_name in sorted(cls.HASHED_SCRIPTS):
-            script_path = scripts_dir / script_name
-            if script_path.exists():
-                # Include filename in hash to detect renames
-                hasher.update(script_name.encode("utf-8"))
-                # Include file contents
-                hasher.update(script_path.read_bytes())
+        Returns:
+            Hex-encoded SHA256 hash
+        """
+        directory = Path(directory)
+        index = cls._load_index(index_file) if index_file is not None else None
+        entries = index["files"] if index is not None else {}
+        written_ns = index.get("written_ns", 0) if index is not None else 0
+
+        hasher = hashlib.sha256()
+        files: Dict[str, dict] = {}
+        reread = False
+        for rel in sorted({Path(name).as_posix() for name in names}):
+            key = cls._stat_key(directory / rel)
+            if key is None:
+                files[rel] = {"key": None, "sha256": None}
+                continue
+            entry = entries.get(rel) or {}
+            digest = entry.get("sha256")
+            if paranoid or digest is None or entry.get("key") != key or cls._is_racy(key, written_ns):
+                digest = hashlib.sha256((directory / rel).read_bytes()).hexdigest()
+                reread = True
+            files[rel] = {"key": key, "sha256": digest}
+            # Include the path to detect renames
+            hasher.update(rel.encode("utf-8") + b"\0" + bytes.fromhex(digest))
+
+        if index_file is not None and (reread or index is None or any(entries.get(r) != e for r, e in files.items())):
+            if index is None:
+                index = {"files": {}}
+            index["files"].update(files)
+            cls._save_index(index_file, index)
 
         return hasher.hexdigest()
 
+    @classmethod
+    def changed_files(cls, directory: Path, names: Sequence[str], index_file: Path) -> List[str]:
+        """
+        List files whose current content differs from the digest index.
+
+        Used to name the culprits on a manifest mismatch. Only files whose
+        stat key changed are re-read.
+
+        Returns:
+            Sorted list of changed (or newly missing/added) relative paths
+        """
+        directory = Path(directory)
+        index = cls._load_index(index_file)
+        if index is None:
+            return []
+
+        changed = []
+        for rel in sorted({Path(name).as_posix() for name in names}):
+            entry = index["files"].get(rel)
+            key = cls._stat_key(directory / rel)
+            if entry is None:
+                if key is not None:
+                    changed.append(rel)
+                continue
+            if entry.get("key") == key and not cls._is_racy(key, index.get("written_ns", 0)):
+                continue
+            if key is None or entry.get("sha256") is None:
+                if key != entry.get("key"):
+                    changed.append(rel)
+                continue
+            if hashlib.sha256((directory / rel).read_bytes()).hexdigest() != entry["sha256"]:
+                changed.append(rel)
+        return changed
+
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[List[int]]:
+        """
+        Return [size, mtime_ns, inode, ctime_ns] for a file, or None if absent.
+
+        mtime can be set back with utime() after a same-size edit; the inode
+        change time cannot, so ctime_ns keeps such an edit from matching.
+        """
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return [st.st_size, st.st_mtime_ns, st.st_ino, st.st_ctime_ns]
+
+    @staticmethod
+    def _is_racy(key: Optional[List[int]], written_ns: int) -> bool:
+        """
+        True if a file was modified too close to the index write to trust mtime.
+
+        FAT32/exFAT store mtimes with 2 s granularity, so an edit within that
+        window of indexing could leave the stat key unchanged (cf. git's
+        "racy clean" rule). Such entries are always re-hashed.
+        """
+        if key is None:
+            return False
+        return key[1] >= written_ns - Limits.INTEGRITY_INDEX_RACY_WINDOW_NS
+
+    @classmethod
+    def _load_index(cls, index_file: Path) -> Optional[dict]:
+        """Load the digest index; None if missing, corrupt, or from another schema."""
+        try:
+            data = json.loads(Path(index_file).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("schema_version") != cls.INDEX_SCHEMA_VERSION:
+            return None
+        if not isinstance(data.get("files"), dict):
+            return None
+        return data
+
+    @classmethod
+    def _save_index(cls, index_file: Path, index: dict) -> None:
+        """Persist the digest index (best effort: read-only media just skip caching)."""
+        from core.config import write_file_atomic
+
+        index["schema_version"] = cls.INDEX_SCHEMA_VERSION
+        index["written_ns"] = time.time_ns()
+        try:
+            write_file_atomic(Path(index_file), json.dumps(index, sort_keys=True))
+        except OSError:
+            pass
+
     @classmethod
     def validate_integrity(
-        cls, launcher_root: Path, bypass_enabled: bool = False, verify_signature: bool = True
+        cls,
+        launcher_root: Path,
+        bypass_enabled: bool = False,
+        verify_signature: bool = True,
+        paranoid: bool = False,
     ) -> IntegrityResult:
         """
         Validate script integrity against signed manifest.
@@ -115,6 +264,7 @@ class Integrity:
             launcher_root: Root directory (drive root or repo root)
             bypass_enabled: If True, return valid=True even on failure (with warning)
             verify_signature: If True and GPG available, verify manifest signature
+            paranoid: If True, bypass the digest index and re-read every script
 
         Returns:
             IntegrityResult with validation outcome
@@ -125,9 +275,10 @@ class Integrity:
         integrity_dir = Paths.integrity_dir(launcher_root)
         manifest_file = integrity_dir / cls.MANIFEST_FILE
         signature_file = integrity_dir / cls.SIGNATURE_FILE
+        index_file = integrity_dir / cls.INDEX_FILE if integrity_dir.is_dir() else None
 
-        # Calculate actual hash
-        actual_hash = cls.calculate_scripts_hash(scripts_dir)
+        # Calculate actual hash (CHG-20261016-002: served from the index when unchanged)
+        actual_hash = cls.calculate_scripts_hash(scripts_dir, index_file=index_file, paranoid=paranoid)
 
         # Check for manifest existence
         if not manifest_file.exists():
@@ -193,7 +344,9 @@ class Integrity:
                 signer_info=signer_info,
             )
         else:
-            # Hash mismatch
+            # Hash mismatch - name the files that changed since they were last indexed.
+            # Computed before this call re-indexed them, so use the signing snapshot.
+            mismatched = cls._signed_changes(scripts_dir, integrity_dir) or ["(hash mismatch)"]
             msg = (
                 "INTEGRITY CHECK FAILED\n\n"
                 f"Expected: {expected_hash}\n"
@@ -211,7 +364,7 @@ class Integrity:
                     valid=True,
                     expected_hash=expected_hash,
                     actual_hash=actual_hash,
-                    mismatched_files=["(hash mismatch)"],
+                    mismatched_files=mismatched,
                     message=f"[BYPASSED] {msg}",
                     signature_valid=signature_valid,
                     signer_info=signer_info,
@@ -221,12 +374,23 @@ class Integrity:
                 valid=False,
                 expected_hash=expected_hash,
                 actual_hash=actual_hash,
-                mismatched_files=["(hash mismatch)"],
+                mismatched_files=mismatched,
                 message=msg,
                 signature_valid=signature_valid,
                 signer_info=signer_info,
             )
 
+    @classmethod
+    def _signed_changes(cls, scripts_dir: Path, integrity_dir: Path) -> List[str]:
+        """Files that differ from the per-file digests recorded at signing time."""
+        snapshot = integrity_dir / cls.SIGNED_INDEX_FILE
+        if not snapshot.exists():
+            return []
+        try:
+            return cls.changed_files(scripts_dir, cls.HASHED_SCRIPTS, snapshot)
+        except OSError:
+            return []
+
     @classmethod
     def _verify_gpg_signature(cls, manifest_file: Path, signature_file: Path) -> Tuple[bool, Optional[str]]:
         """
@@ -261,6 +425,28 @@ class Integrity:
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
             return (False, None)
 
+    @classmethod
+    def manifest_entries(cls, launcher_root: Path) -> Optional[Dict[str, str]]:
+        """
+        Entries of the integrity manifest ("HASH  name" per line).
+
+        Returns:
+            name -> hash, or None if there is no readable manifest
+        """
+        from core.paths import Paths
+
+        manifest_file = Paths.integrity_dir(launcher_root) / cls.MANIFEST_FILE
+        try:
+            content = manifest_file.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        entries = {}
+        for line in content.splitlines():
+            parts = line.split(None, 1)
+            if len(parts) == 2:
+                entries[parts[1].strip()] = parts[0].lower()
+        return entries
+
     @classmethod
     def create_manifest(cls, launcher_root: Path) -> Tuple[str, Path]:
         """
@@ -280,12 +466,28 @@ class Integrity:
         # Ensure integrity dir exists
         integrity_dir.mkdir(parents=True, exist_ok=True)
 
-        # Calculate hash
-        hash_value = cls.calculate_scripts_hash(scripts_dir)
+        # Calculate hash - always a full read when signing (never trust the index)
+        hash_value = cls.calculate_scripts_hash(scripts_dir, index_file=integrity_dir / cls.INDEX_FILE, paranoid=True)
 
         # Write manifest
+        # CHG-20261016-016: Bytecode bundles are listed too, so the signature
+        # covers the code the launchers actually run
+        lines = [f"{hash_value}  scripts"]
+        bytecode_dir = Paths.smartdrive_dir(launcher_root) / FileNames.BYTECODE_DIR
+        for bundle in sorted(bytecode_dir.glob("*.zip")) if bytecode_dir.is_dir() else []:
+            bundle_hash = hashlib.sha256(bundle.read_bytes()).hexdigest()
+            lines.append(f"{bundle_hash}  {FileNames.BYTECODE_DIR}/{bundle.name}")
         manifest_path = integrity_dir / cls.MANIFEST_FILE
-        manifest_path.write_text(f"{hash_value}  scripts\n", encoding="utf-8")
+        manifest_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        # CHG-20261016-002: Snapshot of per-file digests at signing time, used to
+        # report which files changed when validation later fails
+        index_file = integrity_dir / cls.INDEX_FILE
+        signed_snapshot = integrity_dir / cls.SIGNED_INDEX_FILE
+        try:
+            shutil.copyfile(index_file, signed_snapshot)
+        except OSError:
+            pass
 
         return (hash_value, manifest_path)
 
@@ -367,7 +569,9 @@ class Integrity:
             return None
 
 
-def integrity_gate(launcher_root: Path, bypass_setting: bool = False, on_failure: str = "abort") -> IntegrityResult:
+def integrity_gate(
+    launcher_root: Path, bypass_setting: bool = False, on_failure: str = "abort", paranoid: bool = False
+) -> IntegrityResult:
     """
     Pre-setup/pre-operation integrity gate.
 
@@ -380,6 +584,7 @@ def integrity_gate(launcher_root: Path, bypass_setting: bool = False, on_failure
         launcher_root: Root directory to validate
         bypass_setting: User's bypass preference (from settings/advanced)
         on_failure: "abort" (raise), "warn" (return result), "skip" (return valid)
+        paranoid: If True, re-read every script instead of trusting the digest index
 
     Returns:
         IntegrityResult
@@ -387,7 +592,9 @@ def integrity_gate(launcher_root: Path, bypass_setting: bool = False, on_failure
     Raises:
         RuntimeError: If on_failure="abort" and validation fails
     """
-    result = Integrity.validate_integrity(launcher_root, bypass_enabled=(bypass_setting or on_failure == "skip"))
+    result = Integrity.validate_integrity(
+        launcher_root, bypass_enabled=(bypass_setting or on_failure == "skip"), paranoid=paranoid
+    )
 
     if not result.valid and on_failure == "abort":
         raise RuntimeError(f"Integrity gate failed - aborting operation.\n\n{result.message}")
@@ -42,17 +42,41 @@ class Limits:
     GPG_SIGN_TIMEOUT = 30
     GPG_KEY_AUTH_TIMEOUT = 60  # CHG-20251223-032: Hardware key auth needs time for PIN entry
 
+    # CHG-20261016-021: gpg-agent warm-up (core/gpg_session.py). Decrypts wait
+    # up to READY_TIMEOUT for the agent; the warm-up thread re-polls the agent
+    # socket starting at RETRY_MIN_DELAY, doubling up to RETRY_MAX_DELAY.
+    GPG_SESSION_READY_TIMEOUT = 15
+    GPG_SESSION_RETRY_MIN_DELAY = 0.1
+    GPG_SESSION_RETRY_MAX_DELAY = 1.0
+
+    # CHG-20261016-022: Card presence cache (core/card_presence.py). Without
+    # USB hotplug events a present card is trusted for CACHE_TTL seconds; the
+    # netlink watcher wakes every NETLINK_TIMEOUT seconds to check for stop.
+    CARD_PRESENCE_CACHE_TTL = 5.0
+    CARD_PRESENCE_NETLINK_TIMEOUT = 1.0
+
     # VeraCrypt operations
     VERACRYPT_MOUNT_TIMEOUT = 60
     VERACRYPT_UNMOUNT_TIMEOUT = 30
     VERACRYPT_FORMAT_TIMEOUT = 300  # 5 minutes for volume creation
 
+    # CHG-20261016-024: Mount inventory (core/mount_inventory.py). One
+    # `veracrypt --text --list` answers every mount query for INVENTORY_TTL
+    # seconds (Linux also re-lists when the kernel mount table changes).
+    MOUNT_INVENTORY_TTL = 1.0
+    MOUNT_INVENTORY_LIST_TIMEOUT = 10
+
     # Subprocess default
     SUBPROCESS_DEFAULT_TIMEOUT = 30
 
     # HTTP requests (remote integrity verification, etc.)
     HTTP_REQUEST_TIMEOUT = 30
 
+    # CHG-20261016-009: Resumable update downloads (core/download.py)
+    DOWNLOAD_MAX_RETRIES = 5
+    DOWNLOAD_RETRY_BASE_DELAY = 2  # Seconds, doubled per retry
+    DOWNLOAD_RETRY_MAX_DELAY = 60
+
     # PowerShell operations (Windows drive management, etc.)
     POWERSHELL_QUICK_TIMEOUT = 10
     POWERSHELL_ASSIGN_LETTER_TIMEOUT = 15
@@ -69,6 +93,26 @@ class Limits:
     MIN_LAUNCHER_PARTITION_MB = 100
     MIN_PAYLOAD_PARTITION_MB = 100
 
+    # CHG-20261016-003: Directory hashing (core/hashing.py)
+    HASH_READ_BUFFER_SIZE = 1024 * 1024  # Reusable per-thread read buffer
+    HASH_PREFETCH_MAX_FILE_SIZE = 4 * 1024 * 1024  # Larger files are streamed, not read whole
+    HASH_MMAP_THRESHOLD = 64 * 1024 * 1024  # Stream via mmap at or above this size
+    HASH_MAX_WORKERS = 8  # Upper bound for read-ahead threads
+
+    # CHG-20261016-009: Streaming download chunk size
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+    # CHG-20261016-012: Drive copy pipeline (core/copier.py)
+    COPY_BUFFER_SIZE = 1024 * 1024  # Reusable per-thread copy buffer
+    COPY_MAX_WORKERS = 4  # Outstanding copies; removable media gain little beyond this
+
+    # CHG-20261016-014: Update rollback snapshots (oldest pruned first; newest always kept)
+    SNAPSHOT_KEEP = 3
+    SNAPSHOT_MAX_BYTES = 64 * 1024 * 1024  # Unique object bytes across retained snapshots
+
+    # CHG-20261016-016: Bytecode bundle build with a drive venv interpreter
+    BYTECODE_BUILD_TIMEOUT = 120
+
     # Maximum log file size before rotation (bytes)
     MAX_LOG_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
@@ -97,6 +141,32 @@ class Limits:
     # Delay between retry attempts
     RETRY_DELAY = 1
 
+    # CHG-20261016-001: Mount monitor polling fallback (non-Linux platforms)
+    # Interval starts at MIN, grows by BACKOFF while unchanged, capped at MAX
+    MOUNT_MONITOR_MIN_INTERVAL = 1.0
+    MOUNT_MONITOR_MAX_INTERVAL = 15.0
+    MOUNT_MONITOR_BACKOFF = 1.5
+
+    # CHG-20261016-020: Remote-drive health checks (core/drive_health.py)
+    # Checked every INTERVAL while healthy; a probe taking longer than
+    # PROBE_TIMEOUT counts as failed. Failed cycles are retried after
+    # RETRY_MIN_INTERVAL, growing by BACKOFF up to MAX_INTERVAL; missing
+    # paths disconnect at once, other failures after FAILURE_THRESHOLD cycles.
+    DRIVE_HEALTH_INTERVAL = 5.0
+    DRIVE_HEALTH_PROBE_TIMEOUT = 2.0
+    DRIVE_HEALTH_RETRY_MIN_INTERVAL = 1.0
+    DRIVE_HEALTH_BACKOFF = 2.0
+    DRIVE_HEALTH_MAX_INTERVAL = 60.0
+    DRIVE_HEALTH_FAILURE_THRESHOLD = 3
+
+    # Storage display refresh while the GUI is open (mount changes are event-driven)
+    STORAGE_REFRESH_INTERVAL_MS = 15000
+
+    # CHG-20261016-002: Integrity digest index "racy" window (nanoseconds).
+    # FAT32/exFAT mtimes have 2 s resolution; files modified this close to the
+    # index write are re-hashed instead of trusted.
+    INTEGRITY_INDEX_RACY_WINDOW_NS = 2_000_000_000
+
     # Diskpart device readiness retry delay (Windows)
     DISKPART_DEVICE_READY_RETRY_DELAY_SECONDS = 2
 
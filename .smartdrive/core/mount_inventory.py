@@ -0,0 +1,422 @@
+# core/mount_inventory.py - SINGLE SOURCE OF TRUTH for "what is mounted where"
+"""
+Structured inventory of mounted VeraCrypt volumes, merged with the OS mount table.
+
+CHG-20261016-024: veracrypt_cli.get_mount_status() ran `veracrypt --text --list`
+on every call and substring-matched the mount point against stdout; the GUI's
+credential test and rekey flow, recovery's header backup and mount.py's
+mount point check each asked again in their own way, often within the same
+second. They now share one snapshot:
+
+- VeraCrypt's verbose listing is parsed once into MountSlot records (slot,
+  volume, virtual device, mount point, size, type, read-only).
+- The OS mount table is merged in: /proc/self/mountinfo on Linux (source and
+  filesystem type per mount point), logical drive letters on Windows.
+- The snapshot is reused for MOUNT_INVENTORY_TTL seconds. On Linux it is
+  also dropped as soon as the kernel mount table changes (an in-process
+  read), so a mount or unmount is never hidden by the cache.
+- Windows VeraCrypt has no command-line listing; there the inventory has
+  no slots and mount questions are answered from drive letters.
+
+Usage:
+    from core.mount_inventory import get_mount_inventory
+
+    inventory = get_mount_inventory()
+    if inventory.is_mounted("~/veradrive"):
+        slot = inventory.find(mount_point="~/veradrive")
+        print(slot.slot, slot.volume, slot.size)
+"""
+
+import logging
+import os
+import platform
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.constants import ConfigKeys
+from core.limits import Limits
+from core.mount_monitor import PROC_MOUNTINFO, parse_mountinfo_table
+
+# Logger for mount inventory operations
+_inventory_logger = logging.getLogger("SmartDrive.mount_inventory")
+
+# `veracrypt --text --list` short form: "1: /path/vol.hc /dev/mapper/veracrypt1 /mnt/x"
+_SHORT_LIST_RE = re.compile(r"^\s*(\d+):\s+(.*)$")
+
+# Listing output when nothing is mounted (returned with a non-zero exit code)
+_NO_VOLUMES_MARKER = "no volumes mounted"
+
+# Listing function: raw `--list` stdout, "" when nothing is mounted, None when unavailable
+VolumeLister = Callable[[], Optional[str]]
+
+
+@dataclass(frozen=True)
+class MountSlot:
+    """One mounted VeraCrypt volume."""
+
+    slot: int
+    volume: str
+    mount_point: str
+    virtual_device: str = ""
+    size: str = ""
+    volume_type: str = ""  # "Normal", "Hidden", ...
+    read_only: bool = False
+    fs_type: str = ""  # From the OS mount table (Linux)
+
+    def as_dict(self) -> dict:
+        """Dict form for callers that expect the legacy list-of-dicts shape."""
+        return {
+            "slot": self.slot,
+            "volume": self.volume,
+            ConfigKeys.MOUNT_POINT: self.mount_point,
+            "virtual_device": self.virtual_device,
+            "size": self.size,
+            "type": self.volume_type,
+            "read_only": self.read_only,
+            "fs_type": self.fs_type,
+        }
+
+
+@dataclass(frozen=True)
+class InventorySnapshot:
+    """Mounted volumes and OS mount table at one point in time."""
+
+    slots: Tuple[MountSlot, ...] = ()
+    os_mounts: Optional[Dict[str, Tuple[str, str]]] = None  # mount point -> (source, fstype); None = unknown
+    listing_available: bool = False  # False: VeraCrypt missing, failed, or cannot list (Windows)
+    taken_at: float = 0.0  # time.monotonic()
+    system: str = ""
+    mount_table_raw: Optional[str] = field(default=None, repr=False)
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+
+def normalize_mount_point(path: str, system: Optional[str] = None) -> str:
+    """
+    Canonical form used to compare mount points.
+
+    Windows: "V", "V:", "v:\\" -> "V:". Elsewhere: ~ expanded, path normalized
+    (no realpath: resolving symlinks could block on a dead remote mount).
+    """
+    system = system or platform.system().lower()
+    path = str(path or "").strip()
+    if not path:
+        return ""
+    if system == "windows" and re.match(r"^[A-Za-z](:[\\/]?)?$", path):
+        return path[0].upper() + ":"
+    return os.path.normpath(os.path.expanduser(path))
+
+
+def _parse_verbose_listing(output: str) -> List[dict]:
+    """Parse `--text --list --verbose` blocks ("Slot: 1", "Volume: ...", ...)."""
+    records: List[dict] = []
+    current: Optional[dict] = None
+    for line in output.splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip().lower()
+        value = value.strip()
+        if key == "slot":
+            current = {"slot": value}
+            records.append(current)
+        elif current is not None:
+            current[key] = value
+    return records
+
+
+def _parse_short_listing(output: str) -> List[dict]:
+    """Parse the one-line-per-volume form: "<slot>: <volume> <device> <mount point>"."""
+    records = []
+    for line in output.splitlines():
+        match = _SHORT_LIST_RE.match(line)
+        if not match:
+            continue
+        fields = match.group(2).split(" ")
+        if len(fields) < 3:
+            continue
+        # Volume and mount point may contain spaces; the device is "-" or /dev/...
+        device_index = next(
+            (i for i in range(1, len(fields) - 1) if fields[i] == "-" or fields[i].startswith("/dev/")),
+            1,
+        )
+        records.append(
+            {
+                "slot": match.group(1),
+                "volume": " ".join(fields[:device_index]),
+                "virtual device": fields[device_index],
+                "mount directory": " ".join(fields[device_index + 1 :]),
+            }
+        )
+    return records
+
+
+def parse_veracrypt_list(output: str) -> List[MountSlot]:
+    """
+    Parse VeraCrypt's `--text --list [--verbose]` output into slot records.
+
+    Args:
+        output: Listing stdout (verbose or short form)
+
+    Returns:
+        MountSlot per mounted volume, ordered by slot
+    """
+    records = _parse_verbose_listing(output) or _parse_short_listing(output)
+    slots = []
+    for record in records:
+        try:
+            slot_number = int(record.get("slot", ""))
+        except ValueError:
+            continue
+        device = record.get("virtual device", "")
+        slots.append(
+            MountSlot(
+                slot=slot_number,
+                volume=record.get("volume", ""),
+                mount_point=record.get("mount directory", ""),
+                virtual_device="" if device == "-" else device,
+                size=record.get("size", ""),
+                volume_type=record.get("type", ""),
+                read_only=record.get("read-only", "").lower() == "yes",
+            )
+        )
+    return sorted(slots, key=lambda s: s.slot)
+
+
+# =============================================================================
+# Data sources
+# =============================================================================
+
+
+def _veracrypt_exe() -> Optional[Path]:
+    """VeraCrypt CLI through the shared tool cache (same entry as veracrypt_cli)."""
+    from core.paths import Paths
+    from core.tool_cache import which_tool
+
+    return which_tool("veracrypt", fallbacks=lambda: [Paths.veracrypt_exe()])
+
+
+def run_veracrypt_list() -> Optional[str]:
+    """
+    Run `veracrypt --text --list --verbose` once.
+
+    Returns:
+        Listing stdout, "" if no volumes are mounted, None if unavailable
+    """
+    if platform.system().lower() == "windows":
+        # VeraCrypt.exe has no listing switch (/l selects a drive letter)
+        return None
+    vc_exe = _veracrypt_exe()
+    if vc_exe is None:
+        return None
+    try:
+        result = subprocess.run(
+            [str(vc_exe), "--text", "--list", "--verbose", "--non-interactive"],
+            capture_output=True,
+            text=True,
+            timeout=Limits.MOUNT_INVENTORY_LIST_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        _inventory_logger.debug(f"VeraCrypt listing failed: {e}")
+        return None
+    if result.returncode == 0:
+        return result.stdout
+    if _NO_VOLUMES_MARKER in (result.stderr + result.stdout).lower():
+        return ""
+    _inventory_logger.debug(f"VeraCrypt listing exited {result.returncode}: {result.stderr.strip()[:200]}")
+    return None
+
+
+def _windows_drive_letters() -> Dict[str, Tuple[str, str]]:
+    """Logical drive letters in use (GetLogicalDrives bitmask, no subprocess)."""
+    import ctypes
+
+    mask = ctypes.windll.kernel32.GetLogicalDrives()
+    return {f"{chr(ord('A') + i)}:": ("", "") for i in range(26) if mask & (1 << i)}
+
+
+def read_os_mount_table(system: Optional[str] = None) -> Tuple[Optional[Dict[str, Tuple[str, str]]], Optional[str]]:
+    """
+    Read the OS mount table in-process.
+
+    Returns:
+        (table, raw) where table maps mount point -> (source, fstype), or None
+        where no table is available (macOS); raw is the Linux mountinfo text
+    """
+    system = system or platform.system().lower()
+    if system == "windows":
+        try:
+            return _windows_drive_letters(), None
+        except (OSError, AttributeError) as e:
+            _inventory_logger.debug(f"Drive letters unavailable: {e}")
+            return None, None
+    try:
+        raw = PROC_MOUNTINFO.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None, None
+    return parse_mountinfo_table(raw), raw
+
+
+# =============================================================================
+# Inventory
+# =============================================================================
+
+
+class MountInventory:
+    """
+    Short-lived shared snapshot of mounted volumes.
+
+    Concurrent callers share one listing; a fresh snapshot is taken after
+    MOUNT_INVENTORY_TTL seconds, when the Linux mount table changes, or
+    after invalidate() (called by veracrypt_cli after mount/unmount).
+    """
+
+    def __init__(
+        self,
+        list_volumes: VolumeLister = run_veracrypt_list,
+        read_mount_table: Optional[Callable[[], tuple]] = None,
+        system: Optional[str] = None,
+    ):
+        """
+        Initialize mount inventory.
+
+        Args:
+            list_volumes: Returns VeraCrypt listing output (tests)
+            read_mount_table: Returns (table, raw) like read_os_mount_table (tests)
+            system: Platform override (defaults to platform.system().lower())
+        """
+        self.system = system or platform.system().lower()
+        self._list_volumes = list_volumes
+        self._read_mount_table = read_mount_table or (lambda: read_os_mount_table(self.system))
+        self._lock = threading.Lock()
+        self._snapshot: Optional[InventorySnapshot] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def snapshot(self, refresh: bool = False) -> InventorySnapshot:
+        """
+        Return the current inventory, listing VeraCrypt only if the cache is stale.
+
+        Args:
+            refresh: Ignore the cache and list now
+        """
+        with self._lock:
+            table, raw = self._read_mount_table()
+            cached = self._snapshot
+            if (
+                not refresh
+                and cached is not None
+                and time.monotonic() - cached.taken_at < Limits.MOUNT_INVENTORY_TTL
+                and raw == cached.mount_table_raw
+            ):
+                return cached
+
+            listing = self._list_volumes()
+            slots = parse_veracrypt_list(listing) if listing else []
+            if table is not None:
+                slots = [self._merge_os_data(slot, table) for slot in slots]
+            self._snapshot = InventorySnapshot(
+                slots=tuple(slots),
+                os_mounts=table,
+                listing_available=listing is not None,
+                taken_at=time.monotonic(),
+                system=self.system,
+                mount_table_raw=raw,
+            )
+            return self._snapshot
+
+    def slots(self) -> Tuple[MountSlot, ...]:
+        """Mounted VeraCrypt volumes."""
+        return self.snapshot().slots
+
+    def find(self, mount_point: Optional[str] = None, volume: Optional[str] = None) -> Optional[MountSlot]:
+        """
+        Find the slot mounted at mount_point and/or holding volume.
+
+        Args:
+            mount_point: Mount directory (Unix) or drive letter (Windows)
+            volume: Volume path or device
+        """
+        wanted_mp = normalize_mount_point(mount_point, self.system) if mount_point else None
+        wanted_vol = normalize_mount_point(volume, self.system) if volume else None
+        for slot in self.slots():
+            if wanted_mp and normalize_mount_point(slot.mount_point, self.system) != wanted_mp:
+                continue
+            if wanted_vol and normalize_mount_point(slot.volume, self.system) != wanted_vol:
+                continue
+            return slot
+        return None
+
+    def is_mounted(self, mount_point: str) -> bool:
+        """
+        True if a VeraCrypt volume is mounted at mount_point.
+
+        Where VeraCrypt cannot be listed (Windows, or the CLI is missing) the
+        OS mount table answers instead: the drive letter / path is in use.
+        """
+        if not mount_point:
+            return False
+        snap = self.snapshot()
+        if snap.listing_available:
+            return self.find(mount_point=mount_point) is not None
+        return self._in_os_table(snap.os_mounts, mount_point)
+
+    def os_mounted(self, path: str) -> bool:
+        """
+        True if the OS reports something mounted at path (any filesystem).
+
+        Reads only the OS mount table; VeraCrypt is not listed.
+        """
+        table, _raw = self._read_mount_table()
+        return self._in_os_table(table, path)
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot (after mount/unmount)."""
+        self._snapshot = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _in_os_table(self, table: Optional[Dict[str, Tuple[str, str]]], path: str) -> bool:
+        wanted = normalize_mount_point(path, self.system)
+        if table is not None:
+            return wanted in table
+        # No mount table (macOS): stat-based check
+        try:
+            return os.path.ismount(wanted)
+        except OSError:
+            return False
+
+    def _merge_os_data(self, slot: MountSlot, table: Dict[str, Tuple[str, str]]) -> MountSlot:
+        entry = table.get(normalize_mount_point(slot.mount_point, self.system))
+        if entry is None or not entry[1]:
+            return slot
+        return replace(slot, fs_type=entry[1])
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+_inventory: Optional[MountInventory] = None
+_inventory_lock = threading.Lock()
+
+
+def get_mount_inventory() -> MountInventory:
+    """Return the process-wide mount inventory."""
+    global _inventory
+    with _inventory_lock:
+        if _inventory is None:
+            _inventory = MountInventory()
+        return _inventory
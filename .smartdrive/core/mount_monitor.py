@@ -0,0 +1,445 @@
+# core/mount_monitor.py - SINGLE SOURCE OF TRUTH for mount-state change detection
+"""
+Event-driven mount-state monitor.
+
+CHG-20261016-001: Replaces the fixed 2-second polling in the GUI (which re-read
+config.json and spawned `mountpoint -q` on every tick) with one shared service.
+
+Backends:
+- Linux: blocks in poll(POLLPRI) on /proc/self/mountinfo; the kernel wakes us
+  only when the mount table changes. No subprocesses, no periodic wakeups.
+- Other platforms: adaptive-interval poller. The interval starts short and
+  backs off while nothing changes; refresh() forces an immediate re-check.
+
+Consumers:
+- GUI/tray: create_qt_mount_signal() exposes a Qt signal (queued across threads)
+- CLI: MountMonitor.is_mounted() returns the cached state while the monitor
+  runs, or performs a cheap in-process probe when it does not.
+
+Usage:
+    from core.mount_monitor import MountMonitor
+
+    monitor = MountMonitor(config_file)
+    monitor.add_listener(lambda mounted: print("mounted" if mounted else "unmounted"))
+    monitor.start()
+"""
+
+import json
+import logging
+import os
+import platform
+import select
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.constants import ConfigKeys
+from core.limits import Limits
+
+# Logger for mount monitor operations
+_monitor_logger = logging.getLogger("SmartDrive.mount_monitor")
+
+# Kernel mount table for the current mount namespace
+PROC_MOUNTINFO = Path("/proc/self/mountinfo")
+
+# Listener signature: called with the new mounted state
+MountListener = Callable[[bool], None]
+
+
+# =============================================================================
+# Mount Target Resolution
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class MountTarget:
+    """Where the volume is expected to be mounted on this platform."""
+
+    system: str  # "windows", "linux", "darwin", ...
+    location: str  # Drive letter ("V") on Windows, absolute mount path elsewhere
+
+
+def resolve_mount_target(cfg: dict, system: Optional[str] = None) -> Optional[MountTarget]:
+    """
+    Resolve the configured mount target from a config dict.
+
+    Args:
+        cfg: Parsed config.json contents
+        system: Platform override (defaults to platform.system().lower())
+
+    Returns:
+        MountTarget or None if no mount point is configured
+    """
+    system = system or platform.system().lower()
+
+    if system == "windows":
+        letter = (cfg.get(ConfigKeys.WINDOWS) or {}).get(ConfigKeys.MOUNT_LETTER, "V")
+        letter = str(letter or "V").strip().rstrip(":").upper()[:1]
+        return MountTarget(system=system, location=letter) if letter else None
+
+    mount_point = (cfg.get(ConfigKeys.UNIX) or {}).get(ConfigKeys.MOUNT_POINT, "")
+    if not mount_point:
+        return None
+    resolved = os.path.realpath(os.path.expanduser(mount_point))
+    return MountTarget(system=system, location=resolved)
+
+
+# =============================================================================
+# Mount Probes (in-process, no subprocesses)
+# =============================================================================
+
+
+def _unescape_mountinfo(field: str) -> str:
+    """Decode the octal escapes (\\040 etc.) used in /proc mount tables."""
+    if "\\" not in field:
+        return field
+    out = []
+    i = 0
+    while i < len(field):
+        if field[i] == "\\" and i + 3 < len(field) and field[i + 1 : i + 4].isdigit():
+            out.append(chr(int(field[i + 1 : i + 4], 8)))
+            i += 4
+        else:
+            out.append(field[i])
+            i += 1
+    return "".join(out)
+
+
+def parse_mountinfo_table(content: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Map mount point -> (source, fstype) from /proc/self/mountinfo content.
+
+    CHG-20261016-024: The one mountinfo parser; the monitor probe and the
+    mount inventory (core.mount_inventory) both use it.
+
+    Field 5 (index 4) is the mount point relative to the process root.
+    Optional fields end at the " - " separator; fstype and source follow it.
+    Later entries win, matching the kernel's view of stacked mounts.
+
+    Args:
+        content: Raw mountinfo text
+
+    Returns:
+        Dict of mount point -> (source, fstype)
+    """
+    table = {}
+    for line in content.splitlines():
+        head, sep, tail = line.partition(" - ")
+        parts = head.split(" ")
+        if not sep or len(parts) < 5:
+            continue
+        after = tail.split(" ")
+        fstype = after[0] if after else ""
+        source = _unescape_mountinfo(after[1]) if len(after) > 1 else ""
+        table[_unescape_mountinfo(parts[4])] = (source, fstype)
+    return table
+
+
+def _probe_windows(letter: str) -> bool:
+    """Windows: the drive letter exists and can be listed."""
+    drive_path = Path(f"{letter}:/")
+    try:
+        if drive_path.exists() and drive_path.is_dir():
+            next(iter(os.scandir(drive_path)), None)
+            return True
+    except (OSError, PermissionError):
+        pass
+    return False
+
+
+def probe_mount_state(target: Optional[MountTarget], mountinfo: Optional[str] = None) -> bool:
+    """
+    Determine whether the target is currently mounted.
+
+    Args:
+        target: Resolved mount target (None = not configured)
+        mountinfo: Pre-read /proc/self/mountinfo content (Linux only)
+
+    Returns:
+        True if mounted, False otherwise
+    """
+    if target is None:
+        return False
+
+    if target.system == "windows":
+        return _probe_windows(target.location)
+
+    if target.system == "linux":
+        if mountinfo is None:
+            try:
+                mountinfo = PROC_MOUNTINFO.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                mountinfo = None
+        if mountinfo is not None:
+            return target.location in parse_mountinfo_table(mountinfo)
+
+    # macOS / other Unix (or Linux without /proc): stat-based check
+    try:
+        return os.path.ismount(target.location)
+    except OSError:
+        return False
+
+
+# =============================================================================
+# Mount Monitor
+# =============================================================================
+
+
+class MountMonitor:
+    """
+    Watches the mount state of the configured VeraCrypt volume.
+
+    The config file is read once and re-read only when its mtime changes.
+    Listeners are invoked from the monitor thread on state transitions.
+    """
+
+    def __init__(self, config_file: Path, system: Optional[str] = None):
+        """
+        Initialize mount monitor.
+
+        Args:
+            config_file: Path to config.json containing the mount target
+            system: Platform override (tests)
+        """
+        self.config_file = Path(config_file)
+        self.system = system or platform.system().lower()
+
+        self._listeners: List[MountListener] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._wake_pipe: Optional[tuple] = None
+
+        self._target: Optional[MountTarget] = None
+        self._config_mtime_ns: Optional[int] = None
+        self._state: Optional[bool] = None
+        self._backend: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        """True while the background watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def backend(self) -> str:
+        """Name of the change-detection backend in use."""
+        if self._backend is None:
+            if self.system == "linux" and hasattr(select, "poll") and PROC_MOUNTINFO.exists():
+                self._backend = "mountinfo"
+            else:
+                self._backend = "poll"
+        return self._backend
+
+    def add_listener(self, listener: MountListener) -> None:
+        """Register a callback invoked with the new state on every transition."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: MountListener) -> None:
+        """Unregister a previously added callback."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def target(self) -> Optional[MountTarget]:
+        """Return the mount target, re-reading config.json only if it changed."""
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
+            self._target = None
+            self._config_mtime_ns = None
+            return None
+
+        if mtime_ns != self._config_mtime_ns:
+            try:
+                with open(self.config_file, "r", encoding="utf-8") as f:
+                    cfg = json.load(f)
+                self._target = resolve_mount_target(cfg, self.system)
+            except (OSError, ValueError) as e:
+                _monitor_logger.debug(f"Could not read mount target from config: {e}")
+                self._target = None
+            self._config_mtime_ns = mtime_ns
+        return self._target
+
+    def is_mounted(self) -> bool:
+        """
+        Return the current mount state.
+
+        While the event-driven (mountinfo) watcher runs this is the cached
+        state (no I/O). Otherwise a fresh in-process probe is performed, so a
+        backed-off poller never returns a stale answer to a direct query.
+        """
+        if self.running and self.backend == "mountinfo" and self._state is not None:
+            return self._state
+        return self.check_now()
+
+    def check_now(self) -> bool:
+        """Probe immediately, update the cached state and notify on change."""
+        state = probe_mount_state(self.target())
+        self._update_state(state)
+        return state
+
+    def refresh(self) -> None:
+        """
+        Request an immediate re-check.
+
+        Call after a mount/unmount action completes so pollers do not wait
+        for their backed-off interval.
+        """
+        self._wake_event.set()
+        if self._wake_pipe is not None:
+            try:
+                os.write(self._wake_pipe[1], b"r")
+            except OSError:
+                pass
+
+    def start(self) -> None:
+        """Start the background watcher thread (idempotent)."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self.check_now()
+        worker = self._run_mountinfo if self.backend == "mountinfo" else self._run_poller
+        self._thread = threading.Thread(target=worker, name="MountMonitor", daemon=True)
+        self._thread.start()
+        _monitor_logger.info(f"Mount monitor started (backend={self.backend})")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the background watcher thread."""
+        self._stop_event.set()
+        self.refresh()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        _monitor_logger.info("Mount monitor stopped")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _update_state(self, state: bool) -> None:
+        """Store state and notify listeners if it changed."""
+        with self._lock:
+            previous = self._state
+            self._state = state
+            listeners = list(self._listeners) if previous is not None and previous != state else []
+
+        for listener in listeners:
+            try:
+                listener(state)
+            except Exception as e:
+                _monitor_logger.warning(f"Mount listener failed: {e}")
+
+    def _run_mountinfo(self) -> None:
+        """Linux backend: wait for POLLPRI on /proc/self/mountinfo."""
+        read_fd, write_fd = os.pipe()
+        self._wake_pipe = (read_fd, write_fd)
+        try:
+            with open(PROC_MOUNTINFO, "r", encoding="utf-8", errors="replace") as mountinfo:
+                poller = select.poll()
+                poller.register(mountinfo.fileno(), select.POLLPRI | select.POLLERR)
+                poller.register(read_fd, select.POLLIN)
+
+                while not self._stop_event.is_set():
+                    # The kernel signals POLLPRI|POLLERR once per table change;
+                    # re-reading the file from the start re-arms the event.
+                    mountinfo.seek(0)
+                    content = mountinfo.read()
+                    self._update_state(probe_mount_state(self.target(), content))
+
+                    events = poller.poll()
+                    for fd, _ in events:
+                        if fd == read_fd:
+                            os.read(read_fd, 64)
+        except OSError as e:
+            _monitor_logger.warning(f"mountinfo watcher failed, falling back to polling: {e}")
+            self._wake_pipe = None
+            self._backend = "poll"
+            self._run_poller()
+        finally:
+            self._wake_pipe = None
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def _run_poller(self) -> None:
+        """Portable backend: adaptive-interval polling with back-off."""
+        interval = Limits.MOUNT_MONITOR_MIN_INTERVAL
+        while not self._stop_event.is_set():
+            self._wake_event.wait(interval)
+            forced = self._wake_event.is_set()
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+
+            previous = self._state
+            state = self.check_now()
+            if forced or state != previous:
+                interval = Limits.MOUNT_MONITOR_MIN_INTERVAL
+            else:
+                interval = min(interval * Limits.MOUNT_MONITOR_BACKOFF, Limits.MOUNT_MONITOR_MAX_INTERVAL)
+
+
+# =============================================================================
+# Shared instance and Qt bridge
+# =============================================================================
+
+_monitors: dict = {}
+_monitors_lock = threading.Lock()
+
+
+def get_mount_monitor(config_file: Path) -> MountMonitor:
+    """
+    Return the process-wide monitor for a config file.
+
+    GUI, tray and CLI share one instance so the mount table is watched once.
+    """
+    key = str(Path(config_file).resolve())
+    with _monitors_lock:
+        monitor = _monitors.get(key)
+        if monitor is None:
+            monitor = MountMonitor(Path(config_file))
+            _monitors[key] = monitor
+        return monitor
+
+
+_qt_signal_class = None
+
+
+def create_qt_mount_signal(monitor: MountMonitor, parent=None):
+    """
+    Create a QObject exposing `mount_state_changed(bool)` for a monitor.
+
+    Listener callbacks run on the monitor thread; emitting a Qt signal from
+    there is delivered to slots in the receiver's thread (queued connection),
+    so GUI code can connect widgets directly.
+
+    Args:
+        monitor: MountMonitor to bridge
+        parent: Optional QObject parent
+
+    Returns:
+        QObject with a `mount_state_changed` pyqtSignal; its `listener`
+        attribute is the callback registered on the monitor (pass it to
+        remove_listener() to detach the bridge)
+    """
+    global _qt_signal_class
+    if _qt_signal_class is None:
+        from PyQt6.QtCore import QObject, pyqtSignal
+
+        class MountStateSignal(QObject):
+            """Qt signal source for mount-state transitions."""
+
+            mount_state_changed = pyqtSignal(bool)
+
+        _qt_signal_class = MountStateSignal
+
+    bridge = _qt_signal_class(parent)
+    bridge.listener = bridge.mount_state_changed.emit
+    monitor.add_listener(bridge.listener)
+    return bridge
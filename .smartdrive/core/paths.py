@@ -44,6 +44,7 @@ class Paths:
     INTEGRITY_SUBDIR = "integrity"
     RECOVERY_SUBDIR = "recovery"
     STATIC_SUBDIR = "static"  # Static assets under .smartdrive/
+    LOCALES_SUBDIR = "locales"  # Translation catalogs under .smartdrive/ (CHG-20261016-019)
     DOCUMENTATION_SUBDIR = "docs"  # Documentation directory under .smartdrive/
 
     # Legacy static assets directory name (at launcher root)
@@ -37,14 +37,16 @@ import hmac
 import logging
 import os
 import subprocess
-import tempfile
 import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, Optional, Tuple
 
+from core.card_presence import get_card_presence
 from core.constants import CryptoParams, FileNames, UserInputs
+from core.ephemeral_keyfile import create_ephemeral_keyfile, discard_ephemeral_keyfile
+from core.gpg_session import get_gpg_session
 from core.limits import Limits
 
 # Core SSOT imports
@@ -140,24 +142,13 @@ def _check_yubikey_presence() -> Tuple[bool, str]:
     Without --no-tty, gpg may wait for TTY input when called multiple times,
     causing the terminal to hang/become unresponsive.
 
+    CHG-20261016-022: Answered from the shared card presence cache; the
+    `gpg --card-status` probe runs only after a USB hotplug event.
+
     Returns:
         Tuple of (is_present: bool, error_message: str)
     """
-    try:
-        result = subprocess.run(["gpg", "--no-tty", "--card-status"], capture_output=True, timeout=GPG_DECRYPT_TIMEOUT)
-        if result.returncode == 0:
-            return True, ""
-        else:
-            stderr = result.stderr.decode("utf-8", errors="replace")
-            if "no card" in stderr.lower() or "card error" in stderr.lower():
-                return False, "No YubiKey/smartcard detected"
-            return False, f"GPG card status failed: {stderr[:100]}"
-    except FileNotFoundError:
-        return False, "GPG not installed or not in PATH"
-    except subprocess.TimeoutExpired:
-        return False, "GPG card status timed out (YubiKey may be unresponsive)"
-    except Exception as e:
-        return False, f"Error checking YubiKey: {e}"
+    return get_card_presence().is_present()
 
 
 def require_yubikey_or_fail(operation: str) -> None:
@@ -176,9 +167,6 @@ def require_yubikey_or_fail(operation: str) -> None:
 # GPG Decryption Helpers
 # =============================================================================
 
-# Track if we've already retried GPG startup (to avoid infinite retries)
-_gpg_startup_retry_attempted = False
-
 
 def _decrypt_gpg_file_to_bytes(
     gpg_file_path: Path,
@@ -190,7 +178,12 @@ def _decrypt_gpg_file_to_bytes(
 
     BUG-20260102-014: Added retry logic for GPG startup issues on Windows.
     On first boot, GPG agent may not be fully initialized, causing the first
-    mount attempt to fail. This function will retry once after a short delay.
+    mount attempt to fail.
+
+    CHG-20261016-021: Waits on the GpgSession readiness event instead of a
+    fixed sleep. The session is normally warmed at launch, so the wait
+    returns at once; an IPC error restarts the warm-up and the single retry
+    runs as soon as the agent answers again.
 
     Args:
         gpg_file_path: Path to .gpg file
@@ -203,8 +196,6 @@ def _decrypt_gpg_file_to_bytes(
     Raises:
         DecryptionError: If decryption fails
     """
-    global _gpg_startup_retry_attempted
-
     if not gpg_file_path.exists():
         raise DecryptionError(f"GPG file not found: {gpg_file_path}")
 
@@ -216,11 +207,16 @@ def _decrypt_gpg_file_to_bytes(
             timeout=GPG_DECRYPT_TIMEOUT,
         )
 
+    session = get_gpg_session()
+    if not session.agent_ready:
+        if status_callback:
+            status_callback("⏳ GPG services starting up, please wait...")
+        session.wait_ready()
+
     try:
         result = attempt_decrypt()
 
         if result.returncode == 0:
-            _gpg_startup_retry_attempted = False  # Reset for next time
             return result.stdout
 
         stderr = result.stderr.decode("utf-8", errors="replace")
@@ -235,28 +231,23 @@ def _decrypt_gpg_file_to_bytes(
             and "not running" in stderr_lower
         )
 
-        if is_startup_error and retry_on_startup and not _gpg_startup_retry_attempted:
-            _gpg_startup_retry_attempted = True
-
+        if is_startup_error and retry_on_startup:
             if status_callback:
                 status_callback("⏳ GPG services starting up, please wait...")
 
-            # Wait for GPG to initialize
-            import time
-
-            time.sleep(3)
-
-            if status_callback:
-                status_callback("🔄 Retrying GPG decryption...")
+            # Re-warm gpg-agent/scdaemon and wait for the round trip
+            session.restart()
+            if session.wait_ready():
+                if status_callback:
+                    status_callback("🔄 Retrying GPG decryption...")
 
-            # Retry the decryption
-            result = attempt_decrypt()
+                result = attempt_decrypt()
 
-            if result.returncode == 0:
-                return result.stdout
+                if result.returncode == 0:
+                    return result.stdout
 
-            # Still failed - get updated error
-            stderr = result.stderr.decode("utf-8", errors="replace")
+                # Still failed - get updated error
+                stderr = result.stderr.decode("utf-8", errors="replace")
 
         # Generate user-friendly error message
         from core.dependencies import format_gpg_error_with_guidance
@@ -328,55 +319,6 @@ def _derive_password_from_seed(seed: bytes, salt: bytes, info: bytes = HKDF_INFO
     return password
 
 
-# =============================================================================
-# RAM Temp Directory for Decrypted Keyfiles
-# =============================================================================
-
-
-def _get_ram_temp_dir() -> Path:
-    """
-    Get a RAM-backed temp directory for sensitive files.
-
-    On Linux: Uses /dev/shm if available
-    On Windows/macOS: Uses system temp (less secure, but no tmpfs available)
-
-    Returns:
-        Path to temp directory
-    """
-    # Try Linux tmpfs first
-    if os.name != "nt":
-        dev_shm = Path("/dev/shm")
-        if dev_shm.exists() and dev_shm.is_dir():
-            smartdrive_tmp = dev_shm / "smartdrive_tmp"
-            try:
-                smartdrive_tmp.mkdir(mode=0o700, exist_ok=True)
-                return smartdrive_tmp
-            except OSError:
-                pass
-
-    # Fallback to system temp
-    return Path(tempfile.gettempdir())
-
-
-def _secure_delete_file(file_path: Path) -> None:
-    """Securely delete a file by overwriting with random data."""
-    if not file_path.exists():
-        return
-    try:
-        file_size = file_path.stat().st_size
-        with open(file_path, "wb") as f:
-            for _ in range(3):  # 3 passes
-                f.write(os.urandom(file_size))
-                f.flush()
-                os.fsync(f.fileno())
-        file_path.unlink()
-    except Exception:
-        try:
-            file_path.unlink()
-        except Exception:
-            pass
-
-
 # =============================================================================
 # Secret Provider - Main Class
 # =============================================================================
@@ -784,17 +726,10 @@ class SecretProvider:
         # Decrypt keyfile
         keyfile_bytes = _decrypt_gpg_file_to_bytes(self.keyfile_gpg_path)
 
-        # Write to RAM temp
-        ram_dir = _get_ram_temp_dir()
-        temp_path = ram_dir / f"keyfile_{os.urandom(4).hex()}.key"
-
+        # CHG-20261016-025: Sealed memfd on Linux, RAM temp file elsewhere
         try:
-            temp_path.write_bytes(keyfile_bytes)
-            # Restrict permissions
-            if os.name != "nt":
-                temp_path.chmod(0o600)
-            self._temp_keyfile_path = temp_path
-            return temp_path
+            self._temp_keyfile_path = create_ephemeral_keyfile(keyfile_bytes, prefix="keyfile_")
+            return self._temp_keyfile_path
         finally:
             # Wipe keyfile bytes from memory
             buffer = bytearray(keyfile_bytes)
@@ -816,8 +751,8 @@ class SecretProvider:
 
     def _cleanup_temp_keyfile(self) -> None:
         """Securely delete temp keyfile if it exists."""
-        if self._temp_keyfile_path and self._temp_keyfile_path.exists():
-            _secure_delete_file(self._temp_keyfile_path)
+        if self._temp_keyfile_path:
+            discard_ephemeral_keyfile(self._temp_keyfile_path)
             self._temp_keyfile_path = None
         if self._temp_keyfile_timer:
             self._temp_keyfile_timer.cancel()
@@ -0,0 +1,398 @@
+# core/snapshot.py - SINGLE SOURCE OF TRUTH for deployment snapshots and rollback
+"""
+Content-addressed snapshots of the deployed .smartdrive tree.
+
+CHG-20261016-014: scripts/update.py only backed up config.json before the
+overlay, so a failed or broken update meant a full redeploy from a
+workstation. The external drive update now snapshots the installed tree
+first and can roll back to it.
+
+Layout (FileNames.SNAPSHOT_DIR inside the deploy root):
+
+    objects/ab/abcdef...       file contents, named by SHA-256
+    snapshots/<id>.json        {rel path: [sha256, size]} plus version/label
+    index.json                 stat cache of the live tree
+    HEAD                       id of the snapshot matching the live tree
+
+- Objects are shared by every snapshot, so a snapshot only costs the files
+  that changed since the previous one.
+- The stat cache ((size, mtime_ns) -> digest, same racy-clean rule as
+  core/integrity.py and core/sync.py) means only files written since the
+  last snapshot are read again.
+- Rollback compares the live tree against the target snapshot and replaces
+  only differing files (temp file + os.replace, atomic per file), then moves
+  HEAD. Its cost is proportional to the update's change set, not the tree.
+- After each snapshot the oldest ones are pruned to Limits.SNAPSHOT_KEEP and
+  Limits.SNAPSHOT_MAX_BYTES, and unreferenced objects are removed.
+
+Objects are copies, not hard links to live files: the overlay and the sync
+engine rewrite files in place, which would silently change a linked object,
+and FAT32/exFAT drives have no hard links.
+
+User data (FileNames.FILES_PROTECTED_FROM_UPDATE), virtual environments and
+runtime directories are never captured or touched.
+
+Usage:
+    from core.snapshot import SnapshotStore
+
+    store = SnapshotStore(deploy_root)
+    snap = store.create(version="1.2.0", label="pre-update")
+    ...
+    store.rollback(snap.id)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.constants import FileNames
+from core.limits import Limits
+
+logger = logging.getLogger("SmartDrive.snapshot")
+
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# Directories never captured (in addition to protected user data)
+_SKIP_DIRS = {
+    FileNames.SNAPSHOT_DIR,
+    FileNames.VENV_DIR_LEGACY,
+    FileNames.VENV_DIR_WIN,
+    FileNames.VENV_DIR_LINUX,
+    FileNames.VENV_DIR_MAC,
+    "_update_tmp",
+    "_update_download",
+    "__pycache__",
+    "logs",
+}
+
+
+class SnapshotError(Exception):
+    """Snapshot store is missing, corrupt, or a snapshot cannot be restored."""
+
+
+@dataclass
+class Snapshot:
+    """One recorded tree state."""
+
+    id: str
+    version: str
+    label: str
+    created_ns: int
+    files: Dict[str, Tuple[str, int]]  # rel -> (sha256, size)
+
+    @property
+    def size(self) -> int:
+        return sum(size for _, size in self.files.values())
+
+
+@dataclass
+class RollbackResult:
+    """Outcome of SnapshotStore.rollback()."""
+
+    snapshot_id: str
+    restored: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    seconds: float = 0.0
+
+
+def _snapshot_id(version: str) -> str:
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return f"{stamp}-{re.sub(r'[^0-9A-Za-z._-]', '_', version or 'unknown')}"
+
+
+class SnapshotStore:
+    """Snapshot store of one deploy root (DRIVE/.smartdrive)."""
+
+    def __init__(
+        self,
+        deploy_root: Path,
+        keep: int = Limits.SNAPSHOT_KEEP,
+        max_bytes: int = Limits.SNAPSHOT_MAX_BYTES,
+        protected: Iterable[str] = FileNames.FILES_PROTECTED_FROM_UPDATE,
+    ):
+        self.deploy_root = Path(deploy_root)
+        self.root = self.deploy_root / FileNames.SNAPSHOT_DIR
+        self.keep = max(1, keep)
+        self.max_bytes = max_bytes
+        self._skip = _SKIP_DIRS | set(protected)
+
+    # ------------------------------------------------------------------
+    # Live tree
+    # ------------------------------------------------------------------
+
+    def _walk(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (rel, path) for every captured file of the live tree."""
+        for dirpath, dirnames, filenames in os.walk(self.deploy_root):
+            dirnames[:] = sorted(d for d in dirnames if d not in self._skip)
+            base = Path(dirpath)
+            for name in sorted(filenames):
+                if name in self._skip:
+                    continue
+                path = base / name
+                yield path.relative_to(self.deploy_root).as_posix(), path
+
+    def _load_index(self) -> Tuple[Dict[str, list], int]:
+        try:
+            data = json.loads((self.root / "index.json").read_text(encoding="utf-8"))
+            return data["files"], data["written_ns"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}, 0
+
+    def _save_index(self, files: Dict[str, list]) -> None:
+        data = {"written_ns": time.time_ns(), "files": files}
+        _write_json(self.root / "index.json", data)
+
+    def _scan(self, store_objects: bool) -> Tuple[Dict[str, Tuple[str, int]], int]:
+        """
+        Digest the live tree via the stat cache.
+
+        Args:
+            store_objects: Copy contents of new digests into the object store
+
+        Returns:
+            (rel -> (sha256, size), number of files read)
+        """
+        cached, written_ns = self._load_index()
+        files: Dict[str, Tuple[str, int]] = {}
+        index: Dict[str, list] = {}
+        hashed = 0
+        for rel, path in self._walk():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            key = [st.st_size, st.st_mtime_ns]
+            entry = cached.get(rel)
+            digest = None
+            # FAT32/exFAT 2 s mtime granularity: an edit just after indexing may keep the stat key
+            if entry and entry[:2] == key and key[1] < written_ns - Limits.INTEGRITY_INDEX_RACY_WINDOW_NS:
+                digest = entry[2]
+            if store_objects and (digest is None or not self._object_path(digest).exists()):
+                digest = self._store_object(path)
+                hashed += 1
+            elif digest is None:
+                digest = _sha256_file(path)
+                hashed += 1
+            files[rel] = (digest, st.st_size)
+            index[rel] = key + [digest]
+        self._save_index(index)
+        return files, hashed
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def _store_object(self, path: Path) -> str:
+        """Copy a file into the object store (read once, hashed while copying)."""
+        tmp_dir = self.root / "objects" / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        tmp = tmp_dir / f"{os.getpid()}-{time.monotonic_ns()}"
+        hasher = hashlib.sha256()
+        try:
+            with open(path, "rb") as fin, open(tmp, "wb") as fout:
+                while True:
+                    chunk = fin.read(Limits.HASH_READ_BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    fout.write(chunk)
+            digest = hasher.hexdigest()
+            target = self._object_path(digest)
+            if target.exists():
+                tmp.unlink()
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return digest
+
+    def _referenced(self, snapshots: Iterable[Snapshot]) -> Dict[str, int]:
+        refs: Dict[str, int] = {}
+        for snap in snapshots:
+            for digest, size in snap.files.values():
+                refs[digest] = size
+        return refs
+
+    def usage(self) -> int:
+        """Bytes held by the object store for the retained snapshots."""
+        return sum(self._referenced(self.list()).values())
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def _snapshot_path(self, snapshot_id: str) -> Path:
+        return self.root / "snapshots" / f"{snapshot_id}.json"
+
+    def list(self) -> List[Snapshot]:
+        """All snapshots, oldest first."""
+        snapshots = []
+        for path in (self.root / "snapshots").glob("*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+                    continue
+                files = {rel: (v[0], v[1]) for rel, v in data["files"].items()}
+                snapshots.append(Snapshot(path.stem, data["version"], data["label"], data["created_ns"], files))
+            except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+                logger.warning(f"Ignoring unreadable snapshot {path.name}: {e}")
+        return sorted(snapshots, key=lambda s: (s.created_ns, s.id))
+
+    def get(self, snapshot_id: Optional[str] = None) -> Snapshot:
+        """Snapshot by id (default: newest)."""
+        snapshots = self.list()
+        if not snapshots:
+            raise SnapshotError(f"No snapshots in {self.root}")
+        if snapshot_id is None:
+            return snapshots[-1]
+        for snap in snapshots:
+            if snap.id == snapshot_id:
+                return snap
+        raise SnapshotError(f"Snapshot not found: {snapshot_id}")
+
+    def head(self) -> Optional[str]:
+        """Id of the snapshot the live tree was last captured as or restored to."""
+        try:
+            return (self.root / "HEAD").read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def _set_head(self, snapshot_id: str) -> None:
+        from core.config import write_file_atomic
+
+        write_file_atomic(self.root / "HEAD", snapshot_id + "\n")
+
+    def create(self, version: str, label: str = "") -> Snapshot:
+        """
+        Capture the live tree.
+
+        Only files without a trustworthy stat-cache entry are read; only
+        contents not already in the store are written. Old snapshots are
+        pruned afterwards.
+        """
+        started = time.perf_counter()
+        files, hashed = self._scan(store_objects=True)
+
+        snapshot_id = _snapshot_id(version)
+        suffix = 1
+        while self._snapshot_path(snapshot_id).exists():
+            suffix += 1
+            snapshot_id = f"{_snapshot_id(version)}.{suffix}"
+
+        snap = Snapshot(snapshot_id, version, label, time.time_ns(), files)
+        data = {
+            "schema_version": SNAPSHOT_SCHEMA_VERSION,
+            "version": version,
+            "label": label,
+            "created_ns": snap.created_ns,
+            "files": {rel: list(v) for rel, v in files.items()},
+        }
+        _write_json(self._snapshot_path(snapshot_id), data)
+        self._set_head(snapshot_id)
+        self.prune()
+        logger.info(f"Snapshot {snapshot_id}: {len(files)} files, {hashed} read, {time.perf_counter() - started:.2f}s")
+        return snap
+
+    def prune(self) -> List[str]:
+        """
+        Drop the oldest snapshots beyond the count and size limits, then
+        remove unreferenced objects. The newest snapshot is always kept.
+
+        Returns:
+            Removed snapshot ids
+        """
+        snapshots = self.list()
+        removed = []
+        while len(snapshots) > 1 and (
+            len(snapshots) > self.keep or sum(self._referenced(snapshots).values()) > self.max_bytes
+        ):
+            oldest = snapshots.pop(0)
+            self._snapshot_path(oldest.id).unlink(missing_ok=True)
+            removed.append(oldest.id)
+
+        live = self._referenced(snapshots)
+        objects = self.root / "objects"
+        if objects.exists():
+            for bucket in objects.iterdir():
+                if bucket.name == "tmp":
+                    shutil.rmtree(bucket, ignore_errors=True)
+                    continue
+                for obj in bucket.iterdir():
+                    if obj.name not in live:
+                        obj.unlink(missing_ok=True)
+        if removed:
+            logger.info(f"Pruned snapshots: {', '.join(removed)}")
+        return removed
+
+    def rollback(self, snapshot_id: Optional[str] = None) -> RollbackResult:
+        """
+        Restore the live tree to a snapshot (default: newest).
+
+        Files that differ are replaced atomically; files captured now but
+        absent from the snapshot (added by the update) are deleted.
+
+        Raises:
+            SnapshotError: Unknown snapshot or missing object (nothing changed)
+        """
+        started = time.perf_counter()
+        snap = self.get(snapshot_id)
+        for digest, _ in snap.files.values():
+            if not self._object_path(digest).exists():
+                raise SnapshotError(f"Snapshot {snap.id} is incomplete (missing object {digest[:12]})")
+
+        current, _ = self._scan(store_objects=False)
+        result = RollbackResult(snap.id)
+        for rel, (digest, _) in sorted(snap.files.items()):
+            if current.get(rel, (None,))[0] == digest:
+                result.unchanged += 1
+                continue
+            dst = self.deploy_root / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dst.with_name(dst.name + ".rollback-tmp")
+            shutil.copyfile(self._object_path(digest), tmp)
+            os.replace(tmp, dst)
+            result.restored.append(rel)
+
+        for rel in sorted(set(current) - set(snap.files)):
+            (self.deploy_root / rel).unlink(missing_ok=True)
+            result.deleted.append(rel)
+
+        # Refresh the stat cache for the files just written
+        self._scan(store_objects=False)
+        self._set_head(snap.id)
+        result.seconds = time.perf_counter() - started
+        logger.info(
+            f"Rolled back to {snap.id}: {len(result.restored)} restored, "
+            f"{len(result.deleted)} deleted, {result.unchanged} unchanged, {result.seconds:.2f}s"
+        )
+        return result
+
+
+def _sha256_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(Limits.HASH_READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _write_json(path: Path, data: dict) -> None:
+    from core.config import write_file_atomic
+
+    write_file_atomic(path, json.dumps(data, sort_keys=True))
@@ -0,0 +1,281 @@
+# core/startup_profile.py - SINGLE SOURCE OF TRUTH for startup profiling
+"""
+Startup profiling for the launchers (--profile-startup).
+
+CHG-20261016-017: Cold starts from a USB stick are dominated by imports and
+first-time work, but nothing recorded where the time went. With
+--profile-startup the GUI launcher, the CLI menu and mount.py record:
+
+- per-module import time (self and cumulative, first import only),
+- milestones: first config load, first tr() call and the entry point's
+  "ready" point (first window, first menu, mount credentials prompt),
+
+and write a JSON report to the logs directory:
+
+    logs/startup-<entry>-<YYYYmmdd-HHMMSS>.json
+
+Everything here is stdlib-only and a no-op unless enabled, so the hooks in
+load_config() / tr() cost one global lookup per call.
+
+Slow media can be simulated with SMARTDRIVE_STARTUP_THROTTLE="<latency_ms>,<MB/s>":
+each module loaded from the drive then costs the latency plus its size over
+the bandwidth (tools/startup_bench.py uses this to benchmark against
+stored baselines).
+
+Usage:
+    from core.startup_profile import enable_from_argv, finish, mark_once
+
+    enable_from_argv("gui", launcher_root)   # top of the entry script
+    mark_once("first_config_load")           # hooks
+    finish("first_window")                   # entry point is ready
+"""
+
+import builtins
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("SmartDrive.startup_profile")
+
+PROFILE_FLAG = "--profile-startup"
+STARTUP_PROFILE_SCHEMA_VERSION = 1
+
+# Environment (set by tools/startup_bench.py; usable by hand)
+ENV_THROTTLE = "SMARTDRIVE_STARTUP_THROTTLE"  # "<latency_ms>,<MB/s>"
+ENV_REPORT = "SMARTDRIVE_STARTUP_REPORT"  # Write the report to this path instead of logs/
+ENV_EXIT = "SMARTDRIVE_STARTUP_EXIT"  # "1": exit right after the report (benchmark runs)
+
+# Milestones recorded by the shared hooks
+MILESTONE_CONFIG = "first_config_load"
+MILESTONE_TR = "first_tr"
+
+
+def parse_throttle(value: Optional[str]) -> Optional[Dict[str, float]]:
+    """
+    Parse "<latency_ms>,<MB/s>" (bandwidth optional; 0 = unlimited).
+
+    Returns:
+        {"latency_ms": ..., "mb_per_s": ...} or None if empty/invalid
+    """
+    if not value:
+        return None
+    try:
+        parts = [float(p) for p in value.split(",")]
+    except ValueError:
+        logger.warning(f"Ignoring invalid {ENV_THROTTLE}={value!r}")
+        return None
+    latency = parts[0] if parts else 0.0
+    bandwidth = parts[1] if len(parts) > 1 else 0.0
+    if latency < 0 or bandwidth < 0:
+        return None
+    return {"latency_ms": latency, "mb_per_s": bandwidth}
+
+
+class StartupProfiler:
+    """Import timer and milestone recorder for one process start."""
+
+    def __init__(self, entry: str, launcher_root: Path, throttle: Optional[Dict[str, float]] = None):
+        self.entry = entry
+        self.launcher_root = Path(launcher_root)
+        self.throttle = throttle
+        self.started = time.perf_counter()
+        self.milestones: Dict[str, float] = {}
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self.throttled_ms = 0.0
+        self._children: List[float] = []  # Time spent in nested imports, per open frame
+        self._original_import = None
+        self._drive = str(self.launcher_root.resolve())
+        self.report_path: Optional[Path] = None
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    # --------------------------------------------------------
+    # Import timing
+    # --------------------------------------------------------
+
+    def start(self) -> None:
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop(self) -> None:
+        if self._original_import is not None and builtins.__import__ == self._timed_import:
+            builtins.__import__ = self._original_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        modules = sys.modules
+        target = name
+        if level and globals:
+            package = globals.get("__package__") or ""
+            base = package.rsplit(".", level - 1)[0] if level > 1 else package
+            target = f"{base}.{name}" if name else base
+        if target not in modules:
+            new = target
+        elif fromlist:
+            # "from pkg import submodule" for a submodule not loaded yet
+            new = next((f"{target}.{f}" for f in fromlist if f != "*" and f"{target}.{f}" not in modules), None)
+        else:
+            new = None
+        if new is None:
+            return original(name, globals, locals, fromlist, level)
+
+        self._children.append(0.0)
+        begin = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            self._throttle(modules.get(new))
+            elapsed = (time.perf_counter() - begin) * 1000
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            if new in modules and new not in self.imports:
+                self.imports[new] = {"self_ms": elapsed - children, "cumulative_ms": elapsed}
+
+    def _throttle(self, module) -> None:
+        """Charge the simulated media cost for a module loaded from the drive."""
+        if not self.throttle or module is None:
+            return
+        origin = getattr(module, "__file__", None)
+        if not origin or not origin.startswith(self._drive):
+            return
+        try:
+            size = os.path.getsize(origin)
+        except OSError:
+            return
+        delay = self.throttle["latency_ms"] / 1000
+        if self.throttle["mb_per_s"]:
+            delay += size / (self.throttle["mb_per_s"] * 1024 * 1024)
+        time.sleep(delay)
+        self.throttled_ms += delay * 1000
+
+    # --------------------------------------------------------
+    # Milestones and report
+    # --------------------------------------------------------
+
+    def mark(self, name: str) -> None:
+        """Record a milestone (first occurrence wins)."""
+        if name not in self.milestones:
+            self.milestones[name] = self._elapsed_ms()
+
+    def report(self) -> dict:
+        imports = sorted(
+            ({"module": name, **times} for name, times in self.imports.items()),
+            key=lambda item: item["cumulative_ms"],
+            reverse=True,
+        )
+        bundle = any(type(f).__name__ == "BundleFinder" for f in sys.meta_path)
+        return {
+            "schema_version": STARTUP_PROFILE_SCHEMA_VERSION,
+            "entry": self.entry,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "bytecode_bundle": bundle,
+            "throttle": self.throttle,
+            "throttled_ms": round(self.throttled_ms, 3),
+            "total_ms": round(self._elapsed_ms(), 3),
+            "milestones": {k: round(v, 3) for k, v in self.milestones.items()},
+            "import_count": len(imports),
+            "import_ms": round(sum(i["self_ms"] for i in imports), 3),
+            "imports": [
+                {
+                    "module": i["module"],
+                    "self_ms": round(i["self_ms"], 3),
+                    "cumulative_ms": round(i["cumulative_ms"], 3),
+                }
+                for i in imports
+            ],
+        }
+
+    def write_report(self, path: Optional[Path] = None) -> Path:
+        from core.config import write_file_atomic
+
+        if path is None:
+            from core.paths import Paths
+
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = Paths.logs_dir(self.launcher_root) / f"startup-{self.entry}-{stamp}.json"
+        path = Path(path)
+        write_file_atomic(path, json.dumps(self.report(), indent=1))
+        self.report_path = path
+        return path
+
+
+_active: Optional[StartupProfiler] = None
+
+
+def active() -> Optional[StartupProfiler]:
+    return _active
+
+
+def enable(entry: str, launcher_root: Path) -> StartupProfiler:
+    """Start profiling this process (idempotent)."""
+    global _active
+    if _active is None:
+        _active = StartupProfiler(entry, launcher_root, parse_throttle(os.environ.get(ENV_THROTTLE)))
+        _active.start()
+    return _active
+
+
+def enable_from_argv(entry: str, launcher_root: Path, argv: Optional[List[str]] = None) -> Optional[StartupProfiler]:
+    """
+    Enable profiling if PROFILE_FLAG is in argv.
+
+    The flag is removed so the entry point's argparse never sees it.
+    """
+    argv = sys.argv if argv is None else argv
+    if PROFILE_FLAG not in argv:
+        return None
+    while PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+    return enable(entry, launcher_root)
+
+
+def mark(name: str) -> None:
+    if _active is not None:
+        _active.mark(name)
+
+
+def mark_once(name: str) -> None:
+    """Hot-path hook: records the first call only, free when profiling is off."""
+    profiler = _active
+    if profiler is not None and name not in profiler.milestones:
+        profiler.mark(name)
+
+
+def finish(milestone: str) -> Optional[Path]:
+    """
+    Record the entry point's ready milestone, stop timing and write the report.
+
+    Later calls (and calls without --profile-startup) do nothing.
+
+    Returns:
+        Report path, or None
+    """
+    global _active
+    profiler, _active = _active, None
+    if profiler is None:
+        return None
+    profiler.mark(milestone)
+    profiler.stop()
+    try:
+        path = profiler.write_report(os.environ.get(ENV_REPORT) or None)
+    except OSError as e:
+        logger.warning(f"Startup profile not written: {e}")
+        path = None
+    else:
+        print(
+            f"[startup-profile] {milestone} after {profiler.milestones[milestone]:.0f} ms, report: {path}",
+            file=sys.stderr,
+        )
+    if os.environ.get(ENV_EXIT) == "1":
+        sys.stderr.flush()
+        os._exit(0 if path else 1)
+    return path
@@ -0,0 +1,316 @@
+# core/sync.py - SINGLE SOURCE OF TRUTH for incremental drive sync
+"""
+Manifest-driven incremental sync of files onto a drive.
+
+CHG-20261016-011: Used by update.perform_update() and deploy.deploy_to_drive().
+Previously every run compared source and target byte-for-byte (filecmp with
+shallow=False reads both files) and re-copied whole trees regardless of
+changes, which on USB 2.0 media dominates the run time.
+
+The target keeps a sync manifest (FileNames.SYNC_MANIFEST_JSON in the target
+root) recording, per managed file, the SHA-256 and the (size, mtime_ns) of the
+file as written. Planning then:
+
+- hashes the sources (local disk, cheap),
+- trusts the recorded digest of a target file whose stat is unchanged
+  (no read of the drive); files modified within the FAT mtime window of the
+  manifest write are re-hashed (racy-clean rule, as in core/integrity.py),
+- re-hashes only target files without a trustworthy entry (first run),
+- marks files listed in the previous manifest but no longer in the sources
+  as orphans to delete (never touching protected user data).
+
+The same SyncPlan drives the dry-run preview and apply_sync().
+
+CHG-20261016-012: apply_sync() copies through core/copier.CopyScheduler
+(bounded worker pool, one sync barrier per directory batch) and reports each
+file's size and copy time.
+
+Usage:
+    from core.sync import plan_sync, apply_sync
+
+    plan = plan_sync({"core/paths.py": src_path, ...}, drive / ".smartdrive")
+    for action in plan.pending:
+        print(action.action, action.dst)
+    result = apply_sync(plan)
+"""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from core.constants import FileNames
+from core.copier import CopyFunc, CopyScheduler, CopyStats, copy_file
+from core.limits import Limits
+
+logger = logging.getLogger("SmartDrive.sync")
+
+SYNC_SCHEMA_VERSION = 1
+
+# Plan actions (strings double as preview labels)
+ACTION_COPY = "COPY"
+ACTION_UPDATE = "UPDATE"
+ACTION_SKIP = "SKIP (same)"
+ACTION_DELETE = "DELETE"
+
+# Progress callback: (action, stats for copies / None for deletions)
+ActionCallback = Callable[["SyncAction", Optional[CopyStats]], None]
+
+
+@dataclass(frozen=True)
+class SyncAction:
+    """One planned file operation."""
+
+    action: str
+    rel: str  # POSIX path relative to the target root
+    src: Optional[Path]  # None for deletions
+    dst: Path
+
+
+@dataclass
+class SyncPlan:
+    """Result of comparing sources against a target via its sync manifest."""
+
+    target_root: Path
+    actions: List[SyncAction]
+    digests: Dict[str, str]  # rel -> source SHA-256
+    previous: Dict[str, dict]  # Manifest entries found on the target
+    target_hashed: int = 0  # Target files that had to be read
+
+    @property
+    def pending(self) -> List[SyncAction]:
+        """Actions that change the target."""
+        return [a for a in self.actions if a.action != ACTION_SKIP]
+
+    def count(self, action: str) -> int:
+        return sum(1 for a in self.actions if a.action == action)
+
+
+@dataclass
+class SyncResult:
+    """Outcome of apply_sync()."""
+
+    copied: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    skipped: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)  # rel -> message
+    bytes_copied: int = 0
+    seconds: float = 0.0  # Wall time of the copy phase
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_copied / (1024 * 1024) / self.seconds if self.seconds > 0 else 0.0
+
+
+def sha256_file(path: Path) -> str:
+    """Hex SHA-256 of a file."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(Limits.HASH_READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def manifest_path(target_root: Path) -> Path:
+    """Location of the sync manifest inside the target root."""
+    return Path(target_root) / FileNames.SYNC_MANIFEST_JSON
+
+
+def load_manifest(target_root: Path) -> dict:
+    """Load the sync manifest; an empty manifest if missing, corrupt, or from another schema."""
+    try:
+        data = json.loads(manifest_path(target_root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get("schema_version") != SYNC_SCHEMA_VERSION:
+        return {"files": {}, "written_ns": 0}
+    if not isinstance(data.get("files"), dict):
+        data["files"] = {}
+    return data
+
+
+def has_manifest(target_root: Path) -> bool:
+    """True if the target was written by this sync engine before."""
+    return manifest_path(target_root).exists()
+
+
+def _stat_key(path: Path) -> Optional[List[int]]:
+    """Return [size, mtime_ns] for a file, or None if absent."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _trusted_digest(entry: Optional[dict], key: Optional[List[int]], written_ns: int) -> Optional[str]:
+    """Recorded digest if the target file is unchanged since it was recorded."""
+    if not entry or key is None or entry.get("stat") != key:
+        return None
+    # FAT32/exFAT 2 s mtime granularity: an edit just after recording may keep the stat key
+    if key[1] >= written_ns - Limits.INTEGRITY_INDEX_RACY_WINDOW_NS:
+        return None
+    return entry.get("sha256")
+
+
+def _is_protected(rel: str, protected: Iterable[str]) -> bool:
+    return bool(set(protected).intersection(rel.split("/")))
+
+
+def plan_sync(
+    sources: Mapping[str, Path],
+    target_root: Path,
+    prune: Optional[Sequence[str]] = None,
+    protected: Iterable[str] = FileNames.FILES_PROTECTED_FROM_UPDATE,
+) -> SyncPlan:
+    """
+    Plan a sync of sources onto target_root.
+
+    Args:
+        sources: rel path (POSIX, relative to target_root) -> source file
+        target_root: Target directory (e.g. DRIVE/.smartdrive)
+        prune: Prefixes (e.g. "core/") under which orphans are deleted;
+               None deletes every orphan recorded in the manifest
+        protected: Path components never deleted
+
+    Returns:
+        SyncPlan (nothing on the target is modified)
+    """
+    target_root = Path(target_root)
+    protected = set(protected)
+    manifest = load_manifest(target_root)
+    previous = manifest["files"]
+    written_ns = manifest.get("written_ns", 0)
+
+    actions: List[SyncAction] = []
+    digests: Dict[str, str] = {}
+    target_hashed = 0
+
+    for rel in sorted(sources):
+        src = Path(sources[rel])
+        dst = target_root / rel
+        digests[rel] = sha256_file(src)
+
+        key = _stat_key(dst)
+        if key is None:
+            actions.append(SyncAction(ACTION_COPY, rel, src, dst))
+            continue
+
+        target_digest = _trusted_digest(previous.get(rel), key, written_ns)
+        if target_digest is None:
+            try:
+                target_digest = sha256_file(dst)
+                target_hashed += 1
+            except OSError:
+                target_digest = None
+
+        same = target_digest == digests[rel]
+        actions.append(SyncAction(ACTION_SKIP if same else ACTION_UPDATE, rel, src, dst))
+
+    for rel in sorted(set(previous) - set(sources)):
+        if prune is not None and not any(rel.startswith(p) for p in prune):
+            continue
+        if _is_protected(rel, protected):
+            continue
+        dst = target_root / rel
+        if dst.exists():
+            actions.append(SyncAction(ACTION_DELETE, rel, None, dst))
+
+    return SyncPlan(target_root, actions, digests, previous, target_hashed)
+
+
+def apply_sync(
+    plan: SyncPlan,
+    copy: CopyFunc = copy_file,
+    on_action: Optional[ActionCallback] = None,
+    workers: Optional[int] = None,
+) -> SyncResult:
+    """
+    Execute a plan and rewrite the sync manifest.
+
+    Errors are collected per file; the manifest only records files whose
+    content on the target is known.
+
+    Args:
+        plan: Plan from plan_sync()
+        copy: File copy function (runs on worker threads)
+        on_action: Called on this thread after each successful copy/delete
+        workers: Copy worker count (default: core.copier.default_workers())
+
+    Returns:
+        SyncResult
+    """
+    result = SyncResult()
+    files: Dict[str, dict] = {}
+    by_rel = {a.rel: a for a in plan.actions}
+
+    def _record(action: SyncAction) -> None:
+        files[action.rel] = {"sha256": plan.digests[action.rel], "stat": _stat_key(action.dst)}
+
+    copies = []
+    for action in plan.actions:
+        if action.action == ACTION_SKIP:
+            result.skipped += 1
+            _record(action)
+        elif action.action == ACTION_DELETE:
+            try:
+                action.dst.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                result.errors[action.rel] = str(e)
+                continue
+            result.deleted.append(action.rel)
+            if on_action:
+                on_action(action, None)
+        else:
+            try:
+                action.dst.parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                result.errors[action.rel] = str(e)
+                continue
+            copies.append((action.rel, action.src, action.dst))
+
+    def _done(rel: str, stats: Optional[CopyStats], error: Optional[BaseException]) -> None:
+        action = by_rel[rel]
+        if error is not None:
+            result.errors[rel] = str(error)
+            return
+        result.copied.append(rel)
+        result.bytes_copied += stats.bytes
+        _record(action)
+        if on_action:
+            on_action(action, stats)
+
+    started = time.perf_counter()
+    CopyScheduler(workers=workers, copy=copy).run(copies, on_done=_done)
+    result.seconds = time.perf_counter() - started
+
+    # Keep entries managed by another sync scope (e.g. deploy-only files during update)
+    for rel, entry in plan.previous.items():
+        if rel not in by_rel and entry.get("stat") == _stat_key(plan.target_root / rel):
+            files[rel] = entry
+
+    save_manifest(plan.target_root, files)
+    logger.info(
+        f"Sync {plan.target_root}: {len(result.copied)} copied ({result.mb_per_s:.1f} MB/s), "
+        f"{len(result.deleted)} deleted, {result.skipped} unchanged, {len(result.errors)} errors"
+    )
+    return result
+
+
+def save_manifest(target_root: Path, files: Dict[str, dict]) -> None:
+    """Persist the sync manifest (best effort: a missing manifest only costs a re-hash)."""
+    from core.config import write_file_atomic
+
+    data = {"schema_version": SYNC_SCHEMA_VERSION, "written_ns": time.time_ns(), "files": files}
+    try:
+        write_file_atomic(manifest_path(target_root), json.dumps(data, sort_keys=True))
+    except OSError as e:
+        logger.warning(f"Could not write sync manifest: {e}")
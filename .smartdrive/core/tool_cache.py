@@ -0,0 +1,328 @@
+# core/tool_cache.py - SINGLE SOURCE OF TRUTH for external tool discovery
+"""
+Persistent cache of resolved tool paths, versions and capability flags.
+
+CHG-20261016-023: get_veracrypt_exe()/have_veracrypt() ran shutil.which
+plus Paths.veracrypt_exe() probes on every call, check_cli_capabilities()
+parsed `veracrypt --help` into a module global only, and
+core.dependencies.is_tool_installed() repeated the PATH search for gpg,
+veracrypt and pcscd. Mount, unmount and every CLI menu action run in a
+fresh process and paid all of it again. Results now persist on the drive
+in .smartdrive/.tool_cache.json:
+
+    {
+      "version": 1,
+      "hosts": {
+        "<host key>": {
+          "tools": {"veracrypt": "/usr/bin/veracrypt"},
+          "executables": {
+            "/usr/bin/veracrypt": {"size": 1234, "mtime_ns": 5678,
+                                   "data": {"capabilities": {...}, "version": "..."}}
+          }
+        }
+      }
+    }
+
+The drive moves between machines, so entries live under a host key (OS,
+hostname and PATH hash); a changed PATH starts a fresh section. A cached
+path or per-executable datum is valid while os.stat() of the executable
+still reports the recorded size and mtime - one stat, no subprocess. Tools
+that were not found are not cached, so installing one is noticed at once.
+The cache is best effort: an unreadable or read-only file only means
+the work is redone.
+
+The file sits on the drive and anyone who can write the drive can edit it,
+so it is never trusted to choose an executable: a cached path is used only
+if it is absolute, outside the drive, and is <PATH dir>/<tool name> for a
+directory on the current PATH or one of the caller's install locations.
+Anything else is re-resolved. Probe data (capabilities, version) is keyed
+by that resolved path.
+
+Usage:
+    from core.tool_cache import get_tool_cache
+
+    cache = get_tool_cache()
+    vc = cache.which("veracrypt", fallbacks=lambda: [Paths.veracrypt_exe()])
+    caps = cache.get_data(vc, "capabilities")
+    if caps is None:
+        caps = probe(vc)
+        cache.set_data(vc, "capabilities", caps)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from core.constants import FileNames
+
+# Logger for tool discovery
+_tool_logger = logging.getLogger("SmartDrive.tool_cache")
+
+# Bump when the file layout changes; other versions are discarded
+CACHE_FORMAT_VERSION = 1
+
+# Deployed .smartdrive root (core/ lives directly under it)
+_DEPLOY_ROOT = Path(__file__).resolve().parent.parent
+
+# Root of the drive holding .smartdrive; executables under it are never trusted
+_DRIVE_ROOT = _DEPLOY_ROOT.parent
+
+
+def host_key() -> str:
+    """Identify this machine and PATH; tool locations are only valid per host."""
+    ident = "\0".join([platform.system(), platform.node(), os.environ.get("PATH", "")])
+    return hashlib.sha256(ident.encode("utf-8", errors="replace")).hexdigest()[:16]
+
+
+def _norm(path) -> str:
+    return os.path.normcase(os.path.normpath(str(path)))
+
+
+def _is_within(path: str, root: Path) -> bool:
+    try:
+        return os.path.commonpath([_norm(path), _norm(root)]) == _norm(root)
+    except ValueError:  # Different drives (Windows)
+        return False
+
+
+def _executable_names(name: str) -> set:
+    """File names shutil.which may return for a command (PATHEXT on Windows)."""
+    names = {os.path.normcase(name)}
+    if os.name == "nt":
+        for ext in os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").split(os.pathsep):
+            if ext:
+                names.add(os.path.normcase(name + ext))
+    return names
+
+
+def _stat_key(path: str) -> Optional[Dict[str, int]]:
+    """(size, mtime_ns) of an executable, or None if it is gone."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class ToolCache:
+    """
+    Host-scoped, stat-validated cache of tool locations and probe results.
+
+    The file is read on first use and written back only when something
+    changed, so cache hits cost one os.stat() per executable.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialize tool cache.
+
+        Args:
+            cache_file: JSON file (default: .smartdrive/.tool_cache.json)
+        """
+        self.cache_file = Path(cache_file) if cache_file else _DEPLOY_ROOT / FileNames.TOOL_CACHE_JSON
+        self._lock = threading.RLock()
+        self._doc: Optional[dict] = None
+        self._host: Optional[dict] = None
+        self._verified: Dict[str, bool] = {}  # exe -> stat matched (once per process)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def which(self, name: str, fallbacks: Optional[Callable[[], Iterable]] = None) -> Optional[Path]:
+        """
+        Resolve a tool like shutil.which, consulting the cache first.
+
+        Args:
+            name: Command name (e.g. "gpg", "veracrypt")
+            fallbacks: Callable returning extra candidate paths (e.g. the
+                standard install locations from Paths), tried after PATH
+
+        Returns:
+            Path to the executable, or None if not found
+        """
+        with self._lock:
+            host = self._host_section()
+            candidates = None  # Fallback locations, evaluated at most once
+            cached = host["tools"].get(name)
+            if cached:
+                candidates = self._fallback_candidates(name, fallbacks)
+                if self._trusted_location(name, cached, candidates) and self._entry_valid(cached):
+                    return Path(cached)
+                _tool_logger.debug(f"Cached {name} path not used, re-resolving: {cached}")
+
+            resolved = shutil.which(name)
+            if not resolved:
+                if candidates is None:
+                    candidates = self._fallback_candidates(name, fallbacks)
+                for candidate in candidates:
+                    if candidate and Path(candidate).is_file():
+                        resolved = str(candidate)
+                        break
+
+            if not resolved:
+                # Keep entries another caller (with other fallbacks) may still use
+                if cached and _stat_key(cached) is None:
+                    host["tools"].pop(name, None)
+                    self._save()
+                return None
+
+            host["tools"][name] = resolved
+            self._record_executable(resolved)
+            self._save()
+            return Path(resolved)
+
+    def get_data(self, exe: Optional[Path], key: str) -> Any:
+        """Return a cached probe result for an executable, or None if stale/missing."""
+        if exe is None:
+            return None
+        with self._lock:
+            entry = self._host_section()["executables"].get(str(exe))
+            if entry is None or not self._entry_valid(str(exe)):
+                return None
+            return entry.get("data", {}).get(key)
+
+    def set_data(self, exe: Path, key: str, value: Any) -> None:
+        """Store a probe result (must be JSON-serializable) for an executable."""
+        with self._lock:
+            entry = self._record_executable(str(exe))
+            if entry is None:
+                return
+            entry.setdefault("data", {})[key] = value
+            self._save()
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget one tool (or everything for this host)."""
+        with self._lock:
+            host = self._host_section()
+            if name is None:
+                host["tools"].clear()
+                host["executables"].clear()
+            else:
+                host["tools"].pop(name, None)
+            self._verified.clear()
+            self._save()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _fallback_candidates(name: str, fallbacks: Optional[Callable[[], Iterable]]) -> list:
+        if fallbacks is None:
+            return []
+        try:
+            return [c for c in fallbacks() if c]
+        except Exception as e:
+            _tool_logger.debug(f"Fallback locations for {name} failed: {e}")
+            return []
+
+    @staticmethod
+    def _trusted_location(name: str, path: str, candidates: list) -> bool:
+        """
+        True if a path read from the (untrusted) cache file may be executed.
+
+        It must be absolute, off the drive, and either one of the caller's
+        install locations or <dir>/<name> for a directory on the current PATH.
+        """
+        if not os.path.isabs(path) or _is_within(path, _DRIVE_ROOT):
+            return False
+        norm = _norm(path)
+        if any(norm == _norm(c) for c in candidates):
+            return True
+        if os.path.basename(norm) not in _executable_names(name):
+            return False
+        parent = os.path.dirname(norm)
+        path_dirs = [d for d in os.environ.get("PATH", "").split(os.pathsep) if d and os.path.isabs(d)]
+        return any(parent == _norm(d) and not _is_within(d, _DRIVE_ROOT) for d in path_dirs)
+
+    def _host_section(self) -> dict:
+        if self._host is None:
+            doc = self._load()
+            self._host = doc["hosts"].setdefault(host_key(), {"tools": {}, "executables": {}})
+            self._host.setdefault("tools", {})
+            self._host.setdefault("executables", {})
+        return self._host
+
+    def _load(self) -> dict:
+        if self._doc is None:
+            doc = None
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    doc = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if not isinstance(doc, dict) or doc.get("version") != CACHE_FORMAT_VERSION:
+                doc = {"version": CACHE_FORMAT_VERSION, "hosts": {}}
+            doc.setdefault("hosts", {})
+            self._doc = doc
+        return self._doc
+
+    def _save(self) -> None:
+        try:
+            tmp = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._doc, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            _tool_logger.debug(f"Tool cache not written ({self.cache_file}): {e}")
+
+    def _entry_valid(self, exe: str) -> bool:
+        """True if the executable still has the recorded size and mtime."""
+        verified = self._verified.get(exe)
+        if verified is not None:
+            return verified
+        entry = self._host_section()["executables"].get(exe)
+        current = _stat_key(exe)
+        valid = (
+            entry is not None
+            and current is not None
+            and entry.get("size") == current["size"]
+            and entry.get("mtime_ns") == current["mtime_ns"]
+        )
+        if not valid and entry is not None:
+            # Replaced or removed: probe results for the old binary are stale
+            del self._host_section()["executables"][exe]
+        self._verified[exe] = valid
+        return valid
+
+    def _record_executable(self, exe: str) -> Optional[dict]:
+        """Create or refresh the stat record for an executable."""
+        executables = self._host_section()["executables"]
+        entry = executables.get(exe)
+        if entry is not None and self._entry_valid(exe):
+            return entry
+        current = _stat_key(exe)
+        if current is None:
+            return None
+        entry = executables[exe] = dict(current, data={})
+        self._verified[exe] = True
+        return entry
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+_cache: Optional[ToolCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> ToolCache:
+    """Return the process-wide tool cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ToolCache()
+        return _cache
+
+
+def which_tool(name: str, fallbacks: Optional[Callable[[], Iterable]] = None) -> Optional[Path]:
+    """Shorthand for get_tool_cache().which(...)."""
+    return get_tool_cache().which(name, fallbacks)
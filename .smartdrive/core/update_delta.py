@@ -0,0 +1,232 @@
+# core/update_delta.py - SINGLE SOURCE OF TRUTH for delta update packages
+"""
+Delta update packages (client side).
+
+CHG-20261016-010: Releases ship a per-file manifest, and the packager
+(.keydriveserver/tools/create_update_package.py) builds delta zips between
+consecutive releases. A delta zip contains only changed and added files plus
+DELTA_META_NAME:
+
+    {
+      "schema_version": 1,
+      "from_version": "1.0.0",
+      "to_version": "1.0.1",
+      "base":   {"<arcname>": "<sha256>", ...},   # unchanged files it relies on
+      "files":  {"<arcname>": "<sha256>", ...},   # files carried in the delta
+      "delete": ["<arcname>", ...]                # files removed in to_version
+    }
+
+Arcnames are package-relative POSIX paths. Packages carry the drive layout
+(".smartdrive/scripts/gui.py"), while updates run against the deployment
+root (the .smartdrive directory itself). deploy_path() maps an arcname onto
+the deployment root for the base check, the deletions and the update
+overlay alike.
+
+A delta is only applied when every base file on the drive and every file in
+the delta match their recorded SHA-256; otherwise the caller falls back to
+the full package.
+"""
+
+import hashlib
+import json
+import logging
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from core.limits import Limits
+from core.paths import Paths
+
+logger = logging.getLogger("SmartDrive.update_delta")
+
+DELTA_META_NAME = "delta.json"
+DELTA_SCHEMA_VERSION = 1
+
+PACKAGE_TYPE_FULL = "full"
+PACKAGE_TYPE_DELTA = "delta"
+
+# Suffix of the configured "latest" download URL; the check endpoint is its sibling
+_LATEST_SUFFIX = "/download/latest"
+
+
+def check_url_for(download_url: str, current_version: str) -> Optional[str]:
+    """
+    Derive the /check/<version> endpoint from a .../download/latest URL.
+
+    Returns:
+        Check URL, or None if the download URL has another shape
+    """
+    base, sep, _ = download_url.rstrip("/").rpartition(_LATEST_SUFFIX)
+    if not sep:
+        return None
+    return f"{base}/check/{urllib.parse.quote(current_version, safe='')}"
+
+
+def select_package(download_url: str, current_version: str, timeout: float = Limits.HTTP_REQUEST_TIMEOUT) -> dict:
+    """
+    Ask the server for the smallest applicable package.
+
+    Args:
+        download_url: Configured full-package URL (.../download/latest)
+        current_version: Version installed on this drive
+
+    Returns:
+        {"type": PACKAGE_TYPE_*, "url": str, "sha512": str | None}
+        Any failure returns the full package at download_url.
+    """
+    full = {"type": PACKAGE_TYPE_FULL, "url": download_url, "sha512": None}
+    check_url = check_url_for(download_url, current_version)
+    if not check_url:
+        return full
+
+    try:
+        with urllib.request.urlopen(check_url, timeout=timeout) as response:
+            info = json.loads(response.read().decode("utf-8"))
+    except Exception as e:
+        logger.info(f"Update check unavailable ({e}); using full package")
+        return full
+
+    if info.get("package_type") != PACKAGE_TYPE_DELTA or not info.get("download_url"):
+        return full
+
+    return {
+        "type": PACKAGE_TYPE_DELTA,
+        "url": urllib.parse.urljoin(check_url, info["download_url"]),
+        "sha512": info.get("package_hash"),
+        "from_version": current_version,
+        "to_version": info.get("latest_version"),
+    }
+
+
+def sha256_file(path: Path) -> str:
+    """Hex SHA-256 of a file."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(Limits.HASH_READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def load_delta_meta(payload_dir: Path) -> dict:
+    """
+    Load and validate the delta metadata from an extracted delta package.
+
+    Raises:
+        ValueError: Missing or malformed metadata
+    """
+    meta_path = Path(payload_dir) / DELTA_META_NAME
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Invalid delta package: {e}") from e
+
+    if meta.get("schema_version") != DELTA_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported delta schema: {meta.get('schema_version')}")
+    for field in ("base", "files", "delete"):
+        if field not in meta:
+            raise ValueError(f"Invalid delta package: missing '{field}'")
+    for arcname in list(meta["base"]) + list(meta["files"]) + list(meta["delete"]):
+        if not _safe_arcname(arcname):
+            raise ValueError(f"Invalid delta package: unsafe path {arcname!r}")
+    return meta
+
+
+def _safe_arcname(arcname: str) -> bool:
+    """Reject absolute paths and parent-directory traversal."""
+    parts = arcname.split("/")
+    return bool(arcname) and not arcname.startswith("/") and ".." not in parts and ":" not in parts[0]
+
+
+def deploy_path(deploy_root: Path, arcname: str) -> Path:
+    """
+    Map a package arcname (or payload-relative path) onto the deployment root.
+
+    The leading ".smartdrive/" of the package layout is the deployment root
+    itself; other names (root files, payloads copied from a .smartdrive
+    directory) are already relative to it.
+    """
+    prefix = f"{Paths.SMARTDRIVE_DIR_NAME}/"
+    if arcname.startswith(prefix):
+        arcname = arcname[len(prefix) :]
+    return Path(deploy_root) / arcname
+
+
+def _mismatched(
+    expected: Dict[str, str], root: Path, to_path: Optional[Callable[[Path, str], Path]] = None
+) -> List[str]:
+    mismatched = []
+    for arcname, digest in sorted(expected.items()):
+        path = to_path(root, arcname) if to_path else root / arcname
+        try:
+            if sha256_file(path) != digest:
+                mismatched.append(arcname)
+        except OSError:
+            mismatched.append(arcname)
+    return mismatched
+
+
+def verify_delta(
+    meta: dict,
+    payload_dir: Path,
+    deploy_root: Path,
+    digests: Optional[Dict[str, str]] = None,
+    excluded: Iterable[str] = (),
+) -> List[str]:
+    """
+    Check that a delta can be applied to this drive.
+
+    Args:
+        meta: Loaded delta metadata
+        payload_dir: Extracted delta package
+        deploy_root: Deployment root the payload is overlaid onto
+        digests: SHA-256 per member computed during extraction
+                 (CHG-20261016-013); payload files are re-read if omitted
+        excluded: Members skipped by the deployment filter (not applied)
+
+    Returns:
+        Problems found (empty list = safe to apply)
+    """
+    problems = [f"base file differs: {a}" for a in _mismatched(meta["base"], Path(deploy_root), deploy_path)]
+    if digests is None:
+        problems += [f"payload file corrupt: {a}" for a in _mismatched(meta["files"], Path(payload_dir))]
+        return problems
+
+    excluded = set(excluded)
+    for arcname, digest in sorted(meta["files"].items()):
+        if arcname in excluded:
+            continue
+        if arcname not in digests:
+            problems.append(f"payload file missing: {arcname}")
+        elif digests[arcname] != digest:
+            problems.append(f"payload file corrupt: {arcname}")
+    return problems
+
+
+def apply_deletions(meta: dict, deploy_root: Path, protected: Iterable[str] = ()) -> int:
+    """
+    Remove files dropped in the target release.
+
+    Args:
+        meta: Loaded delta metadata
+        deploy_root: Deployment root
+        protected: Path components that are never touched (user data)
+
+    Returns:
+        Number of files removed
+    """
+    protected = set(protected)
+    removed = 0
+    for arcname in meta["delete"]:
+        if protected.intersection(arcname.split("/")):
+            continue
+        path = deploy_path(deploy_root, arcname)
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
@@ -0,0 +1,316 @@
+# core/zipstream.py - SINGLE SOURCE OF TRUTH for update archive extraction
+"""
+Filtering, verifying zip extraction for update packages.
+
+CHG-20261016-013: Replaces zf.extractall() followed by an rglob() pass that
+deleted excluded files and another that counted the rest. Each member is
+checked against the exclude filter *before* anything is written, so excluded
+files never touch the flash drive.
+
+- extract_archive(): seekable archive on disk (zipfile; members are streamed,
+  CRC-32 is checked by zipfile as the data is read).
+- extract_stream(): non-seekable stream such as an HTTP response, parsed
+  member by member from the local file headers; no temporary zip is needed.
+  CRC-32 and size are checked per member as the data is inflated.
+
+Both compute a SHA-256 of every written member on the fly (ExtractResult.digests),
+so callers can verify contents against a manifest without re-reading files.
+
+Usage:
+    from core.zipstream import extract_archive
+
+    result = extract_archive(zip_path, payload_dir, exclude=lambda name: ...)
+"""
+
+import hashlib
+import logging
+import struct
+import zipfile
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+from core.limits import Limits
+
+logger = logging.getLogger("SmartDrive.zipstream")
+
+# Member filter: return True to skip a member (POSIX member name)
+ExcludeFunc = Callable[[str], bool]
+
+# Zip record signatures
+_LOCAL_HEADER_SIG = 0x04034B50
+_CENTRAL_DIR_SIG = 0x02014B50
+_END_OF_CENTRAL_DIR_SIG = 0x06054B50
+_ZIP64_END_SIG = 0x06064B50
+_DATA_DESCRIPTOR_SIG = 0x08074B50
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+
+_FLAG_ENCRYPTED = 0x0001
+_FLAG_DATA_DESCRIPTOR = 0x0008
+
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP64_MARKER = 0xFFFFFFFF
+
+
+class ZipStreamError(Exception):
+    """Archive is corrupt, unsafe, or uses an unsupported feature."""
+
+
+@dataclass
+class ExtractResult:
+    """Outcome of an extraction."""
+
+    files: int = 0
+    excluded: int = 0
+    bytes_written: int = 0
+    digests: Dict[str, str] = field(default_factory=dict)  # member name -> SHA-256
+    excluded_names: List[str] = field(default_factory=list)
+
+
+def _member_path(dest_dir: Path, name: str) -> Path:
+    """Destination for a member; rejects absolute paths and traversal (zip-slip)."""
+    posix = PurePosixPath(name.replace("\\", "/"))
+    if posix.is_absolute() or ".." in posix.parts or (posix.parts and ":" in posix.parts[0]):
+        raise ZipStreamError(f"Unsafe member path: {name!r}")
+    return dest_dir.joinpath(*posix.parts)
+
+
+class _MemberWriter:
+    """Writes one member while hashing it."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "wb")
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    def close(self) -> str:
+        self._file.close()
+        return self._hash.hexdigest()
+
+
+def extract_archive(archive: Path, dest_dir: Path, exclude: Optional[ExcludeFunc] = None) -> ExtractResult:
+    """
+    Extract a zip file, skipping excluded members before they are written.
+
+    Raises:
+        ZipStreamError: Corrupt archive (bad CRC/header) or unsafe member path
+    """
+    dest_dir = Path(dest_dir)
+    result = ExtractResult()
+    try:
+        with zipfile.ZipFile(archive, "r") as zf:
+            for info in zf.infolist():
+                name = info.filename
+                if exclude and exclude(name.rstrip("/")):
+                    result.excluded += 1
+                    result.excluded_names.append(name)
+                    continue
+                path = _member_path(dest_dir, name)
+                if info.is_dir():
+                    path.mkdir(parents=True, exist_ok=True)
+                    continue
+                writer = _MemberWriter(path)
+                try:
+                    # ZipExtFile verifies the CRC-32 when the member is fully read
+                    with zf.open(info) as src:
+                        while True:
+                            chunk = src.read(Limits.DOWNLOAD_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            writer.write(chunk)
+                finally:
+                    result.digests[name] = writer.close()
+                result.files += 1
+                result.bytes_written += writer.size
+    except zipfile.BadZipFile as e:
+        raise ZipStreamError(f"Corrupt update archive: {e}") from e
+    return result
+
+
+class _StreamReader:
+    """Exact reads with push-back over a non-seekable stream."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._pending = b""
+
+    def read(self, n: int) -> bytes:
+        """Read up to n bytes (fewer only at end of stream)."""
+        out = self._pending[:n]
+        self._pending = self._pending[n:]
+        while len(out) < n:
+            chunk = self._stream.read(max(n - len(out), Limits.DOWNLOAD_CHUNK_SIZE))
+            if not chunk:
+                break
+            need = n - len(out)
+            out += chunk[:need]
+            self._pending = chunk[need:] + self._pending
+        return out
+
+    def read_exact(self, n: int) -> bytes:
+        data = self.read(n)
+        if len(data) != n:
+            raise ZipStreamError("Unexpected end of update archive")
+        return data
+
+    def read_some(self) -> bytes:
+        """Next available chunk (any size); b"" at end of stream."""
+        if self._pending:
+            data, self._pending = self._pending, b""
+            return data
+        return self._stream.read(Limits.DOWNLOAD_CHUNK_SIZE)
+
+    def unread(self, data: bytes) -> None:
+        self._pending = data + self._pending
+
+    def drain(self) -> None:
+        """Consume the rest of the stream (central directory)."""
+        while self.read_some():
+            pass
+
+
+def _zip64_extra(extra: bytes) -> Optional[bytes]:
+    """Body of the ZIP64 extended information extra field, if present."""
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, length = struct.unpack_from("<HH", extra, pos)
+        if header_id == _ZIP64_EXTRA_ID:
+            return extra[pos + 4 : pos + 4 + length]
+        pos += 4 + length
+    return None
+
+
+def _zip64_sizes(extra: bytes, csize: int, usize: int):
+    """Apply the ZIP64 extra field to sizes stored as 0xFFFFFFFF."""
+    body = _zip64_extra(extra)
+    if body is None:
+        return csize, usize
+    values = list(struct.unpack_from(f"<{len(body) // 8}Q", body))
+    if usize == _ZIP64_MARKER and values:
+        usize = values.pop(0)
+    if csize == _ZIP64_MARKER and values:
+        csize = values.pop(0)
+    return csize, usize
+
+
+def extract_stream(stream: BinaryIO, dest_dir: Path, exclude: Optional[ExcludeFunc] = None) -> ExtractResult:
+    """
+    Extract a zip from a non-seekable stream (e.g. an HTTP response).
+
+    Members are parsed from their local headers in order; stored and deflated
+    members are supported, with or without trailing data descriptors
+    (stored members need sizes in the header). The remainder of the stream
+    (central directory) is consumed so a wrapping hasher sees every byte.
+
+    Raises:
+        ZipStreamError: Corrupt/unsupported archive or unsafe member path
+    """
+    dest_dir = Path(dest_dir)
+    reader = _StreamReader(stream)
+    result = ExtractResult()
+
+    while True:
+        sig_bytes = reader.read(4)
+        if len(sig_bytes) < 4:
+            raise ZipStreamError("Update archive ended before the central directory")
+        (sig,) = struct.unpack("<I", sig_bytes)
+        if sig in (_CENTRAL_DIR_SIG, _END_OF_CENTRAL_DIR_SIG, _ZIP64_END_SIG):
+            reader.drain()
+            return result
+        if sig != _LOCAL_HEADER_SIG:
+            raise ZipStreamError(f"Bad zip record signature 0x{sig:08x}")
+
+        header = _LOCAL_HEADER.unpack(sig_bytes + reader.read_exact(_LOCAL_HEADER.size - 4))
+        _, _, flags, method, _, _, crc, csize, usize, name_len, extra_len = header
+        raw_name = reader.read_exact(name_len)
+        extra = reader.read_exact(extra_len)
+        name = raw_name.decode("utf-8" if flags & 0x0800 else "cp437")
+        csize, usize = _zip64_sizes(extra, csize, usize)
+        has_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+
+        if flags & _FLAG_ENCRYPTED:
+            raise ZipStreamError(f"Encrypted member not supported: {name}")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise ZipStreamError(f"Unsupported compression method {method}: {name}")
+        if method == zipfile.ZIP_STORED and has_descriptor:
+            raise ZipStreamError(f"Stored member without sizes cannot be streamed: {name}")
+
+        skip = bool(exclude and exclude(name.rstrip("/")))
+        is_dir = name.endswith("/")
+        writer = None
+        if skip:
+            result.excluded += 1
+            result.excluded_names.append(name)
+        else:
+            path = _member_path(dest_dir, name)
+            if is_dir:
+                path.mkdir(parents=True, exist_ok=True)
+            else:
+                writer = _MemberWriter(path)
+
+        running_crc = 0
+        written = 0
+        try:
+            if method == zipfile.ZIP_STORED:
+                remaining = csize
+                while remaining:
+                    chunk = reader.read_exact(min(remaining, Limits.DOWNLOAD_CHUNK_SIZE))
+                    remaining -= len(chunk)
+                    running_crc = zlib.crc32(chunk, running_crc)
+                    written += len(chunk)
+                    if writer:
+                        writer.write(chunk)
+            else:
+                inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+                remaining = None if has_descriptor else csize
+                while not inflater.eof:
+                    if remaining is None:
+                        chunk = reader.read_some()
+                    elif remaining:
+                        chunk = reader.read(min(remaining, Limits.DOWNLOAD_CHUNK_SIZE))
+                        remaining -= len(chunk)
+                    else:
+                        chunk = b""
+                    if not chunk:
+                        raise ZipStreamError(f"Truncated member: {name}")
+                    data = inflater.decompress(chunk)
+                    running_crc = zlib.crc32(data, running_crc)
+                    written += len(data)
+                    if writer:
+                        writer.write(data)
+                if inflater.unused_data:
+                    reader.unread(inflater.unused_data)
+        finally:
+            if writer:
+                result.digests[name] = writer.close()
+
+        if has_descriptor:
+            crc, usize = _read_descriptor(reader, extra)
+
+        if running_crc != crc or written != usize:
+            raise ZipStreamError(f"CRC/size mismatch in member: {name}")
+
+        if writer:
+            result.files += 1
+            result.bytes_written += written
+
+
+def _read_descriptor(reader: _StreamReader, extra: bytes):
+    """Read a data descriptor; returns (crc, uncompressed size)."""
+    first = reader.read_exact(4)
+    if struct.unpack("<I", first)[0] == _DATA_DESCRIPTOR_SIG:
+        first = reader.read_exact(4)
+    (crc,) = struct.unpack("<I", first)
+    if _zip64_extra(extra) is not None:
+        _, usize = struct.unpack("<QQ", reader.read_exact(16))
+    else:
+        _, usize = struct.unpack("<II", reader.read_exact(8))
+    return crc, usize
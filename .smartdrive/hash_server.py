@@ -13,33 +13,30 @@ Security Notes:
 - Audit logging
 """
 
-import hashlib
-import json
-import os
 import secrets
+import threading
 import time
 from pathlib import Path
 
 from flask import Flask, jsonify, request
 
+from core.hashing import MODE_COMPAT, PrecomputedTree
+from core.hashing import hash_directory as core_hash_directory
+from core.hashing import tree_signature
+from hash_store import CLAIM_EXPIRED, CLAIM_MISSING, CLAIM_USED, create_stores
+
 app = Flask(__name__)
 
-# Database file for known hashes
+# Database file for known hashes (legacy JSON; imported into the store once)
 DB_FILE = Path(__file__).parent / "hash_database.json"
 
+# CHG-20261016-005: Challenge and hash storage (HASH_SERVER_STORE=memory|sqlite)
+challenge_store, hash_store = create_stores(Path(__file__).parent)
+
 
 def load_database():
     """Load hash database."""
-    if DB_FILE.exists():
-        with open(DB_FILE, "r") as f:
-            return json.load(f)
-    return {}
-
-
-def save_database(db):
-    """Save hash database."""
-    with open(DB_FILE, "w") as f:
-        json.dump(db, f, indent=2)
+    return hash_store.all()
 
 
 @app.route("/api/generate-challenge", methods=["POST"])
@@ -48,10 +45,8 @@ def generate_challenge():
     salt = secrets.token_hex(32)  # 64 character hex string
     challenge_id = secrets.token_hex(16)  # Unique ID for this challenge
 
-    # Store challenge temporarily (in production, use a database with expiration)
-    challenges = load_challenges()
-    challenges[challenge_id] = {"salt": salt, "timestamp": time.time(), "used": False}
-    save_challenges(challenges)
+    # Store challenge with expiry (expired entries are evicted by the store)
+    challenge_store.put(challenge_id, salt)
 
     return jsonify(
         {
@@ -77,25 +72,18 @@ def verify_challenge():
         if not all([challenge_id, client_hash, server_endpoint]):
             return jsonify({"error": "Missing challenge_id, client_hash, or server_endpoint"}), 400
 
-        challenges = load_challenges()
-        if challenge_id not in challenges:
+        # Atomically check expiry (24 hours) and mark the challenge as used
+        status, salt = challenge_store.claim(challenge_id)
+        if status == CLAIM_MISSING:
             return jsonify({"error": "Invalid or expired challenge"}), 404
-
-        challenge = challenges[challenge_id]
-        if challenge["used"]:
+        if status == CLAIM_USED:
             return jsonify({"error": "Challenge already used"}), 400
-
-        # Check if challenge is expired (24 hours)
-        if time.time() - challenge["timestamp"] > 24 * 3600:
+        if status == CLAIM_EXPIRED:
             return jsonify({"error": "Challenge expired"}), 400
 
-        # Mark challenge as used
-        challenge["used"] = True
-        save_challenges(challenges)
-
         # Server-side verification: hash our reference directory with the salt
         try:
-            server_hash = hash_directory_with_salt_server(challenge["salt"])
+            server_hash = hash_directory_with_salt_server(salt)
 
             if client_hash == server_hash:
                 return jsonify(
@@ -121,22 +109,6 @@ def verify_challenge():
         return jsonify({"error": str(e)}), 500
 
 
-def load_challenges():
-    """Load challenges database."""
-    challenges_file = Path(__file__).parent / "challenges.json"
-    if challenges_file.exists():
-        with open(challenges_file, "r") as f:
-            return json.load(f)
-    return {}
-
-
-def save_challenges(challenges):
-    """Save challenges database."""
-    challenges_file = Path(__file__).parent / "challenges.json"
-    with open(challenges_file, "w") as f:
-        json.dump(challenges, f, indent=2)
-
-
 @app.route("/api/add-hash", methods=["POST"])
 def add_hash():
     """Add a hash to the database (admin only - add authentication!)."""
@@ -148,9 +120,7 @@ def add_hash():
         if not version or not hash_value:
             return jsonify({"error": "Missing version or hash"}), 400
 
-        db = load_database()
-        db[version] = hash_value
-        save_database(db)
+        hash_store.set(version, hash_value)
 
         return jsonify({"success": True, "version": version, "hash": hash_value[:16] + "..."})
 
@@ -165,75 +135,66 @@ def list_versions():
     return jsonify({"versions": list(db.keys()), "count": len(db)})
 
 
-def hash_directory_with_salt_server(salt: str) -> str:
-    """Hash the server's reference scripts directory with salt file."""
-    # Server maintains a clean reference copy of scripts
-    reference_dir = Path(__file__).parent / "reference_scripts"
+# CHG-20261016-004: In-memory reference manifest (per worker process)
+REFERENCE_DIR = Path(__file__).parent / "reference_scripts"
+SALT_FILE_NAME = ".challenge_salt"
+REFERENCE_RECHECK_SECONDS = 60  # How often to stat the tree for changes
 
-    if not reference_dir.exists():
-        raise Exception(f"Reference scripts directory not found: {reference_dir}")
+_reference_tree = None
+_reference_checked_at = 0.0
+_reference_lock = threading.Lock()
 
-    # Create salt file in reference directory
-    salt_file = reference_dir / ".challenge_salt"
-    try:
-        with open(salt_file, "w") as f:
-            f.write(salt)
 
-        # Hash the directory including the salt file
-        result = hash_directory(reference_dir)
-        return result
+def get_reference_tree() -> PrecomputedTree:
+    """
+    Return the cached reference manifest, rebuilding it if the tree changed.
 
-    finally:
-        # Clean up salt file
-        try:
-            if salt_file.exists():
-                salt_file.unlink()
-        except:
-            pass
+    The tree is stat-checked at most every REFERENCE_RECHECK_SECONDS; the
+    rebuild is serialized, readers always see a complete immutable snapshot.
+    """
+    global _reference_tree, _reference_checked_at
 
+    if not REFERENCE_DIR.exists():
+        raise Exception(f"Reference scripts directory not found: {REFERENCE_DIR}")
 
-def hash_directory(dir_path: Path) -> str:
-    """Hash an entire directory recursively, including all files."""
-    hash_obj = hashlib.sha256()
-
-    # Get all files in sorted order for consistent hashing
-    all_files = []
-    for root, dirs, files in os.walk(dir_path):
-        # Skip certain directories
-        dirs[:] = [d for d in dirs if d not in ["__pycache__", ".git"]]
-        for file in files:
-            # Include all files, including hidden ones like .challenge_salt
-            all_files.append(str(Path(root) / file))
-
-    all_files.sort()
-
-    for file_path in all_files:
-        # Include relative path in hash to detect file moves
-        rel_path = os.path.relpath(file_path, dir_path)
-        hash_obj.update(rel_path.encode("utf-8"))
-        hash_obj.update(b"\x00")  # Separator
+    tree = _reference_tree
+    now = time.monotonic()
+    if tree is not None and now - _reference_checked_at < REFERENCE_RECHECK_SECONDS:
+        return tree
+
+    with _reference_lock:
+        tree = _reference_tree
+        if tree is None or tree_signature(REFERENCE_DIR) != tree.signature:
+            tree = PrecomputedTree(REFERENCE_DIR)
+            _reference_tree = tree
+        _reference_checked_at = time.monotonic()
+        return tree
 
-        try:
-            with open(file_path, "rb") as f:
-                while True:
-                    chunk = f.read(8192)
-                    if not chunk:
-                        break
-                    hash_obj.update(chunk)
-        except (OSError, IOError) as e:
-            # Skip files that can't be read
-            hash_obj.update(f"[ERROR: {e}]".encode("utf-8"))
 
-        hash_obj.update(b"\x00")  # File separator
+def hash_directory_with_salt_server(salt: str) -> str:
+    """Hash the server's reference scripts directory with salt file.
+
+    CHG-20261016-004: The salt file is inserted into the cached manifest at its
+    sort position instead of being written into reference_scripts, so
+    concurrent challenges cannot race and nothing touches the disk. The digest
+    equals hashing the directory with a real .challenge_salt file in it.
+    """
+    return get_reference_tree().digest_with({SALT_FILE_NAME: salt.encode("utf-8")})
+
+
+def hash_directory(dir_path: Path) -> str:
+    """Hash an entire directory recursively, including all files.
 
-    return hash_obj.hexdigest()
+    CHG-20261016-003: Delegates to the shared parallel hasher (compat mode,
+    identical digest). Hidden files such as .challenge_salt are included.
+    """
+    return core_hash_directory(dir_path, mode=MODE_COMPAT)
 
 
 if __name__ == "__main__":
     print("Hash Verification Server (Challenge-Response)")
     print("============================================")
-    print(f"Database: {DB_FILE}")
-    print("Challenges: challenges.json")
+    print(f"Store: {type(challenge_store).__name__} / {type(hash_store).__name__}")
     print("Endpoints:")
     print("  POST /api/generate-challenge  - Generate unique salt")
     print("  POST /api/verify-challenge    - Verify challenge response")
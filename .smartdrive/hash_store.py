@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Challenge and hash-database storage for hash_server.py
+======================================================
+
+CHG-20261016-005: Replaces whole-file JSON rewrites of challenges.json and
+hash_database.json on every request.
+
+Backends:
+- memory: in-process bounded FIFO + TTL (single-process development server)
+- sqlite: SQLite in WAL mode with an index on expiry (safe across gunicorn
+  workers; a challenge claim is one BEGIN IMMEDIATE transaction)
+
+Expired challenges are evicted lazily and pruned in amortized batches, so
+storage no longer grows without bound.
+
+Select the backend with HASH_SERVER_STORE=memory|sqlite (default: sqlite).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Challenge lifetime and capacity
+CHALLENGE_TTL_SECONDS = 24 * 3600
+MEMORY_MAX_CHALLENGES = 10000
+PRUNE_EVERY_N_WRITES = 256
+
+# Claim outcomes
+CLAIM_OK = "ok"
+CLAIM_MISSING = "missing"
+CLAIM_USED = "used"
+CLAIM_EXPIRED = "expired"
+
+
+# =============================================================================
+# Challenge stores
+# =============================================================================
+
+
+class ChallengeStore:
+    """Interface for challenge storage."""
+
+    def put(self, challenge_id: str, salt: str, ttl: float = CHALLENGE_TTL_SECONDS) -> None:
+        """Store a new, unused challenge that expires after ttl seconds."""
+        raise NotImplementedError
+
+    def claim(self, challenge_id: str) -> Tuple[str, Optional[str]]:
+        """
+        Atomically mark a challenge used.
+
+        Returns:
+            (CLAIM_* status, salt or None)
+        """
+        raise NotImplementedError
+
+    def prune(self) -> int:
+        """Remove expired challenges; returns the number removed."""
+        raise NotImplementedError
+
+
+class MemoryChallengeStore(ChallengeStore):
+    """
+    In-process challenge store: bounded FIFO + TTL.
+
+    Challenges are written once and claimed once, so recency of access says
+    nothing about future use; the oldest (and first to expire) entries are
+    evicted when the store is full.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_MAX_CHALLENGES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, challenge_id: str, salt: str, ttl: float = CHALLENGE_TTL_SECONDS) -> None:
+        now = time.time()
+        with self._lock:
+            self._entries[challenge_id] = {"salt": salt, "expires_at": now + ttl, "used": False}
+            self._entries.move_to_end(challenge_id)
+            # Expired entries sit at the front (insertion order ~ expiry order)
+            while self._entries:
+                oldest_id, oldest = next(iter(self._entries.items()))
+                if oldest_id == challenge_id:
+                    break
+                if oldest["expires_at"] > now and len(self._entries) <= self.max_entries:
+                    break
+                del self._entries[oldest_id]
+
+    def claim(self, challenge_id: str) -> Tuple[str, Optional[str]]:
+        with self._lock:
+            entry = self._entries.get(challenge_id)
+            if entry is None:
+                return (CLAIM_MISSING, None)
+            if entry["used"]:
+                return (CLAIM_USED, None)
+            if entry["expires_at"] <= time.time():
+                del self._entries[challenge_id]
+                return (CLAIM_EXPIRED, None)
+            entry["used"] = True
+            return (CLAIM_OK, entry["salt"])
+
+    def prune(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [cid for cid, e in self._entries.items() if e["expires_at"] <= now]
+            for cid in expired:
+                del self._entries[cid]
+            return len(expired)
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open a WAL-mode connection suitable for concurrent workers."""
+    conn = sqlite3.connect(str(db_path), timeout=10, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SQLiteChallengeStore(ChallengeStore):
+    """SQLite (WAL) challenge store with an index on expiry."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._writes = 0
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS challenges ("
+            " id TEXT PRIMARY KEY,"
+            " salt TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " used INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_challenges_expires_at ON challenges (expires_at)")
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _connect(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    def put(self, challenge_id: str, salt: str, ttl: float = CHALLENGE_TTL_SECONDS) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO challenges (id, salt, expires_at, used) VALUES (?, ?, ?, 0)",
+            (challenge_id, salt, time.time() + ttl),
+        )
+        self._writes += 1
+        if self._writes % PRUNE_EVERY_N_WRITES == 0:
+            self.prune()
+
+    def claim(self, challenge_id: str) -> Tuple[str, Optional[str]]:
+        conn = self._conn()
+        now = time.time()
+        # BEGIN IMMEDIATE takes the write lock up front: exactly one concurrent
+        # caller (thread or worker process) can flip used 0 -> 1
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT salt, used, expires_at FROM challenges WHERE id = ?", (challenge_id,)).fetchone()
+            if row is None:
+                status = CLAIM_MISSING
+            elif row[1]:
+                status = CLAIM_USED
+            elif row[2] <= now:
+                conn.execute("DELETE FROM challenges WHERE id = ?", (challenge_id,))
+                status = CLAIM_EXPIRED
+            else:
+                conn.execute("UPDATE challenges SET used = 1 WHERE id = ?", (challenge_id,))
+                status = CLAIM_OK
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return (status, row[0] if status == CLAIM_OK else None)
+
+    def prune(self) -> int:
+        cur = self._conn().execute("DELETE FROM challenges WHERE expires_at <= ?", (time.time(),))
+        return cur.rowcount
+
+
+# =============================================================================
+# Hash database stores
+# =============================================================================
+
+
+class HashStore:
+    """Interface for the version -> hash database."""
+
+    def set(self, version: str, hash_value: str) -> None:
+        raise NotImplementedError
+
+    def all(self) -> Dict[str, str]:
+        raise NotImplementedError
+
+
+class MemoryHashStore(HashStore):
+    """Hash database cached in memory, persisted to JSON only when it changes."""
+
+    def __init__(self, json_path: Optional[Path] = None):
+        self.json_path = Path(json_path) if json_path else None
+        self._lock = threading.Lock()
+        self._data: Dict[str, str] = {}
+        if self.json_path and self.json_path.exists():
+            with open(self.json_path, "r") as f:
+                self._data = json.load(f)
+
+    def set(self, version: str, hash_value: str) -> None:
+        with self._lock:
+            if self._data.get(version) == hash_value:
+                return
+            self._data[version] = hash_value
+            if self.json_path:
+                tmp = self.json_path.with_suffix(".tmp")
+                with open(tmp, "w") as f:
+                    json.dump(self._data, f, indent=2)
+                os.replace(tmp, self.json_path)
+
+    def all(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._data)
+
+
+class SQLiteHashStore(HashStore):
+    """
+    Hash database in SQLite; imports a legacy JSON file on first use.
+
+    After a successful import the JSON file is renamed to "<name>.migrated",
+    so it is neither re-read nor mistaken for the live database.
+    """
+
+    def __init__(self, db_path: Path, legacy_json: Optional[Path] = None):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("CREATE TABLE IF NOT EXISTS hashes (version TEXT PRIMARY KEY, hash TEXT NOT NULL)")
+        if legacy_json and Path(legacy_json).exists():
+            self._import_legacy(Path(legacy_json))
+
+    def _import_legacy(self, legacy_json: Path) -> None:
+        """One-time import of the JSON hash database (once per database, across workers)."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            imported = False
+            if conn.execute("SELECT 1 FROM hashes LIMIT 1").fetchone() is None:
+                try:
+                    with open(legacy_json, "r") as f:
+                        legacy = json.load(f)
+                except FileNotFoundError:
+                    legacy = None  # Another worker imported and renamed it
+                if legacy is not None:
+                    conn.executemany("INSERT OR IGNORE INTO hashes (version, hash) VALUES (?, ?)", legacy.items())
+                    imported = True
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if imported:
+            try:
+                os.replace(legacy_json, legacy_json.with_name(legacy_json.name + ".migrated"))
+            except FileNotFoundError:
+                pass
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _connect(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    def set(self, version: str, hash_value: str) -> None:
+        self._conn().execute("INSERT OR REPLACE INTO hashes (version, hash) VALUES (?, ?)", (version, hash_value))
+
+    def all(self) -> Dict[str, str]:
+        return dict(self._conn().execute("SELECT version, hash FROM hashes ORDER BY rowid").fetchall())
+
+
+# =============================================================================
+# Factory
+# =============================================================================
+
+
+def create_stores(base_dir: Path, backend: Optional[str] = None) -> Tuple[ChallengeStore, HashStore]:
+    """
+    Create the challenge and hash stores for the configured backend.
+
+    Args:
+        base_dir: Directory holding hash_server.db / hash_database.json
+        backend: "memory" or "sqlite" (default: $HASH_SERVER_STORE or "sqlite")
+
+    Returns:
+        (ChallengeStore, HashStore)
+    """
+    backend = (backend or os.environ.get("HASH_SERVER_STORE", "sqlite")).lower()
+    legacy_json = Path(base_dir) / "hash_database.json"
+
+    if backend == "memory":
+        return (MemoryChallengeStore(), MemoryHashStore(legacy_json))
+    if backend == "sqlite":
+        db_path = Path(base_dir) / "hash_server.db"
+        return (SQLiteChallengeStore(db_path), SQLiteHashStore(db_path, legacy_json=legacy_json))
+    raise ValueError(f"Unknown HASH_SERVER_STORE backend: {backend}")
@@ -0,0 +1,85 @@
+# locales/__init__.py - Per-language translation catalogs
+"""
+Translation catalogs, one module per domain and language.
+
+CHG-20261016-019: gui_i18n.py and cli_i18n.py used to define every language
+in one dict literal, so each import built all seven languages. Catalogs now
+live here as locales/<domain>_<lang>.py, each defining CATALOG, and are
+loaded on first use of a language:
+
+    locales/gui_en.py    GUI strings (gui_i18n.tr)
+    locales/cli_en.py    CLI strings (cli_i18n.tr)
+
+The package is part of core.bytecode.BUNDLED_TREES, so on a deployed drive a
+catalog load is an unmarshal of precompiled constants, not a compile.
+Catalog modules are executed without being kept in sys.modules: the dict is
+the only thing a loaded language costs.
+
+Usage:
+    from locales import CatalogSet
+
+    TRANSLATIONS = CatalogSet("gui", ["en", "de"])
+    TRANSLATIONS["de"]["btn_mount"]   # imports locales/gui_de.py once
+    "de" in TRANSLATIONS              # no import
+"""
+
+import importlib.util
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, List
+
+
+def load_catalog(domain: str, lang: str) -> Dict[str, str]:
+    """
+    Execute locales/<domain>_<lang>.py and return its CATALOG.
+
+    Raises:
+        KeyError: If no catalog exists for the language
+    """
+    spec = importlib.util.find_spec(f"{__name__}.{domain}_{lang}")
+    if spec is None:
+        raise KeyError(f"No '{domain}' translation catalog for language '{lang}'")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.CATALOG
+
+
+class CatalogSet(MutableMapping):
+    """Language code -> catalog dict; each catalog is loaded on first access."""
+
+    def __init__(self, domain: str, languages: Iterable[str]):
+        self.domain = domain
+        self._languages: List[str] = list(languages)
+        self._catalogs: Dict[str, Dict[str, str]] = {}
+
+    def __getitem__(self, lang: str) -> Dict[str, str]:
+        catalog = self._catalogs.get(lang)
+        if catalog is None:
+            if lang not in self._languages:
+                raise KeyError(lang)
+            catalog = self._catalogs[lang] = load_catalog(self.domain, lang)
+        return catalog
+
+    def __setitem__(self, lang: str, catalog: Dict[str, str]) -> None:
+        if lang not in self._languages:
+            self._languages.append(lang)
+        self._catalogs[lang] = catalog
+
+    def __delitem__(self, lang: str) -> None:
+        self._languages.remove(lang)
+        self._catalogs.pop(lang, None)
+
+    def __contains__(self, lang) -> bool:
+        return lang in self._languages
+
+    def __iter__(self):
+        return iter(self._languages)
+
+    def __len__(self) -> int:
+        return len(self._languages)
+
+    def loaded(self) -> List[str]:
+        """Languages whose catalog has been loaded so far."""
+        return list(self._catalogs)
+
+    def __repr__(self) -> str:
+        return f"CatalogSet({self.domain!r}, languages={self._languages}, loaded={self.loaded()})"
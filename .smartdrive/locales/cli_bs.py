@@ -0,0 +1,40 @@
+# locales/cli_bs.py - CLI translation catalog: Bosnian
+"""CLI strings for language 'bs' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    "cli_banner": "╔═══════════════════════════════════════════════════════════════════════╗",
+    "cli_banner_title": "║                        SMARTDRIVE CLI                                 ║",
+    "cli_banner_bottom": "╚═══════════════════════════════════════════════════════════════════════╝",
+    "cli_welcome": "Dobrodošli u {Branding.APP_NAME} komandnu liniju",
+    "cli_version": "Verzija: {version}",
+    "cli_menu_mount": "Montiraj šifrovani volumen",
+    "cli_menu_unmount": "Demontiraj volumen",
+    "cli_menu_status": "Prikaži status",
+    "cli_menu_settings": "Postavke",
+    "cli_menu_recovery": "Alati za oporavak",
+    "cli_menu_quit": "Izlaz",
+    "cli_menu_prompt": "Odaberite opciju",
+    "cli_status_mounted": "Volumen je montiran na {drive}",
+    "cli_status_unmounted": "Volumen nije montiran",
+    "cli_status_unknown": "Nije moguće odrediti status montiranja",
+    "cli_mount_starting": "Montiranje šifrovanog volumena...",
+    "cli_mount_success": "✓ Volumen uspješno montiran na {drive}",
+    "cli_mount_failed": "✗ Montiranje neuspješno: {error}",
+    "cli_unmount_starting": "Demontiranje volumena...",
+    "cli_unmount_success": "✓ Volumen uspješno demontiran",
+    "cli_unmount_failed": "✗ Demontiranje neuspješno: {error}",
+    "cli_press_enter": "Pritisnite Enter za nastavak...",
+    "cli_confirm_yes_no": "[d/N]",
+    "cli_password_prompt": "Unesite VeraCrypt lozinku:",
+    "cli_pin_prompt": "Unesite YubiKey PIN:",
+    "cli_error_config_not_found": "Konfiguracijska datoteka nije pronađena: {path}",
+    "cli_error_invalid_option": "Nevažeća opcija. Pokušajte ponovo.",
+    "cli_recovery_generate": "Generiši kit za oporavak",
+    "cli_recovery_recover": "Oporavi pristup koristeći frazu za oporavak",
+    "cli_recovery_status": "Prikaži status oporavka",
+    "cli_setup_title": "{Branding.APP_NAME} Podešavanje",
+    "cli_setup_complete": "Podešavanje uspješno završeno!",
+    "cli_setup_failed": "Podešavanje neuspješno: {error}",
+    "cli_lang_current": "Trenutni jezik: {lang}",
+    "cli_lang_changed": "Jezik promijenjen na: {lang}",
+}
@@ -0,0 +1,40 @@
+# locales/cli_de.py - CLI translation catalog: German
+"""CLI strings for language 'de' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    "cli_banner": "╔═══════════════════════════════════════════════════════════════════════╗",
+    "cli_banner_title": "║                        SMARTDRIVE CLI                                 ║",
+    "cli_banner_bottom": "╚═══════════════════════════════════════════════════════════════════════╝",
+    "cli_welcome": "Willkommen bei {Branding.APP_NAME} Kommandozeilen-Schnittstelle",
+    "cli_version": "Version: {version}",
+    "cli_menu_mount": "Verschlüsseltes Volumen einbinden",
+    "cli_menu_unmount": "Volumen aushängen",
+    "cli_menu_status": "Status anzeigen",
+    "cli_menu_settings": "Einstellungen",
+    "cli_menu_recovery": "Wiederherstellungstools",
+    "cli_menu_quit": "Beenden",
+    "cli_menu_prompt": "Option wählen",
+    "cli_status_mounted": "Volumen ist eingebunden unter {drive}",
+    "cli_status_unmounted": "Volumen ist nicht eingebunden",
+    "cli_status_unknown": "Mount-Status kann nicht ermittelt werden",
+    "cli_mount_starting": "Binde verschlüsseltes Volumen ein...",
+    "cli_mount_success": "✓ Volumen erfolgreich eingebunden unter {drive}",
+    "cli_mount_failed": "✗ Einbinden fehlgeschlagen: {error}",
+    "cli_unmount_starting": "Hänge Volumen aus...",
+    "cli_unmount_success": "✓ Volumen erfolgreich ausgehängt",
+    "cli_unmount_failed": "✗ Aushängen fehlgeschlagen: {error}",
+    "cli_press_enter": "Drücken Sie Enter um fortzufahren...",
+    "cli_confirm_yes_no": "[j/N]",
+    "cli_password_prompt": "VeraCrypt-Passwort eingeben:",
+    "cli_pin_prompt": "YubiKey-PIN eingeben:",
+    "cli_error_config_not_found": "Konfigurationsdatei nicht gefunden: {path}",
+    "cli_error_invalid_option": "Ungültige Option. Bitte erneut versuchen.",
+    "cli_recovery_generate": "Wiederherstellungs-Kit erstellen",
+    "cli_recovery_recover": "Zugang mit Wiederherstellungsphrase wiederherstellen",
+    "cli_recovery_status": "Wiederherstellungsstatus anzeigen",
+    "cli_setup_title": "{Branding.APP_NAME} Einrichtung",
+    "cli_setup_complete": "Einrichtung erfolgreich abgeschlossen!",
+    "cli_setup_failed": "Einrichtung fehlgeschlagen: {error}",
+    "cli_lang_current": "Aktuelle Sprache: {lang}",
+    "cli_lang_changed": "Sprache geändert auf: {lang}",
+}
@@ -0,0 +1,49 @@
+# locales/cli_en.py - CLI translation catalog: English
+"""CLI strings for language 'en' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Banner and welcome
+    "cli_banner": "╔═══════════════════════════════════════════════════════════════════════╗",
+    "cli_banner_title": "║                        SMARTDRIVE CLI                                 ║",
+    "cli_banner_bottom": "╚═══════════════════════════════════════════════════════════════════════╝",
+    "cli_welcome": "Welcome to {Branding.APP_NAME} Command Line Interface",
+    "cli_version": "Version: {version}",
+    # Menu items
+    "cli_menu_mount": "Mount encrypted volume",
+    "cli_menu_unmount": "Unmount volume",
+    "cli_menu_status": "Show status",
+    "cli_menu_settings": "Settings",
+    "cli_menu_recovery": "Recovery tools",
+    "cli_menu_quit": "Exit",
+    "cli_menu_prompt": "Select an option",
+    # Status messages
+    "cli_status_mounted": "Volume is mounted at {drive}",
+    "cli_status_unmounted": "Volume is not mounted",
+    "cli_status_unknown": "Unable to determine mount status",
+    # Mount/unmount
+    "cli_mount_starting": "Mounting encrypted volume...",
+    "cli_mount_success": "✓ Volume mounted successfully at {drive}",
+    "cli_mount_failed": "✗ Mount failed: {error}",
+    "cli_unmount_starting": "Unmounting volume...",
+    "cli_unmount_success": "✓ Volume unmounted successfully",
+    "cli_unmount_failed": "✗ Unmount failed: {error}",
+    # Prompts
+    "cli_press_enter": "Press Enter to continue...",
+    "cli_confirm_yes_no": "[y/N]",
+    "cli_password_prompt": "Enter VeraCrypt password:",
+    "cli_pin_prompt": "Enter YubiKey PIN:",
+    # Errors
+    "cli_error_config_not_found": "Configuration file not found: {path}",
+    "cli_error_invalid_option": "Invalid option. Please try again.",
+    # Recovery
+    "cli_recovery_generate": "Generate recovery kit",
+    "cli_recovery_recover": "Recover access using recovery phrase",
+    "cli_recovery_status": "View recovery status",
+    # Setup
+    "cli_setup_title": "{Branding.APP_NAME} Setup",
+    "cli_setup_complete": "Setup completed successfully!",
+    "cli_setup_failed": "Setup failed: {error}",
+    # Language
+    "cli_lang_current": "Current language: {lang}",
+    "cli_lang_changed": "Language changed to: {lang}",
+}
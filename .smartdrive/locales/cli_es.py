@@ -0,0 +1,40 @@
+# locales/cli_es.py - CLI translation catalog: Spanish
+"""CLI strings for language 'es' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    "cli_banner": "╔═══════════════════════════════════════════════════════════════════════╗",
+    "cli_banner_title": "║                        SMARTDRIVE CLI                                 ║",
+    "cli_banner_bottom": "╚═══════════════════════════════════════════════════════════════════════╝",
+    "cli_welcome": "Bienvenido a la interfaz de línea de comandos de {Branding.APP_NAME}",
+    "cli_version": "Versión: {version}",
+    "cli_menu_mount": "Montar volumen cifrado",
+    "cli_menu_unmount": "Desmontar volumen",
+    "cli_menu_status": "Mostrar estado",
+    "cli_menu_settings": "Configuración",
+    "cli_menu_recovery": "Herramientas de recuperación",
+    "cli_menu_quit": "Salir",
+    "cli_menu_prompt": "Seleccione una opción",
+    "cli_status_mounted": "El volumen está montado en {drive}",
+    "cli_status_unmounted": "El volumen no está montado",
+    "cli_status_unknown": "No se puede determinar el estado de montaje",
+    "cli_mount_starting": "Montando volumen cifrado...",
+    "cli_mount_success": "✓ Volumen montado correctamente en {drive}",
+    "cli_mount_failed": "✗ Error al montar: {error}",
+    "cli_unmount_starting": "Desmontando volumen...",
+    "cli_unmount_success": "✓ Volumen desmontado correctamente",
+    "cli_unmount_failed": "✗ Error al desmontar: {error}",
+    "cli_press_enter": "Presione Enter para continuar...",
+    "cli_confirm_yes_no": "[s/N]",
+    "cli_password_prompt": "Introduzca la contraseña de VeraCrypt:",
+    "cli_pin_prompt": "Introduzca el PIN del YubiKey:",
+    "cli_error_config_not_found": "Archivo de configuración no encontrado: {path}",
+    "cli_error_invalid_option": "Opción inválida. Por favor, inténtelo de nuevo.",
+    "cli_recovery_generate": "Generar kit de recuperación",
+    "cli_recovery_recover": "Recuperar acceso usando frase de recuperación",
+    "cli_recovery_status": "Ver estado de recuperación",
+    "cli_setup_title": "Configuración de {Branding.APP_NAME}",
+    "cli_setup_complete": "¡Configuración completada correctamente!",
+    "cli_setup_failed": "Configuración fallida: {error}",
+    "cli_lang_current": "Idioma actual: {lang}",
+    "cli_lang_changed": "Idioma cambiado a: {lang}",
+}
@@ -0,0 +1,40 @@
+# locales/cli_fr.py - CLI translation catalog: French
+"""CLI strings for language 'fr' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    "cli_banner": "╔═══════════════════════════════════════════════════════════════════════╗",
+    "cli_banner_title": "║                        SMARTDRIVE CLI                                 ║",
+    "cli_banner_bottom": "╚═══════════════════════════════════════════════════════════════════════╝",
+    "cli_welcome": "Bienvenue dans l'interface en ligne de commande {Branding.APP_NAME}",
+    "cli_version": "Version: {version}",
+    "cli_menu_mount": "Monter le volume chiffré",
+    "cli_menu_unmount": "Démonter le volume",
+    "cli_menu_status": "Afficher l'état",
+    "cli_menu_settings": "Paramètres",
+    "cli_menu_recovery": "Outils de récupération",
+    "cli_menu_quit": "Quitter",
+    "cli_menu_prompt": "Sélectionnez une option",
+    "cli_status_mounted": "Le volume est monté sur {drive}",
+    "cli_status_unmounted": "Le volume n'est pas monté",
+    "cli_status_unknown": "Impossible de déterminer l'état du montage",
+    "cli_mount_starting": "Montage du volume chiffré...",
+    "cli_mount_success": "✓ Volume monté avec succès sur {drive}",
+    "cli_mount_failed": "✗ Échec du montage: {error}",
+    "cli_unmount_starting": "Démontage du volume...",
+    "cli_unmount_success": "✓ Volume démonté avec succès",
+    "cli_unmount_failed": "✗ Échec du démontage: {error}",
+    "cli_press_enter": "Appuyez sur Entrée pour continuer...",
+    "cli_confirm_yes_no": "[o/N]",
+    "cli_password_prompt": "Entrez le mot de passe VeraCrypt:",
+    "cli_pin_prompt": "Entrez le code PIN YubiKey:",
+    "cli_error_config_not_found": "Fichier de configuration non trouvé: {path}",
+    "cli_error_invalid_option": "Option invalide. Veuillez réessayer.",
+    "cli_recovery_generate": "Générer un kit de récupération",
+    "cli_recovery_recover": "Récupérer l'accès avec la phrase de récupération",
+    "cli_recovery_status": "Voir l'état de récupération",
+    "cli_setup_title": "Configuration de {Branding.APP_NAME}",
+    "cli_setup_complete": "Configuration terminée avec succès!",
+    "cli_setup_failed": "Configuration échouée: {error}",
+    "cli_lang_current": "Langue actuelle: {lang}",
+    "cli_lang_changed": "Langue changée en: {lang}",
+}
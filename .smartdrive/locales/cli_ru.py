@@ -0,0 +1,40 @@
+# locales/cli_ru.py - CLI translation catalog: Russian
+"""CLI strings for language 'ru' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    "cli_banner": "╔═══════════════════════════════════════════════════════════════════════╗",
+    "cli_banner_title": "║                        SMARTDRIVE CLI                                 ║",
+    "cli_banner_bottom": "╚═══════════════════════════════════════════════════════════════════════╝",
+    "cli_welcome": "Добро пожаловать в командную строку {Branding.APP_NAME}",
+    "cli_version": "Версия: {version}",
+    "cli_menu_mount": "Подключить зашифрованный том",
+    "cli_menu_unmount": "Отключить том",
+    "cli_menu_status": "Показать статус",
+    "cli_menu_settings": "Настройки",
+    "cli_menu_recovery": "Инструменты восстановления",
+    "cli_menu_quit": "Выход",
+    "cli_menu_prompt": "Выберите опцию",
+    "cli_status_mounted": "Том подключен к {drive}",
+    "cli_status_unmounted": "Том не подключен",
+    "cli_status_unknown": "Невозможно определить статус подключения",
+    "cli_mount_starting": "Подключение зашифрованного тома...",
+    "cli_mount_success": "✓ Том успешно подключен к {drive}",
+    "cli_mount_failed": "✗ Подключение не удалось: {error}",
+    "cli_unmount_starting": "Отключение тома...",
+    "cli_unmount_success": "✓ Том успешно отключен",
+    "cli_unmount_failed": "✗ Отключение не удалось: {error}",
+    "cli_press_enter": "Нажмите Enter для продолжения...",
+    "cli_confirm_yes_no": "[д/Н]",
+    "cli_password_prompt": "Введите пароль VeraCrypt:",
+    "cli_pin_prompt": "Введите PIN-код YubiKey:",
+    "cli_error_config_not_found": "Файл конфигурации не найден: {path}",
+    "cli_error_invalid_option": "Неверная опция. Попробуйте еще раз.",
+    "cli_recovery_generate": "Создать комплект восстановления",
+    "cli_recovery_recover": "Восстановить доступ с помощью фразы восстановления",
+    "cli_recovery_status": "Просмотреть статус восстановления",
+    "cli_setup_title": "Настройка {Branding.APP_NAME}",
+    "cli_setup_complete": "Настройка успешно завершена!",
+    "cli_setup_failed": "Настройка не удалась: {error}",
+    "cli_lang_current": "Текущий язык: {lang}",
+    "cli_lang_changed": "Язык изменен на: {lang}",
+}
@@ -0,0 +1,40 @@
+# locales/cli_zh.py - CLI translation catalog: Chinese
+"""CLI strings for language 'zh' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    "cli_banner": "╔═══════════════════════════════════════════════════════════════════════╗",
+    "cli_banner_title": "║                        SMARTDRIVE CLI                                 ║",
+    "cli_banner_bottom": "╚═══════════════════════════════════════════════════════════════════════╝",
+    "cli_welcome": "欢迎使用 {Branding.APP_NAME} 命令行界面",
+    "cli_version": "版本: {version}",
+    "cli_menu_mount": "挂载加密卷",
+    "cli_menu_unmount": "卸载卷",
+    "cli_menu_status": "显示状态",
+    "cli_menu_settings": "设置",
+    "cli_menu_recovery": "恢复工具",
+    "cli_menu_quit": "退出",
+    "cli_menu_prompt": "选择一个选项",
+    "cli_status_mounted": "卷已挂载到 {drive}",
+    "cli_status_unmounted": "卷未挂载",
+    "cli_status_unknown": "无法确定挂载状态",
+    "cli_mount_starting": "正在挂载加密卷...",
+    "cli_mount_success": "✓ 卷已成功挂载到 {drive}",
+    "cli_mount_failed": "✗ 挂载失败: {error}",
+    "cli_unmount_starting": "正在卸载卷...",
+    "cli_unmount_success": "✓ 卷已成功卸载",
+    "cli_unmount_failed": "✗ 卸载失败: {error}",
+    "cli_press_enter": "按 Enter 继续...",
+    "cli_confirm_yes_no": "[是/否]",
+    "cli_password_prompt": "输入 VeraCrypt 密码:",
+    "cli_pin_prompt": "输入 YubiKey PIN:",
+    "cli_error_config_not_found": "未找到配置文件: {path}",
+    "cli_error_invalid_option": "无效选项。请重试。",
+    "cli_recovery_generate": "生成恢复套件",
+    "cli_recovery_recover": "使用恢复短语恢复访问",
+    "cli_recovery_status": "查看恢复状态",
+    "cli_setup_title": "{Branding.APP_NAME} 设置",
+    "cli_setup_complete": "设置成功完成！",
+    "cli_setup_failed": "设置失败: {error}",
+    "cli_lang_current": "当前语言: {lang}",
+    "cli_lang_changed": "语言已更改为: {lang}",
+}
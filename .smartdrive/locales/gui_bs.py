@@ -0,0 +1,480 @@
+# locales/gui_bs.py - GUI translation catalog: Bosnian
+"""GUI strings for language 'bs' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Window titles
+    "window_title": "KeyDrive",
+    "settings_window_title": "Postavke",
+    # Button labels
+    "btn_mount": "🔓 Montiraj",
+    "btn_unmount": "🔒 Demontiraj",
+    "btn_cancel_auth": "❌ Otkaži",
+    "btn_confirm_mount": "✅ Potvrdi",
+    "btn_tools": "⚙️",
+    "btn_close": "✕",
+    "btn_save": "Sačuvaj",
+    "btn_cancel": "Otkaži",
+    "btn_confirm": "Potvrdi",
+    "btn_ok": "OK",
+    "warning": "Upozorenje",
+    "settings_tab_security": "Sigurnost",
+    # CHG-20251223-055: Reload config button for non-modal settings
+    "btn_reload_config": "↻ Ponovo učitaj",
+    "tooltip_reload_config": "Ponovo učitaj konfiguraciju s diska (odbacuje nesačuvane promjene)",
+    # Status messages
+    "status_config_not_found": "Konfiguracija nije pronađena",
+    "status_volume_mounted": "Volumen montiran",
+    "status_volume_not_mounted": "Volumen nije montiran",
+    "status_mounting": "⏳ Montiranje volumena...",
+    "status_mounting_gpg": "⏳ Montiranje volumena (GPG autentifikacija)...",
+    "status_unmounting": "⏳ Demontiranje volumena...",
+    "status_mount_success": "✅ Volumen uspješno montiran",
+    "status_mount_failed": "❌ Montiranje nije uspjelo",
+    "status_unmount_success": "✅ Volumen uspješno demontiran",
+    "status_unmount_failed": "❌ Demontiranje nije uspjelo",
+    # Info labels
+    "info_unavailable": "Informacije nisu dostupne",
+    "keyfile_selected_one": "Odabrana 1 datoteka ključa",
+    "keyfile_selected_many": "Odabrano {count} datoteka ključa",
+    "keyfile_drop_hint": "Prevucite datoteke ključa ovdje ili kliknite za odabir",
+    "keyfile_drop_supports_multiple": "Podržava više datoteka ključa",
+    "label_show_password": "Prikaži lozinku",
+    # Size formatting
+    "size_free": "Slobodno: {size}",
+    # Icons/placeholders
+    "icon_drive": "🚀",
+    # Tooltips
+    "tooltip_exit": "Izađi iz SmartDrive",
+    "tooltip_settings": "Napredni alati i postavke",
+    # Labels
+    "label_product_name": "Naziv proizvoda",
+    "label_preview": "Pregled:",
+    "label_password": "Lozinka:",
+    "label_keyfile": "Datoteka ključa:",
+    "label_hardware_key_hint": "💡 Hardverski ključ može biti potreban za autentifikaciju",
+    "label_forgot_password": "Zaboravili ste lozinku?",
+    # Placeholder text
+    "placeholder_password": "Unesite svoju VeraCrypt lozinku...",
+    # Menu items
+    "menu_settings": "⚙️ Postavke",
+    "menu_rekey": "🔑 Promijeni lozinku/datoteku ključa",
+    "menu_update": "⬇️ Ažuriraj skripte",
+    "menu_recovery": "💾 Paket za oporavak",
+    "menu_about": "ℹ️ O programu",
+    "menu_cli": "💻 Otvori CLI",
+    "menu_exit": "⏻ Izlaz",
+    "menu_clear_keyfiles": "Očisti datoteke ključa",
+    "menu_switch_drive": "🔀 Promijeni disk...",
+    "menu_switch_drive_browse": "📂 Pregledaj...",
+    # CHG-20251221-042: Remote Control Mode menu items (Bosnian)
+    "menu_manage_remote": "🌐 Upravljaj daljinski...",
+    "menu_manage_remote_browse": "📂 Pronađi daljinski .smartdrive...",
+    "menu_exit_remote": "🏠 Izađi iz daljinskog načina",
+    "remote_active_label": "Daljinsko upravljanje aktivno",
+    "remote_click_to_end": "Kliknite za završetak",
+    "remote_validation_failed_title": "Daljinska validacija nije uspjela",
+    "remote_validation_failed_body": "Nije moguće povezati se s daljinskim diskom:\n\n{error}",
+    "remote_disconnected_title": "Daljinski disk je odvojen",
+    "remote_disconnected_body": "Daljinski disk ({drive}:) je odvojen.\n\nPovratak na lokalni način.",
+    "remote_confirm_title": "Uđi u način daljinskog upravljanja",
+    "remote_confirm_body": "Poveži se s daljinskim .smartdrive na:\n{path}\n\nU daljinskom načinu možete samo montirati/demontirati daljinski volumen.\nPostavke, ažuriranja i CLI pristup su onemogućeni.",
+    "remote_mode_disabled_title": "Daljinski način aktivan",
+    "remote_mode_disabled_cli": "CLI pristup je onemogućen u daljinskom načinu.",
+    "remote_mode_disabled_settings": "Postavke su onemogućene u daljinskom načinu. Prvo izađite iz daljinskog načina.",
+    "remote_mode_disabled_update": "Ažuriranja su onemogućena u daljinskom načinu. Prvo izađite iz daljinskog načina.",
+    "dialog_select_keyfiles": "Odaberite datoteku(e) ključa",
+    # Multi-drive context (CHG-20251221-026)
+    "label_launcher_root": "Pokretački disk:",
+    "group_drive_context": "Kontekst diska",
+    "tooltip_launcher_root": "Disk koji sadrži ovaj .smartdrive folder",
+    # Drive safety context (CHG-20251221-040)
+    "label_os_drive": "OS disk:",
+    "tooltip_os_drive": "Disk na kojem radi operativni sustav (ne može se reparticionirati)",
+    "label_instantiation_drive": "Pokrenut s:",
+    "tooltip_instantiation_drive": "Disk s kojeg je pokrenuta ova instanca (ne može se reparticionirati)",
+    "switch_drive_title": "Promijeni kontekst diska",
+    "switch_drive_confirm": "Prebaci na konfiguraciju s:\n{path}\n\nSve postavke će se ponovno učitati s ovog diska.",
+    "switch_drive_invalid_path": "Nevažeći .smartdrive folder. config.json nije pronađen.",
+    "switch_drive_select_folder": "Odaberite .smartdrive folder",
+    "version_incompatible_title": "Upozorenje o kompatibilnosti verzije",
+    "version_incompatible_error": "Ne mogu prebaciti na ovaj disk:\n\n{message}\n\nFormat konfiguracije nije kompatibilan s ovom verzijom softvera.",
+    "version_incompatible_warning": "{message}\n\nCilj: {path}\n\nŽelite li ipak nastaviti?",
+    # Tray messages
+    "tray_minimized_message": "Radi u pozadini. Kliknite na ikonu u sistemskoj traci za vraćanje.",
+    "tray_unavailable_message": "Sistemska traka nije dostupna.\n\nŽelite li zatvoriti aplikaciju?",
+    "tray_tooltip": "{name} ({id})",
+    # Status messages
+    "status_deriving_yubikey_password": "Izvođenje lozinke sa YubiKey...",
+    "status_checking_mount": "Provjera statusa montiranja...",
+    "status_unmounting_for_rekey": "Demontiranje volumena za rekey...",
+    "status_decrypting_keyfile": "Dešifriranje datoteke ključa sa YubiKey...",
+    # Worker messages (keys for structured errors)
+    "worker_mount_script_not_found": "Skripta za montiranje nije pronađena",
+    "worker_mount_success": "Volumen uspješno montiran",
+    "worker_mount_failed": "Montiranje nije uspjelo: {error}",
+    "worker_mount_timeout": "Vrijeme za montiranje je isteklo",
+    "worker_mount_error": "Greška pri montiranju: {error}",
+    "worker_unmount_script_not_found": "Skripta za demontiranje nije pronađena",
+    "worker_unmount_success": "Volumen uspješno demontiran",
+    "worker_unmount_failed": "Demontiranje nije uspjelo: {error}",
+    "worker_unmount_timeout": "Vrijeme za demontiranje je isteklo",
+    "worker_unmount_error": "Greška pri demontiranju: {error}",
+    # Settings dialog - Tab names
+    "settings_language": "Jezik",
+    "settings_general": "Opšte",
+    "settings_security": "Sigurnost",
+    "settings_keyfile": "Datoteka ključa",
+    "settings_windows": "Windows",
+    "settings_unix": "Unix",
+    "settings_updates": "Ažuriranja",
+    "settings_recovery": "Oporavak",
+    "settings_lost_and_found": "Izgubljeno i nađeno",
+    "settings_advanced": "Napredno",
+    # Settings dialog - Tab descriptions
+    "settings_general_desc": "Konfigurirajte ime prikaza, jezik i postavke teme.",
+    "settings_security_desc": "Postavite način šifriranja i metodu autentifikacije za vaš sigurni disk.",
+    "settings_keyfile_desc": "Upravljajte putanjama datoteka ključeva za šifriranje i GPG autentifikaciju.",
+    "settings_windows_desc": "Windows-specifične postavke uključujući slovo diska i lokaciju VeraCrypt-a.",
+    "settings_unix_desc": "Postavke za Linux i macOS uključujući direktorij točke montiranja.",
+    "settings_updates_desc": "Konfigurirajte automatsku provjeru ažuriranja i postavke servera.",
+    "settings_recovery_desc": "Postavite Shamir Secret Sharing opcije oporavka za pristup ako se ključevi izgube.",
+    "settings_lost_and_found_desc": "Prikažite poruku za kontakt na disku za vraćanje ako se izgubi.",
+    "settings_advanced_desc": "Tehničke postavke za parametre šifriranja i provjeru integriteta.",
+    # BUG-20251221-036: Settings dialog - Group box titles (Serbian)
+    "group_drive_identification": "Identifikacija diska",
+    "group_appearance": "Izgled",
+    "group_timestamps": "Vremenske oznake",
+    "group_security_mode": "Sigurnosni način",
+    "group_keyfile_configuration": "Konfiguracija datoteke ključa",
+    "group_gpg_configuration": "GPG konfiguracija",
+    "group_emergency_recovery_kit": "Komplet za hitni oporavak",
+    "group_verification": "Verifikacija",
+    "group_verification_status": "Status verifikacije",
+    "group_software_integrity": "Integritet softvera",
+    "group_remote_verification": "Udaljena verifikacija",
+    "group_gpg_kdf_parameters": "GPG KDF parametri",
+    "group_metadata": "Metapodaci",
+    "settings_restart_not_required": "✓ Promjene su odmah primijenjene (restart nije potreban)",
+    "label_mode": "Način",
+    "label_encrypted_keyfile": "Šifrirana datoteka ključa",
+    "label_volume_path": "Putanja do volumena",
+    "label_mount_letter": "Slovo diska",
+    "label_veracrypt_path": "Putanja do VeraCrypt-a",
+    "label_mount_point": "Tačka montiranja",
+    "label_source_type": "Tip izvora",
+    "label_server_url": "URL servera",
+    "label_local_root": "Lokalni korijenski direktorij",
+    "error_invalid_mount_letter": "Slovo diska mora biti jedno slovo A–Z.",
+    "error_save_failed": "Nije moguće sačuvati config.json:",
+    "title_invalid_mount_letter": "Neispravno slovo diska",
+    "title_save_failed": "Neuspjelo čuvanje",
+    "title_error": "Greška",
+    "error_apply_theme": "Nije moguće primijeniti temu: {error}",
+    "error_apply_language": "Nije moguće primijeniti jezik: {error}",
+    # Popup dialogs
+    "popup_keyfile_required_title": "Potrebna datoteka ključa",
+    "popup_keyfile_required_body": "Molimo odaberite datoteku ključa za režim lozinka + datoteka ključa.",
+    "popup_password_required_title": "Potrebna lozinka",
+    "popup_password_required_body": "Molimo unesite svoju VeraCrypt lozinku.",
+    "popup_recovery_title": "Oporavak lozinke",
+    "popup_recovery_available_body": "Paket za oporavak je dostupan za ovaj disk!\n\nZa povrat pristupa vašem šifriranom volumenu:\n\n1. Koristite SmartDrive CLI: python smartdrive.py\n2. Odaberite opciju 6: Paket za oporavak\n3. Pratite upute za oporavak\n\nIli kontaktirajte sistem administratora.",
+    "popup_recovery_unavailable_body": "Trenutno nema dostupnog paketa za oporavak za ovaj disk.\n\nZa postavljanje oporavka lozinke:\n\n1. Koristite SmartDrive CLI: python smartdrive.py\n2. Odaberite opciju 6: Paket za oporavak\n3. Izaberite 'Generate Recovery Kit'\n\nIli kontaktirajte sistem administratora.",
+    # Recovery tab - Phrase input and recovery actions
+    "recovery_section_title": "🔐 Hitni oporavak",
+    "recovery_instructions": "Unesite svoju frazu za oporavak od 24 riječi da biste povratili pristup vašem šifriranom volumenu. Možete također navesti datoteku kontejnera za oporavak ako je imate.",
+    "label_recovery_phrase": "Fraza za oporavak (24 riječi):",
+    "placeholder_recovery_phrase": "Unesite 24 riječi odvojene razmacima...",
+    "label_recovery_container": "Kontejner za oporavak (opcionalno):",
+    "btn_browse_container": "Pregledaj...",
+    "btn_recover_credentials": "🔓 Povrati pristupne podatke",
+    "recovery_status_ready": "Unesite svoju frazu za oporavak i kliknite 'Povrati pristupne podatke'",
+    "recovery_status_validating": "Validacija fraze za oporavak...",
+    "recovery_status_decrypting": "Dešifriranje kontejnera za oporavak...",
+    "recovery_status_success": "✅ Oporavak uspješan! Pristupni podaci vraćeni.",
+    "recovery_status_failed": "❌ Oporavak nije uspio: {error}",
+    "recovery_result_title": "Vraćeni pristupni podaci",
+    "recovery_result_password": "Lozinka:",
+    "recovery_result_keyfile": "Datoteka ključa:",
+    "recovery_result_mode": "Sigurnosni način:",
+    "recovery_result_copy_password": "📋 Kopiraj lozinku",
+    "recovery_result_save_keyfile": "💾 Sačuvaj datoteku ključa",
+    "recovery_copied_to_clipboard": "Lozinka kopirana u međuspremnik (automatski se briše za 30 sekundi)",
+    "recovery_keyfile_saved": "Datoteka ključa sačuvana u: {path}",
+    "recovery_phrase_invalid": "Neispravna fraza za oporavak. Molimo provjerite svih 24 riječi.",
+    "recovery_container_not_found": "Kontejner za oporavak nije pronađen. Molimo odaberite datoteku kontejnera.",
+    "recovery_no_kit_configured": "Nijedan paket za oporavak nije konfigurisan za ovaj disk.",
+    "recovery_generate_first": "Molimo prvo generirajte paket za oporavak putem Postavki ili CLI-ja.",
+    # Recovery security enforcement (BUG-20251220-005)
+    "recovery_already_used": "⚠️ Ovaj paket za oporavak je VEĆ KORIŠTEN.\\n\\nPaketi za oporavak su JEDNOKRATNI.\\nMorate vratiti iz druge sigurnosne kopije.",
+    "recovery_status_invalidating": "Poništavanje paketa za oporavak (jednokratna upotreba)...",
+    "recovery_status_complete": "✅ Oporavak završen! Paket je TRAJNO PONIŠTEN.",
+    "recovery_rekey_required_title": "⚠️ OBAVEZNO: Promijenite pristupne podatke",
+    "recovery_rekey_required_body": "Vaša fraza za oporavak je OTKRIVENA tijekom oporavka.\\n\\nSvako s tom frazom može pristupiti ovom volumenu.\\nMORATE promijeniti pristupne podatke ODMAH.\\n\\nKliknite 'Promijeni sada' za nastavak, ili 'Kasnije' za CLI.",
+    "recovery_rekey_now": "🔑 Promijeni sada",
+    "recovery_rekey_later": "Kasnije (CLI)",
+    "recovery_rekey_skipped_warning": "⚠️ PRESKOČILI STE PROMJENU PRISTUPNIH PODATAKA!\\nPokrenite 'python rekey.py' što prije!",
+    # Post-recovery mount enforcement (BUG-20251220-007)
+    "mount_blocked_rekey_required_title": "Montiranje blokirano: Potrebna promjena ključa",
+    "mount_blocked_rekey_required_body": "Oporavak je izvršen: {recovery_time}\\n\\nMORATE promijeniti pristupne podatke prije montiranja.\\n\\nOvo je SIGURNOSNI ZAHTJEV:\\n• Vaša fraza za oporavak je otkrivena tijekom oporavka\\n• Svako s tom frazom može pristupiti ovom volumenu\\n\\nKoristite Postavke → Sigurnost → Promjena lozinke.",
+    "mount_warn_rekey_title": "Sigurnosno upozorenje: Promjena ključa na čekanju",
+    "mount_warn_rekey_body": "Oporavak je izvršen: {recovery_time}\\n\\nNastavljanje bez promjene ključa je SIGURNOSNI RIZIK!\\n\\nUpišite 'INSECURE' za montiranje svejedno:",
+    # Recovery checkbox UX fix (BUG-20251220-006)
+    "label_recovery_status": "Status paketa za oporavak:",
+    "recovery_kit_available": "✅ Paket za oporavak dostupan i spreman",
+    "recovery_kit_used": "⚠️ Paket za oporavak je korišten (generirajte novi)",
+    "recovery_kit_not_configured": "❌ Paket za oporavak nije konfigurisan",
+    "recovery_html_warning": "HTML datoteka za oporavak još uvijek na disku! Obrišite nakon štampanja radi sigurnosti.",
+    "tooltip_recovery_status": "Prikazuje postoji li valjani paket za oporavak za ovaj disk.\\nGenerirajte paket putem CLI: python recovery.py generate",
+    # Rekey dialog (CHG-20251220-001)
+    "settings_security": "Sigurnost",
+    "settings_security_desc": "Promijenite pristupne podatke i upravljajte sigurnosnim postavkama.",
+    "rekey_section_title": "🔑 Promjena pristupnih podataka",
+    "rekey_instructions": "Promijenite lozinku i/ili datoteku ključa za VeraCrypt volumen. Ovo će otvoriti VeraCrypt GUI za stvarnu promjenu.",
+    "rekey_post_recovery_notice": "⚠️ PROMJENA POTREBNA: Vaši pristupni podaci su otkriveni tijekom oporavka. Morate ih promijeniti sada.",
+    "btn_start_rekey": "🔑 Započni promjenu pristupnih podataka",
+    # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
+    "btn_verify_rekey": "✓ Verificiraj nove pristupne podatke",
+    "btn_cancel_rekey": "✕ Otkaži",
+    "rekey_instructions_veracrypt": "VeraCrypt GUI otvoren. U VeraCryptu:\n1. Tools → Promijeni lozinku volumena\n2. Odaberi uređaj → izaberite svoj volumen\n3. Unesite trenutnu lozinku ('Kopiraj staru lozinku' gore)\n4. Unesite novu lozinku ('Kopiraj novu lozinku' gore)\n5. Kliknite OK\n\nNakon potvrde u VeraCryptu, kliknite 'Verificiraj nove pristupne podatke'.",
+    "rekey_verifying": "Verificiram nove pristupne podatke putem mount testa...",
+    "rekey_verification_success": "✓ Novi pristupni podaci verificirani! Završavam rekey...",
+    "rekey_verification_failed": "✕ Verifikacija neuspjela. Provjerite novu lozinku/datoteku ključa.",
+    "rekey_cancelled": "Promjena pristupnih podataka otkazana.",
+    # BUG-20251221-039: Copy credential buttons
+    # CHG-20251222-018: Enhanced tooltips for clarity
+    "btn_copy_old_password": "📋 Kopiraj staru lozinku",
+    "btn_copy_new_password": "📋 Kopiraj novu lozinku",
+    "tooltip_copy_old_password": "Izvedu i kopiraj TRENUTNU lozinku koristeći POSTOJEĆI GPG seed. Za GPG načine koristi hardverski ključ. (30s TTL)",
+    "tooltip_copy_new_password": "Izvedu i kopiraj NOVU lozinku koristeći NOVI GPG seed (gore naveden). Prvo generirajte novi seed.gpg. (30s TTL)",
+    # CHG-20251223-001: Post-recovery tooltip
+    "tooltip_copy_old_password_post_recovery": "Onemogućeno: Nakon oporavka, koristi lozinku iz recovery kita. GPG seed možda nedostaje.",
+    "rekey_gpg_seed_hint": "Za GPG načine: 'Novi GPG Seed' gore određuje izvedenu lozinku. Prvo generirajte novi seed.gpg, zatim koristite 'Kopiraj novu lozinku'.",
+    "copy_password_title": "Kopiranje lozinke",
+    "rekey_status_ready": "Kliknite 'Započni promjenu pristupnih podataka' za početak.",
+    "rekey_status_preparing": "Pripremanje pristupnih podataka...",
+    "rekey_status_opening_veracrypt": "Otvaranje VeraCrypt GUI-ja...",
+    "rekey_status_awaiting_confirmation": "Dovršite promjenu u VeraCryptu, zatim kliknite 'Potvrdi'.",
+    "rekey_status_verifying": "Provjera novih pristupnih podataka...",
+    "rekey_validating": "Validacija novih pristupnih podataka...",
+    "rekey_verifying_mount": "Provjera pristupnih podataka putem montiranja...",
+    "rekey_credentials_verified": "Novi pristupni podaci uspješno provjereni!",
+    "rekey_testing_mount": "Testiranje montiranja sa novim pristupnim podacima...",
+    "rekey_validation_success": "Validacija uspješna - demontiranje...",
+    "rekey_status_success": "✅ Pristupni podaci uspješno promijenjeni!",
+    "rekey_status_failed": "❌ Provjera nije uspjela. Molimo pokušajte ponovo.",
+    "btn_verify_rekey": "✓ Potvrdi nove pristupne podatke",
+    "rekey_current_password_label": "Trenutna lozinka:",
+    "rekey_current_password_auto": "(Automatski osigurano)",
+    "rekey_new_password_label": "Nova lozinka:",
+    "rekey_confirm_password_label": "Potvrdi lozinku:",
+    # Mode selection during rekey (CHG-20251221-001)
+    "rekey_current_mode_label": "Trenutni sigurnosni način:",
+    "rekey_target_mode_label": "Novi sigurnosni način:",
+    "rekey_mode_same_tooltip": "Zadrži trenutni način - samo promijeni lozinku/datoteku ključa",
+    "rekey_mode_pw_only": "🔒 Samo lozinka",
+    "rekey_mode_pw_keyfile": "🔑 Lozinka + datoteka ključa",
+    "rekey_mode_pw_gpg_keyfile": "🔐 YubiKey + lozinka",
+    "rekey_mode_gpg_pw_only": "🔐 GPG izvedena lozinka",
+    "rekey_new_keyfile_label": "Nova putanja datoteke ključa:",
+    "rekey_new_gpg_seed_label": "Nova GPG seed datoteka:",
+    "btn_browse_keyfile": "Pregledaj...",
+    # CHG-20251221-003: GPG seed generation button
+    "btn_generate_gpg_seed": "Generiši",
+    "tooltip_generate_gpg_seed": "Generiši novi GPG-šifrirani seed za izvođenje lozinke. Potreban YubiKey/GPG kartica.",
+    "gpg_seed_generate_title": "Generiši GPG Seed",
+    "gpg_seed_generate_confirm": "Ovo će generisati novi kriptografski siguran seed i šifrirati ga vašim GPG ključem.\n\nMolimo osigurajte da je vaš YubiKey/GPG kartica uložena.\n\nNastaviti?",
+    "gpg_seed_generate_success": "GPG seed uspješno generisan!",
+    "gpg_seed_generate_fail": "Neuspjelo generisanje GPG seeda",
+    "gpg_seed_derive_info": "Lozinka izvedena iz ovog seeda će biti prikazana.\nKopirajte je za korištenje kao novu VeraCrypt lozinku.",
+    # CHG-20251223-032: Multi-key authentication
+    "gpg_key_auth_title": "Autentifikacija GPG ključa",
+    "gpg_key_auth_prompt": "Da biste osigurali da imate pristup ovom ključu, molimo autentifikujte se.\n\nKljuč: {fingerprint}\n\nMožda ćete biti zatraženi za vaš PIN.",
+    "gpg_key_auth_success": "Ključ uspješno autentifikovan.",
+    "gpg_key_auth_fail": "Autentifikacija neuspjela za ključ: {fingerprint}",
+    "gpg_key_auth_skip_prompt": "Želite li preskočiti autentifikaciju za ovaj ključ?\n\n⚠️ UPOZORENJE: Ako preskočite, možete konfigurirati ključ koji ne posjedujete.\nOvo je prihvatljivo kada delegirate pristup drugoj osobi.",
+    "gpg_key_auth_skipped": "Autentifikacija preskočena za ključ: {fingerprint}",
+    # CHG-20251221-008: GPG key selection dialog
+    "gpg_key_select_title": "Odaberi GPG ključ za šifriranje",
+    "gpg_key_select_hint": "Odaberite hardverski ključ sa liste ispod ili ručno unesite otisak prsta ili e-mail ako vaš ključ nije naveden.",
+    "gpg_key_select_label": "GPG ključ:",
+    "gpg_key_select_placeholder": "Odaberite ili unesite ključ...",
+    "gpg_key_select_manual": "Ručni unos...",
+    "gpg_key_select_none": "Nisu pronađeni tajni GPG ključevi",
+    "gpg_key_manual_label": "Unesite otisak prsta ili e-mail:",
+    # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
+    "gpg_key_select_hint_multi": "Odaberite jedan ili više hardverskih ključeva sa liste ispod za redundanciju.\nMožete također ručno unijeti dodatne otiske prstiju (odvojene zarezom ili novim redom).",
+    "gpg_key_manual_label_multi": "Dodatni otisci prstiju:",
+    "gpg_key_select_placeholder_multi": "Unesite otiske prstiju (odvojene zarezom ili novim redom)...",
+    "gpg_key_select_none_selected": "Molimo odaberite barem jedan GPG ključ ili ručno unesite otisak prsta.",
+    "rekey_mode_change_warning": "⚠️ Promjena sigurnosnog načina će promijeniti kako se autentificirate na ovaj disk.",
+    "rekey_gpg_seed_instructions": "Za GPG načine, odaberite šifriranu seed datoteku za izvođenje lozinke.",
+    "popup_unmount_failed_title": "Demontiranje nije uspjelo",
+    "popup_mount_failed_title": "Montiranje nije uspjelo",
+    "popup_update_not_possible_title": "Ažuriranje nije moguće",
+    "popup_update_confirm_title": "Potvrdi ažuriranje",
+    "popup_update_direction": "Smjer",
+    "popup_update_source": "Izvor",
+    "popup_update_destination": "Odredište",
+    "popup_update_files_to_update": "Datoteke za ažuriranje",
+    "popup_update_protected_items": "Zaštićene stavke (Nikad prepisano)",
+    "popup_update_protected_list": "Sledeći korisnički podaci su automatski zaštićeni: {items}",
+    "popup_update_warning": "Upozorenje",
+    "popup_update_warning_body": "Ovo će prepisati postojeće datoteke skripti u .smartdrive/ direktoriju.",
+    "popup_update_confirm_message": "Spremno za pokretanje UPDATE ({direction}).\n\nOD:\n  {src_root}\n\nDO:\n  {dst_root}\n\nStavke:\n  - {items}\n\nMetoda: {method}\n\nOvo će prepisati postojeće datoteke. Nastaviti?",
+    "popup_update_config_title": "Konfiguracija ažuriranja",
+    "popup_update_config_body": "Izvor ažuriranja nije konfigurisan. Postavite ga u Postavkama.",
+    "popup_update_complete_title": "Ažuriranje završeno",
+    "popup_update_complete_body": "Ažuriranje je uspješno završeno. Molimo ponovo pokrenite aplikaciju.",
+    "popup_update_failed_title": "Ažuriranje nije uspjelo",
+    "popup_update_failed_body": "Ažuriranje nije uspjelo:\n\n{error}",
+    "popup_update_timeout_title": "Ažuriranje je isteklo",
+    "popup_update_timeout_body": "Ažuriranje nije završeno u roku od 120 sekundi.",
+    "popup_update_error_title": "Greška ažuriranja",
+    "popup_update_error_body": "Neuspjelo pokretanje ažuriranja:\n\n{error}",
+    "popup_cli_failed_title": "Pokretanje CLI-ja nije uspjelo",
+    "popup_cli_failed_body": "Nije moguće otvoriti CLI:\n\n{error}",
+    # Update configuration error messages
+    "error_update_server_url_not_configured": "Server URL nije konfigurisan.\n\nIdite u Postavke da konfigurirate URL za ažuriranje.",
+    "error_update_local_root_not_configured": "Lokalni direktorij za ažuriranje nije konfigurisan.\n\nIdite u Postavke da konfigurirate lokalni root za ažuriranje.",
+    "error_update_local_root_not_found": "Lokalni direktorij za ažuriranje nije pronađen:\n\n{path}\n\nProvjerite Postavke da verifikujete putanju.",
+    "error_update_install_dir_not_found": "Instalacijski direktorij nije pronađen:\n\n{path}",
+    "error_update_unknown_source_type": "Nepoznat tip izvora ažuriranja: {type}",
+    # Hardware key error messages
+    "error_hardware_key_missing_title": "Potreban hardverski ključ",
+    "error_hardware_key_missing_body": "Hardverski ključ (YubiKey/GPG kartica) nije detektovan. Molimo ubacite hardverski ključ i pokušajte ponovo.",
+    # Theme names (for theme dropdown)
+    "theme_brand": "Brend",
+    "theme_green": "Zelena",
+    "theme_blue": "Plava",
+    "theme_rose": "Ružičasta",
+    "theme_slate": "Škriljac",
+    "label_theme": "Tema",
+    # File explorer buttons
+    "tooltip_open_launcher_drive": "Otvori launcher disk",
+    "tooltip_open_mounted_volume": "Otvori montirani volumen",
+    "popup_open_failed_title": "Otvaranje nije uspjelo",
+    "popup_open_failed_body": "Nije moguće otvoriti upravitelj datoteka:\n\n{path}\n\n{error}",
+    # About section (CHG-20251221-012)
+    "settings_about": "O programu",
+    "label_version": "Verzija:",
+    "label_build_id": "ID izgradnje:",
+    "label_build_dev": "Razvoj",
+    "label_compat_version": "Verzija konfiguracije:",
+    # Recovery kit generation (CHG-20251221-001)
+    "recovery_generate_section_title": "Generiši paket za oporavak",
+    "recovery_generate_instructions": "Generirajte novi paket za oporavak da biste napravili šifrovanu sigurnosnu kopiju vaših vjerodajnica. Ovo je korisno ako je vaš originalni paket izgubljen, oštećen ili ako želite novu kopiju nakon promjene vjerodajnica.",
+    "btn_generate_recovery_kit": "🔐 Generiši novi paket za oporavak",
+    "recovery_generate_status_ready": "Kliknite 'Generiši novi paket za oporavak' za kreiranje novog paketa.",
+    "recovery_generate_status_deriving": "Izvođenje vjerodajnica iz hardverskog ključa...",
+    "recovery_generate_status_verifying": "Provjera vjerodajnica sa VeraCrypt-om...",
+    "recovery_generate_status_running": "Generisanje paketa za oporavak...",
+    "recovery_generate_status_success": "✅ Paket za oporavak uspješno generisan!",
+    "recovery_generate_status_failed": "❌ Generisanje paketa za oporavak nije uspjelo: {error}",
+    "recovery_generate_confirm_title": "Generiši paket za oporavak",
+    "recovery_generate_confirm_body": "Ovo će generisati novi paket za oporavak sa šifriranom sigurnosnom kopijom vaših vjerodajnica.\n\nŽelite li nastaviti?",
+    "recovery_generate_regen_confirm_title": "Regeneriši paket za oporavak",
+    "recovery_generate_regen_confirm_body": "⚠️ UPOZORENJE: Ovo će stvoriti NOVI paket za oporavak.\n\nVaš POSTOJEĆI paket za oporavak će biti TRAJNO PONIŠTEN.\n\nŽelite li nastaviti?",
+    "recovery_generate_security_warning_title": "Sigurnosno upozorenje: Regenerisanje paketa za oporavak",
+    "recovery_generate_security_warning_body": "⚠️ SIGURNOSNO UPOZORENJE ⚠️\n\nPaket za oporavak već postoji. Stvaranje novog će:\n\n• Poništiti prethodni paket\n• Stvoriti NOVI pristup vašim šifriranim podacima\n• Svako s novim paketom može pristupiti vašim podacima\n\nNastavite samo ako razumijete sigurnosne implikacije.\n\nŽelite li regenerisati?",
+    "recovery_generate_password_prompt_title": "Unesite lozinku volumena",
+    "recovery_generate_password_prompt_body": "Molimo unesite lozinku volumena za generisanje paketa za oporavak:",
+    "recovery_generate_success_title": "Paket za oporavak generisan",
+    "recovery_generate_success_body": "Vaš paket za oporavak je generisan!\n\nLokacija: {path}\n\n⚠️ VAŽNO:\n• Odmah odštampajte HTML datoteku\n• Čuvajte na sigurnoj fizičkoj lokaciji\n• Obrišite HTML datoteku s diska nakon štampanja",
+    # Settings dialog - Additional fields (schema-driven UI)
+    "label_drive_id": "ID diska",
+    "label_drive_name": "Naziv diska",
+    "label_setup_date": "Datum postavljanja",
+    "label_last_password_change": "Posljednja promjena lozinke",
+    "label_last_verified": "Posljednja provjera",
+    "label_plain_keyfile": "Obična datoteka ključa",
+    "label_seed_gpg_path": "GPG seed datoteka",
+    "label_kdf": "Funkcija izvođenja ključa",
+    "label_pw_encoding": "Kodiranje lozinke",
+    "label_recovery_enabled": "Omogući paket za oporavak",
+    "label_recovery_share_count": "Broj dijelova za oporavak",
+    "label_recovery_threshold": "Prag oporavka",
+    "label_lost_and_found_enabled": "Omogući poruku pronađenog",
+    "label_lost_and_found_message": "Poruka povrata",
+    "label_verification_overridden": "Provjera zaobiđena",
+    "label_integrity_signed": "Integritet potpisan",
+    "label_signing_key_fpr": "Otisak prsta ključa potpisa",
+    "label_salt_b64": "Salt (Base64)",
+    "label_hkdf_info": "HKDF Info",
+    "label_schema_version": "Verzija šeme",
+    "label_version": "Verzija",
+    # Tooltips for settings fields
+    "tooltip_drive_id": "Jedinstveni identifikator za ovaj disk (samo za čitanje)",
+    "tooltip_drive_name": "Prilagođeni naziv za ovaj disk",
+    "tooltip_language": "Jezik korisničkog interfejsa",
+    "tooltip_theme": "Šema boja za interfejs",
+    "tooltip_mode": "Sigurnosni način: samo lozinka, datoteka ključa ili YubiKey/GPG",
+    "tooltip_encrypted_keyfile": "Putanja do GPG-šifrirane datoteke ključa (za GPG načine)",
+    "tooltip_plain_keyfile": "Putanja do nešifrirane datoteke ključa (za običan način datoteke ključa)",
+    "tooltip_seed_gpg_path": "Putanja do GPG seed datoteke za izvođenje lozinke",
+    "tooltip_kdf": "Funkcija izvođenja ključa za GPG način lozinke",
+    "tooltip_pw_encoding": "Kodiranje znakova za lozinku (UTF-8 preporučeno)",
+    "tooltip_windows_volume_path": "Windows volumen GUID ili putanja uređaja",
+    "tooltip_mount_letter": "Slovo diska za montiranje (A-Z)",
+    "tooltip_veracrypt_path": "Putanja do VeraCrypt.exe izvršne datoteke",
+    "tooltip_unix_volume_path": "Unix putanja uređaja (npr. /dev/sdb2)",
+    "tooltip_mount_point": "Unix direktorij tačke montiranja",
+    # BUG-20251221-037: Mount point fallback i18n keys
+    "label_allow_mount_fallback": "Automatski koristi alternativnu tačku montiranja",
+    "tooltip_allow_mount_fallback": "Kada je omogućeno, automatski se pokušavaju alternativna slova diska (Windows) ili direktoriji montiranja (Unix) ako konfigurisani nije dostupan. Preporučeno za izbjegavanje grešaka montiranja.",
+    "error_mount_point_occupied_fallback_disabled": "Tačka montiranja {mount_point} je već u upotrebi.\n\nDa biste izbjegli ovu grešku u budućnosti, omogućite 'Automatski koristi alternativnu tačku montiranja' u Postavke → {os_tab}.",
+    "error_mount_point_all_occupied": "Nije moguće pronaći dostupnu tačku montiranja nakon 3 pokušaja.\n\nSva slova diska D-Z su zauzeta (Windows) ili alternative tačke montiranja nisu uspjele (Unix).\n\nOvo je problem sa tačkom montiranja, NE problem sa akreditivima.",
+    "warning_mount_fallback_used": "Konfigurisana tačka montiranja {original} nije bila dostupna.\nKoristi se {fallback} umjesto toga. Konfiguracija ažurirana.",
+    "tooltip_recovery_enabled": "Omogući generisanje hitnog paketa za oporavak",
+    "tooltip_recovery_share_count": "Broj dijelova za oporavak za generisanje",
+    "tooltip_recovery_threshold": "Minimalan broj dijelova potrebnih za oporavak",
+    "tooltip_lost_and_found_enabled": "Omogući poruku povrata ako je disk izgubljen",
+    "tooltip_lost_and_found_message": "Poruka prikazana ako je disk pronađen",
+    "tooltip_source_type": "Izvor ažuriranja: lokalni direktorij ili URL servera",
+    "tooltip_server_url": "URL servera za ažuriranja",
+    "tooltip_local_root": "Lokalni direktorij sa datotekama ažuriranja",
+    "hint_update_local_title": "O lokalnim ažuriranjima",
+    "hint_update_local_body": "Odaberite: (1) direktorij koji sadrži .smartdrive/ folder (npr. H:\\ ili C:\\MojDev\\), ili (2) direktno .smartdrive/ folder. .smartdrive/ će biti automatski detektovan. Korisnicki podaci (recovery/, keys/, integrity/, config.json) su automatski zaštićeni. Razvojne datoteke (.git, testovi, helper/) su isključene.",
+    # CHG-20251222-016: Update action section i18n keys
+    "update_action_section_title": "Akcije ažuriranja",
+    "btn_run_update": "Pokreni ažuriranje",
+    "tooltip_run_update": "Izvrši ažuriranje iz konfigurisanog izvora",
+    "label_last_update": "Posljednje ažuriranje:",
+    "label_last_update_source": "Izvor:",
+    "update_never": "Nikad",
+    "update_source_none": "Nije konfigurisano",
+    "tooltip_verification_overridden": "Zaobiđi provjeru integriteta (opasno!)",
+    "tooltip_integrity_signed": "Integritet diska je kriptografski potpisan",
+    "tooltip_signing_key_fpr": "Otisak prsta GPG ključa korišten za potpis",
+    "tooltip_salt_b64": "Kriptografski salt za izvođenje ključa",
+    "tooltip_hkdf_info": "Kontekstni string za HKDF izvođenje ključa",
+    # Integrity tab (CHG-20251220-002)
+    "label_integrity_status": "Status integriteta:",
+    "tooltip_integrity_status": "Prikazuje da li su skripte verifikovane protiv potpisanih hasheva",
+    # CHG-20251222-014: OS-specific tab tooltip
+    "tooltip_tab_disabled_other_os": "Ova kartica je za drugi operativni sistem",
+    "settings_integrity": "Integritet",
+    "settings_integrity_desc": "Provjerite integritet softvera i potpišite skripte.",
+    "integrity_section_title": "🔐 Integritet softvera",
+    "integrity_instructions": "Provjerite da li su skripte promijenjene od potpisivanja. Potpisivanje zahtijeva hardverski ključ (YubiKey/GPG karticu).",
+    "btn_verify_local": "✓ Provjeri integritet (lokalno)",
+    "btn_sign_scripts": "🔑 Potpiši skripte",
+    "btn_verify_remote": "🌐 Provjeri (udaljeno)",
+    "integrity_status_ready": "Kliknite 'Provjeri' za provjeru integriteta skripte.",
+    "integrity_status_checking": "Provjera integriteta...",
+    "integrity_status_signing": "Potpisivanje skripti sa hardverskim ključem...",
+    "integrity_status_pass": "✅ Integritet potvrđen! Skripte su autentične.",
+    "integrity_status_fail": "❌ Provjera integriteta NEUSPJEŠNA! Skripte su možda promijenjene.",
+    "integrity_status_no_manifest": "⚠️ Manifest integriteta nije pronađen. Skripte nisu potpisane.",
+    "integrity_status_sign_success": "✅ Skripte uspješno potpisane!",
+    "integrity_status_sign_fail": "❌ Potpisivanje neuspješno. Da li je hardverski ključ umetnut?",
+    "integrity_result_hash": "Hash: {hash}",
+    "integrity_result_signer": "Potpisano od: {signer}",
+    "integrity_remote_url_label": "URL servera:",
+    "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
+    "integrity_status_remote_checking": "Slanje zahtjeva za verifikaciju serveru...",
+    "integrity_status_remote_success": "✅ Udaljena verifikacija uspješna!",
+    "integrity_status_remote_fail": "❌ Udaljena verifikacija neuspješna: {error}",
+    "integrity_status_no_server_url": "⚠️ URL servera nije konfigurisan. Postavite u Postavke → Integritet.",
+    "label_integrity_server_url": "URL servera za verifikaciju",
+    "tooltip_integrity_server_url": "URL udaljenog servera za verifikaciju (npr. https://verify.example.com/api/check)",
+}
@@ -0,0 +1,481 @@
+# locales/gui_de.py - GUI translation catalog: German
+"""GUI strings for language 'de' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Window titles
+    "window_title": "KeyDrive",
+    "settings_window_title": "Einstellungen",
+    # Button labels
+    "btn_mount": "🔓 Einbinden",
+    "btn_unmount": "🔒 Aushängen",
+    "btn_cancel_auth": "❌ Abbrechen",
+    "btn_confirm_mount": "✅ Bestätigen",
+    "btn_tools": "⚙️",
+    "btn_close": "✕",
+    "btn_save": "Speichern",
+    "btn_cancel": "Abbrechen",
+    "btn_confirm": "Bestätigen",
+    "btn_ok": "OK",
+    "warning": "Warnung",
+    "settings_tab_security": "Sicherheit",
+    # CHG-20251223-055: Reload config button for non-modal settings
+    "btn_reload_config": "↻ Konfig neu laden",
+    "tooltip_reload_config": "Konfiguration von Festplatte neu laden (verwirft ungespeicherte Änderungen)",
+    # Status messages
+    "status_config_not_found": "Konfiguration nicht gefunden",
+    "status_volume_mounted": "Volume eingebunden",
+    "status_volume_not_mounted": "Volume nicht eingebunden",
+    "status_mounting": "⏳ Volume wird eingebunden...",
+    "status_mounting_gpg": "⏳ Volume wird eingebunden (GPG-Authentifizierung)...",
+    "status_unmounting": "⏳ Volume wird ausgehängt...",
+    "status_mount_success": "✅ Volume erfolgreich eingebunden",
+    "status_mount_failed": "❌ Einbinden fehlgeschlagen",
+    "status_unmount_success": "✅ Volume erfolgreich ausgehängt",
+    "status_unmount_failed": "❌ Aushängen fehlgeschlagen",
+    # Info labels
+    "info_unavailable": "Info nicht verfügbar",
+    "keyfile_selected_one": "1 Schlüsseldatei ausgewählt",
+    "keyfile_selected_many": "{count} Schlüsseldateien ausgewählt",
+    "keyfile_drop_hint": "Schlüsseldateien hier ablegen oder klicken zum Auswählen",
+    "keyfile_drop_supports_multiple": "Unterstützt mehrere Schlüsseldateien",
+    "label_show_password": "Passwort anzeigen",
+    # Size formatting
+    "size_free": "Frei: {size}",
+    # Icons/placeholders
+    "icon_drive": "🚀",
+    # Tooltips
+    "tooltip_exit": "SmartDrive beenden",
+    "tooltip_settings": "Erweiterte Werkzeuge und Einstellungen",
+    # Labels
+    "label_product_name": "Produktname",
+    "label_preview": "Vorschau:",
+    "label_password": "Passwort:",
+    "label_keyfile": "Schlüsseldatei:",
+    "label_hardware_key_hint": "💡 Hardware-Schlüssel kann für Authentifizierung erforderlich sein",
+    "label_forgot_password": "Passwort vergessen?",
+    # Placeholder text
+    "placeholder_password": "Geben Sie Ihr VeraCrypt-Passwort ein...",
+    # Menu items
+    "menu_settings": "⚙️ Einstellungen",
+    "menu_rekey": "🔑 Passwort/Schlüssel ändern",
+    "menu_update": "⬇️ Skripte aktualisieren",
+    "menu_recovery": "💾 Wiederherstellungs-Kit",
+    "menu_about": "ℹ️ Über",
+    "menu_cli": "💻 CLI öffnen",
+    "menu_exit": "⏻ Beenden",
+    "menu_clear_keyfiles": "Schlüsseldateien löschen",
+    "menu_switch_drive": "🔀 Laufwerk wechseln...",
+    "menu_switch_drive_browse": "📂 Durchsuchen...",
+    # CHG-20251221-042: Remote Control Mode menu items (German)
+    "menu_manage_remote": "🌐 Fernsteuerung...",
+    "menu_manage_remote_browse": "📂 Fernbedienung .smartdrive suchen...",
+    "menu_exit_remote": "🏠 Fernmodus beenden",
+    "remote_active_label": "Fernsteuerung aktiv",
+    "remote_click_to_end": "Klicken zum Beenden",
+    "remote_validation_failed_title": "Fernvalidierung fehlgeschlagen",
+    "remote_validation_failed_body": "Verbindung zum entfernten Laufwerk nicht möglich:\n\n{error}",
+    "remote_disconnected_title": "Entferntes Laufwerk getrennt",
+    "remote_disconnected_body": "Das entfernte Laufwerk ({drive}:) wurde getrennt.\n\nRückkehr zum lokalen Modus.",
+    "remote_confirm_title": "Fernsteuerungsmodus aktivieren",
+    "remote_confirm_body": "Verbindung zu entferntem .smartdrive herstellen:\n{path}\n\nIm Fernmodus können Sie nur das entfernte Volumen ein-/aushängen.\nEinstellungen, Updates und CLI-Zugriff sind deaktiviert.",
+    "remote_mode_disabled_title": "Fernmodus aktiv",
+    "remote_mode_disabled_cli": "CLI-Zugriff ist im Fernmodus deaktiviert.",
+    "remote_mode_disabled_settings": "Einstellungen sind im Fernmodus deaktiviert. Beenden Sie zuerst den Fernmodus.",
+    "remote_mode_disabled_update": "Updates sind im Fernmodus deaktiviert. Beenden Sie zuerst den Fernmodus.",
+    "dialog_select_keyfiles": "Schlüsseldatei(en) auswählen",
+    # Multi-drive context (CHG-20251221-026)
+    "label_launcher_root": "Startlaufwerk:",
+    "group_drive_context": "Laufwerkskontext",
+    "tooltip_launcher_root": "Das Laufwerk mit diesem .smartdrive-Ordner",
+    # Drive safety context (CHG-20251221-040)
+    "label_os_drive": "Betriebssystem-Laufwerk:",
+    "tooltip_os_drive": "Laufwerk mit dem Betriebssystem (kann nicht neu partitioniert werden)",
+    "label_instantiation_drive": "Gestartet von:",
+    "tooltip_instantiation_drive": "Laufwerk, von dem diese Instanz gestartet wurde (kann nicht neu partitioniert werden)",
+    "switch_drive_title": "Laufwerkskontext wechseln",
+    "switch_drive_confirm": "Konfiguration wechseln von:\n{path}\n\nAlle Einstellungen werden von diesem Laufwerk neu geladen.",
+    "switch_drive_invalid_path": "Ungültiger .smartdrive-Ordner. Keine config.json gefunden.",
+    "switch_drive_select_folder": ".smartdrive-Ordner auswählen",
+    "version_incompatible_title": "Versionskompatibilitätswarnung",
+    "version_incompatible_error": "Wechsel zu diesem Laufwerk nicht möglich:\n\n{message}\n\nDas Konfigurationsformat ist mit dieser Softwareversion nicht kompatibel.",
+    "version_incompatible_warning": "{message}\n\nZiel: {path}\n\nMöchten Sie trotzdem fortfahren?",
+    # Tray messages
+    "tray_minimized_message": "Läuft im Hintergrund. Klicken Sie auf das Tray-Symbol zum Wiederherstellen.",
+    "tray_unavailable_message": "Systemleiste ist nicht verfügbar.\n\nMöchten Sie die Anwendung beenden?",
+    "tray_tooltip": "{name} ({id})",
+    # Status messages
+    "status_deriving_yubikey_password": "Passwort wird vom YubiKey abgeleitet...",
+    "status_checking_mount": "Mount-Status wird überprüft...",
+    "status_unmounting_for_rekey": "Volume wird für Rekey ausgehängt...",
+    "status_decrypting_keyfile": "Schlüsseldatei wird mit YubiKey entschlüsselt...",
+    # Worker messages (keys for structured errors)
+    "worker_mount_script_not_found": "Mount-Skript nicht gefunden",
+    "worker_mount_success": "Volume erfolgreich eingebunden",
+    "worker_mount_failed": "Einbinden fehlgeschlagen: {error}",
+    "worker_mount_timeout": "Mount-Vorgang zeitüberschreitung",
+    "worker_mount_error": "Mount-Fehler: {error}",
+    "worker_unmount_script_not_found": "Unmount-Skript nicht gefunden",
+    "worker_unmount_success": "Volume erfolgreich ausgehängt",
+    "worker_unmount_failed": "Aushängen fehlgeschlagen: {error}",
+    "worker_unmount_timeout": "Unmount-Vorgang Zeitüberschreitung",
+    "worker_unmount_error": "Unmount-Fehler: {error}",
+    # Settings dialog - Tab names
+    "settings_language": "Sprache",
+    "settings_general": "Allgemein",
+    "settings_security": "Sicherheit",
+    "settings_keyfile": "Schlüsseldatei",
+    "settings_windows": "Windows",
+    "settings_unix": "Unix",
+    "settings_updates": "Aktualisierungen",
+    "settings_recovery": "Wiederherstellung",
+    "settings_lost_and_found": "Fundsachen",
+    "settings_advanced": "Erweitert",
+    # Settings dialog - Tab descriptions
+    "settings_general_desc": "Konfigurieren Sie Anzeigename, Sprache und Design-Einstellungen.",
+    "settings_security_desc": "Verschlüsselungsmodus und Authentifizierungsmethode für Ihr sicheres Laufwerk.",
+    "settings_keyfile_desc": "Verwalten Sie Schlüsseldatei-Pfade für Verschlüsselung und GPG-Authentifizierung.",
+    "settings_windows_desc": "Windows-spezifische Einstellungen inkl. Laufwerksbuchstabe und VeraCrypt-Pfad.",
+    "settings_unix_desc": "Linux- und macOS-Einstellungen inkl. Einhängepunkt-Verzeichnis.",
+    "settings_updates_desc": "Automatische Update-Prüfung und Server-Einstellungen konfigurieren.",
+    "settings_recovery_desc": "Shamir Secret Sharing Wiederherstellungsoptionen für Notfallzugriff einrichten.",
+    "settings_lost_and_found_desc": "Kontaktnachricht auf dem Laufwerk für Rückgabe bei Verlust anzeigen.",
+    "settings_advanced_desc": "Technische Einstellungen für Verschlüsselungsparameter und Integritätsprüfung.",
+    # BUG-20251221-036: Settings dialog - Group box titles (German)
+    "group_drive_identification": "Laufwerksidentifikation",
+    "group_appearance": "Erscheinungsbild",
+    "group_timestamps": "Zeitstempel",
+    "group_security_mode": "Sicherheitsmodus",
+    "group_keyfile_configuration": "Schlüsseldatei-Konfiguration",
+    "group_gpg_configuration": "GPG-Konfiguration",
+    "group_emergency_recovery_kit": "Notfall-Wiederherstellungs-Kit",
+    "group_verification": "Verifizierung",
+    "group_verification_status": "Verifizierungsstatus",
+    "group_software_integrity": "Software-Integrität",
+    "group_remote_verification": "Remote-Verifizierung",
+    "group_gpg_kdf_parameters": "GPG-KDF-Parameter",
+    "group_metadata": "Metadaten",
+    "settings_restart_not_required": "✓ Änderungen sofort übernommen (kein Neustart erforderlich)",
+    "label_mode": "Modus",
+    "label_encrypted_keyfile": "Verschlüsselte Schlüsseldatei",
+    "label_volume_path": "Volume-Pfad",
+    "label_mount_letter": "Laufwerksbuchstabe",
+    "label_veracrypt_path": "VeraCrypt-Pfad",
+    "label_mount_point": "Einhängepunkt",
+    "label_source_type": "Quellentyp",
+    "label_server_url": "Server-URL",
+    "label_local_root": "Lokaler Pfad",
+    "error_invalid_mount_letter": "Laufwerksbuchstabe muss ein einzelnes Zeichen von A–Z sein.",
+    "error_save_failed": "Konnte config.json nicht speichern:",
+    "title_invalid_mount_letter": "Ungültiger Laufwerksbuchstabe",
+    "title_save_failed": "Speichern fehlgeschlagen",
+    "title_error": "Fehler",
+    "error_apply_theme": "Thema konnte nicht angewendet werden: {error}",
+    "error_apply_language": "Sprache konnte nicht angewendet werden: {error}",
+    # Popup dialogs
+    "popup_keyfile_required_title": "Schlüsseldatei erforderlich",
+    "popup_keyfile_required_body": "Bitte wählen Sie eine Schlüsseldatei für den Passwort + Schlüsseldatei-Modus.",
+    "popup_password_required_title": "Passwort erforderlich",
+    "popup_password_required_body": "Bitte geben Sie Ihr VeraCrypt-Passwort ein.",
+    "popup_recovery_title": "Passwort-Wiederherstellung",
+    "popup_recovery_available_body": "Wiederherstellungs-Kit ist für dieses Laufwerk verfügbar!\n\nUm Zugriff auf Ihr verschlüsseltes Volume wiederherzustellen:\n\n1. Verwenden Sie die SmartDrive CLI: python smartdrive.py\n2. Wählen Sie Option 6: Recovery Kit\n3. Folgen Sie den Wiederherstellungsanweisungen\n\nOder kontaktieren Sie Ihren Systemadministrator.",
+    "popup_recovery_unavailable_body": "Kein Wiederherstellungs-Kit ist derzeit für dieses Laufwerk verfügbar.\n\nUm Passwort-Wiederherstellung einzurichten:\n\n1. Verwenden Sie die SmartDrive CLI: python smartdrive.py\n2. Wählen Sie Option 6: Recovery Kit\n3. Wählen Sie 'Wiederherstellungs-Kit generieren'\n\nOder kontaktieren Sie Ihren Systemadministrator.",
+    # Recovery tab - Phrase input and recovery actions
+    "recovery_section_title": "🔐 Notfall-Wiederherstellung",
+    "recovery_instructions": "Geben Sie Ihre 24-Wort-Wiederherstellungsphrase ein, um Zugriff auf Ihr verschlüsseltes Volume wiederherzustellen. Sie können auch eine Wiederherstellungs-Container-Datei angeben, falls vorhanden.",
+    "label_recovery_phrase": "Wiederherstellungsphrase (24 Wörter):",
+    "placeholder_recovery_phrase": "Geben Sie 24 Wörter durch Leerzeichen getrennt ein...",
+    "label_recovery_container": "Wiederherstellungs-Container (optional):",
+    "btn_browse_container": "Durchsuchen...",
+    "btn_recover_credentials": "🔓 Zugangsdaten wiederherstellen",
+    "recovery_status_ready": "Geben Sie Ihre Wiederherstellungsphrase ein und klicken Sie auf 'Zugangsdaten wiederherstellen'",
+    "recovery_status_validating": "Validiere Wiederherstellungsphrase...",
+    "recovery_status_decrypting": "Entschlüssele Wiederherstellungs-Container...",
+    "recovery_status_success": "✅ Wiederherstellung erfolgreich! Zugangsdaten wiederhergestellt.",
+    "recovery_status_failed": "❌ Wiederherstellung fehlgeschlagen: {error}",
+    "recovery_result_title": "Wiederhergestellte Zugangsdaten",
+    "recovery_result_password": "Passwort:",
+    "recovery_result_keyfile": "Schlüsseldatei:",
+    "recovery_result_mode": "Sicherheitsmodus:",
+    "recovery_result_copy_password": "📋 Passwort kopieren",
+    "recovery_result_save_keyfile": "💾 Schlüsseldatei speichern",
+    "recovery_copied_to_clipboard": "Passwort in Zwischenablage kopiert (wird in 30 Sekunden gelöscht)",
+    "recovery_keyfile_saved": "Schlüsseldatei gespeichert unter: {path}",
+    "recovery_phrase_invalid": "Ungültige Wiederherstellungsphrase. Bitte überprüfen Sie alle 24 Wörter.",
+    "recovery_container_not_found": "Wiederherstellungs-Container nicht gefunden. Bitte wählen Sie die Container-Datei aus.",
+    "recovery_no_kit_configured": "Kein Wiederherstellungs-Kit für dieses Laufwerk konfiguriert.",
+    "recovery_generate_first": "Bitte generieren Sie zuerst ein Wiederherstellungs-Kit über Einstellungen oder CLI.",
+    # Recovery security enforcement (BUG-20251220-005)
+    "recovery_already_used": "⚠️ Dieses Wiederherstellungs-Kit wurde BEREITS VERWENDET.\\n\\nWiederherstellungs-Kits sind nur EINMAL VERWENDBAR.\\nSie müssen von einer anderen Sicherung wiederherstellen.",
+    "recovery_status_invalidating": "Wiederherstellungs-Kit wird ungültig gemacht (einmalige Verwendung)...",
+    "recovery_status_complete": "✅ Wiederherstellung abgeschlossen! Kit wurde DAUERHAFT UNGÜLTIG GEMACHT.",
+    "recovery_rekey_required_title": "⚠️ PFLICHT: Ändern Sie Ihre Zugangsdaten",
+    "recovery_rekey_required_body": "Ihre Wiederherstellungsphrase wurde während der Wiederherstellung OFFENGELEGT.\\n\\nJeder mit dieser Phrase könnte auf dieses Volume zugreifen.\\nSie MÜSSEN Ihre Zugangsdaten JETZT ändern.\\n\\nKlicken Sie auf 'Jetzt ändern' um fortzufahren, oder 'Später' für CLI.",
+    "recovery_rekey_now": "🔑 Jetzt ändern",
+    "recovery_rekey_later": "Später (CLI)",
+    "recovery_rekey_skipped_warning": "⚠️ SIE HABEN DIE ZUGANGSDATEN-ÄNDERUNG ÜBERSPRUNGEN!\\nFühren Sie 'python rekey.py' so bald wie möglich aus!",
+    # Post-recovery mount enforcement (BUG-20251220-007)
+    "mount_blocked_rekey_required_title": "Einbinden blockiert: Schlüsseländerung erforderlich",
+    "mount_blocked_rekey_required_body": "Eine Wiederherstellung wurde durchgeführt am: {recovery_time}\\n\\nSie MÜSSEN Ihre Zugangsdaten ändern bevor Sie einbinden können.\\n\\nDies ist eine SICHERHEITSANFORDERUNG:\\n• Ihre Wiederherstellungsphrase wurde während der Wiederherstellung offengelegt\\n• Jeder mit dieser Phrase könnte auf dieses Volume zugreifen\\n\\nVerwenden Sie Einstellungen → Sicherheit → Passwort ändern.",
+    "mount_warn_rekey_title": "Sicherheitswarnung: Schlüsseländerung ausstehend",
+    "mount_warn_rekey_body": "Eine Wiederherstellung wurde durchgeführt am: {recovery_time}\\n\\nOhne Schlüsseländerung fortzufahren ist ein SICHERHEITSRISIKO!\\n\\nGeben Sie 'INSECURE' ein um trotzdem einzubinden:",
+    # Recovery checkbox UX fix (BUG-20251220-006)
+    "label_recovery_status": "Wiederherstellungs-Kit Status:",
+    "recovery_kit_available": "✅ Wiederherstellungs-Kit verfügbar und bereit",
+    "recovery_kit_used": "⚠️ Wiederherstellungs-Kit wurde verwendet (neues generieren)",
+    "recovery_kit_not_configured": "❌ Kein Wiederherstellungs-Kit konfiguriert",
+    "recovery_html_warning": "HTML-Wiederherstellungsdatei noch auf dem Laufwerk! Nach dem Drucken löschen.",  # BUG-014
+    "tooltip_recovery_status": "Zeigt an, ob ein gültiges Wiederherstellungs-Kit für dieses Laufwerk existiert.\\nGenerieren Sie ein Kit über CLI: python recovery.py generate",
+    # Rekey dialog (CHG-20251220-001)
+    "settings_security": "Sicherheit",
+    "settings_security_desc": "Zugangsdaten ändern und Sicherheitseinstellungen verwalten.",
+    "rekey_section_title": "🔑 Zugangsdaten ändern",
+    "rekey_instructions": "Ändern Sie Ihr VeraCrypt-Volume-Passwort und/oder Schlüsseldatei. Dies öffnet die VeraCrypt-GUI für die eigentliche Änderung.",
+    "rekey_post_recovery_notice": "⚠️ ÄNDERUNG ERFORDERLICH: Ihre Zugangsdaten wurden während der Wiederherstellung offengelegt. Sie müssen sie jetzt ändern.",
+    "btn_start_rekey": "🔑 Zugangsdaten-Änderung starten",
+    # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
+    "btn_verify_rekey": "✓ Neue Zugangsdaten verifizieren",
+    "btn_cancel_rekey": "✕ Abbrechen",
+    "rekey_instructions_veracrypt": "VeraCrypt-GUI geöffnet. In VeraCrypt:\n1. Tools → Volume-Passwort ändern\n2. Gerät auswählen → Ihr Volume wählen\n3. Aktuelles Passwort eingeben ('Altes Passwort kopieren' oben)\n4. Neues Passwort eingeben ('Neues Passwort kopieren' oben)\n5. OK klicken\n\nNach Bestätigung in VeraCrypt, 'Neue Zugangsdaten verifizieren' klicken.",
+    "rekey_verifying": "Verifiziere neue Zugangsdaten via Mount-Test...",
+    "rekey_verification_success": "✓ Neue Zugangsdaten verifiziert! Rekey wird abgeschlossen...",
+    "rekey_verification_failed": "✕ Verifizierung fehlgeschlagen. Bitte prüfen Sie Ihr neues Passwort/Schlüsseldatei.",
+    "rekey_cancelled": "Zugangsdaten-Änderung abgebrochen.",
+    # BUG-20251221-039: Copy credential buttons
+    # CHG-20251222-018: Enhanced tooltips for clarity
+    "btn_copy_old_password": "📋 Altes Passwort kopieren",
+    "btn_copy_new_password": "📋 Neues Passwort kopieren",
+    "tooltip_copy_old_password": "AKTUELLES Passwort mit VORHANDENEM GPG-Seed ableiten und kopieren. Für GPG-Modi wird Ihr Hardware-Schlüssel verwendet. (30s TTL)",
+    "tooltip_copy_new_password": "NEUES Passwort mit NEUEM GPG-Seed (oben angegeben) ableiten und kopieren. Erst neuen seed.gpg generieren, dann kopieren. (30s TTL)",
+    # CHG-20251223-001: Post-recovery tooltip for disabled Copy Old Password button
+    "tooltip_copy_old_password_post_recovery": "Deaktiviert: Nach Wiederherstellung nutzen Sie das Passwort aus Ihrem Recovery-Kit. Der GPG-Seed fehlt möglicherweise.",
+    "rekey_gpg_seed_hint": "Für GPG-Modi: Der 'Neue GPG-Seed' oben bestimmt das abgeleitete Passwort. Erst neuen seed.gpg generieren, dann 'Neues Passwort kopieren' verwenden.",
+    "copy_password_title": "Passwort kopieren",
+    "rekey_status_ready": "Klicken Sie auf 'Zugangsdaten-Änderung starten' um zu beginnen.",
+    "rekey_status_preparing": "Zugangsdaten werden vorbereitet...",
+    "rekey_status_opening_veracrypt": "VeraCrypt-GUI wird geöffnet...",
+    "rekey_status_awaiting_confirmation": "Führen Sie die Änderung in VeraCrypt durch, dann klicken Sie 'Bestätigen'.",
+    "rekey_status_verifying": "Neue Zugangsdaten werden überprüft...",
+    "rekey_validating": "Neue Zugangsdaten werden validiert...",
+    "rekey_verifying_mount": "Überprüfung der Zugangsdaten via Mount...",
+    "rekey_credentials_verified": "Neue Zugangsdaten erfolgreich verifiziert!",
+    "rekey_testing_mount": "Mount-Test mit neuen Zugangsdaten...",
+    "rekey_validation_success": "Validierung erfolgreich - Aushängen...",
+    "rekey_status_success": "✅ Zugangsdaten erfolgreich geändert!",
+    "rekey_status_failed": "❌ Überprüfung fehlgeschlagen. Bitte erneut versuchen.",
+    "btn_verify_rekey": "✓ Neue Zugangsdaten bestätigen",
+    "rekey_current_password_label": "Aktuelles Passwort:",
+    "rekey_current_password_auto": "(Automatisch bereitgestellt)",
+    "rekey_new_password_label": "Neues Passwort:",
+    "rekey_confirm_password_label": "Passwort bestätigen:",
+    # Mode selection during rekey (CHG-20251221-001)
+    "rekey_current_mode_label": "Aktueller Sicherheitsmodus:",
+    "rekey_target_mode_label": "Neuer Sicherheitsmodus:",
+    "rekey_mode_same_tooltip": "Aktuellen Modus beibehalten - nur Passwort/Schlüsseldatei ändern",
+    "rekey_mode_pw_only": "🔒 Nur Passwort",
+    "rekey_mode_pw_keyfile": "🔑 Passwort + Schlüsseldatei",
+    "rekey_mode_pw_gpg_keyfile": "🔐 YubiKey + Passwort",
+    "rekey_mode_gpg_pw_only": "🔐 GPG-abgeleitetes Passwort",
+    "rekey_new_keyfile_label": "Neuer Schlüsseldatei-Pfad:",
+    "rekey_new_gpg_seed_label": "Neue GPG-Seed-Datei:",
+    "btn_browse_keyfile": "Durchsuchen...",
+    # CHG-20251221-003: GPG seed generation button
+    "btn_generate_gpg_seed": "Generieren",
+    "tooltip_generate_gpg_seed": "Neuen GPG-verschlüsselten Seed für Passwortableitung generieren. Erfordert YubiKey/GPG-Karte.",
+    "gpg_seed_generate_title": "GPG-Seed generieren",
+    "gpg_seed_generate_confirm": "Dies generiert einen neuen kryptographisch sicheren Seed und verschlüsselt ihn mit Ihrem GPG-Schlüssel.\n\nBitte stellen Sie sicher, dass Ihr YubiKey/GPG-Karte eingelegt ist.\n\nFortfahren?",
+    "gpg_seed_generate_success": "GPG-Seed erfolgreich generiert!",
+    "gpg_seed_generate_fail": "GPG-Seed-Generierung fehlgeschlagen",
+    "gpg_seed_derive_info": "Das von diesem Seed abgeleitete Passwort wird angezeigt.\nKopieren Sie es, um es als neues VeraCrypt-Passwort zu verwenden.",
+    # CHG-20251223-032: Multi-key authentication
+    "gpg_key_auth_title": "GPG-Schlüssel authentifizieren",
+    "gpg_key_auth_prompt": "Um sicherzustellen, dass Sie Zugriff auf diesen Schlüssel haben, authentifizieren Sie sich bitte.\n\nSchlüssel: {fingerprint}\n\nSie werden möglicherweise nach Ihrer PIN gefragt.",
+    "gpg_key_auth_success": "Schlüssel erfolgreich authentifiziert.",
+    "gpg_key_auth_fail": "Authentifizierung fehlgeschlagen für Schlüssel: {fingerprint}",
+    "gpg_key_auth_skip_prompt": "Möchten Sie die Authentifizierung für diesen Schlüssel überspringen?\n\n⚠️ WARNUNG: Wenn Sie überspringen, konfigurieren Sie möglicherweise einen Schlüssel, den Sie nicht besitzen.\nDies ist akzeptabel, wenn Sie den Zugang an eine andere Person delegieren.",
+    "gpg_key_auth_skipped": "Authentifizierung übersprungen für Schlüssel: {fingerprint}",
+    # CHG-20251221-008: GPG key selection dialog
+    "gpg_key_select_title": "GPG-Schlüssel für Verschlüsselung auswählen",
+    "gpg_key_select_hint": "Wählen Sie einen Hardware-Schlüssel aus der Liste oder geben Sie manuell einen Fingerabdruck oder E-Mail ein, falls Ihr Schlüssel nicht aufgeführt ist.",
+    "gpg_key_select_label": "GPG-Schlüssel:",
+    "gpg_key_select_placeholder": "Schlüssel auswählen oder eingeben...",
+    "gpg_key_select_manual": "Manuelle Eingabe...",
+    "gpg_key_select_none": "Keine geheimen GPG-Schlüssel gefunden",
+    "gpg_key_manual_label": "Fingerabdruck oder E-Mail eingeben:",
+    # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
+    "gpg_key_select_hint_multi": "Wählen Sie einen oder mehrere Hardware-Schlüssel aus der Liste unten für Redundanz.\nSie können auch zusätzliche Fingerabdrücke manuell eingeben (durch Komma oder Zeilenumbruch getrennt).",
+    "gpg_key_manual_label_multi": "Zusätzliche Fingerabdrücke:",
+    "gpg_key_select_placeholder_multi": "Fingerabdrücke eingeben (durch Komma oder Zeilenumbruch getrennt)...",
+    "gpg_key_select_none_selected": "Bitte wählen Sie mindestens einen GPG-Schlüssel oder geben Sie einen Fingerabdruck manuell ein.",
+    "rekey_mode_change_warning": "⚠️ Eine Änderung des Sicherheitsmodus ändert, wie Sie sich bei diesem Laufwerk authentifizieren.",
+    "rekey_gpg_seed_instructions": "Für GPG-Modi wählen Sie die verschlüsselte Seed-Datei für die Passwortableitung.",
+    # Integrity verification (CHG-20251220-002)
+    "settings_integrity": "Integrität",
+    "settings_integrity_desc": "Software-Integrität überprüfen und Skripte signieren.",
+    "integrity_section_title": "🔐 Software-Integrität",
+    "integrity_instructions": "Überprüfen Sie, ob Skripte seit dem Signieren nicht geändert wurden. Signieren erfordert Hardware-Schlüssel (YubiKey/GPG-Karte).",
+    "btn_verify_local": "✓ Integrität prüfen (Lokal)",
+    "btn_sign_scripts": "🔑 Skripte signieren",
+    "btn_verify_remote": "🌐 Prüfen (Remote)",
+    "integrity_status_ready": "Klicken Sie auf 'Prüfen' um die Skript-Integrität zu überprüfen.",
+    "integrity_status_checking": "Integrität wird geprüft...",
+    "integrity_status_signing": "Skripte werden mit Hardware-Schlüssel signiert...",
+    "integrity_status_pass": "✅ Integrität verifiziert! Skripte sind authentisch.",
+    "integrity_status_fail": "❌ Integritätsprüfung FEHLGESCHLAGEN! Skripte wurden möglicherweise geändert.",
+    "integrity_status_no_manifest": "⚠️ Kein Integritäts-Manifest gefunden. Skripte sind nicht signiert.",
+    "integrity_status_sign_success": "✅ Skripte erfolgreich signiert!",
+    "integrity_status_sign_fail": "❌ Signieren fehlgeschlagen. Hardware-Schlüssel eingesteckt?",
+    "integrity_result_hash": "Hash: {hash}",
+    "integrity_result_signer": "Signiert von: {signer}",
+    "integrity_remote_url_label": "Server-URL:",
+    "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
+    "integrity_status_remote_checking": "Sende Verifizierungsanfrage an Server...",
+    "integrity_status_remote_success": "✅ Remote-Verifizierung erfolgreich!",
+    "integrity_status_remote_fail": "❌ Remote-Verifizierung fehlgeschlagen: {error}",
+    "integrity_status_no_server_url": "⚠️ Keine Server-URL konfiguriert. Setze sie unter Einstellungen → Integrität.",
+    "label_integrity_server_url": "Verifizierungsserver-URL",
+    "tooltip_integrity_server_url": "URL des Remote-Verifizierungsservers (z.B. https://verify.example.com/api/check)",
+    "popup_unmount_failed_title": "Aushängen fehlgeschlagen",
+    "popup_mount_failed_title": "Einbinden fehlgeschlagen",
+    "popup_update_not_possible_title": "Update nicht möglich",
+    "popup_update_confirm_title": "Update bestätigen",
+    "popup_update_direction": "Richtung",
+    "popup_update_source": "Quelle",
+    "popup_update_destination": "Ziel",
+    "popup_update_files_to_update": "Zu aktualisierende Dateien",
+    "popup_update_protected_items": "Geschützte Elemente (Nie überschrieben)",
+    "popup_update_protected_list": "Die folgenden Benutzerdaten werden automatisch geschützt: {items}",
+    "popup_update_warning": "Warnung",
+    "popup_update_warning_body": "Dies überschreibt vorhandene Skriptdateien im .smartdrive/-Verzeichnis.",
+    "popup_update_confirm_message": "UPDATE ({direction}) wird ausgeführt.\n\nVON:\n  {src_root}\n\nNACH:\n  {dst_root}\n\nElemente:\n  - {items}\n\nMethode: {method}\n\nDies überschreibt vorhandene Dateien. Fortfahren?",
+    "popup_update_config_title": "Update-Konfiguration",
+    "popup_update_config_body": "Update-Quelle ist nicht konfiguriert. Bitte in Einstellungen festlegen.",
+    "popup_update_complete_title": "Update abgeschlossen",
+    "popup_update_complete_body": "Update erfolgreich abgeschlossen. Bitte Anwendung neu starten.",
+    "popup_update_failed_title": "Update fehlgeschlagen",
+    "popup_update_failed_body": "Update fehlgeschlagen:\n\n{error}",
+    "popup_update_timeout_title": "Update-Zeitüberschreitung",
+    "popup_update_timeout_body": "Update wurde nicht innerhalb von 120 Sekunden abgeschlossen.",
+    "popup_update_error_title": "Update-Fehler",
+    "popup_update_error_body": "Update konnte nicht ausgeführt werden:\n\n{error}",
+    "popup_cli_failed_title": "CLI-Start fehlgeschlagen",
+    "popup_cli_failed_body": "CLI konnte nicht geöffnet werden:\n\n{error}",
+    # Update configuration error messages
+    "error_update_server_url_not_configured": "Server-URL ist nicht konfiguriert.\\n\\nGehen Sie zu Einstellungen, um die Update-URL zu konfigurieren.",
+    "error_update_local_root_not_configured": "Lokales Update-Verzeichnis ist nicht konfiguriert.\\n\\nGehen Sie zu Einstellungen, um das lokale Update-Root zu konfigurieren.",
+    "error_update_local_root_not_found": "Lokales Update-Verzeichnis nicht gefunden:\\n\\n{path}\\n\\nÜberprüfen Sie die Einstellungen, um den Pfad zu verifizieren.",
+    "error_update_install_dir_not_found": "Installationsverzeichnis nicht gefunden:\\n\\n{path}",
+    "error_update_unknown_source_type": "Unbekannter Update-Quelltyp: {type}",
+    # Hardware key error messages
+    "error_hardware_key_missing_title": "Hardware-Schlüssel erforderlich",
+    "error_hardware_key_missing_body": "Hardware-Schlüssel (YubiKey/GPG-Karte) nicht erkannt. Bitte stecken Sie Ihren Hardware-Schlüssel ein und versuchen Sie es erneut.",
+    # Theme names (for theme dropdown)
+    "theme_brand": "Marke",
+    "theme_green": "Grün",
+    "theme_blue": "Blau",
+    "theme_rose": "Rosa",
+    "theme_slate": "Schiefer",
+    "label_theme": "Thema",
+    # File explorer buttons
+    "tooltip_open_launcher_drive": "Launcher-Laufwerk öffnen",
+    "tooltip_open_mounted_volume": "Eingebundenes Volume öffnen",
+    "popup_open_failed_title": "Öffnen fehlgeschlagen",
+    "popup_open_failed_body": "Dateimanager konnte nicht geöffnet werden:\n\n{path}\n\n{error}",
+    # About section (CHG-20251221-012)
+    "settings_about": "Über",
+    "label_version": "Version:",
+    "label_build_id": "Build-ID:",
+    "label_build_dev": "Entwicklung",
+    "label_compat_version": "Konfig-Version:",
+    # Recovery kit generation (CHG-20251221-001)
+    "recovery_generate_section_title": "Wiederherstellungs-Kit generieren",
+    "recovery_generate_instructions": "Generieren Sie ein neues Wiederherstellungs-Kit, um eine verschlüsselte Sicherung Ihrer Anmeldedaten zu erstellen. Dies ist nützlich, wenn Ihr Original-Kit verloren ging, beschädigt wurde oder Sie eine neue Kopie nach Änderung der Anmeldedaten wünschen.",
+    "btn_generate_recovery_kit": "🔐 Neues Wiederherstellungs-Kit generieren",
+    "recovery_generate_status_ready": "Klicken Sie auf 'Neues Wiederherstellungs-Kit generieren', um ein neues Kit zu erstellen.",
+    "recovery_generate_status_deriving": "Anmeldedaten vom Hardware-Schlüssel ableiten...",
+    "recovery_generate_status_verifying": "Anmeldedaten mit VeraCrypt verifizieren...",
+    "recovery_generate_status_running": "Wiederherstellungs-Kit wird generiert...",
+    "recovery_generate_status_success": "✅ Wiederherstellungs-Kit erfolgreich generiert!",
+    "recovery_generate_status_failed": "❌ Generierung fehlgeschlagen: {error}",
+    "recovery_generate_confirm_title": "Wiederherstellungs-Kit generieren",
+    "recovery_generate_confirm_body": "Dies generiert ein neues Wiederherstellungs-Kit mit verschlüsselter Sicherung Ihrer Anmeldedaten.\n\nMöchten Sie fortfahren?",
+    "recovery_generate_regen_confirm_title": "Wiederherstellungs-Kit neu generieren",
+    "recovery_generate_regen_confirm_body": "⚠️ WARNUNG: Dies erstellt ein NEUES Wiederherstellungs-Kit.\n\nIhr BESTEHENDES Kit wird PERMANENT UNGÜLTIG.\n\nMöchten Sie fortfahren?",
+    "recovery_generate_security_warning_title": "Sicherheitswarnung: Wiederherstellungs-Kit neu generieren",
+    "recovery_generate_security_warning_body": "⚠️ SICHERHEITSWARNUNG ⚠️\n\nEin Wiederherstellungs-Kit existiert bereits. Ein neues zu erstellen wird:\n\n• Das vorherige Kit ungültig machen\n• Einen NEUEN Zugang zu Ihren verschlüsselten Daten erstellen\n• Jeder mit dem neuen Kit kann auf Ihre Daten zugreifen\n\nFahren Sie nur fort, wenn Sie die Sicherheitsrisiken verstehen.\n\nMöchten Sie neu generieren?",
+    "recovery_generate_password_prompt_title": "Volume-Passwort eingeben",
+    "recovery_generate_password_prompt_body": "Bitte geben Sie Ihr Volume-Passwort für die Wiederherstellungs-Kit-Generierung ein:",
+    "recovery_generate_success_title": "Wiederherstellungs-Kit generiert",
+    "recovery_generate_success_body": "Ihr Wiederherstellungs-Kit wurde generiert!\n\nSpeicherort: {path}\n\n⚠️ WICHTIG:\n• Drucken Sie die HTML-Datei sofort aus\n• Bewahren Sie sie an einem sicheren physischen Ort auf\n• Löschen Sie die HTML-Datei nach dem Drucken vom Laufwerk",
+    # Settings dialog - Additional fields (schema-driven UI)
+    "label_drive_id": "Laufwerk-ID",
+    "label_drive_name": "Laufwerksname",
+    "label_setup_date": "Einrichtungsdatum",
+    "label_last_password_change": "Letzte Passwortänderung",
+    "label_last_verified": "Zuletzt überprüft",
+    "label_plain_keyfile": "Einfache Schlüsseldatei",
+    "label_seed_gpg_path": "GPG-Seed-Datei",
+    "label_kdf": "Schlüsselableitungsfunktion",
+    "label_pw_encoding": "Passwort-Kodierung",
+    "label_recovery_enabled": "Wiederherstellungs-Kit aktivieren",
+    "label_recovery_share_count": "Anzahl Wiederherstellungsanteile",
+    "label_recovery_threshold": "Wiederherstellungsschwelle",
+    "label_lost_and_found_enabled": "Fundmeldung aktivieren",
+    "label_lost_and_found_message": "Rückgabenachricht",
+    "label_verification_overridden": "Überprüfung überschrieben",
+    "label_integrity_signed": "Integrität signiert",
+    "label_signing_key_fpr": "Signaturschlüssel-Fingerabdruck",
+    "label_salt_b64": "Salt (Base64)",
+    "label_hkdf_info": "HKDF-Info",
+    "label_schema_version": "Schema-Version",
+    "label_version": "Version",
+    # Tooltips for settings fields
+    "tooltip_drive_id": "Eindeutige Kennung für dieses Laufwerk (schreibgeschützt)",
+    "tooltip_drive_name": "Benutzerdefinierter Name für dieses Laufwerk",
+    "tooltip_language": "Sprache der Benutzeroberfläche",
+    "tooltip_theme": "Farbschema für die Oberfläche",
+    "tooltip_mode": "Sicherheitsmodus: nur Passwort, Schlüsseldatei oder YubiKey/GPG",
+    "tooltip_encrypted_keyfile": "Pfad zur GPG-verschlüsselten Schlüsseldatei (für GPG-Modi)",
+    "tooltip_plain_keyfile": "Pfad zur unverschlüsselten Schlüsseldatei (für einfachen Schlüsseldatei-Modus)",
+    "tooltip_seed_gpg_path": "Pfad zur GPG-Seed-Datei für Passwortableitung",
+    "tooltip_kdf": "Schlüsselableitungsfunktion für GPG-Passwortmodus",
+    "tooltip_pw_encoding": "Zeichenkodierung für Passwort (UTF-8 empfohlen)",
+    "tooltip_windows_volume_path": "Windows Volume-GUID oder Gerätepfad",
+    "tooltip_mount_letter": "Laufwerksbuchstabe zum Einbinden (A-Z)",
+    "tooltip_veracrypt_path": "Pfad zur VeraCrypt.exe",
+    "tooltip_unix_volume_path": "Unix-Gerätepfad (z. B. /dev/sdb2)",
+    "tooltip_mount_point": "Unix-Einhängepunkt-Verzeichnis",
+    # BUG-20251221-037: Mount point fallback i18n keys
+    "label_allow_mount_fallback": "Alternativen Einhängepunkt automatisch verwenden",
+    "tooltip_allow_mount_fallback": "Wenn aktiviert, werden automatisch alternative Laufwerksbuchstaben (Windows) oder Einhänge-Verzeichnisse (Unix) versucht, falls der konfigurierte nicht verfügbar ist. Empfohlen, um Einbindungsfehler zu vermeiden.",
+    "error_mount_point_occupied_fallback_disabled": "Einhängepunkt {mount_point} wird bereits verwendet.\n\nUm diesen Fehler in Zukunft zu vermeiden, aktivieren Sie 'Alternativen Einhängepunkt automatisch verwenden' in Einstellungen → {os_tab}.",
+    "error_mount_point_all_occupied": "Nach 3 Versuchen konnte kein verfügbarer Einhängepunkt gefunden werden.\n\nAlle Laufwerksbuchstaben D-Z sind belegt (Windows) oder alternative Einhängepunkte fehlgeschlagen (Unix).\n\nDies ist ein Einhängepunkt-Problem, KEIN Anmeldedaten-Problem.",
+    "warning_mount_fallback_used": "Konfigurierter Einhängepunkt {original} war nicht verfügbar.\nVerwende stattdessen {fallback}. Konfiguration aktualisiert.",
+    "tooltip_recovery_enabled": "Notfall-Wiederherstellungs-Kit-Generierung aktivieren",
+    "tooltip_recovery_share_count": "Anzahl der zu generierenden Wiederherstellungsanteile",
+    "tooltip_recovery_threshold": "Mindestanzahl benötigter Anteile zur Wiederherstellung",
+    "tooltip_lost_and_found_enabled": "Rückgabenachricht aktivieren, wenn Laufwerk verloren geht",
+    "tooltip_lost_and_found_message": "Nachricht, die angezeigt wird, wenn Laufwerk gefunden wird",
+    "tooltip_source_type": "Update-Quelle: lokales Verzeichnis oder Server-URL",
+    "tooltip_server_url": "Server-URL für Updates",
+    "tooltip_local_root": "Lokales Verzeichnis mit Update-Dateien",
+    "hint_update_local_title": "Über lokale Updates",
+    "hint_update_local_body": "Wählen Sie entweder: (1) das Verzeichnis, das einen .smartdrive/-Ordner enthält (z.B. H:\\ oder C:\\MeineDev\\), oder (2) direkt einen .smartdrive/-Ordner. Der .smartdrive/-Ordner wird automatisch erkannt. Benutzerdaten (recovery/, keys/, integrity/, config.json) werden automatisch geschützt. Entwicklungsdateien (.git, Tests, helper/) werden ausgeschlossen.",
+    # CHG-20251222-016: Update action section i18n keys
+    "update_action_section_title": "Update-Aktionen",
+    "btn_run_update": "Update ausführen",
+    "tooltip_run_update": "Update von konfigurierter Quelle ausführen",
+    "label_last_update": "Letztes Update:",
+    "label_last_update_source": "Quelle:",
+    "update_never": "Nie",
+    "update_source_none": "Nicht konfiguriert",
+    "tooltip_verification_overridden": "Integritätsprüfung umgehen (gefährlich!)",
+    "tooltip_integrity_signed": "Laufwerksintegrität wurde kryptografisch signiert",
+    "tooltip_signing_key_fpr": "GPG-Schlüssel-Fingerabdruck für Signatur",
+    "tooltip_salt_b64": "Kryptografisches Salt für Schlüsselableitung",
+    "tooltip_hkdf_info": "Kontextzeichenfolge für HKDF-Schlüsselableitung",
+    # Integrity tab (CHG-20251220-002)
+    "label_integrity_status": "Integritätsstatus:",
+    "tooltip_integrity_status": "Zeigt an, ob Skripte gegen signierte Hashes verifiziert wurden",
+    # CHG-20251222-014: OS-specific tab tooltip
+    "tooltip_tab_disabled_other_os": "Diese Registerkarte ist für ein anderes Betriebssystem",
+}
@@ -0,0 +1,482 @@
+# locales/gui_en.py - GUI translation catalog: English
+"""GUI strings for language 'en' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Window titles
+    "window_title": "KeyDrive",
+    "settings_window_title": "Settings",
+    # Button labels
+    "btn_mount": "🔓 Mount",
+    "btn_unmount": "🔒 Unmount",
+    "btn_cancel_auth": "❌ Cancel",
+    "btn_confirm_mount": "✅ Confirm",
+    "btn_tools": "⚙️",
+    "btn_close": "✕",
+    "btn_save": "Save",
+    "btn_cancel": "Cancel",
+    "btn_confirm": "Confirm",
+    "btn_ok": "OK",
+    # CHG-20251223-055: Reload config button for non-modal settings
+    "btn_reload_config": "↻ Reload Config",
+    "tooltip_reload_config": "Reload configuration from disk (discards unsaved changes)",
+    # Common dialog titles
+    "warning": "Warning",
+    "settings_tab_security": "Security",
+    # Status messages
+    "status_config_not_found": "Configuration not found",
+    "status_volume_mounted": "Volume mounted",
+    "status_volume_not_mounted": "Volume not mounted",
+    "status_mounting": "⏳ Mounting volume...",
+    "status_mounting_gpg": "⏳ Mounting volume (GPG authentication)...",
+    "status_unmounting": "⏳ Unmounting volume...",
+    "status_mount_success": "✅ Volume mounted successfully",
+    "status_mount_failed": "❌ Mount failed",
+    "status_unmount_success": "✅ Volume unmounted successfully",
+    "status_unmount_failed": "❌ Unmount failed",
+    # Info labels
+    "info_unavailable": "Info unavailable",
+    "keyfile_selected_one": "1 keyfile selected",
+    "keyfile_selected_many": "{count} keyfiles selected",
+    "keyfile_drop_hint": "Drop keyfiles here or click to browse",
+    "keyfile_drop_supports_multiple": "Supports multiple keyfiles",
+    "label_show_password": "Show password",
+    # Size formatting
+    "size_free": "Free: {size}",
+    # Icons/placeholders
+    "icon_drive": "🚀",
+    # Tooltips
+    "tooltip_exit": "Exit SmartDrive",
+    "tooltip_settings": "Advanced tools and settings",
+    # Labels
+    "label_product_name": "Product Name",
+    "label_preview": "Preview:",
+    "label_password": "Password:",
+    "label_keyfile": "Keyfile:",
+    "label_hardware_key_hint": "💡 Hardware key may be required for authentication",
+    "label_forgot_password": "Forgot your password?",
+    # Placeholder text
+    "placeholder_password": "Enter your VeraCrypt password...",
+    # Menu items
+    "menu_settings": "⚙️ Settings",
+    "menu_rekey": "🔑 Change Password/Keyfile",
+    "menu_update": "⬇️ Update Scripts",
+    "menu_recovery": "💾 Recovery Kit",
+    "menu_about": "ℹ️ About",
+    "menu_cli": "💻 Open CLI",
+    "menu_exit": "⏻ Exit",
+    "menu_clear_keyfiles": "Clear Keyfiles",
+    "menu_switch_drive": "🔀 Switch Drive...",
+    "menu_switch_drive_browse": "📂 Browse...",
+    # CHG-20251221-042: Remote Control Mode menu items
+    "menu_manage_remote": "🌐 Manage Remote...",
+    "menu_manage_remote_browse": "📂 Browse for remote .smartdrive...",
+    "menu_exit_remote": "🏠 Exit Remote Mode",
+    "remote_active_label": "Remote Control Active",
+    "remote_click_to_end": "Click to End Remote",
+    "remote_validation_failed_title": "Remote Validation Failed",
+    "remote_validation_failed_body": "Cannot connect to remote drive:\n\n{error}",
+    "remote_disconnected_title": "Remote Drive Disconnected",
+    "remote_disconnected_body": "The remote drive ({drive}:) has been disconnected.\n\nReturning to local mode.",
+    "remote_confirm_title": "Enter Remote Control Mode",
+    "remote_confirm_body": "Connect to remote .smartdrive at:\n{path}\n\nIn remote mode, you can only mount/unmount the remote volume.\nSettings, Updates, and CLI access will be disabled.",
+    "remote_mode_disabled_title": "Remote Mode Active",
+    "remote_mode_disabled_cli": "CLI access is disabled in remote mode to prevent split-brain issues.",
+    "remote_mode_disabled_settings": "Settings are disabled in remote mode. Exit remote mode first.",
+    "remote_mode_disabled_update": "Updates are disabled in remote mode. Exit remote mode first.",
+    "dialog_select_keyfiles": "Select Keyfile(s)",
+    # Multi-drive context (CHG-20251221-026)
+    "label_launcher_root": "Launcher Drive:",
+    "group_drive_context": "Drive Context",
+    "tooltip_launcher_root": "The drive containing this .smartdrive folder",
+    # Drive safety context (CHG-20251221-040)
+    "label_os_drive": "OS Drive:",
+    "tooltip_os_drive": "Drive running the operating system (cannot be repartitioned)",
+    "label_instantiation_drive": "Running From:",
+    "tooltip_instantiation_drive": "Drive from which this instance was launched (cannot be repartitioned)",
+    "switch_drive_title": "Switch Drive Context",
+    "switch_drive_confirm": "Switch to configuration from:\n{path}\n\nAll settings will reload from this drive.",
+    "switch_drive_invalid_path": "Invalid .smartdrive folder. No config.json found.",
+    "switch_drive_select_folder": "Select .smartdrive Folder",
+    "version_incompatible_title": "Version Compatibility Warning",
+    "version_incompatible_error": "Cannot switch to this drive:\n\n{message}\n\nThe configuration format is incompatible with this software version.",
+    "version_incompatible_warning": "{message}\n\nTarget: {path}\n\nDo you want to proceed anyway?",
+    # Tray messages
+    "tray_minimized_message": "Running in background. Click tray icon to restore.",
+    "tray_unavailable_message": "System tray is not available.\n\nDo you want to quit the application?",
+    "tray_tooltip": "{name} ({id})",
+    # Status messages
+    "status_deriving_yubikey_password": "Deriving password from YubiKey...",
+    "status_checking_mount": "Checking mount status...",
+    "status_unmounting_for_rekey": "Unmounting volume for rekey...",
+    "status_decrypting_keyfile": "Decrypting keyfile with YubiKey...",
+    # Worker messages (keys for structured errors)
+    "worker_mount_script_not_found": "Mount script not found",
+    "worker_mount_success": "Volume mounted successfully",
+    "worker_mount_failed": "Mount failed: {error}",
+    "worker_mount_timeout": "Mount operation timed out",
+    "worker_mount_error": "Mount error: {error}",
+    "worker_unmount_script_not_found": "Unmount script not found",
+    "worker_unmount_success": "Volume unmounted successfully",
+    "worker_unmount_failed": "Unmount failed: {error}",
+    "worker_unmount_timeout": "Unmount operation timed out",
+    "worker_unmount_error": "Unmount error: {error}",
+    # Settings dialog - Tab names
+    "settings_language": "Language",
+    "settings_general": "General",
+    "settings_security": "Security",
+    "settings_keyfile": "Keyfile",
+    "settings_windows": "Windows",
+    "settings_unix": "Unix",
+    "settings_updates": "Updates",
+    "settings_recovery": "Recovery",
+    "settings_lost_and_found": "Lost+Found",
+    "settings_advanced": "Advanced",
+    # Settings dialog - Tab descriptions
+    "settings_general_desc": "Configure display name, language, and theme preferences for the application.",
+    "settings_security_desc": "Set the encryption mode and authentication method for your secure drive.",
+    "settings_keyfile_desc": "Manage keyfile paths for encryption and GPG-protected authentication.",
+    "settings_windows_desc": "Windows-specific settings including mount drive letter and VeraCrypt location.",
+    "settings_unix_desc": "Linux and macOS settings including mount point directory.",
+    "settings_updates_desc": "Configure automatic update checking and server settings.",
+    "settings_recovery_desc": "Set up Shamir Secret Sharing recovery options to recover access if keys are lost.",
+    "settings_lost_and_found_desc": "Display a contact message on the drive for recovery if lost.",
+    "settings_advanced_desc": "Technical settings for encryption parameters and integrity verification.",
+    # BUG-20251221-036: Settings dialog - Group box titles
+    "group_drive_identification": "Drive Identification",
+    "group_appearance": "Appearance",
+    "group_timestamps": "Timestamps",
+    "group_security_mode": "Security Mode",
+    "group_keyfile_configuration": "Keyfile Configuration",
+    "group_gpg_configuration": "GPG Configuration",
+    "group_emergency_recovery_kit": "Emergency Recovery Kit",
+    "group_verification": "Verification",
+    "group_verification_status": "Verification Status",
+    "group_software_integrity": "Software Integrity",
+    "group_remote_verification": "Remote Verification",
+    "group_gpg_kdf_parameters": "GPG KDF Parameters",
+    "group_metadata": "Metadata",
+    "settings_restart_not_required": "✓ Changes applied immediately (no restart required)",
+    "label_mode": "Mode",
+    "label_encrypted_keyfile": "Encrypted keyfile",
+    "label_volume_path": "Volume path",
+    "label_mount_letter": "Mount letter",
+    "label_veracrypt_path": "VeraCrypt path",
+    "label_mount_point": "Mount point",
+    "label_source_type": "Source type",
+    "label_server_url": "Server URL",
+    "label_local_root": "Local root",
+    "error_invalid_mount_letter": "Mount letter must be a single A–Z character.",
+    "error_save_failed": "Could not save config.json:",
+    "title_invalid_mount_letter": "Invalid Mount Letter",
+    "title_save_failed": "Save Failed",
+    "title_error": "Error",
+    "error_apply_theme": "Failed to apply theme: {error}",
+    "error_apply_language": "Failed to apply language: {error}",
+    # Settings dialog - Additional fields (schema-driven UI)
+    "label_drive_id": "Drive ID",
+    "label_drive_name": "Drive Name",
+    "label_setup_date": "Setup Date",
+    "label_last_password_change": "Last Password Change",
+    "label_last_verified": "Last Verified",
+    "label_plain_keyfile": "Plain Keyfile",
+    "label_seed_gpg_path": "GPG Seed File",
+    "label_kdf": "Key Derivation Function",
+    "label_pw_encoding": "Password Encoding",
+    "label_recovery_enabled": "Enable Recovery Kit",
+    "label_recovery_share_count": "Recovery Share Count",
+    "label_recovery_threshold": "Recovery Threshold",
+    "label_lost_and_found_enabled": "Enable Lost & Found",
+    "label_lost_and_found_message": "Return Message",
+    "label_verification_overridden": "Override Verification",
+    "label_integrity_signed": "Integrity Signed",
+    "label_signing_key_fpr": "Signing Key Fingerprint",
+    "label_salt_b64": "Salt (Base64)",
+    "label_hkdf_info": "HKDF Info",
+    "label_schema_version": "Schema Version",
+    "label_version": "Version",
+    # Tooltips for settings fields
+    "tooltip_drive_id": "Unique identifier for this drive (read-only)",
+    "tooltip_drive_name": "Custom name for this drive",
+    "tooltip_language": "User interface language",
+    "tooltip_theme": "Color scheme for the interface",
+    "tooltip_mode": "Security mode: password-only, keyfile, or YubiKey/GPG",
+    "tooltip_encrypted_keyfile": "Path to GPG-encrypted keyfile (for GPG modes)",
+    "tooltip_plain_keyfile": "Path to unencrypted keyfile (for plain keyfile mode)",
+    "tooltip_seed_gpg_path": "Path to GPG seed file for password derivation",
+    "tooltip_kdf": "Key derivation function for GPG password mode",
+    "tooltip_pw_encoding": "Character encoding for password (UTF-8 recommended)",
+    "tooltip_windows_volume_path": "Windows volume GUID or device path",
+    "tooltip_mount_letter": "Drive letter to mount as (A-Z)",
+    "tooltip_veracrypt_path": "Path to VeraCrypt.exe executable",
+    "tooltip_unix_volume_path": "Unix device path (e.g., /dev/sdb2)",
+    "tooltip_mount_point": "Unix mount point directory",
+    # BUG-20251221-037: Mount point fallback i18n keys
+    "label_allow_mount_fallback": "Auto-use alternative mount point when occupied",
+    "tooltip_allow_mount_fallback": "When enabled, automatically tries alternative drive letters (Windows) or mount directories (Unix) if the configured one is unavailable. Recommended to avoid mount failures.",
+    "error_mount_point_occupied_fallback_disabled": "Mount point {mount_point} is already in use.\n\nTo avoid this error in future, enable 'Auto-use alternative mount point' in Settings → {os_tab} tab.",
+    "error_mount_point_all_occupied": "Could not find an available mount point after 3 attempts.\n\nAll drive letters D-Z are in use (Windows) or mount point alternatives failed (Unix).\n\nThis is a mount point issue, NOT a credential problem.",
+    "warning_mount_fallback_used": "Configured mount point {original} was unavailable.\nUsing {fallback} instead. Config updated.",
+    "tooltip_recovery_enabled": "Enable emergency recovery kit generation",
+    "tooltip_recovery_share_count": "Number of recovery shares to generate",
+    "tooltip_recovery_threshold": "Minimum shares needed for recovery",
+    "tooltip_lost_and_found_enabled": "Enable return message if drive is lost",
+    "tooltip_lost_and_found_message": "Message displayed if drive is found",
+    "tooltip_source_type": "Update source: local directory or server URL",
+    "tooltip_server_url": "Server URL for updates",
+    "tooltip_local_root": "Local directory containing update files",
+    "hint_update_local_title": "About Local Updates",
+    "hint_update_local_body": "Select either: (1) the directory containing a .smartdrive/ folder (e.g., H:\\ or C:\\MyDev\\), or (2) a .smartdrive/ folder directly. The .smartdrive/ will be auto-detected. User data (recovery/, keys/, integrity/, config.json) is automatically protected. Development files (.git, tests, helper/) are excluded.",
+    # CHG-20251222-016: Update action section i18n keys
+    "update_action_section_title": "Update Actions",
+    "btn_run_update": "Run Update",
+    "tooltip_run_update": "Execute update from configured source",
+    "label_last_update": "Last Update:",
+    "label_last_update_source": "Source:",
+    "update_never": "Never",
+    "update_source_none": "Not configured",
+    "tooltip_verification_overridden": "Bypass integrity verification (dangerous!)",
+    "tooltip_integrity_signed": "Drive integrity has been cryptographically signed",
+    "tooltip_signing_key_fpr": "GPG key fingerprint used for signing",
+    "tooltip_salt_b64": "Cryptographic salt for key derivation",
+    "tooltip_hkdf_info": "Context string for HKDF key derivation",
+    # Integrity tab (CHG-20251220-002)
+    "label_integrity_status": "Integrity Status:",
+    "tooltip_integrity_status": "Shows whether scripts have been verified against signed hash",
+    # CHG-20251222-014: OS-specific tab tooltip
+    "tooltip_tab_disabled_other_os": "This tab is for a different operating system",
+    # Popup dialogs
+    "popup_keyfile_required_title": "Keyfile Required",
+    "popup_keyfile_required_body": "Please select a keyfile for password + keyfile mode.",
+    "popup_password_required_title": "Password Required",
+    "popup_password_required_body": "Please enter your VeraCrypt password.",
+    "popup_recovery_title": "Password Recovery",
+    "popup_recovery_available_body": "Recovery kit is available for this drive!\n\nTo recover access to your encrypted volume:\n\n1. Use the SmartDrive CLI: python smartdrive.py\n2. Select option 6: Recovery Kit\n3. Follow the recovery instructions\n\nOr contact your system administrator.",
+    "popup_recovery_unavailable_body": "No recovery kit is currently available for this drive.\n\nTo set up password recovery:\n\n1. Use the SmartDrive CLI: python smartdrive.py\n2. Select option 6: Recovery Kit\n3. Choose 'Generate Recovery Kit'\n\nOr contact your system administrator.",
+    # Recovery tab - Phrase input and recovery actions
+    "recovery_section_title": "🔐 Emergency Recovery",
+    "recovery_instructions": "Enter your 24-word recovery phrase to recover access to your encrypted volume. You can also provide a recovery container file if you have one.",
+    "label_recovery_phrase": "Recovery Phrase (24 words):",
+    "placeholder_recovery_phrase": "Enter 24 words separated by spaces...",
+    "label_recovery_container": "Recovery Container (optional):",
+    "btn_browse_container": "Browse...",
+    "btn_recover_credentials": "🔓 Recover Credentials",
+    "recovery_status_ready": "Enter your recovery phrase and click 'Recover Credentials'",
+    "recovery_status_validating": "Validating recovery phrase...",
+    "recovery_status_decrypting": "Decrypting recovery container...",
+    "recovery_status_success": "✅ Recovery successful! Credentials recovered.",
+    "recovery_status_failed": "❌ Recovery failed: {error}",
+    "recovery_result_title": "Recovered Credentials",
+    "recovery_result_password": "Password:",
+    "recovery_result_keyfile": "Keyfile:",
+    "recovery_result_mode": "Security Mode:",
+    "recovery_result_copy_password": "📋 Copy Password",
+    "recovery_result_save_keyfile": "💾 Save Keyfile",
+    "recovery_copied_to_clipboard": "Password copied to clipboard (auto-clears in 30 seconds)",
+    "recovery_keyfile_saved": "Keyfile saved to: {path}",
+    "recovery_phrase_invalid": "Invalid recovery phrase. Please check all 24 words.",
+    "recovery_container_not_found": "Recovery container not found. Please select the container file.",
+    "recovery_no_kit_configured": "No recovery kit is configured for this drive.",
+    "recovery_generate_first": "Please generate a recovery kit first using Settings or CLI.",
+    # Recovery security enforcement (BUG-20251220-005)
+    "recovery_already_used": "⚠️ This recovery kit has ALREADY BEEN USED.\n\nRecovery kits are ONE-TIME USE ONLY.\nYou must restore from a different backup.",
+    "recovery_status_invalidating": "Invalidating recovery kit (one-time use)...",
+    "recovery_status_complete": "✅ Recovery complete! Kit has been PERMANENTLY INVALIDATED.",
+    "recovery_rekey_required_title": "⚠️ MANDATORY: Change Your Credentials",
+    "recovery_rekey_required_body": "Your recovery phrase was EXPOSED during recovery.\n\nAnyone with that phrase could access this volume.\nYou MUST change your credentials NOW.\n\nClick 'Rekey Now' to change credentials, or 'Later' to do it via CLI.",
+    "recovery_rekey_now": "🔑 Rekey Now",
+    "recovery_rekey_later": "Later (CLI)",
+    "recovery_rekey_skipped_warning": "⚠️ YOU SKIPPED CREDENTIAL CHANGE!\nRun 'python rekey.py' as soon as possible!",
+    # Post-recovery mount enforcement (BUG-20251220-007)
+    "mount_blocked_rekey_required_title": "Mount Blocked: Rekey Required",
+    "mount_blocked_rekey_required_body": "A recovery was performed at: {recovery_time}\n\nYou MUST change your credentials before mounting.\n\nThis is a SECURITY REQUIREMENT:\n• Your recovery phrase was exposed during recovery\n• Anyone with that phrase could access this volume\n\nUse Settings → Security → Change Password to rekey.",
+    "mount_warn_rekey_title": "Security Warning: Rekey Pending",
+    "mount_warn_rekey_body": "A recovery was performed at: {recovery_time}\n\nProceeding without rekey is a SECURITY RISK!\n\nType 'INSECURE' to mount anyway:",
+    # Recovery checkbox UX fix (BUG-20251220-006)
+    "label_recovery_status": "Recovery Kit Status:",
+    "recovery_kit_available": "✅ Recovery kit available and ready",
+    "recovery_kit_used": "⚠️ Recovery kit has been used (generate new one)",
+    "recovery_kit_not_configured": "❌ No recovery kit configured",
+    "recovery_html_warning": "HTML recovery file still on drive! Delete after printing for security.",  # BUG-014
+    "tooltip_recovery_status": "Shows whether a valid recovery kit exists for this drive.\nGenerate a kit using the CLI: python recovery.py generate",
+    # Rekey dialog (CHG-20251220-001)
+    "settings_security": "Security",
+    "settings_security_desc": "Change credentials and manage security settings.",
+    "rekey_section_title": "🔑 Change Credentials",
+    "rekey_instructions": "Change your VeraCrypt volume password and/or keyfile. This will open VeraCrypt GUI to perform the actual credential change.",
+    "rekey_post_recovery_notice": "⚠️ REKEY REQUIRED: Your credentials were exposed during recovery. You must change them now.",
+    "btn_start_rekey": "🔑 Start Credential Change",
+    # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
+    "btn_verify_rekey": "✓ Verify New Credentials",
+    "btn_cancel_rekey": "✕ Cancel",
+    "rekey_instructions_veracrypt": "VeraCrypt GUI opened. In VeraCrypt:\n1. Tools → Change Volume Password\n2. Select Device → choose your volume\n3. Enter current password (use 'Copy Old Password' above)\n4. Enter new password (use 'Copy New Password' above)\n5. Click OK to apply\n\nAfter VeraCrypt confirms success, click 'Verify New Credentials' below.",
+    "rekey_verifying": "Verifying new credentials via mount test...",
+    "rekey_verification_success": "✓ New credentials verified! Finalizing rekey...",
+    "rekey_verification_failed": "✕ Credential verification failed. Please check your new password/keyfile.",
+    "rekey_cancelled": "Credential change cancelled.",
+    # BUG-20251221-039: Copy credential buttons
+    # CHG-20251222-018: Enhanced tooltips for clarity on old vs new credentials
+    "btn_copy_old_password": "📋 Copy Old Password",
+    "btn_copy_new_password": "📋 Copy New Password",
+    "tooltip_copy_old_password": "Derive and copy CURRENT password using EXISTING GPG seed. For GPG modes, uses your hardware key to decrypt the current seed.gpg file. (30s TTL)",
+    "tooltip_copy_new_password": "Derive and copy NEW password using NEW GPG seed specified above. Ensure a new seed.gpg is generated or selected before copying. (30s TTL)",
+    # CHG-20251223-001: Post-recovery tooltip for disabled Copy Old Password button
+    "tooltip_copy_old_password_post_recovery": "Disabled: After recovery, use the password from your recovery kit. The GPG seed may be missing or corrupted.",
+    "rekey_gpg_seed_hint": "For GPG modes: The 'New GPG Seed' above defines what password will be derived. Generate a new seed.gpg first, then use 'Copy New Password'.",
+    "copy_password_title": "Copy Password",
+    "rekey_status_ready": "Click 'Start Credential Change' to begin.",
+    "rekey_status_preparing": "Preparing credentials...",
+    "rekey_status_opening_veracrypt": "Opening VeraCrypt GUI...",
+    "rekey_status_awaiting_confirmation": "Complete the credential change in VeraCrypt, then click 'Verify'.",
+    "rekey_status_verifying": "Verifying new credentials...",
+    "rekey_validating": "Validating new credentials...",
+    "rekey_verifying_mount": "Verifying credentials via mount...",
+    "rekey_credentials_verified": "New credentials verified successfully!",
+    "rekey_testing_mount": "Testing mount with new credentials...",
+    "rekey_validation_success": "Validation successful - unmounting...",
+    "rekey_status_success": "✅ Credentials changed successfully!",
+    "rekey_status_failed": "❌ Verification failed. Please try again.",
+    "btn_verify_rekey": "✓ Verify New Credentials",
+    "rekey_current_password_label": "Current Password:",
+    "rekey_current_password_auto": "(Provided automatically)",
+    "rekey_new_password_label": "New Password:",
+    "rekey_confirm_password_label": "Confirm Password:",
+    # Mode selection during rekey (CHG-20251221-001)
+    "rekey_current_mode_label": "Current Security Mode:",
+    "rekey_target_mode_label": "New Security Mode:",
+    "rekey_mode_same_tooltip": "Keep current mode - only change password/keyfile",
+    "rekey_mode_pw_only": "🔒 Password Only",
+    "rekey_mode_pw_keyfile": "🔑 Password + Keyfile",
+    "rekey_mode_pw_gpg_keyfile": "🔐 YubiKey + Password",
+    "rekey_mode_gpg_pw_only": "🔐 GPG Derived Password",
+    "rekey_new_keyfile_label": "New Keyfile Path:",
+    "rekey_new_gpg_seed_label": "New GPG Seed File:",
+    "btn_browse_keyfile": "Browse...",
+    # CHG-20251221-003: GPG seed generation button
+    "btn_generate_gpg_seed": "Generate",
+    "tooltip_generate_gpg_seed": "Generate a new GPG-encrypted seed for password derivation. Requires YubiKey/GPG card.",
+    "gpg_seed_generate_title": "Generate GPG Seed",
+    "gpg_seed_generate_confirm": "This will generate a new cryptographically secure seed and encrypt it with your GPG key.\n\nPlease ensure your YubiKey/GPG card is inserted.\n\nContinue?",
+    "gpg_seed_generate_success": "GPG seed generated successfully!",
+    "gpg_seed_generate_fail": "Failed to generate GPG seed",
+    "gpg_seed_derive_info": "The password derived from this seed will be shown.\nCopy it to use as your new VeraCrypt password.",
+    # CHG-20251223-032: Multi-key authentication
+    "gpg_key_auth_title": "Authenticate GPG Key",
+    "gpg_key_auth_prompt": "To ensure you have access to this key, please authenticate.\n\nKey: {fingerprint}\n\nYou may be prompted for your PIN.",
+    "gpg_key_auth_success": "Key authenticated successfully.",
+    "gpg_key_auth_fail": "Authentication failed for key: {fingerprint}",
+    "gpg_key_auth_skip_prompt": "Do you want to skip authentication for this key?\n\n⚠️ WARNING: If you skip, you may configure a key you don't possess.\nThis is acceptable when delegating access to another person.",
+    "gpg_key_auth_skipped": "Authentication skipped for key: {fingerprint}",
+    # CHG-20251221-008: GPG key selection dialog
+    "gpg_key_select_title": "Select GPG Key for Encryption",
+    "gpg_key_select_hint": "Select a hardware key from the list below, or manually enter a fingerprint or email if your key is not listed.",
+    "gpg_key_select_label": "GPG Key:",
+    "gpg_key_select_placeholder": "Select or enter key...",
+    "gpg_key_select_manual": "Manual entry...",
+    "gpg_key_select_none": "No GPG secret keys found",
+    "gpg_key_manual_label": "Enter fingerprint or email:",
+    # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
+    "gpg_key_select_hint_multi": "Select one or more hardware keys from the list below for redundancy.\nYou can also manually enter additional fingerprints (comma or newline separated).",
+    "gpg_key_manual_label_multi": "Additional fingerprints:",
+    "gpg_key_select_placeholder_multi": "Enter fingerprints (comma or newline separated)...",
+    "gpg_key_select_none_selected": "Please select at least one GPG key or enter a fingerprint manually.",
+    "rekey_mode_change_warning": "⚠️ Changing security mode will update how you authenticate to this drive.",
+    "rekey_gpg_seed_instructions": "For GPG modes, select the encrypted seed file for password derivation.",
+    # Integrity verification (CHG-20251220-002)
+    "settings_integrity": "Integrity",
+    "settings_integrity_desc": "Verify software integrity and sign scripts.",
+    "integrity_section_title": "🔐 Software Integrity",
+    "integrity_instructions": "Verify that scripts have not been modified since signing. Sign requires hardware key (YubiKey/GPG card).",
+    "btn_verify_local": "✓ Verify Integrity (Local)",
+    "btn_sign_scripts": "🔑 Sign Scripts",
+    "btn_verify_remote": "🌐 Verify (Remote)",
+    "integrity_status_ready": "Click 'Verify' to check script integrity.",
+    "integrity_status_checking": "Checking integrity...",
+    "integrity_status_signing": "Signing scripts with hardware key...",
+    "integrity_status_pass": "✅ Integrity verified! Scripts are authentic.",
+    "integrity_status_fail": "❌ Integrity check FAILED! Scripts may have been modified.",
+    "integrity_status_no_manifest": "⚠️ No integrity manifest found. Scripts are unsigned.",
+    "integrity_status_sign_success": "✅ Scripts signed successfully!",
+    "integrity_status_sign_fail": "❌ Signing failed. Ensure hardware key is inserted.",
+    "integrity_result_hash": "Hash: {hash}",
+    "integrity_result_signer": "Signed by: {signer}",
+    "integrity_remote_url_label": "Server URL:",
+    "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
+    "integrity_status_remote_checking": "Sending verification request to server...",
+    "integrity_status_remote_success": "✅ Remote verification passed!",
+    "integrity_status_remote_fail": "❌ Remote verification failed: {error}",
+    "integrity_status_no_server_url": "⚠️ No server URL configured. Set it in Settings → Integrity.",
+    "label_integrity_server_url": "Verification Server URL",
+    "tooltip_integrity_server_url": "URL of the remote verification server (e.g., https://verify.example.com/api/check)",
+    "popup_unmount_failed_title": "Unmount Failed",
+    "popup_mount_failed_title": "Mount Failed",
+    "popup_update_not_possible_title": "Update Not Possible",
+    "popup_update_confirm_title": "Confirm Update",
+    "popup_update_direction": "Direction",
+    "popup_update_source": "Source",
+    "popup_update_destination": "Destination",
+    "popup_update_files_to_update": "Files to Update",
+    "popup_update_protected_items": "Protected Items (Never Overwritten)",
+    "popup_update_protected_list": "The following user data is automatically protected: {items}",
+    "popup_update_warning": "Warning",
+    "popup_update_warning_body": "This will overwrite existing script files in .smartdrive/ directory.",
+    "popup_update_confirm_message": "About to run UPDATE ({direction}).\n\nFROM:\n  {src_root}\n\nTO:\n  {dst_root}\n\nItems:\n  - {items}\n\nMethod: {method}\n\nThis will overwrite existing files. Continue?",
+    "popup_update_config_title": "Update Configuration",
+    "popup_update_config_body": "Update source is not configured. Please set it in Settings.",
+    "popup_update_complete_title": "Update Complete",
+    "popup_update_complete_body": "Update finished successfully. Please restart the application.",
+    "popup_update_failed_title": "Update Failed",
+    "popup_update_failed_body": "Update failed:\n\n{error}",
+    "popup_update_timeout_title": "Update Timeout",
+    "popup_update_timeout_body": "Update did not complete within 120 seconds.",
+    "popup_update_error_title": "Update Error",
+    "popup_update_error_body": "Failed to run update:\n\n{error}",
+    "popup_cli_failed_title": "CLI Launch Failed",
+    "popup_cli_failed_body": "Could not open CLI:\n\n{error}",
+    # Update configuration error messages
+    "error_update_server_url_not_configured": "Server URL is not configured.\\n\\nGo to Settings to configure the update URL.",
+    "error_update_local_root_not_configured": "Local update directory is not configured.\\n\\nGo to Settings to configure the local update root.",
+    "error_update_local_root_not_found": "Local update directory not found:\\n\\n{path}\\n\\nCheck Settings to verify the path.",
+    "error_update_install_dir_not_found": "Installation directory not found:\\n\\n{path}",
+    "error_update_unknown_source_type": "Unknown update source type: {type}",
+    # Hardware key error messages
+    "error_hardware_key_missing_title": "Hardware Key Required",
+    "error_hardware_key_missing_body": "Hardware key (YubiKey/GPG card) not detected. Please insert your hardware key and try again.",
+    # Theme names (for theme dropdown)
+    "theme_brand": "Brand",
+    "theme_green": "Green",
+    "theme_blue": "Blue",
+    "theme_rose": "Rose",
+    "theme_slate": "Slate",
+    "label_theme": "Theme",
+    # File explorer buttons
+    "tooltip_open_launcher_drive": "Open launcher drive",
+    "tooltip_open_mounted_volume": "Open mounted volume",
+    "popup_open_failed_title": "Open Failed",
+    "popup_open_failed_body": "Could not open file explorer:\n\n{path}\n\n{error}",
+    # About section (CHG-20251221-012)
+    "settings_about": "About",
+    "label_version": "Version:",
+    "label_build_id": "Build ID:",
+    "label_build_dev": "Development",
+    "label_compat_version": "Config Version:",
+    # Recovery kit generation (CHG-20251221-001)
+    "recovery_generate_section_title": "Generate Recovery Kit",
+    "recovery_generate_instructions": "Generate a new recovery kit to create an encrypted backup of your credentials. This is useful if your original kit was lost, damaged, or if you want a new copy after changing credentials.",
+    "btn_generate_recovery_kit": "🔐 Generate New Recovery Kit",
+    "recovery_generate_status_ready": "Click 'Generate New Recovery Kit' to create a new kit.",
+    "recovery_generate_status_deriving": "Deriving credentials from hardware key...",
+    "recovery_generate_status_verifying": "Verifying credentials with VeraCrypt...",
+    "recovery_generate_status_running": "Generating recovery kit...",
+    "recovery_generate_status_success": "✅ Recovery kit generated successfully!",
+    "recovery_generate_status_failed": "❌ Recovery kit generation failed: {error}",
+    "recovery_generate_confirm_title": "Generate Recovery Kit",
+    "recovery_generate_confirm_body": "This will generate a new recovery kit with an encrypted backup of your credentials.\n\nDo you want to continue?",
+    "recovery_generate_regen_confirm_title": "Regenerate Recovery Kit",
+    "recovery_generate_regen_confirm_body": "⚠️ WARNING: This will create a NEW recovery kit.\n\nYour EXISTING recovery kit will be PERMANENTLY INVALIDATED.\n\nDo you want to continue?",
+    "recovery_generate_security_warning_title": "Security Warning: Recovery Kit Regeneration",
+    "recovery_generate_security_warning_body": "⚠️ SECURITY WARNING ⚠️\n\nA recovery kit already exists. Creating a new one will:\n\n• Invalidate the previous kit\n• Create a NEW access path to your encrypted data\n• Anyone with the new kit can access your data\n\nOnly proceed if you understand the security implications.\n\nDo you want to regenerate?",
+    "recovery_generate_password_prompt_title": "Enter Volume Password",
+    "recovery_generate_password_prompt_body": "Please enter your volume password for recovery kit generation:",
+    "recovery_generate_success_title": "Recovery Kit Generated",
+    "recovery_generate_success_body": "Your recovery kit has been generated!\n\nLocation: {path}\n\n⚠️ IMPORTANT:\n• Print the HTML file immediately\n• Store in a secure physical location\n• Delete the HTML file from the drive after printing",
+}
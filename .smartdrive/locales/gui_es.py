@@ -0,0 +1,472 @@
+# locales/gui_es.py - GUI translation catalog: Spanish
+"""GUI strings for language 'es' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Window titles
+    "window_title": "KeyDrive",
+    "settings_window_title": "Configuración",
+    # Button labels
+    "btn_mount": "🔓 Montar",
+    "btn_unmount": "🔒 Desmontar",
+    "btn_cancel_auth": "❌ Cancelar",
+    "btn_confirm_mount": "✅ Confirmar",
+    "btn_tools": "⚙️",
+    "btn_close": "✕",
+    "btn_save": "Guardar",
+    "btn_cancel": "Cancelar",
+    "btn_confirm": "Confirmar",
+    "btn_ok": "OK",
+    "warning": "Advertencia",
+    "settings_tab_security": "Seguridad",
+    # CHG-20251223-055: Reload config button for non-modal settings
+    "btn_reload_config": "↻ Recargar config",
+    "tooltip_reload_config": "Recargar configuración desde disco (descarta cambios no guardados)",
+    # Status messages
+    "status_config_not_found": "Configuración no encontrada",
+    "status_volume_mounted": "Volumen montado",
+    "status_volume_not_mounted": "Volumen no montado",
+    "status_mounting": "⏳ Montando volumen...",
+    "status_mounting_gpg": "⏳ Montando volumen (autenticación GPG)...",
+    "status_unmounting": "⏳ Desmontando volumen...",
+    "status_mount_success": "✅ Volumen montado correctamente",
+    "status_mount_failed": "❌ Error al montar",
+    "status_unmount_success": "✅ Volumen desmontado correctamente",
+    "status_unmount_failed": "❌ Error al desmontar",
+    # Info labels
+    "info_unavailable": "Información no disponible",
+    "keyfile_selected_one": "1 archivo de clave seleccionado",
+    "keyfile_selected_many": "{count} archivos de clave seleccionados",
+    "keyfile_drop_hint": "Arrastra los archivos de clave aquí o haz clic para buscar",
+    "keyfile_drop_supports_multiple": "Admite varios archivos de clave",
+    "label_show_password": "Mostrar contraseña",
+    # Size formatting
+    "size_free": "Libre: {size}",
+    # Icons/placeholders
+    "icon_drive": "🚀",
+    # Tooltips
+    "tooltip_exit": "Salir de SmartDrive",
+    "tooltip_settings": "Herramientas y configuración avanzadas",
+    # Labels
+    "label_product_name": "Nombre del producto",
+    "label_preview": "Vista previa:",
+    "label_password": "Contraseña:",
+    "label_keyfile": "Archivo de clave:",
+    "label_hardware_key_hint": "💡 Puede requerirse una llave de hardware para la autenticación",
+    "label_forgot_password": "¿Olvidaste tu contraseña?",
+    # Placeholder text
+    "placeholder_password": "Introduce tu contraseña de VeraCrypt...",
+    # Menu items
+    "menu_settings": "⚙️ Configuración",
+    "menu_rekey": "🔑 Cambiar contraseña/archivo de clave",
+    "menu_update": "⬇️ Actualizar scripts",
+    "menu_recovery": "💾 Kit de recuperación",
+    "menu_about": "ℹ️ Acerca de",
+    "menu_cli": "💻 Abrir CLI",
+    "menu_exit": "⏻ Salir",
+    "menu_clear_keyfiles": "Borrar archivos de clave",
+    "menu_switch_drive": "🔀 Cambiar unidad...",
+    "menu_switch_drive_browse": "📂 Examinar...",
+    # CHG-20251221-042: Remote Control Mode menu items (Spanish)
+    "menu_manage_remote": "🌐 Control remoto...",
+    "menu_manage_remote_browse": "📂 Buscar .smartdrive remoto...",
+    "menu_exit_remote": "🏠 Salir del modo remoto",
+    "remote_active_label": "Control remoto activo",
+    "remote_click_to_end": "Clic para terminar",
+    "remote_validation_failed_title": "Validación remota fallida",
+    "remote_validation_failed_body": "No se puede conectar a la unidad remota:\n\n{error}",
+    "remote_disconnected_title": "Unidad remota desconectada",
+    "remote_disconnected_body": "La unidad remota ({drive}:) se ha desconectado.\n\nVolviendo al modo local.",
+    "remote_confirm_title": "Entrar en modo de control remoto",
+    "remote_confirm_body": "Conectar a .smartdrive remoto en:\n{path}\n\nEn modo remoto, solo puede montar/desmontar el volumen remoto.\nConfiguración, actualizaciones y acceso CLI están deshabilitados.",
+    "remote_mode_disabled_title": "Modo remoto activo",
+    "remote_mode_disabled_cli": "Acceso CLI deshabilitado en modo remoto.",
+    "remote_mode_disabled_settings": "Configuración deshabilitada en modo remoto. Salga del modo remoto primero.",
+    "remote_mode_disabled_update": "Actualizaciones deshabilitadas en modo remoto. Salga del modo remoto primero.",
+    "dialog_select_keyfiles": "Seleccionar archivo(s) de clave",
+    # Multi-drive context (CHG-20251221-026)
+    "label_launcher_root": "Unidad de inicio:",
+    "group_drive_context": "Contexto de unidad",
+    "tooltip_launcher_root": "La unidad que contiene esta carpeta .smartdrive",
+    # Drive safety context (CHG-20251221-040)
+    "label_os_drive": "Unidad del sistema:",
+    "tooltip_os_drive": "Unidad que ejecuta el sistema operativo (no se puede reparticionar)",
+    "label_instantiation_drive": "Ejecutándose desde:",
+    "tooltip_instantiation_drive": "Unidad desde la que se lanzó esta instancia (no se puede reparticionar)",
+    "switch_drive_title": "Cambiar contexto de unidad",
+    "switch_drive_confirm": "Cambiar a la configuración de:\n{path}\n\nTodas las configuraciones se recargarán desde esta unidad.",
+    "switch_drive_invalid_path": "Carpeta .smartdrive inválida. No se encontró config.json.",
+    "switch_drive_select_folder": "Seleccionar carpeta .smartdrive",
+    "version_incompatible_title": "Advertencia de compatibilidad de versión",
+    "version_incompatible_error": "No se puede cambiar a esta unidad:\n\n{message}\n\nEl formato de configuración no es compatible con esta versión del software.",
+    "version_incompatible_warning": "{message}\n\nDestino: {path}\n\n¿Desea continuar de todos modos?",
+    # Tray
+    "tray_minimized_message": "Ejecutándose en segundo plano. Haz clic en el icono de la bandeja para abrir.",
+    "tray_unavailable_message": "La bandeja del sistema no está disponible.\n\n¿Desea cerrar la aplicación?",
+    "tray_tooltip": "{name} ({id})",
+    # Status messages
+    "status_deriving_yubikey_password": "Derivando contraseña de YubiKey...",
+    "status_checking_mount": "Comprobando estado de montaje...",
+    "status_unmounting_for_rekey": "Desmontando volumen para rekey...",
+    "status_decrypting_keyfile": "Descifrando archivo de claves con YubiKey...",
+    # Worker messages (keys for structured errors)
+    "worker_mount_script_not_found": "No se encontró el script de montaje",
+    "worker_mount_success": "Volumen montado correctamente",
+    "worker_mount_failed": "Error al montar: {error}",
+    "worker_mount_timeout": "Tiempo de espera agotado al montar",
+    "worker_mount_error": "Error de montaje: {error}",
+    "worker_unmount_script_not_found": "No se encontró el script de desmontaje",
+    "worker_unmount_success": "Volumen desmontado correctamente",
+    "worker_unmount_failed": "Error al desmontar: {error}",
+    "worker_unmount_timeout": "Tiempo de espera agotado al desmontar",
+    "worker_unmount_error": "Error de desmontaje: {error}",
+    # Settings dialog - Tab names
+    "settings_language": "Idioma",
+    "settings_general": "General",
+    "settings_security": "Seguridad",
+    "settings_keyfile": "Archivo de clave",
+    "settings_windows": "Windows",
+    "settings_unix": "Unix",
+    "settings_updates": "Actualizaciones",
+    "settings_recovery": "Recuperación",
+    "settings_lost_and_found": "Perdido y encontrado",
+    "settings_advanced": "Avanzado",
+    # Settings dialog - Tab descriptions
+    "settings_general_desc": "Configure el nombre para mostrar, el idioma y las preferencias de tema.",
+    "settings_security_desc": "Establezca el modo de cifrado y el método de autenticación para su unidad segura.",
+    "settings_keyfile_desc": "Administre las rutas de archivos de clave para cifrado y autenticación GPG.",
+    "settings_windows_desc": "Configuración específica de Windows incluyendo letra de unidad y ubicación de VeraCrypt.",
+    "settings_unix_desc": "Configuración de Linux y macOS incluyendo directorio del punto de montaje.",
+    "settings_updates_desc": "Configure la verificación automática de actualizaciones y la configuración del servidor.",
+    "settings_recovery_desc": "Configure las opciones de recuperación Shamir Secret Sharing para recuperar el acceso si se pierden las claves.",
+    "settings_lost_and_found_desc": "Muestre un mensaje de contacto en la unidad para su devolución si se pierde.",
+    "settings_advanced_desc": "Configuración técnica para parámetros de cifrado y verificación de integridad.",
+    # BUG-20251221-036: Settings dialog - Group box titles (Spanish)
+    "group_drive_identification": "Identificación de unidad",
+    "group_appearance": "Apariencia",
+    "group_timestamps": "Marcas de tiempo",
+    "group_security_mode": "Modo de seguridad",
+    "group_keyfile_configuration": "Configuración de archivo de clave",
+    "group_gpg_configuration": "Configuración de GPG",
+    "group_emergency_recovery_kit": "Kit de recuperación de emergencia",
+    "group_verification": "Verificación",
+    "group_verification_status": "Estado de verificación",
+    "group_software_integrity": "Integridad del software",
+    "group_remote_verification": "Verificación remota",
+    "group_gpg_kdf_parameters": "Parámetros de GPG KDF",
+    "group_metadata": "Metadatos",
+    "settings_restart_not_required": "✓ Cambios aplicados inmediatamente (no se requiere reinicio)",
+    "label_mode": "Modo",
+    "label_encrypted_keyfile": "Archivo de clave cifrado",
+    "label_volume_path": "Ruta del volumen",
+    "label_mount_letter": "Letra de unidad",
+    "label_veracrypt_path": "Ruta de VeraCrypt",
+    "label_mount_point": "Punto de montaje",
+    "label_source_type": "Tipo de origen",
+    "label_server_url": "URL del servidor",
+    "label_local_root": "Raíz local",
+    "error_invalid_mount_letter": "La letra de unidad debe ser un solo carácter A–Z.",
+    "error_save_failed": "No se pudo guardar config.json:",
+    "title_invalid_mount_letter": "Letra de unidad no válida",
+    "title_save_failed": "Error al guardar",
+    "title_error": "Error",
+    "error_apply_theme": "No se pudo aplicar el tema: {error}",
+    "error_apply_language": "No se pudo aplicar el idioma: {error}",
+    # Popup dialogs
+    "popup_keyfile_required_title": "Se requiere archivo de clave",
+    "popup_keyfile_required_body": "Selecciona un archivo de clave para el modo contraseña + archivo de clave.",
+    "popup_password_required_title": "Se requiere contraseña",
+    "popup_password_required_body": "Introduce tu contraseña de VeraCrypt.",
+    "popup_recovery_title": "Recuperación de contraseña",
+    "popup_recovery_available_body": "¡Hay un kit de recuperación disponible para esta unidad!\n\nPara recuperar el acceso a tu volumen cifrado:\n\n1. Usa la CLI de SmartDrive: python smartdrive.py\n2. Selecciona la opción 6: Kit de recuperación\n3. Sigue las instrucciones de recuperación\n\nO contacta con tu administrador del sistema.",
+    "popup_recovery_unavailable_body": "Actualmente no hay un kit de recuperación disponible para esta unidad.\n\nPara configurar la recuperación de contraseña:\n\n1. Usa la CLI de SmartDrive: python smartdrive.py\n2. Selecciona la opción 6: Kit de recuperación\n3. Elige 'Generate Recovery Kit'\n\nO contacta con tu administrador del sistema.",
+    # Recovery tab - Phrase input and recovery actions
+    "recovery_section_title": "🔐 Recuperación de emergencia",
+    "recovery_instructions": "Introduce tu frase de recuperación de 24 palabras para recuperar el acceso a tu volumen cifrado. También puedes proporcionar un archivo contenedor de recuperación si tienes uno.",
+    "label_recovery_phrase": "Frase de recuperación (24 palabras):",
+    "placeholder_recovery_phrase": "Introduce 24 palabras separadas por espacios...",
+    "label_recovery_container": "Contenedor de recuperación (opcional):",
+    "btn_browse_container": "Examinar...",
+    "btn_recover_credentials": "🔓 Recuperar credenciales",
+    "recovery_status_ready": "Introduce tu frase de recuperación y haz clic en 'Recuperar credenciales'",
+    "recovery_status_validating": "Validando frase de recuperación...",
+    "recovery_status_decrypting": "Descifrando contenedor de recuperación...",
+    "recovery_status_success": "✅ ¡Recuperación exitosa! Credenciales recuperadas.",
+    "recovery_status_failed": "❌ Error en la recuperación: {error}",
+    "recovery_result_title": "Credenciales recuperadas",
+    "recovery_result_password": "Contraseña:",
+    "recovery_result_keyfile": "Archivo de clave:",
+    "recovery_result_mode": "Modo de seguridad:",
+    "recovery_result_copy_password": "📋 Copiar contraseña",
+    "recovery_result_save_keyfile": "💾 Guardar archivo de clave",
+    "recovery_copied_to_clipboard": "Contraseña copiada al portapapeles (se borrará en 30 segundos)",
+    "recovery_keyfile_saved": "Archivo de clave guardado en: {path}",
+    "recovery_phrase_invalid": "Frase de recuperación no válida. Verifica las 24 palabras.",
+    "recovery_container_not_found": "Contenedor de recuperación no encontrado. Selecciona el archivo contenedor.",
+    "recovery_no_kit_configured": "No hay kit de recuperación configurado para esta unidad.",
+    "recovery_generate_first": "Por favor genera primero un kit de recuperación desde Configuración o CLI.",
+    "recovery_already_used": "⚠️ El kit de recuperación ya fue utilizado. Esta operación está deshabilitada.",
+    "recovery_status_invalidating": "Invalidando kit de recuperación...",
+    "recovery_status_complete": "Recuperación completada. El kit de recuperación ha sido invalidado permanentemente.",
+    "recovery_rekey_required_title": "Cambio de credenciales obligatorio",
+    "recovery_rekey_required_body": "La recuperación fue exitosa. Por razones de seguridad, DEBES cambiar tu contraseña/archivo de clave ahora.\n\nEl kit de recuperación contenía credenciales temporales que ahora están comprometidas.\n\n¿Deseas cambiar tus credenciales ahora?",
+    "recovery_rekey_now": "Cambiar credenciales ahora",
+    "recovery_rekey_later": "Recordarme después",
+    "recovery_rekey_skipped_warning": "⚠️ Omitiste el cambio de credenciales. No podrás montar tu unidad hasta que las credenciales sean cambiadas.",
+    "mount_blocked_rekey_required_title": "Cambio de credenciales obligatorio",
+    "mount_blocked_rekey_required_body": "Se usó el kit de recuperación pero las credenciales no han sido cambiadas. Por seguridad, el montaje está bloqueado.\n\nUsa el script de cambio de clave para establecer nuevas credenciales.",
+    "mount_warn_rekey_title": "Cambio de credenciales recomendado",
+    "mount_warn_rekey_body": "El kit de recuperación fue usado recientemente. Se recomienda encarecidamente cambiar tus credenciales.\n\n¿Deseas cambiar las credenciales ahora o continuar con el montaje?",
+    "label_recovery_status": "Estado del kit de recuperación",
+    "recovery_kit_available": "✅ Disponible",
+    "recovery_kit_used": "🚫 Usado (Inválido)",
+    "recovery_kit_not_configured": "⚪ No configurado",
+    "recovery_html_warning": "¡Archivo HTML de recuperación aún en el disco! Elimínalo después de imprimir por seguridad.",
+    "tooltip_recovery_status": "Muestra si el kit de recuperación está disponible, fue utilizado o no está configurado",
+    "rekey_section_title": "🔑 Cambiar credenciales",
+    "rekey_instructions": "Cambia la contraseña de tu contenedor VeraCrypt y/o archivos de clave.",
+    "rekey_post_recovery_notice": "⚠️ POST-RECUPERACIÓN: Debes cambiar las credenciales antes de que el montaje sea permitido.",
+    "btn_start_rekey": "Iniciar cambio de credenciales...",
+    # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
+    "btn_verify_rekey": "✓ Verificar nuevas credenciales",
+    "btn_cancel_rekey": "✕ Cancelar",
+    "rekey_instructions_veracrypt": "GUI de VeraCrypt abierto. En VeraCrypt:\n1. Herramientas → Cambiar contraseña del volumen\n2. Seleccionar dispositivo → elige tu volumen\n3. Ingresa contraseña actual ('Copiar contraseña anterior' arriba)\n4. Ingresa nueva contraseña ('Copiar contraseña nueva' arriba)\n5. Haz clic en OK\n\nDespués de confirmar en VeraCrypt, haz clic en 'Verificar nuevas credenciales'.",
+    "rekey_verifying": "Verificando nuevas credenciales mediante prueba de montaje...",
+    "rekey_verification_success": "✓ ¡Nuevas credenciales verificadas! Finalizando rekey...",
+    "rekey_verification_failed": "✕ Verificación fallida. Verifica tu nueva contraseña/archivo de clave.",
+    "rekey_cancelled": "Cambio de credenciales cancelado.",
+    # BUG-20251221-039: Copy credential buttons
+    # CHG-20251222-018: Enhanced tooltips for clarity
+    "btn_copy_old_password": "📋 Copiar contraseña anterior",
+    "btn_copy_new_password": "📋 Copiar contraseña nueva",
+    "tooltip_copy_old_password": "Derivar y copiar contraseña ACTUAL usando semilla GPG EXISTENTE. Para modos GPG, usa tu llave de hardware. (30s TTL)",
+    "tooltip_copy_old_password_post_recovery": "Deshabilitado: Después de la recuperación, usa la contraseña del kit de recuperación. El seed GPG puede faltar o estar dañado.",
+    "tooltip_copy_new_password": "Derivar y copiar NUEVA contraseña usando NUEVA semilla GPG (arriba). Primero genera nuevo seed.gpg. (30s TTL)",
+    "rekey_gpg_seed_hint": "Para modos GPG: La 'Nueva Semilla GPG' arriba define qué contraseña se derivará. Primero genera un nuevo seed.gpg, luego usa 'Copiar contraseña nueva'.",
+    "copy_password_title": "Copiar contraseña",
+    "rekey_status_ready": "Listo para cambiar credenciales",
+    "rekey_status_preparing": "Preparando cambio de credenciales...",
+    "rekey_status_opening_veracrypt": "Abriendo VeraCrypt GUI...",
+    "rekey_status_awaiting_confirmation": "Esperando confirmación del cambio de contraseña...",
+    "rekey_status_verifying": "Verificando nuevas credenciales...",
+    "rekey_validating": "Validando nuevas credenciales...",
+    "rekey_verifying_mount": "Verificando credenciales vía montaje...",
+    "rekey_credentials_verified": "¡Nuevas credenciales verificadas exitosamente!",
+    "rekey_testing_mount": "Probando montaje con nuevas credenciales...",
+    "rekey_validation_success": "Validación exitosa - desmontando...",
+    "rekey_status_success": "✅ Credenciales cambiadas exitosamente",
+    "rekey_status_failed": "❌ Cambio de credenciales falló: {error}",
+    "btn_verify_rekey": "Verificar cambio completado",
+    "rekey_current_password_label": "Contraseña actual:",
+    "rekey_current_password_auto": "(detectada automáticamente)",
+    "rekey_new_password_label": "Nueva contraseña:",
+    "rekey_confirm_password_label": "Confirmar contraseña:",
+    "rekey_current_mode_label": "Modo de seguridad actual:",
+    "rekey_target_mode_label": "Nuevo modo de seguridad:",
+    "rekey_mode_same_tooltip": "Mantener el modo de seguridad actual",
+    "rekey_mode_pw_only": "🔒 Solo contraseña",
+    "rekey_mode_pw_keyfile": "🔑 Contraseña + Archivo de clave",
+    "rekey_mode_pw_gpg_keyfile": "🛡️ Contraseña + Archivo de clave derivado GPG",
+    "rekey_mode_gpg_pw_only": "🔐 Contraseña derivada GPG (solo lectura)",
+    "rekey_new_keyfile_label": "Nueva ruta de archivo de clave:",
+    "rekey_new_gpg_seed_label": "Nueva ruta de semilla GPG:",
+    "btn_browse_keyfile": "Examinar...",
+    # CHG-20251221-003: GPG seed generation button
+    "btn_generate_gpg_seed": "Generar",
+    "tooltip_generate_gpg_seed": "Generar nueva semilla GPG cifrada para derivación de contraseña. Requiere YubiKey/tarjeta GPG.",
+    "gpg_seed_generate_title": "Generar Semilla GPG",
+    "gpg_seed_generate_confirm": "Esto generará una nueva semilla criptográficamente segura y la cifrará con su clave GPG.\n\nAsegúrese de que su YubiKey/tarjeta GPG esté insertada.\n\n¿Continuar?",
+    "gpg_seed_generate_success": "¡Semilla GPG generada exitosamente!",
+    "gpg_seed_generate_fail": "Error al generar semilla GPG",
+    "gpg_seed_derive_info": "Se mostrará la contraseña derivada de esta semilla.\nCópiela para usarla como su nueva contraseña de VeraCrypt.",
+    # CHG-20251223-032: Multi-key authentication
+    "gpg_key_auth_title": "Autenticar Clave GPG",
+    "gpg_key_auth_prompt": "Para asegurarse de que tiene acceso a esta clave, por favor autentíquese.\n\nClave: {fingerprint}\n\nPuede que se le solicite su PIN.",
+    "gpg_key_auth_success": "Clave autenticada exitosamente.",
+    "gpg_key_auth_fail": "Error de autenticación para clave: {fingerprint}",
+    "gpg_key_auth_skip_prompt": "¿Desea omitir la autenticación para esta clave?\n\n⚠️ ADVERTENCIA: Si omite, puede configurar una clave que no posee.\nEsto es aceptable cuando delega el acceso a otra persona.",
+    "gpg_key_auth_skipped": "Autenticación omitida para clave: {fingerprint}",
+    # CHG-20251221-008: GPG key selection dialog
+    "gpg_key_select_title": "Seleccionar Clave GPG para Cifrado",
+    "gpg_key_select_hint": "Seleccione una clave de hardware de la lista o ingrese manualmente una huella digital o correo electrónico si su clave no está listada.",
+    "gpg_key_select_label": "Clave GPG:",
+    "gpg_key_select_placeholder": "Seleccionar o ingresar clave...",
+    "gpg_key_select_manual": "Entrada manual...",
+    "gpg_key_select_none": "No se encontraron claves secretas GPG",
+    "gpg_key_manual_label": "Ingrese huella digital o correo:",
+    # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
+    "gpg_key_select_hint_multi": "Seleccione una o más claves de hardware de la lista a continuación para redundancia.\nTambién puede ingresar manualmente huellas digitales adicionales (separadas por coma o salto de línea).",
+    "gpg_key_manual_label_multi": "Huellas digitales adicionales:",
+    "gpg_key_select_placeholder_multi": "Ingrese huellas digitales (separadas por coma o salto de línea)...",
+    "gpg_key_select_none_selected": "Por favor seleccione al menos una clave GPG o ingrese una huella digital manualmente.",
+    "rekey_mode_change_warning": "⚠️ Cambiar el modo de seguridad requiere verificación adicional",
+    "rekey_gpg_seed_instructions": "Por favor conecta tu YubiKey e ingresa la ruta a tu archivo de semilla GPG.",
+    "popup_unmount_failed_title": "Error al desmontar",
+    "popup_mount_failed_title": "Error al montar",
+    "popup_update_not_possible_title": "Actualización no posible",
+    "popup_update_confirm_title": "Confirmar actualización",
+    "popup_update_direction": "Dirección",
+    "popup_update_source": "Fuente",
+    "popup_update_destination": "Destino",
+    "popup_update_files_to_update": "Archivos a actualizar",
+    "popup_update_protected_items": "Elementos protegidos (Nunca sobrescritos)",
+    "popup_update_protected_list": "Los siguientes datos de usuario están protegidos automáticamente: {items}",
+    "popup_update_warning": "Advertencia",
+    "popup_update_warning_body": "Esto sobrescribirá archivos de script existentes en el directorio .smartdrive/.",
+    "popup_update_confirm_message": "Se va a ejecutar UPDATE ({direction}).\n\nDESDE:\n  {src_root}\n\nHACIA:\n  {dst_root}\n\nElementos:\n  - {items}\n\nMétodo: {method}\n\nEsto sobrescribirá los archivos existentes. ¿Continuar?",
+    "popup_update_config_title": "Configuración de actualización",
+    "popup_update_config_body": "La fuente de actualización no está configurada. Configúrala en Configuración.",
+    "popup_update_complete_title": "Actualización completa",
+    "popup_update_complete_body": "La actualización finalizó correctamente. Reinicia la aplicación.",
+    "popup_update_failed_title": "Actualización fallida",
+    "popup_update_failed_body": "La actualización falló:\n\n{error}",
+    "popup_update_timeout_title": "Tiempo de espera de actualización",
+    "popup_update_timeout_body": "La actualización no se completó en 120 segundos.",
+    "popup_update_error_title": "Error de actualización",
+    "popup_update_error_body": "No se pudo ejecutar la actualización:\n\n{error}",
+    "popup_cli_failed_title": "Error al iniciar CLI",
+    "popup_cli_failed_body": "No se pudo abrir la CLI:\n\n{error}",
+    # Update configuration error messages
+    "error_update_server_url_not_configured": "El URL del servidor no está configurado.\n\nVe a Configuración para configurar el URL de actualización.",
+    "error_update_local_root_not_configured": "El directorio de actualización local no está configurado.\n\nVe a Configuración para configurar la raíz local de actualización.",
+    "error_update_local_root_not_found": "No se encontró el directorio de actualización local:\n\n{path}\n\nComprueba Configuración para verificar la ruta.",
+    "error_update_install_dir_not_found": "No se encontró el directorio de instalación:\n\n{path}",
+    "error_update_unknown_source_type": "Tipo de origen de actualización desconocido: {type}",
+    # Hardware key error messages
+    "error_hardware_key_missing_title": "Se requiere llave de hardware",
+    "error_hardware_key_missing_body": "No se detectó la llave de hardware (YubiKey/tarjeta GPG). Inserta tu llave de hardware e inténtalo de nuevo.",
+    # Theme names (for theme dropdown)
+    "theme_brand": "Marca",
+    "theme_green": "Verde",
+    "theme_blue": "Azul",
+    "theme_rose": "Rosa",
+    "theme_slate": "Pizarra",
+    "label_theme": "Tema",
+    # File explorer buttons
+    "tooltip_open_launcher_drive": "Abrir unidad del launcher",
+    "tooltip_open_mounted_volume": "Abrir volumen montado",
+    "popup_open_failed_title": "Error al abrir",
+    "popup_open_failed_body": "No se pudo abrir el explorador de archivos:\n\n{path}\n\n{error}",
+    # About section (CHG-20251221-012)
+    "settings_about": "Acerca de",
+    "label_version": "Versión:",
+    "label_build_id": "ID de compilación:",
+    "label_build_dev": "Desarrollo",
+    "label_compat_version": "Versión de configuración:",
+    # Recovery kit generation (CHG-20251221-001)
+    "recovery_generate_section_title": "Generar kit de recuperación",
+    "recovery_generate_instructions": "Genera un nuevo kit de recuperación para crear una copia de seguridad cifrada de tus credenciales. Esto es útil si tu kit original se perdió, se dañó o si deseas una nueva copia después de cambiar las credenciales.",
+    "btn_generate_recovery_kit": "🔐 Generar nuevo kit de recuperación",
+    "recovery_generate_status_ready": "Haz clic en 'Generar nuevo kit de recuperación' para crear un nuevo kit.",
+    "recovery_generate_status_deriving": "Derivando credenciales de la llave de hardware...",
+    "recovery_generate_status_verifying": "Verificando credenciales con VeraCrypt...",
+    "recovery_generate_status_running": "Generando kit de recuperación...",
+    "recovery_generate_status_success": "✅ ¡Kit de recuperación generado exitosamente!",
+    "recovery_generate_status_failed": "❌ Error al generar el kit de recuperación: {error}",
+    "recovery_generate_confirm_title": "Generar kit de recuperación",
+    "recovery_generate_confirm_body": "Esto generará un nuevo kit de recuperación con una copia de seguridad cifrada de tus credenciales.\n\n¿Deseas continuar?",
+    "recovery_generate_regen_confirm_title": "Regenerar kit de recuperación",
+    "recovery_generate_regen_confirm_body": "⚠️ ADVERTENCIA: Esto creará un NUEVO kit de recuperación.\n\nTu kit de recuperación EXISTENTE será PERMANENTEMENTE INVALIDADO.\n\n¿Deseas continuar?",
+    "recovery_generate_security_warning_title": "Advertencia de seguridad: Regeneración del kit de recuperación",
+    "recovery_generate_security_warning_body": "⚠️ ADVERTENCIA DE SEGURIDAD ⚠️\n\nYa existe un kit de recuperación. Crear uno nuevo:\n\n• Invalidará el kit anterior\n• Creará un NUEVO acceso a tus datos cifrados\n• Cualquiera con el nuevo kit puede acceder a tus datos\n\nSolo continúa si comprendes las implicaciones de seguridad.\n\n¿Deseas regenerar?",
+    "recovery_generate_password_prompt_title": "Ingresa la contraseña del volumen",
+    "recovery_generate_password_prompt_body": "Por favor, ingresa tu contraseña del volumen para la generación del kit de recuperación:",
+    "recovery_generate_success_title": "Kit de recuperación generado",
+    "recovery_generate_success_body": "¡Tu kit de recuperación ha sido generado!\n\nUbicación: {path}\n\n⚠️ IMPORTANTE:\n• Imprime el archivo HTML inmediatamente\n• Guárdalo en un lugar físico seguro\n• Elimina el archivo HTML de la unidad después de imprimirlo",
+    # Settings dialog - Additional fields (schema-driven UI)
+    "label_drive_id": "ID de unidad",
+    "label_drive_name": "Nombre de unidad",
+    "label_setup_date": "Fecha de configuración",
+    "label_last_password_change": "Último cambio de contraseña",
+    "label_last_verified": "Última verificación",
+    "label_plain_keyfile": "Archivo de clave simple",
+    "label_seed_gpg_path": "Archivo semilla GPG",
+    "label_kdf": "Función de derivación de clave",
+    "label_pw_encoding": "Codificación de contraseña",
+    "label_recovery_enabled": "Habilitar kit de recuperación",
+    "label_recovery_share_count": "Número de partes de recuperación",
+    "label_recovery_threshold": "Umbral de recuperación",
+    "label_lost_and_found_enabled": "Habilitar mensaje de objetos perdidos",
+    "label_lost_and_found_message": "Mensaje de devolución",
+    "label_verification_overridden": "Verificación anulada",
+    "label_integrity_signed": "Integridad firmada",
+    "label_signing_key_fpr": "Huella digital de clave de firma",
+    "label_salt_b64": "Salt (Base64)",
+    "label_hkdf_info": "Info HKDF",
+    "label_schema_version": "Versión del esquema",
+    "label_version": "Versión",
+    # Tooltips for settings fields
+    "tooltip_drive_id": "Identificador único para esta unidad (solo lectura)",
+    "tooltip_drive_name": "Nombre personalizado para esta unidad",
+    "tooltip_language": "Idioma de la interfaz de usuario",
+    "tooltip_theme": "Esquema de color para la interfaz",
+    "tooltip_mode": "Modo de seguridad: solo contraseña, archivo de clave o YubiKey/GPG",
+    "tooltip_encrypted_keyfile": "Ruta al archivo de clave cifrado con GPG (para modos GPG)",
+    "tooltip_plain_keyfile": "Ruta al archivo de clave no cifrado (para modo de archivo de clave simple)",
+    "tooltip_seed_gpg_path": "Ruta al archivo semilla GPG para derivación de contraseña",
+    "tooltip_kdf": "Función de derivación de clave para modo de contraseña GPG",
+    "tooltip_pw_encoding": "Codificación de caracteres para contraseña (se recomienda UTF-8)",
+    "tooltip_windows_volume_path": "GUID de volumen de Windows o ruta de dispositivo",
+    "tooltip_mount_letter": "Letra de unidad para montar como (A-Z)",
+    "tooltip_veracrypt_path": "Ruta al ejecutable VeraCrypt.exe",
+    "tooltip_unix_volume_path": "Ruta de dispositivo Unix (p. ej., /dev/sdb2)",
+    "tooltip_mount_point": "Directorio de punto de montaje Unix",
+    # BUG-20251221-037: Mount point fallback i18n keys
+    "label_allow_mount_fallback": "Usar punto de montaje alternativo automáticamente",
+    "tooltip_allow_mount_fallback": "Cuando está habilitado, intenta automáticamente letras de unidad alternativas (Windows) o directorios de montaje (Unix) si el configurado no está disponible. Recomendado para evitar errores de montaje.",
+    "error_mount_point_occupied_fallback_disabled": "El punto de montaje {mount_point} ya está en uso.\n\nPara evitar este error en el futuro, habilite 'Usar punto de montaje alternativo automáticamente' en Configuración → pestaña {os_tab}.",
+    "error_mount_point_all_occupied": "No se pudo encontrar un punto de montaje disponible después de 3 intentos.\n\nTodas las letras de unidad D-Z están en uso (Windows) o las alternativas de punto de montaje fallaron (Unix).\n\nEsto es un problema de punto de montaje, NO un problema de credenciales.",
+    "warning_mount_fallback_used": "El punto de montaje configurado {original} no estaba disponible.\nUsando {fallback} en su lugar. Configuración actualizada.",
+    "tooltip_recovery_enabled": "Habilitar generación de kit de recuperación de emergencia",
+    "tooltip_recovery_share_count": "Número de partes de recuperación para generar",
+    "tooltip_recovery_threshold": "Número mínimo de partes necesarias para recuperación",
+    "tooltip_lost_and_found_enabled": "Habilitar mensaje de devolución si se pierde la unidad",
+    "tooltip_lost_and_found_message": "Mensaje mostrado si se encuentra la unidad",
+    "tooltip_source_type": "Fuente de actualización: directorio local o URL del servidor",
+    "tooltip_server_url": "URL del servidor para actualizaciones",
+    "tooltip_local_root": "Directorio local que contiene archivos de actualización",
+    "hint_update_local_title": "Acerca de las actualizaciones locales",
+    "hint_update_local_body": "Seleccione: (1) el directorio que contiene una carpeta .smartdrive/ (ej. H:\\ o C:\\MiDes\\), o (2) una carpeta .smartdrive/ directamente. El .smartdrive/ se detectará automáticamente. Los datos del usuario (recovery/, keys/, integrity/, config.json) están protegidos automáticamente. Los archivos de desarrollo (.git, pruebas, helper/) se excluyen.",
+    # CHG-20251222-016: Update action section i18n keys
+    "update_action_section_title": "Acciones de actualización",
+    "btn_run_update": "Ejecutar actualización",
+    "tooltip_run_update": "Ejecutar actualización desde la fuente configurada",
+    "label_last_update": "Última actualización:",
+    "label_last_update_source": "Fuente:",
+    "update_never": "Nunca",
+    "update_source_none": "No configurado",
+    "tooltip_verification_overridden": "Omitir verificación de integridad (¡peligroso!)",
+    "tooltip_integrity_signed": "La integridad de la unidad ha sido firmada criptográficamente",
+    "tooltip_signing_key_fpr": "Huella digital de clave GPG usada para firmar",
+    "tooltip_salt_b64": "Salt criptográfico para derivación de clave",
+    "tooltip_hkdf_info": "Cadena de contexto para derivación de clave HKDF",
+    # Integrity tab (CHG-20251220-002)
+    "label_integrity_status": "Estado de integridad:",
+    "tooltip_integrity_status": "Muestra si los scripts han sido verificados contra hash firmado",
+    # CHG-20251222-014: OS-specific tab tooltip
+    "tooltip_tab_disabled_other_os": "Esta pestaña es para otro sistema operativo",
+    "settings_integrity": "Integridad",
+    "settings_integrity_desc": "Verificar integridad del software y firmar scripts.",
+    "integrity_section_title": "🔐 Integridad del software",
+    "integrity_instructions": "Verifique que los scripts no hayan sido modificados desde la firma. Firmar requiere clave de hardware (YubiKey/tarjeta GPG).",
+    "btn_verify_local": "✓ Verificar integridad (local)",
+    "btn_sign_scripts": "🔑 Firmar scripts",
+    "btn_verify_remote": "🌐 Verificar (remoto)",
+    "integrity_status_ready": "Haga clic en 'Verificar' para comprobar la integridad del script.",
+    "integrity_status_checking": "Verificando integridad...",
+    "integrity_status_signing": "Firmando scripts con clave de hardware...",
+    "integrity_status_pass": "✅ ¡Integridad verificada! Los scripts son auténticos.",
+    "integrity_status_fail": "❌ ¡Verificación de integridad FALLIDA! Los scripts pueden haber sido modificados.",
+    "integrity_status_no_manifest": "⚠️ No se encontró manifiesto de integridad. Los scripts no están firmados.",
+    "integrity_status_sign_success": "✅ ¡Scripts firmados exitosamente!",
+    "integrity_status_sign_fail": "❌ Firma fallida. ¿Está insertada la clave de hardware?",
+    "integrity_result_hash": "Hash: {hash}",
+    "integrity_result_signer": "Firmado por: {signer}",
+    "integrity_remote_url_label": "URL del servidor:",
+    "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
+    "integrity_status_remote_checking": "Enviando solicitud de verificación al servidor...",
+    "integrity_status_remote_success": "✅ ¡Verificación remota exitosa!",
+    "integrity_status_remote_fail": "❌ Verificación remota fallida: {error}",
+    "integrity_status_no_server_url": "⚠️ URL del servidor no configurada. Configúrela en Ajustes → Integridad.",
+    "label_integrity_server_url": "URL del servidor de verificación",
+    "tooltip_integrity_server_url": "URL del servidor de verificación remota (ej. https://verify.example.com/api/check)",
+}
@@ -0,0 +1,472 @@
+# locales/gui_fr.py - GUI translation catalog: French
+"""GUI strings for language 'fr' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Window titles
+    "window_title": "KeyDrive",
+    "settings_window_title": "Paramètres",
+    # Button labels
+    "btn_mount": "🔓 Monter",
+    "btn_unmount": "🔒 Démonter",
+    "btn_cancel_auth": "❌ Annuler",
+    "btn_confirm_mount": "✅ Confirmer",
+    "btn_tools": "⚙️",
+    "btn_close": "✕",
+    "btn_save": "Enregistrer",
+    "btn_cancel": "Annuler",
+    "btn_confirm": "Confirmer",
+    "btn_ok": "OK",
+    "warning": "Avertissement",
+    "settings_tab_security": "Sécurité",
+    # CHG-20251223-055: Reload config button for non-modal settings
+    "btn_reload_config": "↻ Recharger config",
+    "tooltip_reload_config": "Recharger la configuration depuis le disque (annule les modifications non enregistrées)",
+    # Status messages
+    "status_config_not_found": "Configuration introuvable",
+    "status_volume_mounted": "Volume monté",
+    "status_volume_not_mounted": "Volume non monté",
+    "status_mounting": "⏳ Montage du volume...",
+    "status_mounting_gpg": "⏳ Montage du volume (authentification GPG)...",
+    "status_unmounting": "⏳ Démontage du volume...",
+    "status_mount_success": "✅ Volume monté avec succès",
+    "status_mount_failed": "❌ Échec du montage",
+    "status_unmount_success": "✅ Volume démonté avec succès",
+    "status_unmount_failed": "❌ Échec du démontage",
+    # Info labels
+    "info_unavailable": "Infos indisponibles",
+    "keyfile_selected_one": "1 fichier clé sélectionné",
+    "keyfile_selected_many": "{count} fichiers clés sélectionnés",
+    "keyfile_drop_hint": "Déposez les fichiers clés ici ou cliquez pour parcourir",
+    "keyfile_drop_supports_multiple": "Prend en charge plusieurs fichiers clés",
+    "label_show_password": "Afficher le mot de passe",
+    # Size formatting
+    "size_free": "Libre : {size}",
+    # Icons/placeholders
+    "icon_drive": "🚀",
+    # Tooltips
+    "tooltip_exit": "Quitter SmartDrive",
+    "tooltip_settings": "Outils et paramètres avancés",
+    # Labels
+    "label_product_name": "Nom du produit",
+    "label_preview": "Aperçu :",
+    "label_password": "Mot de passe :",
+    "label_keyfile": "Fichier clé :",
+    "label_hardware_key_hint": "💡 Une clé matérielle peut être requise pour l'authentification",
+    "label_forgot_password": "Mot de passe oublié ?",
+    # Placeholder text
+    "placeholder_password": "Saisissez votre mot de passe VeraCrypt...",
+    # Menu items
+    "menu_settings": "⚙️ Paramètres",
+    "menu_rekey": "🔑 Changer mot de passe/fichier clé",
+    "menu_update": "⬇️ Mettre à jour les scripts",
+    "menu_recovery": "💾 Kit de récupération",
+    "menu_about": "ℹ️ À propos",
+    "menu_cli": "💻 Ouvrir la CLI",
+    "menu_exit": "⏻ Quitter",
+    "menu_clear_keyfiles": "Effacer les fichiers clés",
+    "menu_switch_drive": "🔀 Changer de lecteur...",
+    "menu_switch_drive_browse": "📂 Parcourir...",
+    # CHG-20251221-042: Remote Control Mode menu items (French)
+    "menu_manage_remote": "🌐 Contrôle à distance...",
+    "menu_manage_remote_browse": "📂 Rechercher .smartdrive distant...",
+    "menu_exit_remote": "🏠 Quitter le mode distant",
+    "remote_active_label": "Contrôle à distance actif",
+    "remote_click_to_end": "Cliquez pour terminer",
+    "remote_validation_failed_title": "Échec de validation à distance",
+    "remote_validation_failed_body": "Impossible de se connecter au lecteur distant:\n\n{error}",
+    "remote_disconnected_title": "Lecteur distant déconnecté",
+    "remote_disconnected_body": "Le lecteur distant ({drive}:) a été déconnecté.\n\nRetour au mode local.",
+    "remote_confirm_title": "Entrer en mode contrôle à distance",
+    "remote_confirm_body": "Se connecter au .smartdrive distant:\n{path}\n\nEn mode distant, vous pouvez uniquement monter/démonter le volume distant.\nParamètres, mises à jour et accès CLI sont désactivés.",
+    "remote_mode_disabled_title": "Mode distant actif",
+    "remote_mode_disabled_cli": "Accès CLI désactivé en mode distant.",
+    "remote_mode_disabled_settings": "Paramètres désactivés en mode distant. Quittez d'abord le mode distant.",
+    "remote_mode_disabled_update": "Mises à jour désactivées en mode distant. Quittez d'abord le mode distant.",
+    "dialog_select_keyfiles": "Sélectionner le(s) fichier(s) clé(s)",
+    # Multi-drive context (CHG-20251221-026)
+    "label_launcher_root": "Lecteur de lancement :",
+    "group_drive_context": "Contexte du lecteur",
+    "tooltip_launcher_root": "Le lecteur contenant ce dossier .smartdrive",
+    # Drive safety context (CHG-20251221-040)
+    "label_os_drive": "Lecteur système :",
+    "tooltip_os_drive": "Lecteur exécutant le système d'exploitation (ne peut pas être repartitionné)",
+    "label_instantiation_drive": "Exécuté depuis :",
+    "tooltip_instantiation_drive": "Lecteur depuis lequel cette instance a été lancée (ne peut pas être repartitionné)",
+    "switch_drive_title": "Changer de contexte de lecteur",
+    "switch_drive_confirm": "Basculer vers la configuration de :\n{path}\n\nTous les paramètres seront rechargés depuis ce lecteur.",
+    "switch_drive_invalid_path": "Dossier .smartdrive invalide. config.json non trouvé.",
+    "switch_drive_select_folder": "Sélectionner le dossier .smartdrive",
+    "version_incompatible_title": "Avertissement de compatibilité de version",
+    "version_incompatible_error": "Impossible de basculer vers ce lecteur :\n\n{message}\n\nLe format de configuration n'est pas compatible avec cette version du logiciel.",
+    "version_incompatible_warning": "{message}\n\nCible : {path}\n\nVoulez-vous continuer quand même ?",
+    # Tray
+    "tray_minimized_message": "Exécution en arrière-plan. Cliquez sur l'icône de la barre pour ouvrir.",
+    "tray_unavailable_message": "La barre d'état système n'est pas disponible.\n\nVoulez-vous quitter l'application ?",
+    "tray_tooltip": "{name} ({id})",
+    # Status messages
+    "status_deriving_yubikey_password": "Dérivation du mot de passe depuis YubiKey...",
+    "status_checking_mount": "Vérification de l'état du montage...",
+    "status_unmounting_for_rekey": "Démontage du volume pour rekey...",
+    "status_decrypting_keyfile": "Déchiffrement du fichier clé avec YubiKey...",
+    # Worker messages (keys for structured errors)
+    "worker_mount_script_not_found": "Script de montage introuvable",
+    "worker_mount_success": "Volume monté avec succès",
+    "worker_mount_failed": "Échec du montage : {error}",
+    "worker_mount_timeout": "Délai de montage dépassé",
+    "worker_mount_error": "Erreur de montage : {error}",
+    "worker_unmount_script_not_found": "Script de démontage introuvable",
+    "worker_unmount_success": "Volume démonté avec succès",
+    "worker_unmount_failed": "Échec du démontage : {error}",
+    "worker_unmount_timeout": "Délai de démontage dépassé",
+    "worker_unmount_error": "Erreur de démontage : {error}",
+    # Settings dialog - Tab names
+    "settings_language": "Langue",
+    "settings_general": "Général",
+    "settings_security": "Sécurité",
+    "settings_keyfile": "Fichier clé",
+    "settings_windows": "Windows",
+    "settings_unix": "Unix",
+    "settings_updates": "Mises à jour",
+    "settings_recovery": "Récupération",
+    "settings_lost_and_found": "Objets trouvés",
+    "settings_advanced": "Avancé",
+    # Settings dialog - Tab descriptions
+    "settings_general_desc": "Configurez le nom d'affichage, la langue et les préférences de thème.",
+    "settings_security_desc": "Définissez le mode de chiffrement et la méthode d'authentification pour votre disque sécurisé.",
+    "settings_keyfile_desc": "Gérez les chemins des fichiers clés pour le chiffrement et l'authentification GPG.",
+    "settings_windows_desc": "Paramètres spécifiques à Windows, notamment la lettre du lecteur et l'emplacement de VeraCrypt.",
+    "settings_unix_desc": "Paramètres Linux et macOS, notamment le répertoire du point de montage.",
+    "settings_updates_desc": "Configurez la vérification automatique des mises à jour et les paramètres du serveur.",
+    "settings_recovery_desc": "Configurez les options de récupération Shamir Secret Sharing pour récupérer l'accès si les clés sont perdues.",
+    "settings_lost_and_found_desc": "Affichez un message de contact sur le disque pour le récupérer s'il est perdu.",
+    "settings_advanced_desc": "Paramètres techniques pour les paramètres de chiffrement et la vérification de l'intégrité.",
+    # BUG-20251221-036: Settings dialog - Group box titles (French)
+    "group_drive_identification": "Identification du lecteur",
+    "group_appearance": "Apparence",
+    "group_timestamps": "Horodatages",
+    "group_security_mode": "Mode de sécurité",
+    "group_keyfile_configuration": "Configuration du fichier clé",
+    "group_gpg_configuration": "Configuration GPG",
+    "group_emergency_recovery_kit": "Kit de récupération d'urgence",
+    "group_verification": "Vérification",
+    "group_verification_status": "État de vérification",
+    "group_software_integrity": "Intégrité du logiciel",
+    "group_remote_verification": "Vérification à distance",
+    "group_gpg_kdf_parameters": "Paramètres GPG KDF",
+    "group_metadata": "Métadonnées",
+    "settings_restart_not_required": "✓ Modifications appliquées immédiatement (aucun redémarrage requis)",
+    "label_mode": "Mode",
+    "label_encrypted_keyfile": "Fichier clé chiffré",
+    "label_volume_path": "Chemin du volume",
+    "label_mount_letter": "Lettre de montage",
+    "label_veracrypt_path": "Chemin de VeraCrypt",
+    "label_mount_point": "Point de montage",
+    "label_source_type": "Type de source",
+    "label_server_url": "URL du serveur",
+    "label_local_root": "Racine locale",
+    "error_invalid_mount_letter": "La lettre de montage doit être un seul caractère A–Z.",
+    "error_save_failed": "Impossible d'enregistrer config.json :",
+    "title_invalid_mount_letter": "Lettre de montage non valide",
+    "title_save_failed": "Échec de l'enregistrement",
+    "title_error": "Erreur",
+    "error_apply_theme": "Échec de l'application du thème : {error}",
+    "error_apply_language": "Échec de l'application de la langue : {error}",
+    # Popup dialogs
+    "popup_keyfile_required_title": "Fichier clé requis",
+    "popup_keyfile_required_body": "Veuillez sélectionner un fichier clé pour le mode mot de passe + fichier clé.",
+    "popup_password_required_title": "Mot de passe requis",
+    "popup_password_required_body": "Veuillez saisir votre mot de passe VeraCrypt.",
+    "popup_recovery_title": "Récupération de mot de passe",
+    "popup_recovery_available_body": "Un kit de récupération est disponible pour ce lecteur !\n\nPour récupérer l'accès à votre volume chiffré :\n\n1. Utilisez la CLI SmartDrive : python smartdrive.py\n2. Sélectionnez l'option 6 : Kit de récupération\n3. Suivez les instructions de récupération\n\nOu contactez votre administrateur système.",
+    "popup_recovery_unavailable_body": "Aucun kit de récupération n'est actuellement disponible pour ce lecteur.\n\nPour configurer la récupération de mot de passe :\n\n1. Utilisez la CLI SmartDrive : python smartdrive.py\n2. Sélectionnez l'option 6 : Kit de récupération\n3. Choisissez 'Generate Recovery Kit'\n\nOu contactez votre administrateur système.",
+    # Recovery tab - Phrase input and recovery actions
+    "recovery_section_title": "🔐 Récupération d'urgence",
+    "recovery_instructions": "Entrez votre phrase de récupération de 24 mots pour récupérer l'accès à votre volume chiffré. Vous pouvez également fournir un fichier conteneur de récupération si vous en avez un.",
+    "label_recovery_phrase": "Phrase de récupération (24 mots) :",
+    "placeholder_recovery_phrase": "Entrez 24 mots séparés par des espaces...",
+    "label_recovery_container": "Conteneur de récupération (optionnel) :",
+    "btn_browse_container": "Parcourir...",
+    "btn_recover_credentials": "🔓 Récupérer les identifiants",
+    "recovery_status_ready": "Entrez votre phrase de récupération et cliquez sur 'Récupérer les identifiants'",
+    "recovery_status_validating": "Validation de la phrase de récupération...",
+    "recovery_status_decrypting": "Déchiffrement du conteneur de récupération...",
+    "recovery_status_success": "✅ Récupération réussie ! Identifiants récupérés.",
+    "recovery_status_failed": "❌ Échec de la récupération : {error}",
+    "recovery_result_title": "Identifiants récupérés",
+    "recovery_result_password": "Mot de passe :",
+    "recovery_result_keyfile": "Fichier clé :",
+    "recovery_result_mode": "Mode de sécurité :",
+    "recovery_result_copy_password": "📋 Copier le mot de passe",
+    "recovery_result_save_keyfile": "💾 Enregistrer le fichier clé",
+    "recovery_copied_to_clipboard": "Mot de passe copié dans le presse-papiers (effacement auto dans 30 secondes)",
+    "recovery_keyfile_saved": "Fichier clé enregistré dans : {path}",
+    "recovery_phrase_invalid": "Phrase de récupération invalide. Veuillez vérifier les 24 mots.",
+    "recovery_container_not_found": "Conteneur de récupération introuvable. Veuillez sélectionner le fichier conteneur.",
+    "recovery_no_kit_configured": "Aucun kit de récupération configuré pour ce lecteur.",
+    "recovery_generate_first": "Veuillez d'abord générer un kit de récupération via Paramètres ou CLI.",
+    "recovery_already_used": "⚠️ Le kit de récupération a déjà été utilisé. Cette opération est désactivée.",
+    "recovery_status_invalidating": "Invalidation du kit de récupération...",
+    "recovery_status_complete": "Récupération terminée. Le kit de récupération a été définitivement invalidé.",
+    "recovery_rekey_required_title": "Changement d'identifiants obligatoire",
+    "recovery_rekey_required_body": "Récupération réussie. Pour des raisons de sécurité, vous DEVEZ changer votre mot de passe/fichier clé maintenant.\n\nLe kit de récupération contenait des identifiants temporaires qui sont maintenant compromis.\n\nVoulez-vous changer vos identifiants maintenant ?",
+    "recovery_rekey_now": "Changer les identifiants maintenant",
+    "recovery_rekey_later": "Me rappeler plus tard",
+    "recovery_rekey_skipped_warning": "⚠️ Vous avez ignoré le changement d'identifiants. Vous ne pourrez pas monter votre lecteur tant que les identifiants ne seront pas changés.",
+    "mount_blocked_rekey_required_title": "Changement d'identifiants obligatoire",
+    "mount_blocked_rekey_required_body": "Le kit de récupération a été utilisé mais les identifiants n'ont pas été changés. Pour la sécurité, le montage est bloqué.\n\nUtilisez le script de changement de clé pour définir de nouveaux identifiants.",
+    "mount_warn_rekey_title": "Changement d'identifiants recommandé",
+    "mount_warn_rekey_body": "Le kit de récupération a été utilisé récemment. Il est fortement recommandé de changer vos identifiants.\n\nVoulez-vous changer les identifiants maintenant ou continuer le montage ?",
+    "label_recovery_status": "État du kit de récupération",
+    "recovery_kit_available": "✅ Disponible",
+    "recovery_kit_used": "🚫 Utilisé (Invalide)",
+    "recovery_kit_not_configured": "⚪ Non configuré",
+    "recovery_html_warning": "Fichier HTML de récupération encore sur le disque ! Supprimez-le après impression pour la sécurité.",
+    "tooltip_recovery_status": "Indique si le kit de récupération est disponible, a été utilisé ou n'est pas configuré",
+    "rekey_section_title": "🔑 Changer les identifiants",
+    "rekey_instructions": "Changez le mot de passe de votre conteneur VeraCrypt et/ou les fichiers clé.",
+    "rekey_post_recovery_notice": "⚠️ POST-RÉCUPÉRATION : Vous devez changer les identifiants avant que le montage soit autorisé.",
+    "btn_start_rekey": "Démarrer le changement d'identifiants...",
+    # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
+    "btn_verify_rekey": "✓ Vérifier nouveaux identifiants",
+    "btn_cancel_rekey": "✕ Annuler",
+    "rekey_instructions_veracrypt": "GUI VeraCrypt ouvert. Dans VeraCrypt :\n1. Outils → Changer le mot de passe du volume\n2. Sélectionner appareil → choisissez votre volume\n3. Entrez mot de passe actuel ('Copier ancien mot de passe' ci-dessus)\n4. Entrez nouveau mot de passe ('Copier nouveau mot de passe' ci-dessus)\n5. Cliquez OK\n\nAprès confirmation dans VeraCrypt, cliquez 'Vérifier nouveaux identifiants'.",
+    "rekey_verifying": "Vérification des nouveaux identifiants via test de montage...",
+    "rekey_verification_success": "✓ Nouveaux identifiants vérifiés ! Finalisation du rekey...",
+    "rekey_verification_failed": "✕ Vérification échouée. Vérifiez votre nouveau mot de passe/fichier clé.",
+    "rekey_cancelled": "Changement d'identifiants annulé.",
+    # BUG-20251221-039: Copy credential buttons
+    # CHG-20251222-018: Enhanced tooltips for clarity
+    "btn_copy_old_password": "📋 Copier ancien mot de passe",
+    "btn_copy_new_password": "📋 Copier nouveau mot de passe",
+    "tooltip_copy_old_password": "Dériver et copier le mot de passe ACTUEL en utilisant le seed GPG EXISTANT. Pour les modes GPG, utilise votre clé matérielle. (30s TTL)",
+    "tooltip_copy_old_password_post_recovery": "Désactivé : Après la récupération, utilisez le mot de passe de votre kit de récupération. Le seed GPG peut être manquant ou corrompu.",
+    "tooltip_copy_new_password": "Dériver et copier le NOUVEAU mot de passe en utilisant le NOUVEAU seed GPG (ci-dessus). Générez d'abord un nouveau seed.gpg. (30s TTL)",
+    "rekey_gpg_seed_hint": "Pour les modes GPG : Le 'Nouveau Seed GPG' ci-dessus définit quel mot de passe sera dérivé. Générez d'abord un nouveau seed.gpg, puis utilisez 'Copier nouveau mot de passe'.",
+    "copy_password_title": "Copier le mot de passe",
+    "rekey_status_ready": "Prêt à changer les identifiants",
+    "rekey_status_preparing": "Préparation du changement d'identifiants...",
+    "rekey_status_opening_veracrypt": "Ouverture de VeraCrypt GUI...",
+    "rekey_status_awaiting_confirmation": "En attente de confirmation du changement de mot de passe...",
+    "rekey_status_verifying": "Vérification des nouveaux identifiants...",
+    "rekey_validating": "Validation des nouveaux identifiants...",
+    "rekey_verifying_mount": "Vérification des identifiants via montage...",
+    "rekey_credentials_verified": "Nouveaux identifiants vérifiés avec succès !",
+    "rekey_testing_mount": "Test de montage avec les nouveaux identifiants...",
+    "rekey_validation_success": "Validation réussie - démontage...",
+    "rekey_status_success": "✅ Identifiants changés avec succès",
+    "rekey_status_failed": "❌ Échec du changement d'identifiants : {error}",
+    "btn_verify_rekey": "Vérifier que le changement est terminé",
+    "rekey_current_password_label": "Mot de passe actuel :",
+    "rekey_current_password_auto": "(détecté automatiquement)",
+    "rekey_new_password_label": "Nouveau mot de passe :",
+    "rekey_confirm_password_label": "Confirmer le mot de passe :",
+    "rekey_current_mode_label": "Mode de sécurité actuel :",
+    "rekey_target_mode_label": "Nouveau mode de sécurité :",
+    "rekey_mode_same_tooltip": "Conserver le mode de sécurité actuel",
+    "rekey_mode_pw_only": "🔒 Mot de passe uniquement",
+    "rekey_mode_pw_keyfile": "🔑 Mot de passe + Fichier-clé",
+    "rekey_mode_pw_gpg_keyfile": "🛡️ Mot de passe + Fichier-clé dérivé GPG",
+    "rekey_mode_gpg_pw_only": "🔐 Mot de passe dérivé GPG (lecture seule)",
+    "rekey_new_keyfile_label": "Nouveau chemin du fichier-clé :",
+    "rekey_new_gpg_seed_label": "Nouveau chemin de la graine GPG :",
+    "btn_browse_keyfile": "Parcourir...",
+    # CHG-20251221-003: GPG seed generation button
+    "btn_generate_gpg_seed": "Générer",
+    "tooltip_generate_gpg_seed": "Générer une nouvelle graine GPG chiffrée pour la dérivation de mot de passe. Nécessite YubiKey/carte GPG.",
+    "gpg_seed_generate_title": "Générer une graine GPG",
+    "gpg_seed_generate_confirm": "Cela générera une nouvelle graine cryptographiquement sécurisée et la chiffrera avec votre clé GPG.\n\nVeuillez vous assurer que votre YubiKey/carte GPG est insérée.\n\nContinuer ?",
+    "gpg_seed_generate_success": "Graine GPG générée avec succès !",
+    "gpg_seed_generate_fail": "Échec de la génération de la graine GPG",
+    "gpg_seed_derive_info": "Le mot de passe dérivé de cette graine sera affiché.\nCopiez-le pour l'utiliser comme nouveau mot de passe VeraCrypt.",
+    # CHG-20251223-032: Multi-key authentication
+    "gpg_key_auth_title": "Authentifier la clé GPG",
+    "gpg_key_auth_prompt": "Pour vous assurer que vous avez accès à cette clé, veuillez vous authentifier.\n\nClé : {fingerprint}\n\nVotre PIN peut vous être demandé.",
+    "gpg_key_auth_success": "Clé authentifiée avec succès.",
+    "gpg_key_auth_fail": "Échec de l'authentification pour la clé : {fingerprint}",
+    "gpg_key_auth_skip_prompt": "Voulez-vous ignorer l'authentification pour cette clé ?\n\n⚠️ AVERTISSEMENT : Si vous ignorez, vous pouvez configurer une clé que vous ne possédez pas.\nCeci est acceptable lorsque vous déléguez l'accès à une autre personne.",
+    "gpg_key_auth_skipped": "Authentification ignorée pour la clé : {fingerprint}",
+    # CHG-20251221-008: GPG key selection dialog
+    "gpg_key_select_title": "Sélectionner la clé GPG pour le chiffrement",
+    "gpg_key_select_hint": "Sélectionnez une clé matérielle dans la liste ci-dessous ou entrez manuellement une empreinte ou un e-mail si votre clé n'est pas répertoriée.",
+    "gpg_key_select_label": "Clé GPG :",
+    "gpg_key_select_placeholder": "Sélectionner ou entrer la clé...",
+    "gpg_key_select_manual": "Saisie manuelle...",
+    "gpg_key_select_none": "Aucune clé secrète GPG trouvée",
+    "gpg_key_manual_label": "Entrez l'empreinte ou l'e-mail :",
+    # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
+    "gpg_key_select_hint_multi": "Sélectionnez une ou plusieurs clés matérielles dans la liste ci-dessous pour la redondance.\nVous pouvez également entrer manuellement des empreintes supplémentaires (séparées par des virgules ou des retours à la ligne).",
+    "gpg_key_manual_label_multi": "Empreintes supplémentaires :",
+    "gpg_key_select_placeholder_multi": "Entrez des empreintes (séparées par des virgules ou des retours à la ligne)...",
+    "gpg_key_select_none_selected": "Veuillez sélectionner au moins une clé GPG ou entrer une empreinte manuellement.",
+    "rekey_mode_change_warning": "⚠️ Le changement de mode de sécurité nécessite une vérification supplémentaire",
+    "rekey_gpg_seed_instructions": "Veuillez connecter votre YubiKey et entrer le chemin vers votre fichier graine GPG.",
+    "popup_unmount_failed_title": "Échec du démontage",
+    "popup_mount_failed_title": "Échec du montage",
+    "popup_update_not_possible_title": "Mise à jour impossible",
+    "popup_update_confirm_title": "Confirmer la mise à jour",
+    "popup_update_direction": "Direction",
+    "popup_update_source": "Source",
+    "popup_update_destination": "Destination",
+    "popup_update_files_to_update": "Fichiers à mettre à jour",
+    "popup_update_protected_items": "Éléments protégés (Jamais écrasés)",
+    "popup_update_protected_list": "Les données utilisateur suivantes sont automatiquement protégées : {items}",
+    "popup_update_warning": "Avertissement",
+    "popup_update_warning_body": "Cela écrasera les fichiers de script existants dans le répertoire .smartdrive/.",
+    "popup_update_confirm_message": "Sur le point d'exécuter UPDATE ({direction}).\n\nDE :\n  {src_root}\n\nVERS :\n  {dst_root}\n\nÉléments :\n  - {items}\n\nMéthode : {method}\n\nCela écrasera les fichiers existants. Continuer ?",
+    "popup_update_config_title": "Configuration de mise à jour",
+    "popup_update_config_body": "La source de mise à jour n'est pas configurée. Veuillez la définir dans Paramètres.",
+    "popup_update_complete_title": "Mise à jour terminée",
+    "popup_update_complete_body": "La mise à jour s'est terminée avec succès. Veuillez redémarrer l'application.",
+    "popup_update_failed_title": "Échec de la mise à jour",
+    "popup_update_failed_body": "Échec de la mise à jour :\n\n{error}",
+    "popup_update_timeout_title": "Délai de mise à jour dépassé",
+    "popup_update_timeout_body": "La mise à jour ne s'est pas terminée dans les 120 secondes.",
+    "popup_update_error_title": "Erreur de mise à jour",
+    "popup_update_error_body": "Impossible d'exécuter la mise à jour :\n\n{error}",
+    "popup_cli_failed_title": "Échec du lancement de la CLI",
+    "popup_cli_failed_body": "Impossible d'ouvrir la CLI :\n\n{error}",
+    # Update configuration error messages
+    "error_update_server_url_not_configured": "L'URL du serveur n'est pas configurée.\n\nAllez dans Paramètres pour configurer l'URL de mise à jour.",
+    "error_update_local_root_not_configured": "Le répertoire de mise à jour local n'est pas configuré.\n\nAllez dans Paramètres pour configurer la racine locale de mise à jour.",
+    "error_update_local_root_not_found": "Répertoire de mise à jour local introuvable :\n\n{path}\n\nVérifiez Paramètres pour valider le chemin.",
+    "error_update_install_dir_not_found": "Répertoire d'installation introuvable :\n\n{path}",
+    "error_update_unknown_source_type": "Type de source de mise à jour inconnu : {type}",
+    # Hardware key error messages
+    "error_hardware_key_missing_title": "Clé matérielle requise",
+    "error_hardware_key_missing_body": "Clé matérielle (YubiKey/carte GPG) non détectée. Veuillez insérer votre clé matérielle et réessayer.",
+    # Theme names (for theme dropdown
+    "theme_brand": "Marque",
+    "theme_green": "Vert",
+    "theme_blue": "Bleu",
+    "theme_rose": "Rose",
+    "theme_slate": "Ardoise",
+    "label_theme": "Thème",
+    # File explorer buttons
+    "tooltip_open_launcher_drive": "Ouvrir le lecteur de lancement",
+    "tooltip_open_mounted_volume": "Ouvrir le volume monté",
+    "popup_open_failed_title": "Échec de l'ouverture",
+    "popup_open_failed_body": "Impossible d'ouvrir l'explorateur de fichiers :\n\n{path}\n\n{error}",
+    # About section (CHG-20251221-012)
+    "settings_about": "À propos",
+    "label_version": "Version :",
+    "label_build_id": "ID de build :",
+    "label_build_dev": "Développement",
+    "label_compat_version": "Version de configuration :",
+    # Recovery kit generation (CHG-20251221-001)
+    "recovery_generate_section_title": "Générer le kit de récupération",
+    "recovery_generate_instructions": "Générez un nouveau kit de récupération pour créer une sauvegarde chiffrée de vos identifiants. C'est utile si votre kit original a été perdu, endommagé ou si vous souhaitez une nouvelle copie après avoir modifié vos identifiants.",
+    "btn_generate_recovery_kit": "🔐 Générer un nouveau kit de récupération",
+    "recovery_generate_status_ready": "Cliquez sur 'Générer un nouveau kit de récupération' pour créer un nouveau kit.",
+    "recovery_generate_status_deriving": "Dérivation des identifiants depuis la clé matérielle...",
+    "recovery_generate_status_verifying": "Vérification des identifiants avec VeraCrypt...",
+    "recovery_generate_status_running": "Génération du kit de récupération...",
+    "recovery_generate_status_success": "✅ Kit de récupération généré avec succès !",
+    "recovery_generate_status_failed": "❌ Échec de la génération du kit de récupération : {error}",
+    "recovery_generate_confirm_title": "Générer le kit de récupération",
+    "recovery_generate_confirm_body": "Ceci générera un nouveau kit de récupération avec une sauvegarde chiffrée de vos identifiants.\n\nVoulez-vous continuer ?",
+    "recovery_generate_regen_confirm_title": "Régénérer le kit de récupération",
+    "recovery_generate_regen_confirm_body": "⚠️ ATTENTION : Ceci créera un NOUVEAU kit de récupération.\n\nVotre kit de récupération EXISTANT sera DÉFINITIVEMENT INVALIDÉ.\n\nVoulez-vous continuer ?",
+    "recovery_generate_security_warning_title": "Avertissement de sécurité : Régénération du kit de récupération",
+    "recovery_generate_security_warning_body": "⚠️ AVERTISSEMENT DE SÉCURITÉ ⚠️\n\nUn kit de récupération existe déjà. En créer un nouveau :\n\n• Invalidera le kit précédent\n• Créera un NOUVEAU chemin d'accès à vos données chiffrées\n• Quiconque possède le nouveau kit peut accéder à vos données\n\nNe continuez que si vous comprenez les implications de sécurité.\n\nVoulez-vous régénérer ?",
+    "recovery_generate_password_prompt_title": "Entrez le mot de passe du volume",
+    "recovery_generate_password_prompt_body": "Veuillez entrer votre mot de passe de volume pour la génération du kit de récupération :",
+    "recovery_generate_success_title": "Kit de récupération généré",
+    "recovery_generate_success_body": "Votre kit de récupération a été généré !\n\nEmplacement : {path}\n\n⚠️ IMPORTANT :\n• Imprimez le fichier HTML immédiatement\n• Conservez-le dans un endroit physique sécurisé\n• Supprimez le fichier HTML du disque après l'impression",
+    # Settings dialog - Additional fields (schema-driven UI)
+    "label_drive_id": "ID du disque",
+    "label_drive_name": "Nom du disque",
+    "label_setup_date": "Date de configuration",
+    "label_last_password_change": "Dernier changement de mot de passe",
+    "label_last_verified": "Dernière vérification",
+    "label_plain_keyfile": "Fichier clé simple",
+    "label_seed_gpg_path": "Fichier semence GPG",
+    "label_kdf": "Fonction de dérivation de clé",
+    "label_pw_encoding": "Encodage du mot de passe",
+    "label_recovery_enabled": "Activer le kit de récupération",
+    "label_recovery_share_count": "Nombre de parts de récupération",
+    "label_recovery_threshold": "Seuil de récupération",
+    "label_lost_and_found_enabled": "Activer le message des objets trouvés",
+    "label_lost_and_found_message": "Message de retour",
+    "label_verification_overridden": "Vérification contournée",
+    "label_integrity_signed": "Intégrité signée",
+    "label_signing_key_fpr": "Empreinte de clé de signature",
+    "label_salt_b64": "Sel (Base64)",
+    "label_hkdf_info": "Info HKDF",
+    "label_schema_version": "Version du schéma",
+    "label_version": "Version",
+    # Tooltips for settings fields
+    "tooltip_drive_id": "Identifiant unique pour ce disque (lecture seule)",
+    "tooltip_drive_name": "Nom personnalisé pour ce disque",
+    "tooltip_language": "Langue de l'interface utilisateur",
+    "tooltip_theme": "Schéma de couleur pour l'interface",
+    "tooltip_mode": "Mode de sécurité : mot de passe uniquement, fichier clé ou YubiKey/GPG",
+    "tooltip_encrypted_keyfile": "Chemin vers le fichier clé chiffré GPG (pour les modes GPG)",
+    "tooltip_plain_keyfile": "Chemin vers le fichier clé non chiffré (pour le mode fichier clé simple)",
+    "tooltip_seed_gpg_path": "Chemin vers le fichier semence GPG pour la dérivation du mot de passe",
+    "tooltip_kdf": "Fonction de dérivation de clé pour le mode mot de passe GPG",
+    "tooltip_pw_encoding": "Encodage des caractères pour le mot de passe (UTF-8 recommandé)",
+    "tooltip_windows_volume_path": "GUID de volume Windows ou chemin du périphérique",
+    "tooltip_mount_letter": "Lettre de lecteur pour monter comme (A-Z)",
+    "tooltip_veracrypt_path": "Chemin vers l'exécutable VeraCrypt.exe",
+    "tooltip_unix_volume_path": "Chemin du périphérique Unix (par ex. /dev/sdb2)",
+    "tooltip_mount_point": "Répertoire de point de montage Unix",
+    # BUG-20251221-037: Mount point fallback i18n keys
+    "label_allow_mount_fallback": "Utiliser automatiquement un point de montage alternatif",
+    "tooltip_allow_mount_fallback": "Lorsqu'activé, essaie automatiquement des lettres de lecteur alternatives (Windows) ou des répertoires de montage (Unix) si celui configuré n'est pas disponible. Recommandé pour éviter les erreurs de montage.",
+    "error_mount_point_occupied_fallback_disabled": "Le point de montage {mount_point} est déjà utilisé.\n\nPour éviter cette erreur à l'avenir, activez 'Utiliser automatiquement un point de montage alternatif' dans Paramètres → onglet {os_tab}.",
+    "error_mount_point_all_occupied": "Impossible de trouver un point de montage disponible après 3 tentatives.\n\nToutes les lettres de lecteur D-Z sont utilisées (Windows) ou les alternatives de point de montage ont échoué (Unix).\n\nC'est un problème de point de montage, PAS un problème d'identifiants.",
+    "warning_mount_fallback_used": "Le point de montage configuré {original} n'était pas disponible.\nUtilisation de {fallback} à la place. Configuration mise à jour.",
+    "tooltip_recovery_enabled": "Activer la génération de kit de récupération d'urgence",
+    "tooltip_recovery_share_count": "Nombre de parts de récupération à générer",
+    "tooltip_recovery_threshold": "Nombre minimum de parts nécessaires pour la récupération",
+    "tooltip_lost_and_found_enabled": "Activer le message de retour si le disque est perdu",
+    "tooltip_lost_and_found_message": "Message affiché si le disque est trouvé",
+    "tooltip_source_type": "Source de mise à jour : répertoire local ou URL du serveur",
+    "tooltip_server_url": "URL du serveur pour les mises à jour",
+    "tooltip_local_root": "Répertoire local contenant les fichiers de mise à jour",
+    "hint_update_local_title": "À propos des mises à jour locales",
+    "hint_update_local_body": "Sélectionnez : (1) le répertoire contenant un dossier .smartdrive/ (par ex. H:\\ ou C:\\MonDev\\), ou (2) un dossier .smartdrive/ directement. Le .smartdrive/ sera détecté automatiquement. Les données utilisateur (recovery/, keys/, integrity/, config.json) sont automatiquement protégées. Les fichiers de développement (.git, tests, helper/) sont exclus.",
+    # CHG-20251222-016: Update action section i18n keys
+    "update_action_section_title": "Actions de mise à jour",
+    "btn_run_update": "Exécuter la mise à jour",
+    "tooltip_run_update": "Exécuter la mise à jour depuis la source configurée",
+    "label_last_update": "Dernière mise à jour :",
+    "label_last_update_source": "Source :",
+    "update_never": "Jamais",
+    "update_source_none": "Non configuré",
+    "tooltip_verification_overridden": "Contourner la vérification d'intégrité (dangereux !)",
+    "tooltip_integrity_signed": "L'intégrité du disque a été signée cryptographiquement",
+    "tooltip_signing_key_fpr": "Empreinte de clé GPG utilisée pour la signature",
+    "tooltip_salt_b64": "Sel cryptographique pour la dérivation de clé",
+    "tooltip_hkdf_info": "Chaîne de contexte pour la dérivation de clé HKDF",
+    # Integrity tab (CHG-20251220-002)
+    "label_integrity_status": "État d'intégrité :",
+    "tooltip_integrity_status": "Indique si les scripts ont été vérifiés par rapport au hash signé",
+    # CHG-20251222-014: OS-specific tab tooltip
+    "tooltip_tab_disabled_other_os": "Cet onglet est pour un autre système d'exploitation",
+    "settings_integrity": "Intégrité",
+    "settings_integrity_desc": "Vérifier l'intégrité du logiciel et signer les scripts.",
+    "integrity_section_title": "🔐 Intégrité du logiciel",
+    "integrity_instructions": "Vérifiez que les scripts n'ont pas été modifiés depuis la signature. La signature nécessite une clé matérielle (YubiKey/carte GPG).",
+    "btn_verify_local": "✓ Vérifier l'intégrité (local)",
+    "btn_sign_scripts": "🔑 Signer les scripts",
+    "btn_verify_remote": "🌐 Vérifier (distant)",
+    "integrity_status_ready": "Cliquez sur 'Vérifier' pour vérifier l'intégrité du script.",
+    "integrity_status_checking": "Vérification de l'intégrité...",
+    "integrity_status_signing": "Signature des scripts avec la clé matérielle...",
+    "integrity_status_pass": "✅ Intégrité vérifiée ! Les scripts sont authentiques.",
+    "integrity_status_fail": "❌ Vérification d'intégrité ÉCHOUÉE ! Les scripts ont peut-être été modifiés.",
+    "integrity_status_no_manifest": "⚠️ Manifeste d'intégrité non trouvé. Les scripts ne sont pas signés.",
+    "integrity_status_sign_success": "✅ Scripts signés avec succès !",
+    "integrity_status_sign_fail": "❌ Échec de la signature. La clé matérielle est-elle insérée ?",
+    "integrity_result_hash": "Hash : {hash}",
+    "integrity_result_signer": "Signé par : {signer}",
+    "integrity_remote_url_label": "URL du serveur :",
+    "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
+    "integrity_status_remote_checking": "Envoi de la demande de vérification au serveur...",
+    "integrity_status_remote_success": "✅ Vérification distante réussie !",
+    "integrity_status_remote_fail": "❌ Vérification distante échouée : {error}",
+    "integrity_status_no_server_url": "⚠️ URL du serveur non configurée. Définissez-la dans Paramètres → Intégrité.",
+    "label_integrity_server_url": "URL du serveur de vérification",
+    "tooltip_integrity_server_url": "URL du serveur de vérification distant (ex. https://verify.example.com/api/check)",
+}
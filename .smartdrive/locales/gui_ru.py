@@ -0,0 +1,472 @@
+# locales/gui_ru.py - GUI translation catalog: Russian
+"""GUI strings for language 'ru' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Window titles
+    "window_title": "KeyDrive",
+    "settings_window_title": "Настройки",
+    # Button labels
+    "btn_mount": "🔓 Смонтировать",
+    "btn_unmount": "🔒 Размонтировать",
+    "btn_cancel_auth": "❌ Отмена",
+    "btn_confirm_mount": "✅ Подтвердить",
+    "btn_tools": "⚙️",
+    "btn_close": "✕",
+    "btn_save": "Сохранить",
+    "btn_cancel": "Отмена",
+    "btn_confirm": "Подтвердить",
+    "btn_ok": "OK",
+    "warning": "Предупреждение",
+    "settings_tab_security": "Безопасность",
+    # CHG-20251223-055: Reload config button for non-modal settings
+    "btn_reload_config": "↻ Перезагрузить",
+    "tooltip_reload_config": "Перезагрузить конфигурацию с диска (отменяет несохранённые изменения)",
+    # Status messages
+    "status_config_not_found": "Конфигурация не найдена",
+    "status_volume_mounted": "Том смонтирован",
+    "status_volume_not_mounted": "Том не смонтирован",
+    "status_mounting": "⏳ Монтирование тома...",
+    "status_mounting_gpg": "⏳ Монтирование тома (GPG-аутентификация)...",
+    "status_unmounting": "⏳ Размонтирование тома...",
+    "status_mount_success": "✅ Том успешно смонтирован",
+    "status_mount_failed": "❌ Ошибка монтирования",
+    "status_unmount_success": "✅ Том успешно размонтирован",
+    "status_unmount_failed": "❌ Ошибка размонтирования",
+    # Info labels
+    "info_unavailable": "Информация недоступна",
+    "keyfile_selected_one": "Выбран 1 ключевой файл",
+    "keyfile_selected_many": "Выбрано {count} ключевых файлов",
+    "keyfile_drop_hint": "Перетащите ключевые файлы сюда или нажмите для выбора",
+    "keyfile_drop_supports_multiple": "Поддерживает несколько ключевых файлов",
+    "label_show_password": "Показать пароль",
+    # Size formatting
+    "size_free": "Свободно: {size}",
+    # Icons/placeholders
+    "icon_drive": "🚀",
+    # Tooltips
+    "tooltip_exit": "Выйти из SmartDrive",
+    "tooltip_settings": "Дополнительные инструменты и настройки",
+    # Labels
+    "label_product_name": "Название продукта",
+    "label_preview": "Предпросмотр:",
+    "label_password": "Пароль:",
+    "label_keyfile": "Ключевой файл:",
+    "label_hardware_key_hint": "💡 Для аутентификации может потребоваться аппаратный ключ",
+    "label_forgot_password": "Забыли пароль?",
+    # Placeholder text
+    "placeholder_password": "Введите пароль VeraCrypt...",
+    # Menu items
+    "menu_settings": "⚙️ Настройки",
+    "menu_rekey": "🔑 Сменить пароль/ключевой файл",
+    "menu_update": "⬇️ Обновить скрипты",
+    "menu_recovery": "💾 Набор восстановления",
+    "menu_about": "ℹ️ О программе",
+    "menu_cli": "💻 Открыть CLI",
+    "menu_exit": "⏻ Выход",
+    "menu_clear_keyfiles": "Очистить ключевые файлы",
+    "menu_switch_drive": "🔀 Сменить диск...",
+    "menu_switch_drive_browse": "📂 Обзор...",
+    # CHG-20251221-042: Remote Control Mode menu items (Russian)
+    "menu_manage_remote": "🌐 Удалённое управление...",
+    "menu_manage_remote_browse": "📂 Найти удалённый .smartdrive...",
+    "menu_exit_remote": "🏠 Выйти из удалённого режима",
+    "remote_active_label": "Удалённое управление активно",
+    "remote_click_to_end": "Нажмите для завершения",
+    "remote_validation_failed_title": "Ошибка удалённой валидации",
+    "remote_validation_failed_body": "Не удалось подключиться к удалённому диску:\n\n{error}",
+    "remote_disconnected_title": "Удалённый диск отключён",
+    "remote_disconnected_body": "Удалённый диск ({drive}:) был отключён.\n\nВозврат в локальный режим.",
+    "remote_confirm_title": "Войти в режим удалённого управления",
+    "remote_confirm_body": "Подключиться к удалённому .smartdrive:\n{path}\n\nВ удалённом режиме вы можете только монтировать/размонтировать удалённый том.\nНастройки, обновления и доступ к CLI отключены.",
+    "remote_mode_disabled_title": "Удалённый режим активен",
+    "remote_mode_disabled_cli": "Доступ к CLI отключён в удалённом режиме.",
+    "remote_mode_disabled_settings": "Настройки отключены в удалённом режиме. Сначала выйдите из удалённого режима.",
+    "remote_mode_disabled_update": "Обновления отключены в удалённом режиме. Сначала выйдите из удалённого режима.",
+    "dialog_select_keyfiles": "Выберите ключевой файл(ы)",
+    # Multi-drive context (CHG-20251221-026)
+    "label_launcher_root": "Загрузочный диск:",
+    "group_drive_context": "Контекст диска",
+    "tooltip_launcher_root": "Диск, содержащий эту папку .smartdrive",
+    # Drive safety context (CHG-20251221-040)
+    "label_os_drive": "Системный диск:",
+    "tooltip_os_drive": "Диск с операционной системой (не может быть перераспределён)",
+    "label_instantiation_drive": "Запущен с:",
+    "tooltip_instantiation_drive": "Диск, с которого запущен этот экземпляр (не может быть перераспределён)",
+    "switch_drive_title": "Сменить контекст диска",
+    "switch_drive_confirm": "Переключиться на конфигурацию из:\n{path}\n\nВсе настройки будут перезагружены с этого диска.",
+    "switch_drive_invalid_path": "Недействительная папка .smartdrive. config.json не найден.",
+    "switch_drive_select_folder": "Выберите папку .smartdrive",
+    "version_incompatible_title": "Предупреждение о совместимости версий",
+    "version_incompatible_error": "Невозможно переключиться на этот диск:\n\n{message}\n\nФормат конфигурации несовместим с этой версией программы.",
+    "version_incompatible_warning": "{message}\n\nЦель: {path}\n\nПродолжить всё равно?",
+    # Tray
+    "tray_minimized_message": "Работает в фоновом режиме. Нажмите на значок в трее, чтобы открыть.",
+    "tray_unavailable_message": "Системный трей недоступен.\n\nВы хотите закрыть приложение?",
+    "tray_tooltip": "{name} ({id})",
+    # Status messages
+    "status_deriving_yubikey_password": "Получение пароля из YubiKey...",
+    "status_checking_mount": "Проверка статуса монтирования...",
+    "status_unmounting_for_rekey": "Размонтирование тома для смены ключа...",
+    "status_decrypting_keyfile": "Расшифровка файла ключа с YubiKey...",
+    # Worker messages (keys for structured errors)
+    "worker_mount_script_not_found": "Скрипт монтирования не найден",
+    "worker_mount_success": "Том успешно смонтирован",
+    "worker_mount_failed": "Ошибка монтирования: {error}",
+    "worker_mount_timeout": "Время ожидания монтирования истекло",
+    "worker_mount_error": "Ошибка монтирования: {error}",
+    "worker_unmount_script_not_found": "Скрипт размонтирования не найден",
+    "worker_unmount_success": "Том успешно размонтирован",
+    "worker_unmount_failed": "Ошибка размонтирования: {error}",
+    "worker_unmount_timeout": "Время ожидания размонтирования истекло",
+    "worker_unmount_error": "Ошибка размонтирования: {error}",
+    # Settings dialog - Tab names
+    "settings_language": "Язык",
+    "settings_general": "Общие",
+    "settings_security": "Безопасность",
+    "settings_keyfile": "Ключевой файл",
+    "settings_windows": "Windows",
+    "settings_unix": "Unix",
+    "settings_updates": "Обновления",
+    "settings_recovery": "Восстановление",
+    "settings_lost_and_found": "Бюро находок",
+    "settings_advanced": "Дополнительно",
+    # Settings dialog - Tab descriptions
+    "settings_general_desc": "Настройте отображаемое имя, язык и параметры темы приложения.",
+    "settings_security_desc": "Установите режим шифрования и метод аутентификации для вашего защищённого диска.",
+    "settings_keyfile_desc": "Управляйте путями к ключевым файлам для шифрования и GPG-аутентификации.",
+    "settings_windows_desc": "Настройки для Windows, включая букву диска и расположение VeraCrypt.",
+    "settings_unix_desc": "Настройки для Linux и macOS, включая каталог точки монтирования.",
+    "settings_updates_desc": "Настройте автоматическую проверку обновлений и параметры сервера.",
+    "settings_recovery_desc": "Настройте параметры восстановления Shamir Secret Sharing для доступа при утере ключей.",
+    "settings_lost_and_found_desc": "Отображайте контактное сообщение на диске для возврата при потере.",
+    "settings_advanced_desc": "Технические настройки параметров шифрования и проверки целостности.",
+    # BUG-20251221-036: Settings dialog - Group box titles (Russian)
+    "group_drive_identification": "Идентификация диска",
+    "group_appearance": "Внешний вид",
+    "group_timestamps": "Временные метки",
+    "group_security_mode": "Режим безопасности",
+    "group_keyfile_configuration": "Конфигурация ключевого файла",
+    "group_gpg_configuration": "Конфигурация GPG",
+    "group_emergency_recovery_kit": "Аварийный набор восстановления",
+    "group_verification": "Проверка",
+    "group_verification_status": "Статус проверки",
+    "group_software_integrity": "Целостность программного обеспечения",
+    "group_remote_verification": "Удалённая проверка",
+    "group_gpg_kdf_parameters": "Параметры GPG KDF",
+    "group_metadata": "Метаданные",
+    "settings_restart_not_required": "✓ Изменения применены сразу (перезапуск не требуется)",
+    "label_mode": "Режим",
+    "label_encrypted_keyfile": "Зашифрованный ключевой файл",
+    "label_volume_path": "Путь к тому",
+    "label_mount_letter": "Буква диска",
+    "label_veracrypt_path": "Путь к VeraCrypt",
+    "label_mount_point": "Точка монтирования",
+    "label_source_type": "Тип источника",
+    "label_server_url": "URL сервера",
+    "label_local_root": "Локальный корневой каталог",
+    "error_invalid_mount_letter": "Буква диска должна быть одной буквой A–Z.",
+    "error_save_failed": "Не удалось сохранить config.json:",
+    "title_invalid_mount_letter": "Недопустимая буква диска",
+    "title_save_failed": "Ошибка сохранения",
+    "title_error": "Ошибка",
+    "error_apply_theme": "Не удалось применить тему: {error}",
+    "error_apply_language": "Не удалось применить язык: {error}",
+    # Popup dialogs
+    "popup_keyfile_required_title": "Требуется ключевой файл",
+    "popup_keyfile_required_body": "Пожалуйста, выберите ключевой файл для режима пароль + ключевой файл.",
+    "popup_password_required_title": "Требуется пароль",
+    "popup_password_required_body": "Пожалуйста, введите пароль VeraCrypt.",
+    "popup_recovery_title": "Восстановление пароля",
+    "popup_recovery_available_body": "Для этого диска доступен набор восстановления!\n\nЧтобы восстановить доступ к зашифрованному тому:\n\n1. Откройте SmartDrive CLI: python smartdrive.py\n2. Выберите пункт 6: Recovery Kit\n3. Следуйте инструкциям по восстановлению\n\nИли обратитесь к системному администратору.",
+    "popup_recovery_unavailable_body": "Набор восстановления для этого диска сейчас недоступен.\n\nЧтобы настроить восстановление пароля:\n\n1. Откройте SmartDrive CLI: python smartdrive.py\n2. Выберите пункт 6: Recovery Kit\n3. Выберите 'Generate Recovery Kit'\n\nИли обратитесь к системному администратору.",
+    # Recovery tab - Phrase input and recovery actions
+    "recovery_section_title": "🔐 Аварийное восстановление",
+    "recovery_instructions": "Введите вашу фразу восстановления из 24 слов для восстановления доступа к зашифрованному тому. Вы также можете указать файл контейнера восстановления, если он у вас есть.",
+    "label_recovery_phrase": "Фраза восстановления (24 слова):",
+    "placeholder_recovery_phrase": "Введите 24 слова через пробел...",
+    "label_recovery_container": "Контейнер восстановления (необязательно):",
+    "btn_browse_container": "Обзор...",
+    "btn_recover_credentials": "🔓 Восстановить учётные данные",
+    "recovery_status_ready": "Введите фразу восстановления и нажмите 'Восстановить учётные данные'",
+    "recovery_status_validating": "Проверка фразы восстановления...",
+    "recovery_status_decrypting": "Расшифровка контейнера восстановления...",
+    "recovery_status_success": "✅ Восстановление успешно! Учётные данные восстановлены.",
+    "recovery_status_failed": "❌ Ошибка восстановления: {error}",
+    "recovery_result_title": "Восстановленные учётные данные",
+    "recovery_result_password": "Пароль:",
+    "recovery_result_keyfile": "Ключевой файл:",
+    "recovery_result_mode": "Режим безопасности:",
+    "recovery_result_copy_password": "📋 Копировать пароль",
+    "recovery_result_save_keyfile": "💾 Сохранить ключевой файл",
+    "recovery_copied_to_clipboard": "Пароль скопирован в буфер обмена (автоочистка через 30 секунд)",
+    "recovery_keyfile_saved": "Ключевой файл сохранён в: {path}",
+    "recovery_phrase_invalid": "Неверная фраза восстановления. Проверьте все 24 слова.",
+    "recovery_container_not_found": "Контейнер восстановления не найден. Выберите файл контейнера.",
+    "recovery_no_kit_configured": "Для этого диска не настроен набор восстановления.",
+    "recovery_generate_first": "Сначала сгенерируйте набор восстановления через Настройки или CLI.",
+    "recovery_already_used": "⚠️ Набор восстановления уже был использован. Эта операция отключена.",
+    "recovery_status_invalidating": "Аннулирование набора восстановления...",
+    "recovery_status_complete": "Восстановление завершено. Набор восстановления был безвозвратно аннулирован.",
+    "recovery_rekey_required_title": "Обязательная смена учётных данных",
+    "recovery_rekey_required_body": "Восстановление успешно. В целях безопасности вы ДОЛЖНЫ сменить пароль/ключевой файл сейчас.\n\nНабор восстановления содержал временные учётные данные, которые теперь скомпрометированы.\n\nХотите сменить учётные данные сейчас?",
+    "recovery_rekey_now": "Сменить учётные данные сейчас",
+    "recovery_rekey_later": "Напомнить позже",
+    "recovery_rekey_skipped_warning": "⚠️ Вы пропустили смену учётных данных. Вы не сможете смонтировать диск, пока учётные данные не будут изменены.",
+    "mount_blocked_rekey_required_title": "Обязательная смена учётных данных",
+    "mount_blocked_rekey_required_body": "Набор восстановления был использован, но учётные данные не были изменены. В целях безопасности монтирование заблокировано.\n\nИспользуйте скрипт смены ключа для установки новых учётных данных.",
+    "mount_warn_rekey_title": "Рекомендуется смена учётных данных",
+    "mount_warn_rekey_body": "Набор восстановления был недавно использован. Настоятельно рекомендуется сменить учётные данные.\n\nХотите сменить учётные данные сейчас или продолжить монтирование?",
+    "label_recovery_status": "Состояние набора восстановления",
+    "recovery_kit_available": "✅ Доступен",
+    "recovery_kit_used": "🚫 Использован (Недействителен)",
+    "recovery_kit_not_configured": "⚪ Не настроен",
+    "recovery_html_warning": "HTML-файл восстановления всё ещё на диске! Удалите после печати для безопасности.",
+    "tooltip_recovery_status": "Показывает, доступен ли набор восстановления, был ли использован или не настроен",
+    "rekey_section_title": "🔑 Смена учётных данных",
+    "rekey_instructions": "Смените пароль контейнера VeraCrypt и/или ключевые файлы.",
+    "rekey_post_recovery_notice": "⚠️ ПОСТ-ВОССТАНОВЛЕНИЕ: Вы должны сменить учётные данные, прежде чем монтирование будет разрешено.",
+    "btn_start_rekey": "Начать смену учётных данных...",
+    # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
+    "btn_verify_rekey": "✓ Проверить новые учётные данные",
+    "btn_cancel_rekey": "✕ Отмена",
+    "rekey_instructions_veracrypt": "VeraCrypt GUI открыт. В VeraCrypt:\n1. Сервис → Изменить пароль тома\n2. Выбрать устройство → выберите ваш том\n3. Введите текущий пароль ('Скопировать старый пароль' выше)\n4. Введите новый пароль ('Скопировать новый пароль' выше)\n5. Нажмите OK\n\nПосле подтверждения в VeraCrypt нажмите 'Проверить новые учётные данные'.",
+    "rekey_verifying": "Проверка новых учётных данных через тест монтирования...",
+    "rekey_verification_success": "✓ Новые учётные данные проверены! Завершение rekey...",
+    "rekey_verification_failed": "✕ Проверка не удалась. Проверьте новый пароль/ключевой файл.",
+    "rekey_cancelled": "Смена учётных данных отменена.",
+    # BUG-20251221-039: Copy credential buttons
+    # CHG-20251222-018: Enhanced tooltips for clarity
+    "btn_copy_old_password": "📋 Скопировать старый пароль",
+    "btn_copy_new_password": "📋 Скопировать новый пароль",
+    "tooltip_copy_old_password": "Получить и скопировать ТЕКУЩИЙ пароль, используя СУЩЕСТВУЮЩИЙ GPG seed. Для режимов GPG используется аппаратный ключ. (30с TTL)",
+    "tooltip_copy_old_password_post_recovery": "Отключено: После восстановления используйте пароль из комплекта восстановления. GPG seed может отсутствовать или быть повреждён.",
+    "tooltip_copy_new_password": "Получить и скопировать НОВЫЙ пароль, используя НОВЫЙ GPG seed (указан выше). Сначала сгенерируйте новый seed.gpg. (30с TTL)",
+    "rekey_gpg_seed_hint": "Для режимов GPG: 'Новый GPG Seed' выше определяет, какой пароль будет получен. Сначала сгенерируйте новый seed.gpg, затем используйте 'Скопировать новый пароль'.",
+    "copy_password_title": "Копирование пароля",
+    "rekey_status_ready": "Готов к смене учётных данных",
+    "rekey_status_preparing": "Подготовка к смене учётных данных...",
+    "rekey_status_opening_veracrypt": "Открытие VeraCrypt GUI...",
+    "rekey_status_awaiting_confirmation": "Ожидание подтверждения смены пароля...",
+    "rekey_status_verifying": "Проверка новых учётных данных...",
+    "rekey_validating": "Валидация новых учётных данных...",
+    "rekey_verifying_mount": "Проверка учётных данных через монтирование...",
+    "rekey_credentials_verified": "Новые учётные данные успешно проверены!",
+    "rekey_testing_mount": "Тест монтирования с новыми учётными данными...",
+    "rekey_validation_success": "Валидация успешна - размонтирование...",
+    "rekey_status_success": "✅ Учётные данные успешно изменены",
+    "rekey_status_failed": "❌ Ошибка смены учётных данных: {error}",
+    "btn_verify_rekey": "Подтвердить завершение смены",
+    "rekey_current_password_label": "Текущий пароль:",
+    "rekey_current_password_auto": "(определён автоматически)",
+    "rekey_new_password_label": "Новый пароль:",
+    "rekey_confirm_password_label": "Подтвердите пароль:",
+    "rekey_current_mode_label": "Текущий режим безопасности:",
+    "rekey_target_mode_label": "Новый режим безопасности:",
+    "rekey_mode_same_tooltip": "Сохранить текущий режим безопасности",
+    "rekey_mode_pw_only": "🔒 Только пароль",
+    "rekey_mode_pw_keyfile": "🔑 Пароль + Ключевой файл",
+    "rekey_mode_pw_gpg_keyfile": "🛡️ Пароль + GPG-производный ключевой файл",
+    "rekey_mode_gpg_pw_only": "🔐 GPG-производный пароль (только чтение)",
+    "rekey_new_keyfile_label": "Путь к новому ключевому файлу:",
+    "rekey_new_gpg_seed_label": "Путь к новому GPG-сиду:",
+    "btn_browse_keyfile": "Обзор...",
+    # CHG-20251221-003: GPG seed generation button
+    "btn_generate_gpg_seed": "Генерировать",
+    "tooltip_generate_gpg_seed": "Генерировать новый GPG-шифрованный сид для вывода пароля. Требуется YubiKey/GPG-карта.",
+    "gpg_seed_generate_title": "Генерация GPG-сида",
+    "gpg_seed_generate_confirm": "Это создаст новый криптографически безопасный сид и зашифрует его вашим GPG-ключом.\n\nУбедитесь, что ваш YubiKey/GPG-карта вставлены.\n\nПродолжить?",
+    "gpg_seed_generate_success": "GPG-сид успешно сгенерирован!",
+    "gpg_seed_generate_fail": "Ошибка генерации GPG-сида",
+    "gpg_seed_derive_info": "Будет показан пароль, выведенный из этого сида.\nСкопируйте его для использования как новый пароль VeraCrypt.",
+    # CHG-20251223-032: Multi-key authentication
+    "gpg_key_auth_title": "Аутентификация GPG-ключа",
+    "gpg_key_auth_prompt": "Чтобы убедиться, что у вас есть доступ к этому ключу, пожалуйста, аутентифицируйтесь.\n\nКлюч: {fingerprint}\n\nВозможно, потребуется ввести PIN.",
+    "gpg_key_auth_success": "Ключ успешно аутентифицирован.",
+    "gpg_key_auth_fail": "Ошибка аутентификации для ключа: {fingerprint}",
+    "gpg_key_auth_skip_prompt": "Хотите пропустить аутентификацию для этого ключа?\n\n⚠️ ПРЕДУПРЕЖДЕНИЕ: Если пропустите, вы можете настроить ключ, которым не владеете.\nЭто допустимо при делегировании доступа другому лицу.",
+    "gpg_key_auth_skipped": "Аутентификация пропущена для ключа: {fingerprint}",
+    # CHG-20251221-008: GPG key selection dialog
+    "gpg_key_select_title": "Выбор GPG-ключа для шифрования",
+    "gpg_key_select_hint": "Выберите аппаратный ключ из списка ниже или вручную введите отпечаток или email, если вашего ключа нет в списке.",
+    "gpg_key_select_label": "GPG-ключ:",
+    "gpg_key_select_placeholder": "Выберите или введите ключ...",
+    "gpg_key_select_manual": "Ручной ввод...",
+    "gpg_key_select_none": "Секретные GPG-ключи не найдены",
+    "gpg_key_manual_label": "Введите отпечаток или email:",
+    # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
+    "gpg_key_select_hint_multi": "Выберите один или несколько аппаратных ключей из списка ниже для резервирования.\nВы также можете вручную ввести дополнительные отпечатки (через запятую или перевод строки).",
+    "gpg_key_manual_label_multi": "Дополнительные отпечатки:",
+    "gpg_key_select_placeholder_multi": "Введите отпечатки (через запятую или перевод строки)...",
+    "gpg_key_select_none_selected": "Пожалуйста, выберите хотя бы один GPG-ключ или введите отпечаток вручную.",
+    "rekey_mode_change_warning": "⚠️ Изменение режима безопасности требует дополнительной проверки",
+    "rekey_gpg_seed_instructions": "Пожалуйста, подключите YubiKey и укажите путь к файлу GPG-сида.",
+    "popup_unmount_failed_title": "Ошибка размонтирования",
+    "popup_mount_failed_title": "Ошибка монтирования",
+    "popup_update_not_possible_title": "Обновление невозможно",
+    "popup_update_confirm_title": "Подтвердить обновление",
+    "popup_update_direction": "Направление",
+    "popup_update_source": "Источник",
+    "popup_update_destination": "Назначение",
+    "popup_update_files_to_update": "Файлы для обновления",
+    "popup_update_protected_items": "Защищенные элементы (Никогда не перезаписываются)",
+    "popup_update_protected_list": "Следующие пользовательские данные автоматически защищены: {items}",
+    "popup_update_warning": "Предупреждение",
+    "popup_update_warning_body": "Это перезапишет существующие файлы скриптов в каталоге .smartdrive/.",
+    "popup_update_confirm_message": "Сейчас будет выполнено UPDATE ({direction}).\n\nИЗ:\n  {src_root}\n\nВ:\n  {dst_root}\n\nЭлементы:\n  - {items}\n\nМетод: {method}\n\nЭто перезапишет существующие файлы. Продолжить?",
+    "popup_update_config_title": "Настройка обновления",
+    "popup_update_config_body": "Источник обновления не настроен. Укажите его в Настройках.",
+    "popup_update_complete_title": "Обновление завершено",
+    "popup_update_complete_body": "Обновление успешно завершено. Пожалуйста, перезапустите приложение.",
+    "popup_update_failed_title": "Ошибка обновления",
+    "popup_update_failed_body": "Обновление не удалось:\n\n{error}",
+    "popup_update_timeout_title": "Время ожидания обновления",
+    "popup_update_timeout_body": "Обновление не завершилось за 120 секунд.",
+    "popup_update_error_title": "Ошибка обновления",
+    "popup_update_error_body": "Не удалось запустить обновление:\n\n{error}",
+    "popup_cli_failed_title": "Не удалось запустить CLI",
+    "popup_cli_failed_body": "Не удалось открыть CLI:\n\n{error}",
+    # Update configuration error messages
+    "error_update_server_url_not_configured": "URL сервера не настроен.\\n\\nОткройте Настройки и укажите URL для обновления.",
+    "error_update_local_root_not_configured": "Локальная папка обновления не настроена.\\n\\nОткройте Настройки и укажите локальный путь для обновления.",
+    "error_update_local_root_not_found": "Локальная папка обновления не найдена:\\n\\n{path}\\n\\nПроверьте Настройки и убедитесь, что путь указан верно.",
+    "error_update_install_dir_not_found": "Каталог установки не найден:\\n\\n{path}",
+    "error_update_unknown_source_type": "Неизвестный тип источника обновления: {type}",
+    # Hardware key error messages
+    "error_hardware_key_missing_title": "Требуется аппаратный ключ",
+    "error_hardware_key_missing_body": "Аппаратный ключ (YubiKey/GPG-карта) не обнаружен. Подключите аппаратный ключ и повторите попытку.",
+    # Theme names (for theme dropdown)
+    "theme_brand": "Фирменная",
+    "theme_green": "Зелёная",
+    "theme_blue": "Синяя",
+    "theme_rose": "Роза",
+    "theme_slate": "Сланец",
+    "label_theme": "Тема",
+    # File explorer buttons
+    "tooltip_open_launcher_drive": "Открыть диск запуска",
+    "tooltip_open_mounted_volume": "Открыть смонтированный том",
+    "popup_open_failed_title": "Ошибка открытия",
+    "popup_open_failed_body": "Не удалось открыть файловый менеджер:\n\n{path}\n\n{error}",
+    # About section (CHG-20251221-012)
+    "settings_about": "О программе",
+    "label_version": "Версия:",
+    "label_build_id": "ID сборки:",
+    "label_build_dev": "Разработка",
+    "label_compat_version": "Версия конфигурации:",
+    # Recovery kit generation (CHG-20251221-001)
+    "recovery_generate_section_title": "Создать набор восстановления",
+    "recovery_generate_instructions": "Создайте новый набор восстановления для создания зашифрованной резервной копии ваших учётных данных. Это полезно, если ваш оригинальный набор был утерян, повреждён или если вы хотите новую копию после изменения учётных данных.",
+    "btn_generate_recovery_kit": "🔐 Создать новый набор восстановления",
+    "recovery_generate_status_ready": "Нажмите 'Создать новый набор восстановления' для создания нового набора.",
+    "recovery_generate_status_deriving": "Получение учётных данных с аппаратного ключа...",
+    "recovery_generate_status_verifying": "Проверка учётных данных с VeraCrypt...",
+    "recovery_generate_status_running": "Создание набора восстановления...",
+    "recovery_generate_status_success": "✅ Набор восстановления успешно создан!",
+    "recovery_generate_status_failed": "❌ Ошибка создания набора восстановления: {error}",
+    "recovery_generate_confirm_title": "Создать набор восстановления",
+    "recovery_generate_confirm_body": "Это создаст новый набор восстановления с зашифрованной резервной копией ваших учётных данных.\n\nПродолжить?",
+    "recovery_generate_regen_confirm_title": "Пересоздать набор восстановления",
+    "recovery_generate_regen_confirm_body": "⚠️ ВНИМАНИЕ: Это создаст НОВЫЙ набор восстановления.\n\nВаш СУЩЕСТВУЮЩИЙ набор восстановления будет НАВСЕГДА АННУЛИРОВАН.\n\nПродолжить?",
+    "recovery_generate_security_warning_title": "Предупреждение безопасности: Пересоздание набора восстановления",
+    "recovery_generate_security_warning_body": "⚠️ ПРЕДУПРЕЖДЕНИЕ БЕЗОПАСНОСТИ ⚠️\n\nНабор восстановления уже существует. Создание нового:\n\n• Аннулирует предыдущий набор\n• Создаст НОВЫЙ путь доступа к вашим зашифрованным данным\n• Любой, у кого есть новый набор, может получить доступ к вашим данным\n\nПродолжайте только если понимаете последствия для безопасности.\n\nХотите пересоздать?",
+    "recovery_generate_password_prompt_title": "Введите пароль тома",
+    "recovery_generate_password_prompt_body": "Пожалуйста, введите пароль тома для создания набора восстановления:",
+    "recovery_generate_success_title": "Набор восстановления создан",
+    "recovery_generate_success_body": "Ваш набор восстановления создан!\n\nРасположение: {path}\n\n⚠️ ВАЖНО:\n• Немедленно распечатайте HTML-файл\n• Храните в безопасном физическом месте\n• Удалите HTML-файл с диска после печати",
+    # Settings dialog - Additional fields (schema-driven UI)
+    "label_drive_id": "ID диска",
+    "label_drive_name": "Имя диска",
+    "label_setup_date": "Дата настройки",
+    "label_last_password_change": "Последнее изменение пароля",
+    "label_last_verified": "Последняя проверка",
+    "label_plain_keyfile": "Простой файл ключа",
+    "label_seed_gpg_path": "Файл семени GPG",
+    "label_kdf": "Функция вывода ключа",
+    "label_pw_encoding": "Кодировка пароля",
+    "label_recovery_enabled": "Включить набор восстановления",
+    "label_recovery_share_count": "Количество частей восстановления",
+    "label_recovery_threshold": "Порог восстановления",
+    "label_lost_and_found_enabled": "Включить сообщение о потере",
+    "label_lost_and_found_message": "Сообщение о возврате",
+    "label_verification_overridden": "Проверка отменена",
+    "label_integrity_signed": "Целостность подписана",
+    "label_signing_key_fpr": "Отпечаток ключа подписи",
+    "label_salt_b64": "Соль (Base64)",
+    "label_hkdf_info": "Информация HKDF",
+    "label_schema_version": "Версия схемы",
+    "label_version": "Версия",
+    # Tooltips for settings fields
+    "tooltip_drive_id": "Уникальный идентификатор для этого диска (только чтение)",
+    "tooltip_drive_name": "Пользовательское имя для этого диска",
+    "tooltip_language": "Язык интерфейса пользователя",
+    "tooltip_theme": "Цветовая схема интерфейса",
+    "tooltip_mode": "Режим безопасности: только пароль, файл ключа или YubiKey/GPG",
+    "tooltip_encrypted_keyfile": "Путь к зашифрованному GPG файлу ключа (для режимов GPG)",
+    "tooltip_plain_keyfile": "Путь к незашифрованному файлу ключа (для простого режима файла ключа)",
+    "tooltip_seed_gpg_path": "Путь к файлу семени GPG для вывода пароля",
+    "tooltip_kdf": "Функция вывода ключа для режима пароля GPG",
+    "tooltip_pw_encoding": "Кодировка символов для пароля (рекомендуется UTF-8)",
+    "tooltip_windows_volume_path": "GUID тома Windows или путь к устройству",
+    "tooltip_mount_letter": "Буква диска для монтирования (A-Z)",
+    "tooltip_veracrypt_path": "Путь к исполняемому файлу VeraCrypt.exe",
+    "tooltip_unix_volume_path": "Путь к устройству Unix (например, /dev/sdb2)",
+    "tooltip_mount_point": "Каталог точки монтирования Unix",
+    # BUG-20251221-037: Mount point fallback i18n keys
+    "label_allow_mount_fallback": "Автоматически использовать альтернативную точку монтирования",
+    "tooltip_allow_mount_fallback": "При включении автоматически пробует альтернативные буквы дисков (Windows) или каталоги монтирования (Unix), если настроенный недоступен. Рекомендуется для предотвращения ошибок монтирования.",
+    "error_mount_point_occupied_fallback_disabled": "Точка монтирования {mount_point} уже используется.\n\nЧтобы избежать этой ошибки в будущем, включите 'Автоматически использовать альтернативную точку монтирования' в Настройки → вкладка {os_tab}.",
+    "error_mount_point_all_occupied": "Не удалось найти доступную точку монтирования после 3 попыток.\n\nВсе буквы дисков D-Z заняты (Windows) или альтернативные точки монтирования не удались (Unix).\n\nЭто проблема с точкой монтирования, НЕ проблема с учетными данными.",
+    "warning_mount_fallback_used": "Настроенная точка монтирования {original} была недоступна.\nИспользуется {fallback} вместо неё. Конфигурация обновлена.",
+    "tooltip_recovery_enabled": "Включить генерацию аварийного набора восстановления",
+    "tooltip_recovery_share_count": "Количество частей восстановления для генерации",
+    "tooltip_recovery_threshold": "Минимальное количество частей, необходимых для восстановления",
+    "tooltip_lost_and_found_enabled": "Включить сообщение о возврате при потере диска",
+    "tooltip_lost_and_found_message": "Сообщение, отображаемое при нахождении диска",
+    "tooltip_source_type": "Источник обновления: локальный каталог или URL сервера",
+    "tooltip_server_url": "URL сервера для обновлений",
+    "tooltip_local_root": "Локальный каталог, содержащий файлы обновления",
+    "hint_update_local_title": "О локальных обновлениях",
+    "hint_update_local_body": "Выберите: (1) каталог, содержащий папку .smartdrive/ (например, H:\\ или C:\\МояРазработка\\), или (2) папку .smartdrive/ напрямую. .smartdrive/ будет обнаружен автоматически. Пользовательские данные (recovery/, keys/, integrity/, config.json) автоматически защищены. Файлы разработки (.git, тесты, helper/) исключаются.",
+    # CHG-20251222-016: Update action section i18n keys
+    "update_action_section_title": "Действия обновления",
+    "btn_run_update": "Выполнить обновление",
+    "tooltip_run_update": "Выполнить обновление из настроенного источника",
+    "label_last_update": "Последнее обновление:",
+    "label_last_update_source": "Источник:",
+    "update_never": "Никогда",
+    "update_source_none": "Не настроен",
+    "tooltip_verification_overridden": "Обойти проверку целостности (опасно!)",
+    "tooltip_integrity_signed": "Целостность диска была криптографически подписана",
+    "tooltip_signing_key_fpr": "Отпечаток ключа GPG, используемого для подписи",
+    "tooltip_salt_b64": "Криптографическая соль для вывода ключа",
+    "tooltip_hkdf_info": "Контекстная строка для вывода ключа HKDF",
+    # Integrity tab (CHG-20251220-002)
+    "label_integrity_status": "Статус целостности:",
+    "tooltip_integrity_status": "Показывает, были ли скрипты проверены по подписанному хешу",
+    # CHG-20251222-014: OS-specific tab tooltip
+    "tooltip_tab_disabled_other_os": "Эта вкладка предназначена для другой операционной системы",
+    "settings_integrity": "Целостность",
+    "settings_integrity_desc": "Проверить целостность программного обеспечения и подписать скрипты.",
+    "integrity_section_title": "🔐 Целостность программного обеспечения",
+    "integrity_instructions": "Проверьте, не были ли скрипты изменены с момента подписи. Подпись требует аппаратный ключ (YubiKey/GPG-карта).",
+    "btn_verify_local": "✓ Проверить целостность (локально)",
+    "btn_sign_scripts": "🔑 Подписать скрипты",
+    "btn_verify_remote": "🌐 Проверить (удаленно)",
+    "integrity_status_ready": "Нажмите 'Проверить' для проверки целостности скриптов.",
+    "integrity_status_checking": "Проверка целостности...",
+    "integrity_status_signing": "Подписание скриптов аппаратным ключом...",
+    "integrity_status_pass": "✅ Целостность подтверждена! Скрипты подлинные.",
+    "integrity_status_fail": "❌ Проверка целостности НЕ ПРОЙДЕНА! Скрипты могли быть изменены.",
+    "integrity_status_no_manifest": "⚠️ Манифест целостности не найден. Скрипты не подписаны.",
+    "integrity_status_sign_success": "✅ Скрипты успешно подписаны!",
+    "integrity_status_sign_fail": "❌ Подпись не удалась. Вставлен ли аппаратный ключ?",
+    "integrity_result_hash": "Хеш: {hash}",
+    "integrity_result_signer": "Подписано: {signer}",
+    "integrity_remote_url_label": "URL сервера:",
+    "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
+    "integrity_status_remote_checking": "Отправка запроса на проверку на сервер...",
+    "integrity_status_remote_success": "✅ Удаленная проверка успешна!",
+    "integrity_status_remote_fail": "❌ Удаленная проверка не удалась: {error}",
+    "integrity_status_no_server_url": "⚠️ URL сервера не настроен. Укажите в Настройки → Целостность.",
+    "label_integrity_server_url": "URL сервера проверки",
+    "tooltip_integrity_server_url": "URL удаленного сервера проверки (напр. https://verify.example.com/api/check)",
+}
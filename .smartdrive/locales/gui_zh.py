@@ -0,0 +1,472 @@
+# locales/gui_zh.py - GUI translation catalog: Chinese
+"""GUI strings for language 'zh' (loaded on first use, see locales/__init__.py)."""
+
+CATALOG = {
+    # Window titles
+    "window_title": "KeyDrive",
+    "settings_window_title": "设置",
+    # Button labels
+    "btn_mount": "🔓 挂载",
+    "btn_unmount": "🔒 卸载",
+    "btn_cancel_auth": "❌ 取消",
+    "btn_confirm_mount": "✅ 确认",
+    "btn_tools": "⚙️",
+    "btn_close": "✕",
+    "btn_save": "保存",
+    "btn_cancel": "取消",
+    "btn_confirm": "确认",
+    "btn_ok": "确定",
+    "warning": "警告",
+    "settings_tab_security": "安全",
+    # CHG-20251223-055: Reload config button for non-modal settings
+    "btn_reload_config": "↻ 重新加载配置",
+    "tooltip_reload_config": "从磁盘重新加载配置（放弃未保存的更改）",
+    # Status messages
+    "status_config_not_found": "未找到配置",
+    "status_volume_mounted": "卷已挂载",
+    "status_volume_not_mounted": "卷未挂载",
+    "status_mounting": "⏳ 正在挂载卷...",
+    "status_mounting_gpg": "⏳ 正在挂载卷（GPG 认证）...",
+    "status_unmounting": "⏳ 正在卸载卷...",
+    "status_mount_success": "✅ 卷挂载成功",
+    "status_mount_failed": "❌ 挂载失败",
+    "status_unmount_success": "✅ 卷卸载成功",
+    "status_unmount_failed": "❌ 卸载失败",
+    # Info labels
+    "info_unavailable": "信息不可用",
+    "keyfile_selected_one": "已选择 1 个密钥文件",
+    "keyfile_selected_many": "已选择 {count} 个密钥文件",
+    "keyfile_drop_hint": "将密钥文件拖到此处或点击浏览",
+    "keyfile_drop_supports_multiple": "支持多个密钥文件",
+    "label_show_password": "显示密码",
+    # Size formatting
+    "size_free": "可用：{size}",
+    # Icons/placeholders
+    "icon_drive": "🚀",
+    # Tooltips
+    "tooltip_exit": "退出 SmartDrive",
+    "tooltip_settings": "高级工具和设置",
+    # Labels
+    "label_product_name": "产品名称",
+    "label_preview": "预览：",
+    "label_password": "密码：",
+    "label_keyfile": "密钥文件：",
+    "label_hardware_key_hint": "💡 认证可能需要硬件密钥",
+    "label_forgot_password": "忘记密码？",
+    # Placeholder text
+    "placeholder_password": "请输入你的 VeraCrypt 密码...",
+    # Menu items
+    "menu_settings": "⚙️ 设置",
+    "menu_rekey": "🔑 更改密码/密钥文件",
+    "menu_update": "⬇️ 更新脚本",
+    "menu_recovery": "💾 恢复工具包",
+    "menu_about": "ℹ️ 关于",
+    "menu_cli": "💻 打开 CLI",
+    "menu_exit": "⏻ 退出",
+    "menu_clear_keyfiles": "清除密钥文件",
+    "menu_switch_drive": "🔀 切换驱动器...",
+    "menu_switch_drive_browse": "📂 浏览...",
+    # CHG-20251221-042: Remote Control Mode menu items (Chinese)
+    "menu_manage_remote": "🌐 远程控制...",
+    "menu_manage_remote_browse": "📂 查找远程 .smartdrive...",
+    "menu_exit_remote": "🏠 退出远程模式",
+    "remote_active_label": "远程控制已激活",
+    "remote_click_to_end": "点击结束",
+    "remote_validation_failed_title": "远程验证失败",
+    "remote_validation_failed_body": "无法连接到远程驱动器:\n\n{error}",
+    "remote_disconnected_title": "远程驱动器已断开",
+    "remote_disconnected_body": "远程驱动器 ({drive}:) 已断开连接。\n\n返回本地模式。",
+    "remote_confirm_title": "进入远程控制模式",
+    "remote_confirm_body": "连接到远程 .smartdrive:\n{path}\n\n在远程模式下，您只能挂载/卸载远程卷。\n设置、更新和 CLI 访问已禁用。",
+    "remote_mode_disabled_title": "远程模式已激活",
+    "remote_mode_disabled_cli": "CLI 访问在远程模式下已禁用。",
+    "remote_mode_disabled_settings": "设置在远程模式下已禁用。请先退出远程模式。",
+    "remote_mode_disabled_update": "更新在远程模式下已禁用。请先退出远程模式。",
+    "dialog_select_keyfiles": "选择密钥文件（可多选）",
+    # Multi-drive context (CHG-20251221-026)
+    "label_launcher_root": "启动驱动器：",
+    "group_drive_context": "驱动器上下文",
+    "tooltip_launcher_root": "包含此 .smartdrive 文件夹的驱动器",
+    # Drive safety context (CHG-20251221-040)
+    "label_os_drive": "系统驱动器：",
+    "tooltip_os_drive": "运行操作系统的驱动器（不可重新分区）",
+    "label_instantiation_drive": "运行自：",
+    "tooltip_instantiation_drive": "启动此实例的驱动器（不可重新分区）",
+    "switch_drive_title": "切换驱动器上下文",
+    "switch_drive_confirm": "切换到来自以下位置的配置：\n{path}\n\n所有设置将从此驱动器重新加载。",
+    "switch_drive_invalid_path": "无效的 .smartdrive 文件夹。未找到 config.json。",
+    "switch_drive_select_folder": "选择 .smartdrive 文件夹",
+    "version_incompatible_title": "版本兼容性警告",
+    "version_incompatible_error": "无法切换到此驱动器：\n\n{message}\n\n配置格式与此软件版本不兼容。",
+    "version_incompatible_warning": "{message}\n\n目标：{path}\n\n是否仍要继续？",
+    # Tray
+    "tray_minimized_message": "正在后台运行。点击托盘图标打开。",
+    "tray_unavailable_message": "系统托盘不可用。\n\n您要退出应用程序吗？",
+    "tray_tooltip": "{name} ({id})",
+    # Status messages
+    "status_deriving_yubikey_password": "正在从 YubiKey 派生密码...",
+    "status_checking_mount": "正在检查挂载状态...",
+    "status_unmounting_for_rekey": "正在卸载卷以更换密钥...",
+    "status_decrypting_keyfile": "正在使用 YubiKey 解密密钥文件...",
+    # Worker messages (keys for structured errors)
+    "worker_mount_script_not_found": "未找到挂载脚本",
+    "worker_mount_success": "卷挂载成功",
+    "worker_mount_failed": "挂载失败：{error}",
+    "worker_mount_timeout": "挂载操作超时",
+    "worker_mount_error": "挂载错误：{error}",
+    "worker_unmount_script_not_found": "未找到卸载脚本",
+    "worker_unmount_success": "卷卸载成功",
+    "worker_unmount_failed": "卸载失败：{error}",
+    "worker_unmount_timeout": "卸载操作超时",
+    "worker_unmount_error": "卸载错误：{error}",
+    # Settings dialog - Tab names
+    "settings_language": "语言",
+    "settings_general": "常规",
+    "settings_security": "安全",
+    "settings_keyfile": "密钥文件",
+    "settings_windows": "Windows",
+    "settings_unix": "Unix",
+    "settings_updates": "更新",
+    "settings_recovery": "恢复",
+    "settings_lost_and_found": "失物招领",
+    "settings_advanced": "高级",
+    # Settings dialog - Tab descriptions
+    "settings_general_desc": "配置显示名称、语言和主题首选项。",
+    "settings_security_desc": "设置安全驱动器的加密模式和身份验证方法。",
+    "settings_keyfile_desc": "管理用于加密和 GPG 身份验证的密钥文件路径。",
+    "settings_windows_desc": "Windows 特定设置，包括挂载盘符和 VeraCrypt 位置。",
+    "settings_unix_desc": "Linux 和 macOS 设置，包括挂载点目录。",
+    "settings_updates_desc": "配置自动更新检查和服务器设置。",
+    "settings_recovery_desc": "设置 Shamir 秘密共享恢复选项，以便在密钥丢失时恢复访问。",
+    "settings_lost_and_found_desc": "在驱动器上显示联系信息，以便丢失时归还。",
+    "settings_advanced_desc": "加密参数和完整性验证的技术设置。",
+    # BUG-20251221-036: Settings dialog - Group box titles (Chinese)
+    "group_drive_identification": "驱动器识别",
+    "group_appearance": "外观",
+    "group_timestamps": "时间戳",
+    "group_security_mode": "安全模式",
+    "group_keyfile_configuration": "密钥文件配置",
+    "group_gpg_configuration": "GPG 配置",
+    "group_emergency_recovery_kit": "紧急恢复套件",
+    "group_verification": "验证",
+    "group_verification_status": "验证状态",
+    "group_software_integrity": "软件完整性",
+    "group_remote_verification": "远程验证",
+    "group_gpg_kdf_parameters": "GPG KDF 参数",
+    "group_metadata": "元数据",
+    "settings_restart_not_required": "✓ 更改已立即应用（无需重启）",
+    "label_mode": "模式",
+    "label_encrypted_keyfile": "加密的密钥文件",
+    "label_volume_path": "卷路径",
+    "label_mount_letter": "挂载盘符",
+    "label_veracrypt_path": "VeraCrypt 路径",
+    "label_mount_point": "挂载点",
+    "label_source_type": "来源类型",
+    "label_server_url": "服务器 URL",
+    "label_local_root": "本地根目录",
+    "error_invalid_mount_letter": "盘符必须是单个 A–Z 字符。",
+    "error_save_failed": "无法保存 config.json：",
+    "title_invalid_mount_letter": "无效盘符",
+    "title_save_failed": "保存失败",
+    "title_error": "错误",
+    "error_apply_theme": "无法应用主题：{error}",
+    "error_apply_language": "无法应用语言：{error}",
+    # Popup dialogs
+    "popup_keyfile_required_title": "需要密钥文件",
+    "popup_keyfile_required_body": "在“密码 + 密钥文件”模式下请选择密钥文件。",
+    "popup_password_required_title": "需要密码",
+    "popup_password_required_body": "请输入你的 VeraCrypt 密码。",
+    "popup_recovery_title": "密码恢复",
+    "popup_recovery_available_body": "此驱动器有可用的恢复工具包！\n\n要恢复对加密卷的访问：\n\n1. 使用 SmartDrive CLI：python smartdrive.py\n2. 选择选项 6：恢复工具包\n3. 按照恢复说明操作\n\n或联系系统管理员。",
+    "popup_recovery_unavailable_body": "此驱动器当前没有可用的恢复工具包。\n\n要设置密码恢复：\n\n1. 使用 SmartDrive CLI：python smartdrive.py\n2. 选择选项 6：恢复工具包\n3. 选择 'Generate Recovery Kit'\n\n或联系系统管理员。",
+    # Recovery tab - Phrase input and recovery actions
+    "recovery_section_title": "🔐 紧急恢复",
+    "recovery_instructions": "输入您的 24 个单词的恢复短语以恢复对加密卷的访问。如果您有恢复容器文件，也可以在这里提供。",
+    "label_recovery_phrase": "恢复短语（24 个单词）：",
+    "placeholder_recovery_phrase": "输入 24 个以空格分隔的单词...",
+    "label_recovery_container": "恢复容器（可选）：",
+    "btn_browse_container": "浏览...",
+    "btn_recover_credentials": "🔓 恢复凭证",
+    "recovery_status_ready": "输入恢复短语并点击「恢复凭证」",
+    "recovery_status_validating": "正在验证恢复短语...",
+    "recovery_status_decrypting": "正在解密恢复容器...",
+    "recovery_status_success": "✅ 恢复成功！凭证已恢复。",
+    "recovery_status_failed": "❌ 恢复失败：{error}",
+    "recovery_result_title": "已恢复的凭证",
+    "recovery_result_password": "密码：",
+    "recovery_result_keyfile": "密钥文件：",
+    "recovery_result_mode": "安全模式：",
+    "recovery_result_copy_password": "📋 复制密码",
+    "recovery_result_save_keyfile": "💾 保存密钥文件",
+    "recovery_copied_to_clipboard": "密码已复制到剪贴板（30 秒后自动清除）",
+    "recovery_keyfile_saved": "密钥文件已保存到：{path}",
+    "recovery_phrase_invalid": "恢复短语无效。请检查全部 24 个单词。",
+    "recovery_container_not_found": "未找到恢复容器。请选择容器文件。",
+    "recovery_no_kit_configured": "此驱动器未配置恢复工具包。",
+    "recovery_generate_first": "请先通过设置或 CLI 生成恢复工具包。",
+    "recovery_already_used": "⚠️ 恢复工具包已被使用。此操作已禁用。",
+    "recovery_status_invalidating": "正在作废恢复工具包...",
+    "recovery_status_complete": "恢复完成。恢复工具包已被永久作废。",
+    "recovery_rekey_required_title": "必须更改凭证",
+    "recovery_rekey_required_body": "恢复成功。出于安全考虑，您现在必须更改密码/密钥文件。\n\n恢复工具包包含的临时凭证现已泄露。\n\n您想现在更改凭证吗？",
+    "recovery_rekey_now": "立即更改凭证",
+    "recovery_rekey_later": "稍后提醒我",
+    "recovery_rekey_skipped_warning": "⚠️ 您跳过了凭证更改。在更改凭证之前，您将无法挂载驱动器。",
+    "mount_blocked_rekey_required_title": "必须更改凭证",
+    "mount_blocked_rekey_required_body": "恢复工具包已被使用，但凭证尚未更改。出于安全考虑，挂载已被阻止。\n\n请使用密钥更改脚本设置新凭证。",
+    "mount_warn_rekey_title": "建议更改凭证",
+    "mount_warn_rekey_body": "恢复工具包最近被使用。强烈建议更改您的凭证。\n\n您想现在更改凭证还是继续挂载？",
+    "label_recovery_status": "恢复工具包状态",
+    "recovery_kit_available": "✅ 可用",
+    "recovery_kit_used": "🚫 已使用（无效）",
+    "recovery_kit_not_configured": "⚪ 未配置",
+    "recovery_html_warning": "HTML 恢复文件仍在驱动器上！打印后请删除以确保安全。",
+    "tooltip_recovery_status": "显示恢复工具包是可用、已使用还是未配置",
+    "rekey_section_title": "🔑 更改凭证",
+    "rekey_instructions": "更改您的 VeraCrypt 容器密码和/或密钥文件。",
+    "rekey_post_recovery_notice": "⚠️ 恢复后：您必须更改凭证才能允许挂载。",
+    "btn_start_rekey": "开始更改凭证...",
+    # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
+    "btn_verify_rekey": "✓ 验证新凭证",
+    "btn_cancel_rekey": "✕ 取消",
+    "rekey_instructions_veracrypt": "VeraCrypt GUI 已打开。在 VeraCrypt 中：\n1. 工具 → 更改卷密码\n2. 选择设备 → 选择您的卷\n3. 输入当前密码（使用上面的「复制旧密码」）\n4. 输入新密码（使用上面的「复制新密码」）\n5. 点击确定\n\n在 VeraCrypt 确认后，点击「验证新凭证」。",
+    "rekey_verifying": "通过挂载测试验证新凭证...",
+    "rekey_verification_success": "✓ 新凭证已验证！正在完成密钥更换...",
+    "rekey_verification_failed": "✕ 验证失败。请检查您的新密码/密钥文件。",
+    "rekey_cancelled": "凭证更改已取消。",
+    # BUG-20251221-039: Copy credential buttons
+    # CHG-20251222-018: Enhanced tooltips for clarity
+    "btn_copy_old_password": "📋 复制旧密码",
+    "btn_copy_new_password": "📋 复制新密码",
+    "tooltip_copy_old_password": "使用现有 GPG seed 派生并复制当前密码。对于 GPG 模式，使用您的硬件密钥。（30秒后自动清除）",
+    "tooltip_copy_old_password_post_recovery": "已禁用：恢复后请使用恢复套件中的密码。GPG seed 可能丢失或损坏。",
+    "tooltip_copy_new_password": "使用上面指定的新 GPG seed 派生并复制新密码。请先生成新的 seed.gpg。（30秒后自动清除）",
+    "rekey_gpg_seed_hint": "对于 GPG 模式：上面的「新 GPG Seed」决定将派生什么密码。先生成新的 seed.gpg，然后使用「复制新密码」。",
+    "copy_password_title": "复制密码",
+    "rekey_status_ready": "准备更改凭证",
+    "rekey_status_preparing": "正在准备更改凭证...",
+    "rekey_status_opening_veracrypt": "正在打开 VeraCrypt GUI...",
+    "rekey_status_awaiting_confirmation": "等待确认密码更改...",
+    "rekey_status_verifying": "正在验证新凭证...",
+    "rekey_validating": "正在验证新凭证...",
+    "rekey_verifying_mount": "通过挂载验证凭证...",
+    "rekey_credentials_verified": "新凭证验证成功！",
+    "rekey_testing_mount": "正在测试新凭证挂载...",
+    "rekey_validation_success": "验证成功 - 正在卸载...",
+    "rekey_status_success": "✅ 凭证更改成功",
+    "rekey_status_failed": "❌ 凭证更改失败：{error}",
+    "btn_verify_rekey": "确认更改已完成",
+    "rekey_current_password_label": "当前密码：",
+    "rekey_current_password_auto": "（自动检测）",
+    "rekey_new_password_label": "新密码：",
+    "rekey_confirm_password_label": "确认密码：",
+    "rekey_current_mode_label": "当前安全模式：",
+    "rekey_target_mode_label": "新安全模式：",
+    "rekey_mode_same_tooltip": "保持当前安全模式",
+    "rekey_mode_pw_only": "🔒 仅密码",
+    "rekey_mode_pw_keyfile": "🔑 密码 + 密钥文件",
+    "rekey_mode_pw_gpg_keyfile": "🛡️ 密码 + GPG派生密钥文件",
+    "rekey_mode_gpg_pw_only": "🔐 GPG派生密码（只读）",
+    "rekey_new_keyfile_label": "新密钥文件路径：",
+    "rekey_new_gpg_seed_label": "新GPG种子路径：",
+    "btn_browse_keyfile": "浏览...",
+    # CHG-20251221-003: GPG seed generation button
+    "btn_generate_gpg_seed": "生成",
+    "tooltip_generate_gpg_seed": "生成新的GPG加密种子用于密码派生。需要YubiKey/GPG卡。",
+    "gpg_seed_generate_title": "生成GPG种子",
+    "gpg_seed_generate_confirm": "这将生成一个新的加密安全种子，并使用您的GPG密钥对其进行加密。\n\n请确保您的YubiKey/GPG卡已插入。\n\n继续？",
+    "gpg_seed_generate_success": "GPG种子生成成功！",
+    "gpg_seed_generate_fail": "生成GPG种子失败",
+    "gpg_seed_derive_info": "将显示从此种子派生的密码。\n复制它以用作您的新VeraCrypt密码。",
+    # CHG-20251223-032: Multi-key authentication
+    "gpg_key_auth_title": "验证GPG密钥",
+    "gpg_key_auth_prompt": "为确保您有权访问此密钥，请进行身份验证。\n\n密钥：{fingerprint}\n\n可能需要输入PIN码。",
+    "gpg_key_auth_success": "密钥验证成功。",
+    "gpg_key_auth_fail": "密钥验证失败：{fingerprint}",
+    "gpg_key_auth_skip_prompt": "是否跳过此密钥的验证？\n\n⚠️ 警告：如果跳过，您可能会配置一个您不拥有的密钥。\n当您将访问权限委托给他人时，这是可以接受的。",
+    "gpg_key_auth_skipped": "跳过密钥验证：{fingerprint}",
+    # CHG-20251221-008: GPG key selection dialog
+    "gpg_key_select_title": "选择用于加密的GPG密钥",
+    "gpg_key_select_hint": "从下面的列表中选择硬件密钥，或者如果您的密钥未列出，请手动输入指纹或电子邮件。",
+    "gpg_key_select_label": "GPG密钥：",
+    "gpg_key_select_placeholder": "选择或输入密钥...",
+    "gpg_key_select_manual": "手动输入...",
+    "gpg_key_select_none": "未找到GPG私钥",
+    "gpg_key_manual_label": "输入指纹或电子邮件：",
+    # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
+    "gpg_key_select_hint_multi": "从下面的列表中选择一个或多个硬件密钥以实现冗余。\n您也可以手动输入其他指纹（用逗号或换行符分隔）。",
+    "gpg_key_manual_label_multi": "其他指纹：",
+    "gpg_key_select_placeholder_multi": "输入指纹（用逗号或换行符分隔）...",
+    "gpg_key_select_none_selected": "请至少选择一个GPG密钥或手动输入指纹。",
+    "rekey_mode_change_warning": "⚠️ 更改安全模式需要额外验证",
+    "rekey_gpg_seed_instructions": "请连接您的 YubiKey 并输入 GPG 种子文件路径。",
+    "popup_unmount_failed_title": "卸载失败",
+    "popup_mount_failed_title": "挂载失败",
+    "popup_update_not_possible_title": "无法更新",
+    "popup_update_confirm_title": "确认更新",
+    "popup_update_direction": "方向",
+    "popup_update_source": "源",
+    "popup_update_destination": "目标",
+    "popup_update_files_to_update": "要更新的文件",
+    "popup_update_protected_items": "受保护的项目（永不覆盖）",
+    "popup_update_protected_list": "以下用户数据将自动受到保护：{items}",
+    "popup_update_warning": "警告",
+    "popup_update_warning_body": "这将覆盖 .smartdrive/ 目录中的现有脚本文件。",
+    "popup_update_confirm_message": "即将运行 UPDATE ({direction}).\n\n来源:\n  {src_root}\n\n目标:\n  {dst_root}\n\n项目:\n  - {items}\n\n方式: {method}\n\n这将覆盖现有文件。继续？",
+    "popup_update_config_title": "更新配置",
+    "popup_update_config_body": "未配置更新来源。请在设置中进行配置。",
+    "popup_update_complete_title": "更新完成",
+    "popup_update_complete_body": "更新成功完成。请重启应用程序。",
+    "popup_update_failed_title": "更新失败",
+    "popup_update_failed_body": "更新失败：\n\n{error}",
+    "popup_update_timeout_title": "更新超时",
+    "popup_update_timeout_body": "更新在 120 秒内未完成。",
+    "popup_update_error_title": "更新错误",
+    "popup_update_error_body": "无法运行更新：\n\n{error}",
+    "popup_cli_failed_title": "CLI 启动失败",
+    "popup_cli_failed_body": "无法打开 CLI：\n\n{error}",
+    # Update configuration error messages
+    "error_update_server_url_not_configured": "未配置服务器 URL。\n\n请前往设置配置更新 URL。",
+    "error_update_local_root_not_configured": "未配置本地更新目录。\n\n请前往设置配置本地更新根目录。",
+    "error_update_local_root_not_found": "未找到本地更新目录：\n\n{path}\n\n请检查设置以验证路径。",
+    "error_update_install_dir_not_found": "未找到安装目录：\n\n{path}",
+    "error_update_unknown_source_type": "未知的更新来源类型：{type}",
+    # Hardware key error messages
+    "error_hardware_key_missing_title": "需要硬件密钥",
+    "error_hardware_key_missing_body": "未检测到硬件密钥（YubiKey/GPG 卡）。请插入硬件密钥后重试。",
+    # Theme names (for theme dropdown)
+    "theme_brand": "品牌",
+    "theme_green": "绿色",
+    "theme_blue": "蓝色",
+    "theme_rose": "玫瑰",
+    "theme_slate": "石板",
+    "label_theme": "主题",
+    # File explorer buttons
+    "tooltip_open_launcher_drive": "打开启动器驱动器",
+    "tooltip_open_mounted_volume": "打开已挂载的卷",
+    "popup_open_failed_title": "打开失败",
+    "popup_open_failed_body": "无法打开文件管理器:\n\n{path}\n\n{error}",
+    # About section (CHG-20251221-012)
+    "settings_about": "关于",
+    "label_version": "版本：",
+    "label_build_id": "构建 ID：",
+    "label_build_dev": "开发版",
+    "label_compat_version": "配置版本：",
+    # Recovery kit generation (CHG-20251221-001)
+    "recovery_generate_section_title": "生成恢复工具包",
+    "recovery_generate_instructions": "生成新的恢复工具包以创建您凭据的加密备份。如果您的原始工具包丢失、损坏或您希望在更改凭据后获得新副本，这将很有用。",
+    "btn_generate_recovery_kit": "🔐 生成新的恢复工具包",
+    "recovery_generate_status_ready": "点击「生成新的恢复工具包」以创建新工具包。",
+    "recovery_generate_status_deriving": "正在从硬件密钥派生凭据...",
+    "recovery_generate_status_verifying": "正在使用VeraCrypt验证凭据...",
+    "recovery_generate_status_running": "正在生成恢复工具包...",
+    "recovery_generate_status_success": "✅ 恢复工具包生成成功！",
+    "recovery_generate_status_failed": "❌ 恢复工具包生成失败：{error}",
+    "recovery_generate_confirm_title": "生成恢复工具包",
+    "recovery_generate_confirm_body": "这将生成一个新的恢复工具包，其中包含您凭据的加密备份。\n\n是否继续？",
+    "recovery_generate_regen_confirm_title": "重新生成恢复工具包",
+    "recovery_generate_regen_confirm_body": "⚠️ 警告：这将创建一个新的恢复工具包。\n\n您的现有恢复工具包将被永久失效。\n\n是否继续？",
+    "recovery_generate_security_warning_title": "安全警告：重新生成恢复工具包",
+    "recovery_generate_security_warning_body": "⚠️ 安全警告 ⚠️\n\n恢复工具包已经存在。创建新的将:\n\n• 使之前的工具包失效\n• 创建访问加密数据的新路径\n• 任何拥有新工具包的人都可以访问您的数据\n\n只有在理解安全影响时才继续。\n\n您要重新生成吗？",
+    "recovery_generate_password_prompt_title": "输入卷密码",
+    "recovery_generate_password_prompt_body": "请输入您的卷密码以生成恢复工具包：",
+    "recovery_generate_success_title": "恢复工具包已生成",
+    "recovery_generate_success_body": "您的恢复工具包已生成！\n\n位置：{path}\n\n⚠️ 重要：\n• 立即打印 HTML 文件\n• 存放在安全的物理位置\n• 打印后从驱动器中删除 HTML 文件",
+    # Settings dialog - Additional fields (schema-driven UI)
+    "label_drive_id": "驱动器 ID",
+    "label_drive_name": "驱动器名称",
+    "label_setup_date": "设置日期",
+    "label_last_password_change": "上次密码更改",
+    "label_last_verified": "上次验证",
+    "label_plain_keyfile": "普通密钥文件",
+    "label_seed_gpg_path": "GPG 种子文件",
+    "label_kdf": "密钥派生函数",
+    "label_pw_encoding": "密码编码",
+    "label_recovery_enabled": "启用恢复工具包",
+    "label_recovery_share_count": "恢复份额数量",
+    "label_recovery_threshold": "恢复阈值",
+    "label_lost_and_found_enabled": "启用失物招领消息",
+    "label_lost_and_found_message": "返回消息",
+    "label_verification_overridden": "已覆盖验证",
+    "label_integrity_signed": "完整性已签名",
+    "label_signing_key_fpr": "签名密钥指纹",
+    "label_salt_b64": "盐（Base64）",
+    "label_hkdf_info": "HKDF 信息",
+    "label_schema_version": "模式版本",
+    "label_version": "版本",
+    # Tooltips for settings fields
+    "tooltip_drive_id": "此驱动器的唯一标识符（只读）",
+    "tooltip_drive_name": "此驱动器的自定义名称",
+    "tooltip_language": "用户界面语言",
+    "tooltip_theme": "界面配色方案",
+    "tooltip_mode": "安全模式：仅密码、密钥文件或 YubiKey/GPG",
+    "tooltip_encrypted_keyfile": "GPG 加密的密钥文件路径（用于 GPG 模式）",
+    "tooltip_plain_keyfile": "未加密的密钥文件路径（用于普通密钥文件模式）",
+    "tooltip_seed_gpg_path": "用于密码派生的 GPG 种子文件路径",
+    "tooltip_kdf": "GPG 密码模式的密钥派生函数",
+    "tooltip_pw_encoding": "密码的字符编码（推荐 UTF-8）",
+    "tooltip_windows_volume_path": "Windows 卷 GUID 或设备路径",
+    "tooltip_mount_letter": "挂载为驱动器号（A-Z）",
+    "tooltip_veracrypt_path": "VeraCrypt.exe 可执行文件的路径",
+    "tooltip_unix_volume_path": "Unix 设备路径（例如 /dev/sdb2）",
+    "tooltip_mount_point": "Unix 挂载点目录",
+    "tooltip_recovery_enabled": "启用紧急恢复工具包生成",
+    "tooltip_recovery_share_count": "要生成的恢复份额数量",
+    "tooltip_recovery_threshold": "恢复所需的最少份额数",
+    "tooltip_lost_and_found_enabled": "如果驱动器丢失，启用返回消息",
+    "tooltip_lost_and_found_message": "找到驱动器时显示的消息",
+    "tooltip_source_type": "更新源：本地目录或服务器 URL",
+    "tooltip_server_url": "更新的服务器 URL",
+    "tooltip_local_root": "包含更新文件的本地目录",
+    "hint_update_local_title": "关于本地更新",
+    "hint_update_local_body": "选择：(1) 包含 .smartdrive/ 文件夹的目录（例如 H:\\ 或 C:\\我的开发\\)，或 (2) 直接选择 .smartdrive/ 文件夹。系统将自动检测 .smartdrive/。用户数据（recovery/、keys/、integrity/、config.json）将自动受到保护。开发文件（.git、测试、helper/）将被排除。",
+    # CHG-20251222-016: Update action section i18n keys
+    "update_action_section_title": "更新操作",
+    "btn_run_update": "执行更新",
+    "tooltip_run_update": "从配置的源执行更新",
+    "label_last_update": "上次更新：",
+    "label_last_update_source": "来源：",
+    "update_never": "从未",
+    "update_source_none": "未配置",
+    "tooltip_verification_overridden": "绕过完整性验证（危险！）",
+    "tooltip_integrity_signed": "驱动器完整性已进行加密签名",
+    "tooltip_signing_key_fpr": "用于签名的 GPG 密钥指纹",
+    "tooltip_salt_b64": "用于密钥派生的加密盐",
+    "tooltip_hkdf_info": "HKDF 密钥派生的上下文字符串",
+    # Integrity tab (CHG-20251220-002)
+    "label_integrity_status": "完整性状态：",
+    "tooltip_integrity_status": "显示脚本是否已根据签名哈希进行验证",
+    # CHG-20251222-014: OS-specific tab tooltip
+    "tooltip_tab_disabled_other_os": "此选项卡适用于其他操作系统",
+    "settings_integrity": "完整性",
+    "settings_integrity_desc": "验证软件完整性并签名脚本。",
+    "integrity_section_title": "🔐 软件完整性",
+    "integrity_instructions": "验证脚本自签名以来是否被修改。签名需要硬件密钥（YubiKey/GPG卡）。",
+    "btn_verify_local": "✓ 验证完整性（本地）",
+    "btn_sign_scripts": "🔑 签名脚本",
+    "btn_verify_remote": "🌐 验证（远程）",
+    "integrity_status_ready": "点击'验证'检查脚本完整性。",
+    "integrity_status_checking": "正在验证完整性...",
+    "integrity_status_signing": "正在使用硬件密钥签名脚本...",
+    "integrity_status_pass": "✅ 完整性已验证！脚本是真实的。",
+    "integrity_status_fail": "❌ 完整性验证失败！脚本可能已被修改。",
+    "integrity_status_no_manifest": "⚠️ 未找到完整性清单。脚本未签名。",
+    "integrity_status_sign_success": "✅ 脚本签名成功！",
+    "integrity_status_sign_fail": "❌ 签名失败。硬件密钥是否已插入？",
+    "integrity_result_hash": "哈希：{hash}",
+    "integrity_result_signer": "签名者：{signer}",
+    "integrity_remote_url_label": "服务器 URL：",
+    "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
+    "integrity_status_remote_checking": "正在向服务器发送验证请求...",
+    "integrity_status_remote_success": "✅ 远程验证成功！",
+    "integrity_status_remote_fail": "❌ 远程验证失败：{error}",
+    "integrity_status_no_server_url": "⚠️ 未配置服务器URL。请在设置 → 完整性中设置。",
+    "label_integrity_server_url": "验证服务器URL",
+    "tooltip_integrity_server_url": "远程验证服务器的URL（例如 https://verify.example.com/api/check）",
+    # BUG-20251221-037: Mount point fallback (Chinese)
+    "label_allow_mount_fallback": "允许挂载点回退",
+    "tooltip_allow_mount_fallback": "如果首选挂载点被占用，自动尝试备用挂载点",
+    "error_mount_point_occupied_fallback_disabled": "挂载点 {mount_point} 被占用。\n\n已禁用自动回退。在设置中启用「允许挂载点回退」以自动尝试备用位置。\n\n这不是凭据问题——您的密码/密钥文件正确，但挂载位置不可用。",
+    "error_mount_point_all_occupied": "在 {max_attempts} 次尝试后，所有挂载点都被占用。\n\n已尝试位置：{attempted}\n\n请手动释放其中一个位置或指定其他挂载点。\n\n这不是凭据问题——您的密码/密钥文件正确，但没有可用的挂载位置。",
+    "warning_mount_fallback_used": "挂载点 {original} 被占用，已使用 {fallback}",
+}
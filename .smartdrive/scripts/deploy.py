@@ -9,6 +9,7 @@ Usage:
     python deploy.py                              # Interactive deployment
     python deploy.py --drive G                    # Deploy to Windows drive G:
     python deploy.py --drive /media/user/USBDrive # Deploy to Linux/macOS mount point
+    python deploy.py --drive G --clean            # Wipe .smartdrive instead of syncing changes
 """
 
 import json
@@ -58,6 +59,7 @@ from core.paths import Paths
 from core.platform import get_platform as _get_platform
 from core.platform import is_windows as _is_windows
 from core.platform import windows_create_shortcut, windows_set_attributes
+from core.sync import ACTION_SKIP, apply_sync, has_manifest, plan_sync
 
 # Get product name from variables (optional)
 try:
@@ -340,6 +342,22 @@ PAYLOAD_MANIFEST = {
             ("secrets.py", "Secrets management", True),
             ("settings_schema.py", "Settings schema definitions", True),
             ("tray.py", "System tray support", True),
+            ("mount_monitor.py", "Event-driven mount-state monitor", True),
+            ("drive_health.py", "Remote-drive health checks", True),
+            ("gpg_session.py", "gpg-agent/scdaemon warm-up", True),
+            ("card_presence.py", "Cached smartcard presence", True),
+            ("tool_cache.py", "Persistent tool discovery cache", True),
+            ("mount_inventory.py", "Shared VeraCrypt mount inventory", True),
+            ("ephemeral_keyfile.py", "memfd-backed ephemeral keyfiles", True),
+            ("hashing.py", "Parallel directory hashing", True),
+            ("download.py", "Resumable, verifying update downloads", True),
+            ("update_delta.py", "Delta update package verification", True),
+            ("sync.py", "Manifest-driven incremental sync", True),
+            ("copier.py", "Parallel copy pipeline", True),
+            ("zipstream.py", "Filtering, verifying update extraction", True),
+            ("snapshot.py", "Update rollback snapshots", True),
+            ("bytecode.py", "Precompiled bytecode bundles", True),
+            ("startup_profile.py", "Startup profiling (--profile-startup)", True),
         ],
         "critical": True,  # Abort deployment if any missing
     },
@@ -353,6 +371,7 @@ PAYLOAD_MANIFEST = {
             (FileNames.CLI_I18N_PY, "CLI internationalization", False),  # Optional
             (FileNames.MOUNT_PY, "Volume mounting", True),
             (FileNames.UNMOUNT_PY, "Volume unmounting", True),
+            (FileNames.MOUNT_SERVICE_PY, "Persistent mount service", True),
             (FileNames.KEYFILE_PY, "Keyfile management", True),
             (FileNames.RECOVERY_PY, "Recovery kit generation", True),
             (FileNames.RECOVERY_CONTAINER_PY, "Recovery crypto container", True),
@@ -367,6 +386,16 @@ PAYLOAD_MANIFEST = {
         ],
         "critical": False,  # Warn but continue if non-required missing
     },
+    # Translation catalogs, one module per language (CHG-20261016-019)
+    # English is the fallback for every key; other languages degrade to it
+    "locales": {
+        "files": [
+            ("__init__.py", "Lazy translation catalog loader", True),
+            ("gui_en.py", "GUI strings (English, fallback)", True),
+            ("cli_en.py", "CLI strings (English, fallback)", True),
+        ],
+        "critical": True,
+    },
     # Static assets
     "static": {
         "files": [
@@ -429,7 +458,77 @@ def verify_deployed_layout(smartdrive_dir: Path) -> tuple[bool, list[str]]:
     return (len(missing) == 0, missing)
 
 
-def deploy_to_drive(target_drive):
+def _collect_payload_sources(missing_core: list) -> dict:
+    """
+    Map every payload file to its source in the repo.
+
+    CHG-20261016-011: Feeds the incremental sync plan.
+
+    Args:
+        missing_core: Receives names of required core modules not found
+
+    Returns:
+        Path relative to .smartdrive/ (POSIX) -> source file
+    """
+    sources = {}
+
+    # SSOT core modules (MANDATORY - per AGENT_ARCHITECTURE.md §3)
+    for core_file, _, _ in PAYLOAD_MANIFEST.get("core", {}).get("files", []):
+        src = REPO_SMARTDRIVE / "core" / core_file
+        if src.exists():
+            sources[f"core/{core_file}"] = src
+        else:
+            missing_core.append(core_file)
+
+    # Runtime scripts 1:1 (PAYLOAD_MANIFEST as SSOT)
+    for script, _, _ in PAYLOAD_MANIFEST.get("scripts", {}).get("files", []):
+        src = REPO_SMARTDRIVE / "scripts" / script
+        if src.exists():
+            sources[f"{Paths.SCRIPTS_SUBDIR}/{script}"] = src
+        else:
+            print(f"  ⚠ {script} not found")
+
+    # Docs into .smartdrive/docs (drive root must contain entrypoints only)
+    for doc in (FileNames.README, FileNames.GUI_README):
+        src = REPO_ROOT / doc
+        if src.exists():
+            sources[f"docs/{doc}"] = src
+
+    # CHG-20251229-002: requirements.txt for platform-independent dependency installation
+    req_src = REPO_SMARTDRIVE / FileNames.REQUIREMENTS_TXT
+    if req_src.exists():
+        sources[FileNames.REQUIREMENTS_TXT] = req_src
+        _log_deploy("deploy.requirements.found", file=FileNames.REQUIREMENTS_TXT)
+    else:
+        print(f"  ⚠ {FileNames.REQUIREMENTS_TXT} not found (dependency bootstrap may fail)")
+        _log_deploy("deploy.requirements.notfound", source=str(req_src))
+
+    # Compiled GUI executable into .smartdrive/scripts (preferred Windows entrypoint)
+    exe_src = REPO_ROOT / "dist" / f"{PRODUCT_NAME}GUI.exe"
+    if exe_src.exists():
+        sources[f"{Paths.SCRIPTS_SUBDIR}/{exe_src.name}"] = exe_src
+        _log_deploy("deploy.executable.found", file=exe_src.name)
+    else:
+        print(f"  ⚠ {PRODUCT_NAME}GUI.exe not found in dist/ (run PyInstaller first)")
+        _log_deploy("deploy.executable.notfound", file=exe_src.name)
+
+    # Translation catalogs (CHG-20261016-019), static assets (MANDATORY - icons,
+    # images) and tests (BUG-20251221-032: post-deployment verification runs
+    # against deployed code)
+    for tree in (Paths.LOCALES_SUBDIR, "static", "tests"):
+        tree_src = REPO_SMARTDRIVE / tree
+        if not tree_src.exists():
+            print(f"  ⚠ {tree}/ directory not found")
+            _log_deploy(f"deploy.{tree}.notfound", source=str(tree_src))
+            continue
+        for item in tree_src.rglob("*"):
+            if item.is_file() and "__pycache__" not in item.parts:
+                sources[f"{tree}/{item.relative_to(tree_src).as_posix()}"] = item
+
+    return sources
+
+
+def deploy_to_drive(target_drive, clean: bool = False):
     """
     Deploy KeyDrive to the specified drive.
 
@@ -438,10 +537,13 @@ def deploy_to_drive(target_drive):
 
     Args:
         target_drive: Windows drive letter (e.g., 'G') or Path to mount point
+        clean: Wipe the existing .smartdrive first instead of syncing incrementally
 
     BUG-20260102-010: Now cleans up existing .smartdrive before deployment
     BUG-20260102-011: Shell scripts written with Unix line endings
     BUG-20260102-012: Uses OS-specific venv directory names
+    CHG-20261016-011: Re-deployment onto a drive with a sync manifest copies only
+        changed files and removes files dropped from the payload (user data kept)
     """
     # Normalize target_drive to Path (cross-platform support)
     if isinstance(target_drive, Path):
@@ -454,8 +556,9 @@ def deploy_to_drive(target_drive):
         target_path = Path(target_drive)
 
     # BUG-20260102-010: Clean up existing .smartdrive to prevent storage accumulation
+    # CHG-20261016-011: Drives deployed with a sync manifest are pruned incrementally instead
     existing_smartdrive = target_path / ".smartdrive"
-    if existing_smartdrive.exists():
+    if existing_smartdrive.exists() and (clean or not has_manifest(existing_smartdrive)):
         if not _cleanup_existing_smartdrive(existing_smartdrive):
             print("⚠️  Warning: Could not fully clean existing deployment.")
             print("    Deployment will continue, but some old files may remain.")
@@ -463,10 +566,6 @@ def deploy_to_drive(target_drive):
     # Create RuntimePaths for target (SSOT)
     target_paths = RuntimePaths.for_target(target_path, create_dirs=True)
 
-    # Source directories from repo's canonical .smartdrive structure
-    src_core = REPO_SMARTDRIVE / "core"
-    src_scripts = REPO_SMARTDRIVE / "scripts"
-
     _log_deploy("deploy.start", target=str(target_path), source=str(REPO_SMARTDRIVE))
 
     print(f"\n🚀 Deploying {PRODUCT_NAME} to {target_path}")
@@ -484,41 +583,60 @@ def deploy_to_drive(target_drive):
     target_keys.mkdir(parents=True, exist_ok=True)
     _log_deploy("deploy.directories.created")
 
-    # Copy SSOT core modules 1:1 (MANDATORY - per AGENT_ARCHITECTURE.md §3)
-    print("🔧 Copying SSOT core modules...")
-    # Extract core files from PAYLOAD_MANIFEST (SSOT)
-    core_manifest = PAYLOAD_MANIFEST.get("core", {}).get("files", [])
-    core_files = [fname for fname, _, _ in core_manifest]
+    # CHG-20261016-011: Incremental sync of the payload (core, scripts, docs,
+    # requirements.txt, GUI executable, static/, tests/)
+    print("🔧 Planning payload sync...")
     missing_core = []
-    for core_file in core_files:
-        src = src_core / core_file
-        dst = target_core / core_file
-        if src.exists():
-            shutil.copy2(src, dst)
-            print(f"  ✓ core/{core_file}")
-        else:
-            missing_core.append(core_file)
-            print(f"  ❌ core/{core_file} MISSING")
+    sources = _collect_payload_sources(missing_core)
+    for core_file in missing_core:
+        print(f"  ❌ core/{core_file} MISSING")
 
     if missing_core:
         print(f"\n❌ FATAL: Missing SSOT core modules: {missing_core}")
         print("   Deployment ABORTED. core/* modules are required per AGENT_ARCHITECTURE.md.")
         return False
 
-    # Copy runtime scripts 1:1 (use PAYLOAD_MANIFEST as SSOT)
-    print("📋 Copying scripts...")
-    # Extract script files from manifest
-    script_manifest = PAYLOAD_MANIFEST.get("scripts", {}).get("files", [])
-    script_files = [fname for fname, _, _ in script_manifest]
+    plan = plan_sync(sources, target_paths.smartdrive_root)
+    _log_deploy(
+        "deploy.sync.plan",
+        pending=len(plan.pending),
+        unchanged=plan.count(ACTION_SKIP),
+        target_hashed=plan.target_hashed,
+    )
+    print(f"📋 Copying {len(plan.pending)} changed files ({plan.count(ACTION_SKIP)} unchanged)...")
+
+    # CHG-20261016-012: Parallel copies, one sync barrier per directory batch
+    def _report(action, stats):
+        if stats is None:
+            print(f"  ✗ {action.rel} (removed)")
+            _log_deploy("deploy.sync.deleted", file=action.rel)
+            return
+        print(f"  ✓ {action.rel}")
+        _log_deploy("deploy.sync.file", file=action.rel, bytes=stats.bytes, mb_s=f"{stats.mb_per_s:.2f}")
+
+    sync_result = apply_sync(plan, on_action=_report)
+    _log_deploy(
+        "deploy.sync.complete",
+        copied=len(sync_result.copied),
+        deleted=len(sync_result.deleted),
+        skipped=sync_result.skipped,
+        errors=len(sync_result.errors),
+        bytes=sync_result.bytes_copied,
+        mb_s=f"{sync_result.mb_per_s:.2f}",
+    )
+    if sync_result.errors:
+        for rel, message in sync_result.errors.items():
+            print(f"  ❌ {rel}: {message}")
+        print("\n❌ Deployment ABORTED: payload files could not be written.")
+        return False
 
-    for script in script_files:
-        src = src_scripts / script
-        dst = target_scripts / script
-        if src.exists():
-            shutil.copy2(src, dst)
-            print(f"  ✓ {script}")
-        else:
-            print(f"  ⚠ {script} not found")
+    # CHG-20261016-016: Precompiled bytecode so launches from the drive skip compilation
+    print("⚡ Building bytecode bundles...")
+    from core.bytecode import build_bundles
+
+    for bundle in build_bundles(target_paths.smartdrive_root):
+        print(f"  ✓ {bundle.name}")
+        _log_deploy("deploy.bytecode.built", bundle=bundle.name)
 
     # Copy keys (if they exist in repo)
     print("🔑 Copying keys...")
@@ -531,75 +649,6 @@ def deploy_to_drive(target_drive):
     else:
         print("  ℹ No keys directory found (expected for deployment)")
 
-    # Copy docs into .smartdrive/docs (drive root must contain entrypoints only)
-    print("📖 Copying documentation...")
-    docs_dst = target_paths.smartdrive_root / "docs"
-    docs_dst.mkdir(parents=True, exist_ok=True)
-    readme_src = REPO_ROOT / FileNames.README
-    gui_readme_src = REPO_ROOT / FileNames.GUI_README
-    if readme_src.exists():
-        shutil.copy2(readme_src, docs_dst / FileNames.README)
-        print(f"  ✓ {FileNames.README}")
-    if gui_readme_src.exists():
-        shutil.copy2(gui_readme_src, docs_dst / FileNames.GUI_README)
-        print(f"  ✓ {FileNames.GUI_README}")
-
-    # CHG-20251229-002: Copy requirements.txt for platform-independent dependency installation
-    print("📦 Copying requirements.txt for dependency bootstrap...")
-    req_src = REPO_SMARTDRIVE / FileNames.REQUIREMENTS_TXT
-    req_dst = target_paths.smartdrive_root / FileNames.REQUIREMENTS_TXT
-    if req_src.exists():
-        shutil.copy2(req_src, req_dst)
-        print(f"  ✓ {FileNames.REQUIREMENTS_TXT}")
-        _log_deploy("deploy.requirements.copied", file=FileNames.REQUIREMENTS_TXT)
-    else:
-        print(f"  ⚠ {FileNames.REQUIREMENTS_TXT} not found (dependency bootstrap may fail)")
-        _log_deploy("deploy.requirements.notfound", source=str(req_src))
-
-    # Copy the compiled GUI executable into .smartdrive/scripts (preferred Windows entrypoint)
-    exe_src = REPO_ROOT / "dist" / f"{PRODUCT_NAME}GUI.exe"
-    exe_dst = target_scripts / f"{PRODUCT_NAME}GUI.exe"
-    if exe_src.exists():
-        shutil.copy2(exe_src, exe_dst)
-        print(f"  ✓ {PRODUCT_NAME}GUI.exe copied")
-        _log_deploy("deploy.executable.copied", file=f"{PRODUCT_NAME}GUI.exe")
-    else:
-        print(f"  ⚠ {PRODUCT_NAME}GUI.exe not found in dist/ (run PyInstaller first)")
-        _log_deploy("deploy.executable.notfound", file=f"{PRODUCT_NAME}GUI.exe")
-
-    # Copy static assets (MANDATORY - icons, images per AGENT_ARCHITECTURE.md)
-    # Use PathResolver canonical static path (SSOT)
-    # After restructure: static/ is inside .smartdrive/, not at repo root
-    print("🎨 Copying static assets...")
-    static_src = REPO_SMARTDRIVE / "static"  # .smartdrive/static/
-    static_dst = target_paths.static_dir  # SSOT from PathResolver
-    if static_src.exists():
-        shutil.copytree(static_src, static_dst, dirs_exist_ok=True)
-        # Count files for logging
-        static_files = list(static_dst.rglob("*"))
-        file_count = sum(1 for f in static_files if f.is_file())
-        print(f"  ✓ static/ directory copied ({file_count} files)")
-        _log_deploy("deploy.static.copied", path=str(static_dst), file_count=file_count)
-    else:
-        print("  ⚠ static/ directory not found")
-        _log_deploy("deploy.static.notfound", source=str(static_src))
-
-    # BUG-20251221-032: Copy tests directory for post-deployment verification
-    # Tests MUST be deployed to target so verification runs against deployed code
-    print("🧪 Copying tests...")
-    tests_src = REPO_SMARTDRIVE / "tests"  # .smartdrive/tests/
-    tests_dst = target_paths.smartdrive_root / "tests"  # target/.smartdrive/tests/
-    if tests_src.exists():
-        shutil.copytree(tests_src, tests_dst, dirs_exist_ok=True)
-        # Count files for logging
-        test_files = list(tests_dst.rglob("*.py"))
-        file_count = len(test_files)
-        print(f"  ✓ tests/ directory copied ({file_count} test files)")
-        _log_deploy("deploy.tests.copied", path=str(tests_dst), file_count=file_count)
-    else:
-        print("  ⚠ tests/ directory not found (tests will not be deployed)")
-        _log_deploy("deploy.tests.notfound", source=str(tests_src))
-
     # CHG-20260103-001: Virtual environments are NOT copied during deployment
     # They are auto-created and dependencies installed on first startup via bootstrap_dependencies.py
     # This reduces deployment size and ensures each OS creates its own compatible venv
@@ -776,7 +825,7 @@ def main():
             print("❌ Deployment cancelled.")
             sys.exit(0)
 
-    success = deploy_to_drive(target_drive)
+    success = deploy_to_drive(target_drive, clean="--clean" in sys.argv)
     if success:
         print("\n🎉 Ready to test! Run the launcher and configure config.json for your setup.")
         sys.exit(0)
@@ -73,14 +73,19 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 # Import i18n module for translations
-from gui_i18n import AVAILABLE_LANGUAGES, TRANSLATIONS, tr
+from gui_i18n import AVAILABLE_LANGUAGES, TRANSLATIONS, TranslationBindings, tr
 
 from core.config import get_drive_id, load_or_create_config, write_config_atomic
 from core.constants import Branding, ConfigKeys, FileNames, GUIConfig
+from core.drive_health import DriveHealthMonitor, create_qt_health_signal
+from core.gpg_session import warm_up_for_mode
 from core.limits import Limits
 from core.modes import SecurityMode
+from core.mount_inventory import get_mount_inventory
+from core.mount_monitor import create_qt_mount_signal, get_mount_monitor
 from core.paths import Paths
 from core.single_instance import SingleInstanceManager, check_single_instance
+from core.startup_profile import finish as finish_startup_profile
 from core.tray import TrayIconManager, is_tray_available
 
 # Import from core modules (single source of truth)
@@ -651,65 +656,13 @@ def check_mount_status_veracrypt() -> bool:
 
     BUG-20260102-014: Now handles both Windows and Linux/macOS mount detection.
     - Windows: Checks configured mount letter (e.g., V:/)
-    - Linux/macOS: Checks configured mount point using mountpoint command or directory iteration
+    - Linux/macOS: Checks configured mount point against the kernel mount table
+
+    CHG-20261016-001: Delegates to the shared MountMonitor. While the monitor runs
+    this returns its cached state; no config re-read and no `mountpoint` subprocess.
     """
     try:
-        import json
-        import platform
-        import subprocess
-        from pathlib import Path
-
-        if not CONFIG_FILE.exists():
-            return False
-
-        with open(CONFIG_FILE, "r") as f:
-            cfg = json.load(f)
-
-        system = platform.system().lower()
-
-        if system == "windows":
-            # Windows: Check mount letter (e.g., V:/)
-            mount_letter = (cfg.get(ConfigKeys.WINDOWS) or {}).get(ConfigKeys.MOUNT_LETTER, "V").upper()
-            drive_path = Path(f"{mount_letter}:/")
-
-            # Check if drive exists and is accessible
-            if drive_path.exists() and drive_path.is_dir():
-                # Additional check: try to list directory contents to verify it's really mounted
-                try:
-                    list(drive_path.iterdir())
-                    return True
-                except (OSError, PermissionError):
-                    # If we can't list contents, it might not be properly mounted
-                    return False
-            return False
-        else:
-            # Linux/macOS: Check mount point
-            mount_point = (cfg.get(ConfigKeys.UNIX) or {}).get(ConfigKeys.MOUNT_POINT, "")
-            if not mount_point:
-                return False
-
-            mount_path = Path(mount_point).expanduser()
-
-            if not mount_path.exists():
-                return False
-
-            # On Unix, check if it's a mount point using mountpoint command
-            try:
-                result = subprocess.run(
-                    ["mountpoint", "-q", str(mount_path)],
-                    capture_output=True,
-                    timeout=5,
-                )
-                return result.returncode == 0
-            except FileNotFoundError:
-                # mountpoint command not available, check if dir has content
-                try:
-                    return any(mount_path.iterdir())
-                except (OSError, PermissionError):
-                    return False
-            except subprocess.TimeoutExpired:
-                return False
-
+        return get_mount_monitor(CONFIG_FILE).is_mounted()
     except Exception as e:
         log_exception("Error checking mount status", e, level="debug")
         return False
@@ -747,8 +700,8 @@ class MountWorker(QThread):
         try:
             # Import here to avoid circular imports
             import subprocess
-            import sys
-            from pathlib import Path
+
+            from mount_service import OP_MOUNT, MountRequest, get_service
 
             # CHG-20251221-042: Use config_path's parent scripts dir for remote mode
             if self.config_path:
@@ -763,43 +716,20 @@ class MountWorker(QThread):
                 self.finished.emit(False, "worker_mount_script_not_found", {})
                 return
 
-            python_exe = get_python_exe()
-
-            # Run mount script with password (if provided)
-            cmd = [str(python_exe), str(mount_script), "--gui"]
-
-            # CHG-20251221-042: Pass config path for remote mode
-            if self.config_path:
-                cmd.extend(["--config", str(self.config_path)])
-
-            if self.password:
-                cmd.extend(["--password", self.password])
-            if self.keyfiles:
-                for kf in self.keyfiles:
-                    cmd.extend(["--keyfile", kf])
-            # BUG-20251222-001: Use getattr for CREATE_NO_WINDOW (Windows-only flag)
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=script_dir,
-                timeout=Limits.VERACRYPT_MOUNT_TIMEOUT,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            # CHG-20261016-015: Persistent mount service; the password goes over
+            # the service pipe, never on a command line
+            request = MountRequest(
+                OP_MOUNT,
+                config_path=str(self.config_path) if self.config_path else None,
+                password=self.password or None,
+                keyfiles=tuple(str(kf) for kf in self.keyfiles),
             )
+            result = get_service(script_dir, get_python_exe()).call(request, timeout=Limits.VERACRYPT_MOUNT_TIMEOUT)
 
-            if result.returncode == 0:
+            if result.ok:
                 self.finished.emit(True, "worker_mount_success", {})
             else:
-                error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-                # Clean up error message for GUI
-                if "Traceback" in error_msg:
-                    # Extract just the main error
-                    lines = error_msg.split("\n")
-                    for line in reversed(lines):
-                        if line.strip() and not line.startswith(" "):
-                            error_msg = line.strip()
-                            break
-                self.finished.emit(False, "worker_mount_failed", {"error": error_msg})
+                self.finished.emit(False, "worker_mount_failed", {"error": result.error})
 
         except subprocess.TimeoutExpired:
             self.finished.emit(False, "worker_mount_timeout", {})
@@ -833,8 +763,8 @@ class UnmountWorker(QThread):
         try:
             # Import here to avoid circular imports
             import subprocess
-            import sys
-            from pathlib import Path
+
+            from mount_service import OP_UNMOUNT, MountRequest, get_service
 
             # CHG-20251221-042: Use config_path's parent scripts dir for remote mode
             if self.config_path:
@@ -849,37 +779,14 @@ class UnmountWorker(QThread):
                 self.finished.emit(False, "worker_unmount_script_not_found", {})
                 return
 
-            python_exe = get_python_exe()
-
-            # Run unmount script
-            cmd = [str(python_exe), str(unmount_script), "--gui"]
-
-            # CHG-20251221-042: Pass config path for remote mode
-            if self.config_path:
-                cmd.extend(["--config", str(self.config_path)])
-
-            # BUG-20251222-001: Use getattr for CREATE_NO_WINDOW (Windows-only flag)
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=script_dir,
-                timeout=Limits.VERACRYPT_MOUNT_TIMEOUT,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
+            # CHG-20261016-015: Persistent mount service (no interpreter start per unmount)
+            request = MountRequest(OP_UNMOUNT, config_path=str(self.config_path) if self.config_path else None)
+            result = get_service(script_dir, get_python_exe()).call(request, timeout=Limits.VERACRYPT_MOUNT_TIMEOUT)
 
-            if result.returncode == 0:
+            if result.ok:
                 self.finished.emit(True, "worker_unmount_success", {})
             else:
-                error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-                # Clean up error message for GUI
-                if "Traceback" in error_msg:
-                    lines = error_msg.split("\n")
-                    for line in reversed(lines):
-                        if line.strip() and not line.startswith(" "):
-                            error_msg = line.strip()
-                            break
-                self.finished.emit(False, "worker_unmount_failed", {"error": error_msg})
+                self.finished.emit(False, "worker_unmount_failed", {"error": result.error})
 
         except subprocess.TimeoutExpired:
             self.finished.emit(False, "worker_unmount_timeout", {})
@@ -924,7 +831,6 @@ class RecoveryGenerateWorker(QThread):
             from scripts.veracrypt_cli import (
                 InvalidCredentialsError,
                 VeraCryptError,
-                get_mount_status,
                 try_mount,
                 unmount,
             )
@@ -932,10 +838,9 @@ class RecoveryGenerateWorker(QThread):
             return False, f"Cannot import veracrypt_cli: {e}"
 
         # Check if already mounted - if so, credentials are already verified
+        # CHG-20261016-024: Structured lookup in the shared mount inventory
         try:
-            status = get_mount_status()
-            # Check if our volume is in the mounted list
-            if status and any(volume_path in str(m.get("volume", "")) for m in status):
+            if get_mount_inventory().find(volume=volume_path) is not None:
                 return True, ""  # Already mounted = credentials valid
         except Exception as e:
             _gui_logger.debug(f"Mount status check failed (continuing): {e}")  # Continue with mount test
@@ -949,9 +854,10 @@ class RecoveryGenerateWorker(QThread):
 
             used_letters = set()
             try:
-                for m in get_mount_status() or []:
-                    # BUG-20251224-006: Use ConfigKeys.MOUNT_POINT for SSOT compliance
-                    letter = m.get(ConfigKeys.MOUNT_POINT, "")
+                # CHG-20261016-024: Every letter in use, not only VeraCrypt slots
+                snapshot = get_mount_inventory().snapshot()
+                used_points = [slot.mount_point for slot in snapshot.slots] + list(snapshot.os_mounts or {})
+                for letter in used_points:
                     if letter:
                         used_letters.add(letter[0].upper())
             except Exception as e:
@@ -1682,6 +1588,69 @@ class RemoteBannerLabel(QLabel):
             super().mousePressEvent(event)
 
 
+class LazyTabWidget(QTabWidget):
+    """
+    Tab widget whose pages are built on first view.
+
+    CHG-20261016-018: Each tab starts as an empty placeholder; its builder runs
+    the first time the tab becomes current (or materialize() is called) and the
+    built page is kept for later views. Widgets of tabs never opened do not
+    exist, so language/theme refreshes only touch materialized pages and
+    opening a dialog costs one page regardless of how many tabs it has.
+
+    Usage:
+        tabs = LazyTabWidget()
+        tabs.addLazyTab(lambda: build_general_page(), tr("settings_general", lang=get_lang()))
+        tabs.page_materialized.connect(on_page_built)
+        tabs.materialize(tabs.currentIndex())
+    """
+
+    page_materialized = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._builders = {}  # placeholder QWidget -> builder callable (pending pages only)
+        self.currentChanged.connect(self.materialize)
+
+    def addLazyTab(self, builder, label: str) -> int:
+        """Add a tab built by builder() on first view. Returns the tab index."""
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._builders[placeholder] = builder
+        # Adding the first tab makes it current; it is materialized explicitly
+        # once the owner has finished setting up (initial tab selection etc.)
+        blocked = self.blockSignals(True)
+        try:
+            return self.addTab(placeholder, label)
+        finally:
+            self.blockSignals(blocked)
+
+    def is_materialized(self, index: int) -> bool:
+        placeholder = self.widget(index)
+        return placeholder is not None and placeholder not in self._builders
+
+    def materialize(self, index: int) -> Optional[QWidget]:
+        """
+        Build the page at index if it is still pending.
+
+        Returns:
+            The built page, or None for an invalid index
+        """
+        placeholder = self.widget(index)
+        if placeholder is None:
+            return None
+        builder = self._builders.pop(placeholder, None)
+        if builder is None:
+            layout = placeholder.layout()
+            item = layout.itemAt(0) if layout is not None and layout.count() else None
+            return item.widget() if item is not None else placeholder
+        page = builder()
+        placeholder.layout().addWidget(page)
+        self.page_materialized.emit(index)
+        return page
+
+
 class SmartDriveGUI(QWidget):
     """Main KeyDrive GUI window."""
 
@@ -1722,7 +1691,9 @@ class SmartDriveGUI(QWidget):
         # CHG-20251221-042: Remote Control Mode state
         self._app_mode = AppMode.LOCAL
         self._remote_profile: Optional[RemoteMountProfile] = None
-        self._remote_identity_timer: Optional[QTimer] = None
+        # CHG-20261016-020: Remote drive probes run off the GUI thread
+        self._remote_health: Optional[DriveHealthMonitor] = None
+        self._remote_health_signal = None
         self._remote_banner: Optional[RemoteBannerLabel] = None
         self._remote_blink_timer: Optional[QTimer] = None
         self._remote_blink_state = False
@@ -1753,10 +1724,19 @@ class SmartDriveGUI(QWidget):
         self.update_storage_display()
         self._update_lost_and_found_banner()
 
-        # Auto-refresh mount status every 2 seconds
+        # CHG-20261016-001: Mount state changes are event-driven (MountMonitor).
+        # The timer only refreshes the storage display at a relaxed cadence.
+        self._mount_monitor = None
+        self._mount_signal = None
+        self._bind_mount_monitor(CONFIG_FILE)
+
+        # CHG-20261016-021: Warm gpg-agent/scdaemon in the background so the
+        # first mount does not wait for (or retry around) agent start-up
+        warm_up_for_mode((self.config or {}).get(ConfigKeys.MODE))
+
         self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.refresh_status)
-        self.status_timer.start(2000)
+        self.status_timer.timeout.connect(self.update_storage_display)
+        self.status_timer.start(Limits.STORAGE_REFRESH_INTERVAL_MS)
 
         # CHG-20260102-013, CHG-20260103-002: Loading animation state
         # Now uses LoadingDotsWidget for visible, colorful animation on own row
@@ -2039,6 +2019,14 @@ QPushButton:pressed {{
         if hasattr(self, "status_timer") and self.status_timer:
             self.status_timer.stop()
 
+        # Stop mount monitor thread
+        if hasattr(self, "_mount_monitor") and self._mount_monitor:
+            self._mount_monitor.stop()
+
+        # CHG-20261016-020: Stop remote drive health monitor
+        if getattr(self, "_remote_health", None):
+            self._remote_health.stop(timeout=0)
+
         # Clean up tray
         if self._tray_manager:
             self._tray_manager.cleanup()
@@ -2560,6 +2548,7 @@ QPushButton:pressed {{
         # Update global CONFIG_FILE path
         global CONFIG_FILE
         CONFIG_FILE = config_path
+        self._bind_mount_monitor(CONFIG_FILE)
 
         # Update _launcher_root
         self._launcher_root = new_smartdrive_path.parent
@@ -3726,42 +3715,49 @@ QPushButton:pressed {{
         self._update_open_button_states()
 
     def refresh_status(self):
-        """Refresh mount status and storage display periodically."""
+        """Refresh mount status and storage display."""
         current_status = check_mount_status_veracrypt()
         if current_status != self.is_mounted:
-            self.is_mounted = current_status
-            self.update_button_states()
-            # Update tray icon to reflect mount state
-            self._update_tray_icon_state()
+            self._on_mount_state_changed(current_status)
         self.update_storage_display()
 
-    def check_remote_identity(self) -> None:
+    def _bind_mount_monitor(self, config_file: Path) -> None:
         """
-        CHG-20251221-042: Check if remote drive is still accessible.
+        CHG-20261016-001: Watch the volume configured in config_file.
 
-        Called by QTimer every 5 seconds when in REMOTE mode.
-        If remote drive disconnected, auto-exit remote mode with warning.
+        Called at start-up and whenever CONFIG_FILE switches drives (remote
+        mode, drive switch) so mount events follow the active config.
         """
-        if self._app_mode != AppMode.REMOTE or self._remote_profile is None:
+        monitor = get_mount_monitor(config_file)
+        if monitor is self._mount_monitor:
             return
+        if self._mount_monitor is not None:
+            self._mount_monitor.remove_listener(self._mount_signal.listener)
+            self._mount_monitor.stop()
+            self._mount_signal.deleteLater()
+        self._mount_monitor = monitor
+        self._mount_signal = create_qt_mount_signal(monitor, self)
+        self._mount_signal.mount_state_changed.connect(self._on_mount_state_changed)
+        monitor.start()
+        # The new drive's state may equal its monitor's cached state (no signal)
+        self._on_mount_state_changed(monitor.is_mounted())
+
+    @pyqtSlot(bool)
+    def _on_mount_state_changed(self, mounted: bool) -> None:
+        """CHG-20261016-001: React to a MountMonitor transition (GUI thread)."""
+        _gui_logger.info(f"mount.state_changed: mounted={mounted}")
+        self.is_mounted = mounted
+        self.update_button_states()
+        # Update tray icon to reflect mount state
+        self._update_tray_icon_state()
 
-        profile = self._remote_profile
-        # Check if the remote root still exists and is accessible
-        try:
-            if not profile.remote_root.exists():
-                _gui_logger.warning(f"Remote drive disconnected: {profile.remote_root}")
-                self._handle_remote_disconnect()
-                return
-
-            # Additional check: verify config.json still exists
-            if not profile.remote_config_path.exists():
-                _gui_logger.warning(f"Remote config disappeared: {profile.remote_config_path}")
-                self._handle_remote_disconnect()
-                return
-
-        except (OSError, PermissionError) as e:
-            _gui_logger.warning(f"Remote drive inaccessible: {e}")
-            self._handle_remote_disconnect()
+    def _on_remote_drive_disconnected(self, reason: str) -> None:
+        """CHG-20261016-020: Slot for the health monitor's disconnect signal."""
+        # A queued signal can arrive after remote mode was already left
+        if self._app_mode != AppMode.REMOTE or self._remote_profile is None:
+            return
+        _gui_logger.warning(f"Remote drive disconnected: {reason}")
+        self._handle_remote_disconnect()
 
     def _handle_remote_disconnect(self) -> None:
         """
@@ -3903,12 +3899,17 @@ QPushButton:pressed {{
             # CHG-20251221-042: Use remote root when in remote mode
             if self._app_mode == AppMode.REMOTE and self._remote_profile:
                 drive_path = self._remote_profile.remote_root
+                # CHG-20261016-020: Don't stat a remote drive whose last health
+                # check failed; a half-disconnected drive blocks the GUI thread.
+                health = self._remote_health.status() if self._remote_health else None
+                if health is not None and (health.connected is False or health.consecutive_failures):
+                    drive_path = None
             else:
                 # Get KeyDrive (launch drive) info
                 script_dir = get_script_dir()
                 drive_path = script_dir.parent.parent  # Go up to drive root
 
-            if drive_path.exists():
+            if drive_path is not None and drive_path.exists():
                 stat = shutil.disk_usage(str(drive_path))
                 storage_info["keydrive"] = {"total": stat.total, "used": stat.used, "free": stat.free}
         except Exception as e:
@@ -4489,6 +4490,7 @@ QPushButton:pressed {{
             QMessageBox.critical(self, tr("popup_unmount_failed_title", lang=get_lang()), translated_message)
 
         # Re-enable buttons and refresh status after a longer delay
+        self._mount_monitor.refresh()
         QTimer.singleShot(2000, self.update_button_states)  # 2 second delay to let filesystem settle
 
     @pyqtSlot(bool, str, dict)
@@ -4518,6 +4520,7 @@ QPushButton:pressed {{
                     self.recovery_label.setVisible(True)
 
         # Re-enable buttons and refresh status after a delay
+        self._mount_monitor.refresh()
         QTimer.singleShot(2000, self.update_button_states)  # 2 second delay to let filesystem settle
 
     def _finalize_recovery_container_deletion_on_mount_success(self):
@@ -4941,6 +4944,7 @@ QPushButton:pressed {{
         # Update global CONFIG_FILE to point to remote config
         global CONFIG_FILE
         CONFIG_FILE = config_path
+        self._bind_mount_monitor(CONFIG_FILE)
 
         # Update _launcher_root to remote root
         self._launcher_root = remote_root
@@ -4956,10 +4960,13 @@ QPushButton:pressed {{
         # Apply remote UI state
         self._apply_remote_ui_state()
 
-        # Start identity check timer (5 second interval)
-        self._remote_identity_timer = QTimer()
-        self._remote_identity_timer.timeout.connect(self.check_remote_identity)
-        self._remote_identity_timer.start(5000)
+        # CHG-20261016-020: Watch the remote drive from a background thread
+        self._remote_health = DriveHealthMonitor(
+            [self._remote_profile.remote_root, self._remote_profile.remote_config_path]
+        )
+        self._remote_health_signal = create_qt_health_signal(self._remote_health, self)
+        self._remote_health_signal.drive_disconnected.connect(self._on_remote_drive_disconnected)
+        self._remote_health.start()
 
         # CHG-20251221-048: Add to recent remote roots list
         self._add_to_recent_remote_roots(remote_root)
@@ -5150,10 +5157,13 @@ QPushButton:pressed {{
         BUG-20251221-045 FIX: Restore original button styles when exiting remote mode.
         BUG-20251221-047 FIX: Refresh storage display with local launcher_root to remove remote volumes.
         """
-        # Stop identity check timer
-        if self._remote_identity_timer:
-            self._remote_identity_timer.stop()
-            self._remote_identity_timer = None
+        # CHG-20261016-020: Stop the drive health monitor without waiting on a hung probe
+        if self._remote_health:
+            self._remote_health.stop(timeout=0)
+            self._remote_health = None
+        if self._remote_health_signal:
+            self._remote_health_signal.deleteLater()
+            self._remote_health_signal = None
 
         # Stop blink timer
         self._stop_remote_blink()
@@ -5173,6 +5183,7 @@ QPushButton:pressed {{
         # Restore global CONFIG_FILE to local config
         global CONFIG_FILE
         CONFIG_FILE = self._detect_local_config_path()
+        self._bind_mount_monitor(CONFIG_FILE)
 
         # Restore _launcher_root to local root
         self._launcher_root = self._detect_launcher_root()
@@ -6245,6 +6256,8 @@ class SettingsDialog(QDialog):
         self.field_labels = {}
         # Storage for group boxes (for i18n refresh)
         self.group_boxes = {}
+        # CHG-20261016-019: Fixed-key texts of built tabs, retranslated on language switch
+        self._tr_bindings = TranslationBindings()
 
         # Pre-translate known keys for test detection (schema uses these internally)
         # NOTE: These explicit calls are required for source code test detection
@@ -6317,11 +6330,11 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Create tab widget
-        self.tab_widget = QTabWidget()
+        # CHG-20261016-018: Tab pages are built on first view (LazyTabWidget)
+        self.tab_widget = LazyTabWidget()
 
         # Create tabs from schema
         for tab_name in self.get_all_tabs():
-            tab_widget = self._create_tab(tab_name)
             # Translate tab names using tr() with settings_<lowercase> key
             # NOTE: These explicit calls are required for test detection
             if tab_name == "General":
@@ -6349,7 +6362,7 @@ class SettingsDialog(QDialog):
             else:
                 tab_key = f"settings_{tab_name.lower()}"
                 translated_tab_name = tr(tab_key, lang=get_lang())
-            self.tab_widget.addTab(tab_widget, translated_tab_name)
+            self.tab_widget.addLazyTab(lambda name=tab_name: self._create_tab(name), translated_tab_name)
 
             # CHG-20251222-014: Disable OS-specific tabs based on current OS
             # Windows tabs disabled on Unix, Unix tabs disabled on Windows
@@ -6392,15 +6405,14 @@ class SettingsDialog(QDialog):
         self.save_btn.clicked.connect(self.save)
         self.cancel_btn.clicked.connect(self.reject)
 
-        # Special handling for product name (QSettings, not config.json)
-        self._add_product_name_to_general_tab()
-
-        # CHG-20251221-012: Add About section with version info
-        self._add_about_section_to_general_tab()
+        # CHG-20261016-018: Pages built after a security mode change honour the pending mode
+        self.tab_widget.page_materialized.connect(self._on_tab_materialized)
 
         # CHG-20251221-025: Select initial tab if specified
         if self._initial_tab:
             self._select_tab_by_name(self._initial_tab)
+        # Only the tab shown first is built now; the others on first view
+        self.tab_widget.materialize(self.tab_widget.currentIndex())
 
         # CHG-20251222-012: Start Security tab blinking if post-recovery rekey required
         self._check_and_start_security_tab_blink()
@@ -6461,6 +6473,11 @@ class SettingsDialog(QDialog):
                 # Normal state: white text
                 tab_bar.setTabTextColor(self._security_tab_index, QColor("#FFFFFF"))
 
+    def _on_tab_materialized(self, index: int):
+        """CHG-20261016-018: Apply pending-config visibility to a freshly built tab."""
+        if self._pending_config is not None:
+            self._refresh_conditional_fields()
+
     def _on_tab_changed(self, index: int):
         """
         CHG-20251222-012: Handle tab change to stop blinking when Security tab is selected.
@@ -6531,7 +6548,7 @@ class SettingsDialog(QDialog):
             desc_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px; padding: 4px 0 8px 0;")
             tab_layout.addWidget(desc_label)
             # Store for i18n refresh
-            self.field_labels[f"tab_desc_{tab_name}"] = (desc_label, desc_key)
+            self._bind_label(f"tab_desc_{tab_name}", desc_label, desc_key)
 
         # Get fields for this tab
         fields = self.get_fields_for_tab(tab_name)
@@ -6616,7 +6633,15 @@ class SettingsDialog(QDialog):
         if tab_name == "Integrity":
             self._add_integrity_section(tab_layout)
 
+        # Special handling for product name (QSettings, not config.json)
+        if tab_name == "General":
+            self._add_product_name_to_general_tab(tab_layout)
+
         tab_layout.addStretch()
+
+        # CHG-20251221-012: Add About section with version info
+        if tab_name == "General":
+            self._add_about_section_to_general_tab(tab_layout)
         content_widget.setLayout(tab_layout)
 
         # CHG-20251223-065: Set content widget inside scroll area
@@ -6652,14 +6677,14 @@ class SettingsDialog(QDialog):
                 f"color: {COLORS['error']}; font-weight: bold; padding: 8px; background-color: #ffeeee; border-radius: 4px;"
             )
             rekey_layout.addWidget(warning_label)
-            self.field_labels["rekey_post_recovery_notice"] = (warning_label, "rekey_post_recovery_notice")
+            self._bind_label("rekey_post_recovery_notice", warning_label, "rekey_post_recovery_notice")
 
         # Instructions
         instructions = QLabel(tr("rekey_instructions", lang=get_lang()))
         instructions.setWordWrap(True)
         instructions.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px;")
         rekey_layout.addWidget(instructions)
-        self.field_labels["rekey_instructions"] = (instructions, "rekey_instructions")
+        self._bind_label("rekey_instructions", instructions, "rekey_instructions")
 
         # CHG-20251221-001: Mode selection section
         mode_section = QFrame()
@@ -6685,7 +6710,7 @@ class SettingsDialog(QDialog):
         current_mode_label = QLabel(current_mode_display)
         current_mode_label.setStyleSheet(f"font-weight: bold; color: {COLORS['primary']};")
         mode_layout.addRow(tr("rekey_current_mode_label", lang=get_lang()), current_mode_label)
-        self.field_labels["rekey_current_mode_label"] = (current_mode_label, "rekey_current_mode_label")
+        self._bind_label("rekey_current_mode_label", current_mode_label, current_mode_i18n_key)
 
         # Target mode dropdown
         self.rekey_target_mode_combo = QComboBox()
@@ -6853,7 +6878,7 @@ class SettingsDialog(QDialog):
         is_gpg_mode = current_mode in (SecurityMode.GPG_PW_ONLY.value, SecurityMode.PW_GPG_KEYFILE.value)
         self.rekey_gpg_hint_label.setVisible(is_gpg_mode)
         rekey_layout.addWidget(self.rekey_gpg_hint_label)
-        self.field_labels["rekey_gpg_seed_hint"] = (self.rekey_gpg_hint_label, "rekey_gpg_seed_hint")
+        self._bind_label("rekey_gpg_seed_hint", self.rekey_gpg_hint_label, "rekey_gpg_seed_hint")
 
         # Status label
         self.rekey_status_label = QLabel(tr("rekey_status_ready", lang=get_lang()))
@@ -8003,7 +8028,6 @@ class SettingsDialog(QDialog):
             from scripts.veracrypt_cli import (
                 InvalidCredentialsError,
                 VeraCryptError,
-                get_mount_status,
                 try_mount,
                 unmount,
             )
@@ -8011,10 +8035,9 @@ class SettingsDialog(QDialog):
             return False, f"Cannot import veracrypt_cli: {e}"
 
         # Check if already mounted - if so, credentials are already verified
+        # CHG-20261016-024: Structured lookup in the shared mount inventory
         try:
-            status = get_mount_status()
-            # Check if our volume is in the mounted list
-            if status and any(volume_path in str(m.get("volume", "")) for m in status):
+            if get_mount_inventory().find(volume=volume_path) is not None:
                 return True, ""  # Already mounted = credentials valid
         except Exception as e:
             _gui_logger.debug(f"Mount status check failed (continuing): {e}")
@@ -8027,8 +8050,10 @@ class SettingsDialog(QDialog):
 
             used_letters = set()
             try:
-                for m in get_mount_status() or []:
-                    letter = m.get(ConfigKeys.MOUNT_POINT, "")
+                # CHG-20261016-024: Every letter in use, not only VeraCrypt slots
+                snapshot = get_mount_inventory().snapshot()
+                used_points = [slot.mount_point for slot in snapshot.slots] + list(snapshot.os_mounts or {})
+                for letter in used_points:
                     if letter:
                         used_letters.add(letter[0].upper())
             except Exception as e:
@@ -8448,7 +8473,7 @@ class SettingsDialog(QDialog):
         instructions.setWordWrap(True)
         instructions.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px; margin-bottom: 10px;")
         tab_layout.addWidget(instructions)
-        self.field_labels["integrity_instructions"] = (instructions, "integrity_instructions")
+        self._bind_label("integrity_instructions", instructions, "integrity_instructions")
 
         # Verification group box
         self.integrity_verify_box = QGroupBox(tr("integrity_section_title", lang=get_lang()))
@@ -8738,7 +8763,13 @@ class SettingsDialog(QDialog):
 
         try:
             # Calculate scripts hash
-            scripts_hash = Integrity.calculate_scripts_hash(self._launcher_root)
+            # CHG-20261016-002: Hash the scripts dir (not the launcher root) and reuse
+            # the digest index so repeated remote checks do not re-read the drive
+            integrity_dir = Paths.integrity_dir(self._launcher_root)
+            scripts_hash = Integrity.calculate_scripts_hash(
+                Paths.scripts_dir(self._launcher_root),
+                index_file=integrity_dir / Integrity.INDEX_FILE if integrity_dir.is_dir() else None,
+            )
 
             # Build payload
             # BUG-20251221-029: Use timezone.utc instead of datetime.UTC
@@ -8823,11 +8854,11 @@ class SettingsDialog(QDialog):
         instructions.setWordWrap(True)
         instructions.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px;")
         action_layout.addWidget(instructions)
-        self.field_labels["recovery_instructions"] = (instructions, "recovery_instructions")
+        self._bind_label("recovery_instructions", instructions, "recovery_instructions")
 
         # Recovery phrase input
         phrase_label = QLabel(tr("label_recovery_phrase", lang=get_lang()))
-        self.field_labels["label_recovery_phrase"] = (phrase_label, "label_recovery_phrase")
+        self._bind_label("label_recovery_phrase", phrase_label, "label_recovery_phrase")
         action_layout.addWidget(phrase_label)
 
         self.recovery_phrase_edit = QTextEdit()
@@ -8849,7 +8880,7 @@ class SettingsDialog(QDialog):
         # Container file picker (optional)
         container_layout = QHBoxLayout()
         container_label = QLabel(tr("label_recovery_container", lang=get_lang()))
-        self.field_labels["label_recovery_container"] = (container_label, "label_recovery_container")
+        self._bind_label("label_recovery_container", container_label, "label_recovery_container")
         container_layout.addWidget(container_label)
 
         self.recovery_container_path = QLineEdit()
@@ -8913,12 +8944,12 @@ class SettingsDialog(QDialog):
         results_title = QLabel(tr("recovery_result_title", lang=get_lang()))
         results_title.setStyleSheet("font-weight: bold;")
         results_layout.addWidget(results_title)
-        self.field_labels["recovery_result_title"] = (results_title, "recovery_result_title")
+        self._bind_label("recovery_result_title", results_title, "recovery_result_title")
 
         # Password result
         password_row = QHBoxLayout()
         password_label = QLabel(tr("recovery_result_password", lang=get_lang()))
-        self.field_labels["recovery_result_password"] = (password_label, "recovery_result_password")
+        self._bind_label("recovery_result_password", password_label, "recovery_result_password")
         password_row.addWidget(password_label)
         self.recovered_password_display = QLineEdit()
         self.recovered_password_display.setReadOnly(True)
@@ -8932,7 +8963,7 @@ class SettingsDialog(QDialog):
         # Keyfile result
         keyfile_row = QHBoxLayout()
         keyfile_label = QLabel(tr("recovery_result_keyfile", lang=get_lang()))
-        self.field_labels["recovery_result_keyfile"] = (keyfile_label, "recovery_result_keyfile")
+        self._bind_label("recovery_result_keyfile", keyfile_label, "recovery_result_keyfile")
         keyfile_row.addWidget(keyfile_label)
         self.recovered_keyfile_display = QLabel("—")
         keyfile_row.addWidget(self.recovered_keyfile_display, stretch=1)
@@ -8945,7 +8976,7 @@ class SettingsDialog(QDialog):
         # Security mode result
         mode_row = QHBoxLayout()
         mode_label = QLabel(tr("recovery_result_mode", lang=get_lang()))
-        self.field_labels["recovery_result_mode"] = (mode_label, "recovery_result_mode")
+        self._bind_label("recovery_result_mode", mode_label, "recovery_result_mode")
         mode_row.addWidget(mode_label)
         self.recovered_mode_display = QLabel("—")
         mode_row.addWidget(self.recovered_mode_display, stretch=1)
@@ -8982,7 +9013,7 @@ class SettingsDialog(QDialog):
         gen_instructions.setWordWrap(True)
         gen_instructions.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px;")
         generate_layout.addWidget(gen_instructions)
-        self.field_labels["recovery_generate_instructions"] = (gen_instructions, "recovery_generate_instructions")
+        self._bind_label("recovery_generate_instructions", gen_instructions, "recovery_generate_instructions")
 
         # Generate button
         self.btn_generate_recovery_kit = QPushButton(tr("btn_generate_recovery_kit", lang=get_lang()))
@@ -9602,6 +9633,7 @@ class SettingsDialog(QDialog):
             self.field_widgets[field_key] = widget
             label = QLabel(tr(field.label_key, lang=get_lang()))
             self.field_labels[field_key] = label
+            self._tr_bindings.bind(label, field.label_key)
             if field.tooltip_key:
                 tooltip = tr(field.tooltip_key, lang=get_lang())
                 widget.setToolTip(tooltip)
@@ -9767,6 +9799,7 @@ class SettingsDialog(QDialog):
         # Create label
         label = QLabel(tr(field.label_key, lang=get_lang()))
         self.field_labels[field_key] = label
+        self._tr_bindings.bind(label, field.label_key)
 
         # Add tooltip if specified
         if field.tooltip_key:
@@ -9780,6 +9813,11 @@ class SettingsDialog(QDialog):
         else:
             layout.addRow(label, widget)
 
+    def _bind_label(self, name: str, widget, key: str) -> None:
+        """Register a fixed-key text for i18n refresh (CHG-20261016-019)."""
+        self.field_labels[name] = (widget, key)
+        self._tr_bindings.bind(widget, key)
+
     def _make_field_key(self, field) -> str:
         """Create unique key for field widget storage."""
         if field.nested_path:
@@ -9812,109 +9850,73 @@ class SettingsDialog(QDialog):
         if dir_path:
             line_edit.setText(dir_path)
 
-    def _add_product_name_to_general_tab(self):
+    def _add_product_name_to_general_tab(self, layout: QVBoxLayout):
         """Add product name field to General tab (QSettings, not config.json)."""
-        from PyQt6.QtWidgets import QScrollArea
+        # Find the first group box or create form layout
+        if layout.count() > 0:
+            first_widget = layout.itemAt(0).widget()
+            if isinstance(first_widget, QGroupBox):
+                # Insert into existing group box at top
+                group_layout = first_widget.layout()
 
-        # Find General tab
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == "General":
-                tab = self.tab_widget.widget(i)
-                # CHG-20251223-065: Tab is now a QScrollArea, get the content widget inside
-                if isinstance(tab, QScrollArea):
-                    content_widget = tab.widget()
-                    layout = content_widget.layout() if content_widget else None
-                else:
-                    layout = tab.layout()
-
-                if layout is None:
-                    break
+                # Create product name widgets
+                self.product_name_edit = QLineEdit()
+                self.product_name_edit.setText(get_product_name(self.settings))
+                self.product_name_edit.setPlaceholderText(f"Default: {PRODUCT_NAME}")
+                self.product_name_edit.setMaxLength(TITLE_MAX_CHARS)
 
-                # Find the first group box or create form layout
-                if layout.count() > 0:
-                    first_widget = layout.itemAt(0).widget()
-                    if isinstance(first_widget, QGroupBox):
-                        # Insert into existing group box at top
-                        group_layout = first_widget.layout()
+                self.preview_label = QLabel()
+                self.preview_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-style: italic;")
+                self.update_preview()
 
-                        # Create product name widgets
-                        self.product_name_edit = QLineEdit()
-                        self.product_name_edit.setText(get_product_name(self.settings))
-                        self.product_name_edit.setPlaceholderText(f"Default: {PRODUCT_NAME}")
-                        self.product_name_edit.setMaxLength(TITLE_MAX_CHARS)
+                self.product_name_edit.textChanged.connect(self.update_preview)
 
-                        self.preview_label = QLabel()
-                        self.preview_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-style: italic;")
-                        self.update_preview()
+                # Insert at row 0
+                group_layout.insertRow(0, tr("label_preview", lang=get_lang()), self.preview_label)
+                group_layout.insertRow(0, tr("label_product_name", lang=get_lang()), self.product_name_edit)
 
-                        self.product_name_edit.textChanged.connect(self.update_preview)
-
-                        # Insert at row 0
-                        group_layout.insertRow(0, tr("label_preview", lang=get_lang()), self.preview_label)
-                        group_layout.insertRow(0, tr("label_product_name", lang=get_lang()), self.product_name_edit)
-                break
-
-    def _add_about_section_to_general_tab(self):
+    def _add_about_section_to_general_tab(self, layout: QVBoxLayout):
         """
         Add About section to General tab showing version information.
 
         CHG-20251221-012: Displays version, build ID, and compatibility version
         in a dedicated About group box at the bottom of the General tab.
         """
-        from PyQt6.QtWidgets import QScrollArea
-
-        # Find General tab
-        for i in range(self.tab_widget.count()):
-            tab_text = self.tab_widget.tabText(i)
-            # Handle translated tab names
-            if tab_text in ["General", "Allgemein", "Opšte", "General", "Général", "Общие", "常规"]:
-                tab = self.tab_widget.widget(i)
-                # CHG-20251223-065: Tab is now a QScrollArea, get the content widget inside
-                if isinstance(tab, QScrollArea):
-                    content_widget = tab.widget()
-                    layout = content_widget.layout() if content_widget else None
-                else:
-                    layout = tab.layout()
-
-                if layout is None:
-                    break
+        # Add stretch before About section to push it to bottom
+        layout.addStretch()
 
-                # Add stretch before About section to push it to bottom
-                layout.addStretch()
+        # Create About group box
+        about_group = QGroupBox(tr("settings_about", lang=get_lang()))
+        about_layout = QFormLayout()
+        about_layout.setSpacing(8)
+        about_layout.setContentsMargins(12, 12, 12, 12)
 
-                # Create About group box
-                about_group = QGroupBox(tr("settings_about", lang=get_lang()))
-                about_layout = QFormLayout()
-                about_layout.setSpacing(8)
-                about_layout.setContentsMargins(12, 12, 12, 12)
+        # Version label (read-only)
+        self.version_label = QLabel(APP_VERSION)
+        self.version_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        about_layout.addRow(tr("label_version", lang=get_lang()), self.version_label)
 
-                # Version label (read-only)
-                self.version_label = QLabel(APP_VERSION)
-                self.version_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-                about_layout.addRow(tr("label_version", lang=get_lang()), self.version_label)
+        # Build ID label (read-only, shows "Development" if not set)
+        build_display = BUILD_ID if BUILD_ID else tr("label_build_dev", lang=get_lang())
+        self.build_id_label = QLabel(build_display)
+        self.build_id_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        about_layout.addRow(tr("label_build_id", lang=get_lang()), self.build_id_label)
 
-                # Build ID label (read-only, shows "Development" if not set)
-                build_display = BUILD_ID if BUILD_ID else tr("label_build_dev", lang=get_lang())
-                self.build_id_label = QLabel(build_display)
-                self.build_id_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-                about_layout.addRow(tr("label_build_id", lang=get_lang()), self.build_id_label)
+        # Compatibility version label (read-only)
+        self.compat_version_label = QLabel(COMPATIBILITY_VERSION)
+        self.compat_version_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        about_layout.addRow(tr("label_compat_version", lang=get_lang()), self.compat_version_label)
 
-                # Compatibility version label (read-only)
-                self.compat_version_label = QLabel(COMPATIBILITY_VERSION)
-                self.compat_version_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-                about_layout.addRow(tr("label_compat_version", lang=get_lang()), self.compat_version_label)
+        about_group.setLayout(about_layout)
 
-                about_group.setLayout(about_layout)
+        # Store for i18n refresh
+        self.group_boxes["about"] = (about_group, "settings_about")
+        self.field_labels["about_version"] = (None, "label_version")  # Row labels refreshed via group
+        self.field_labels["about_build"] = (None, "label_build_id")
+        self.field_labels["about_compat"] = (None, "label_compat_version")
 
-                # Store for i18n refresh
-                self.group_boxes["about"] = (about_group, "settings_about")
-                self.field_labels["about_version"] = (None, "label_version")  # Row labels refreshed via group
-                self.field_labels["about_build"] = (None, "label_build_id")
-                self.field_labels["about_compat"] = (None, "label_compat_version")
-
-                # Add at bottom of General tab
-                layout.addWidget(about_group)
-                break
+        # Add at bottom of General tab
+        layout.addWidget(about_group)
 
     def on_language_changed(self, index):
         """Handle language dropdown change with immediate UI update."""
@@ -10498,13 +10500,8 @@ class SettingsDialog(QDialog):
             # Could add translation if needed
             pass
 
-        # Update field labels
-        for field_key, label in self.field_labels.items():
-            # Find field in schema to get label_key
-            for field in self.schema:
-                if self._make_field_key(field) == field_key:
-                    label.setText(tr(field.label_key, lang=lang_code))
-                    break
+        # Update field labels and other bound texts (CHG-20261016-019: built tabs only)
+        self._tr_bindings.retranslate(lang_code)
 
         # Update buttons
         self.save_btn.setText(tr("btn_save", lang=lang_code))
@@ -10682,6 +10679,9 @@ def main():
     window.raise_()  # Bring to front
     window.activateWindow()  # Activate the window
 
+    # CHG-20261016-017: --profile-startup ends on the first event-loop turn (window painted)
+    QTimer.singleShot(0, lambda: finish_startup_profile("first_window"))
+
     # Run event loop
     exit_code = app.exec()
 
@@ -3,7 +3,7 @@
 GUI Internationalization (i18n) Module
 
 SINGLE SOURCE OF TRUTH for all GUI-visible text labels.
-All GUI strings MUST be defined here and accessed via tr() function.
+All GUI strings MUST be defined in locales/gui_<lang>.py and accessed via tr().
 
 Per AGENT_ARCHITECTURE.md Section 11.2:
 - NO GUI text literals outside this module
@@ -11,7 +11,26 @@ Per AGENT_ARCHITECTURE.md Section 11.2:
 - Fallback: missing key in selected lang -> try 'en' -> fail loudly
 """
 
-from typing import Dict
+import sys
+import weakref
+from pathlib import Path
+from typing import Dict, Tuple
+
+# CHG-20261016-019: Catalogs live in .smartdrive/locales/ (sibling of scripts/)
+_deploy_root = Path(__file__).resolve().parent.parent
+if str(_deploy_root) not in sys.path:
+    sys.path.insert(0, str(_deploy_root))
+
+from locales import CatalogSet
+
+try:
+    from core.startup_profile import MILESTONE_TR, mark_once
+except ImportError:  # Standalone use without core/
+    MILESTONE_TR = ""
+
+    def mark_once(name):
+        pass
+
 
 # =============================================================================
 # Available Languages
@@ -31,3318 +50,11 @@ AVAILABLE_LANGUAGES: Dict[str, str] = {
 # Translation Table
 # =============================================================================
 
-TRANSLATIONS: Dict[str, Dict[str, str]] = {
-    "en": {
-        # Window titles
-        "window_title": "KeyDrive",
-        "settings_window_title": "Settings",
-        # Button labels
-        "btn_mount": "🔓 Mount",
-        "btn_unmount": "🔒 Unmount",
-        "btn_cancel_auth": "❌ Cancel",
-        "btn_confirm_mount": "✅ Confirm",
-        "btn_tools": "⚙️",
-        "btn_close": "✕",
-        "btn_save": "Save",
-        "btn_cancel": "Cancel",
-        "btn_confirm": "Confirm",
-        "btn_ok": "OK",
-        # CHG-20251223-055: Reload config button for non-modal settings
-        "btn_reload_config": "↻ Reload Config",
-        "tooltip_reload_config": "Reload configuration from disk (discards unsaved changes)",
-        # Common dialog titles
-        "warning": "Warning",
-        "settings_tab_security": "Security",
-        # Status messages
-        "status_config_not_found": "Configuration not found",
-        "status_volume_mounted": "Volume mounted",
-        "status_volume_not_mounted": "Volume not mounted",
-        "status_mounting": "⏳ Mounting volume...",
-        "status_mounting_gpg": "⏳ Mounting volume (GPG authentication)...",
-        "status_unmounting": "⏳ Unmounting volume...",
-        "status_mount_success": "✅ Volume mounted successfully",
-        "status_mount_failed": "❌ Mount failed",
-        "status_unmount_success": "✅ Volume unmounted successfully",
-        "status_unmount_failed": "❌ Unmount failed",
-        # Info labels
-        "info_unavailable": "Info unavailable",
-        "keyfile_selected_one": "1 keyfile selected",
-        "keyfile_selected_many": "{count} keyfiles selected",
-        "keyfile_drop_hint": "Drop keyfiles here or click to browse",
-        "keyfile_drop_supports_multiple": "Supports multiple keyfiles",
-        "label_show_password": "Show password",
-        # Size formatting
-        "size_free": "Free: {size}",
-        # Icons/placeholders
-        "icon_drive": "🚀",
-        # Tooltips
-        "tooltip_exit": "Exit SmartDrive",
-        "tooltip_settings": "Advanced tools and settings",
-        # Labels
-        "label_product_name": "Product Name",
-        "label_preview": "Preview:",
-        "label_password": "Password:",
-        "label_keyfile": "Keyfile:",
-        "label_hardware_key_hint": "💡 Hardware key may be required for authentication",
-        "label_forgot_password": "Forgot your password?",
-        # Placeholder text
-        "placeholder_password": "Enter your VeraCrypt password...",
-        # Menu items
-        "menu_settings": "⚙️ Settings",
-        "menu_rekey": "🔑 Change Password/Keyfile",
-        "menu_update": "⬇️ Update Scripts",
-        "menu_recovery": "💾 Recovery Kit",
-        "menu_about": "ℹ️ About",
-        "menu_cli": "💻 Open CLI",
-        "menu_exit": "⏻ Exit",
-        "menu_clear_keyfiles": "Clear Keyfiles",
-        "menu_switch_drive": "🔀 Switch Drive...",
-        "menu_switch_drive_browse": "📂 Browse...",
-        # CHG-20251221-042: Remote Control Mode menu items
-        "menu_manage_remote": "🌐 Manage Remote...",
-        "menu_manage_remote_browse": "📂 Browse for remote .smartdrive...",
-        "menu_exit_remote": "🏠 Exit Remote Mode",
-        "remote_active_label": "Remote Control Active",
-        "remote_click_to_end": "Click to End Remote",
-        "remote_validation_failed_title": "Remote Validation Failed",
-        "remote_validation_failed_body": "Cannot connect to remote drive:\n\n{error}",
-        "remote_disconnected_title": "Remote Drive Disconnected",
-        "remote_disconnected_body": "The remote drive ({drive}:) has been disconnected.\n\nReturning to local mode.",
-        "remote_confirm_title": "Enter Remote Control Mode",
-        "remote_confirm_body": "Connect to remote .smartdrive at:\n{path}\n\nIn remote mode, you can only mount/unmount the remote volume.\nSettings, Updates, and CLI access will be disabled.",
-        "remote_mode_disabled_title": "Remote Mode Active",
-        "remote_mode_disabled_cli": "CLI access is disabled in remote mode to prevent split-brain issues.",
-        "remote_mode_disabled_settings": "Settings are disabled in remote mode. Exit remote mode first.",
-        "remote_mode_disabled_update": "Updates are disabled in remote mode. Exit remote mode first.",
-        "dialog_select_keyfiles": "Select Keyfile(s)",
-        # Multi-drive context (CHG-20251221-026)
-        "label_launcher_root": "Launcher Drive:",
-        "group_drive_context": "Drive Context",
-        "tooltip_launcher_root": "The drive containing this .smartdrive folder",
-        # Drive safety context (CHG-20251221-040)
-        "label_os_drive": "OS Drive:",
-        "tooltip_os_drive": "Drive running the operating system (cannot be repartitioned)",
-        "label_instantiation_drive": "Running From:",
-        "tooltip_instantiation_drive": "Drive from which this instance was launched (cannot be repartitioned)",
-        "switch_drive_title": "Switch Drive Context",
-        "switch_drive_confirm": "Switch to configuration from:\n{path}\n\nAll settings will reload from this drive.",
-        "switch_drive_invalid_path": "Invalid .smartdrive folder. No config.json found.",
-        "switch_drive_select_folder": "Select .smartdrive Folder",
-        "version_incompatible_title": "Version Compatibility Warning",
-        "version_incompatible_error": "Cannot switch to this drive:\n\n{message}\n\nThe configuration format is incompatible with this software version.",
-        "version_incompatible_warning": "{message}\n\nTarget: {path}\n\nDo you want to proceed anyway?",
-        # Tray messages
-        "tray_minimized_message": "Running in background. Click tray icon to restore.",
-        "tray_unavailable_message": "System tray is not available.\n\nDo you want to quit the application?",
-        "tray_tooltip": "{name} ({id})",
-        # Status messages
-        "status_deriving_yubikey_password": "Deriving password from YubiKey...",
-        "status_checking_mount": "Checking mount status...",
-        "status_unmounting_for_rekey": "Unmounting volume for rekey...",
-        "status_decrypting_keyfile": "Decrypting keyfile with YubiKey...",
-        # Worker messages (keys for structured errors)
-        "worker_mount_script_not_found": "Mount script not found",
-        "worker_mount_success": "Volume mounted successfully",
-        "worker_mount_failed": "Mount failed: {error}",
-        "worker_mount_timeout": "Mount operation timed out",
-        "worker_mount_error": "Mount error: {error}",
-        "worker_unmount_script_not_found": "Unmount script not found",
-        "worker_unmount_success": "Volume unmounted successfully",
-        "worker_unmount_failed": "Unmount failed: {error}",
-        "worker_unmount_timeout": "Unmount operation timed out",
-        "worker_unmount_error": "Unmount error: {error}",
-        # Settings dialog - Tab names
-        "settings_language": "Language",
-        "settings_general": "General",
-        "settings_security": "Security",
-        "settings_keyfile": "Keyfile",
-        "settings_windows": "Windows",
-        "settings_unix": "Unix",
-        "settings_updates": "Updates",
-        "settings_recovery": "Recovery",
-        "settings_lost_and_found": "Lost+Found",
-        "settings_advanced": "Advanced",
-        # Settings dialog - Tab descriptions
-        "settings_general_desc": "Configure display name, language, and theme preferences for the application.",
-        "settings_security_desc": "Set the encryption mode and authentication method for your secure drive.",
-        "settings_keyfile_desc": "Manage keyfile paths for encryption and GPG-protected authentication.",
-        "settings_windows_desc": "Windows-specific settings including mount drive letter and VeraCrypt location.",
-        "settings_unix_desc": "Linux and macOS settings including mount point directory.",
-        "settings_updates_desc": "Configure automatic update checking and server settings.",
-        "settings_recovery_desc": "Set up Shamir Secret Sharing recovery options to recover access if keys are lost.",
-        "settings_lost_and_found_desc": "Display a contact message on the drive for recovery if lost.",
-        "settings_advanced_desc": "Technical settings for encryption parameters and integrity verification.",
-        # BUG-20251221-036: Settings dialog - Group box titles
-        "group_drive_identification": "Drive Identification",
-        "group_appearance": "Appearance",
-        "group_timestamps": "Timestamps",
-        "group_security_mode": "Security Mode",
-        "group_keyfile_configuration": "Keyfile Configuration",
-        "group_gpg_configuration": "GPG Configuration",
-        "group_emergency_recovery_kit": "Emergency Recovery Kit",
-        "group_verification": "Verification",
-        "group_verification_status": "Verification Status",
-        "group_software_integrity": "Software Integrity",
-        "group_remote_verification": "Remote Verification",
-        "group_gpg_kdf_parameters": "GPG KDF Parameters",
-        "group_metadata": "Metadata",
-        "settings_restart_not_required": "✓ Changes applied immediately (no restart required)",
-        "label_mode": "Mode",
-        "label_encrypted_keyfile": "Encrypted keyfile",
-        "label_volume_path": "Volume path",
-        "label_mount_letter": "Mount letter",
-        "label_veracrypt_path": "VeraCrypt path",
-        "label_mount_point": "Mount point",
-        "label_source_type": "Source type",
-        "label_server_url": "Server URL",
-        "label_local_root": "Local root",
-        "error_invalid_mount_letter": "Mount letter must be a single A–Z character.",
-        "error_save_failed": "Could not save config.json:",
-        "title_invalid_mount_letter": "Invalid Mount Letter",
-        "title_save_failed": "Save Failed",
-        "title_error": "Error",
-        "error_apply_theme": "Failed to apply theme: {error}",
-        "error_apply_language": "Failed to apply language: {error}",
-        # Settings dialog - Additional fields (schema-driven UI)
-        "label_drive_id": "Drive ID",
-        "label_drive_name": "Drive Name",
-        "label_setup_date": "Setup Date",
-        "label_last_password_change": "Last Password Change",
-        "label_last_verified": "Last Verified",
-        "label_plain_keyfile": "Plain Keyfile",
-        "label_seed_gpg_path": "GPG Seed File",
-        "label_kdf": "Key Derivation Function",
-        "label_pw_encoding": "Password Encoding",
-        "label_recovery_enabled": "Enable Recovery Kit",
-        "label_recovery_share_count": "Recovery Share Count",
-        "label_recovery_threshold": "Recovery Threshold",
-        "label_lost_and_found_enabled": "Enable Lost & Found",
-        "label_lost_and_found_message": "Return Message",
-        "label_verification_overridden": "Override Verification",
-        "label_integrity_signed": "Integrity Signed",
-        "label_signing_key_fpr": "Signing Key Fingerprint",
-        "label_salt_b64": "Salt (Base64)",
-        "label_hkdf_info": "HKDF Info",
-        "label_schema_version": "Schema Version",
-        "label_version": "Version",
-        # Tooltips for settings fields
-        "tooltip_drive_id": "Unique identifier for this drive (read-only)",
-        "tooltip_drive_name": "Custom name for this drive",
-        "tooltip_language": "User interface language",
-        "tooltip_theme": "Color scheme for the interface",
-        "tooltip_mode": "Security mode: password-only, keyfile, or YubiKey/GPG",
-        "tooltip_encrypted_keyfile": "Path to GPG-encrypted keyfile (for GPG modes)",
-        "tooltip_plain_keyfile": "Path to unencrypted keyfile (for plain keyfile mode)",
-        "tooltip_seed_gpg_path": "Path to GPG seed file for password derivation",
-        "tooltip_kdf": "Key derivation function for GPG password mode",
-        "tooltip_pw_encoding": "Character encoding for password (UTF-8 recommended)",
-        "tooltip_windows_volume_path": "Windows volume GUID or device path",
-        "tooltip_mount_letter": "Drive letter to mount as (A-Z)",
-        "tooltip_veracrypt_path": "Path to VeraCrypt.exe executable",
-        "tooltip_unix_volume_path": "Unix device path (e.g., /dev/sdb2)",
-        "tooltip_mount_point": "Unix mount point directory",
-        # BUG-20251221-037: Mount point fallback i18n keys
-        "label_allow_mount_fallback": "Auto-use alternative mount point when occupied",
-        "tooltip_allow_mount_fallback": "When enabled, automatically tries alternative drive letters (Windows) or mount directories (Unix) if the configured one is unavailable. Recommended to avoid mount failures.",
-        "error_mount_point_occupied_fallback_disabled": "Mount point {mount_point} is already in use.\n\nTo avoid this error in future, enable 'Auto-use alternative mount point' in Settings → {os_tab} tab.",
-        "error_mount_point_all_occupied": "Could not find an available mount point after 3 attempts.\n\nAll drive letters D-Z are in use (Windows) or mount point alternatives failed (Unix).\n\nThis is a mount point issue, NOT a credential problem.",
-        "warning_mount_fallback_used": "Configured mount point {original} was unavailable.\nUsing {fallback} instead. Config updated.",
-        "tooltip_recovery_enabled": "Enable emergency recovery kit generation",
-        "tooltip_recovery_share_count": "Number of recovery shares to generate",
-        "tooltip_recovery_threshold": "Minimum shares needed for recovery",
-        "tooltip_lost_and_found_enabled": "Enable return message if drive is lost",
-        "tooltip_lost_and_found_message": "Message displayed if drive is found",
-        "tooltip_source_type": "Update source: local directory or server URL",
-        "tooltip_server_url": "Server URL for updates",
-        "tooltip_local_root": "Local directory containing update files",
-        "hint_update_local_title": "About Local Updates",
-        "hint_update_local_body": "Select either: (1) the directory containing a .smartdrive/ folder (e.g., H:\\ or C:\\MyDev\\), or (2) a .smartdrive/ folder directly. The .smartdrive/ will be auto-detected. User data (recovery/, keys/, integrity/, config.json) is automatically protected. Development files (.git, tests, helper/) are excluded.",
-        # CHG-20251222-016: Update action section i18n keys
-        "update_action_section_title": "Update Actions",
-        "btn_run_update": "Run Update",
-        "tooltip_run_update": "Execute update from configured source",
-        "label_last_update": "Last Update:",
-        "label_last_update_source": "Source:",
-        "update_never": "Never",
-        "update_source_none": "Not configured",
-        "tooltip_verification_overridden": "Bypass integrity verification (dangerous!)",
-        "tooltip_integrity_signed": "Drive integrity has been cryptographically signed",
-        "tooltip_signing_key_fpr": "GPG key fingerprint used for signing",
-        "tooltip_salt_b64": "Cryptographic salt for key derivation",
-        "tooltip_hkdf_info": "Context string for HKDF key derivation",
-        # Integrity tab (CHG-20251220-002)
-        "label_integrity_status": "Integrity Status:",
-        "tooltip_integrity_status": "Shows whether scripts have been verified against signed hash",
-        # CHG-20251222-014: OS-specific tab tooltip
-        "tooltip_tab_disabled_other_os": "This tab is for a different operating system",
-        # Popup dialogs
-        "popup_keyfile_required_title": "Keyfile Required",
-        "popup_keyfile_required_body": "Please select a keyfile for password + keyfile mode.",
-        "popup_password_required_title": "Password Required",
-        "popup_password_required_body": "Please enter your VeraCrypt password.",
-        "popup_recovery_title": "Password Recovery",
-        "popup_recovery_available_body": "Recovery kit is available for this drive!\n\nTo recover access to your encrypted volume:\n\n1. Use the SmartDrive CLI: python smartdrive.py\n2. Select option 6: Recovery Kit\n3. Follow the recovery instructions\n\nOr contact your system administrator.",
-        "popup_recovery_unavailable_body": "No recovery kit is currently available for this drive.\n\nTo set up password recovery:\n\n1. Use the SmartDrive CLI: python smartdrive.py\n2. Select option 6: Recovery Kit\n3. Choose 'Generate Recovery Kit'\n\nOr contact your system administrator.",
-        # Recovery tab - Phrase input and recovery actions
-        "recovery_section_title": "🔐 Emergency Recovery",
-        "recovery_instructions": "Enter your 24-word recovery phrase to recover access to your encrypted volume. You can also provide a recovery container file if you have one.",
-        "label_recovery_phrase": "Recovery Phrase (24 words):",
-        "placeholder_recovery_phrase": "Enter 24 words separated by spaces...",
-        "label_recovery_container": "Recovery Container (optional):",
-        "btn_browse_container": "Browse...",
-        "btn_recover_credentials": "🔓 Recover Credentials",
-        "recovery_status_ready": "Enter your recovery phrase and click 'Recover Credentials'",
-        "recovery_status_validating": "Validating recovery phrase...",
-        "recovery_status_decrypting": "Decrypting recovery container...",
-        "recovery_status_success": "✅ Recovery successful! Credentials recovered.",
-        "recovery_status_failed": "❌ Recovery failed: {error}",
-        "recovery_result_title": "Recovered Credentials",
-        "recovery_result_password": "Password:",
-        "recovery_result_keyfile": "Keyfile:",
-        "recovery_result_mode": "Security Mode:",
-        "recovery_result_copy_password": "📋 Copy Password",
-        "recovery_result_save_keyfile": "💾 Save Keyfile",
-        "recovery_copied_to_clipboard": "Password copied to clipboard (auto-clears in 30 seconds)",
-        "recovery_keyfile_saved": "Keyfile saved to: {path}",
-        "recovery_phrase_invalid": "Invalid recovery phrase. Please check all 24 words.",
-        "recovery_container_not_found": "Recovery container not found. Please select the container file.",
-        "recovery_no_kit_configured": "No recovery kit is configured for this drive.",
-        "recovery_generate_first": "Please generate a recovery kit first using Settings or CLI.",
-        # Recovery security enforcement (BUG-20251220-005)
-        "recovery_already_used": "⚠️ This recovery kit has ALREADY BEEN USED.\n\nRecovery kits are ONE-TIME USE ONLY.\nYou must restore from a different backup.",
-        "recovery_status_invalidating": "Invalidating recovery kit (one-time use)...",
-        "recovery_status_complete": "✅ Recovery complete! Kit has been PERMANENTLY INVALIDATED.",
-        "recovery_rekey_required_title": "⚠️ MANDATORY: Change Your Credentials",
-        "recovery_rekey_required_body": "Your recovery phrase was EXPOSED during recovery.\n\nAnyone with that phrase could access this volume.\nYou MUST change your credentials NOW.\n\nClick 'Rekey Now' to change credentials, or 'Later' to do it via CLI.",
-        "recovery_rekey_now": "🔑 Rekey Now",
-        "recovery_rekey_later": "Later (CLI)",
-        "recovery_rekey_skipped_warning": "⚠️ YOU SKIPPED CREDENTIAL CHANGE!\nRun 'python rekey.py' as soon as possible!",
-        # Post-recovery mount enforcement (BUG-20251220-007)
-        "mount_blocked_rekey_required_title": "Mount Blocked: Rekey Required",
-        "mount_blocked_rekey_required_body": "A recovery was performed at: {recovery_time}\n\nYou MUST change your credentials before mounting.\n\nThis is a SECURITY REQUIREMENT:\n• Your recovery phrase was exposed during recovery\n• Anyone with that phrase could access this volume\n\nUse Settings → Security → Change Password to rekey.",
-        "mount_warn_rekey_title": "Security Warning: Rekey Pending",
-        "mount_warn_rekey_body": "A recovery was performed at: {recovery_time}\n\nProceeding without rekey is a SECURITY RISK!\n\nType 'INSECURE' to mount anyway:",
-        # Recovery checkbox UX fix (BUG-20251220-006)
-        "label_recovery_status": "Recovery Kit Status:",
-        "recovery_kit_available": "✅ Recovery kit available and ready",
-        "recovery_kit_used": "⚠️ Recovery kit has been used (generate new one)",
-        "recovery_kit_not_configured": "❌ No recovery kit configured",
-        "recovery_html_warning": "HTML recovery file still on drive! Delete after printing for security.",  # BUG-014
-        "tooltip_recovery_status": "Shows whether a valid recovery kit exists for this drive.\nGenerate a kit using the CLI: python recovery.py generate",
-        # Rekey dialog (CHG-20251220-001)
-        "settings_security": "Security",
-        "settings_security_desc": "Change credentials and manage security settings.",
-        "rekey_section_title": "🔑 Change Credentials",
-        "rekey_instructions": "Change your VeraCrypt volume password and/or keyfile. This will open VeraCrypt GUI to perform the actual credential change.",
-        "rekey_post_recovery_notice": "⚠️ REKEY REQUIRED: Your credentials were exposed during recovery. You must change them now.",
-        "btn_start_rekey": "🔑 Start Credential Change",
-        # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
-        "btn_verify_rekey": "✓ Verify New Credentials",
-        "btn_cancel_rekey": "✕ Cancel",
-        "rekey_instructions_veracrypt": "VeraCrypt GUI opened. In VeraCrypt:\n1. Tools → Change Volume Password\n2. Select Device → choose your volume\n3. Enter current password (use 'Copy Old Password' above)\n4. Enter new password (use 'Copy New Password' above)\n5. Click OK to apply\n\nAfter VeraCrypt confirms success, click 'Verify New Credentials' below.",
-        "rekey_verifying": "Verifying new credentials via mount test...",
-        "rekey_verification_success": "✓ New credentials verified! Finalizing rekey...",
-        "rekey_verification_failed": "✕ Credential verification failed. Please check your new password/keyfile.",
-        "rekey_cancelled": "Credential change cancelled.",
-        # BUG-20251221-039: Copy credential buttons
-        # CHG-20251222-018: Enhanced tooltips for clarity on old vs new credentials
-        "btn_copy_old_password": "📋 Copy Old Password",
-        "btn_copy_new_password": "📋 Copy New Password",
-        "tooltip_copy_old_password": "Derive and copy CURRENT password using EXISTING GPG seed. For GPG modes, uses your hardware key to decrypt the current seed.gpg file. (30s TTL)",
-        "tooltip_copy_new_password": "Derive and copy NEW password using NEW GPG seed specified above. Ensure a new seed.gpg is generated or selected before copying. (30s TTL)",
-        # CHG-20251223-001: Post-recovery tooltip for disabled Copy Old Password button
-        "tooltip_copy_old_password_post_recovery": "Disabled: After recovery, use the password from your recovery kit. The GPG seed may be missing or corrupted.",
-        "rekey_gpg_seed_hint": "For GPG modes: The 'New GPG Seed' above defines what password will be derived. Generate a new seed.gpg first, then use 'Copy New Password'.",
-        "copy_password_title": "Copy Password",
-        "rekey_status_ready": "Click 'Start Credential Change' to begin.",
-        "rekey_status_preparing": "Preparing credentials...",
-        "rekey_status_opening_veracrypt": "Opening VeraCrypt GUI...",
-        "rekey_status_awaiting_confirmation": "Complete the credential change in VeraCrypt, then click 'Verify'.",
-        "rekey_status_verifying": "Verifying new credentials...",
-        "rekey_validating": "Validating new credentials...",
-        "rekey_verifying_mount": "Verifying credentials via mount...",
-        "rekey_credentials_verified": "New credentials verified successfully!",
-        "rekey_testing_mount": "Testing mount with new credentials...",
-        "rekey_validation_success": "Validation successful - unmounting...",
-        "rekey_status_success": "✅ Credentials changed successfully!",
-        "rekey_status_failed": "❌ Verification failed. Please try again.",
-        "btn_verify_rekey": "✓ Verify New Credentials",
-        "rekey_current_password_label": "Current Password:",
-        "rekey_current_password_auto": "(Provided automatically)",
-        "rekey_new_password_label": "New Password:",
-        "rekey_confirm_password_label": "Confirm Password:",
-        # Mode selection during rekey (CHG-20251221-001)
-        "rekey_current_mode_label": "Current Security Mode:",
-        "rekey_target_mode_label": "New Security Mode:",
-        "rekey_mode_same_tooltip": "Keep current mode - only change password/keyfile",
-        "rekey_mode_pw_only": "🔒 Password Only",
-        "rekey_mode_pw_keyfile": "🔑 Password + Keyfile",
-        "rekey_mode_pw_gpg_keyfile": "🔐 YubiKey + Password",
-        "rekey_mode_gpg_pw_only": "🔐 GPG Derived Password",
-        "rekey_new_keyfile_label": "New Keyfile Path:",
-        "rekey_new_gpg_seed_label": "New GPG Seed File:",
-        "btn_browse_keyfile": "Browse...",
-        # CHG-20251221-003: GPG seed generation button
-        "btn_generate_gpg_seed": "Generate",
-        "tooltip_generate_gpg_seed": "Generate a new GPG-encrypted seed for password derivation. Requires YubiKey/GPG card.",
-        "gpg_seed_generate_title": "Generate GPG Seed",
-        "gpg_seed_generate_confirm": "This will generate a new cryptographically secure seed and encrypt it with your GPG key.\n\nPlease ensure your YubiKey/GPG card is inserted.\n\nContinue?",
-        "gpg_seed_generate_success": "GPG seed generated successfully!",
-        "gpg_seed_generate_fail": "Failed to generate GPG seed",
-        "gpg_seed_derive_info": "The password derived from this seed will be shown.\nCopy it to use as your new VeraCrypt password.",
-        # CHG-20251223-032: Multi-key authentication
-        "gpg_key_auth_title": "Authenticate GPG Key",
-        "gpg_key_auth_prompt": "To ensure you have access to this key, please authenticate.\n\nKey: {fingerprint}\n\nYou may be prompted for your PIN.",
-        "gpg_key_auth_success": "Key authenticated successfully.",
-        "gpg_key_auth_fail": "Authentication failed for key: {fingerprint}",
-        "gpg_key_auth_skip_prompt": "Do you want to skip authentication for this key?\n\n⚠️ WARNING: If you skip, you may configure a key you don't possess.\nThis is acceptable when delegating access to another person.",
-        "gpg_key_auth_skipped": "Authentication skipped for key: {fingerprint}",
-        # CHG-20251221-008: GPG key selection dialog
-        "gpg_key_select_title": "Select GPG Key for Encryption",
-        "gpg_key_select_hint": "Select a hardware key from the list below, or manually enter a fingerprint or email if your key is not listed.",
-        "gpg_key_select_label": "GPG Key:",
-        "gpg_key_select_placeholder": "Select or enter key...",
-        "gpg_key_select_manual": "Manual entry...",
-        "gpg_key_select_none": "No GPG secret keys found",
-        "gpg_key_manual_label": "Enter fingerprint or email:",
-        # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
-        "gpg_key_select_hint_multi": "Select one or more hardware keys from the list below for redundancy.\nYou can also manually enter additional fingerprints (comma or newline separated).",
-        "gpg_key_manual_label_multi": "Additional fingerprints:",
-        "gpg_key_select_placeholder_multi": "Enter fingerprints (comma or newline separated)...",
-        "gpg_key_select_none_selected": "Please select at least one GPG key or enter a fingerprint manually.",
-        "rekey_mode_change_warning": "⚠️ Changing security mode will update how you authenticate to this drive.",
-        "rekey_gpg_seed_instructions": "For GPG modes, select the encrypted seed file for password derivation.",
-        # Integrity verification (CHG-20251220-002)
-        "settings_integrity": "Integrity",
-        "settings_integrity_desc": "Verify software integrity and sign scripts.",
-        "integrity_section_title": "🔐 Software Integrity",
-        "integrity_instructions": "Verify that scripts have not been modified since signing. Sign requires hardware key (YubiKey/GPG card).",
-        "btn_verify_local": "✓ Verify Integrity (Local)",
-        "btn_sign_scripts": "🔑 Sign Scripts",
-        "btn_verify_remote": "🌐 Verify (Remote)",
-        "integrity_status_ready": "Click 'Verify' to check script integrity.",
-        "integrity_status_checking": "Checking integrity...",
-        "integrity_status_signing": "Signing scripts with hardware key...",
-        "integrity_status_pass": "✅ Integrity verified! Scripts are authentic.",
-        "integrity_status_fail": "❌ Integrity check FAILED! Scripts may have been modified.",
-        "integrity_status_no_manifest": "⚠️ No integrity manifest found. Scripts are unsigned.",
-        "integrity_status_sign_success": "✅ Scripts signed successfully!",
-        "integrity_status_sign_fail": "❌ Signing failed. Ensure hardware key is inserted.",
-        "integrity_result_hash": "Hash: {hash}",
-        "integrity_result_signer": "Signed by: {signer}",
-        "integrity_remote_url_label": "Server URL:",
-        "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
-        "integrity_status_remote_checking": "Sending verification request to server...",
-        "integrity_status_remote_success": "✅ Remote verification passed!",
-        "integrity_status_remote_fail": "❌ Remote verification failed: {error}",
-        "integrity_status_no_server_url": "⚠️ No server URL configured. Set it in Settings → Integrity.",
-        "label_integrity_server_url": "Verification Server URL",
-        "tooltip_integrity_server_url": "URL of the remote verification server (e.g., https://verify.example.com/api/check)",
-        "popup_unmount_failed_title": "Unmount Failed",
-        "popup_mount_failed_title": "Mount Failed",
-        "popup_update_not_possible_title": "Update Not Possible",
-        "popup_update_confirm_title": "Confirm Update",
-        "popup_update_direction": "Direction",
-        "popup_update_source": "Source",
-        "popup_update_destination": "Destination",
-        "popup_update_files_to_update": "Files to Update",
-        "popup_update_protected_items": "Protected Items (Never Overwritten)",
-        "popup_update_protected_list": "The following user data is automatically protected: {items}",
-        "popup_update_warning": "Warning",
-        "popup_update_warning_body": "This will overwrite existing script files in .smartdrive/ directory.",
-        "popup_update_confirm_message": "About to run UPDATE ({direction}).\n\nFROM:\n  {src_root}\n\nTO:\n  {dst_root}\n\nItems:\n  - {items}\n\nMethod: {method}\n\nThis will overwrite existing files. Continue?",
-        "popup_update_config_title": "Update Configuration",
-        "popup_update_config_body": "Update source is not configured. Please set it in Settings.",
-        "popup_update_complete_title": "Update Complete",
-        "popup_update_complete_body": "Update finished successfully. Please restart the application.",
-        "popup_update_failed_title": "Update Failed",
-        "popup_update_failed_body": "Update failed:\n\n{error}",
-        "popup_update_timeout_title": "Update Timeout",
-        "popup_update_timeout_body": "Update did not complete within 120 seconds.",
-        "popup_update_error_title": "Update Error",
-        "popup_update_error_body": "Failed to run update:\n\n{error}",
-        "popup_cli_failed_title": "CLI Launch Failed",
-        "popup_cli_failed_body": "Could not open CLI:\n\n{error}",
-        # Update configuration error messages
-        "error_update_server_url_not_configured": "Server URL is not configured.\\n\\nGo to Settings to configure the update URL.",
-        "error_update_local_root_not_configured": "Local update directory is not configured.\\n\\nGo to Settings to configure the local update root.",
-        "error_update_local_root_not_found": "Local update directory not found:\\n\\n{path}\\n\\nCheck Settings to verify the path.",
-        "error_update_install_dir_not_found": "Installation directory not found:\\n\\n{path}",
-        "error_update_unknown_source_type": "Unknown update source type: {type}",
-        # Hardware key error messages
-        "error_hardware_key_missing_title": "Hardware Key Required",
-        "error_hardware_key_missing_body": "Hardware key (YubiKey/GPG card) not detected. Please insert your hardware key and try again.",
-        # Theme names (for theme dropdown)
-        "theme_brand": "Brand",
-        "theme_green": "Green",
-        "theme_blue": "Blue",
-        "theme_rose": "Rose",
-        "theme_slate": "Slate",
-        "label_theme": "Theme",
-        # File explorer buttons
-        "tooltip_open_launcher_drive": "Open launcher drive",
-        "tooltip_open_mounted_volume": "Open mounted volume",
-        "popup_open_failed_title": "Open Failed",
-        "popup_open_failed_body": "Could not open file explorer:\n\n{path}\n\n{error}",
-        # About section (CHG-20251221-012)
-        "settings_about": "About",
-        "label_version": "Version:",
-        "label_build_id": "Build ID:",
-        "label_build_dev": "Development",
-        "label_compat_version": "Config Version:",
-        # Recovery kit generation (CHG-20251221-001)
-        "recovery_generate_section_title": "Generate Recovery Kit",
-        "recovery_generate_instructions": "Generate a new recovery kit to create an encrypted backup of your credentials. This is useful if your original kit was lost, damaged, or if you want a new copy after changing credentials.",
-        "btn_generate_recovery_kit": "🔐 Generate New Recovery Kit",
-        "recovery_generate_status_ready": "Click 'Generate New Recovery Kit' to create a new kit.",
-        "recovery_generate_status_deriving": "Deriving credentials from hardware key...",
-        "recovery_generate_status_verifying": "Verifying credentials with VeraCrypt...",
-        "recovery_generate_status_running": "Generating recovery kit...",
-        "recovery_generate_status_success": "✅ Recovery kit generated successfully!",
-        "recovery_generate_status_failed": "❌ Recovery kit generation failed: {error}",
-        "recovery_generate_confirm_title": "Generate Recovery Kit",
-        "recovery_generate_confirm_body": "This will generate a new recovery kit with an encrypted backup of your credentials.\n\nDo you want to continue?",
-        "recovery_generate_regen_confirm_title": "Regenerate Recovery Kit",
-        "recovery_generate_regen_confirm_body": "⚠️ WARNING: This will create a NEW recovery kit.\n\nYour EXISTING recovery kit will be PERMANENTLY INVALIDATED.\n\nDo you want to continue?",
-        "recovery_generate_security_warning_title": "Security Warning: Recovery Kit Regeneration",
-        "recovery_generate_security_warning_body": "⚠️ SECURITY WARNING ⚠️\n\nA recovery kit already exists. Creating a new one will:\n\n• Invalidate the previous kit\n• Create a NEW access path to your encrypted data\n• Anyone with the new kit can access your data\n\nOnly proceed if you understand the security implications.\n\nDo you want to regenerate?",
-        "recovery_generate_password_prompt_title": "Enter Volume Password",
-        "recovery_generate_password_prompt_body": "Please enter your volume password for recovery kit generation:",
-        "recovery_generate_success_title": "Recovery Kit Generated",
-        "recovery_generate_success_body": "Your recovery kit has been generated!\n\nLocation: {path}\n\n⚠️ IMPORTANT:\n• Print the HTML file immediately\n• Store in a secure physical location\n• Delete the HTML file from the drive after printing",
-    },
-    "de": {
-        # Window titles
-        "window_title": "KeyDrive",
-        "settings_window_title": "Einstellungen",
-        # Button labels
-        "btn_mount": "🔓 Einbinden",
-        "btn_unmount": "🔒 Aushängen",
-        "btn_cancel_auth": "❌ Abbrechen",
-        "btn_confirm_mount": "✅ Bestätigen",
-        "btn_tools": "⚙️",
-        "btn_close": "✕",
-        "btn_save": "Speichern",
-        "btn_cancel": "Abbrechen",
-        "btn_confirm": "Bestätigen",
-        "btn_ok": "OK",
-        "warning": "Warnung",
-        "settings_tab_security": "Sicherheit",
-        # CHG-20251223-055: Reload config button for non-modal settings
-        "btn_reload_config": "↻ Konfig neu laden",
-        "tooltip_reload_config": "Konfiguration von Festplatte neu laden (verwirft ungespeicherte Änderungen)",
-        # Status messages
-        "status_config_not_found": "Konfiguration nicht gefunden",
-        "status_volume_mounted": "Volume eingebunden",
-        "status_volume_not_mounted": "Volume nicht eingebunden",
-        "status_mounting": "⏳ Volume wird eingebunden...",
-        "status_mounting_gpg": "⏳ Volume wird eingebunden (GPG-Authentifizierung)...",
-        "status_unmounting": "⏳ Volume wird ausgehängt...",
-        "status_mount_success": "✅ Volume erfolgreich eingebunden",
-        "status_mount_failed": "❌ Einbinden fehlgeschlagen",
-        "status_unmount_success": "✅ Volume erfolgreich ausgehängt",
-        "status_unmount_failed": "❌ Aushängen fehlgeschlagen",
-        # Info labels
-        "info_unavailable": "Info nicht verfügbar",
-        "keyfile_selected_one": "1 Schlüsseldatei ausgewählt",
-        "keyfile_selected_many": "{count} Schlüsseldateien ausgewählt",
-        "keyfile_drop_hint": "Schlüsseldateien hier ablegen oder klicken zum Auswählen",
-        "keyfile_drop_supports_multiple": "Unterstützt mehrere Schlüsseldateien",
-        "label_show_password": "Passwort anzeigen",
-        # Size formatting
-        "size_free": "Frei: {size}",
-        # Icons/placeholders
-        "icon_drive": "🚀",
-        # Tooltips
-        "tooltip_exit": "SmartDrive beenden",
-        "tooltip_settings": "Erweiterte Werkzeuge und Einstellungen",
-        # Labels
-        "label_product_name": "Produktname",
-        "label_preview": "Vorschau:",
-        "label_password": "Passwort:",
-        "label_keyfile": "Schlüsseldatei:",
-        "label_hardware_key_hint": "💡 Hardware-Schlüssel kann für Authentifizierung erforderlich sein",
-        "label_forgot_password": "Passwort vergessen?",
-        # Placeholder text
-        "placeholder_password": "Geben Sie Ihr VeraCrypt-Passwort ein...",
-        # Menu items
-        "menu_settings": "⚙️ Einstellungen",
-        "menu_rekey": "🔑 Passwort/Schlüssel ändern",
-        "menu_update": "⬇️ Skripte aktualisieren",
-        "menu_recovery": "💾 Wiederherstellungs-Kit",
-        "menu_about": "ℹ️ Über",
-        "menu_cli": "💻 CLI öffnen",
-        "menu_exit": "⏻ Beenden",
-        "menu_clear_keyfiles": "Schlüsseldateien löschen",
-        "menu_switch_drive": "🔀 Laufwerk wechseln...",
-        "menu_switch_drive_browse": "📂 Durchsuchen...",
-        # CHG-20251221-042: Remote Control Mode menu items (German)
-        "menu_manage_remote": "🌐 Fernsteuerung...",
-        "menu_manage_remote_browse": "📂 Fernbedienung .smartdrive suchen...",
-        "menu_exit_remote": "🏠 Fernmodus beenden",
-        "remote_active_label": "Fernsteuerung aktiv",
-        "remote_click_to_end": "Klicken zum Beenden",
-        "remote_validation_failed_title": "Fernvalidierung fehlgeschlagen",
-        "remote_validation_failed_body": "Verbindung zum entfernten Laufwerk nicht möglich:\n\n{error}",
-        "remote_disconnected_title": "Entferntes Laufwerk getrennt",
-        "remote_disconnected_body": "Das entfernte Laufwerk ({drive}:) wurde getrennt.\n\nRückkehr zum lokalen Modus.",
-        "remote_confirm_title": "Fernsteuerungsmodus aktivieren",
-        "remote_confirm_body": "Verbindung zu entferntem .smartdrive herstellen:\n{path}\n\nIm Fernmodus können Sie nur das entfernte Volumen ein-/aushängen.\nEinstellungen, Updates und CLI-Zugriff sind deaktiviert.",
-        "remote_mode_disabled_title": "Fernmodus aktiv",
-        "remote_mode_disabled_cli": "CLI-Zugriff ist im Fernmodus deaktiviert.",
-        "remote_mode_disabled_settings": "Einstellungen sind im Fernmodus deaktiviert. Beenden Sie zuerst den Fernmodus.",
-        "remote_mode_disabled_update": "Updates sind im Fernmodus deaktiviert. Beenden Sie zuerst den Fernmodus.",
-        "dialog_select_keyfiles": "Schlüsseldatei(en) auswählen",
-        # Multi-drive context (CHG-20251221-026)
-        "label_launcher_root": "Startlaufwerk:",
-        "group_drive_context": "Laufwerkskontext",
-        "tooltip_launcher_root": "Das Laufwerk mit diesem .smartdrive-Ordner",
-        # Drive safety context (CHG-20251221-040)
-        "label_os_drive": "Betriebssystem-Laufwerk:",
-        "tooltip_os_drive": "Laufwerk mit dem Betriebssystem (kann nicht neu partitioniert werden)",
-        "label_instantiation_drive": "Gestartet von:",
-        "tooltip_instantiation_drive": "Laufwerk, von dem diese Instanz gestartet wurde (kann nicht neu partitioniert werden)",
-        "switch_drive_title": "Laufwerkskontext wechseln",
-        "switch_drive_confirm": "Konfiguration wechseln von:\n{path}\n\nAlle Einstellungen werden von diesem Laufwerk neu geladen.",
-        "switch_drive_invalid_path": "Ungültiger .smartdrive-Ordner. Keine config.json gefunden.",
-        "switch_drive_select_folder": ".smartdrive-Ordner auswählen",
-        "version_incompatible_title": "Versionskompatibilitätswarnung",
-        "version_incompatible_error": "Wechsel zu diesem Laufwerk nicht möglich:\n\n{message}\n\nDas Konfigurationsformat ist mit dieser Softwareversion nicht kompatibel.",
-        "version_incompatible_warning": "{message}\n\nZiel: {path}\n\nMöchten Sie trotzdem fortfahren?",
-        # Tray messages
-        "tray_minimized_message": "Läuft im Hintergrund. Klicken Sie auf das Tray-Symbol zum Wiederherstellen.",
-        "tray_unavailable_message": "Systemleiste ist nicht verfügbar.\n\nMöchten Sie die Anwendung beenden?",
-        "tray_tooltip": "{name} ({id})",
-        # Status messages
-        "status_deriving_yubikey_password": "Passwort wird vom YubiKey abgeleitet...",
-        "status_checking_mount": "Mount-Status wird überprüft...",
-        "status_unmounting_for_rekey": "Volume wird für Rekey ausgehängt...",
-        "status_decrypting_keyfile": "Schlüsseldatei wird mit YubiKey entschlüsselt...",
-        # Worker messages (keys for structured errors)
-        "worker_mount_script_not_found": "Mount-Skript nicht gefunden",
-        "worker_mount_success": "Volume erfolgreich eingebunden",
-        "worker_mount_failed": "Einbinden fehlgeschlagen: {error}",
-        "worker_mount_timeout": "Mount-Vorgang zeitüberschreitung",
-        "worker_mount_error": "Mount-Fehler: {error}",
-        "worker_unmount_script_not_found": "Unmount-Skript nicht gefunden",
-        "worker_unmount_success": "Volume erfolgreich ausgehängt",
-        "worker_unmount_failed": "Aushängen fehlgeschlagen: {error}",
-        "worker_unmount_timeout": "Unmount-Vorgang Zeitüberschreitung",
-        "worker_unmount_error": "Unmount-Fehler: {error}",
-        # Settings dialog - Tab names
-        "settings_language": "Sprache",
-        "settings_general": "Allgemein",
-        "settings_security": "Sicherheit",
-        "settings_keyfile": "Schlüsseldatei",
-        "settings_windows": "Windows",
-        "settings_unix": "Unix",
-        "settings_updates": "Aktualisierungen",
-        "settings_recovery": "Wiederherstellung",
-        "settings_lost_and_found": "Fundsachen",
-        "settings_advanced": "Erweitert",
-        # Settings dialog - Tab descriptions
-        "settings_general_desc": "Konfigurieren Sie Anzeigename, Sprache und Design-Einstellungen.",
-        "settings_security_desc": "Verschlüsselungsmodus und Authentifizierungsmethode für Ihr sicheres Laufwerk.",
-        "settings_keyfile_desc": "Verwalten Sie Schlüsseldatei-Pfade für Verschlüsselung und GPG-Authentifizierung.",
-        "settings_windows_desc": "Windows-spezifische Einstellungen inkl. Laufwerksbuchstabe und VeraCrypt-Pfad.",
-        "settings_unix_desc": "Linux- und macOS-Einstellungen inkl. Einhängepunkt-Verzeichnis.",
-        "settings_updates_desc": "Automatische Update-Prüfung und Server-Einstellungen konfigurieren.",
-        "settings_recovery_desc": "Shamir Secret Sharing Wiederherstellungsoptionen für Notfallzugriff einrichten.",
-        "settings_lost_and_found_desc": "Kontaktnachricht auf dem Laufwerk für Rückgabe bei Verlust anzeigen.",
-        "settings_advanced_desc": "Technische Einstellungen für Verschlüsselungsparameter und Integritätsprüfung.",
-        # BUG-20251221-036: Settings dialog - Group box titles (German)
-        "group_drive_identification": "Laufwerksidentifikation",
-        "group_appearance": "Erscheinungsbild",
-        "group_timestamps": "Zeitstempel",
-        "group_security_mode": "Sicherheitsmodus",
-        "group_keyfile_configuration": "Schlüsseldatei-Konfiguration",
-        "group_gpg_configuration": "GPG-Konfiguration",
-        "group_emergency_recovery_kit": "Notfall-Wiederherstellungs-Kit",
-        "group_verification": "Verifizierung",
-        "group_verification_status": "Verifizierungsstatus",
-        "group_software_integrity": "Software-Integrität",
-        "group_remote_verification": "Remote-Verifizierung",
-        "group_gpg_kdf_parameters": "GPG-KDF-Parameter",
-        "group_metadata": "Metadaten",
-        "settings_restart_not_required": "✓ Änderungen sofort übernommen (kein Neustart erforderlich)",
-        "label_mode": "Modus",
-        "label_encrypted_keyfile": "Verschlüsselte Schlüsseldatei",
-        "label_volume_path": "Volume-Pfad",
-        "label_mount_letter": "Laufwerksbuchstabe",
-        "label_veracrypt_path": "VeraCrypt-Pfad",
-        "label_mount_point": "Einhängepunkt",
-        "label_source_type": "Quellentyp",
-        "label_server_url": "Server-URL",
-        "label_local_root": "Lokaler Pfad",
-        "error_invalid_mount_letter": "Laufwerksbuchstabe muss ein einzelnes Zeichen von A–Z sein.",
-        "error_save_failed": "Konnte config.json nicht speichern:",
-        "title_invalid_mount_letter": "Ungültiger Laufwerksbuchstabe",
-        "title_save_failed": "Speichern fehlgeschlagen",
-        "title_error": "Fehler",
-        "error_apply_theme": "Thema konnte nicht angewendet werden: {error}",
-        "error_apply_language": "Sprache konnte nicht angewendet werden: {error}",
-        # Popup dialogs
-        "popup_keyfile_required_title": "Schlüsseldatei erforderlich",
-        "popup_keyfile_required_body": "Bitte wählen Sie eine Schlüsseldatei für den Passwort + Schlüsseldatei-Modus.",
-        "popup_password_required_title": "Passwort erforderlich",
-        "popup_password_required_body": "Bitte geben Sie Ihr VeraCrypt-Passwort ein.",
-        "popup_recovery_title": "Passwort-Wiederherstellung",
-        "popup_recovery_available_body": "Wiederherstellungs-Kit ist für dieses Laufwerk verfügbar!\n\nUm Zugriff auf Ihr verschlüsseltes Volume wiederherzustellen:\n\n1. Verwenden Sie die SmartDrive CLI: python smartdrive.py\n2. Wählen Sie Option 6: Recovery Kit\n3. Folgen Sie den Wiederherstellungsanweisungen\n\nOder kontaktieren Sie Ihren Systemadministrator.",
-        "popup_recovery_unavailable_body": "Kein Wiederherstellungs-Kit ist derzeit für dieses Laufwerk verfügbar.\n\nUm Passwort-Wiederherstellung einzurichten:\n\n1. Verwenden Sie die SmartDrive CLI: python smartdrive.py\n2. Wählen Sie Option 6: Recovery Kit\n3. Wählen Sie 'Wiederherstellungs-Kit generieren'\n\nOder kontaktieren Sie Ihren Systemadministrator.",
-        # Recovery tab - Phrase input and recovery actions
-        "recovery_section_title": "🔐 Notfall-Wiederherstellung",
-        "recovery_instructions": "Geben Sie Ihre 24-Wort-Wiederherstellungsphrase ein, um Zugriff auf Ihr verschlüsseltes Volume wiederherzustellen. Sie können auch eine Wiederherstellungs-Container-Datei angeben, falls vorhanden.",
-        "label_recovery_phrase": "Wiederherstellungsphrase (24 Wörter):",
-        "placeholder_recovery_phrase": "Geben Sie 24 Wörter durch Leerzeichen getrennt ein...",
-        "label_recovery_container": "Wiederherstellungs-Container (optional):",
-        "btn_browse_container": "Durchsuchen...",
-        "btn_recover_credentials": "🔓 Zugangsdaten wiederherstellen",
-        "recovery_status_ready": "Geben Sie Ihre Wiederherstellungsphrase ein und klicken Sie auf 'Zugangsdaten wiederherstellen'",
-        "recovery_status_validating": "Validiere Wiederherstellungsphrase...",
-        "recovery_status_decrypting": "Entschlüssele Wiederherstellungs-Container...",
-        "recovery_status_success": "✅ Wiederherstellung erfolgreich! Zugangsdaten wiederhergestellt.",
-        "recovery_status_failed": "❌ Wiederherstellung fehlgeschlagen: {error}",
-        "recovery_result_title": "Wiederhergestellte Zugangsdaten",
-        "recovery_result_password": "Passwort:",
-        "recovery_result_keyfile": "Schlüsseldatei:",
-        "recovery_result_mode": "Sicherheitsmodus:",
-        "recovery_result_copy_password": "📋 Passwort kopieren",
-        "recovery_result_save_keyfile": "💾 Schlüsseldatei speichern",
-        "recovery_copied_to_clipboard": "Passwort in Zwischenablage kopiert (wird in 30 Sekunden gelöscht)",
-        "recovery_keyfile_saved": "Schlüsseldatei gespeichert unter: {path}",
-        "recovery_phrase_invalid": "Ungültige Wiederherstellungsphrase. Bitte überprüfen Sie alle 24 Wörter.",
-        "recovery_container_not_found": "Wiederherstellungs-Container nicht gefunden. Bitte wählen Sie die Container-Datei aus.",
-        "recovery_no_kit_configured": "Kein Wiederherstellungs-Kit für dieses Laufwerk konfiguriert.",
-        "recovery_generate_first": "Bitte generieren Sie zuerst ein Wiederherstellungs-Kit über Einstellungen oder CLI.",
-        # Recovery security enforcement (BUG-20251220-005)
-        "recovery_already_used": "⚠️ Dieses Wiederherstellungs-Kit wurde BEREITS VERWENDET.\\n\\nWiederherstellungs-Kits sind nur EINMAL VERWENDBAR.\\nSie müssen von einer anderen Sicherung wiederherstellen.",
-        "recovery_status_invalidating": "Wiederherstellungs-Kit wird ungültig gemacht (einmalige Verwendung)...",
-        "recovery_status_complete": "✅ Wiederherstellung abgeschlossen! Kit wurde DAUERHAFT UNGÜLTIG GEMACHT.",
-        "recovery_rekey_required_title": "⚠️ PFLICHT: Ändern Sie Ihre Zugangsdaten",
-        "recovery_rekey_required_body": "Ihre Wiederherstellungsphrase wurde während der Wiederherstellung OFFENGELEGT.\\n\\nJeder mit dieser Phrase könnte auf dieses Volume zugreifen.\\nSie MÜSSEN Ihre Zugangsdaten JETZT ändern.\\n\\nKlicken Sie auf 'Jetzt ändern' um fortzufahren, oder 'Später' für CLI.",
-        "recovery_rekey_now": "🔑 Jetzt ändern",
-        "recovery_rekey_later": "Später (CLI)",
-        "recovery_rekey_skipped_warning": "⚠️ SIE HABEN DIE ZUGANGSDATEN-ÄNDERUNG ÜBERSPRUNGEN!\\nFühren Sie 'python rekey.py' so bald wie möglich aus!",
-        # Post-recovery mount enforcement (BUG-20251220-007)
-        "mount_blocked_rekey_required_title": "Einbinden blockiert: Schlüsseländerung erforderlich",
-        "mount_blocked_rekey_required_body": "Eine Wiederherstellung wurde durchgeführt am: {recovery_time}\\n\\nSie MÜSSEN Ihre Zugangsdaten ändern bevor Sie einbinden können.\\n\\nDies ist eine SICHERHEITSANFORDERUNG:\\n• Ihre Wiederherstellungsphrase wurde während der Wiederherstellung offengelegt\\n• Jeder mit dieser Phrase könnte auf dieses Volume zugreifen\\n\\nVerwenden Sie Einstellungen → Sicherheit → Passwort ändern.",
-        "mount_warn_rekey_title": "Sicherheitswarnung: Schlüsseländerung ausstehend",
-        "mount_warn_rekey_body": "Eine Wiederherstellung wurde durchgeführt am: {recovery_time}\\n\\nOhne Schlüsseländerung fortzufahren ist ein SICHERHEITSRISIKO!\\n\\nGeben Sie 'INSECURE' ein um trotzdem einzubinden:",
-        # Recovery checkbox UX fix (BUG-20251220-006)
-        "label_recovery_status": "Wiederherstellungs-Kit Status:",
-        "recovery_kit_available": "✅ Wiederherstellungs-Kit verfügbar und bereit",
-        "recovery_kit_used": "⚠️ Wiederherstellungs-Kit wurde verwendet (neues generieren)",
-        "recovery_kit_not_configured": "❌ Kein Wiederherstellungs-Kit konfiguriert",
-        "recovery_html_warning": "HTML-Wiederherstellungsdatei noch auf dem Laufwerk! Nach dem Drucken löschen.",  # BUG-014
-        "tooltip_recovery_status": "Zeigt an, ob ein gültiges Wiederherstellungs-Kit für dieses Laufwerk existiert.\\nGenerieren Sie ein Kit über CLI: python recovery.py generate",
-        # Rekey dialog (CHG-20251220-001)
-        "settings_security": "Sicherheit",
-        "settings_security_desc": "Zugangsdaten ändern und Sicherheitseinstellungen verwalten.",
-        "rekey_section_title": "🔑 Zugangsdaten ändern",
-        "rekey_instructions": "Ändern Sie Ihr VeraCrypt-Volume-Passwort und/oder Schlüsseldatei. Dies öffnet die VeraCrypt-GUI für die eigentliche Änderung.",
-        "rekey_post_recovery_notice": "⚠️ ÄNDERUNG ERFORDERLICH: Ihre Zugangsdaten wurden während der Wiederherstellung offengelegt. Sie müssen sie jetzt ändern.",
-        "btn_start_rekey": "🔑 Zugangsdaten-Änderung starten",
-        # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
-        "btn_verify_rekey": "✓ Neue Zugangsdaten verifizieren",
-        "btn_cancel_rekey": "✕ Abbrechen",
-        "rekey_instructions_veracrypt": "VeraCrypt-GUI geöffnet. In VeraCrypt:\n1. Tools → Volume-Passwort ändern\n2. Gerät auswählen → Ihr Volume wählen\n3. Aktuelles Passwort eingeben ('Altes Passwort kopieren' oben)\n4. Neues Passwort eingeben ('Neues Passwort kopieren' oben)\n5. OK klicken\n\nNach Bestätigung in VeraCrypt, 'Neue Zugangsdaten verifizieren' klicken.",
-        "rekey_verifying": "Verifiziere neue Zugangsdaten via Mount-Test...",
-        "rekey_verification_success": "✓ Neue Zugangsdaten verifiziert! Rekey wird abgeschlossen...",
-        "rekey_verification_failed": "✕ Verifizierung fehlgeschlagen. Bitte prüfen Sie Ihr neues Passwort/Schlüsseldatei.",
-        "rekey_cancelled": "Zugangsdaten-Änderung abgebrochen.",
-        # BUG-20251221-039: Copy credential buttons
-        # CHG-20251222-018: Enhanced tooltips for clarity
-        "btn_copy_old_password": "📋 Altes Passwort kopieren",
-        "btn_copy_new_password": "📋 Neues Passwort kopieren",
-        "tooltip_copy_old_password": "AKTUELLES Passwort mit VORHANDENEM GPG-Seed ableiten und kopieren. Für GPG-Modi wird Ihr Hardware-Schlüssel verwendet. (30s TTL)",
-        "tooltip_copy_new_password": "NEUES Passwort mit NEUEM GPG-Seed (oben angegeben) ableiten und kopieren. Erst neuen seed.gpg generieren, dann kopieren. (30s TTL)",
-        # CHG-20251223-001: Post-recovery tooltip for disabled Copy Old Password button
-        "tooltip_copy_old_password_post_recovery": "Deaktiviert: Nach Wiederherstellung nutzen Sie das Passwort aus Ihrem Recovery-Kit. Der GPG-Seed fehlt möglicherweise.",
-        "rekey_gpg_seed_hint": "Für GPG-Modi: Der 'Neue GPG-Seed' oben bestimmt das abgeleitete Passwort. Erst neuen seed.gpg generieren, dann 'Neues Passwort kopieren' verwenden.",
-        "copy_password_title": "Passwort kopieren",
-        "rekey_status_ready": "Klicken Sie auf 'Zugangsdaten-Änderung starten' um zu beginnen.",
-        "rekey_status_preparing": "Zugangsdaten werden vorbereitet...",
-        "rekey_status_opening_veracrypt": "VeraCrypt-GUI wird geöffnet...",
-        "rekey_status_awaiting_confirmation": "Führen Sie die Änderung in VeraCrypt durch, dann klicken Sie 'Bestätigen'.",
-        "rekey_status_verifying": "Neue Zugangsdaten werden überprüft...",
-        "rekey_validating": "Neue Zugangsdaten werden validiert...",
-        "rekey_verifying_mount": "Überprüfung der Zugangsdaten via Mount...",
-        "rekey_credentials_verified": "Neue Zugangsdaten erfolgreich verifiziert!",
-        "rekey_testing_mount": "Mount-Test mit neuen Zugangsdaten...",
-        "rekey_validation_success": "Validierung erfolgreich - Aushängen...",
-        "rekey_status_success": "✅ Zugangsdaten erfolgreich geändert!",
-        "rekey_status_failed": "❌ Überprüfung fehlgeschlagen. Bitte erneut versuchen.",
-        "btn_verify_rekey": "✓ Neue Zugangsdaten bestätigen",
-        "rekey_current_password_label": "Aktuelles Passwort:",
-        "rekey_current_password_auto": "(Automatisch bereitgestellt)",
-        "rekey_new_password_label": "Neues Passwort:",
-        "rekey_confirm_password_label": "Passwort bestätigen:",
-        # Mode selection during rekey (CHG-20251221-001)
-        "rekey_current_mode_label": "Aktueller Sicherheitsmodus:",
-        "rekey_target_mode_label": "Neuer Sicherheitsmodus:",
-        "rekey_mode_same_tooltip": "Aktuellen Modus beibehalten - nur Passwort/Schlüsseldatei ändern",
-        "rekey_mode_pw_only": "🔒 Nur Passwort",
-        "rekey_mode_pw_keyfile": "🔑 Passwort + Schlüsseldatei",
-        "rekey_mode_pw_gpg_keyfile": "🔐 YubiKey + Passwort",
-        "rekey_mode_gpg_pw_only": "🔐 GPG-abgeleitetes Passwort",
-        "rekey_new_keyfile_label": "Neuer Schlüsseldatei-Pfad:",
-        "rekey_new_gpg_seed_label": "Neue GPG-Seed-Datei:",
-        "btn_browse_keyfile": "Durchsuchen...",
-        # CHG-20251221-003: GPG seed generation button
-        "btn_generate_gpg_seed": "Generieren",
-        "tooltip_generate_gpg_seed": "Neuen GPG-verschlüsselten Seed für Passwortableitung generieren. Erfordert YubiKey/GPG-Karte.",
-        "gpg_seed_generate_title": "GPG-Seed generieren",
-        "gpg_seed_generate_confirm": "Dies generiert einen neuen kryptographisch sicheren Seed und verschlüsselt ihn mit Ihrem GPG-Schlüssel.\n\nBitte stellen Sie sicher, dass Ihr YubiKey/GPG-Karte eingelegt ist.\n\nFortfahren?",
-        "gpg_seed_generate_success": "GPG-Seed erfolgreich generiert!",
-        "gpg_seed_generate_fail": "GPG-Seed-Generierung fehlgeschlagen",
-        "gpg_seed_derive_info": "Das von diesem Seed abgeleitete Passwort wird angezeigt.\nKopieren Sie es, um es als neues VeraCrypt-Passwort zu verwenden.",
-        # CHG-20251223-032: Multi-key authentication
-        "gpg_key_auth_title": "GPG-Schlüssel authentifizieren",
-        "gpg_key_auth_prompt": "Um sicherzustellen, dass Sie Zugriff auf diesen Schlüssel haben, authentifizieren Sie sich bitte.\n\nSchlüssel: {fingerprint}\n\nSie werden möglicherweise nach Ihrer PIN gefragt.",
-        "gpg_key_auth_success": "Schlüssel erfolgreich authentifiziert.",
-        "gpg_key_auth_fail": "Authentifizierung fehlgeschlagen für Schlüssel: {fingerprint}",
-        "gpg_key_auth_skip_prompt": "Möchten Sie die Authentifizierung für diesen Schlüssel überspringen?\n\n⚠️ WARNUNG: Wenn Sie überspringen, konfigurieren Sie möglicherweise einen Schlüssel, den Sie nicht besitzen.\nDies ist akzeptabel, wenn Sie den Zugang an eine andere Person delegieren.",
-        "gpg_key_auth_skipped": "Authentifizierung übersprungen für Schlüssel: {fingerprint}",
-        # CHG-20251221-008: GPG key selection dialog
-        "gpg_key_select_title": "GPG-Schlüssel für Verschlüsselung auswählen",
-        "gpg_key_select_hint": "Wählen Sie einen Hardware-Schlüssel aus der Liste oder geben Sie manuell einen Fingerabdruck oder E-Mail ein, falls Ihr Schlüssel nicht aufgeführt ist.",
-        "gpg_key_select_label": "GPG-Schlüssel:",
-        "gpg_key_select_placeholder": "Schlüssel auswählen oder eingeben...",
-        "gpg_key_select_manual": "Manuelle Eingabe...",
-        "gpg_key_select_none": "Keine geheimen GPG-Schlüssel gefunden",
-        "gpg_key_manual_label": "Fingerabdruck oder E-Mail eingeben:",
-        # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
-        "gpg_key_select_hint_multi": "Wählen Sie einen oder mehrere Hardware-Schlüssel aus der Liste unten für Redundanz.\nSie können auch zusätzliche Fingerabdrücke manuell eingeben (durch Komma oder Zeilenumbruch getrennt).",
-        "gpg_key_manual_label_multi": "Zusätzliche Fingerabdrücke:",
-        "gpg_key_select_placeholder_multi": "Fingerabdrücke eingeben (durch Komma oder Zeilenumbruch getrennt)...",
-        "gpg_key_select_none_selected": "Bitte wählen Sie mindestens einen GPG-Schlüssel oder geben Sie einen Fingerabdruck manuell ein.",
-        "rekey_mode_change_warning": "⚠️ Eine Änderung des Sicherheitsmodus ändert, wie Sie sich bei diesem Laufwerk authentifizieren.",
-        "rekey_gpg_seed_instructions": "Für GPG-Modi wählen Sie die verschlüsselte Seed-Datei für die Passwortableitung.",
-        # Integrity verification (CHG-20251220-002)
-        "settings_integrity": "Integrität",
-        "settings_integrity_desc": "Software-Integrität überprüfen und Skripte signieren.",
-        "integrity_section_title": "🔐 Software-Integrität",
-        "integrity_instructions": "Überprüfen Sie, ob Skripte seit dem Signieren nicht geändert wurden. Signieren erfordert Hardware-Schlüssel (YubiKey/GPG-Karte).",
-        "btn_verify_local": "✓ Integrität prüfen (Lokal)",
-        "btn_sign_scripts": "🔑 Skripte signieren",
-        "btn_verify_remote": "🌐 Prüfen (Remote)",
-        "integrity_status_ready": "Klicken Sie auf 'Prüfen' um die Skript-Integrität zu überprüfen.",
-        "integrity_status_checking": "Integrität wird geprüft...",
-        "integrity_status_signing": "Skripte werden mit Hardware-Schlüssel signiert...",
-        "integrity_status_pass": "✅ Integrität verifiziert! Skripte sind authentisch.",
-        "integrity_status_fail": "❌ Integritätsprüfung FEHLGESCHLAGEN! Skripte wurden möglicherweise geändert.",
-        "integrity_status_no_manifest": "⚠️ Kein Integritäts-Manifest gefunden. Skripte sind nicht signiert.",
-        "integrity_status_sign_success": "✅ Skripte erfolgreich signiert!",
-        "integrity_status_sign_fail": "❌ Signieren fehlgeschlagen. Hardware-Schlüssel eingesteckt?",
-        "integrity_result_hash": "Hash: {hash}",
-        "integrity_result_signer": "Signiert von: {signer}",
-        "integrity_remote_url_label": "Server-URL:",
-        "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
-        "integrity_status_remote_checking": "Sende Verifizierungsanfrage an Server...",
-        "integrity_status_remote_success": "✅ Remote-Verifizierung erfolgreich!",
-        "integrity_status_remote_fail": "❌ Remote-Verifizierung fehlgeschlagen: {error}",
-        "integrity_status_no_server_url": "⚠️ Keine Server-URL konfiguriert. Setze sie unter Einstellungen → Integrität.",
-        "label_integrity_server_url": "Verifizierungsserver-URL",
-        "tooltip_integrity_server_url": "URL des Remote-Verifizierungsservers (z.B. https://verify.example.com/api/check)",
-        "popup_unmount_failed_title": "Aushängen fehlgeschlagen",
-        "popup_mount_failed_title": "Einbinden fehlgeschlagen",
-        "popup_update_not_possible_title": "Update nicht möglich",
-        "popup_update_confirm_title": "Update bestätigen",
-        "popup_update_direction": "Richtung",
-        "popup_update_source": "Quelle",
-        "popup_update_destination": "Ziel",
-        "popup_update_files_to_update": "Zu aktualisierende Dateien",
-        "popup_update_protected_items": "Geschützte Elemente (Nie überschrieben)",
-        "popup_update_protected_list": "Die folgenden Benutzerdaten werden automatisch geschützt: {items}",
-        "popup_update_warning": "Warnung",
-        "popup_update_warning_body": "Dies überschreibt vorhandene Skriptdateien im .smartdrive/-Verzeichnis.",
-        "popup_update_confirm_message": "UPDATE ({direction}) wird ausgeführt.\n\nVON:\n  {src_root}\n\nNACH:\n  {dst_root}\n\nElemente:\n  - {items}\n\nMethode: {method}\n\nDies überschreibt vorhandene Dateien. Fortfahren?",
-        "popup_update_config_title": "Update-Konfiguration",
-        "popup_update_config_body": "Update-Quelle ist nicht konfiguriert. Bitte in Einstellungen festlegen.",
-        "popup_update_complete_title": "Update abgeschlossen",
-        "popup_update_complete_body": "Update erfolgreich abgeschlossen. Bitte Anwendung neu starten.",
-        "popup_update_failed_title": "Update fehlgeschlagen",
-        "popup_update_failed_body": "Update fehlgeschlagen:\n\n{error}",
-        "popup_update_timeout_title": "Update-Zeitüberschreitung",
-        "popup_update_timeout_body": "Update wurde nicht innerhalb von 120 Sekunden abgeschlossen.",
-        "popup_update_error_title": "Update-Fehler",
-        "popup_update_error_body": "Update konnte nicht ausgeführt werden:\n\n{error}",
-        "popup_cli_failed_title": "CLI-Start fehlgeschlagen",
-        "popup_cli_failed_body": "CLI konnte nicht geöffnet werden:\n\n{error}",
-        # Update configuration error messages
-        "error_update_server_url_not_configured": "Server-URL ist nicht konfiguriert.\\n\\nGehen Sie zu Einstellungen, um die Update-URL zu konfigurieren.",
-        "error_update_local_root_not_configured": "Lokales Update-Verzeichnis ist nicht konfiguriert.\\n\\nGehen Sie zu Einstellungen, um das lokale Update-Root zu konfigurieren.",
-        "error_update_local_root_not_found": "Lokales Update-Verzeichnis nicht gefunden:\\n\\n{path}\\n\\nÜberprüfen Sie die Einstellungen, um den Pfad zu verifizieren.",
-        "error_update_install_dir_not_found": "Installationsverzeichnis nicht gefunden:\\n\\n{path}",
-        "error_update_unknown_source_type": "Unbekannter Update-Quelltyp: {type}",
-        # Hardware key error messages
-        "error_hardware_key_missing_title": "Hardware-Schlüssel erforderlich",
-        "error_hardware_key_missing_body": "Hardware-Schlüssel (YubiKey/GPG-Karte) nicht erkannt. Bitte stecken Sie Ihren Hardware-Schlüssel ein und versuchen Sie es erneut.",
-        # Theme names (for theme dropdown)
-        "theme_brand": "Marke",
-        "theme_green": "Grün",
-        "theme_blue": "Blau",
-        "theme_rose": "Rosa",
-        "theme_slate": "Schiefer",
-        "label_theme": "Thema",
-        # File explorer buttons
-        "tooltip_open_launcher_drive": "Launcher-Laufwerk öffnen",
-        "tooltip_open_mounted_volume": "Eingebundenes Volume öffnen",
-        "popup_open_failed_title": "Öffnen fehlgeschlagen",
-        "popup_open_failed_body": "Dateimanager konnte nicht geöffnet werden:\n\n{path}\n\n{error}",
-        # About section (CHG-20251221-012)
-        "settings_about": "Über",
-        "label_version": "Version:",
-        "label_build_id": "Build-ID:",
-        "label_build_dev": "Entwicklung",
-        "label_compat_version": "Konfig-Version:",
-        # Recovery kit generation (CHG-20251221-001)
-        "recovery_generate_section_title": "Wiederherstellungs-Kit generieren",
-        "recovery_generate_instructions": "Generieren Sie ein neues Wiederherstellungs-Kit, um eine verschlüsselte Sicherung Ihrer Anmeldedaten zu erstellen. Dies ist nützlich, wenn Ihr Original-Kit verloren ging, beschädigt wurde oder Sie eine neue Kopie nach Änderung der Anmeldedaten wünschen.",
-        "btn_generate_recovery_kit": "🔐 Neues Wiederherstellungs-Kit generieren",
-        "recovery_generate_status_ready": "Klicken Sie auf 'Neues Wiederherstellungs-Kit generieren', um ein neues Kit zu erstellen.",
-        "recovery_generate_status_deriving": "Anmeldedaten vom Hardware-Schlüssel ableiten...",
-        "recovery_generate_status_verifying": "Anmeldedaten mit VeraCrypt verifizieren...",
-        "recovery_generate_status_running": "Wiederherstellungs-Kit wird generiert...",
-        "recovery_generate_status_success": "✅ Wiederherstellungs-Kit erfolgreich generiert!",
-        "recovery_generate_status_failed": "❌ Generierung fehlgeschlagen: {error}",
-        "recovery_generate_confirm_title": "Wiederherstellungs-Kit generieren",
-        "recovery_generate_confirm_body": "Dies generiert ein neues Wiederherstellungs-Kit mit verschlüsselter Sicherung Ihrer Anmeldedaten.\n\nMöchten Sie fortfahren?",
-        "recovery_generate_regen_confirm_title": "Wiederherstellungs-Kit neu generieren",
-        "recovery_generate_regen_confirm_body": "⚠️ WARNUNG: Dies erstellt ein NEUES Wiederherstellungs-Kit.\n\nIhr BESTEHENDES Kit wird PERMANENT UNGÜLTIG.\n\nMöchten Sie fortfahren?",
-        "recovery_generate_security_warning_title": "Sicherheitswarnung: Wiederherstellungs-Kit neu generieren",
-        "recovery_generate_security_warning_body": "⚠️ SICHERHEITSWARNUNG ⚠️\n\nEin Wiederherstellungs-Kit existiert bereits. Ein neues zu erstellen wird:\n\n• Das vorherige Kit ungültig machen\n• Einen NEUEN Zugang zu Ihren verschlüsselten Daten erstellen\n• Jeder mit dem neuen Kit kann auf Ihre Daten zugreifen\n\nFahren Sie nur fort, wenn Sie die Sicherheitsrisiken verstehen.\n\nMöchten Sie neu generieren?",
-        "recovery_generate_password_prompt_title": "Volume-Passwort eingeben",
-        "recovery_generate_password_prompt_body": "Bitte geben Sie Ihr Volume-Passwort für die Wiederherstellungs-Kit-Generierung ein:",
-        "recovery_generate_success_title": "Wiederherstellungs-Kit generiert",
-        "recovery_generate_success_body": "Ihr Wiederherstellungs-Kit wurde generiert!\n\nSpeicherort: {path}\n\n⚠️ WICHTIG:\n• Drucken Sie die HTML-Datei sofort aus\n• Bewahren Sie sie an einem sicheren physischen Ort auf\n• Löschen Sie die HTML-Datei nach dem Drucken vom Laufwerk",
-        # Settings dialog - Additional fields (schema-driven UI)
-        "label_drive_id": "Laufwerk-ID",
-        "label_drive_name": "Laufwerksname",
-        "label_setup_date": "Einrichtungsdatum",
-        "label_last_password_change": "Letzte Passwortänderung",
-        "label_last_verified": "Zuletzt überprüft",
-        "label_plain_keyfile": "Einfache Schlüsseldatei",
-        "label_seed_gpg_path": "GPG-Seed-Datei",
-        "label_kdf": "Schlüsselableitungsfunktion",
-        "label_pw_encoding": "Passwort-Kodierung",
-        "label_recovery_enabled": "Wiederherstellungs-Kit aktivieren",
-        "label_recovery_share_count": "Anzahl Wiederherstellungsanteile",
-        "label_recovery_threshold": "Wiederherstellungsschwelle",
-        "label_lost_and_found_enabled": "Fundmeldung aktivieren",
-        "label_lost_and_found_message": "Rückgabenachricht",
-        "label_verification_overridden": "Überprüfung überschrieben",
-        "label_integrity_signed": "Integrität signiert",
-        "label_signing_key_fpr": "Signaturschlüssel-Fingerabdruck",
-        "label_salt_b64": "Salt (Base64)",
-        "label_hkdf_info": "HKDF-Info",
-        "label_schema_version": "Schema-Version",
-        "label_version": "Version",
-        # Tooltips for settings fields
-        "tooltip_drive_id": "Eindeutige Kennung für dieses Laufwerk (schreibgeschützt)",
-        "tooltip_drive_name": "Benutzerdefinierter Name für dieses Laufwerk",
-        "tooltip_language": "Sprache der Benutzeroberfläche",
-        "tooltip_theme": "Farbschema für die Oberfläche",
-        "tooltip_mode": "Sicherheitsmodus: nur Passwort, Schlüsseldatei oder YubiKey/GPG",
-        "tooltip_encrypted_keyfile": "Pfad zur GPG-verschlüsselten Schlüsseldatei (für GPG-Modi)",
-        "tooltip_plain_keyfile": "Pfad zur unverschlüsselten Schlüsseldatei (für einfachen Schlüsseldatei-Modus)",
-        "tooltip_seed_gpg_path": "Pfad zur GPG-Seed-Datei für Passwortableitung",
-        "tooltip_kdf": "Schlüsselableitungsfunktion für GPG-Passwortmodus",
-        "tooltip_pw_encoding": "Zeichenkodierung für Passwort (UTF-8 empfohlen)",
-        "tooltip_windows_volume_path": "Windows Volume-GUID oder Gerätepfad",
-        "tooltip_mount_letter": "Laufwerksbuchstabe zum Einbinden (A-Z)",
-        "tooltip_veracrypt_path": "Pfad zur VeraCrypt.exe",
-        "tooltip_unix_volume_path": "Unix-Gerätepfad (z. B. /dev/sdb2)",
-        "tooltip_mount_point": "Unix-Einhängepunkt-Verzeichnis",
-        # BUG-20251221-037: Mount point fallback i18n keys
-        "label_allow_mount_fallback": "Alternativen Einhängepunkt automatisch verwenden",
-        "tooltip_allow_mount_fallback": "Wenn aktiviert, werden automatisch alternative Laufwerksbuchstaben (Windows) oder Einhänge-Verzeichnisse (Unix) versucht, falls der konfigurierte nicht verfügbar ist. Empfohlen, um Einbindungsfehler zu vermeiden.",
-        "error_mount_point_occupied_fallback_disabled": "Einhängepunkt {mount_point} wird bereits verwendet.\n\nUm diesen Fehler in Zukunft zu vermeiden, aktivieren Sie 'Alternativen Einhängepunkt automatisch verwenden' in Einstellungen → {os_tab}.",
-        "error_mount_point_all_occupied": "Nach 3 Versuchen konnte kein verfügbarer Einhängepunkt gefunden werden.\n\nAlle Laufwerksbuchstaben D-Z sind belegt (Windows) oder alternative Einhängepunkte fehlgeschlagen (Unix).\n\nDies ist ein Einhängepunkt-Problem, KEIN Anmeldedaten-Problem.",
-        "warning_mount_fallback_used": "Konfigurierter Einhängepunkt {original} war nicht verfügbar.\nVerwende stattdessen {fallback}. Konfiguration aktualisiert.",
-        "tooltip_recovery_enabled": "Notfall-Wiederherstellungs-Kit-Generierung aktivieren",
-        "tooltip_recovery_share_count": "Anzahl der zu generierenden Wiederherstellungsanteile",
-        "tooltip_recovery_threshold": "Mindestanzahl benötigter Anteile zur Wiederherstellung",
-        "tooltip_lost_and_found_enabled": "Rückgabenachricht aktivieren, wenn Laufwerk verloren geht",
-        "tooltip_lost_and_found_message": "Nachricht, die angezeigt wird, wenn Laufwerk gefunden wird",
-        "tooltip_source_type": "Update-Quelle: lokales Verzeichnis oder Server-URL",
-        "tooltip_server_url": "Server-URL für Updates",
-        "tooltip_local_root": "Lokales Verzeichnis mit Update-Dateien",
-        "hint_update_local_title": "Über lokale Updates",
-        "hint_update_local_body": "Wählen Sie entweder: (1) das Verzeichnis, das einen .smartdrive/-Ordner enthält (z.B. H:\\ oder C:\\MeineDev\\), oder (2) direkt einen .smartdrive/-Ordner. Der .smartdrive/-Ordner wird automatisch erkannt. Benutzerdaten (recovery/, keys/, integrity/, config.json) werden automatisch geschützt. Entwicklungsdateien (.git, Tests, helper/) werden ausgeschlossen.",
-        # CHG-20251222-016: Update action section i18n keys
-        "update_action_section_title": "Update-Aktionen",
-        "btn_run_update": "Update ausführen",
-        "tooltip_run_update": "Update von konfigurierter Quelle ausführen",
-        "label_last_update": "Letztes Update:",
-        "label_last_update_source": "Quelle:",
-        "update_never": "Nie",
-        "update_source_none": "Nicht konfiguriert",
-        "tooltip_verification_overridden": "Integritätsprüfung umgehen (gefährlich!)",
-        "tooltip_integrity_signed": "Laufwerksintegrität wurde kryptografisch signiert",
-        "tooltip_signing_key_fpr": "GPG-Schlüssel-Fingerabdruck für Signatur",
-        "tooltip_salt_b64": "Kryptografisches Salt für Schlüsselableitung",
-        "tooltip_hkdf_info": "Kontextzeichenfolge für HKDF-Schlüsselableitung",
-        # Integrity tab (CHG-20251220-002)
-        "label_integrity_status": "Integritätsstatus:",
-        "tooltip_integrity_status": "Zeigt an, ob Skripte gegen signierte Hashes verifiziert wurden",
-        # CHG-20251222-014: OS-specific tab tooltip
-        "tooltip_tab_disabled_other_os": "Diese Registerkarte ist für ein anderes Betriebssystem",
-    },
-    "bs": {
-        # Window titles
-        "window_title": "KeyDrive",
-        "settings_window_title": "Postavke",
-        # Button labels
-        "btn_mount": "🔓 Montiraj",
-        "btn_unmount": "🔒 Demontiraj",
-        "btn_cancel_auth": "❌ Otkaži",
-        "btn_confirm_mount": "✅ Potvrdi",
-        "btn_tools": "⚙️",
-        "btn_close": "✕",
-        "btn_save": "Sačuvaj",
-        "btn_cancel": "Otkaži",
-        "btn_confirm": "Potvrdi",
-        "btn_ok": "OK",
-        "warning": "Upozorenje",
-        "settings_tab_security": "Sigurnost",
-        # CHG-20251223-055: Reload config button for non-modal settings
-        "btn_reload_config": "↻ Ponovo učitaj",
-        "tooltip_reload_config": "Ponovo učitaj konfiguraciju s diska (odbacuje nesačuvane promjene)",
-        # Status messages
-        "status_config_not_found": "Konfiguracija nije pronađena",
-        "status_volume_mounted": "Volumen montiran",
-        "status_volume_not_mounted": "Volumen nije montiran",
-        "status_mounting": "⏳ Montiranje volumena...",
-        "status_mounting_gpg": "⏳ Montiranje volumena (GPG autentifikacija)...",
-        "status_unmounting": "⏳ Demontiranje volumena...",
-        "status_mount_success": "✅ Volumen uspješno montiran",
-        "status_mount_failed": "❌ Montiranje nije uspjelo",
-        "status_unmount_success": "✅ Volumen uspješno demontiran",
-        "status_unmount_failed": "❌ Demontiranje nije uspjelo",
-        # Info labels
-        "info_unavailable": "Informacije nisu dostupne",
-        "keyfile_selected_one": "Odabrana 1 datoteka ključa",
-        "keyfile_selected_many": "Odabrano {count} datoteka ključa",
-        "keyfile_drop_hint": "Prevucite datoteke ključa ovdje ili kliknite za odabir",
-        "keyfile_drop_supports_multiple": "Podržava više datoteka ključa",
-        "label_show_password": "Prikaži lozinku",
-        # Size formatting
-        "size_free": "Slobodno: {size}",
-        # Icons/placeholders
-        "icon_drive": "🚀",
-        # Tooltips
-        "tooltip_exit": "Izađi iz SmartDrive",
-        "tooltip_settings": "Napredni alati i postavke",
-        # Labels
-        "label_product_name": "Naziv proizvoda",
-        "label_preview": "Pregled:",
-        "label_password": "Lozinka:",
-        "label_keyfile": "Datoteka ključa:",
-        "label_hardware_key_hint": "💡 Hardverski ključ može biti potreban za autentifikaciju",
-        "label_forgot_password": "Zaboravili ste lozinku?",
-        # Placeholder text
-        "placeholder_password": "Unesite svoju VeraCrypt lozinku...",
-        # Menu items
-        "menu_settings": "⚙️ Postavke",
-        "menu_rekey": "🔑 Promijeni lozinku/datoteku ključa",
-        "menu_update": "⬇️ Ažuriraj skripte",
-        "menu_recovery": "💾 Paket za oporavak",
-        "menu_about": "ℹ️ O programu",
-        "menu_cli": "💻 Otvori CLI",
-        "menu_exit": "⏻ Izlaz",
-        "menu_clear_keyfiles": "Očisti datoteke ključa",
-        "menu_switch_drive": "🔀 Promijeni disk...",
-        "menu_switch_drive_browse": "📂 Pregledaj...",
-        # CHG-20251221-042: Remote Control Mode menu items (Bosnian)
-        "menu_manage_remote": "🌐 Upravljaj daljinski...",
-        "menu_manage_remote_browse": "📂 Pronađi daljinski .smartdrive...",
-        "menu_exit_remote": "🏠 Izađi iz daljinskog načina",
-        "remote_active_label": "Daljinsko upravljanje aktivno",
-        "remote_click_to_end": "Kliknite za završetak",
-        "remote_validation_failed_title": "Daljinska validacija nije uspjela",
-        "remote_validation_failed_body": "Nije moguće povezati se s daljinskim diskom:\n\n{error}",
-        "remote_disconnected_title": "Daljinski disk je odvojen",
-        "remote_disconnected_body": "Daljinski disk ({drive}:) je odvojen.\n\nPovratak na lokalni način.",
-        "remote_confirm_title": "Uđi u način daljinskog upravljanja",
-        "remote_confirm_body": "Poveži se s daljinskim .smartdrive na:\n{path}\n\nU daljinskom načinu možete samo montirati/demontirati daljinski volumen.\nPostavke, ažuriranja i CLI pristup su onemogućeni.",
-        "remote_mode_disabled_title": "Daljinski način aktivan",
-        "remote_mode_disabled_cli": "CLI pristup je onemogućen u daljinskom načinu.",
-        "remote_mode_disabled_settings": "Postavke su onemogućene u daljinskom načinu. Prvo izađite iz daljinskog načina.",
-        "remote_mode_disabled_update": "Ažuriranja su onemogućena u daljinskom načinu. Prvo izađite iz daljinskog načina.",
-        "dialog_select_keyfiles": "Odaberite datoteku(e) ključa",
-        # Multi-drive context (CHG-20251221-026)
-        "label_launcher_root": "Pokretački disk:",
-        "group_drive_context": "Kontekst diska",
-        "tooltip_launcher_root": "Disk koji sadrži ovaj .smartdrive folder",
-        # Drive safety context (CHG-20251221-040)
-        "label_os_drive": "OS disk:",
-        "tooltip_os_drive": "Disk na kojem radi operativni sustav (ne može se reparticionirati)",
-        "label_instantiation_drive": "Pokrenut s:",
-        "tooltip_instantiation_drive": "Disk s kojeg je pokrenuta ova instanca (ne može se reparticionirati)",
-        "switch_drive_title": "Promijeni kontekst diska",
-        "switch_drive_confirm": "Prebaci na konfiguraciju s:\n{path}\n\nSve postavke će se ponovno učitati s ovog diska.",
-        "switch_drive_invalid_path": "Nevažeći .smartdrive folder. config.json nije pronađen.",
-        "switch_drive_select_folder": "Odaberite .smartdrive folder",
-        "version_incompatible_title": "Upozorenje o kompatibilnosti verzije",
-        "version_incompatible_error": "Ne mogu prebaciti na ovaj disk:\n\n{message}\n\nFormat konfiguracije nije kompatibilan s ovom verzijom softvera.",
-        "version_incompatible_warning": "{message}\n\nCilj: {path}\n\nŽelite li ipak nastaviti?",
-        # Tray messages
-        "tray_minimized_message": "Radi u pozadini. Kliknite na ikonu u sistemskoj traci za vraćanje.",
-        "tray_unavailable_message": "Sistemska traka nije dostupna.\n\nŽelite li zatvoriti aplikaciju?",
-        "tray_tooltip": "{name} ({id})",
-        # Status messages
-        "status_deriving_yubikey_password": "Izvođenje lozinke sa YubiKey...",
-        "status_checking_mount": "Provjera statusa montiranja...",
-        "status_unmounting_for_rekey": "Demontiranje volumena za rekey...",
-        "status_decrypting_keyfile": "Dešifriranje datoteke ključa sa YubiKey...",
-        # Worker messages (keys for structured errors)
-        "worker_mount_script_not_found": "Skripta za montiranje nije pronađena",
-        "worker_mount_success": "Volumen uspješno montiran",
-        "worker_mount_failed": "Montiranje nije uspjelo: {error}",
-        "worker_mount_timeout": "Vrijeme za montiranje je isteklo",
-        "worker_mount_error": "Greška pri montiranju: {error}",
-        "worker_unmount_script_not_found": "Skripta za demontiranje nije pronađena",
-        "worker_unmount_success": "Volumen uspješno demontiran",
-        "worker_unmount_failed": "Demontiranje nije uspjelo: {error}",
-        "worker_unmount_timeout": "Vrijeme za demontiranje je isteklo",
-        "worker_unmount_error": "Greška pri demontiranju: {error}",
-        # Settings dialog - Tab names
-        "settings_language": "Jezik",
-        "settings_general": "Opšte",
-        "settings_security": "Sigurnost",
-        "settings_keyfile": "Datoteka ključa",
-        "settings_windows": "Windows",
-        "settings_unix": "Unix",
-        "settings_updates": "Ažuriranja",
-        "settings_recovery": "Oporavak",
-        "settings_lost_and_found": "Izgubljeno i nađeno",
-        "settings_advanced": "Napredno",
-        # Settings dialog - Tab descriptions
-        "settings_general_desc": "Konfigurirajte ime prikaza, jezik i postavke teme.",
-        "settings_security_desc": "Postavite način šifriranja i metodu autentifikacije za vaš sigurni disk.",
-        "settings_keyfile_desc": "Upravljajte putanjama datoteka ključeva za šifriranje i GPG autentifikaciju.",
-        "settings_windows_desc": "Windows-specifične postavke uključujući slovo diska i lokaciju VeraCrypt-a.",
-        "settings_unix_desc": "Postavke za Linux i macOS uključujući direktorij točke montiranja.",
-        "settings_updates_desc": "Konfigurirajte automatsku provjeru ažuriranja i postavke servera.",
-        "settings_recovery_desc": "Postavite Shamir Secret Sharing opcije oporavka za pristup ako se ključevi izgube.",
-        "settings_lost_and_found_desc": "Prikažite poruku za kontakt na disku za vraćanje ako se izgubi.",
-        "settings_advanced_desc": "Tehničke postavke za parametre šifriranja i provjeru integriteta.",
-        # BUG-20251221-036: Settings dialog - Group box titles (Serbian)
-        "group_drive_identification": "Identifikacija diska",
-        "group_appearance": "Izgled",
-        "group_timestamps": "Vremenske oznake",
-        "group_security_mode": "Sigurnosni način",
-        "group_keyfile_configuration": "Konfiguracija datoteke ključa",
-        "group_gpg_configuration": "GPG konfiguracija",
-        "group_emergency_recovery_kit": "Komplet za hitni oporavak",
-        "group_verification": "Verifikacija",
-        "group_verification_status": "Status verifikacije",
-        "group_software_integrity": "Integritet softvera",
-        "group_remote_verification": "Udaljena verifikacija",
-        "group_gpg_kdf_parameters": "GPG KDF parametri",
-        "group_metadata": "Metapodaci",
-        "settings_restart_not_required": "✓ Promjene su odmah primijenjene (restart nije potreban)",
-        "label_mode": "Način",
-        "label_encrypted_keyfile": "Šifrirana datoteka ključa",
-        "label_volume_path": "Putanja do volumena",
-        "label_mount_letter": "Slovo diska",
-        "label_veracrypt_path": "Putanja do VeraCrypt-a",
-        "label_mount_point": "Tačka montiranja",
-        "label_source_type": "Tip izvora",
-        "label_server_url": "URL servera",
-        "label_local_root": "Lokalni korijenski direktorij",
-        "error_invalid_mount_letter": "Slovo diska mora biti jedno slovo A–Z.",
-        "error_save_failed": "Nije moguće sačuvati config.json:",
-        "title_invalid_mount_letter": "Neispravno slovo diska",
-        "title_save_failed": "Neuspjelo čuvanje",
-        "title_error": "Greška",
-        "error_apply_theme": "Nije moguće primijeniti temu: {error}",
-        "error_apply_language": "Nije moguće primijeniti jezik: {error}",
-        # Popup dialogs
-        "popup_keyfile_required_title": "Potrebna datoteka ključa",
-        "popup_keyfile_required_body": "Molimo odaberite datoteku ključa za režim lozinka + datoteka ključa.",
-        "popup_password_required_title": "Potrebna lozinka",
-        "popup_password_required_body": "Molimo unesite svoju VeraCrypt lozinku.",
-        "popup_recovery_title": "Oporavak lozinke",
-        "popup_recovery_available_body": "Paket za oporavak je dostupan za ovaj disk!\n\nZa povrat pristupa vašem šifriranom volumenu:\n\n1. Koristite SmartDrive CLI: python smartdrive.py\n2. Odaberite opciju 6: Paket za oporavak\n3. Pratite upute za oporavak\n\nIli kontaktirajte sistem administratora.",
-        "popup_recovery_unavailable_body": "Trenutno nema dostupnog paketa za oporavak za ovaj disk.\n\nZa postavljanje oporavka lozinke:\n\n1. Koristite SmartDrive CLI: python smartdrive.py\n2. Odaberite opciju 6: Paket za oporavak\n3. Izaberite 'Generate Recovery Kit'\n\nIli kontaktirajte sistem administratora.",
-        # Recovery tab - Phrase input and recovery actions
-        "recovery_section_title": "🔐 Hitni oporavak",
-        "recovery_instructions": "Unesite svoju frazu za oporavak od 24 riječi da biste povratili pristup vašem šifriranom volumenu. Možete također navesti datoteku kontejnera za oporavak ako je imate.",
-        "label_recovery_phrase": "Fraza za oporavak (24 riječi):",
-        "placeholder_recovery_phrase": "Unesite 24 riječi odvojene razmacima...",
-        "label_recovery_container": "Kontejner za oporavak (opcionalno):",
-        "btn_browse_container": "Pregledaj...",
-        "btn_recover_credentials": "🔓 Povrati pristupne podatke",
-        "recovery_status_ready": "Unesite svoju frazu za oporavak i kliknite 'Povrati pristupne podatke'",
-        "recovery_status_validating": "Validacija fraze za oporavak...",
-        "recovery_status_decrypting": "Dešifriranje kontejnera za oporavak...",
-        "recovery_status_success": "✅ Oporavak uspješan! Pristupni podaci vraćeni.",
-        "recovery_status_failed": "❌ Oporavak nije uspio: {error}",
-        "recovery_result_title": "Vraćeni pristupni podaci",
-        "recovery_result_password": "Lozinka:",
-        "recovery_result_keyfile": "Datoteka ključa:",
-        "recovery_result_mode": "Sigurnosni način:",
-        "recovery_result_copy_password": "📋 Kopiraj lozinku",
-        "recovery_result_save_keyfile": "💾 Sačuvaj datoteku ključa",
-        "recovery_copied_to_clipboard": "Lozinka kopirana u međuspremnik (automatski se briše za 30 sekundi)",
-        "recovery_keyfile_saved": "Datoteka ključa sačuvana u: {path}",
-        "recovery_phrase_invalid": "Neispravna fraza za oporavak. Molimo provjerite svih 24 riječi.",
-        "recovery_container_not_found": "Kontejner za oporavak nije pronađen. Molimo odaberite datoteku kontejnera.",
-        "recovery_no_kit_configured": "Nijedan paket za oporavak nije konfigurisan za ovaj disk.",
-        "recovery_generate_first": "Molimo prvo generirajte paket za oporavak putem Postavki ili CLI-ja.",
-        # Recovery security enforcement (BUG-20251220-005)
-        "recovery_already_used": "⚠️ Ovaj paket za oporavak je VEĆ KORIŠTEN.\\n\\nPaketi za oporavak su JEDNOKRATNI.\\nMorate vratiti iz druge sigurnosne kopije.",
-        "recovery_status_invalidating": "Poništavanje paketa za oporavak (jednokratna upotreba)...",
-        "recovery_status_complete": "✅ Oporavak završen! Paket je TRAJNO PONIŠTEN.",
-        "recovery_rekey_required_title": "⚠️ OBAVEZNO: Promijenite pristupne podatke",
-        "recovery_rekey_required_body": "Vaša fraza za oporavak je OTKRIVENA tijekom oporavka.\\n\\nSvako s tom frazom može pristupiti ovom volumenu.\\nMORATE promijeniti pristupne podatke ODMAH.\\n\\nKliknite 'Promijeni sada' za nastavak, ili 'Kasnije' za CLI.",
-        "recovery_rekey_now": "🔑 Promijeni sada",
-        "recovery_rekey_later": "Kasnije (CLI)",
-        "recovery_rekey_skipped_warning": "⚠️ PRESKOČILI STE PROMJENU PRISTUPNIH PODATAKA!\\nPokrenite 'python rekey.py' što prije!",
-        # Post-recovery mount enforcement (BUG-20251220-007)
-        "mount_blocked_rekey_required_title": "Montiranje blokirano: Potrebna promjena ključa",
-        "mount_blocked_rekey_required_body": "Oporavak je izvršen: {recovery_time}\\n\\nMORATE promijeniti pristupne podatke prije montiranja.\\n\\nOvo je SIGURNOSNI ZAHTJEV:\\n• Vaša fraza za oporavak je otkrivena tijekom oporavka\\n• Svako s tom frazom može pristupiti ovom volumenu\\n\\nKoristite Postavke → Sigurnost → Promjena lozinke.",
-        "mount_warn_rekey_title": "Sigurnosno upozorenje: Promjena ključa na čekanju",
-        "mount_warn_rekey_body": "Oporavak je izvršen: {recovery_time}\\n\\nNastavljanje bez promjene ključa je SIGURNOSNI RIZIK!\\n\\nUpišite 'INSECURE' za montiranje svejedno:",
-        # Recovery checkbox UX fix (BUG-20251220-006)
-        "label_recovery_status": "Status paketa za oporavak:",
-        "recovery_kit_available": "✅ Paket za oporavak dostupan i spreman",
-        "recovery_kit_used": "⚠️ Paket za oporavak je korišten (generirajte novi)",
-        "recovery_kit_not_configured": "❌ Paket za oporavak nije konfigurisan",
-        "recovery_html_warning": "HTML datoteka za oporavak još uvijek na disku! Obrišite nakon štampanja radi sigurnosti.",
-        "tooltip_recovery_status": "Prikazuje postoji li valjani paket za oporavak za ovaj disk.\\nGenerirajte paket putem CLI: python recovery.py generate",
-        # Rekey dialog (CHG-20251220-001)
-        "settings_security": "Sigurnost",
-        "settings_security_desc": "Promijenite pristupne podatke i upravljajte sigurnosnim postavkama.",
-        "rekey_section_title": "🔑 Promjena pristupnih podataka",
-        "rekey_instructions": "Promijenite lozinku i/ili datoteku ključa za VeraCrypt volumen. Ovo će otvoriti VeraCrypt GUI za stvarnu promjenu.",
-        "rekey_post_recovery_notice": "⚠️ PROMJENA POTREBNA: Vaši pristupni podaci su otkriveni tijekom oporavka. Morate ih promijeniti sada.",
-        "btn_start_rekey": "🔑 Započni promjenu pristupnih podataka",
-        # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
-        "btn_verify_rekey": "✓ Verificiraj nove pristupne podatke",
-        "btn_cancel_rekey": "✕ Otkaži",
-        "rekey_instructions_veracrypt": "VeraCrypt GUI otvoren. U VeraCryptu:\n1. Tools → Promijeni lozinku volumena\n2. Odaberi uređaj → izaberite svoj volumen\n3. Unesite trenutnu lozinku ('Kopiraj staru lozinku' gore)\n4. Unesite novu lozinku ('Kopiraj novu lozinku' gore)\n5. Kliknite OK\n\nNakon potvrde u VeraCryptu, kliknite 'Verificiraj nove pristupne podatke'.",
-        "rekey_verifying": "Verificiram nove pristupne podatke putem mount testa...",
-        "rekey_verification_success": "✓ Novi pristupni podaci verificirani! Završavam rekey...",
-        "rekey_verification_failed": "✕ Verifikacija neuspjela. Provjerite novu lozinku/datoteku ključa.",
-        "rekey_cancelled": "Promjena pristupnih podataka otkazana.",
-        # BUG-20251221-039: Copy credential buttons
-        # CHG-20251222-018: Enhanced tooltips for clarity
-        "btn_copy_old_password": "📋 Kopiraj staru lozinku",
-        "btn_copy_new_password": "📋 Kopiraj novu lozinku",
-        "tooltip_copy_old_password": "Izvedu i kopiraj TRENUTNU lozinku koristeći POSTOJEĆI GPG seed. Za GPG načine koristi hardverski ključ. (30s TTL)",
-        "tooltip_copy_new_password": "Izvedu i kopiraj NOVU lozinku koristeći NOVI GPG seed (gore naveden). Prvo generirajte novi seed.gpg. (30s TTL)",
-        # CHG-20251223-001: Post-recovery tooltip
-        "tooltip_copy_old_password_post_recovery": "Onemogućeno: Nakon oporavka, koristi lozinku iz recovery kita. GPG seed možda nedostaje.",
-        "rekey_gpg_seed_hint": "Za GPG načine: 'Novi GPG Seed' gore određuje izvedenu lozinku. Prvo generirajte novi seed.gpg, zatim koristite 'Kopiraj novu lozinku'.",
-        "copy_password_title": "Kopiranje lozinke",
-        "rekey_status_ready": "Kliknite 'Započni promjenu pristupnih podataka' za početak.",
-        "rekey_status_preparing": "Pripremanje pristupnih podataka...",
-        "rekey_status_opening_veracrypt": "Otvaranje VeraCrypt GUI-ja...",
-        "rekey_status_awaiting_confirmation": "Dovršite promjenu u VeraCryptu, zatim kliknite 'Potvrdi'.",
-        "rekey_status_verifying": "Provjera novih pristupnih podataka...",
-        "rekey_validating": "Validacija novih pristupnih podataka...",
-        "rekey_verifying_mount": "Provjera pristupnih podataka putem montiranja...",
-        "rekey_credentials_verified": "Novi pristupni podaci uspješno provjereni!",
-        "rekey_testing_mount": "Testiranje montiranja sa novim pristupnim podacima...",
-        "rekey_validation_success": "Validacija uspješna - demontiranje...",
-        "rekey_status_success": "✅ Pristupni podaci uspješno promijenjeni!",
-        "rekey_status_failed": "❌ Provjera nije uspjela. Molimo pokušajte ponovo.",
-        "btn_verify_rekey": "✓ Potvrdi nove pristupne podatke",
-        "rekey_current_password_label": "Trenutna lozinka:",
-        "rekey_current_password_auto": "(Automatski osigurano)",
-        "rekey_new_password_label": "Nova lozinka:",
-        "rekey_confirm_password_label": "Potvrdi lozinku:",
-        # Mode selection during rekey (CHG-20251221-001)
-        "rekey_current_mode_label": "Trenutni sigurnosni način:",
-        "rekey_target_mode_label": "Novi sigurnosni način:",
-        "rekey_mode_same_tooltip": "Zadrži trenutni način - samo promijeni lozinku/datoteku ključa",
-        "rekey_mode_pw_only": "🔒 Samo lozinka",
-        "rekey_mode_pw_keyfile": "🔑 Lozinka + datoteka ključa",
-        "rekey_mode_pw_gpg_keyfile": "🔐 YubiKey + lozinka",
-        "rekey_mode_gpg_pw_only": "🔐 GPG izvedena lozinka",
-        "rekey_new_keyfile_label": "Nova putanja datoteke ključa:",
-        "rekey_new_gpg_seed_label": "Nova GPG seed datoteka:",
-        "btn_browse_keyfile": "Pregledaj...",
-        # CHG-20251221-003: GPG seed generation button
-        "btn_generate_gpg_seed": "Generiši",
-        "tooltip_generate_gpg_seed": "Generiši novi GPG-šifrirani seed za izvođenje lozinke. Potreban YubiKey/GPG kartica.",
-        "gpg_seed_generate_title": "Generiši GPG Seed",
-        "gpg_seed_generate_confirm": "Ovo će generisati novi kriptografski siguran seed i šifrirati ga vašim GPG ključem.\n\nMolimo osigurajte da je vaš YubiKey/GPG kartica uložena.\n\nNastaviti?",
-        "gpg_seed_generate_success": "GPG seed uspješno generisan!",
-        "gpg_seed_generate_fail": "Neuspjelo generisanje GPG seeda",
-        "gpg_seed_derive_info": "Lozinka izvedena iz ovog seeda će biti prikazana.\nKopirajte je za korištenje kao novu VeraCrypt lozinku.",
-        # CHG-20251223-032: Multi-key authentication
-        "gpg_key_auth_title": "Autentifikacija GPG ključa",
-        "gpg_key_auth_prompt": "Da biste osigurali da imate pristup ovom ključu, molimo autentifikujte se.\n\nKljuč: {fingerprint}\n\nMožda ćete biti zatraženi za vaš PIN.",
-        "gpg_key_auth_success": "Ključ uspješno autentifikovan.",
-        "gpg_key_auth_fail": "Autentifikacija neuspjela za ključ: {fingerprint}",
-        "gpg_key_auth_skip_prompt": "Želite li preskočiti autentifikaciju za ovaj ključ?\n\n⚠️ UPOZORENJE: Ako preskočite, možete konfigurirati ključ koji ne posjedujete.\nOvo je prihvatljivo kada delegirate pristup drugoj osobi.",
-        "gpg_key_auth_skipped": "Autentifikacija preskočena za ključ: {fingerprint}",
-        # CHG-20251221-008: GPG key selection dialog
-        "gpg_key_select_title": "Odaberi GPG ključ za šifriranje",
-        "gpg_key_select_hint": "Odaberite hardverski ključ sa liste ispod ili ručno unesite otisak prsta ili e-mail ako vaš ključ nije naveden.",
-        "gpg_key_select_label": "GPG ključ:",
-        "gpg_key_select_placeholder": "Odaberite ili unesite ključ...",
-        "gpg_key_select_manual": "Ručni unos...",
-        "gpg_key_select_none": "Nisu pronađeni tajni GPG ključevi",
-        "gpg_key_manual_label": "Unesite otisak prsta ili e-mail:",
-        # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
-        "gpg_key_select_hint_multi": "Odaberite jedan ili više hardverskih ključeva sa liste ispod za redundanciju.\nMožete također ručno unijeti dodatne otiske prstiju (odvojene zarezom ili novim redom).",
-        "gpg_key_manual_label_multi": "Dodatni otisci prstiju:",
-        "gpg_key_select_placeholder_multi": "Unesite otiske prstiju (odvojene zarezom ili novim redom)...",
-        "gpg_key_select_none_selected": "Molimo odaberite barem jedan GPG ključ ili ručno unesite otisak prsta.",
-        "rekey_mode_change_warning": "⚠️ Promjena sigurnosnog načina će promijeniti kako se autentificirate na ovaj disk.",
-        "rekey_gpg_seed_instructions": "Za GPG načine, odaberite šifriranu seed datoteku za izvođenje lozinke.",
-        "popup_unmount_failed_title": "Demontiranje nije uspjelo",
-        "popup_mount_failed_title": "Montiranje nije uspjelo",
-        "popup_update_not_possible_title": "Ažuriranje nije moguće",
-        "popup_update_confirm_title": "Potvrdi ažuriranje",
-        "popup_update_direction": "Smjer",
-        "popup_update_source": "Izvor",
-        "popup_update_destination": "Odredište",
-        "popup_update_files_to_update": "Datoteke za ažuriranje",
-        "popup_update_protected_items": "Zaštićene stavke (Nikad prepisano)",
-        "popup_update_protected_list": "Sledeći korisnički podaci su automatski zaštićeni: {items}",
-        "popup_update_warning": "Upozorenje",
-        "popup_update_warning_body": "Ovo će prepisati postojeće datoteke skripti u .smartdrive/ direktoriju.",
-        "popup_update_confirm_message": "Spremno za pokretanje UPDATE ({direction}).\n\nOD:\n  {src_root}\n\nDO:\n  {dst_root}\n\nStavke:\n  - {items}\n\nMetoda: {method}\n\nOvo će prepisati postojeće datoteke. Nastaviti?",
-        "popup_update_config_title": "Konfiguracija ažuriranja",
-        "popup_update_config_body": "Izvor ažuriranja nije konfigurisan. Postavite ga u Postavkama.",
-        "popup_update_complete_title": "Ažuriranje završeno",
-        "popup_update_complete_body": "Ažuriranje je uspješno završeno. Molimo ponovo pokrenite aplikaciju.",
-        "popup_update_failed_title": "Ažuriranje nije uspjelo",
-        "popup_update_failed_body": "Ažuriranje nije uspjelo:\n\n{error}",
-        "popup_update_timeout_title": "Ažuriranje je isteklo",
-        "popup_update_timeout_body": "Ažuriranje nije završeno u roku od 120 sekundi.",
-        "popup_update_error_title": "Greška ažuriranja",
-        "popup_update_error_body": "Neuspjelo pokretanje ažuriranja:\n\n{error}",
-        "popup_cli_failed_title": "Pokretanje CLI-ja nije uspjelo",
-        "popup_cli_failed_body": "Nije moguće otvoriti CLI:\n\n{error}",
-        # Update configuration error messages
-        "error_update_server_url_not_configured": "Server URL nije konfigurisan.\n\nIdite u Postavke da konfigurirate URL za ažuriranje.",
-        "error_update_local_root_not_configured": "Lokalni direktorij za ažuriranje nije konfigurisan.\n\nIdite u Postavke da konfigurirate lokalni root za ažuriranje.",
-        "error_update_local_root_not_found": "Lokalni direktorij za ažuriranje nije pronađen:\n\n{path}\n\nProvjerite Postavke da verifikujete putanju.",
-        "error_update_install_dir_not_found": "Instalacijski direktorij nije pronađen:\n\n{path}",
-        "error_update_unknown_source_type": "Nepoznat tip izvora ažuriranja: {type}",
-        # Hardware key error messages
-        "error_hardware_key_missing_title": "Potreban hardverski ključ",
-        "error_hardware_key_missing_body": "Hardverski ključ (YubiKey/GPG kartica) nije detektovan. Molimo ubacite hardverski ključ i pokušajte ponovo.",
-        # Theme names (for theme dropdown)
-        "theme_brand": "Brend",
-        "theme_green": "Zelena",
-        "theme_blue": "Plava",
-        "theme_rose": "Ružičasta",
-        "theme_slate": "Škriljac",
-        "label_theme": "Tema",
-        # File explorer buttons
-        "tooltip_open_launcher_drive": "Otvori launcher disk",
-        "tooltip_open_mounted_volume": "Otvori montirani volumen",
-        "popup_open_failed_title": "Otvaranje nije uspjelo",
-        "popup_open_failed_body": "Nije moguće otvoriti upravitelj datoteka:\n\n{path}\n\n{error}",
-        # About section (CHG-20251221-012)
-        "settings_about": "O programu",
-        "label_version": "Verzija:",
-        "label_build_id": "ID izgradnje:",
-        "label_build_dev": "Razvoj",
-        "label_compat_version": "Verzija konfiguracije:",
-        # Recovery kit generation (CHG-20251221-001)
-        "recovery_generate_section_title": "Generiši paket za oporavak",
-        "recovery_generate_instructions": "Generirajte novi paket za oporavak da biste napravili šifrovanu sigurnosnu kopiju vaših vjerodajnica. Ovo je korisno ako je vaš originalni paket izgubljen, oštećen ili ako želite novu kopiju nakon promjene vjerodajnica.",
-        "btn_generate_recovery_kit": "🔐 Generiši novi paket za oporavak",
-        "recovery_generate_status_ready": "Kliknite 'Generiši novi paket za oporavak' za kreiranje novog paketa.",
-        "recovery_generate_status_deriving": "Izvođenje vjerodajnica iz hardverskog ključa...",
-        "recovery_generate_status_verifying": "Provjera vjerodajnica sa VeraCrypt-om...",
-        "recovery_generate_status_running": "Generisanje paketa za oporavak...",
-        "recovery_generate_status_success": "✅ Paket za oporavak uspješno generisan!",
-        "recovery_generate_status_failed": "❌ Generisanje paketa za oporavak nije uspjelo: {error}",
-        "recovery_generate_confirm_title": "Generiši paket za oporavak",
-        "recovery_generate_confirm_body": "Ovo će generisati novi paket za oporavak sa šifriranom sigurnosnom kopijom vaših vjerodajnica.\n\nŽelite li nastaviti?",
-        "recovery_generate_regen_confirm_title": "Regeneriši paket za oporavak",
-        "recovery_generate_regen_confirm_body": "⚠️ UPOZORENJE: Ovo će stvoriti NOVI paket za oporavak.\n\nVaš POSTOJEĆI paket za oporavak će biti TRAJNO PONIŠTEN.\n\nŽelite li nastaviti?",
-        "recovery_generate_security_warning_title": "Sigurnosno upozorenje: Regenerisanje paketa za oporavak",
-        "recovery_generate_security_warning_body": "⚠️ SIGURNOSNO UPOZORENJE ⚠️\n\nPaket za oporavak već postoji. Stvaranje novog će:\n\n• Poništiti prethodni paket\n• Stvoriti NOVI pristup vašim šifriranim podacima\n• Svako s novim paketom može pristupiti vašim podacima\n\nNastavite samo ako razumijete sigurnosne implikacije.\n\nŽelite li regenerisati?",
-        "recovery_generate_password_prompt_title": "Unesite lozinku volumena",
-        "recovery_generate_password_prompt_body": "Molimo unesite lozinku volumena za generisanje paketa za oporavak:",
-        "recovery_generate_success_title": "Paket za oporavak generisan",
-        "recovery_generate_success_body": "Vaš paket za oporavak je generisan!\n\nLokacija: {path}\n\n⚠️ VAŽNO:\n• Odmah odštampajte HTML datoteku\n• Čuvajte na sigurnoj fizičkoj lokaciji\n• Obrišite HTML datoteku s diska nakon štampanja",
-        # Settings dialog - Additional fields (schema-driven UI)
-        "label_drive_id": "ID diska",
-        "label_drive_name": "Naziv diska",
-        "label_setup_date": "Datum postavljanja",
-        "label_last_password_change": "Posljednja promjena lozinke",
-        "label_last_verified": "Posljednja provjera",
-        "label_plain_keyfile": "Obična datoteka ključa",
-        "label_seed_gpg_path": "GPG seed datoteka",
-        "label_kdf": "Funkcija izvođenja ključa",
-        "label_pw_encoding": "Kodiranje lozinke",
-        "label_recovery_enabled": "Omogući paket za oporavak",
-        "label_recovery_share_count": "Broj dijelova za oporavak",
-        "label_recovery_threshold": "Prag oporavka",
-        "label_lost_and_found_enabled": "Omogući poruku pronađenog",
-        "label_lost_and_found_message": "Poruka povrata",
-        "label_verification_overridden": "Provjera zaobiđena",
-        "label_integrity_signed": "Integritet potpisan",
-        "label_signing_key_fpr": "Otisak prsta ključa potpisa",
-        "label_salt_b64": "Salt (Base64)",
-        "label_hkdf_info": "HKDF Info",
-        "label_schema_version": "Verzija šeme",
-        "label_version": "Verzija",
-        # Tooltips for settings fields
-        "tooltip_drive_id": "Jedinstveni identifikator za ovaj disk (samo za čitanje)",
-        "tooltip_drive_name": "Prilagođeni naziv za ovaj disk",
-        "tooltip_language": "Jezik korisničkog interfejsa",
-        "tooltip_theme": "Šema boja za interfejs",
-        "tooltip_mode": "Sigurnosni način: samo lozinka, datoteka ključa ili YubiKey/GPG",
-        "tooltip_encrypted_keyfile": "Putanja do GPG-šifrirane datoteke ključa (za GPG načine)",
-        "tooltip_plain_keyfile": "Putanja do nešifrirane datoteke ključa (za običan način datoteke ključa)",
-        "tooltip_seed_gpg_path": "Putanja do GPG seed datoteke za izvođenje lozinke",
-        "tooltip_kdf": "Funkcija izvođenja ključa za GPG način lozinke",
-        "tooltip_pw_encoding": "Kodiranje znakova za lozinku (UTF-8 preporučeno)",
-        "tooltip_windows_volume_path": "Windows volumen GUID ili putanja uređaja",
-        "tooltip_mount_letter": "Slovo diska za montiranje (A-Z)",
-        "tooltip_veracrypt_path": "Putanja do VeraCrypt.exe izvršne datoteke",
-        "tooltip_unix_volume_path": "Unix putanja uređaja (npr. /dev/sdb2)",
-        "tooltip_mount_point": "Unix direktorij tačke montiranja",
-        # BUG-20251221-037: Mount point fallback i18n keys
-        "label_allow_mount_fallback": "Automatski koristi alternativnu tačku montiranja",
-        "tooltip_allow_mount_fallback": "Kada je omogućeno, automatski se pokušavaju alternativna slova diska (Windows) ili direktoriji montiranja (Unix) ako konfigurisani nije dostupan. Preporučeno za izbjegavanje grešaka montiranja.",
-        "error_mount_point_occupied_fallback_disabled": "Tačka montiranja {mount_point} je već u upotrebi.\n\nDa biste izbjegli ovu grešku u budućnosti, omogućite 'Automatski koristi alternativnu tačku montiranja' u Postavke → {os_tab}.",
-        "error_mount_point_all_occupied": "Nije moguće pronaći dostupnu tačku montiranja nakon 3 pokušaja.\n\nSva slova diska D-Z su zauzeta (Windows) ili alternative tačke montiranja nisu uspjele (Unix).\n\nOvo je problem sa tačkom montiranja, NE problem sa akreditivima.",
-        "warning_mount_fallback_used": "Konfigurisana tačka montiranja {original} nije bila dostupna.\nKoristi se {fallback} umjesto toga. Konfiguracija ažurirana.",
-        "tooltip_recovery_enabled": "Omogući generisanje hitnog paketa za oporavak",
-        "tooltip_recovery_share_count": "Broj dijelova za oporavak za generisanje",
-        "tooltip_recovery_threshold": "Minimalan broj dijelova potrebnih za oporavak",
-        "tooltip_lost_and_found_enabled": "Omogući poruku povrata ako je disk izgubljen",
-        "tooltip_lost_and_found_message": "Poruka prikazana ako je disk pronađen",
-        "tooltip_source_type": "Izvor ažuriranja: lokalni direktorij ili URL servera",
-        "tooltip_server_url": "URL servera za ažuriranja",
-        "tooltip_local_root": "Lokalni direktorij sa datotekama ažuriranja",
-        "hint_update_local_title": "O lokalnim ažuriranjima",
-        "hint_update_local_body": "Odaberite: (1) direktorij koji sadrži .smartdrive/ folder (npr. H:\\ ili C:\\MojDev\\), ili (2) direktno .smartdrive/ folder. .smartdrive/ će biti automatski detektovan. Korisnicki podaci (recovery/, keys/, integrity/, config.json) su automatski zaštićeni. Razvojne datoteke (.git, testovi, helper/) su isključene.",
-        # CHG-20251222-016: Update action section i18n keys
-        "update_action_section_title": "Akcije ažuriranja",
-        "btn_run_update": "Pokreni ažuriranje",
-        "tooltip_run_update": "Izvrši ažuriranje iz konfigurisanog izvora",
-        "label_last_update": "Posljednje ažuriranje:",
-        "label_last_update_source": "Izvor:",
-        "update_never": "Nikad",
-        "update_source_none": "Nije konfigurisano",
-        "tooltip_verification_overridden": "Zaobiđi provjeru integriteta (opasno!)",
-        "tooltip_integrity_signed": "Integritet diska je kriptografski potpisan",
-        "tooltip_signing_key_fpr": "Otisak prsta GPG ključa korišten za potpis",
-        "tooltip_salt_b64": "Kriptografski salt za izvođenje ključa",
-        "tooltip_hkdf_info": "Kontekstni string za HKDF izvođenje ključa",
-        # Integrity tab (CHG-20251220-002)
-        "label_integrity_status": "Status integriteta:",
-        "tooltip_integrity_status": "Prikazuje da li su skripte verifikovane protiv potpisanih hasheva",
-        # CHG-20251222-014: OS-specific tab tooltip
-        "tooltip_tab_disabled_other_os": "Ova kartica je za drugi operativni sistem",
-        "settings_integrity": "Integritet",
-        "settings_integrity_desc": "Provjerite integritet softvera i potpišite skripte.",
-        "integrity_section_title": "🔐 Integritet softvera",
-        "integrity_instructions": "Provjerite da li su skripte promijenjene od potpisivanja. Potpisivanje zahtijeva hardverski ključ (YubiKey/GPG karticu).",
-        "btn_verify_local": "✓ Provjeri integritet (lokalno)",
-        "btn_sign_scripts": "🔑 Potpiši skripte",
-        "btn_verify_remote": "🌐 Provjeri (udaljeno)",
-        "integrity_status_ready": "Kliknite 'Provjeri' za provjeru integriteta skripte.",
-        "integrity_status_checking": "Provjera integriteta...",
-        "integrity_status_signing": "Potpisivanje skripti sa hardverskim ključem...",
-        "integrity_status_pass": "✅ Integritet potvrđen! Skripte su autentične.",
-        "integrity_status_fail": "❌ Provjera integriteta NEUSPJEŠNA! Skripte su možda promijenjene.",
-        "integrity_status_no_manifest": "⚠️ Manifest integriteta nije pronađen. Skripte nisu potpisane.",
-        "integrity_status_sign_success": "✅ Skripte uspješno potpisane!",
-        "integrity_status_sign_fail": "❌ Potpisivanje neuspješno. Da li je hardverski ključ umetnut?",
-        "integrity_result_hash": "Hash: {hash}",
-        "integrity_result_signer": "Potpisano od: {signer}",
-        "integrity_remote_url_label": "URL servera:",
-        "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
-        "integrity_status_remote_checking": "Slanje zahtjeva za verifikaciju serveru...",
-        "integrity_status_remote_success": "✅ Udaljena verifikacija uspješna!",
-        "integrity_status_remote_fail": "❌ Udaljena verifikacija neuspješna: {error}",
-        "integrity_status_no_server_url": "⚠️ URL servera nije konfigurisan. Postavite u Postavke → Integritet.",
-        "label_integrity_server_url": "URL servera za verifikaciju",
-        "tooltip_integrity_server_url": "URL udaljenog servera za verifikaciju (npr. https://verify.example.com/api/check)",
-    },
-    "es": {
-        # Window titles
-        "window_title": "KeyDrive",
-        "settings_window_title": "Configuración",
-        # Button labels
-        "btn_mount": "🔓 Montar",
-        "btn_unmount": "🔒 Desmontar",
-        "btn_cancel_auth": "❌ Cancelar",
-        "btn_confirm_mount": "✅ Confirmar",
-        "btn_tools": "⚙️",
-        "btn_close": "✕",
-        "btn_save": "Guardar",
-        "btn_cancel": "Cancelar",
-        "btn_confirm": "Confirmar",
-        "btn_ok": "OK",
-        "warning": "Advertencia",
-        "settings_tab_security": "Seguridad",
-        # CHG-20251223-055: Reload config button for non-modal settings
-        "btn_reload_config": "↻ Recargar config",
-        "tooltip_reload_config": "Recargar configuración desde disco (descarta cambios no guardados)",
-        # Status messages
-        "status_config_not_found": "Configuración no encontrada",
-        "status_volume_mounted": "Volumen montado",
-        "status_volume_not_mounted": "Volumen no montado",
-        "status_mounting": "⏳ Montando volumen...",
-        "status_mounting_gpg": "⏳ Montando volumen (autenticación GPG)...",
-        "status_unmounting": "⏳ Desmontando volumen...",
-        "status_mount_success": "✅ Volumen montado correctamente",
-        "status_mount_failed": "❌ Error al montar",
-        "status_unmount_success": "✅ Volumen desmontado correctamente",
-        "status_unmount_failed": "❌ Error al desmontar",
-        # Info labels
-        "info_unavailable": "Información no disponible",
-        "keyfile_selected_one": "1 archivo de clave seleccionado",
-        "keyfile_selected_many": "{count} archivos de clave seleccionados",
-        "keyfile_drop_hint": "Arrastra los archivos de clave aquí o haz clic para buscar",
-        "keyfile_drop_supports_multiple": "Admite varios archivos de clave",
-        "label_show_password": "Mostrar contraseña",
-        # Size formatting
-        "size_free": "Libre: {size}",
-        # Icons/placeholders
-        "icon_drive": "🚀",
-        # Tooltips
-        "tooltip_exit": "Salir de SmartDrive",
-        "tooltip_settings": "Herramientas y configuración avanzadas",
-        # Labels
-        "label_product_name": "Nombre del producto",
-        "label_preview": "Vista previa:",
-        "label_password": "Contraseña:",
-        "label_keyfile": "Archivo de clave:",
-        "label_hardware_key_hint": "💡 Puede requerirse una llave de hardware para la autenticación",
-        "label_forgot_password": "¿Olvidaste tu contraseña?",
-        # Placeholder text
-        "placeholder_password": "Introduce tu contraseña de VeraCrypt...",
-        # Menu items
-        "menu_settings": "⚙️ Configuración",
-        "menu_rekey": "🔑 Cambiar contraseña/archivo de clave",
-        "menu_update": "⬇️ Actualizar scripts",
-        "menu_recovery": "💾 Kit de recuperación",
-        "menu_about": "ℹ️ Acerca de",
-        "menu_cli": "💻 Abrir CLI",
-        "menu_exit": "⏻ Salir",
-        "menu_clear_keyfiles": "Borrar archivos de clave",
-        "menu_switch_drive": "🔀 Cambiar unidad...",
-        "menu_switch_drive_browse": "📂 Examinar...",
-        # CHG-20251221-042: Remote Control Mode menu items (Spanish)
-        "menu_manage_remote": "🌐 Control remoto...",
-        "menu_manage_remote_browse": "📂 Buscar .smartdrive remoto...",
-        "menu_exit_remote": "🏠 Salir del modo remoto",
-        "remote_active_label": "Control remoto activo",
-        "remote_click_to_end": "Clic para terminar",
-        "remote_validation_failed_title": "Validación remota fallida",
-        "remote_validation_failed_body": "No se puede conectar a la unidad remota:\n\n{error}",
-        "remote_disconnected_title": "Unidad remota desconectada",
-        "remote_disconnected_body": "La unidad remota ({drive}:) se ha desconectado.\n\nVolviendo al modo local.",
-        "remote_confirm_title": "Entrar en modo de control remoto",
-        "remote_confirm_body": "Conectar a .smartdrive remoto en:\n{path}\n\nEn modo remoto, solo puede montar/desmontar el volumen remoto.\nConfiguración, actualizaciones y acceso CLI están deshabilitados.",
-        "remote_mode_disabled_title": "Modo remoto activo",
-        "remote_mode_disabled_cli": "Acceso CLI deshabilitado en modo remoto.",
-        "remote_mode_disabled_settings": "Configuración deshabilitada en modo remoto. Salga del modo remoto primero.",
-        "remote_mode_disabled_update": "Actualizaciones deshabilitadas en modo remoto. Salga del modo remoto primero.",
-        "dialog_select_keyfiles": "Seleccionar archivo(s) de clave",
-        # Multi-drive context (CHG-20251221-026)
-        "label_launcher_root": "Unidad de inicio:",
-        "group_drive_context": "Contexto de unidad",
-        "tooltip_launcher_root": "La unidad que contiene esta carpeta .smartdrive",
-        # Drive safety context (CHG-20251221-040)
-        "label_os_drive": "Unidad del sistema:",
-        "tooltip_os_drive": "Unidad que ejecuta el sistema operativo (no se puede reparticionar)",
-        "label_instantiation_drive": "Ejecutándose desde:",
-        "tooltip_instantiation_drive": "Unidad desde la que se lanzó esta instancia (no se puede reparticionar)",
-        "switch_drive_title": "Cambiar contexto de unidad",
-        "switch_drive_confirm": "Cambiar a la configuración de:\n{path}\n\nTodas las configuraciones se recargarán desde esta unidad.",
-        "switch_drive_invalid_path": "Carpeta .smartdrive inválida. No se encontró config.json.",
-        "switch_drive_select_folder": "Seleccionar carpeta .smartdrive",
-        "version_incompatible_title": "Advertencia de compatibilidad de versión",
-        "version_incompatible_error": "No se puede cambiar a esta unidad:\n\n{message}\n\nEl formato de configuración no es compatible con esta versión del software.",
-        "version_incompatible_warning": "{message}\n\nDestino: {path}\n\n¿Desea continuar de todos modos?",
-        # Tray
-        "tray_minimized_message": "Ejecutándose en segundo plano. Haz clic en el icono de la bandeja para abrir.",
-        "tray_unavailable_message": "La bandeja del sistema no está disponible.\n\n¿Desea cerrar la aplicación?",
-        "tray_tooltip": "{name} ({id})",
-        # Status messages
-        "status_deriving_yubikey_password": "Derivando contraseña de YubiKey...",
-        "status_checking_mount": "Comprobando estado de montaje...",
-        "status_unmounting_for_rekey": "Desmontando volumen para rekey...",
-        "status_decrypting_keyfile": "Descifrando archivo de claves con YubiKey...",
-        # Worker messages (keys for structured errors)
-        "worker_mount_script_not_found": "No se encontró el script de montaje",
-        "worker_mount_success": "Volumen montado correctamente",
-        "worker_mount_failed": "Error al montar: {error}",
-        "worker_mount_timeout": "Tiempo de espera agotado al montar",
-        "worker_mount_error": "Error de montaje: {error}",
-        "worker_unmount_script_not_found": "No se encontró el script de desmontaje",
-        "worker_unmount_success": "Volumen desmontado correctamente",
-        "worker_unmount_failed": "Error al desmontar: {error}",
-        "worker_unmount_timeout": "Tiempo de espera agotado al desmontar",
-        "worker_unmount_error": "Error de desmontaje: {error}",
-        # Settings dialog - Tab names
-        "settings_language": "Idioma",
-        "settings_general": "General",
-        "settings_security": "Seguridad",
-        "settings_keyfile": "Archivo de clave",
-        "settings_windows": "Windows",
-        "settings_unix": "Unix",
-        "settings_updates": "Actualizaciones",
-        "settings_recovery": "Recuperación",
-        "settings_lost_and_found": "Perdido y encontrado",
-        "settings_advanced": "Avanzado",
-        # Settings dialog - Tab descriptions
-        "settings_general_desc": "Configure el nombre para mostrar, el idioma y las preferencias de tema.",
-        "settings_security_desc": "Establezca el modo de cifrado y el método de autenticación para su unidad segura.",
-        "settings_keyfile_desc": "Administre las rutas de archivos de clave para cifrado y autenticación GPG.",
-        "settings_windows_desc": "Configuración específica de Windows incluyendo letra de unidad y ubicación de VeraCrypt.",
-        "settings_unix_desc": "Configuración de Linux y macOS incluyendo directorio del punto de montaje.",
-        "settings_updates_desc": "Configure la verificación automática de actualizaciones y la configuración del servidor.",
-        "settings_recovery_desc": "Configure las opciones de recuperación Shamir Secret Sharing para recuperar el acceso si se pierden las claves.",
-        "settings_lost_and_found_desc": "Muestre un mensaje de contacto en la unidad para su devolución si se pierde.",
-        "settings_advanced_desc": "Configuración técnica para parámetros de cifrado y verificación de integridad.",
-        # BUG-20251221-036: Settings dialog - Group box titles (Spanish)
-        "group_drive_identification": "Identificación de unidad",
-        "group_appearance": "Apariencia",
-        "group_timestamps": "Marcas de tiempo",
-        "group_security_mode": "Modo de seguridad",
-        "group_keyfile_configuration": "Configuración de archivo de clave",
-        "group_gpg_configuration": "Configuración de GPG",
-        "group_emergency_recovery_kit": "Kit de recuperación de emergencia",
-        "group_verification": "Verificación",
-        "group_verification_status": "Estado de verificación",
-        "group_software_integrity": "Integridad del software",
-        "group_remote_verification": "Verificación remota",
-        "group_gpg_kdf_parameters": "Parámetros de GPG KDF",
-        "group_metadata": "Metadatos",
-        "settings_restart_not_required": "✓ Cambios aplicados inmediatamente (no se requiere reinicio)",
-        "label_mode": "Modo",
-        "label_encrypted_keyfile": "Archivo de clave cifrado",
-        "label_volume_path": "Ruta del volumen",
-        "label_mount_letter": "Letra de unidad",
-        "label_veracrypt_path": "Ruta de VeraCrypt",
-        "label_mount_point": "Punto de montaje",
-        "label_source_type": "Tipo de origen",
-        "label_server_url": "URL del servidor",
-        "label_local_root": "Raíz local",
-        "error_invalid_mount_letter": "La letra de unidad debe ser un solo carácter A–Z.",
-        "error_save_failed": "No se pudo guardar config.json:",
-        "title_invalid_mount_letter": "Letra de unidad no válida",
-        "title_save_failed": "Error al guardar",
-        "title_error": "Error",
-        "error_apply_theme": "No se pudo aplicar el tema: {error}",
-        "error_apply_language": "No se pudo aplicar el idioma: {error}",
-        # Popup dialogs
-        "popup_keyfile_required_title": "Se requiere archivo de clave",
-        "popup_keyfile_required_body": "Selecciona un archivo de clave para el modo contraseña + archivo de clave.",
-        "popup_password_required_title": "Se requiere contraseña",
-        "popup_password_required_body": "Introduce tu contraseña de VeraCrypt.",
-        "popup_recovery_title": "Recuperación de contraseña",
-        "popup_recovery_available_body": "¡Hay un kit de recuperación disponible para esta unidad!\n\nPara recuperar el acceso a tu volumen cifrado:\n\n1. Usa la CLI de SmartDrive: python smartdrive.py\n2. Selecciona la opción 6: Kit de recuperación\n3. Sigue las instrucciones de recuperación\n\nO contacta con tu administrador del sistema.",
-        "popup_recovery_unavailable_body": "Actualmente no hay un kit de recuperación disponible para esta unidad.\n\nPara configurar la recuperación de contraseña:\n\n1. Usa la CLI de SmartDrive: python smartdrive.py\n2. Selecciona la opción 6: Kit de recuperación\n3. Elige 'Generate Recovery Kit'\n\nO contacta con tu administrador del sistema.",
-        # Recovery tab - Phrase input and recovery actions
-        "recovery_section_title": "🔐 Recuperación de emergencia",
-        "recovery_instructions": "Introduce tu frase de recuperación de 24 palabras para recuperar el acceso a tu volumen cifrado. También puedes proporcionar un archivo contenedor de recuperación si tienes uno.",
-        "label_recovery_phrase": "Frase de recuperación (24 palabras):",
-        "placeholder_recovery_phrase": "Introduce 24 palabras separadas por espacios...",
-        "label_recovery_container": "Contenedor de recuperación (opcional):",
-        "btn_browse_container": "Examinar...",
-        "btn_recover_credentials": "🔓 Recuperar credenciales",
-        "recovery_status_ready": "Introduce tu frase de recuperación y haz clic en 'Recuperar credenciales'",
-        "recovery_status_validating": "Validando frase de recuperación...",
-        "recovery_status_decrypting": "Descifrando contenedor de recuperación...",
-        "recovery_status_success": "✅ ¡Recuperación exitosa! Credenciales recuperadas.",
-        "recovery_status_failed": "❌ Error en la recuperación: {error}",
-        "recovery_result_title": "Credenciales recuperadas",
-        "recovery_result_password": "Contraseña:",
-        "recovery_result_keyfile": "Archivo de clave:",
-        "recovery_result_mode": "Modo de seguridad:",
-        "recovery_result_copy_password": "📋 Copiar contraseña",
-        "recovery_result_save_keyfile": "💾 Guardar archivo de clave",
-        "recovery_copied_to_clipboard": "Contraseña copiada al portapapeles (se borrará en 30 segundos)",
-        "recovery_keyfile_saved": "Archivo de clave guardado en: {path}",
-        "recovery_phrase_invalid": "Frase de recuperación no válida. Verifica las 24 palabras.",
-        "recovery_container_not_found": "Contenedor de recuperación no encontrado. Selecciona el archivo contenedor.",
-        "recovery_no_kit_configured": "No hay kit de recuperación configurado para esta unidad.",
-        "recovery_generate_first": "Por favor genera primero un kit de recuperación desde Configuración o CLI.",
-        "recovery_already_used": "⚠️ El kit de recuperación ya fue utilizado. Esta operación está deshabilitada.",
-        "recovery_status_invalidating": "Invalidando kit de recuperación...",
-        "recovery_status_complete": "Recuperación completada. El kit de recuperación ha sido invalidado permanentemente.",
-        "recovery_rekey_required_title": "Cambio de credenciales obligatorio",
-        "recovery_rekey_required_body": "La recuperación fue exitosa. Por razones de seguridad, DEBES cambiar tu contraseña/archivo de clave ahora.\n\nEl kit de recuperación contenía credenciales temporales que ahora están comprometidas.\n\n¿Deseas cambiar tus credenciales ahora?",
-        "recovery_rekey_now": "Cambiar credenciales ahora",
-        "recovery_rekey_later": "Recordarme después",
-        "recovery_rekey_skipped_warning": "⚠️ Omitiste el cambio de credenciales. No podrás montar tu unidad hasta que las credenciales sean cambiadas.",
-        "mount_blocked_rekey_required_title": "Cambio de credenciales obligatorio",
-        "mount_blocked_rekey_required_body": "Se usó el kit de recuperación pero las credenciales no han sido cambiadas. Por seguridad, el montaje está bloqueado.\n\nUsa el script de cambio de clave para establecer nuevas credenciales.",
-        "mount_warn_rekey_title": "Cambio de credenciales recomendado",
-        "mount_warn_rekey_body": "El kit de recuperación fue usado recientemente. Se recomienda encarecidamente cambiar tus credenciales.\n\n¿Deseas cambiar las credenciales ahora o continuar con el montaje?",
-        "label_recovery_status": "Estado del kit de recuperación",
-        "recovery_kit_available": "✅ Disponible",
-        "recovery_kit_used": "🚫 Usado (Inválido)",
-        "recovery_kit_not_configured": "⚪ No configurado",
-        "recovery_html_warning": "¡Archivo HTML de recuperación aún en el disco! Elimínalo después de imprimir por seguridad.",
-        "tooltip_recovery_status": "Muestra si el kit de recuperación está disponible, fue utilizado o no está configurado",
-        "rekey_section_title": "🔑 Cambiar credenciales",
-        "rekey_instructions": "Cambia la contraseña de tu contenedor VeraCrypt y/o archivos de clave.",
-        "rekey_post_recovery_notice": "⚠️ POST-RECUPERACIÓN: Debes cambiar las credenciales antes de que el montaje sea permitido.",
-        "btn_start_rekey": "Iniciar cambio de credenciales...",
-        # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
-        "btn_verify_rekey": "✓ Verificar nuevas credenciales",
-        "btn_cancel_rekey": "✕ Cancelar",
-        "rekey_instructions_veracrypt": "GUI de VeraCrypt abierto. En VeraCrypt:\n1. Herramientas → Cambiar contraseña del volumen\n2. Seleccionar dispositivo → elige tu volumen\n3. Ingresa contraseña actual ('Copiar contraseña anterior' arriba)\n4. Ingresa nueva contraseña ('Copiar contraseña nueva' arriba)\n5. Haz clic en OK\n\nDespués de confirmar en VeraCrypt, haz clic en 'Verificar nuevas credenciales'.",
-        "rekey_verifying": "Verificando nuevas credenciales mediante prueba de montaje...",
-        "rekey_verification_success": "✓ ¡Nuevas credenciales verificadas! Finalizando rekey...",
-        "rekey_verification_failed": "✕ Verificación fallida. Verifica tu nueva contraseña/archivo de clave.",
-        "rekey_cancelled": "Cambio de credenciales cancelado.",
-        # BUG-20251221-039: Copy credential buttons
-        # CHG-20251222-018: Enhanced tooltips for clarity
-        "btn_copy_old_password": "📋 Copiar contraseña anterior",
-        "btn_copy_new_password": "📋 Copiar contraseña nueva",
-        "tooltip_copy_old_password": "Derivar y copiar contraseña ACTUAL usando semilla GPG EXISTENTE. Para modos GPG, usa tu llave de hardware. (30s TTL)",
-        "tooltip_copy_old_password_post_recovery": "Deshabilitado: Después de la recuperación, usa la contraseña del kit de recuperación. El seed GPG puede faltar o estar dañado.",
-        "tooltip_copy_new_password": "Derivar y copiar NUEVA contraseña usando NUEVA semilla GPG (arriba). Primero genera nuevo seed.gpg. (30s TTL)",
-        "rekey_gpg_seed_hint": "Para modos GPG: La 'Nueva Semilla GPG' arriba define qué contraseña se derivará. Primero genera un nuevo seed.gpg, luego usa 'Copiar contraseña nueva'.",
-        "copy_password_title": "Copiar contraseña",
-        "rekey_status_ready": "Listo para cambiar credenciales",
-        "rekey_status_preparing": "Preparando cambio de credenciales...",
-        "rekey_status_opening_veracrypt": "Abriendo VeraCrypt GUI...",
-        "rekey_status_awaiting_confirmation": "Esperando confirmación del cambio de contraseña...",
-        "rekey_status_verifying": "Verificando nuevas credenciales...",
-        "rekey_validating": "Validando nuevas credenciales...",
-        "rekey_verifying_mount": "Verificando credenciales vía montaje...",
-        "rekey_credentials_verified": "¡Nuevas credenciales verificadas exitosamente!",
-        "rekey_testing_mount": "Probando montaje con nuevas credenciales...",
-        "rekey_validation_success": "Validación exitosa - desmontando...",
-        "rekey_status_success": "✅ Credenciales cambiadas exitosamente",
-        "rekey_status_failed": "❌ Cambio de credenciales falló: {error}",
-        "btn_verify_rekey": "Verificar cambio completado",
-        "rekey_current_password_label": "Contraseña actual:",
-        "rekey_current_password_auto": "(detectada automáticamente)",
-        "rekey_new_password_label": "Nueva contraseña:",
-        "rekey_confirm_password_label": "Confirmar contraseña:",
-        "rekey_current_mode_label": "Modo de seguridad actual:",
-        "rekey_target_mode_label": "Nuevo modo de seguridad:",
-        "rekey_mode_same_tooltip": "Mantener el modo de seguridad actual",
-        "rekey_mode_pw_only": "🔒 Solo contraseña",
-        "rekey_mode_pw_keyfile": "🔑 Contraseña + Archivo de clave",
-        "rekey_mode_pw_gpg_keyfile": "🛡️ Contraseña + Archivo de clave derivado GPG",
-        "rekey_mode_gpg_pw_only": "🔐 Contraseña derivada GPG (solo lectura)",
-        "rekey_new_keyfile_label": "Nueva ruta de archivo de clave:",
-        "rekey_new_gpg_seed_label": "Nueva ruta de semilla GPG:",
-        "btn_browse_keyfile": "Examinar...",
-        # CHG-20251221-003: GPG seed generation button
-        "btn_generate_gpg_seed": "Generar",
-        "tooltip_generate_gpg_seed": "Generar nueva semilla GPG cifrada para derivación de contraseña. Requiere YubiKey/tarjeta GPG.",
-        "gpg_seed_generate_title": "Generar Semilla GPG",
-        "gpg_seed_generate_confirm": "Esto generará una nueva semilla criptográficamente segura y la cifrará con su clave GPG.\n\nAsegúrese de que su YubiKey/tarjeta GPG esté insertada.\n\n¿Continuar?",
-        "gpg_seed_generate_success": "¡Semilla GPG generada exitosamente!",
-        "gpg_seed_generate_fail": "Error al generar semilla GPG",
-        "gpg_seed_derive_info": "Se mostrará la contraseña derivada de esta semilla.\nCópiela para usarla como su nueva contraseña de VeraCrypt.",
-        # CHG-20251223-032: Multi-key authentication
-        "gpg_key_auth_title": "Autenticar Clave GPG",
-        "gpg_key_auth_prompt": "Para asegurarse de que tiene acceso a esta clave, por favor autentíquese.\n\nClave: {fingerprint}\n\nPuede que se le solicite su PIN.",
-        "gpg_key_auth_success": "Clave autenticada exitosamente.",
-        "gpg_key_auth_fail": "Error de autenticación para clave: {fingerprint}",
-        "gpg_key_auth_skip_prompt": "¿Desea omitir la autenticación para esta clave?\n\n⚠️ ADVERTENCIA: Si omite, puede configurar una clave que no posee.\nEsto es aceptable cuando delega el acceso a otra persona.",
-        "gpg_key_auth_skipped": "Autenticación omitida para clave: {fingerprint}",
-        # CHG-20251221-008: GPG key selection dialog
-        "gpg_key_select_title": "Seleccionar Clave GPG para Cifrado",
-        "gpg_key_select_hint": "Seleccione una clave de hardware de la lista o ingrese manualmente una huella digital o correo electrónico si su clave no está listada.",
-        "gpg_key_select_label": "Clave GPG:",
-        "gpg_key_select_placeholder": "Seleccionar o ingresar clave...",
-        "gpg_key_select_manual": "Entrada manual...",
-        "gpg_key_select_none": "No se encontraron claves secretas GPG",
-        "gpg_key_manual_label": "Ingrese huella digital o correo:",
-        # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
-        "gpg_key_select_hint_multi": "Seleccione una o más claves de hardware de la lista a continuación para redundancia.\nTambién puede ingresar manualmente huellas digitales adicionales (separadas por coma o salto de línea).",
-        "gpg_key_manual_label_multi": "Huellas digitales adicionales:",
-        "gpg_key_select_placeholder_multi": "Ingrese huellas digitales (separadas por coma o salto de línea)...",
-        "gpg_key_select_none_selected": "Por favor seleccione al menos una clave GPG o ingrese una huella digital manualmente.",
-        "rekey_mode_change_warning": "⚠️ Cambiar el modo de seguridad requiere verificación adicional",
-        "rekey_gpg_seed_instructions": "Por favor conecta tu YubiKey e ingresa la ruta a tu archivo de semilla GPG.",
-        "popup_unmount_failed_title": "Error al desmontar",
-        "popup_mount_failed_title": "Error al montar",
-        "popup_update_not_possible_title": "Actualización no posible",
-        "popup_update_confirm_title": "Confirmar actualización",
-        "popup_update_direction": "Dirección",
-        "popup_update_source": "Fuente",
-        "popup_update_destination": "Destino",
-        "popup_update_files_to_update": "Archivos a actualizar",
-        "popup_update_protected_items": "Elementos protegidos (Nunca sobrescritos)",
-        "popup_update_protected_list": "Los siguientes datos de usuario están protegidos automáticamente: {items}",
-        "popup_update_warning": "Advertencia",
-        "popup_update_warning_body": "Esto sobrescribirá archivos de script existentes en el directorio .smartdrive/.",
-        "popup_update_confirm_message": "Se va a ejecutar UPDATE ({direction}).\n\nDESDE:\n  {src_root}\n\nHACIA:\n  {dst_root}\n\nElementos:\n  - {items}\n\nMétodo: {method}\n\nEsto sobrescribirá los archivos existentes. ¿Continuar?",
-        "popup_update_config_title": "Configuración de actualización",
-        "popup_update_config_body": "La fuente de actualización no está configurada. Configúrala en Configuración.",
-        "popup_update_complete_title": "Actualización completa",
-        "popup_update_complete_body": "La actualización finalizó correctamente. Reinicia la aplicación.",
-        "popup_update_failed_title": "Actualización fallida",
-        "popup_update_failed_body": "La actualización falló:\n\n{error}",
-        "popup_update_timeout_title": "Tiempo de espera de actualización",
-        "popup_update_timeout_body": "La actualización no se completó en 120 segundos.",
-        "popup_update_error_title": "Error de actualización",
-        "popup_update_error_body": "No se pudo ejecutar la actualización:\n\n{error}",
-        "popup_cli_failed_title": "Error al iniciar CLI",
-        "popup_cli_failed_body": "No se pudo abrir la CLI:\n\n{error}",
-        # Update configuration error messages
-        "error_update_server_url_not_configured": "El URL del servidor no está configurado.\n\nVe a Configuración para configurar el URL de actualización.",
-        "error_update_local_root_not_configured": "El directorio de actualización local no está configurado.\n\nVe a Configuración para configurar la raíz local de actualización.",
-        "error_update_local_root_not_found": "No se encontró el directorio de actualización local:\n\n{path}\n\nComprueba Configuración para verificar la ruta.",
-        "error_update_install_dir_not_found": "No se encontró el directorio de instalación:\n\n{path}",
-        "error_update_unknown_source_type": "Tipo de origen de actualización desconocido: {type}",
-        # Hardware key error messages
-        "error_hardware_key_missing_title": "Se requiere llave de hardware",
-        "error_hardware_key_missing_body": "No se detectó la llave de hardware (YubiKey/tarjeta GPG). Inserta tu llave de hardware e inténtalo de nuevo.",
-        # Theme names (for theme dropdown)
-        "theme_brand": "Marca",
-        "theme_green": "Verde",
-        "theme_blue": "Azul",
-        "theme_rose": "Rosa",
-        "theme_slate": "Pizarra",
-        "label_theme": "Tema",
-        # File explorer buttons
-        "tooltip_open_launcher_drive": "Abrir unidad del launcher",
-        "tooltip_open_mounted_volume": "Abrir volumen montado",
-        "popup_open_failed_title": "Error al abrir",
-        "popup_open_failed_body": "No se pudo abrir el explorador de archivos:\n\n{path}\n\n{error}",
-        # About section (CHG-20251221-012)
-        "settings_about": "Acerca de",
-        "label_version": "Versión:",
-        "label_build_id": "ID de compilación:",
-        "label_build_dev": "Desarrollo",
-        "label_compat_version": "Versión de configuración:",
-        # Recovery kit generation (CHG-20251221-001)
-        "recovery_generate_section_title": "Generar kit de recuperación",
-        "recovery_generate_instructions": "Genera un nuevo kit de recuperación para crear una copia de seguridad cifrada de tus credenciales. Esto es útil si tu kit original se perdió, se dañó o si deseas una nueva copia después de cambiar las credenciales.",
-        "btn_generate_recovery_kit": "🔐 Generar nuevo kit de recuperación",
-        "recovery_generate_status_ready": "Haz clic en 'Generar nuevo kit de recuperación' para crear un nuevo kit.",
-        "recovery_generate_status_deriving": "Derivando credenciales de la llave de hardware...",
-        "recovery_generate_status_verifying": "Verificando credenciales con VeraCrypt...",
-        "recovery_generate_status_running": "Generando kit de recuperación...",
-        "recovery_generate_status_success": "✅ ¡Kit de recuperación generado exitosamente!",
-        "recovery_generate_status_failed": "❌ Error al generar el kit de recuperación: {error}",
-        "recovery_generate_confirm_title": "Generar kit de recuperación",
-        "recovery_generate_confirm_body": "Esto generará un nuevo kit de recuperación con una copia de seguridad cifrada de tus credenciales.\n\n¿Deseas continuar?",
-        "recovery_generate_regen_confirm_title": "Regenerar kit de recuperación",
-        "recovery_generate_regen_confirm_body": "⚠️ ADVERTENCIA: Esto creará un NUEVO kit de recuperación.\n\nTu kit de recuperación EXISTENTE será PERMANENTEMENTE INVALIDADO.\n\n¿Deseas continuar?",
-        "recovery_generate_security_warning_title": "Advertencia de seguridad: Regeneración del kit de recuperación",
-        "recovery_generate_security_warning_body": "⚠️ ADVERTENCIA DE SEGURIDAD ⚠️\n\nYa existe un kit de recuperación. Crear uno nuevo:\n\n• Invalidará el kit anterior\n• Creará un NUEVO acceso a tus datos cifrados\n• Cualquiera con el nuevo kit puede acceder a tus datos\n\nSolo continúa si comprendes las implicaciones de seguridad.\n\n¿Deseas regenerar?",
-        "recovery_generate_password_prompt_title": "Ingresa la contraseña del volumen",
-        "recovery_generate_password_prompt_body": "Por favor, ingresa tu contraseña del volumen para la generación del kit de recuperación:",
-        "recovery_generate_success_title": "Kit de recuperación generado",
-        "recovery_generate_success_body": "¡Tu kit de recuperación ha sido generado!\n\nUbicación: {path}\n\n⚠️ IMPORTANTE:\n• Imprime el archivo HTML inmediatamente\n• Guárdalo en un lugar físico seguro\n• Elimina el archivo HTML de la unidad después de imprimirlo",
-        # Settings dialog - Additional fields (schema-driven UI)
-        "label_drive_id": "ID de unidad",
-        "label_drive_name": "Nombre de unidad",
-        "label_setup_date": "Fecha de configuración",
-        "label_last_password_change": "Último cambio de contraseña",
-        "label_last_verified": "Última verificación",
-        "label_plain_keyfile": "Archivo de clave simple",
-        "label_seed_gpg_path": "Archivo semilla GPG",
-        "label_kdf": "Función de derivación de clave",
-        "label_pw_encoding": "Codificación de contraseña",
-        "label_recovery_enabled": "Habilitar kit de recuperación",
-        "label_recovery_share_count": "Número de partes de recuperación",
-        "label_recovery_threshold": "Umbral de recuperación",
-        "label_lost_and_found_enabled": "Habilitar mensaje de objetos perdidos",
-        "label_lost_and_found_message": "Mensaje de devolución",
-        "label_verification_overridden": "Verificación anulada",
-        "label_integrity_signed": "Integridad firmada",
-        "label_signing_key_fpr": "Huella digital de clave de firma",
-        "label_salt_b64": "Salt (Base64)",
-        "label_hkdf_info": "Info HKDF",
-        "label_schema_version": "Versión del esquema",
-        "label_version": "Versión",
-        # Tooltips for settings fields
-        "tooltip_drive_id": "Identificador único para esta unidad (solo lectura)",
-        "tooltip_drive_name": "Nombre personalizado para esta unidad",
-        "tooltip_language": "Idioma de la interfaz de usuario",
-        "tooltip_theme": "Esquema de color para la interfaz",
-        "tooltip_mode": "Modo de seguridad: solo contraseña, archivo de clave o YubiKey/GPG",
-        "tooltip_encrypted_keyfile": "Ruta al archivo de clave cifrado con GPG (para modos GPG)",
-        "tooltip_plain_keyfile": "Ruta al archivo de clave no cifrado (para modo de archivo de clave simple)",
-        "tooltip_seed_gpg_path": "Ruta al archivo semilla GPG para derivación de contraseña",
-        "tooltip_kdf": "Función de derivación de clave para modo de contraseña GPG",
-        "tooltip_pw_encoding": "Codificación de caracteres para contraseña (se recomienda UTF-8)",
-        "tooltip_windows_volume_path": "GUID de volumen de Windows o ruta de dispositivo",
-        "tooltip_mount_letter": "Letra de unidad para montar como (A-Z)",
-        "tooltip_veracrypt_path": "Ruta al ejecutable VeraCrypt.exe",
-        "tooltip_unix_volume_path": "Ruta de dispositivo Unix (p. ej., /dev/sdb2)",
-        "tooltip_mount_point": "Directorio de punto de montaje Unix",
-        # BUG-20251221-037: Mount point fallback i18n keys
-        "label_allow_mount_fallback": "Usar punto de montaje alternativo automáticamente",
-        "tooltip_allow_mount_fallback": "Cuando está habilitado, intenta automáticamente letras de unidad alternativas (Windows) o directorios de montaje (Unix) si el configurado no está disponible. Recomendado para evitar errores de montaje.",
-        "error_mount_point_occupied_fallback_disabled": "El punto de montaje {mount_point} ya está en uso.\n\nPara evitar este error en el futuro, habilite 'Usar punto de montaje alternativo automáticamente' en Configuración → pestaña {os_tab}.",
-        "error_mount_point_all_occupied": "No se pudo encontrar un punto de montaje disponible después de 3 intentos.\n\nTodas las letras de unidad D-Z están en uso (Windows) o las alternativas de punto de montaje fallaron (Unix).\n\nEsto es un problema de punto de montaje, NO un problema de credenciales.",
-        "warning_mount_fallback_used": "El punto de montaje configurado {original} no estaba disponible.\nUsando {fallback} en su lugar. Configuración actualizada.",
-        "tooltip_recovery_enabled": "Habilitar generación de kit de recuperación de emergencia",
-        "tooltip_recovery_share_count": "Número de partes de recuperación para generar",
-        "tooltip_recovery_threshold": "Número mínimo de partes necesarias para recuperación",
-        "tooltip_lost_and_found_enabled": "Habilitar mensaje de devolución si se pierde la unidad",
-        "tooltip_lost_and_found_message": "Mensaje mostrado si se encuentra la unidad",
-        "tooltip_source_type": "Fuente de actualización: directorio local o URL del servidor",
-        "tooltip_server_url": "URL del servidor para actualizaciones",
-        "tooltip_local_root": "Directorio local que contiene archivos de actualización",
-        "hint_update_local_title": "Acerca de las actualizaciones locales",
-        "hint_update_local_body": "Seleccione: (1) el directorio que contiene una carpeta .smartdrive/ (ej. H:\\ o C:\\MiDes\\), o (2) una carpeta .smartdrive/ directamente. El .smartdrive/ se detectará automáticamente. Los datos del usuario (recovery/, keys/, integrity/, config.json) están protegidos automáticamente. Los archivos de desarrollo (.git, pruebas, helper/) se excluyen.",
-        # CHG-20251222-016: Update action section i18n keys
-        "update_action_section_title": "Acciones de actualización",
-        "btn_run_update": "Ejecutar actualización",
-        "tooltip_run_update": "Ejecutar actualización desde la fuente configurada",
-        "label_last_update": "Última actualización:",
-        "label_last_update_source": "Fuente:",
-        "update_never": "Nunca",
-        "update_source_none": "No configurado",
-        "tooltip_verification_overridden": "Omitir verificación de integridad (¡peligroso!)",
-        "tooltip_integrity_signed": "La integridad de la unidad ha sido firmada criptográficamente",
-        "tooltip_signing_key_fpr": "Huella digital de clave GPG usada para firmar",
-        "tooltip_salt_b64": "Salt criptográfico para derivación de clave",
-        "tooltip_hkdf_info": "Cadena de contexto para derivación de clave HKDF",
-        # Integrity tab (CHG-20251220-002)
-        "label_integrity_status": "Estado de integridad:",
-        "tooltip_integrity_status": "Muestra si los scripts han sido verificados contra hash firmado",
-        # CHG-20251222-014: OS-specific tab tooltip
-        "tooltip_tab_disabled_other_os": "Esta pestaña es para otro sistema operativo",
-        "settings_integrity": "Integridad",
-        "settings_integrity_desc": "Verificar integridad del software y firmar scripts.",
-        "integrity_section_title": "🔐 Integridad del software",
-        "integrity_instructions": "Verifique que los scripts no hayan sido modificados desde la firma. Firmar requiere clave de hardware (YubiKey/tarjeta GPG).",
-        "btn_verify_local": "✓ Verificar integridad (local)",
-        "btn_sign_scripts": "🔑 Firmar scripts",
-        "btn_verify_remote": "🌐 Verificar (remoto)",
-        "integrity_status_ready": "Haga clic en 'Verificar' para comprobar la integridad del script.",
-        "integrity_status_checking": "Verificando integridad...",
-        "integrity_status_signing": "Firmando scripts con clave de hardware...",
-        "integrity_status_pass": "✅ ¡Integridad verificada! Los scripts son auténticos.",
-        "integrity_status_fail": "❌ ¡Verificación de integridad FALLIDA! Los scripts pueden haber sido modificados.",
-        "integrity_status_no_manifest": "⚠️ No se encontró manifiesto de integridad. Los scripts no están firmados.",
-        "integrity_status_sign_success": "✅ ¡Scripts firmados exitosamente!",
-        "integrity_status_sign_fail": "❌ Firma fallida. ¿Está insertada la clave de hardware?",
-        "integrity_result_hash": "Hash: {hash}",
-        "integrity_result_signer": "Firmado por: {signer}",
-        "integrity_remote_url_label": "URL del servidor:",
-        "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
-        "integrity_status_remote_checking": "Enviando solicitud de verificación al servidor...",
-        "integrity_status_remote_success": "✅ ¡Verificación remota exitosa!",
-        "integrity_status_remote_fail": "❌ Verificación remota fallida: {error}",
-        "integrity_status_no_server_url": "⚠️ URL del servidor no configurada. Configúrela en Ajustes → Integridad.",
-        "label_integrity_server_url": "URL del servidor de verificación",
-        "tooltip_integrity_server_url": "URL del servidor de verificación remota (ej. https://verify.example.com/api/check)",
-    },
-    "fr": {
-        # Window titles
-        "window_title": "KeyDrive",
-        "settings_window_title": "Paramètres",
-        # Button labels
-        "btn_mount": "🔓 Monter",
-        "btn_unmount": "🔒 Démonter",
-        "btn_cancel_auth": "❌ Annuler",
-        "btn_confirm_mount": "✅ Confirmer",
-        "btn_tools": "⚙️",
-        "btn_close": "✕",
-        "btn_save": "Enregistrer",
-        "btn_cancel": "Annuler",
-        "btn_confirm": "Confirmer",
-        "btn_ok": "OK",
-        "warning": "Avertissement",
-        "settings_tab_security": "Sécurité",
-        # CHG-20251223-055: Reload config button for non-modal settings
-        "btn_reload_config": "↻ Recharger config",
-        "tooltip_reload_config": "Recharger la configuration depuis le disque (annule les modifications non enregistrées)",
-        # Status messages
-        "status_config_not_found": "Configuration introuvable",
-        "status_volume_mounted": "Volume monté",
-        "status_volume_not_mounted": "Volume non monté",
-        "status_mounting": "⏳ Montage du volume...",
-        "status_mounting_gpg": "⏳ Montage du volume (authentification GPG)...",
-        "status_unmounting": "⏳ Démontage du volume...",
-        "status_mount_success": "✅ Volume monté avec succès",
-        "status_mount_failed": "❌ Échec du montage",
-        "status_unmount_success": "✅ Volume démonté avec succès",
-        "status_unmount_failed": "❌ Échec du démontage",
-        # Info labels
-        "info_unavailable": "Infos indisponibles",
-        "keyfile_selected_one": "1 fichier clé sélectionné",
-        "keyfile_selected_many": "{count} fichiers clés sélectionnés",
-        "keyfile_drop_hint": "Déposez les fichiers clés ici ou cliquez pour parcourir",
-        "keyfile_drop_supports_multiple": "Prend en charge plusieurs fichiers clés",
-        "label_show_password": "Afficher le mot de passe",
-        # Size formatting
-        "size_free": "Libre : {size}",
-        # Icons/placeholders
-        "icon_drive": "🚀",
-        # Tooltips
-        "tooltip_exit": "Quitter SmartDrive",
-        "tooltip_settings": "Outils et paramètres avancés",
-        # Labels
-        "label_product_name": "Nom du produit",
-        "label_preview": "Aperçu :",
-        "label_password": "Mot de passe :",
-        "label_keyfile": "Fichier clé :",
-        "label_hardware_key_hint": "💡 Une clé matérielle peut être requise pour l'authentification",
-        "label_forgot_password": "Mot de passe oublié ?",
-        # Placeholder text
-        "placeholder_password": "Saisissez votre mot de passe VeraCrypt...",
-        # Menu items
-        "menu_settings": "⚙️ Paramètres",
-        "menu_rekey": "🔑 Changer mot de passe/fichier clé",
-        "menu_update": "⬇️ Mettre à jour les scripts",
-        "menu_recovery": "💾 Kit de récupération",
-        "menu_about": "ℹ️ À propos",
-        "menu_cli": "💻 Ouvrir la CLI",
-        "menu_exit": "⏻ Quitter",
-        "menu_clear_keyfiles": "Effacer les fichiers clés",
-        "menu_switch_drive": "🔀 Changer de lecteur...",
-        "menu_switch_drive_browse": "📂 Parcourir...",
-        # CHG-20251221-042: Remote Control Mode menu items (French)
-        "menu_manage_remote": "🌐 Contrôle à distance...",
-        "menu_manage_remote_browse": "📂 Rechercher .smartdrive distant...",
-        "menu_exit_remote": "🏠 Quitter le mode distant",
-        "remote_active_label": "Contrôle à distance actif",
-        "remote_click_to_end": "Cliquez pour terminer",
-        "remote_validation_failed_title": "Échec de validation à distance",
-        "remote_validation_failed_body": "Impossible de se connecter au lecteur distant:\n\n{error}",
-        "remote_disconnected_title": "Lecteur distant déconnecté",
-        "remote_disconnected_body": "Le lecteur distant ({drive}:) a été déconnecté.\n\nRetour au mode local.",
-        "remote_confirm_title": "Entrer en mode contrôle à distance",
-        "remote_confirm_body": "Se connecter au .smartdrive distant:\n{path}\n\nEn mode distant, vous pouvez uniquement monter/démonter le volume distant.\nParamètres, mises à jour et accès CLI sont désactivés.",
-        "remote_mode_disabled_title": "Mode distant actif",
-        "remote_mode_disabled_cli": "Accès CLI désactivé en mode distant.",
-        "remote_mode_disabled_settings": "Paramètres désactivés en mode distant. Quittez d'abord le mode distant.",
-        "remote_mode_disabled_update": "Mises à jour désactivées en mode distant. Quittez d'abord le mode distant.",
-        "dialog_select_keyfiles": "Sélectionner le(s) fichier(s) clé(s)",
-        # Multi-drive context (CHG-20251221-026)
-        "label_launcher_root": "Lecteur de lancement :",
-        "group_drive_context": "Contexte du lecteur",
-        "tooltip_launcher_root": "Le lecteur contenant ce dossier .smartdrive",
-        # Drive safety context (CHG-20251221-040)
-        "label_os_drive": "Lecteur système :",
-        "tooltip_os_drive": "Lecteur exécutant le système d'exploitation (ne peut pas être repartitionné)",
-        "label_instantiation_drive": "Exécuté depuis :",
-        "tooltip_instantiation_drive": "Lecteur depuis lequel cette instance a été lancée (ne peut pas être repartitionné)",
-        "switch_drive_title": "Changer de contexte de lecteur",
-        "switch_drive_confirm": "Basculer vers la configuration de :\n{path}\n\nTous les paramètres seront rechargés depuis ce lecteur.",
-        "switch_drive_invalid_path": "Dossier .smartdrive invalide. config.json non trouvé.",
-        "switch_drive_select_folder": "Sélectionner le dossier .smartdrive",
-        "version_incompatible_title": "Avertissement de compatibilité de version",
-        "version_incompatible_error": "Impossible de basculer vers ce lecteur :\n\n{message}\n\nLe format de configuration n'est pas compatible avec cette version du logiciel.",
-        "version_incompatible_warning": "{message}\n\nCible : {path}\n\nVoulez-vous continuer quand même ?",
-        # Tray
-        "tray_minimized_message": "Exécution en arrière-plan. Cliquez sur l'icône de la barre pour ouvrir.",
-        "tray_unavailable_message": "La barre d'état système n'est pas disponible.\n\nVoulez-vous quitter l'application ?",
-        "tray_tooltip": "{name} ({id})",
-        # Status messages
-        "status_deriving_yubikey_password": "Dérivation du mot de passe depuis YubiKey...",
-        "status_checking_mount": "Vérification de l'état du montage...",
-        "status_unmounting_for_rekey": "Démontage du volume pour rekey...",
-        "status_decrypting_keyfile": "Déchiffrement du fichier clé avec YubiKey...",
-        # Worker messages (keys for structured errors)
-        "worker_mount_script_not_found": "Script de montage introuvable",
-        "worker_mount_success": "Volume monté avec succès",
-        "worker_mount_failed": "Échec du montage : {error}",
-        "worker_mount_timeout": "Délai de montage dépassé",
-        "worker_mount_error": "Erreur de montage : {error}",
-        "worker_unmount_script_not_found": "Script de démontage introuvable",
-        "worker_unmount_success": "Volume démonté avec succès",
-        "worker_unmount_failed": "Échec du démontage : {error}",
-        "worker_unmount_timeout": "Délai de démontage dépassé",
-        "worker_unmount_error": "Erreur de démontage : {error}",
-        # Settings dialog - Tab names
-        "settings_language": "Langue",
-        "settings_general": "Général",
-        "settings_security": "Sécurité",
-        "settings_keyfile": "Fichier clé",
-        "settings_windows": "Windows",
-        "settings_unix": "Unix",
-        "settings_updates": "Mises à jour",
-        "settings_recovery": "Récupération",
-        "settings_lost_and_found": "Objets trouvés",
-        "settings_advanced": "Avancé",
-        # Settings dialog - Tab descriptions
-        "settings_general_desc": "Configurez le nom d'affichage, la langue et les préférences de thème.",
-        "settings_security_desc": "Définissez le mode de chiffrement et la méthode d'authentification pour votre disque sécurisé.",
-        "settings_keyfile_desc": "Gérez les chemins des fichiers clés pour le chiffrement et l'authentification GPG.",
-        "settings_windows_desc": "Paramètres spécifiques à Windows, notamment la lettre du lecteur et l'emplacement de VeraCrypt.",
-        "settings_unix_desc": "Paramètres Linux et macOS, notamment le répertoire du point de montage.",
-        "settings_updates_desc": "Configurez la vérification automatique des mises à jour et les paramètres du serveur.",
-        "settings_recovery_desc": "Configurez les options de récupération Shamir Secret Sharing pour récupérer l'accès si les clés sont perdues.",
-        "settings_lost_and_found_desc": "Affichez un message de contact sur le disque pour le récupérer s'il est perdu.",
-        "settings_advanced_desc": "Paramètres techniques pour les paramètres de chiffrement et la vérification de l'intégrité.",
-        # BUG-20251221-036: Settings dialog - Group box titles (French)
-        "group_drive_identification": "Identification du lecteur",
-        "group_appearance": "Apparence",
-        "group_timestamps": "Horodatages",
-        "group_security_mode": "Mode de sécurité",
-        "group_keyfile_configuration": "Configuration du fichier clé",
-        "group_gpg_configuration": "Configuration GPG",
-        "group_emergency_recovery_kit": "Kit de récupération d'urgence",
-        "group_verification": "Vérification",
-        "group_verification_status": "État de vérification",
-        "group_software_integrity": "Intégrité du logiciel",
-        "group_remote_verification": "Vérification à distance",
-        "group_gpg_kdf_parameters": "Paramètres GPG KDF",
-        "group_metadata": "Métadonnées",
-        "settings_restart_not_required": "✓ Modifications appliquées immédiatement (aucun redémarrage requis)",
-        "label_mode": "Mode",
-        "label_encrypted_keyfile": "Fichier clé chiffré",
-        "label_volume_path": "Chemin du volume",
-        "label_mount_letter": "Lettre de montage",
-        "label_veracrypt_path": "Chemin de VeraCrypt",
-        "label_mount_point": "Point de montage",
-        "label_source_type": "Type de source",
-        "label_server_url": "URL du serveur",
-        "label_local_root": "Racine locale",
-        "error_invalid_mount_letter": "La lettre de montage doit être un seul caractère A–Z.",
-        "error_save_failed": "Impossible d'enregistrer config.json :",
-        "title_invalid_mount_letter": "Lettre de montage non valide",
-        "title_save_failed": "Échec de l'enregistrement",
-        "title_error": "Erreur",
-        "error_apply_theme": "Échec de l'application du thème : {error}",
-        "error_apply_language": "Échec de l'application de la langue : {error}",
-        # Popup dialogs
-        "popup_keyfile_required_title": "Fichier clé requis",
-        "popup_keyfile_required_body": "Veuillez sélectionner un fichier clé pour le mode mot de passe + fichier clé.",
-        "popup_password_required_title": "Mot de passe requis",
-        "popup_password_required_body": "Veuillez saisir votre mot de passe VeraCrypt.",
-        "popup_recovery_title": "Récupération de mot de passe",
-        "popup_recovery_available_body": "Un kit de récupération est disponible pour ce lecteur !\n\nPour récupérer l'accès à votre volume chiffré :\n\n1. Utilisez la CLI SmartDrive : python smartdrive.py\n2. Sélectionnez l'option 6 : Kit de récupération\n3. Suivez les instructions de récupération\n\nOu contactez votre administrateur système.",
-        "popup_recovery_unavailable_body": "Aucun kit de récupération n'est actuellement disponible pour ce lecteur.\n\nPour configurer la récupération de mot de passe :\n\n1. Utilisez la CLI SmartDrive : python smartdrive.py\n2. Sélectionnez l'option 6 : Kit de récupération\n3. Choisissez 'Generate Recovery Kit'\n\nOu contactez votre administrateur système.",
-        # Recovery tab - Phrase input and recovery actions
-        "recovery_section_title": "🔐 Récupération d'urgence",
-        "recovery_instructions": "Entrez votre phrase de récupération de 24 mots pour récupérer l'accès à votre volume chiffré. Vous pouvez également fournir un fichier conteneur de récupération si vous en avez un.",
-        "label_recovery_phrase": "Phrase de récupération (24 mots) :",
-        "placeholder_recovery_phrase": "Entrez 24 mots séparés par des espaces...",
-        "label_recovery_container": "Conteneur de récupération (optionnel) :",
-        "btn_browse_container": "Parcourir...",
-        "btn_recover_credentials": "🔓 Récupérer les identifiants",
-        "recovery_status_ready": "Entrez votre phrase de récupération et cliquez sur 'Récupérer les identifiants'",
-        "recovery_status_validating": "Validation de la phrase de récupération...",
-        "recovery_status_decrypting": "Déchiffrement du conteneur de récupération...",
-        "recovery_status_success": "✅ Récupération réussie ! Identifiants récupérés.",
-        "recovery_status_failed": "❌ Échec de la récupération : {error}",
-        "recovery_result_title": "Identifiants récupérés",
-        "recovery_result_password": "Mot de passe :",
-        "recovery_result_keyfile": "Fichier clé :",
-        "recovery_result_mode": "Mode de sécurité :",
-        "recovery_result_copy_password": "📋 Copier le mot de passe",
-        "recovery_result_save_keyfile": "💾 Enregistrer le fichier clé",
-        "recovery_copied_to_clipboard": "Mot de passe copié dans le presse-papiers (effacement auto dans 30 secondes)",
-        "recovery_keyfile_saved": "Fichier clé enregistré dans : {path}",
-        "recovery_phrase_invalid": "Phrase de récupération invalide. Veuillez vérifier les 24 mots.",
-        "recovery_container_not_found": "Conteneur de récupération introuvable. Veuillez sélectionner le fichier conteneur.",
-        "recovery_no_kit_configured": "Aucun kit de récupération configuré pour ce lecteur.",
-        "recovery_generate_first": "Veuillez d'abord générer un kit de récupération via Paramètres ou CLI.",
-        "recovery_already_used": "⚠️ Le kit de récupération a déjà été utilisé. Cette opération est désactivée.",
-        "recovery_status_invalidating": "Invalidation du kit de récupération...",
-        "recovery_status_complete": "Récupération terminée. Le kit de récupération a été définitivement invalidé.",
-        "recovery_rekey_required_title": "Changement d'identifiants obligatoire",
-        "recovery_rekey_required_body": "Récupération réussie. Pour des raisons de sécurité, vous DEVEZ changer votre mot de passe/fichier clé maintenant.\n\nLe kit de récupération contenait des identifiants temporaires qui sont maintenant compromis.\n\nVoulez-vous changer vos identifiants maintenant ?",
-        "recovery_rekey_now": "Changer les identifiants maintenant",
-        "recovery_rekey_later": "Me rappeler plus tard",
-        "recovery_rekey_skipped_warning": "⚠️ Vous avez ignoré le changement d'identifiants. Vous ne pourrez pas monter votre lecteur tant que les identifiants ne seront pas changés.",
-        "mount_blocked_rekey_required_title": "Changement d'identifiants obligatoire",
-        "mount_blocked_rekey_required_body": "Le kit de récupération a été utilisé mais les identifiants n'ont pas été changés. Pour la sécurité, le montage est bloqué.\n\nUtilisez le script de changement de clé pour définir de nouveaux identifiants.",
-        "mount_warn_rekey_title": "Changement d'identifiants recommandé",
-        "mount_warn_rekey_body": "Le kit de récupération a été utilisé récemment. Il est fortement recommandé de changer vos identifiants.\n\nVoulez-vous changer les identifiants maintenant ou continuer le montage ?",
-        "label_recovery_status": "État du kit de récupération",
-        "recovery_kit_available": "✅ Disponible",
-        "recovery_kit_used": "🚫 Utilisé (Invalide)",
-        "recovery_kit_not_configured": "⚪ Non configuré",
-        "recovery_html_warning": "Fichier HTML de récupération encore sur le disque ! Supprimez-le après impression pour la sécurité.",
-        "tooltip_recovery_status": "Indique si le kit de récupération est disponible, a été utilisé ou n'est pas configuré",
-        "rekey_section_title": "🔑 Changer les identifiants",
-        "rekey_instructions": "Changez le mot de passe de votre conteneur VeraCrypt et/ou les fichiers clé.",
-        "rekey_post_recovery_notice": "⚠️ POST-RÉCUPÉRATION : Vous devez changer les identifiants avant que le montage soit autorisé.",
-        "btn_start_rekey": "Démarrer le changement d'identifiants...",
-        # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
-        "btn_verify_rekey": "✓ Vérifier nouveaux identifiants",
-        "btn_cancel_rekey": "✕ Annuler",
-        "rekey_instructions_veracrypt": "GUI VeraCrypt ouvert. Dans VeraCrypt :\n1. Outils → Changer le mot de passe du volume\n2. Sélectionner appareil → choisissez votre volume\n3. Entrez mot de passe actuel ('Copier ancien mot de passe' ci-dessus)\n4. Entrez nouveau mot de passe ('Copier nouveau mot de passe' ci-dessus)\n5. Cliquez OK\n\nAprès confirmation dans VeraCrypt, cliquez 'Vérifier nouveaux identifiants'.",
-        "rekey_verifying": "Vérification des nouveaux identifiants via test de montage...",
-        "rekey_verification_success": "✓ Nouveaux identifiants vérifiés ! Finalisation du rekey...",
-        "rekey_verification_failed": "✕ Vérification échouée. Vérifiez votre nouveau mot de passe/fichier clé.",
-        "rekey_cancelled": "Changement d'identifiants annulé.",
-        # BUG-20251221-039: Copy credential buttons
-        # CHG-20251222-018: Enhanced tooltips for clarity
-        "btn_copy_old_password": "📋 Copier ancien mot de passe",
-        "btn_copy_new_password": "📋 Copier nouveau mot de passe",
-        "tooltip_copy_old_password": "Dériver et copier le mot de passe ACTUEL en utilisant le seed GPG EXISTANT. Pour les modes GPG, utilise votre clé matérielle. (30s TTL)",
-        "tooltip_copy_old_password_post_recovery": "Désactivé : Après la récupération, utilisez le mot de passe de votre kit de récupération. Le seed GPG peut être manquant ou corrompu.",
-        "tooltip_copy_new_password": "Dériver et copier le NOUVEAU mot de passe en utilisant le NOUVEAU seed GPG (ci-dessus). Générez d'abord un nouveau seed.gpg. (30s TTL)",
-        "rekey_gpg_seed_hint": "Pour les modes GPG : Le 'Nouveau Seed GPG' ci-dessus définit quel mot de passe sera dérivé. Générez d'abord un nouveau seed.gpg, puis utilisez 'Copier nouveau mot de passe'.",
-        "copy_password_title": "Copier le mot de passe",
-        "rekey_status_ready": "Prêt à changer les identifiants",
-        "rekey_status_preparing": "Préparation du changement d'identifiants...",
-        "rekey_status_opening_veracrypt": "Ouverture de VeraCrypt GUI...",
-        "rekey_status_awaiting_confirmation": "En attente de confirmation du changement de mot de passe...",
-        "rekey_status_verifying": "Vérification des nouveaux identifiants...",
-        "rekey_validating": "Validation des nouveaux identifiants...",
-        "rekey_verifying_mount": "Vérification des identifiants via montage...",
-        "rekey_credentials_verified": "Nouveaux identifiants vérifiés avec succès !",
-        "rekey_testing_mount": "Test de montage avec les nouveaux identifiants...",
-        "rekey_validation_success": "Validation réussie - démontage...",
-        "rekey_status_success": "✅ Identifiants changés avec succès",
-        "rekey_status_failed": "❌ Échec du changement d'identifiants : {error}",
-        "btn_verify_rekey": "Vérifier que le changement est terminé",
-        "rekey_current_password_label": "Mot de passe actuel :",
-        "rekey_current_password_auto": "(détecté automatiquement)",
-        "rekey_new_password_label": "Nouveau mot de passe :",
-        "rekey_confirm_password_label": "Confirmer le mot de passe :",
-        "rekey_current_mode_label": "Mode de sécurité actuel :",
-        "rekey_target_mode_label": "Nouveau mode de sécurité :",
-        "rekey_mode_same_tooltip": "Conserver le mode de sécurité actuel",
-        "rekey_mode_pw_only": "🔒 Mot de passe uniquement",
-        "rekey_mode_pw_keyfile": "🔑 Mot de passe + Fichier-clé",
-        "rekey_mode_pw_gpg_keyfile": "🛡️ Mot de passe + Fichier-clé dérivé GPG",
-        "rekey_mode_gpg_pw_only": "🔐 Mot de passe dérivé GPG (lecture seule)",
-        "rekey_new_keyfile_label": "Nouveau chemin du fichier-clé :",
-        "rekey_new_gpg_seed_label": "Nouveau chemin de la graine GPG :",
-        "btn_browse_keyfile": "Parcourir...",
-        # CHG-20251221-003: GPG seed generation button
-        "btn_generate_gpg_seed": "Générer",
-        "tooltip_generate_gpg_seed": "Générer une nouvelle graine GPG chiffrée pour la dérivation de mot de passe. Nécessite YubiKey/carte GPG.",
-        "gpg_seed_generate_title": "Générer une graine GPG",
-        "gpg_seed_generate_confirm": "Cela générera une nouvelle graine cryptographiquement sécurisée et la chiffrera avec votre clé GPG.\n\nVeuillez vous assurer que votre YubiKey/carte GPG est insérée.\n\nContinuer ?",
-        "gpg_seed_generate_success": "Graine GPG générée avec succès !",
-        "gpg_seed_generate_fail": "Échec de la génération de la graine GPG",
-        "gpg_seed_derive_info": "Le mot de passe dérivé de cette graine sera affiché.\nCopiez-le pour l'utiliser comme nouveau mot de passe VeraCrypt.",
-        # CHG-20251223-032: Multi-key authentication
-        "gpg_key_auth_title": "Authentifier la clé GPG",
-        "gpg_key_auth_prompt": "Pour vous assurer que vous avez accès à cette clé, veuillez vous authentifier.\n\nClé : {fingerprint}\n\nVotre PIN peut vous être demandé.",
-        "gpg_key_auth_success": "Clé authentifiée avec succès.",
-        "gpg_key_auth_fail": "Échec de l'authentification pour la clé : {fingerprint}",
-        "gpg_key_auth_skip_prompt": "Voulez-vous ignorer l'authentification pour cette clé ?\n\n⚠️ AVERTISSEMENT : Si vous ignorez, vous pouvez configurer une clé que vous ne possédez pas.\nCeci est acceptable lorsque vous déléguez l'accès à une autre personne.",
-        "gpg_key_auth_skipped": "Authentification ignorée pour la clé : {fingerprint}",
-        # CHG-20251221-008: GPG key selection dialog
-        "gpg_key_select_title": "Sélectionner la clé GPG pour le chiffrement",
-        "gpg_key_select_hint": "Sélectionnez une clé matérielle dans la liste ci-dessous ou entrez manuellement une empreinte ou un e-mail si votre clé n'est pas répertoriée.",
-        "gpg_key_select_label": "Clé GPG :",
-        "gpg_key_select_placeholder": "Sélectionner ou entrer la clé...",
-        "gpg_key_select_manual": "Saisie manuelle...",
-        "gpg_key_select_none": "Aucune clé secrète GPG trouvée",
-        "gpg_key_manual_label": "Entrez l'empreinte ou l'e-mail :",
-        # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
-        "gpg_key_select_hint_multi": "Sélectionnez une ou plusieurs clés matérielles dans la liste ci-dessous pour la redondance.\nVous pouvez également entrer manuellement des empreintes supplémentaires (séparées par des virgules ou des retours à la ligne).",
-        "gpg_key_manual_label_multi": "Empreintes supplémentaires :",
-        "gpg_key_select_placeholder_multi": "Entrez des empreintes (séparées par des virgules ou des retours à la ligne)...",
-        "gpg_key_select_none_selected": "Veuillez sélectionner au moins une clé GPG ou entrer une empreinte manuellement.",
-        "rekey_mode_change_warning": "⚠️ Le changement de mode de sécurité nécessite une vérification supplémentaire",
-        "rekey_gpg_seed_instructions": "Veuillez connecter votre YubiKey et entrer le chemin vers votre fichier graine GPG.",
-        "popup_unmount_failed_title": "Échec du démontage",
-        "popup_mount_failed_title": "Échec du montage",
-        "popup_update_not_possible_title": "Mise à jour impossible",
-        "popup_update_confirm_title": "Confirmer la mise à jour",
-        "popup_update_direction": "Direction",
-        "popup_update_source": "Source",
-        "popup_update_destination": "Destination",
-        "popup_update_files_to_update": "Fichiers à mettre à jour",
-        "popup_update_protected_items": "Éléments protégés (Jamais écrasés)",
-        "popup_update_protected_list": "Les données utilisateur suivantes sont automatiquement protégées : {items}",
-        "popup_update_warning": "Avertissement",
-        "popup_update_warning_body": "Cela écrasera les fichiers de script existants dans le répertoire .smartdrive/.",
-        "popup_update_confirm_message": "Sur le point d'exécuter UPDATE ({direction}).\n\nDE :\n  {src_root}\n\nVERS :\n  {dst_root}\n\nÉléments :\n  - {items}\n\nMéthode : {method}\n\nCela écrasera les fichiers existants. Continuer ?",
-        "popup_update_config_title": "Configuration de mise à jour",
-        "popup_update_config_body": "La source de mise à jour n'est pas configurée. Veuillez la définir dans Paramètres.",
-        "popup_update_complete_title": "Mise à jour terminée",
-        "popup_update_complete_body": "La mise à jour s'est terminée avec succès. Veuillez redémarrer l'application.",
-        "popup_update_failed_title": "Échec de la mise à jour",
-        "popup_update_failed_body": "Échec de la mise à jour :\n\n{error}",
-        "popup_update_timeout_title": "Délai de mise à jour dépassé",
-        "popup_update_timeout_body": "La mise à jour ne s'est pas terminée dans les 120 secondes.",
-        "popup_update_error_title": "Erreur de mise à jour",
-        "popup_update_error_body": "Impossible d'exécuter la mise à jour :\n\n{error}",
-        "popup_cli_failed_title": "Échec du lancement de la CLI",
-        "popup_cli_failed_body": "Impossible d'ouvrir la CLI :\n\n{error}",
-        # Update configuration error messages
-        "error_update_server_url_not_configured": "L'URL du serveur n'est pas configurée.\n\nAllez dans Paramètres pour configurer l'URL de mise à jour.",
-        "error_update_local_root_not_configured": "Le répertoire de mise à jour local n'est pas configuré.\n\nAllez dans Paramètres pour configurer la racine locale de mise à jour.",
-        "error_update_local_root_not_found": "Répertoire de mise à jour local introuvable :\n\n{path}\n\nVérifiez Paramètres pour valider le chemin.",
-        "error_update_install_dir_not_found": "Répertoire d'installation introuvable :\n\n{path}",
-        "error_update_unknown_source_type": "Type de source de mise à jour inconnu : {type}",
-        # Hardware key error messages
-        "error_hardware_key_missing_title": "Clé matérielle requise",
-        "error_hardware_key_missing_body": "Clé matérielle (YubiKey/carte GPG) non détectée. Veuillez insérer votre clé matérielle et réessayer.",
-        # Theme names (for theme dropdown
-        "theme_brand": "Marque",
-        "theme_green": "Vert",
-        "theme_blue": "Bleu",
-        "theme_rose": "Rose",
-        "theme_slate": "Ardoise",
-        "label_theme": "Thème",
-        # File explorer buttons
-        "tooltip_open_launcher_drive": "Ouvrir le lecteur de lancement",
-        "tooltip_open_mounted_volume": "Ouvrir le volume monté",
-        "popup_open_failed_title": "Échec de l'ouverture",
-        "popup_open_failed_body": "Impossible d'ouvrir l'explorateur de fichiers :\n\n{path}\n\n{error}",
-        # About section (CHG-20251221-012)
-        "settings_about": "À propos",
-        "label_version": "Version :",
-        "label_build_id": "ID de build :",
-        "label_build_dev": "Développement",
-        "label_compat_version": "Version de configuration :",
-        # Recovery kit generation (CHG-20251221-001)
-        "recovery_generate_section_title": "Générer le kit de récupération",
-        "recovery_generate_instructions": "Générez un nouveau kit de récupération pour créer une sauvegarde chiffrée de vos identifiants. C'est utile si votre kit original a été perdu, endommagé ou si vous souhaitez une nouvelle copie après avoir modifié vos identifiants.",
-        "btn_generate_recovery_kit": "🔐 Générer un nouveau kit de récupération",
-        "recovery_generate_status_ready": "Cliquez sur 'Générer un nouveau kit de récupération' pour créer un nouveau kit.",
-        "recovery_generate_status_deriving": "Dérivation des identifiants depuis la clé matérielle...",
-        "recovery_generate_status_verifying": "Vérification des identifiants avec VeraCrypt...",
-        "recovery_generate_status_running": "Génération du kit de récupération...",
-        "recovery_generate_status_success": "✅ Kit de récupération généré avec succès !",
-        "recovery_generate_status_failed": "❌ Échec de la génération du kit de récupération : {error}",
-        "recovery_generate_confirm_title": "Générer le kit de récupération",
-        "recovery_generate_confirm_body": "Ceci générera un nouveau kit de récupération avec une sauvegarde chiffrée de vos identifiants.\n\nVoulez-vous continuer ?",
-        "recovery_generate_regen_confirm_title": "Régénérer le kit de récupération",
-        "recovery_generate_regen_confirm_body": "⚠️ ATTENTION : Ceci créera un NOUVEAU kit de récupération.\n\nVotre kit de récupération EXISTANT sera DÉFINITIVEMENT INVALIDÉ.\n\nVoulez-vous continuer ?",
-        "recovery_generate_security_warning_title": "Avertissement de sécurité : Régénération du kit de récupération",
-        "recovery_generate_security_warning_body": "⚠️ AVERTISSEMENT DE SÉCURITÉ ⚠️\n\nUn kit de récupération existe déjà. En créer un nouveau :\n\n• Invalidera le kit précédent\n• Créera un NOUVEAU chemin d'accès à vos données chiffrées\n• Quiconque possède le nouveau kit peut accéder à vos données\n\nNe continuez que si vous comprenez les implications de sécurité.\n\nVoulez-vous régénérer ?",
-        "recovery_generate_password_prompt_title": "Entrez le mot de passe du volume",
-        "recovery_generate_password_prompt_body": "Veuillez entrer votre mot de passe de volume pour la génération du kit de récupération :",
-        "recovery_generate_success_title": "Kit de récupération généré",
-        "recovery_generate_success_body": "Votre kit de récupération a été généré !\n\nEmplacement : {path}\n\n⚠️ IMPORTANT :\n• Imprimez le fichier HTML immédiatement\n• Conservez-le dans un endroit physique sécurisé\n• Supprimez le fichier HTML du disque après l'impression",
-        # Settings dialog - Additional fields (schema-driven UI)
-        "label_drive_id": "ID du disque",
-        "label_drive_name": "Nom du disque",
-        "label_setup_date": "Date de configuration",
-        "label_last_password_change": "Dernier changement de mot de passe",
-        "label_last_verified": "Dernière vérification",
-        "label_plain_keyfile": "Fichier clé simple",
-        "label_seed_gpg_path": "Fichier semence GPG",
-        "label_kdf": "Fonction de dérivation de clé",
-        "label_pw_encoding": "Encodage du mot de passe",
-        "label_recovery_enabled": "Activer le kit de récupération",
-        "label_recovery_share_count": "Nombre de parts de récupération",
-        "label_recovery_threshold": "Seuil de récupération",
-        "label_lost_and_found_enabled": "Activer le message des objets trouvés",
-        "label_lost_and_found_message": "Message de retour",
-        "label_verification_overridden": "Vérification contournée",
-        "label_integrity_signed": "Intégrité signée",
-        "label_signing_key_fpr": "Empreinte de clé de signature",
-        "label_salt_b64": "Sel (Base64)",
-        "label_hkdf_info": "Info HKDF",
-        "label_schema_version": "Version du schéma",
-        "label_version": "Version",
-        # Tooltips for settings fields
-        "tooltip_drive_id": "Identifiant unique pour ce disque (lecture seule)",
-        "tooltip_drive_name": "Nom personnalisé pour ce disque",
-        "tooltip_language": "Langue de l'interface utilisateur",
-        "tooltip_theme": "Schéma de couleur pour l'interface",
-        "tooltip_mode": "Mode de sécurité : mot de passe uniquement, fichier clé ou YubiKey/GPG",
-        "tooltip_encrypted_keyfile": "Chemin vers le fichier clé chiffré GPG (pour les modes GPG)",
-        "tooltip_plain_keyfile": "Chemin vers le fichier clé non chiffré (pour le mode fichier clé simple)",
-        "tooltip_seed_gpg_path": "Chemin vers le fichier semence GPG pour la dérivation du mot de passe",
-        "tooltip_kdf": "Fonction de dérivation de clé pour le mode mot de passe GPG",
-        "tooltip_pw_encoding": "Encodage des caractères pour le mot de passe (UTF-8 recommandé)",
-        "tooltip_windows_volume_path": "GUID de volume Windows ou chemin du périphérique",
-        "tooltip_mount_letter": "Lettre de lecteur pour monter comme (A-Z)",
-        "tooltip_veracrypt_path": "Chemin vers l'exécutable VeraCrypt.exe",
-        "tooltip_unix_volume_path": "Chemin du périphérique Unix (par ex. /dev/sdb2)",
-        "tooltip_mount_point": "Répertoire de point de montage Unix",
-        # BUG-20251221-037: Mount point fallback i18n keys
-        "label_allow_mount_fallback": "Utiliser automatiquement un point de montage alternatif",
-        "tooltip_allow_mount_fallback": "Lorsqu'activé, essaie automatiquement des lettres de lecteur alternatives (Windows) ou des répertoires de montage (Unix) si celui configuré n'est pas disponible. Recommandé pour éviter les erreurs de montage.",
-        "error_mount_point_occupied_fallback_disabled": "Le point de montage {mount_point} est déjà utilisé.\n\nPour éviter cette erreur à l'avenir, activez 'Utiliser automatiquement un point de montage alternatif' dans Paramètres → onglet {os_tab}.",
-        "error_mount_point_all_occupied": "Impossible de trouver un point de montage disponible après 3 tentatives.\n\nToutes les lettres de lecteur D-Z sont utilisées (Windows) ou les alternatives de point de montage ont échoué (Unix).\n\nC'est un problème de point de montage, PAS un problème d'identifiants.",
-        "warning_mount_fallback_used": "Le point de montage configuré {original} n'était pas disponible.\nUtilisation de {fallback} à la place. Configuration mise à jour.",
-        "tooltip_recovery_enabled": "Activer la génération de kit de récupération d'urgence",
-        "tooltip_recovery_share_count": "Nombre de parts de récupération à générer",
-        "tooltip_recovery_threshold": "Nombre minimum de parts nécessaires pour la récupération",
-        "tooltip_lost_and_found_enabled": "Activer le message de retour si le disque est perdu",
-        "tooltip_lost_and_found_message": "Message affiché si le disque est trouvé",
-        "tooltip_source_type": "Source de mise à jour : répertoire local ou URL du serveur",
-        "tooltip_server_url": "URL du serveur pour les mises à jour",
-        "tooltip_local_root": "Répertoire local contenant les fichiers de mise à jour",
-        "hint_update_local_title": "À propos des mises à jour locales",
-        "hint_update_local_body": "Sélectionnez : (1) le répertoire contenant un dossier .smartdrive/ (par ex. H:\\ ou C:\\MonDev\\), ou (2) un dossier .smartdrive/ directement. Le .smartdrive/ sera détecté automatiquement. Les données utilisateur (recovery/, keys/, integrity/, config.json) sont automatiquement protégées. Les fichiers de développement (.git, tests, helper/) sont exclus.",
-        # CHG-20251222-016: Update action section i18n keys
-        "update_action_section_title": "Actions de mise à jour",
-        "btn_run_update": "Exécuter la mise à jour",
-        "tooltip_run_update": "Exécuter la mise à jour depuis la source configurée",
-        "label_last_update": "Dernière mise à jour :",
-        "label_last_update_source": "Source :",
-        "update_never": "Jamais",
-        "update_source_none": "Non configuré",
-        "tooltip_verification_overridden": "Contourner la vérification d'intégrité (dangereux !)",
-        "tooltip_integrity_signed": "L'intégrité du disque a été signée cryptographiquement",
-        "tooltip_signing_key_fpr": "Empreinte de clé GPG utilisée pour la signature",
-        "tooltip_salt_b64": "Sel cryptographique pour la dérivation de clé",
-        "tooltip_hkdf_info": "Chaîne de contexte pour la dérivation de clé HKDF",
-        # Integrity tab (CHG-20251220-002)
-        "label_integrity_status": "État d'intégrité :",
-        "tooltip_integrity_status": "Indique si les scripts ont été vérifiés par rapport au hash signé",
-        # CHG-20251222-014: OS-specific tab tooltip
-        "tooltip_tab_disabled_other_os": "Cet onglet est pour un autre système d'exploitation",
-        "settings_integrity": "Intégrité",
-        "settings_integrity_desc": "Vérifier l'intégrité du logiciel et signer les scripts.",
-        "integrity_section_title": "🔐 Intégrité du logiciel",
-        "integrity_instructions": "Vérifiez que les scripts n'ont pas été modifiés depuis la signature. La signature nécessite une clé matérielle (YubiKey/carte GPG).",
-        "btn_verify_local": "✓ Vérifier l'intégrité (local)",
-        "btn_sign_scripts": "🔑 Signer les scripts",
-        "btn_verify_remote": "🌐 Vérifier (distant)",
-        "integrity_status_ready": "Cliquez sur 'Vérifier' pour vérifier l'intégrité du script.",
-        "integrity_status_checking": "Vérification de l'intégrité...",
-        "integrity_status_signing": "Signature des scripts avec la clé matérielle...",
-        "integrity_status_pass": "✅ Intégrité vérifiée ! Les scripts sont authentiques.",
-        "integrity_status_fail": "❌ Vérification d'intégrité ÉCHOUÉE ! Les scripts ont peut-être été modifiés.",
-        "integrity_status_no_manifest": "⚠️ Manifeste d'intégrité non trouvé. Les scripts ne sont pas signés.",
-        "integrity_status_sign_success": "✅ Scripts signés avec succès !",
-        "integrity_status_sign_fail": "❌ Échec de la signature. La clé matérielle est-elle insérée ?",
-        "integrity_result_hash": "Hash : {hash}",
-        "integrity_result_signer": "Signé par : {signer}",
-        "integrity_remote_url_label": "URL du serveur :",
-        "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
-        "integrity_status_remote_checking": "Envoi de la demande de vérification au serveur...",
-        "integrity_status_remote_success": "✅ Vérification distante réussie !",
-        "integrity_status_remote_fail": "❌ Vérification distante échouée : {error}",
-        "integrity_status_no_server_url": "⚠️ URL du serveur non configurée. Définissez-la dans Paramètres → Intégrité.",
-        "label_integrity_server_url": "URL du serveur de vérification",
-        "tooltip_integrity_server_url": "URL du serveur de vérification distant (ex. https://verify.example.com/api/check)",
-    },
-    "ru": {
-        # Window titles
-        "window_title": "KeyDrive",
-        "settings_window_title": "Настройки",
-        # Button labels
-        "btn_mount": "🔓 Смонтировать",
-        "btn_unmount": "🔒 Размонтировать",
-        "btn_cancel_auth": "❌ Отмена",
-        "btn_confirm_mount": "✅ Подтвердить",
-        "btn_tools": "⚙️",
-        "btn_close": "✕",
-        "btn_save": "Сохранить",
-        "btn_cancel": "Отмена",
-        "btn_confirm": "Подтвердить",
-        "btn_ok": "OK",
-        "warning": "Предупреждение",
-        "settings_tab_security": "Безопасность",
-        # CHG-20251223-055: Reload config button for non-modal settings
-        "btn_reload_config": "↻ Перезагрузить",
-        "tooltip_reload_config": "Перезагрузить конфигурацию с диска (отменяет несохранённые изменения)",
-        # Status messages
-        "status_config_not_found": "Конфигурация не найдена",
-        "status_volume_mounted": "Том смонтирован",
-        "status_volume_not_mounted": "Том не смонтирован",
-        "status_mounting": "⏳ Монтирование тома...",
-        "status_mounting_gpg": "⏳ Монтирование тома (GPG-аутентификация)...",
-        "status_unmounting": "⏳ Размонтирование тома...",
-        "status_mount_success": "✅ Том успешно смонтирован",
-        "status_mount_failed": "❌ Ошибка монтирования",
-        "status_unmount_success": "✅ Том успешно размонтирован",
-        "status_unmount_failed": "❌ Ошибка размонтирования",
-        # Info labels
-        "info_unavailable": "Информация недоступна",
-        "keyfile_selected_one": "Выбран 1 ключевой файл",
-        "keyfile_selected_many": "Выбрано {count} ключевых файлов",
-        "keyfile_drop_hint": "Перетащите ключевые файлы сюда или нажмите для выбора",
-        "keyfile_drop_supports_multiple": "Поддерживает несколько ключевых файлов",
-        "label_show_password": "Показать пароль",
-        # Size formatting
-        "size_free": "Свободно: {size}",
-        # Icons/placeholders
-        "icon_drive": "🚀",
-        # Tooltips
-        "tooltip_exit": "Выйти из SmartDrive",
-        "tooltip_settings": "Дополнительные инструменты и настройки",
-        # Labels
-        "label_product_name": "Название продукта",
-        "label_preview": "Предпросмотр:",
-        "label_password": "Пароль:",
-        "label_keyfile": "Ключевой файл:",
-        "label_hardware_key_hint": "💡 Для аутентификации может потребоваться аппаратный ключ",
-        "label_forgot_password": "Забыли пароль?",
-        # Placeholder text
-        "placeholder_password": "Введите пароль VeraCrypt...",
-        # Menu items
-        "menu_settings": "⚙️ Настройки",
-        "menu_rekey": "🔑 Сменить пароль/ключевой файл",
-        "menu_update": "⬇️ Обновить скрипты",
-        "menu_recovery": "💾 Набор восстановления",
-        "menu_about": "ℹ️ О программе",
-        "menu_cli": "💻 Открыть CLI",
-        "menu_exit": "⏻ Выход",
-        "menu_clear_keyfiles": "Очистить ключевые файлы",
-        "menu_switch_drive": "🔀 Сменить диск...",
-        "menu_switch_drive_browse": "📂 Обзор...",
-        # CHG-20251221-042: Remote Control Mode menu items (Russian)
-        "menu_manage_remote": "🌐 Удалённое управление...",
-        "menu_manage_remote_browse": "📂 Найти удалённый .smartdrive...",
-        "menu_exit_remote": "🏠 Выйти из удалённого режима",
-        "remote_active_label": "Удалённое управление активно",
-        "remote_click_to_end": "Нажмите для завершения",
-        "remote_validation_failed_title": "Ошибка удалённой валидации",
-        "remote_validation_failed_body": "Не удалось подключиться к удалённому диску:\n\n{error}",
-        "remote_disconnected_title": "Удалённый диск отключён",
-        "remote_disconnected_body": "Удалённый диск ({drive}:) был отключён.\n\nВозврат в локальный режим.",
-        "remote_confirm_title": "Войти в режим удалённого управления",
-        "remote_confirm_body": "Подключиться к удалённому .smartdrive:\n{path}\n\nВ удалённом режиме вы можете только монтировать/размонтировать удалённый том.\nНастройки, обновления и доступ к CLI отключены.",
-        "remote_mode_disabled_title": "Удалённый режим активен",
-        "remote_mode_disabled_cli": "Доступ к CLI отключён в удалённом режиме.",
-        "remote_mode_disabled_settings": "Настройки отключены в удалённом режиме. Сначала выйдите из удалённого режима.",
-        "remote_mode_disabled_update": "Обновления отключены в удалённом режиме. Сначала выйдите из удалённого режима.",
-        "dialog_select_keyfiles": "Выберите ключевой файл(ы)",
-        # Multi-drive context (CHG-20251221-026)
-        "label_launcher_root": "Загрузочный диск:",
-        "group_drive_context": "Контекст диска",
-        "tooltip_launcher_root": "Диск, содержащий эту папку .smartdrive",
-        # Drive safety context (CHG-20251221-040)
-        "label_os_drive": "Системный диск:",
-        "tooltip_os_drive": "Диск с операционной системой (не может быть перераспределён)",
-        "label_instantiation_drive": "Запущен с:",
-        "tooltip_instantiation_drive": "Диск, с которого запущен этот экземпляр (не может быть перераспределён)",
-        "switch_drive_title": "Сменить контекст диска",
-        "switch_drive_confirm": "Переключиться на конфигурацию из:\n{path}\n\nВсе настройки будут перезагружены с этого диска.",
-        "switch_drive_invalid_path": "Недействительная папка .smartdrive. config.json не найден.",
-        "switch_drive_select_folder": "Выберите папку .smartdrive",
-        "version_incompatible_title": "Предупреждение о совместимости версий",
-        "version_incompatible_error": "Невозможно переключиться на этот диск:\n\n{message}\n\nФормат конфигурации несовместим с этой версией программы.",
-        "version_incompatible_warning": "{message}\n\nЦель: {path}\n\nПродолжить всё равно?",
-        # Tray
-        "tray_minimized_message": "Работает в фоновом режиме. Нажмите на значок в трее, чтобы открыть.",
-        "tray_unavailable_message": "Системный трей недоступен.\n\nВы хотите закрыть приложение?",
-        "tray_tooltip": "{name} ({id})",
-        # Status messages
-        "status_deriving_yubikey_password": "Получение пароля из YubiKey...",
-        "status_checking_mount": "Проверка статуса монтирования...",
-        "status_unmounting_for_rekey": "Размонтирование тома для смены ключа...",
-        "status_decrypting_keyfile": "Расшифровка файла ключа с YubiKey...",
-        # Worker messages (keys for structured errors)
-        "worker_mount_script_not_found": "Скрипт монтирования не найден",
-        "worker_mount_success": "Том успешно смонтирован",
-        "worker_mount_failed": "Ошибка монтирования: {error}",
-        "worker_mount_timeout": "Время ожидания монтирования истекло",
-        "worker_mount_error": "Ошибка монтирования: {error}",
-        "worker_unmount_script_not_found": "Скрипт размонтирования не найден",
-        "worker_unmount_success": "Том успешно размонтирован",
-        "worker_unmount_failed": "Ошибка размонтирования: {error}",
-        "worker_unmount_timeout": "Время ожидания размонтирования истекло",
-        "worker_unmount_error": "Ошибка размонтирования: {error}",
-        # Settings dialog - Tab names
-        "settings_language": "Язык",
-        "settings_general": "Общие",
-        "settings_security": "Безопасность",
-        "settings_keyfile": "Ключевой файл",
-        "settings_windows": "Windows",
-        "settings_unix": "Unix",
-        "settings_updates": "Обновления",
-        "settings_recovery": "Восстановление",
-        "settings_lost_and_found": "Бюро находок",
-        "settings_advanced": "Дополнительно",
-        # Settings dialog - Tab descriptions
-        "settings_general_desc": "Настройте отображаемое имя, язык и параметры темы приложения.",
-        "settings_security_desc": "Установите режим шифрования и метод аутентификации для вашего защищённого диска.",
-        "settings_keyfile_desc": "Управляйте путями к ключевым файлам для шифрования и GPG-аутентификации.",
-        "settings_windows_desc": "Настройки для Windows, включая букву диска и расположение VeraCrypt.",
-        "settings_unix_desc": "Настройки для Linux и macOS, включая каталог точки монтирования.",
-        "settings_updates_desc": "Настройте автоматическую проверку обновлений и параметры сервера.",
-        "settings_recovery_desc": "Настройте параметры восстановления Shamir Secret Sharing для доступа при утере ключей.",
-        "settings_lost_and_found_desc": "Отображайте контактное сообщение на диске для возврата при потере.",
-        "settings_advanced_desc": "Технические настройки параметров шифрования и проверки целостности.",
-        # BUG-20251221-036: Settings dialog - Group box titles (Russian)
-        "group_drive_identification": "Идентификация диска",
-        "group_appearance": "Внешний вид",
-        "group_timestamps": "Временные метки",
-        "group_security_mode": "Режим безопасности",
-        "group_keyfile_configuration": "Конфигурация ключевого файла",
-        "group_gpg_configuration": "Конфигурация GPG",
-        "group_emergency_recovery_kit": "Аварийный набор восстановления",
-        "group_verification": "Проверка",
-        "group_verification_status": "Статус проверки",
-        "group_software_integrity": "Целостность программного обеспечения",
-        "group_remote_verification": "Удалённая проверка",
-        "group_gpg_kdf_parameters": "Параметры GPG KDF",
-        "group_metadata": "Метаданные",
-        "settings_restart_not_required": "✓ Изменения применены сразу (перезапуск не требуется)",
-        "label_mode": "Режим",
-        "label_encrypted_keyfile": "Зашифрованный ключевой файл",
-        "label_volume_path": "Путь к тому",
-        "label_mount_letter": "Буква диска",
-        "label_veracrypt_path": "Путь к VeraCrypt",
-        "label_mount_point": "Точка монтирования",
-        "label_source_type": "Тип источника",
-        "label_server_url": "URL сервера",
-        "label_local_root": "Локальный корневой каталог",
-        "error_invalid_mount_letter": "Буква диска должна быть одной буквой A–Z.",
-        "error_save_failed": "Не удалось сохранить config.json:",
-        "title_invalid_mount_letter": "Недопустимая буква диска",
-        "title_save_failed": "Ошибка сохранения",
-        "title_error": "Ошибка",
-        "error_apply_theme": "Не удалось применить тему: {error}",
-        "error_apply_language": "Не удалось применить язык: {error}",
-        # Popup dialogs
-        "popup_keyfile_required_title": "Требуется ключевой файл",
-        "popup_keyfile_required_body": "Пожалуйста, выберите ключевой файл для режима пароль + ключевой файл.",
-        "popup_password_required_title": "Требуется пароль",
-        "popup_password_required_body": "Пожалуйста, введите пароль VeraCrypt.",
-        "popup_recovery_title": "Восстановление пароля",
-        "popup_recovery_available_body": "Для этого диска доступен набор восстановления!\n\nЧтобы восстановить доступ к зашифрованному тому:\n\n1. Откройте SmartDrive CLI: python smartdrive.py\n2. Выберите пункт 6: Recovery Kit\n3. Следуйте инструкциям по восстановлению\n\nИли обратитесь к системному администратору.",
-        "popup_recovery_unavailable_body": "Набор восстановления для этого диска сейчас недоступен.\n\nЧтобы настроить восстановление пароля:\n\n1. Откройте SmartDrive CLI: python smartdrive.py\n2. Выберите пункт 6: Recovery Kit\n3. Выберите 'Generate Recovery Kit'\n\nИли обратитесь к системному администратору.",
-        # Recovery tab - Phrase input and recovery actions
-        "recovery_section_title": "🔐 Аварийное восстановление",
-        "recovery_instructions": "Введите вашу фразу восстановления из 24 слов для восстановления доступа к зашифрованному тому. Вы также можете указать файл контейнера восстановления, если он у вас есть.",
-        "label_recovery_phrase": "Фраза восстановления (24 слова):",
-        "placeholder_recovery_phrase": "Введите 24 слова через пробел...",
-        "label_recovery_container": "Контейнер восстановления (необязательно):",
-        "btn_browse_container": "Обзор...",
-        "btn_recover_credentials": "🔓 Восстановить учётные данные",
-        "recovery_status_ready": "Введите фразу восстановления и нажмите 'Восстановить учётные данные'",
-        "recovery_status_validating": "Проверка фразы восстановления...",
-        "recovery_status_decrypting": "Расшифровка контейнера восстановления...",
-        "recovery_status_success": "✅ Восстановление успешно! Учётные данные восстановлены.",
-        "recovery_status_failed": "❌ Ошибка восстановления: {error}",
-        "recovery_result_title": "Восстановленные учётные данные",
-        "recovery_result_password": "Пароль:",
-        "recovery_result_keyfile": "Ключевой файл:",
-        "recovery_result_mode": "Режим безопасности:",
-        "recovery_result_copy_password": "📋 Копировать пароль",
-        "recovery_result_save_keyfile": "💾 Сохранить ключевой файл",
-        "recovery_copied_to_clipboard": "Пароль скопирован в буфер обмена (автоочистка через 30 секунд)",
-        "recovery_keyfile_saved": "Ключевой файл сохранён в: {path}",
-        "recovery_phrase_invalid": "Неверная фраза восстановления. Проверьте все 24 слова.",
-        "recovery_container_not_found": "Контейнер восстановления не найден. Выберите файл контейнера.",
-        "recovery_no_kit_configured": "Для этого диска не настроен набор восстановления.",
-        "recovery_generate_first": "Сначала сгенерируйте набор восстановления через Настройки или CLI.",
-        "recovery_already_used": "⚠️ Набор восстановления уже был использован. Эта операция отключена.",
-        "recovery_status_invalidating": "Аннулирование набора восстановления...",
-        "recovery_status_complete": "Восстановление завершено. Набор восстановления был безвозвратно аннулирован.",
-        "recovery_rekey_required_title": "Обязательная смена учётных данных",
-        "recovery_rekey_required_body": "Восстановление успешно. В целях безопасности вы ДОЛЖНЫ сменить пароль/ключевой файл сейчас.\n\nНабор восстановления содержал временные учётные данные, которые теперь скомпрометированы.\n\nХотите сменить учётные данные сейчас?",
-        "recovery_rekey_now": "Сменить учётные данные сейчас",
-        "recovery_rekey_later": "Напомнить позже",
-        "recovery_rekey_skipped_warning": "⚠️ Вы пропустили смену учётных данных. Вы не сможете смонтировать диск, пока учётные данные не будут изменены.",
-        "mount_blocked_rekey_required_title": "Обязательная смена учётных данных",
-        "mount_blocked_rekey_required_body": "Набор восстановления был использован, но учётные данные не были изменены. В целях безопасности монтирование заблокировано.\n\nИспользуйте скрипт смены ключа для установки новых учётных данных.",
-        "mount_warn_rekey_title": "Рекомендуется смена учётных данных",
-        "mount_warn_rekey_body": "Набор восстановления был недавно использован. Настоятельно рекомендуется сменить учётные данные.\n\nХотите сменить учётные данные сейчас или продолжить монтирование?",
-        "label_recovery_status": "Состояние набора восстановления",
-        "recovery_kit_available": "✅ Доступен",
-        "recovery_kit_used": "🚫 Использован (Недействителен)",
-        "recovery_kit_not_configured": "⚪ Не настроен",
-        "recovery_html_warning": "HTML-файл восстановления всё ещё на диске! Удалите после печати для безопасности.",
-        "tooltip_recovery_status": "Показывает, доступен ли набор восстановления, был ли использован или не настроен",
-        "rekey_section_title": "🔑 Смена учётных данных",
-        "rekey_instructions": "Смените пароль контейнера VeraCrypt и/или ключевые файлы.",
-        "rekey_post_recovery_notice": "⚠️ ПОСТ-ВОССТАНОВЛЕНИЕ: Вы должны сменить учётные данные, прежде чем монтирование будет разрешено.",
-        "btn_start_rekey": "Начать смену учётных данных...",
-        # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
-        "btn_verify_rekey": "✓ Проверить новые учётные данные",
-        "btn_cancel_rekey": "✕ Отмена",
-        "rekey_instructions_veracrypt": "VeraCrypt GUI открыт. В VeraCrypt:\n1. Сервис → Изменить пароль тома\n2. Выбрать устройство → выберите ваш том\n3. Введите текущий пароль ('Скопировать старый пароль' выше)\n4. Введите новый пароль ('Скопировать новый пароль' выше)\n5. Нажмите OK\n\nПосле подтверждения в VeraCrypt нажмите 'Проверить новые учётные данные'.",
-        "rekey_verifying": "Проверка новых учётных данных через тест монтирования...",
-        "rekey_verification_success": "✓ Новые учётные данные проверены! Завершение rekey...",
-        "rekey_verification_failed": "✕ Проверка не удалась. Проверьте новый пароль/ключевой файл.",
-        "rekey_cancelled": "Смена учётных данных отменена.",
-        # BUG-20251221-039: Copy credential buttons
-        # CHG-20251222-018: Enhanced tooltips for clarity
-        "btn_copy_old_password": "📋 Скопировать старый пароль",
-        "btn_copy_new_password": "📋 Скопировать новый пароль",
-        "tooltip_copy_old_password": "Получить и скопировать ТЕКУЩИЙ пароль, используя СУЩЕСТВУЮЩИЙ GPG seed. Для режимов GPG используется аппаратный ключ. (30с TTL)",
-        "tooltip_copy_old_password_post_recovery": "Отключено: После восстановления используйте пароль из комплекта восстановления. GPG seed может отсутствовать или быть повреждён.",
-        "tooltip_copy_new_password": "Получить и скопировать НОВЫЙ пароль, используя НОВЫЙ GPG seed (указан выше). Сначала сгенерируйте новый seed.gpg. (30с TTL)",
-        "rekey_gpg_seed_hint": "Для режимов GPG: 'Новый GPG Seed' выше определяет, какой пароль будет получен. Сначала сгенерируйте новый seed.gpg, затем используйте 'Скопировать новый пароль'.",
-        "copy_password_title": "Копирование пароля",
-        "rekey_status_ready": "Готов к смене учётных данных",
-        "rekey_status_preparing": "Подготовка к смене учётных данных...",
-        "rekey_status_opening_veracrypt": "Открытие VeraCrypt GUI...",
-        "rekey_status_awaiting_confirmation": "Ожидание подтверждения смены пароля...",
-        "rekey_status_verifying": "Проверка новых учётных данных...",
-        "rekey_validating": "Валидация новых учётных данных...",
-        "rekey_verifying_mount": "Проверка учётных данных через монтирование...",
-        "rekey_credentials_verified": "Новые учётные данные успешно проверены!",
-        "rekey_testing_mount": "Тест монтирования с новыми учётными данными...",
-        "rekey_validation_success": "Валидация успешна - размонтирование...",
-        "rekey_status_success": "✅ Учётные данные успешно изменены",
-        "rekey_status_failed": "❌ Ошибка смены учётных данных: {error}",
-        "btn_verify_rekey": "Подтвердить завершение смены",
-        "rekey_current_password_label": "Текущий пароль:",
-        "rekey_current_password_auto": "(определён автоматически)",
-        "rekey_new_password_label": "Новый пароль:",
-        "rekey_confirm_password_label": "Подтвердите пароль:",
-        "rekey_current_mode_label": "Текущий режим безопасности:",
-        "rekey_target_mode_label": "Новый режим безопасности:",
-        "rekey_mode_same_tooltip": "Сохранить текущий режим безопасности",
-        "rekey_mode_pw_only": "🔒 Только пароль",
-        "rekey_mode_pw_keyfile": "🔑 Пароль + Ключевой файл",
-        "rekey_mode_pw_gpg_keyfile": "🛡️ Пароль + GPG-производный ключевой файл",
-        "rekey_mode_gpg_pw_only": "🔐 GPG-производный пароль (только чтение)",
-        "rekey_new_keyfile_label": "Путь к новому ключевому файлу:",
-        "rekey_new_gpg_seed_label": "Путь к новому GPG-сиду:",
-        "btn_browse_keyfile": "Обзор...",
-        # CHG-20251221-003: GPG seed generation button
-        "btn_generate_gpg_seed": "Генерировать",
-        "tooltip_generate_gpg_seed": "Генерировать новый GPG-шифрованный сид для вывода пароля. Требуется YubiKey/GPG-карта.",
-        "gpg_seed_generate_title": "Генерация GPG-сида",
-        "gpg_seed_generate_confirm": "Это создаст новый криптографически безопасный сид и зашифрует его вашим GPG-ключом.\n\nУбедитесь, что ваш YubiKey/GPG-карта вставлены.\n\nПродолжить?",
-        "gpg_seed_generate_success": "GPG-сид успешно сгенерирован!",
-        "gpg_seed_generate_fail": "Ошибка генерации GPG-сида",
-        "gpg_seed_derive_info": "Будет показан пароль, выведенный из этого сида.\nСкопируйте его для использования как новый пароль VeraCrypt.",
-        # CHG-20251223-032: Multi-key authentication
-        "gpg_key_auth_title": "Аутентификация GPG-ключа",
-        "gpg_key_auth_prompt": "Чтобы убедиться, что у вас есть доступ к этому ключу, пожалуйста, аутентифицируйтесь.\n\nКлюч: {fingerprint}\n\nВозможно, потребуется ввести PIN.",
-        "gpg_key_auth_success": "Ключ успешно аутентифицирован.",
-        "gpg_key_auth_fail": "Ошибка аутентификации для ключа: {fingerprint}",
-        "gpg_key_auth_skip_prompt": "Хотите пропустить аутентификацию для этого ключа?\n\n⚠️ ПРЕДУПРЕЖДЕНИЕ: Если пропустите, вы можете настроить ключ, которым не владеете.\nЭто допустимо при делегировании доступа другому лицу.",
-        "gpg_key_auth_skipped": "Аутентификация пропущена для ключа: {fingerprint}",
-        # CHG-20251221-008: GPG key selection dialog
-        "gpg_key_select_title": "Выбор GPG-ключа для шифрования",
-        "gpg_key_select_hint": "Выберите аппаратный ключ из списка ниже или вручную введите отпечаток или email, если вашего ключа нет в списке.",
-        "gpg_key_select_label": "GPG-ключ:",
-        "gpg_key_select_placeholder": "Выберите или введите ключ...",
-        "gpg_key_select_manual": "Ручной ввод...",
-        "gpg_key_select_none": "Секретные GPG-ключи не найдены",
-        "gpg_key_manual_label": "Введите отпечаток или email:",
-        # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
-        "gpg_key_select_hint_multi": "Выберите один или несколько аппаратных ключей из списка ниже для резервирования.\nВы также можете вручную ввести дополнительные отпечатки (через запятую или перевод строки).",
-        "gpg_key_manual_label_multi": "Дополнительные отпечатки:",
-        "gpg_key_select_placeholder_multi": "Введите отпечатки (через запятую или перевод строки)...",
-        "gpg_key_select_none_selected": "Пожалуйста, выберите хотя бы один GPG-ключ или введите отпечаток вручную.",
-        "rekey_mode_change_warning": "⚠️ Изменение режима безопасности требует дополнительной проверки",
-        "rekey_gpg_seed_instructions": "Пожалуйста, подключите YubiKey и укажите путь к файлу GPG-сида.",
-        "popup_unmount_failed_title": "Ошибка размонтирования",
-        "popup_mount_failed_title": "Ошибка монтирования",
-        "popup_update_not_possible_title": "Обновление невозможно",
-        "popup_update_confirm_title": "Подтвердить обновление",
-        "popup_update_direction": "Направление",
-        "popup_update_source": "Источник",
-        "popup_update_destination": "Назначение",
-        "popup_update_files_to_update": "Файлы для обновления",
-        "popup_update_protected_items": "Защищенные элементы (Никогда не перезаписываются)",
-        "popup_update_protected_list": "Следующие пользовательские данные автоматически защищены: {items}",
-        "popup_update_warning": "Предупреждение",
-        "popup_update_warning_body": "Это перезапишет существующие файлы скриптов в каталоге .smartdrive/.",
-        "popup_update_confirm_message": "Сейчас будет выполнено UPDATE ({direction}).\n\nИЗ:\n  {src_root}\n\nВ:\n  {dst_root}\n\nЭлементы:\n  - {items}\n\nМетод: {method}\n\nЭто перезапишет существующие файлы. Продолжить?",
-        "popup_update_config_title": "Настройка обновления",
-        "popup_update_config_body": "Источник обновления не настроен. Укажите его в Настройках.",
-        "popup_update_complete_title": "Обновление завершено",
-        "popup_update_complete_body": "Обновление успешно завершено. Пожалуйста, перезапустите приложение.",
-        "popup_update_failed_title": "Ошибка обновления",
-        "popup_update_failed_body": "Обновление не удалось:\n\n{error}",
-        "popup_update_timeout_title": "Время ожидания обновления",
-        "popup_update_timeout_body": "Обновление не завершилось за 120 секунд.",
-        "popup_update_error_title": "Ошибка обновления",
-        "popup_update_error_body": "Не удалось запустить обновление:\n\n{error}",
-        "popup_cli_failed_title": "Не удалось запустить CLI",
-        "popup_cli_failed_body": "Не удалось открыть CLI:\n\n{error}",
-        # Update configuration error messages
-        "error_update_server_url_not_configured": "URL сервера не настроен.\\n\\nОткройте Настройки и укажите URL для обновления.",
-        "error_update_local_root_not_configured": "Локальная папка обновления не настроена.\\n\\nОткройте Настройки и укажите локальный путь для обновления.",
-        "error_update_local_root_not_found": "Локальная папка обновления не найдена:\\n\\n{path}\\n\\nПроверьте Настройки и убедитесь, что путь указан верно.",
-        "error_update_install_dir_not_found": "Каталог установки не найден:\\n\\n{path}",
-        "error_update_unknown_source_type": "Неизвестный тип источника обновления: {type}",
-        # Hardware key error messages
-        "error_hardware_key_missing_title": "Требуется аппаратный ключ",
-        "error_hardware_key_missing_body": "Аппаратный ключ (YubiKey/GPG-карта) не обнаружен. Подключите аппаратный ключ и повторите попытку.",
-        # Theme names (for theme dropdown)
-        "theme_brand": "Фирменная",
-        "theme_green": "Зелёная",
-        "theme_blue": "Синяя",
-        "theme_rose": "Роза",
-        "theme_slate": "Сланец",
-        "label_theme": "Тема",
-        # File explorer buttons
-        "tooltip_open_launcher_drive": "Открыть диск запуска",
-        "tooltip_open_mounted_volume": "Открыть смонтированный том",
-        "popup_open_failed_title": "Ошибка открытия",
-        "popup_open_failed_body": "Не удалось открыть файловый менеджер:\n\n{path}\n\n{error}",
-        # About section (CHG-20251221-012)
-        "settings_about": "О программе",
-        "label_version": "Версия:",
-        "label_build_id": "ID сборки:",
-        "label_build_dev": "Разработка",
-        "label_compat_version": "Версия конфигурации:",
-        # Recovery kit generation (CHG-20251221-001)
-        "recovery_generate_section_title": "Создать набор восстановления",
-        "recovery_generate_instructions": "Создайте новый набор восстановления для создания зашифрованной резервной копии ваших учётных данных. Это полезно, если ваш оригинальный набор был утерян, повреждён или если вы хотите новую копию после изменения учётных данных.",
-        "btn_generate_recovery_kit": "🔐 Создать новый набор восстановления",
-        "recovery_generate_status_ready": "Нажмите 'Создать новый набор восстановления' для создания нового набора.",
-        "recovery_generate_status_deriving": "Получение учётных данных с аппаратного ключа...",
-        "recovery_generate_status_verifying": "Проверка учётных данных с VeraCrypt...",
-        "recovery_generate_status_running": "Создание набора восстановления...",
-        "recovery_generate_status_success": "✅ Набор восстановления успешно создан!",
-        "recovery_generate_status_failed": "❌ Ошибка создания набора восстановления: {error}",
-        "recovery_generate_confirm_title": "Создать набор восстановления",
-        "recovery_generate_confirm_body": "Это создаст новый набор восстановления с зашифрованной резервной копией ваших учётных данных.\n\nПродолжить?",
-        "recovery_generate_regen_confirm_title": "Пересоздать набор восстановления",
-        "recovery_generate_regen_confirm_body": "⚠️ ВНИМАНИЕ: Это создаст НОВЫЙ набор восстановления.\n\nВаш СУЩЕСТВУЮЩИЙ набор восстановления будет НАВСЕГДА АННУЛИРОВАН.\n\nПродолжить?",
-        "recovery_generate_security_warning_title": "Предупреждение безопасности: Пересоздание набора восстановления",
-        "recovery_generate_security_warning_body": "⚠️ ПРЕДУПРЕЖДЕНИЕ БЕЗОПАСНОСТИ ⚠️\n\nНабор восстановления уже существует. Создание нового:\n\n• Аннулирует предыдущий набор\n• Создаст НОВЫЙ путь доступа к вашим зашифрованным данным\n• Любой, у кого есть новый набор, может получить доступ к вашим данным\n\nПродолжайте только если понимаете последствия для безопасности.\n\nХотите пересоздать?",
-        "recovery_generate_password_prompt_title": "Введите пароль тома",
-        "recovery_generate_password_prompt_body": "Пожалуйста, введите пароль тома для создания набора восстановления:",
-        "recovery_generate_success_title": "Набор восстановления создан",
-        "recovery_generate_success_body": "Ваш набор восстановления создан!\n\nРасположение: {path}\n\n⚠️ ВАЖНО:\n• Немедленно распечатайте HTML-файл\n• Храните в безопасном физическом месте\n• Удалите HTML-файл с диска после печати",
-        # Settings dialog - Additional fields (schema-driven UI)
-        "label_drive_id": "ID диска",
-        "label_drive_name": "Имя диска",
-        "label_setup_date": "Дата настройки",
-        "label_last_password_change": "Последнее изменение пароля",
-        "label_last_verified": "Последняя проверка",
-        "label_plain_keyfile": "Простой файл ключа",
-        "label_seed_gpg_path": "Файл семени GPG",
-        "label_kdf": "Функция вывода ключа",
-        "label_pw_encoding": "Кодировка пароля",
-        "label_recovery_enabled": "Включить набор восстановления",
-        "label_recovery_share_count": "Количество частей восстановления",
-        "label_recovery_threshold": "Порог восстановления",
-        "label_lost_and_found_enabled": "Включить сообщение о потере",
-        "label_lost_and_found_message": "Сообщение о возврате",
-        "label_verification_overridden": "Проверка отменена",
-        "label_integrity_signed": "Целостность подписана",
-        "label_signing_key_fpr": "Отпечаток ключа подписи",
-        "label_salt_b64": "Соль (Base64)",
-        "label_hkdf_info": "Информация HKDF",
-        "label_schema_version": "Версия схемы",
-        "label_version": "Версия",
-        # Tooltips for settings fields
-        "tooltip_drive_id": "Уникальный идентификатор для этого диска (только чтение)",
-        "tooltip_drive_name": "Пользовательское имя для этого диска",
-        "tooltip_language": "Язык интерфейса пользователя",
-        "tooltip_theme": "Цветовая схема интерфейса",
-        "tooltip_mode": "Режим безопасности: только пароль, файл ключа или YubiKey/GPG",
-        "tooltip_encrypted_keyfile": "Путь к зашифрованному GPG файлу ключа (для режимов GPG)",
-        "tooltip_plain_keyfile": "Путь к незашифрованному файлу ключа (для простого режима файла ключа)",
-        "tooltip_seed_gpg_path": "Путь к файлу семени GPG для вывода пароля",
-        "tooltip_kdf": "Функция вывода ключа для режима пароля GPG",
-        "tooltip_pw_encoding": "Кодировка символов для пароля (рекомендуется UTF-8)",
-        "tooltip_windows_volume_path": "GUID тома Windows или путь к устройству",
-        "tooltip_mount_letter": "Буква диска для монтирования (A-Z)",
-        "tooltip_veracrypt_path": "Путь к исполняемому файлу VeraCrypt.exe",
-        "tooltip_unix_volume_path": "Путь к устройству Unix (например, /dev/sdb2)",
-        "tooltip_mount_point": "Каталог точки монтирования Unix",
-        # BUG-20251221-037: Mount point fallback i18n keys
-        "label_allow_mount_fallback": "Автоматически использовать альтернативную точку монтирования",
-        "tooltip_allow_mount_fallback": "При включении автоматически пробует альтернативные буквы дисков (Windows) или каталоги монтирования (Unix), если настроенный недоступен. Рекомендуется для предотвращения ошибок монтирования.",
-        "error_mount_point_occupied_fallback_disabled": "Точка монтирования {mount_point} уже используется.\n\nЧтобы избежать этой ошибки в будущем, включите 'Автоматически использовать альтернативную точку монтирования' в Настройки → вкладка {os_tab}.",
-        "error_mount_point_all_occupied": "Не удалось найти доступную точку монтирования после 3 попыток.\n\nВсе буквы дисков D-Z заняты (Windows) или альтернативные точки монтирования не удались (Unix).\n\nЭто проблема с точкой монтирования, НЕ проблема с учетными данными.",
-        "warning_mount_fallback_used": "Настроенная точка монтирования {original} была недоступна.\nИспользуется {fallback} вместо неё. Конфигурация обновлена.",
-        "tooltip_recovery_enabled": "Включить генерацию аварийного набора восстановления",
-        "tooltip_recovery_share_count": "Количество частей восстановления для генерации",
-        "tooltip_recovery_threshold": "Минимальное количество частей, необходимых для восстановления",
-        "tooltip_lost_and_found_enabled": "Включить сообщение о возврате при потере диска",
-        "tooltip_lost_and_found_message": "Сообщение, отображаемое при нахождении диска",
-        "tooltip_source_type": "Источник обновления: локальный каталог или URL сервера",
-        "tooltip_server_url": "URL сервера для обновлений",
-        "tooltip_local_root": "Локальный каталог, содержащий файлы обновления",
-        "hint_update_local_title": "О локальных обновлениях",
-        "hint_update_local_body": "Выберите: (1) каталог, содержащий папку .smartdrive/ (например, H:\\ или C:\\МояРазработка\\), или (2) папку .smartdrive/ напрямую. .smartdrive/ будет обнаружен автоматически. Пользовательские данные (recovery/, keys/, integrity/, config.json) автоматически защищены. Файлы разработки (.git, тесты, helper/) исключаются.",
-        # CHG-20251222-016: Update action section i18n keys
-        "update_action_section_title": "Действия обновления",
-        "btn_run_update": "Выполнить обновление",
-        "tooltip_run_update": "Выполнить обновление из настроенного источника",
-        "label_last_update": "Последнее обновление:",
-        "label_last_update_source": "Источник:",
-        "update_never": "Никогда",
-        "update_source_none": "Не настроен",
-        "tooltip_verification_overridden": "Обойти проверку целостности (опасно!)",
-        "tooltip_integrity_signed": "Целостность диска была криптографически подписана",
-        "tooltip_signing_key_fpr": "Отпечаток ключа GPG, используемого для подписи",
-        "tooltip_salt_b64": "Криптографическая соль для вывода ключа",
-        "tooltip_hkdf_info": "Контекстная строка для вывода ключа HKDF",
-        # Integrity tab (CHG-20251220-002)
-        "label_integrity_status": "Статус целостности:",
-        "tooltip_integrity_status": "Показывает, были ли скрипты проверены по подписанному хешу",
-        # CHG-20251222-014: OS-specific tab tooltip
-        "tooltip_tab_disabled_other_os": "Эта вкладка предназначена для другой операционной системы",
-        "settings_integrity": "Целостность",
-        "settings_integrity_desc": "Проверить целостность программного обеспечения и подписать скрипты.",
-        "integrity_section_title": "🔐 Целостность программного обеспечения",
-        "integrity_instructions": "Проверьте, не были ли скрипты изменены с момента подписи. Подпись требует аппаратный ключ (YubiKey/GPG-карта).",
-        "btn_verify_local": "✓ Проверить целостность (локально)",
-        "btn_sign_scripts": "🔑 Подписать скрипты",
-        "btn_verify_remote": "🌐 Проверить (удаленно)",
-        "integrity_status_ready": "Нажмите 'Проверить' для проверки целостности скриптов.",
-        "integrity_status_checking": "Проверка целостности...",
-        "integrity_status_signing": "Подписание скриптов аппаратным ключом...",
-        "integrity_status_pass": "✅ Целостность подтверждена! Скрипты подлинные.",
-        "integrity_status_fail": "❌ Проверка целостности НЕ ПРОЙДЕНА! Скрипты могли быть изменены.",
-        "integrity_status_no_manifest": "⚠️ Манифест целостности не найден. Скрипты не подписаны.",
-        "integrity_status_sign_success": "✅ Скрипты успешно подписаны!",
-        "integrity_status_sign_fail": "❌ Подпись не удалась. Вставлен ли аппаратный ключ?",
-        "integrity_result_hash": "Хеш: {hash}",
-        "integrity_result_signer": "Подписано: {signer}",
-        "integrity_remote_url_label": "URL сервера:",
-        "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
-        "integrity_status_remote_checking": "Отправка запроса на проверку на сервер...",
-        "integrity_status_remote_success": "✅ Удаленная проверка успешна!",
-        "integrity_status_remote_fail": "❌ Удаленная проверка не удалась: {error}",
-        "integrity_status_no_server_url": "⚠️ URL сервера не настроен. Укажите в Настройки → Целостность.",
-        "label_integrity_server_url": "URL сервера проверки",
-        "tooltip_integrity_server_url": "URL удаленного сервера проверки (напр. https://verify.example.com/api/check)",
-    },
-    "zh": {
-        # Window titles
-        "window_title": "KeyDrive",
-        "settings_window_title": "设置",
-        # Button labels
-        "btn_mount": "🔓 挂载",
-        "btn_unmount": "🔒 卸载",
-        "btn_cancel_auth": "❌ 取消",
-        "btn_confirm_mount": "✅ 确认",
-        "btn_tools": "⚙️",
-        "btn_close": "✕",
-        "btn_save": "保存",
-        "btn_cancel": "取消",
-        "btn_confirm": "确认",
-        "btn_ok": "确定",
-        "warning": "警告",
-        "settings_tab_security": "安全",
-        # CHG-20251223-055: Reload config button for non-modal settings
-        "btn_reload_config": "↻ 重新加载配置",
-        "tooltip_reload_config": "从磁盘重新加载配置（放弃未保存的更改）",
-        # Status messages
-        "status_config_not_found": "未找到配置",
-        "status_volume_mounted": "卷已挂载",
-        "status_volume_not_mounted": "卷未挂载",
-        "status_mounting": "⏳ 正在挂载卷...",
-        "status_mounting_gpg": "⏳ 正在挂载卷（GPG 认证）...",
-        "status_unmounting": "⏳ 正在卸载卷...",
-        "status_mount_success": "✅ 卷挂载成功",
-        "status_mount_failed": "❌ 挂载失败",
-        "status_unmount_success": "✅ 卷卸载成功",
-        "status_unmount_failed": "❌ 卸载失败",
-        # Info labels
-        "info_unavailable": "信息不可用",
-        "keyfile_selected_one": "已选择 1 个密钥文件",
-        "keyfile_selected_many": "已选择 {count} 个密钥文件",
-        "keyfile_drop_hint": "将密钥文件拖到此处或点击浏览",
-        "keyfile_drop_supports_multiple": "支持多个密钥文件",
-        "label_show_password": "显示密码",
-        # Size formatting
-        "size_free": "可用：{size}",
-        # Icons/placeholders
-        "icon_drive": "🚀",
-        # Tooltips
-        "tooltip_exit": "退出 SmartDrive",
-        "tooltip_settings": "高级工具和设置",
-        # Labels
-        "label_product_name": "产品名称",
-        "label_preview": "预览：",
-        "label_password": "密码：",
-        "label_keyfile": "密钥文件：",
-        "label_hardware_key_hint": "💡 认证可能需要硬件密钥",
-        "label_forgot_password": "忘记密码？",
-        # Placeholder text
-        "placeholder_password": "请输入你的 VeraCrypt 密码...",
-        # Menu items
-        "menu_settings": "⚙️ 设置",
-        "menu_rekey": "🔑 更改密码/密钥文件",
-        "menu_update": "⬇️ 更新脚本",
-        "menu_recovery": "💾 恢复工具包",
-        "menu_about": "ℹ️ 关于",
-        "menu_cli": "💻 打开 CLI",
-        "menu_exit": "⏻ 退出",
-        "menu_clear_keyfiles": "清除密钥文件",
-        "menu_switch_drive": "🔀 切换驱动器...",
-        "menu_switch_drive_browse": "📂 浏览...",
-        # CHG-20251221-042: Remote Control Mode menu items (Chinese)
-        "menu_manage_remote": "🌐 远程控制...",
-        "menu_manage_remote_browse": "📂 查找远程 .smartdrive...",
-        "menu_exit_remote": "🏠 退出远程模式",
-        "remote_active_label": "远程控制已激活",
-        "remote_click_to_end": "点击结束",
-        "remote_validation_failed_title": "远程验证失败",
-        "remote_validation_failed_body": "无法连接到远程驱动器:\n\n{error}",
-        "remote_disconnected_title": "远程驱动器已断开",
-        "remote_disconnected_body": "远程驱动器 ({drive}:) 已断开连接。\n\n返回本地模式。",
-        "remote_confirm_title": "进入远程控制模式",
-        "remote_confirm_body": "连接到远程 .smartdrive:\n{path}\n\n在远程模式下，您只能挂载/卸载远程卷。\n设置、更新和 CLI 访问已禁用。",
-        "remote_mode_disabled_title": "远程模式已激活",
-        "remote_mode_disabled_cli": "CLI 访问在远程模式下已禁用。",
-        "remote_mode_disabled_settings": "设置在远程模式下已禁用。请先退出远程模式。",
-        "remote_mode_disabled_update": "更新在远程模式下已禁用。请先退出远程模式。",
-        "dialog_select_keyfiles": "选择密钥文件（可多选）",
-        # Multi-drive context (CHG-20251221-026)
-        "label_launcher_root": "启动驱动器：",
-        "group_drive_context": "驱动器上下文",
-        "tooltip_launcher_root": "包含此 .smartdrive 文件夹的驱动器",
-        # Drive safety context (CHG-20251221-040)
-        "label_os_drive": "系统驱动器：",
-        "tooltip_os_drive": "运行操作系统的驱动器（不可重新分区）",
-        "label_instantiation_drive": "运行自：",
-        "tooltip_instantiation_drive": "启动此实例的驱动器（不可重新分区）",
-        "switch_drive_title": "切换驱动器上下文",
-        "switch_drive_confirm": "切换到来自以下位置的配置：\n{path}\n\n所有设置将从此驱动器重新加载。",
-        "switch_drive_invalid_path": "无效的 .smartdrive 文件夹。未找到 config.json。",
-        "switch_drive_select_folder": "选择 .smartdrive 文件夹",
-        "version_incompatible_title": "版本兼容性警告",
-        "version_incompatible_error": "无法切换到此驱动器：\n\n{message}\n\n配置格式与此软件版本不兼容。",
-        "version_incompatible_warning": "{message}\n\n目标：{path}\n\n是否仍要继续？",
-        # Tray
-        "tray_minimized_message": "正在后台运行。点击托盘图标打开。",
-        "tray_unavailable_message": "系统托盘不可用。\n\n您要退出应用程序吗？",
-        "tray_tooltip": "{name} ({id})",
-        # Status messages
-        "status_deriving_yubikey_password": "正在从 YubiKey 派生密码...",
-        "status_checking_mount": "正在检查挂载状态...",
-        "status_unmounting_for_rekey": "正在卸载卷以更换密钥...",
-        "status_decrypting_keyfile": "正在使用 YubiKey 解密密钥文件...",
-        # Worker messages (keys for structured errors)
-        "worker_mount_script_not_found": "未找到挂载脚本",
-        "worker_mount_success": "卷挂载成功",
-        "worker_mount_failed": "挂载失败：{error}",
-        "worker_mount_timeout": "挂载操作超时",
-        "worker_mount_error": "挂载错误：{error}",
-        "worker_unmount_script_not_found": "未找到卸载脚本",
-        "worker_unmount_success": "卷卸载成功",
-        "worker_unmount_failed": "卸载失败：{error}",
-        "worker_unmount_timeout": "卸载操作超时",
-        "worker_unmount_error": "卸载错误：{error}",
-        # Settings dialog - Tab names
-        "settings_language": "语言",
-        "settings_general": "常规",
-        "settings_security": "安全",
-        "settings_keyfile": "密钥文件",
-        "settings_windows": "Windows",
-        "settings_unix": "Unix",
-        "settings_updates": "更新",
-        "settings_recovery": "恢复",
-        "settings_lost_and_found": "失物招领",
-        "settings_advanced": "高级",
-        # Settings dialog - Tab descriptions
-        "settings_general_desc": "配置显示名称、语言和主题首选项。",
-        "settings_security_desc": "设置安全驱动器的加密模式和身份验证方法。",
-        "settings_keyfile_desc": "管理用于加密和 GPG 身份验证的密钥文件路径。",
-        "settings_windows_desc": "Windows 特定设置，包括挂载盘符和 VeraCrypt 位置。",
-        "settings_unix_desc": "Linux 和 macOS 设置，包括挂载点目录。",
-        "settings_updates_desc": "配置自动更新检查和服务器设置。",
-        "settings_recovery_desc": "设置 Shamir 秘密共享恢复选项，以便在密钥丢失时恢复访问。",
-        "settings_lost_and_found_desc": "在驱动器上显示联系信息，以便丢失时归还。",
-        "settings_advanced_desc": "加密参数和完整性验证的技术设置。",
-        # BUG-20251221-036: Settings dialog - Group box titles (Chinese)
-        "group_drive_identification": "驱动器识别",
-        "group_appearance": "外观",
-        "group_timestamps": "时间戳",
-        "group_security_mode": "安全模式",
-        "group_keyfile_configuration": "密钥文件配置",
-        "group_gpg_configuration": "GPG 配置",
-        "group_emergency_recovery_kit": "紧急恢复套件",
-        "group_verification": "验证",
-        "group_verification_status": "验证状态",
-        "group_software_integrity": "软件完整性",
-        "group_remote_verification": "远程验证",
-        "group_gpg_kdf_parameters": "GPG KDF 参数",
-        "group_metadata": "元数据",
-        "settings_restart_not_required": "✓ 更改已立即应用（无需重启）",
-        "label_mode": "模式",
-        "label_encrypted_keyfile": "加密的密钥文件",
-        "label_volume_path": "卷路径",
-        "label_mount_letter": "挂载盘符",
-        "label_veracrypt_path": "VeraCrypt 路径",
-        "label_mount_point": "挂载点",
-        "label_source_type": "来源类型",
-        "label_server_url": "服务器 URL",
-        "label_local_root": "本地根目录",
-        "error_invalid_mount_letter": "盘符必须是单个 A–Z 字符。",
-        "error_save_failed": "无法保存 config.json：",
-        "title_invalid_mount_letter": "无效盘符",
-        "title_save_failed": "保存失败",
-        "title_error": "错误",
-        "error_apply_theme": "无法应用主题：{error}",
-        "error_apply_language": "无法应用语言：{error}",
-        # Popup dialogs
-        "popup_keyfile_required_title": "需要密钥文件",
-        "popup_keyfile_required_body": "在“密码 + 密钥文件”模式下请选择密钥文件。",
-        "popup_password_required_title": "需要密码",
-        "popup_password_required_body": "请输入你的 VeraCrypt 密码。",
-        "popup_recovery_title": "密码恢复",
-        "popup_recovery_available_body": "此驱动器有可用的恢复工具包！\n\n要恢复对加密卷的访问：\n\n1. 使用 SmartDrive CLI：python smartdrive.py\n2. 选择选项 6：恢复工具包\n3. 按照恢复说明操作\n\n或联系系统管理员。",
-        "popup_recovery_unavailable_body": "此驱动器当前没有可用的恢复工具包。\n\n要设置密码恢复：\n\n1. 使用 SmartDrive CLI：python smartdrive.py\n2. 选择选项 6：恢复工具包\n3. 选择 'Generate Recovery Kit'\n\n或联系系统管理员。",
-        # Recovery tab - Phrase input and recovery actions
-        "recovery_section_title": "🔐 紧急恢复",
-        "recovery_instructions": "输入您的 24 个单词的恢复短语以恢复对加密卷的访问。如果您有恢复容器文件，也可以在这里提供。",
-        "label_recovery_phrase": "恢复短语（24 个单词）：",
-        "placeholder_recovery_phrase": "输入 24 个以空格分隔的单词...",
-        "label_recovery_container": "恢复容器（可选）：",
-        "btn_browse_container": "浏览...",
-        "btn_recover_credentials": "🔓 恢复凭证",
-        "recovery_status_ready": "输入恢复短语并点击「恢复凭证」",
-        "recovery_status_validating": "正在验证恢复短语...",
-        "recovery_status_decrypting": "正在解密恢复容器...",
-        "recovery_status_success": "✅ 恢复成功！凭证已恢复。",
-        "recovery_status_failed": "❌ 恢复失败：{error}",
-        "recovery_result_title": "已恢复的凭证",
-        "recovery_result_password": "密码：",
-        "recovery_result_keyfile": "密钥文件：",
-        "recovery_result_mode": "安全模式：",
-        "recovery_result_copy_password": "📋 复制密码",
-        "recovery_result_save_keyfile": "💾 保存密钥文件",
-        "recovery_copied_to_clipboard": "密码已复制到剪贴板（30 秒后自动清除）",
-        "recovery_keyfile_saved": "密钥文件已保存到：{path}",
-        "recovery_phrase_invalid": "恢复短语无效。请检查全部 24 个单词。",
-        "recovery_container_not_found": "未找到恢复容器。请选择容器文件。",
-        "recovery_no_kit_configured": "此驱动器未配置恢复工具包。",
-        "recovery_generate_first": "请先通过设置或 CLI 生成恢复工具包。",
-        "recovery_already_used": "⚠️ 恢复工具包已被使用。此操作已禁用。",
-        "recovery_status_invalidating": "正在作废恢复工具包...",
-        "recovery_status_complete": "恢复完成。恢复工具包已被永久作废。",
-        "recovery_rekey_required_title": "必须更改凭证",
-        "recovery_rekey_required_body": "恢复成功。出于安全考虑，您现在必须更改密码/密钥文件。\n\n恢复工具包包含的临时凭证现已泄露。\n\n您想现在更改凭证吗？",
-        "recovery_rekey_now": "立即更改凭证",
-        "recovery_rekey_later": "稍后提醒我",
-        "recovery_rekey_skipped_warning": "⚠️ 您跳过了凭证更改。在更改凭证之前，您将无法挂载驱动器。",
-        "mount_blocked_rekey_required_title": "必须更改凭证",
-        "mount_blocked_rekey_required_body": "恢复工具包已被使用，但凭证尚未更改。出于安全考虑，挂载已被阻止。\n\n请使用密钥更改脚本设置新凭证。",
-        "mount_warn_rekey_title": "建议更改凭证",
-        "mount_warn_rekey_body": "恢复工具包最近被使用。强烈建议更改您的凭证。\n\n您想现在更改凭证还是继续挂载？",
-        "label_recovery_status": "恢复工具包状态",
-        "recovery_kit_available": "✅ 可用",
-        "recovery_kit_used": "🚫 已使用（无效）",
-        "recovery_kit_not_configured": "⚪ 未配置",
-        "recovery_html_warning": "HTML 恢复文件仍在驱动器上！打印后请删除以确保安全。",
-        "tooltip_recovery_status": "显示恢复工具包是可用、已使用还是未配置",
-        "rekey_section_title": "🔑 更改凭证",
-        "rekey_instructions": "更改您的 VeraCrypt 容器密码和/或密钥文件。",
-        "rekey_post_recovery_notice": "⚠️ 恢复后：您必须更改凭证才能允许挂载。",
-        "btn_start_rekey": "开始更改凭证...",
-        # CHG-20251223-054: Verify/Cancel buttons for streamlined rekey flow
-        "btn_verify_rekey": "✓ 验证新凭证",
-        "btn_cancel_rekey": "✕ 取消",
-        "rekey_instructions_veracrypt": "VeraCrypt GUI 已打开。在 VeraCrypt 中：\n1. 工具 → 更改卷密码\n2. 选择设备 → 选择您的卷\n3. 输入当前密码（使用上面的「复制旧密码」）\n4. 输入新密码（使用上面的「复制新密码」）\n5. 点击确定\n\n在 VeraCrypt 确认后，点击「验证新凭证」。",
-        "rekey_verifying": "通过挂载测试验证新凭证...",
-        "rekey_verification_success": "✓ 新凭证已验证！正在完成密钥更换...",
-        "rekey_verification_failed": "✕ 验证失败。请检查您的新密码/密钥文件。",
-        "rekey_cancelled": "凭证更改已取消。",
-        # BUG-20251221-039: Copy credential buttons
-        # CHG-20251222-018: Enhanced tooltips for clarity
-        "btn_copy_old_password": "📋 复制旧密码",
-        "btn_copy_new_password": "📋 复制新密码",
-        "tooltip_copy_old_password": "使用现有 GPG seed 派生并复制当前密码。对于 GPG 模式，使用您的硬件密钥。（30秒后自动清除）",
-        "tooltip_copy_old_password_post_recovery": "已禁用：恢复后请使用恢复套件中的密码。GPG seed 可能丢失或损坏。",
-        "tooltip_copy_new_password": "使用上面指定的新 GPG seed 派生并复制新密码。请先生成新的 seed.gpg。（30秒后自动清除）",
-        "rekey_gpg_seed_hint": "对于 GPG 模式：上面的「新 GPG Seed」决定将派生什么密码。先生成新的 seed.gpg，然后使用「复制新密码」。",
-        "copy_password_title": "复制密码",
-        "rekey_status_ready": "准备更改凭证",
-        "rekey_status_preparing": "正在准备更改凭证...",
-        "rekey_status_opening_veracrypt": "正在打开 VeraCrypt GUI...",
-        "rekey_status_awaiting_confirmation": "等待确认密码更改...",
-        "rekey_status_verifying": "正在验证新凭证...",
-        "rekey_validating": "正在验证新凭证...",
-        "rekey_verifying_mount": "通过挂载验证凭证...",
-        "rekey_credentials_verified": "新凭证验证成功！",
-        "rekey_testing_mount": "正在测试新凭证挂载...",
-        "rekey_validation_success": "验证成功 - 正在卸载...",
-        "rekey_status_success": "✅ 凭证更改成功",
-        "rekey_status_failed": "❌ 凭证更改失败：{error}",
-        "btn_verify_rekey": "确认更改已完成",
-        "rekey_current_password_label": "当前密码：",
-        "rekey_current_password_auto": "（自动检测）",
-        "rekey_new_password_label": "新密码：",
-        "rekey_confirm_password_label": "确认密码：",
-        "rekey_current_mode_label": "当前安全模式：",
-        "rekey_target_mode_label": "新安全模式：",
-        "rekey_mode_same_tooltip": "保持当前安全模式",
-        "rekey_mode_pw_only": "🔒 仅密码",
-        "rekey_mode_pw_keyfile": "🔑 密码 + 密钥文件",
-        "rekey_mode_pw_gpg_keyfile": "🛡️ 密码 + GPG派生密钥文件",
-        "rekey_mode_gpg_pw_only": "🔐 GPG派生密码（只读）",
-        "rekey_new_keyfile_label": "新密钥文件路径：",
-        "rekey_new_gpg_seed_label": "新GPG种子路径：",
-        "btn_browse_keyfile": "浏览...",
-        # CHG-20251221-003: GPG seed generation button
-        "btn_generate_gpg_seed": "生成",
-        "tooltip_generate_gpg_seed": "生成新的GPG加密种子用于密码派生。需要YubiKey/GPG卡。",
-        "gpg_seed_generate_title": "生成GPG种子",
-        "gpg_seed_generate_confirm": "这将生成一个新的加密安全种子，并使用您的GPG密钥对其进行加密。\n\n请确保您的YubiKey/GPG卡已插入。\n\n继续？",
-        "gpg_seed_generate_success": "GPG种子生成成功！",
-        "gpg_seed_generate_fail": "生成GPG种子失败",
-        "gpg_seed_derive_info": "将显示从此种子派生的密码。\n复制它以用作您的新VeraCrypt密码。",
-        # CHG-20251223-032: Multi-key authentication
-        "gpg_key_auth_title": "验证GPG密钥",
-        "gpg_key_auth_prompt": "为确保您有权访问此密钥，请进行身份验证。\n\n密钥：{fingerprint}\n\n可能需要输入PIN码。",
-        "gpg_key_auth_success": "密钥验证成功。",
-        "gpg_key_auth_fail": "密钥验证失败：{fingerprint}",
-        "gpg_key_auth_skip_prompt": "是否跳过此密钥的验证？\n\n⚠️ 警告：如果跳过，您可能会配置一个您不拥有的密钥。\n当您将访问权限委托给他人时，这是可以接受的。",
-        "gpg_key_auth_skipped": "跳过密钥验证：{fingerprint}",
-        # CHG-20251221-008: GPG key selection dialog
-        "gpg_key_select_title": "选择用于加密的GPG密钥",
-        "gpg_key_select_hint": "从下面的列表中选择硬件密钥，或者如果您的密钥未列出，请手动输入指纹或电子邮件。",
-        "gpg_key_select_label": "GPG密钥：",
-        "gpg_key_select_placeholder": "选择或输入密钥...",
-        "gpg_key_select_manual": "手动输入...",
-        "gpg_key_select_none": "未找到GPG私钥",
-        "gpg_key_manual_label": "输入指纹或电子邮件：",
-        # CHG-20251222-001: Multi-GPG key selection for hardware key redundancy
-        "gpg_key_select_hint_multi": "从下面的列表中选择一个或多个硬件密钥以实现冗余。\n您也可以手动输入其他指纹（用逗号或换行符分隔）。",
-        "gpg_key_manual_label_multi": "其他指纹：",
-        "gpg_key_select_placeholder_multi": "输入指纹（用逗号或换行符分隔）...",
-        "gpg_key_select_none_selected": "请至少选择一个GPG密钥或手动输入指纹。",
-        "rekey_mode_change_warning": "⚠️ 更改安全模式需要额外验证",
-        "rekey_gpg_seed_instructions": "请连接您的 YubiKey 并输入 GPG 种子文件路径。",
-        "popup_unmount_failed_title": "卸载失败",
-        "popup_mount_failed_title": "挂载失败",
-        "popup_update_not_possible_title": "无法更新",
-        "popup_update_confirm_title": "确认更新",
-        "popup_update_direction": "方向",
-        "popup_update_source": "源",
-        "popup_update_destination": "目标",
-        "popup_update_files_to_update": "要更新的文件",
-        "popup_update_protected_items": "受保护的项目（永不覆盖）",
-        "popup_update_protected_list": "以下用户数据将自动受到保护：{items}",
-        "popup_update_warning": "警告",
-        "popup_update_warning_body": "这将覆盖 .smartdrive/ 目录中的现有脚本文件。",
-        "popup_update_confirm_message": "即将运行 UPDATE ({direction}).\n\n来源:\n  {src_root}\n\n目标:\n  {dst_root}\n\n项目:\n  - {items}\n\n方式: {method}\n\n这将覆盖现有文件。继续？",
-        "popup_update_config_title": "更新配置",
-        "popup_update_config_body": "未配置更新来源。请在设置中进行配置。",
-        "popup_update_complete_title": "更新完成",
-        "popup_update_complete_body": "更新成功完成。请重启应用程序。",
-        "popup_update_failed_title": "更新失败",
-        "popup_update_failed_body": "更新失败：\n\n{error}",
-        "popup_update_timeout_title": "更新超时",
-        "popup_update_timeout_body": "更新在 120 秒内未完成。",
-        "popup_update_error_title": "更新错误",
-        "popup_update_error_body": "无法运行更新：\n\n{error}",
-        "popup_cli_failed_title": "CLI 启动失败",
-        "popup_cli_failed_body": "无法打开 CLI：\n\n{error}",
-        # Update configuration error messages
-        "error_update_server_url_not_configured": "未配置服务器 URL。\n\n请前往设置配置更新 URL。",
-        "error_update_local_root_not_configured": "未配置本地更新目录。\n\n请前往设置配置本地更新根目录。",
-        "error_update_local_root_not_found": "未找到本地更新目录：\n\n{path}\n\n请检查设置以验证路径。",
-        "error_update_install_dir_not_found": "未找到安装目录：\n\n{path}",
-        "error_update_unknown_source_type": "未知的更新来源类型：{type}",
-        # Hardware key error messages
-        "error_hardware_key_missing_title": "需要硬件密钥",
-        "error_hardware_key_missing_body": "未检测到硬件密钥（YubiKey/GPG 卡）。请插入硬件密钥后重试。",
-        # Theme names (for theme dropdown)
-        "theme_brand": "品牌",
-        "theme_green": "绿色",
-        "theme_blue": "蓝色",
-        "theme_rose": "玫瑰",
-        "theme_slate": "石板",
-        "label_theme": "主题",
-        # File explorer buttons
-        "tooltip_open_launcher_drive": "打开启动器驱动器",
-        "tooltip_open_mounted_volume": "打开已挂载的卷",
-        "popup_open_failed_title": "打开失败",
-        "popup_open_failed_body": "无法打开文件管理器:\n\n{path}\n\n{error}",
-        # About section (CHG-20251221-012)
-        "settings_about": "关于",
-        "label_version": "版本：",
-        "label_build_id": "构建 ID：",
-        "label_build_dev": "开发版",
-        "label_compat_version": "配置版本：",
-        # Recovery kit generation (CHG-20251221-001)
-        "recovery_generate_section_title": "生成恢复工具包",
-        "recovery_generate_instructions": "生成新的恢复工具包以创建您凭据的加密备份。如果您的原始工具包丢失、损坏或您希望在更改凭据后获得新副本，这将很有用。",
-        "btn_generate_recovery_kit": "🔐 生成新的恢复工具包",
-        "recovery_generate_status_ready": "点击「生成新的恢复工具包」以创建新工具包。",
-        "recovery_generate_status_deriving": "正在从硬件密钥派生凭据...",
-        "recovery_generate_status_verifying": "正在使用VeraCrypt验证凭据...",
-        "recovery_generate_status_running": "正在生成恢复工具包...",
-        "recovery_generate_status_success": "✅ 恢复工具包生成成功！",
-        "recovery_generate_status_failed": "❌ 恢复工具包生成失败：{error}",
-        "recovery_generate_confirm_title": "生成恢复工具包",
-        "recovery_generate_confirm_body": "这将生成一个新的恢复工具包，其中包含您凭据的加密备份。\n\n是否继续？",
-        "recovery_generate_regen_confirm_title": "重新生成恢复工具包",
-        "recovery_generate_regen_confirm_body": "⚠️ 警告：这将创建一个新的恢复工具包。\n\n您的现有恢复工具包将被永久失效。\n\n是否继续？",
-        "recovery_generate_security_warning_title": "安全警告：重新生成恢复工具包",
-        "recovery_generate_security_warning_body": "⚠️ 安全警告 ⚠️\n\n恢复工具包已经存在。创建新的将:\n\n• 使之前的工具包失效\n• 创建访问加密数据的新路径\n• 任何拥有新工具包的人都可以访问您的数据\n\n只有在理解安全影响时才继续。\n\n您要重新生成吗？",
-        "recovery_generate_password_prompt_title": "输入卷密码",
-        "recovery_generate_password_prompt_body": "请输入您的卷密码以生成恢复工具包：",
-        "recovery_generate_success_title": "恢复工具包已生成",
-        "recovery_generate_success_body": "您的恢复工具包已生成！\n\n位置：{path}\n\n⚠️ 重要：\n• 立即打印 HTML 文件\n• 存放在安全的物理位置\n• 打印后从驱动器中删除 HTML 文件",
-        # Settings dialog - Additional fields (schema-driven UI)
-        "label_drive_id": "驱动器 ID",
-        "label_drive_name": "驱动器名称",
-        "label_setup_date": "设置日期",
-        "label_last_password_change": "上次密码更改",
-        "label_last_verified": "上次验证",
-        "label_plain_keyfile": "普通密钥文件",
-        "label_seed_gpg_path": "GPG 种子文件",
-        "label_kdf": "密钥派生函数",
-        "label_pw_encoding": "密码编码",
-        "label_recovery_enabled": "启用恢复工具包",
-        "label_recovery_share_count": "恢复份额数量",
-        "label_recovery_threshold": "恢复阈值",
-        "label_lost_and_found_enabled": "启用失物招领消息",
-        "label_lost_and_found_message": "返回消息",
-        "label_verification_overridden": "已覆盖验证",
-        "label_integrity_signed": "完整性已签名",
-        "label_signing_key_fpr": "签名密钥指纹",
-        "label_salt_b64": "盐（Base64）",
-        "label_hkdf_info": "HKDF 信息",
-        "label_schema_version": "模式版本",
-        "label_version": "版本",
-        # Tooltips for settings fields
-        "tooltip_drive_id": "此驱动器的唯一标识符（只读）",
-        "tooltip_drive_name": "此驱动器的自定义名称",
-        "tooltip_language": "用户界面语言",
-        "tooltip_theme": "界面配色方案",
-        "tooltip_mode": "安全模式：仅密码、密钥文件或 YubiKey/GPG",
-        "tooltip_encrypted_keyfile": "GPG 加密的密钥文件路径（用于 GPG 模式）",
-        "tooltip_plain_keyfile": "未加密的密钥文件路径（用于普通密钥文件模式）",
-        "tooltip_seed_gpg_path": "用于密码派生的 GPG 种子文件路径",
-        "tooltip_kdf": "GPG 密码模式的密钥派生函数",
-        "tooltip_pw_encoding": "密码的字符编码（推荐 UTF-8）",
-        "tooltip_windows_volume_path": "Windows 卷 GUID 或设备路径",
-        "tooltip_mount_letter": "挂载为驱动器号（A-Z）",
-        "tooltip_veracrypt_path": "VeraCrypt.exe 可执行文件的路径",
-        "tooltip_unix_volume_path": "Unix 设备路径（例如 /dev/sdb2）",
-        "tooltip_mount_point": "Unix 挂载点目录",
-        "tooltip_recovery_enabled": "启用紧急恢复工具包生成",
-        "tooltip_recovery_share_count": "要生成的恢复份额数量",
-        "tooltip_recovery_threshold": "恢复所需的最少份额数",
-        "tooltip_lost_and_found_enabled": "如果驱动器丢失，启用返回消息",
-        "tooltip_lost_and_found_message": "找到驱动器时显示的消息",
-        "tooltip_source_type": "更新源：本地目录或服务器 URL",
-        "tooltip_server_url": "更新的服务器 URL",
-        "tooltip_local_root": "包含更新文件的本地目录",
-        "hint_update_local_title": "关于本地更新",
-        "hint_update_local_body": "选择：(1) 包含 .smartdrive/ 文件夹的目录（例如 H:\\ 或 C:\\我的开发\\)，或 (2) 直接选择 .smartdrive/ 文件夹。系统将自动检测 .smartdrive/。用户数据（recovery/、keys/、integrity/、config.json）将自动受到保护。开发文件（.git、测试、helper/）将被排除。",
-        # CHG-20251222-016: Update action section i18n keys
-        "update_action_section_title": "更新操作",
-        "btn_run_update": "执行更新",
-        "tooltip_run_update": "从配置的源执行更新",
-        "label_last_update": "上次更新：",
-        "label_last_update_source": "来源：",
-        "update_never": "从未",
-        "update_source_none": "未配置",
-        "tooltip_verification_overridden": "绕过完整性验证（危险！）",
-        "tooltip_integrity_signed": "驱动器完整性已进行加密签名",
-        "tooltip_signing_key_fpr": "用于签名的 GPG 密钥指纹",
-        "tooltip_salt_b64": "用于密钥派生的加密盐",
-        "tooltip_hkdf_info": "HKDF 密钥派生的上下文字符串",
-        # Integrity tab (CHG-20251220-002)
-        "label_integrity_status": "完整性状态：",
-        "tooltip_integrity_status": "显示脚本是否已根据签名哈希进行验证",
-        # CHG-20251222-014: OS-specific tab tooltip
-        "tooltip_tab_disabled_other_os": "此选项卡适用于其他操作系统",
-        "settings_integrity": "完整性",
-        "settings_integrity_desc": "验证软件完整性并签名脚本。",
-        "integrity_section_title": "🔐 软件完整性",
-        "integrity_instructions": "验证脚本自签名以来是否被修改。签名需要硬件密钥（YubiKey/GPG卡）。",
-        "btn_verify_local": "✓ 验证完整性（本地）",
-        "btn_sign_scripts": "🔑 签名脚本",
-        "btn_verify_remote": "🌐 验证（远程）",
-        "integrity_status_ready": "点击'验证'检查脚本完整性。",
-        "integrity_status_checking": "正在验证完整性...",
-        "integrity_status_signing": "正在使用硬件密钥签名脚本...",
-        "integrity_status_pass": "✅ 完整性已验证！脚本是真实的。",
-        "integrity_status_fail": "❌ 完整性验证失败！脚本可能已被修改。",
-        "integrity_status_no_manifest": "⚠️ 未找到完整性清单。脚本未签名。",
-        "integrity_status_sign_success": "✅ 脚本签名成功！",
-        "integrity_status_sign_fail": "❌ 签名失败。硬件密钥是否已插入？",
-        "integrity_result_hash": "哈希：{hash}",
-        "integrity_result_signer": "签名者：{signer}",
-        "integrity_remote_url_label": "服务器 URL：",
-        "integrity_remote_url_placeholder": "https://verify.example.com/api/check",
-        "integrity_status_remote_checking": "正在向服务器发送验证请求...",
-        "integrity_status_remote_success": "✅ 远程验证成功！",
-        "integrity_status_remote_fail": "❌ 远程验证失败：{error}",
-        "integrity_status_no_server_url": "⚠️ 未配置服务器URL。请在设置 → 完整性中设置。",
-        "label_integrity_server_url": "验证服务器URL",
-        "tooltip_integrity_server_url": "远程验证服务器的URL（例如 https://verify.example.com/api/check）",
-        # BUG-20251221-037: Mount point fallback (Chinese)
-        "label_allow_mount_fallback": "允许挂载点回退",
-        "tooltip_allow_mount_fallback": "如果首选挂载点被占用，自动尝试备用挂载点",
-        "error_mount_point_occupied_fallback_disabled": "挂载点 {mount_point} 被占用。\n\n已禁用自动回退。在设置中启用「允许挂载点回退」以自动尝试备用位置。\n\n这不是凭据问题——您的密码/密钥文件正确，但挂载位置不可用。",
-        "error_mount_point_all_occupied": "在 {max_attempts} 次尝试后，所有挂载点都被占用。\n\n已尝试位置：{attempted}\n\n请手动释放其中一个位置或指定其他挂载点。\n\n这不是凭据问题——您的密码/密钥文件正确，但没有可用的挂载位置。",
-        "warning_mount_fallback_used": "挂载点 {original} 被占用，已使用 {fallback}",
-    },
-}
+# CHG-20261016-019: One catalog per language in locales/gui_<lang>.py, loaded on
+# first use (see locales/__init__.py). TRANSLATIONS keeps the dict-of-dicts
+# interface: "de" in TRANSLATIONS, TRANSLATIONS["de"][key], .items(), ...
+
+TRANSLATIONS: CatalogSet = CatalogSet("gui", AVAILABLE_LANGUAGES)
 
 
 # =============================================================================
@@ -3369,21 +81,83 @@ def tr(key: str, *, lang: str = "en", **kwargs) -> str:
         tr("btn_mount")  # "🔓 Mount"
         tr("keyfile_selected_many", count=3)  # "3 keyfiles selected"
     """
-    # Try selected language
-    if lang in TRANSLATIONS and key in TRANSLATIONS[lang]:
-        template = TRANSLATIONS[lang][key]
-        return template.format(**kwargs) if kwargs else template
+    mark_once(MILESTONE_TR)
+    # Try selected language, then fall back to English (one lookup each)
+    template = TRANSLATIONS[lang].get(key) if lang in TRANSLATIONS else None
+    if template is None:
+        template = TRANSLATIONS["en"].get(key)
+        if template is None:
+            # Hard fail - missing key even in English
+            raise KeyError(
+                f"Translation key '{key}' not found in language '{lang}' "
+                f"nor in fallback language 'en'. This is a programming error."
+            )
+
+    # Fast path: templates without placeholders are returned as-is
+    if kwargs and "{" in template:
+        return template.format(**kwargs)
+    return template
+
+
+# =============================================================================
+# Widget Bindings
+# =============================================================================
+
+
+class TranslationBindings:
+    """
+    Registry of widgets showing a translated string, for retranslation.
+
+    CHG-20261016-019: A widget registers the key it displays once; a language
+    switch then retranslates exactly the bound widgets. Widgets are held
+    weakly, and Qt objects deleted on the C++ side are dropped on the next
+    retranslate(), so only live (materialized) widgets are touched.
+
+    Usage:
+        bindings = TranslationBindings()
+        label = QLabel(tr("label_password", lang=lang))
+        bindings.bind(label, "label_password")
+        bindings.bind(label, "tooltip_password", setter="setToolTip")
+        bindings.retranslate("de")
+    """
+
+    def __init__(self):
+        self._bindings: Dict[Tuple[int, str], tuple] = {}
+
+    def bind(self, widget, key: str, setter: str = "setText", **kwargs) -> None:
+        """Retranslate widget.<setter>(tr(key, **kwargs)) on language switches."""
+        slot = (id(widget), setter)
+
+        def _forget(_ref, slot=slot):
+            self._bindings.pop(slot, None)
+
+        self._bindings[slot] = (weakref.ref(widget, _forget), setter, key, kwargs)
+
+    def unbind(self, widget, setter: str = "setText") -> None:
+        self._bindings.pop((id(widget), setter), None)
+
+    def retranslate(self, lang: str) -> int:
+        """
+        Apply lang to every bound widget.
 
-    # Fallback to English
-    if key in TRANSLATIONS.get("en", {}):
-        template = TRANSLATIONS["en"][key]
-        return template.format(**kwargs) if kwargs else template
+        Returns:
+            Number of widgets updated
+        """
+        updated = 0
+        for slot, (ref, setter, key, kwargs) in list(self._bindings.items()):
+            widget = ref()
+            try:
+                if widget is None:
+                    raise RuntimeError("widget collected")
+                getattr(widget, setter)(tr(key, lang=lang, **kwargs))
+            except RuntimeError:  # Deleted (C++ side) or collected
+                self._bindings.pop(slot, None)
+                continue
+            updated += 1
+        return updated
 
-    # Hard fail - missing key even in English
-    raise KeyError(
-        f"Translation key '{key}' not found in language '{lang}' "
-        f"nor in fallback language 'en'. This is a programming error."
-    )
+    def __len__(self) -> int:
+        return len(self._bindings)
 
 
 # =============================================================================
@@ -3401,7 +175,7 @@ def validate_keys(used_keys: set) -> None:
     Raises:
         KeyError: If any key is missing from 'en' translation table
     """
-    en_keys = set(TRANSLATIONS.get("en", {}).keys())
+    en_keys = set(TRANSLATIONS["en"].keys())
     missing = used_keys - en_keys
 
     if missing:
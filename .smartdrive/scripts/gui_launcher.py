@@ -38,6 +38,24 @@ if str(_project_root) not in sys.path:
 if str(_script_dir) not in sys.path:
     sys.path.insert(0, str(_script_dir))
 
+# CHG-20261016-017: --profile-startup times every import from here on
+try:
+    from core.startup_profile import enable_from_argv
+
+    enable_from_argv("gui", _project_root)
+except ImportError:
+    pass
+
+# CHG-20261016-016: Use the verified precompiled bytecode bundle when present
+# (gui.py, gui_i18n.py, core/* are then not recompiled on every launch)
+if _deploy_root is not None:
+    try:
+        from core.bytecode import install_bundle
+
+        install_bundle(_deploy_root)
+    except Exception:
+        pass  # Normal imports from source
+
 # ============================================================
 # GLOBAL EXCEPTION HANDLING AND LOGGING
 # ============================================================
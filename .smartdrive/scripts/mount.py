@@ -58,18 +58,38 @@ else:
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+# CHG-20261016-017: --profile-startup times every import from here on
+if __name__ == "__main__":
+    try:
+        from core.startup_profile import enable_from_argv
+
+        enable_from_argv("mount", _project_root)
+    except ImportError:
+        pass
+
 try:
+    from core import startup_profile
+    from core.card_presence import get_card_presence
     from core.constants import ConfigKeys, CryptoParams, Defaults, FileNames
+    from core.ephemeral_keyfile import create_ephemeral_keyfile, discard_ephemeral_keyfile, is_memfd_keyfile
+    from core.gpg_session import get_gpg_session, warm_up_for_mode
     from core.limits import Limits
     from core.modes import SecurityMode
+    from core.mount_inventory import get_mount_inventory
     from core.paths import Paths
     from core.platform import is_windows as _is_windows
     from core.platform import windows_refresh_explorer, windows_set_attributes
+    from core.tool_cache import which_tool
 
     CONFIG_FILENAME = FileNames.CONFIG_JSON
 except ImportError:
     # Fallback for standalone operation
     CONFIG_FILENAME = "config.json"
+    startup_profile = None
+    create_ephemeral_keyfile = None
+    discard_ephemeral_keyfile = None
+    get_mount_inventory = None
+    which_tool = None
 
     class Defaults:
         WINDOWS_MOUNT_LETTER = "V"
@@ -143,7 +163,7 @@ def is_mount_point_available_unix(mount_point: Path) -> bool:
     BUG-20251221-037: Check if a Unix mount point is available for mounting.
 
     A mount point is considered unavailable if:
-    - It already has something mounted there (checked via /proc/mounts or mount command)
+    - It already has something mounted there (checked via the OS mount table)
     - It exists and contains files (non-empty directory)
 
     Args:
@@ -157,22 +177,14 @@ def is_mount_point_available_unix(mount_point: Path) -> bool:
         return True
 
     # Check if it's a mount point (something already mounted)
+    # CHG-20261016-024: Shared OS mount table from the mount inventory
+    # (mountinfo on Linux, stat elsewhere) instead of /proc/mounts or `mount`
     try:
-        # On Linux, check /proc/mounts
-        proc_mounts = Path("/proc/mounts")
-        if proc_mounts.exists():
-            with proc_mounts.open("r") as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 2 and Path(parts[1]) == mount_point.resolve():
-                        return False  # Already a mount point
-
-        # On macOS, use mount command
-        if platform.system() == "Darwin":
-            result = subprocess.run(["mount"], capture_output=True, text=True, timeout=5)
-            for line in result.stdout.split("\n"):
-                if f" on {mount_point} " in line or f" on {mount_point.resolve()} " in line:
-                    return False  # Already a mount point
+        if get_mount_inventory is not None:
+            if get_mount_inventory().os_mounted(str(mount_point.resolve())):
+                return False  # Already a mount point
+        elif os.path.ismount(mount_point):
+            return False
     except Exception:
         pass  # If we can't check, assume it's not mounted
 
@@ -436,6 +448,9 @@ def log(msg: str) -> None:
 
 def have(cmd: str) -> bool:
     """Check if a command is available in PATH."""
+    # CHG-20261016-023: Persistent tool cache (one stat on a hit)
+    if which_tool is not None:
+        return which_tool(cmd) is not None
     return shutil.which(cmd) is not None
 
 
@@ -523,6 +538,8 @@ def load_or_init_config(script_root: Path) -> dict:
         print(f"Failed to read/parse {CONFIG_FILENAME}: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if startup_profile is not None:
+        startup_profile.mark_once(startup_profile.MILESTONE_CONFIG)
     return cfg
 
 
@@ -878,156 +895,66 @@ def check_gpg_yubikey_readiness() -> None:
     """
     Check that GPG agent is running and YubiKey is available.
     Provides clear error messages with actionable solutions.
-    """
-    import time
 
+    CHG-20261016-021: Agent start-up and liveness come from the shared
+    GpgSession (warmed at launch) instead of a process-list check, a
+    gpg-connect-agent call and a fixed 2-second sleep.
+    """
     log("Checking GPG and YubiKey readiness...")
 
-    # Check 1: GPG agent process
-    agent_running = False
-    try:
-        if platform.system().lower() == "windows":
-            # On Windows, check for gpg-agent.exe process
-            result = subprocess.run(
-                ["tasklist", "/FI", "IMAGENAME eq gpg-agent.exe", "/NH"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="ignore",
-                timeout=Limits.PROCESS_CHECK_TIMEOUT,
+    # Check 1: GPG agent answers (waits on the warm-up started at launch)
+    session = get_gpg_session()
+    if not session.agent_ready:
+        log("Waiting for GPG agent to start...")
+    agent_running = session.wait_ready(Limits.GPG_SESSION_READY_TIMEOUT)
+    if not agent_running:
+        log(f"Could not start GPG agent automatically: {session.error}")
+        if _GUI_MODE:
+            error_msg = (
+                "GPG AGENT NOT RUNNING\n\n"
+                "The GPG agent (gpg-agent.exe) is not running.\n"
+                "This is required to communicate with your YubiKey.\n\n"
+                "The script attempted to start it automatically but failed.\n\n"
+                "SOLUTIONS:\n\n"
+                "1. Start Kleopatra (GUI for GPG):\n"
+                "   - Launch Kleopatra from Start Menu\n"
+                "   - This will start the GPG agent automatically\n\n"
+                "2. Or start GPG agent manually:\n"
+                "   gpg-connect-agent /bye\n\n"
+                "3. Or restart your computer\n"
+                "   (GPG agent should start on login)\n\n"
+                "After starting the agent, try mounting again."
             )
-            agent_running = result.returncode == 0 and result.stdout and "gpg-agent.exe" in result.stdout
         else:
-            # On Unix, check for gpg-agent process
-            result = subprocess.run(
-                ["pgrep", "-f", "gpg-agent"], capture_output=True, timeout=Limits.PROCESS_CHECK_TIMEOUT
-            )
-            agent_running = result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-        pass
-
-    if not agent_running:
-        log("GPG agent not running, attempting to start it...")
-        try:
-            # Try to start the GPG agent
-            result = subprocess.run(
-                ["gpg-connect-agent", "/bye"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="ignore",
-                timeout=Limits.GPG_AGENT_START_TIMEOUT,
+            error_msg = (
+                "\n" + "=" * 70 + "\n"
+                "GPG AGENT NOT RUNNING\n" + "=" * 70 + "\n\n"
+                "The GPG agent (gpg-agent.exe) is not running.\n"
+                "This is required to communicate with your YubiKey.\n\n"
+                "The script attempted to start it automatically but failed.\n\n"
+                "SOLUTIONS:\n\n"
+                "1. Start Kleopatra (GUI for GPG):\n"
+                "   - Launch Kleopatra from Start Menu\n"
+                "   - This will start the GPG agent automatically\n\n"
+                "2. Or start GPG agent manually:\n"
+                "   gpg-connect-agent /bye\n\n"
+                "3. Or restart your computer\n"
+                "   (GPG agent should start on login)\n\n"
+                "After starting the agent, try mounting again.\n" + "=" * 70
             )
-            if result.returncode == 0:
-                log("GPG agent started successfully ✓")
-                # Wait a moment for it to initialize
-                time.sleep(2)
-                # Re-check if agent is now running
-                try:
-                    if platform.system().lower() == "windows":
-                        result = subprocess.run(
-                            ["tasklist", "/FI", "IMAGENAME eq gpg-agent.exe", "/NH"],
-                            capture_output=True,
-                            text=True,
-                            encoding="utf-8",
-                            errors="ignore",
-                            timeout=Limits.PROCESS_CHECK_TIMEOUT,
-                        )
-                        agent_running = result.returncode == 0 and result.stdout and "gpg-agent.exe" in result.stdout
-                    else:
-                        result = subprocess.run(
-                            ["pgrep", "-f", "gpg-agent"], capture_output=True, timeout=Limits.PROCESS_CHECK_TIMEOUT
-                        )
-                        agent_running = result.returncode == 0
-                except:
-                    pass
-                if agent_running:
-                    log("GPG agent is now running ✓")
-                else:
-                    log("Failed to verify GPG agent started")
-            else:
-                log("Failed to start GPG agent")
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            log("Could not start GPG agent automatically")
-
-        # If still not running, show error
-        if not agent_running:
-            if _GUI_MODE:
-                error_msg = (
-                    "GPG AGENT NOT RUNNING\n\n"
-                    "The GPG agent (gpg-agent.exe) is not running.\n"
-                    "This is required to communicate with your YubiKey.\n\n"
-                    "The script attempted to start it automatically but failed.\n\n"
-                    "SOLUTIONS:\n\n"
-                    "1. Start Kleopatra (GUI for GPG):\n"
-                    "   - Launch Kleopatra from Start Menu\n"
-                    "   - This will start the GPG agent automatically\n\n"
-                    "2. Or start GPG agent manually:\n"
-                    "   gpg-connect-agent /bye\n\n"
-                    "3. Or restart your computer\n"
-                    "   (GPG agent should start on login)\n\n"
-                    "After starting the agent, try mounting again."
-                )
-            else:
-                error_msg = (
-                    "\n" + "=" * 70 + "\n"
-                    "GPG AGENT NOT RUNNING\n" + "=" * 70 + "\n\n"
-                    "The GPG agent (gpg-agent.exe) is not running.\n"
-                    "This is required to communicate with your YubiKey.\n\n"
-                    "The script attempted to start it automatically but failed.\n\n"
-                    "SOLUTIONS:\n\n"
-                    "1. Start Kleopatra (GUI for GPG):\n"
-                    "   - Launch Kleopatra from Start Menu\n"
-                    "   - This will start the GPG agent automatically\n\n"
-                    "2. Or start GPG agent manually:\n"
-                    "   gpg-connect-agent /bye\n\n"
-                    "3. Or restart your computer\n"
-                    "   (GPG agent should start on login)\n\n"
-                    "After starting the agent, try mounting again.\n" + "=" * 70
-                )
-            raise RuntimeError(error_msg)
+        raise RuntimeError(error_msg)
 
     # Check 2: YubiKey detected by GPG
     log("GPG agent is running ✓")
     log("Checking for YubiKey...")
 
-    try:
-        # Try to list smartcards - this will fail if no YubiKey or agent issues
-        # BUG-20251218-007: --no-tty prevents gpg from waiting on TTY input
-        result = subprocess.run(
-            ["gpg", "--no-tty", "--card-status"],
-            capture_output=True,
-            text=True,
-            timeout=Limits.GPG_CARD_STATUS_TIMEOUT,  # Give it time to prompt for PIN if needed
-            encoding="utf-8",
-            errors="ignore",  # Ignore decoding errors
-        )
-
-        if result.returncode == 0:
-            # Check if output contains YubiKey/OpenPGP card info
-            output_lower = (result.stdout or "").lower()
-            if any(keyword in output_lower for keyword in ["yubikey", "openpgp", "card", "serial"]):
-                log("YubiKey detected ✓")
-                return
-            else:
-                # gpg --card-status succeeded but no card detected
-                pass
-        else:
-            # gpg --card-status failed
-            stderr_lower = (result.stderr or "").lower()
-            if "no reader found" in stderr_lower or "card not present" in stderr_lower:
-                pass  # Will be caught below
-            elif "operation cancelled" in stderr_lower or "pin" in stderr_lower:
-                # This might be expected - card is there but needs PIN
-                log("YubiKey detected (PIN required) ✓")
-                return
-            else:
-                # Other error
-                pass
-
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, UnicodeDecodeError, Exception):
-        # Command timed out, failed, or had encoding issues - likely GPG agent not ready
-        pass
+    # CHG-20261016-022: Shared card presence cache (one gpg --card-status
+    # probe, reused until a USB hotplug event)
+    card = get_card_presence().status()
+    if card.present:
+        log("YubiKey detected ✓")
+        return
+    log(f"YubiKey check failed: {card.error}")
 
     # If we get here, YubiKey is not detected
     if _GUI_MODE:
@@ -1242,7 +1169,18 @@ def create_temp_keyfile_secure(keyfile_data: bytes) -> Path:
     On Linux: tries /dev/shm (RAM-only)
     On Windows: uses regular temp with best-effort security
     Returns path to temp keyfile.
+
+    CHG-20261016-025: Linux keeps the keyfile in a sealed memfd and hands
+    VeraCrypt its /proc/<pid>/fd path; no file, no fsync.
     """
+    if create_ephemeral_keyfile is not None:
+        tmp = create_ephemeral_keyfile(keyfile_data, prefix="sd_key_")
+        if is_memfd_keyfile(tmp):
+            log("✓ Keyfile created in memory (memfd)")
+        else:
+            log(f"✓ Keyfile created in temp: {tmp.name}")
+        return tmp
+
     if os.name == "nt":
         # Windows: no native ramdisk, use regular temp
         tmp_fd, tmp_path = tempfile.mkstemp(prefix="sd_key_", suffix=".bin")
@@ -1296,7 +1234,16 @@ def create_temp_keyfile_secure(keyfile_data: bytes) -> Path:
 
 
 def cleanup_temp_keyfile(path: Path) -> None:
-    """Secure cleanup: overwrite keyfile contents before deletion."""
+    """Secure cleanup: overwrite keyfile contents before deletion.
+
+    CHG-20261016-025: memfd keyfiles are released by closing the fd; temp
+    file fallbacks get one synced overwrite, not multi-pass + `shred`.
+    """
+    if discard_ephemeral_keyfile is not None:
+        discard_ephemeral_keyfile(path)
+        log("✓ Keyfile cleaned up")
+        return
+
     if not path or not path.exists():
         return
 
@@ -2155,6 +2102,9 @@ def main(
 
     cfg = load_or_init_config(script_root)
 
+    # CHG-20261016-021: Start gpg-agent/scdaemon while the remaining checks run
+    warm_up_for_mode(cfg.get(ConfigKeys.MODE))
+
     # BUG-20251219-006: Enforce post-recovery rekey policy
     # Check if rekey is required after a recovery event
     post_recovery = cfg.get("post_recovery", {})
@@ -2237,6 +2187,10 @@ def main(
         else:
             log("Mode: Plain keyfile")
 
+    # CHG-20261016-017: --profile-startup ends before any credential is touched
+    if startup_profile is not None:
+        startup_profile.finish("credentials_prompt")
+
     # Get VeraCrypt password
     if mode == SecurityMode.GPG_PW_ONLY.value:
         # Derive password from GPG-encrypted seed
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+SmartDrive mount service - persistent mount/unmount engine.
+
+CHG-20261016-015: The GUI used to start a fresh interpreter running mount.py /
+unmount.py for every operation (password passed with --password on argv),
+and the CLI menu did the same. Each run paid interpreter startup and
+re-imported core/* from the USB stick before VeraCrypt was even invoked.
+
+- execute(): runs a MountRequest in the current process with mount.py /
+  unmount.py imported once (the CLI menu calls this directly, interactive).
+- MountServiceClient: a long-lived worker process (this file with --serve)
+  that the GUI talks to with one JSON line per request over stdin/stdout.
+  Mounting still happens outside the GUI process, but the password travels
+  over the pipe - never on argv or in the environment - and the interpreter
+  and imports are paid once per session. The worker exits when the pipe
+  closes (GUI exit), and is restarted before the next request once an
+  update has replaced the scripts or core modules it imported.
+
+Usage:
+    from mount_service import MountRequest, OP_MOUNT, get_service
+
+    response = get_service(script_dir).call(MountRequest(OP_MOUNT, config_path=cfg, password=pw))
+    if not response.ok:
+        print(response.error)
+"""
+
+import atexit
+import contextlib
+import io
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Operations
+OP_MOUNT = "mount"
+OP_UNMOUNT = "unmount"
+OP_PING = "ping"
+
+# Response exit code for a worker that crashed mid-request
+EXIT_WORKER_DIED = -1
+
+
+@dataclass(frozen=True)
+class MountRequest:
+    """One mount/unmount operation."""
+
+    op: str
+    config_path: Optional[str] = None  # config.json (remote mode); None = config next to the scripts
+    password: Optional[str] = field(default=None, repr=False)  # None = prompt (CLI) / GPG-derived
+    keyfiles: Tuple[str, ...] = ()
+    gui: bool = True  # Suppress interactive prompts
+
+
+@dataclass(frozen=True)
+class MountResponse:
+    """Outcome of a MountRequest."""
+
+    ok: bool
+    exit_code: int = 0
+    error: str = ""  # Short message for the user (last line of a traceback, stderr, ...)
+    output: str = ""  # Captured stdout/stderr (worker mode only)
+
+
+# ============================================================
+# In-process engine
+# ============================================================
+
+
+def _error_from_output(text: str) -> str:
+    """Main error line of script output (the exception line of a traceback)."""
+    text = text.strip()
+    if "Traceback" in text:
+        for line in reversed(text.split("\n")):
+            if line.strip() and not line.startswith(" "):
+                return line.strip()
+    return text
+
+
+def _run_mount(request: MountRequest, config_path: Optional[Path]) -> None:
+    import mount
+
+    mount.main(
+        password=request.password,
+        keyfile_paths=list(request.keyfiles),
+        gui_mode=request.gui,
+        config_path=config_path,
+    )
+
+
+def _run_unmount(request: MountRequest, config_path: Optional[Path]) -> None:
+    import unmount
+
+    argv = [unmount.__file__]
+    if request.gui:
+        argv.append("--gui")
+    if config_path:
+        argv.extend(["--config", str(config_path)])
+    saved_argv = sys.argv
+    sys.argv = argv
+    try:
+        unmount.main()
+    finally:
+        sys.argv = saved_argv
+
+
+_HANDLERS = {OP_MOUNT: _run_mount, OP_UNMOUNT: _run_unmount}
+
+
+def execute(request: MountRequest, capture: bool = False) -> MountResponse:
+    """
+    Run a request in this process.
+
+    mount.py / unmount.py are imported on first use and stay loaded.
+    sys.exit() inside the scripts ends the request, not the process.
+
+    Args:
+        request: Operation to run
+        capture: Capture stdout/stderr into the response (worker mode);
+                 otherwise output goes to the console (CLI mode)
+
+    Raises:
+        KeyboardInterrupt: Propagated from interactive prompts
+    """
+    if request.op == OP_PING:
+        return MountResponse(ok=True)
+    handler = _HANDLERS.get(request.op)
+    if handler is None:
+        return MountResponse(ok=False, exit_code=2, error=f"Unknown operation: {request.op}")
+
+    config_path = None
+    if request.config_path:
+        config_path = Path(request.config_path).resolve()
+        if not config_path.exists():
+            return MountResponse(ok=False, exit_code=1, error=f"Config file not found: {config_path}")
+
+    buffer = io.StringIO()
+    redirect = contextlib.ExitStack()
+    if capture:
+        redirect.enter_context(contextlib.redirect_stdout(buffer))
+        redirect.enter_context(contextlib.redirect_stderr(buffer))
+
+    exit_code = 0
+    error = ""
+    with redirect:
+        try:
+            handler(request, config_path)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except KeyboardInterrupt:
+            if not capture:
+                raise
+            exit_code, error = 1, "Aborted by user."
+        except Exception as e:
+            exit_code, error = 1, f"{type(e).__name__}: {e}"
+            if not capture:
+                print(f"[ERROR] {e}", file=sys.stderr)
+
+    output = buffer.getvalue()
+    if exit_code and not error:
+        error = _error_from_output(output) or "Unknown error"
+    return MountResponse(ok=exit_code == 0, exit_code=exit_code, error=error, output=output)
+
+
+# ============================================================
+# Worker process
+# ============================================================
+
+
+def serve(scripts_dir: Path) -> None:
+    """
+    Worker loop: one JSON request per stdin line, one JSON response per stdout line.
+
+    The protocol pipes are moved off fds 0/1 first, so prompts (input()) and
+    child processes (gpg, veracrypt) can never read the request channel or
+    write into the response channel.
+    """
+    scripts_dir = Path(scripts_dir).resolve()
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+
+    requests_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    responses_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    sys.stdin = open(os.devnull, "r")
+    sys.stdout = open(os.devnull, "w")
+
+    for line in requests_in:
+        try:
+            data = json.loads(line)
+            data["keyfiles"] = tuple(data.get("keyfiles") or ())
+            request = MountRequest(**data)
+        except (ValueError, TypeError) as e:
+            response = MountResponse(ok=False, exit_code=2, error=f"Bad request: {e}")
+        else:
+            response = execute(request, capture=True)
+            del request, data, line  # Drop the password references
+        responses_out.write(json.dumps(asdict(response)) + "\n")
+        responses_out.flush()
+
+
+class MountServiceClient:
+    """
+    Client of one worker process bound to a scripts directory.
+
+    The worker is started on first use and restarted if it died or if the
+    code it runs changed on disk (update.py overwrites scripts/ and core/ in
+    place). Requests are serialized.
+    """
+
+    def __init__(self, scripts_dir: Path, python_exe: Optional[str] = None):
+        self.scripts_dir = Path(scripts_dir)
+        self.python_exe = str(python_exe or sys.executable)
+        self._proc: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._code_signature: Optional[tuple] = None
+
+    def _code_dirs(self) -> Tuple[Path, ...]:
+        """Directories whose modules the worker imports (scripts/ and core/)."""
+        return (self.scripts_dir, self.scripts_dir.parent / "core")
+
+    def _read_code_signature(self) -> tuple:
+        """
+        Stat signature of the worker's Python sources.
+
+        ctime is included: update.py copies files with shutil.copy2, which
+        preserves the release's mtime, but every overwrite changes ctime.
+        """
+        signature = []
+        for directory in self._code_dirs():
+            try:
+                entries = sorted(os.scandir(directory), key=lambda e: e.name)
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.name.endswith(".py"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                signature.append((str(directory), entry.name, st.st_size, st.st_mtime_ns, st.st_ctime_ns))
+        return tuple(signature)
+
+    def _start(self) -> None:
+        self._code_signature = self._read_code_signature()
+        cmd = [self.python_exe, str(Path(__file__).resolve()), "--serve", "--scripts", str(self.scripts_dir)]
+        # BUG-20251222-001: Use getattr for CREATE_NO_WINDOW (Windows-only flag)
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.scripts_dir,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        self._responses = queue.Queue()
+        threading.Thread(
+            target=self._read_responses, args=(self._proc, self._responses), name="mount-service", daemon=True
+        ).start()
+
+    @staticmethod
+    def _read_responses(proc: subprocess.Popen, responses: "queue.Queue[Optional[str]]") -> None:
+        for line in proc.stdout:
+            responses.put(line)
+        responses.put(None)  # Worker exited
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def call(self, request: MountRequest, timeout: Optional[float] = None) -> MountResponse:
+        """
+        Send a request and wait for its response.
+
+        Raises:
+            subprocess.TimeoutExpired: No response within timeout (worker is killed)
+        """
+        with self._lock:
+            if self.alive() and self._read_code_signature() != self._code_signature:
+                self.close()  # Code was updated; never serve requests with stale modules
+            if not self.alive():
+                self._start()
+            payload = asdict(request)
+            payload["keyfiles"] = list(request.keyfiles)
+            try:
+                self._proc.stdin.write(json.dumps(payload) + "\n")
+                self._proc.stdin.flush()
+            except OSError:
+                self.close()
+                return MountResponse(ok=False, exit_code=EXIT_WORKER_DIED, error="Mount service is not running")
+            finally:
+                del payload
+
+            try:
+                line = self._responses.get(timeout=timeout)
+            except queue.Empty:
+                self.close()
+                raise subprocess.TimeoutExpired(request.op, timeout)
+            if line is None:
+                self.close()
+                return MountResponse(ok=False, exit_code=EXIT_WORKER_DIED, error="Mount service exited unexpectedly")
+            return MountResponse(**json.loads(line))
+
+    def close(self) -> None:
+        """Stop the worker (closing stdin ends its loop; killed if it does not exit)."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+
+_services: Dict[Tuple[str, str], MountServiceClient] = {}
+_services_lock = threading.Lock()
+
+
+def get_service(scripts_dir: Path, python_exe: Optional[str] = None) -> MountServiceClient:
+    """Shared client for a scripts directory (local drive or remote .smartdrive/scripts)."""
+    key = (str(Path(scripts_dir).resolve()), str(python_exe or sys.executable))
+    with _services_lock:
+        client = _services.get(key)
+        if client is None:
+            client = _services[key] = MountServiceClient(scripts_dir, python_exe)
+        return client
+
+
+@atexit.register
+def shutdown_services() -> None:
+    """Stop all workers started by this process."""
+    with _services_lock:
+        for client in _services.values():
+            client.close()
+        _services.clear()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SmartDrive mount service worker")
+    parser.add_argument("--serve", action="store_true", help="Serve requests on stdin/stdout")
+    parser.add_argument("--scripts", type=Path, default=Path(__file__).resolve().parent, help="Scripts directory")
+    args = parser.parse_args()
+    if not args.serve:
+        parser.error("--serve is required")
+    serve(args.scripts)
@@ -80,6 +80,7 @@ try:
     from core.modes import RecoveryOutcome, SecurityMode
     from core.paths import Paths
     from core.qr_chain import DataType, chunks_to_qr_data_urls, encode_chunks, encode_config_snapshot
+    from core.tool_cache import get_tool_cache
     from core.version import VERSION
 except ImportError as e:
     # MANDATORY: Abort with clear error - NO FALLBACKS
@@ -274,6 +275,7 @@ from veracrypt_cli import (
     VeraCryptError,
     export_header,
     get_mount_status,
+    get_veracrypt_exe,
     have_veracrypt,
     restore_header,
     try_mount,
@@ -839,24 +841,24 @@ def get_veracrypt_version() -> Tuple[Optional[str], Optional[str]]:
     Per AGENT_ARCHITECTURE.md: No "unknown" placeholders.
     Returns (version, None) on success, (None, error_reason) on failure.
     """
-    import shutil
-
-    # First check if VeraCrypt is available
-    vc_path = shutil.which("veracrypt")
+    # First check if VeraCrypt is available (CHG-20261016-023: tool cache)
+    vc_path = get_veracrypt_exe()
     if not vc_path:
-        # Try Windows standard path via SSOT
-        try:
-            from core.paths import Paths
+        return None, "VeraCrypt not installed (not found in PATH or standard locations)"
 
-            vc_path = Paths.veracrypt_exe()
-            if vc_path and not vc_path.exists():
-                vc_path = None
-        except ImportError:
-            pass
+    tool_cache = get_tool_cache()
+    cached = tool_cache.get_data(vc_path, "version")
+    if cached:
+        return cached, None
+
+    version, error = _probe_veracrypt_version(vc_path)
+    if version:
+        tool_cache.set_data(vc_path, "version", version)
+    return version, error
 
-    if not vc_path:
-        return None, "VeraCrypt not installed (not found in PATH or standard locations)"
 
+def _probe_veracrypt_version(vc_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Ask a VeraCrypt executable for its version (subprocess / file metadata)."""
     # Try to get version
     try:
         vc_exe = str(vc_path) if hasattr(vc_path, "__str__") else vc_path
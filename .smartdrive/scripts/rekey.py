@@ -68,6 +68,7 @@ if str(_project_root) not in sys.path:
 
 from core.config import write_config_atomic
 from core.constants import Branding, ConfigKeys, CryptoParams, FileNames, UserInputs
+from core.ephemeral_keyfile import create_ephemeral_keyfile, discard_ephemeral_keyfile
 from core.limits import Limits
 from core.modes import SECURITY_MODE_DISPLAY, SecurityMode
 from core.paths import Paths
@@ -92,20 +93,6 @@ except ImportError:
         SecretProvider = None  # type: ignore
 
 
-def get_ram_temp_dir():
-    """Get a RAM-backed temp directory if available, else system temp."""
-    if platform.system() == "Linux":
-        ram_dir = Path("/dev/shm")
-        if ram_dir.exists() and os.access(ram_dir, os.W_OK):
-            return ram_dir
-    elif platform.system() == "Darwin":  # macOS
-        ram_dir = Path("/tmp")
-        if ram_dir.exists() and os.access(ram_dir, os.W_OK):
-            return ram_dir
-    # Windows or fallback
-    return Path(tempfile.gettempdir())
-
-
 def log(msg: str) -> None:
     print(f"[INFO] {msg}")
 
@@ -642,51 +629,19 @@ def decrypt_old_keyfile(enc_keyfile_path: Path) -> bytes:
 
 
 def write_temp_keyfile(keyfile_data: bytes) -> Path:
-    """Write keyfile data to temporary file in RAM-backed directory."""
-    ram_temp_dir = get_ram_temp_dir()
-    tmp_path = ram_temp_dir / f"sd_rekey_{os.urandom(8).hex()}.bin"
+    """Write keyfile data to temporary file in RAM-backed directory.
 
-    try:
-        with tmp_path.open("wb") as f:
-            f.write(keyfile_data)
-            f.flush()
-            os.fsync(f.fileno())
-        return tmp_path
-    except Exception:
-        try:
-            tmp_path.unlink(missing_ok=True)
-        except:
-            pass
-        raise
+    CHG-20261016-025: A sealed memfd on Linux (see core/ephemeral_keyfile.py).
+    """
+    return create_ephemeral_keyfile(keyfile_data, prefix="sd_rekey_")
 
 
 def secure_delete_file(path: Path) -> None:
-    """Securely delete a file by overwriting before removal."""
-    if not path or not path.exists():
-        return
+    """Securely delete a file by overwriting before removal.
 
-    try:
-        file_size = path.stat().st_size
-
-        if file_size > 0:
-            with path.open("r+b") as f:
-                f.write(b"\x00" * file_size)
-                f.flush()
-                os.fsync(f.fileno())
-                f.seek(0)
-                f.write(os.urandom(file_size))
-                f.flush()
-                os.fsync(f.fileno())
-
-        if os.name != "nt" and have("shred"):
-            subprocess.run(["shred", "-u", "-n", "1", str(path)], check=False, capture_output=True)
-        else:
-            path.unlink(missing_ok=True)
-    except Exception:
-        try:
-            path.unlink(missing_ok=True)
-        except:
-            pass
+    CHG-20261016-025: Closes memfd keyfiles; temp files get one synced overwrite.
+    """
+    discard_ephemeral_keyfile(path)
 
 
 def change_veracrypt_credentials_windows(
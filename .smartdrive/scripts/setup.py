@@ -63,10 +63,12 @@ else:
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+from core.card_presence import get_card_presence
 from core.config import write_config_atomic
 
 # Import configuration constants (legacy - for file names)
 from core.constants import Branding, ConfigKeys, CryptoParams, Defaults, FileNames, Prompts, UserInputs
+from core.ephemeral_keyfile import create_ephemeral_keyfile, discard_ephemeral_keyfile
 from core.filesystems import FS, launcher_fs_spec
 from core.limits import Limits
 from core.modes import _SECRETS_AVAILABLE  # Module-level flag (not Enum attribute)
@@ -1105,53 +1107,12 @@ def get_inserted_card_identity() -> CardIdentity | None:
     Returns None if no card is inserted or parsing fails.
 
     BUG-20251218-007 FIX: Add --no-tty to prevent terminal hang on repeated calls.
+    CHG-20261016-022: Parsed once by the shared card presence cache.
     """
-    try:
-        result = subprocess.run(
-            ["gpg", "--no-tty", "--with-colons", "--card-status"],
-            capture_output=True,
-            text=True,
-            timeout=Limits.GPG_CARD_STATUS_TIMEOUT,
-        )
-
-        if result.returncode != 0:
-            return None
-
-        serial = None
-        fingerprints = []  # Will collect [sig_fpr, enc_fpr, auth_fpr] in order
-
-        for line in result.stdout.split("\n"):
-            parts = line.split(":")
-            if not parts:
-                continue
-
-            record_type = parts[0]
-
-            # serial:34397658:
-            if record_type == "serial" and len(parts) > 1:
-                serial = parts[1].strip()
-
-            # fpr:SIG_FPR:ENC_FPR:AUTH_FPR:
-            # The fingerprints are colon-separated after "fpr:"
-            elif record_type == "fpr" and len(parts) > 1:
-                # Collect all non-empty fingerprint fields
-                for i in range(1, min(4, len(parts))):
-                    fpr = parts[i].strip().upper()
-                    if fpr and len(fpr) >= 32:  # Valid fingerprint
-                        fingerprints.append(fpr)
-
-        # Assign fingerprints: order is sig, enc, auth
-        sig_fpr = fingerprints[0] if len(fingerprints) > 0 else None
-        enc_fpr = fingerprints[1] if len(fingerprints) > 1 else None
-        auth_fpr = fingerprints[2] if len(fingerprints) > 2 else None
-
-        if not serial and not enc_fpr:
-            return None
-
-        return CardIdentity(serial=serial, enc_fpr=enc_fpr, sig_fpr=sig_fpr, auth_fpr=auth_fpr)
-    except Exception as e:
-        log(f"[DEBUG] get_inserted_card_identity failed: {e}")
+    status = get_card_presence().status()
+    if not status.present or (not status.serial and not status.enc_fpr):
         return None
+    return CardIdentity(serial=status.serial, enc_fpr=status.enc_fpr, sig_fpr=status.sig_fpr, auth_fpr=status.auth_fpr)
 
 
 def get_inserted_card_fingerprint() -> str | None:
@@ -1176,16 +1137,10 @@ def detect_yubikey() -> bool:
     Returns True if YubiKey is detected, False otherwise.
 
     BUG-20251218-007 FIX: Add --no-tty to prevent terminal hang on repeated calls.
+    CHG-20261016-022: Answered from the shared card presence cache.
     """
-    try:
-        # Try gpg --card-status which requires YubiKey presence
-        # BUG-20251218-007: --no-tty prevents gpg from waiting on TTY input
-        result = subprocess.run(
-            ["gpg", "--no-tty", "--card-status"], capture_output=True, text=True, timeout=Limits.GPG_CARD_STATUS_TIMEOUT
-        )
-        return result.returncode == 0 and "serial number" in result.stdout.lower()
-    except Exception:
-        return False
+    status = get_card_presence().status()
+    return status.present and bool(status.serial)
 
 
 def detect_yubikey_with_fingerprint(
@@ -5604,10 +5559,11 @@ def run_phase_6_veracrypt_creation(state: PagedSetupState) -> tuple:
             if password != password_confirm:
                 raise RuntimeError("Passwords do not match")
 
-            tmp_keyfile = get_ram_temp_dir() / f"{FileNames.TMP_FILE_PREFIX}setup_keyfile_{os.urandom(4).hex()}.key"
-            tmp_keyfile.write_bytes(os.urandom(64))
+            # CHG-20261016-025: Sealed memfd on Linux, RAM temp file elsewhere
+            keyfile_bytes = os.urandom(64)
+            tmp_keyfile = create_ephemeral_keyfile(keyfile_bytes, prefix=f"{FileNames.TMP_FILE_PREFIX}setup_keyfile_")
             # Capture keyfile bytes for recovery kit generation (no re-auth)
-            state.keyfile_bytes = tmp_keyfile.read_bytes()
+            state.keyfile_bytes = keyfile_bytes
 
             tmp_encrypted = get_ram_temp_dir() / f"{FileNames.TMP_FILE_PREFIX}setup_keyfile_{os.urandom(4).hex()}.gpg"
             gpg_args = ["gpg", "--encrypt", "--armor", "--output", str(tmp_encrypted)]
@@ -5630,10 +5586,11 @@ def run_phase_6_veracrypt_creation(state: PagedSetupState) -> tuple:
             if password != password_confirm:
                 raise RuntimeError("Passwords do not match")
 
-            tmp_keyfile = get_ram_temp_dir() / f"{FileNames.TMP_FILE_PREFIX}setup_keyfile_{os.urandom(4).hex()}.key"
-            tmp_keyfile.write_bytes(os.urandom(64))
+            # CHG-20261016-025: Sealed memfd on Linux, RAM temp file elsewhere
+            keyfile_bytes = os.urandom(64)
+            tmp_keyfile = create_ephemeral_keyfile(keyfile_bytes, prefix=f"{FileNames.TMP_FILE_PREFIX}setup_keyfile_")
             # Capture keyfile bytes for recovery kit generation (no re-auth)
-            state.keyfile_bytes = tmp_keyfile.read_bytes()
+            state.keyfile_bytes = keyfile_bytes
             state.tmp_keyfile = tmp_keyfile
 
         # Handle GPG password-only mode
@@ -5731,8 +5688,8 @@ def run_phase_6_veracrypt_creation(state: PagedSetupState) -> tuple:
     except Exception as e:
         error(f"\n[X] Volume creation failed: {e}")
         # Clean up temp files
-        if tmp_keyfile and tmp_keyfile.exists():
-            tmp_keyfile.unlink()
+        if tmp_keyfile:
+            discard_ephemeral_keyfile(tmp_keyfile)
         if tmp_encrypted and tmp_encrypted.exists():
             tmp_encrypted.unlink()
         return False, "Q"
@@ -5852,8 +5809,8 @@ def run_phase_7_deployment(state: PagedSetupState, *, auto_nav: bool = False) ->
 
         # Clean up temporary files
         print("[Deployment] Cleaning up temporary files...")
-        if tmp_keyfile and tmp_keyfile.exists():
-            tmp_keyfile.unlink()
+        if tmp_keyfile:
+            discard_ephemeral_keyfile(tmp_keyfile)
             print("  [OK] Removed temp keyfile")
         if tmp_encrypted and tmp_encrypted.exists():
             tmp_encrypted.unlink()
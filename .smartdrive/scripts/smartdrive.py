@@ -48,13 +48,33 @@ else:
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+# CHG-20261016-017: --profile-startup times every import from here on
+if __name__ == "__main__":
+    try:
+        from core.startup_profile import enable_from_argv
+
+        enable_from_argv("cli", _project_root)
+    except ImportError:
+        pass
+
+# CHG-20261016-016: Use the verified precompiled bytecode bundle when present
+if _script_dir.parent.name == ".smartdrive":
+    try:
+        from core.bytecode import install_bundle
+
+        install_bundle(_deploy_root)
+    except Exception:
+        pass  # Normal imports from source
+
 try:
     from core.config import write_config_atomic, write_file_atomic
     from core.constants import CLIOperations, ConfigKeys, ConsoleStyle, Defaults, FileNames
+    from core.gpg_session import warm_up_for_config
     from core.limits import Limits
     from core.modes import SECURITY_MODE_DISPLAY, SecurityMode
     from core.paths import Paths
     from core.platform import _set_admin_override, is_admin
+    from core.startup_profile import finish as finish_startup_profile
     from core.version import VERSION
 
     _HAS_ATOMIC_WRITE = True
@@ -62,6 +82,8 @@ except ImportError:
     # Fallback for standalone operation - VERSION imported above
     _HAS_ATOMIC_WRITE = False
     write_file_atomic = None
+    finish_startup_profile = None
+    warm_up_for_config = None
 
     class ConfigKeys:
         MODE = "mode"
@@ -685,36 +707,17 @@ def check_mount_status() -> bool:
     """
     Check if the volume is currently mounted.
     Returns True if mounted, False if not, None if unknown.
+
+    CHG-20261016-001: Uses the shared MountMonitor (kernel mount table on Linux,
+    stat/drive-letter probes elsewhere) instead of spawning `mountpoint`.
     """
     if not CONFIG_FILE.exists():
         return None
 
     try:
-        import json
+        from core.mount_monitor import get_mount_monitor
 
-        with open(CONFIG_FILE, "r") as f:
-            cfg = json.load(f)
-
-        system = platform.system().lower()
-
-        if system == "windows":
-            mount_letter = (cfg.get(ConfigKeys.WINDOWS) or {}).get(ConfigKeys.MOUNT_LETTER, "V")
-            drive_path = Path(f"{mount_letter}:/")
-            return drive_path.exists() and drive_path.is_dir()
-        else:
-            mount_point = (cfg.get(ConfigKeys.UNIX) or {}).get(ConfigKeys.MOUNT_POINT, "")
-            if mount_point:
-                mount_path = Path(mount_point).expanduser()
-                # Check if something is mounted there
-                if mount_path.exists():
-                    # On Unix, check if it's a mount point
-                    try:
-                        result = subprocess.run(["mountpoint", "-q", str(mount_path)], capture_output=True)
-                        return result.returncode == 0
-                    except FileNotFoundError:
-                        # mountpoint command not available, check if dir has content
-                        return any(mount_path.iterdir())
-            return False
+        return get_mount_monitor(CONFIG_FILE).is_mounted()
     except Exception:
         return None
 
@@ -766,7 +769,16 @@ def run_script(script_name: str, args: list = None):
     print(divider * 70 + "\n")
 
     try:
-        result = subprocess.run(cmd)
+        if script_name in (FileNames.MOUNT_PY, FileNames.UNMOUNT_PY):
+            # CHG-20261016-015: Mount/unmount run in-process (mount.py/unmount.py
+            # imported once per session instead of a new interpreter per action)
+            from mount_service import OP_MOUNT, OP_UNMOUNT, MountRequest, execute
+
+            op = OP_MOUNT if script_name == FileNames.MOUNT_PY else OP_UNMOUNT
+            request = MountRequest(op, config_path=str(CONFIG_FILE), gui=False)
+            result = subprocess.CompletedProcess(cmd, execute(request).exit_code)
+        else:
+            result = subprocess.run(cmd)
         print("\n" + divider * 70)
         if result.returncode == 0:
             print(f"{success} {script_name} completed successfully")
@@ -1327,9 +1339,20 @@ def have_gpg() -> bool:
     return shutil.which("gpg") is not None
 
 
-def calculate_scripts_hash() -> str:
-    """Calculate SHA256 hash of all script files."""
-    hash_obj = hashlib.sha256()
+# CHG-20261016-002: --paranoid disables the integrity digest index (full re-read)
+PARANOID_INTEGRITY = False
+
+
+def calculate_scripts_hash(paranoid: bool = None) -> str:
+    """Calculate SHA256 hash of all script files.
+
+    CHG-20261016-002: Uses the incremental digest index in the integrity dir,
+    so unchanged scripts are not re-read from the drive. The digest is
+    identical to a full read; pass paranoid=True (or run with --paranoid)
+    to force one.
+    """
+    if paranoid is None:
+        paranoid = PARANOID_INTEGRITY
 
     # List of scripts to hash (in consistent order)
     # Only include scripts that are deployed to SMARTDRIVE partition
@@ -1338,13 +1361,22 @@ def calculate_scripts_hash() -> str:
         [FileNames.KEYDRIVE_PY, FileNames.MOUNT_PY, FileNames.UNMOUNT_PY, FileNames.REKEY_PY, FileNames.KEYFILE_PY]
     )
 
+    try:
+        from core.integrity import Integrity
+
+        index_file = INTEGRITY_DIR / Integrity.INDEX_FILE if INTEGRITY_DIR.is_dir() else None
+        return Integrity.hash_files(SCRIPT_DIR, scripts, index_file=index_file, paranoid=paranoid)
+    except ImportError:
+        pass
+
+    hash_obj = hashlib.sha256()
     for script_name in scripts:
         script_path = SCRIPT_DIR / script_name
         if script_path.exists():
-            # Include filename in hash to detect renames
-            hash_obj.update(script_name.encode("utf-8"))
             with open(script_path, "rb") as f:
-                hash_obj.update(f.read())
+                digest = hashlib.sha256(f.read()).digest()
+            # Same scheme as Integrity.hash_files: filename (detects renames) + content digest
+            hash_obj.update(script_name.encode("utf-8") + b"\0" + digest)
 
     return hash_obj.hexdigest()
 
@@ -1468,41 +1500,19 @@ def generate_challenge_hash():
 
 
 def hash_directory_with_salt(dir_path: Path) -> str:
-    """Hash an entire directory recursively, including all files."""
-    hash_obj = hashlib.sha256()
-
-    # Get all files in sorted order for consistent hashing
-    all_files = []
-    for root, dirs, files in os.walk(dir_path):
-        # Skip certain directories
-        dirs[:] = [d for d in dirs if d not in ["__pycache__", ".git"]]
-        for file in files:
-            # Skip temporary files and certain extensions
-            if not file.startswith(".") or file == ".challenge_salt":
-                all_files.append(str(Path(root) / file))
-
-    all_files.sort()
+    """Hash an entire directory recursively, including all files.
 
-    for file_path in all_files:
-        # Include relative path in hash to detect file moves
-        rel_path = os.path.relpath(file_path, dir_path)
-        hash_obj.update(rel_path.encode("utf-8"))
-        hash_obj.update(b"\x00")  # Separator
-
-        try:
-            with open(file_path, "rb") as f:
-                while True:
-                    chunk = f.read(8192)
-                    if not chunk:
-                        break
-                    hash_obj.update(chunk)
-        except (OSError, IOError) as e:
-            # Skip files that can't be read
-            hash_obj.update(f"[ERROR: {e}]".encode("utf-8"))
+    Dotfiles are skipped except the .challenge_salt written for the challenge.
+    CHG-20261016-003: Uses the shared parallel hasher in compat mode, which
+    produces the same digest as the former single-threaded implementation.
+    """
+    from core.hashing import MODE_COMPAT, hash_directory
 
-        hash_obj.update(b"\x00")  # File separator
+    def _include(name: str) -> bool:
+        # Skip temporary files and certain extensions
+        return not name.startswith(".") or name == ".challenge_salt"
 
-    return hash_obj.hexdigest()
+    return hash_directory(dir_path, mode=MODE_COMPAT, file_filter=_include)
 
 
 def get_hash_file_path() -> Path:
@@ -1725,9 +1735,9 @@ def sign_scripts():
         input("\n  Press Enter to continue...")
         return
 
-    # Step 1: Calculate and save hash (atomically)
+    # Step 1: Calculate and save hash (atomically) - signing always re-reads every file
     print("\n  Step 1: Calculating hash...")
-    current_hash = calculate_scripts_hash()
+    current_hash = calculate_scripts_hash(paranoid=True)
     hash_content = f"{current_hash}  scripts\n"
 
     try:
@@ -1997,6 +2007,16 @@ def main_menu_unified():
             "help",
         ]
 
+    # CHG-20261016-001: Watch the mount table in the background so each menu
+    # redraw reads the cached state (mount/unmount run as child processes)
+    if CONFIG_FILE.exists():
+        try:
+            from core.mount_monitor import get_mount_monitor
+
+            get_mount_monitor(CONFIG_FILE).start()
+        except Exception:
+            pass
+
     while True:
         clear_screen()
         is_mounted = check_mount_status()
@@ -2005,6 +2025,9 @@ def main_menu_unified():
         print_unified_menu(admin_status, style)
 
         max_option = len(menu_order)
+        # CHG-20261016-017: --profile-startup ends when the first menu is on screen
+        if finish_startup_profile is not None:
+            finish_startup_profile("first_menu")
         choice = input(f"\n  Select option [0-{max_option}]: ").strip()
 
         if choice == "0":
@@ -2079,8 +2102,16 @@ def main():
     parser.add_argument(
         "--config", "-c", type=Path, metavar="PATH", help="Absolute path to config.json (propagated from caller)"
     )
+    parser.add_argument(
+        "--paranoid",
+        action="store_true",
+        help="Re-hash every script during integrity checks instead of using the digest index",
+    )
     args = parser.parse_args()
 
+    global PARANOID_INTEGRITY
+    PARANOID_INTEGRITY = args.paranoid
+
     # Override global CONFIG_FILE if --config provided
     global CONFIG_FILE
     if args.config:
@@ -2095,6 +2126,10 @@ def main():
     # Initialize CLI i18n - load language from config
     init_cli_i18n(CONFIG_FILE)
 
+    # CHG-20261016-021: Warm gpg-agent/scdaemon while the menu is shown
+    if warm_up_for_config is not None:
+        warm_up_for_config(CONFIG_FILE)
+
     try:
         # Context is used for path resolution only, NOT for menu selection
         _ = detect_context()  # Sets up paths
@@ -50,10 +50,12 @@ try:
     from core.paths import Paths
     from core.platform import is_windows as _is_windows
     from core.platform import windows_refresh_explorer, windows_set_attributes
+    from core.tool_cache import which_tool
 
     CONFIG_FILENAME = FileNames.CONFIG_JSON
 except ImportError:
     CONFIG_FILENAME = "config.json"
+    which_tool = None
 
     class Defaults:
         WINDOWS_MOUNT_LETTER = "V"
@@ -69,6 +71,9 @@ def error(msg: str) -> None:
 
 def have(cmd: str) -> bool:
     """Check if a command is available in PATH."""
+    # CHG-20261016-023: Persistent tool cache (one stat on a hit)
+    if which_tool is not None:
+        return which_tool(cmd) is not None
     return shutil.which(cmd) is not None
 
 
@@ -16,7 +16,6 @@ Usage:
 """
 
 import argparse
-import filecmp
 import json
 import os
 import shutil
@@ -24,7 +23,7 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Set
 
 # =============================================================================
 # Core module imports - SINGLE SOURCE OF TRUTH
@@ -52,6 +51,7 @@ try:
     from core.paths import Paths
     from core.platform import is_windows as _is_windows
     from core.platform import windows_create_shortcut, windows_refresh_explorer, windows_set_attributes
+    from core.sync import ACTION_COPY, ACTION_DELETE, ACTION_SKIP, ACTION_UPDATE, SyncPlan, apply_sync, plan_sync
     from core.version import VERSION as CURRENT_VERSION
 except ImportError:
     CURRENT_VERSION = "1.0.0"  # Fallback for when core not available (bootstrap scenario)
@@ -96,6 +96,9 @@ FILES_TO_UPDATE = FileNames.FILES_TO_UPDATE
 # Note: config.json user data is protected, but version metadata is updated
 PROTECTED = FileNames.FILES_PROTECTED_FROM_UPDATE
 
+# CHG-20261016-011: Source trees mirrored whole into .smartdrive/ (orphans are removed)
+MIRRORED_TREES = ("core", Paths.LOCALES_SUBDIR, Paths.STATIC_SUBDIR, "tests")
+
 
 # =============================================================================
 # CHG-20251221-004: Deployment filtering
@@ -512,62 +515,95 @@ def get_files_to_update() -> List[Path]:
     return files
 
 
-def preview_update(target_drive: str, dry_run: bool = True) -> List[tuple]:
-    """Preview what will be updated."""
-    target_path = Path(f"{target_drive}:\\")
-    target_scripts = target_path / Paths.SMARTDRIVE_DIR_NAME / Paths.SCRIPTS_SUBDIR
-    target_docs = target_path / Paths.SMARTDRIVE_DIR_NAME / "docs"
-
-    changes = []
-    files_to_update = get_files_to_update()
-
-    for src in files_to_update:
-        if src.parent == DEV_ROOT and src.name in {
-            FileNames.README,
-            FileNames.GUI_README,
-            FileNames.README_PDF,
-            FileNames.GUI_README_PDF,
-        }:
+def get_update_sources() -> Dict[str, Path]:
+    """
+    Map every file an update installs to its source.
+
+    CHG-20261016-011: Single list feeding the sync plan (preview and apply).
+
+    Returns:
+        Path relative to .smartdrive/ (POSIX) -> source file
+    """
+    docs = {
+        FileNames.README,
+        FileNames.GUI_README,
+        FileNames.README_PDF,
+        FileNames.GUI_README_PDF,
+    }
+    sources = {}
+
+    for src in get_files_to_update():
+        if src.parent == DEV_ROOT and src.name in docs:
             # Documentation goes under .smartdrive/docs/
-            dst = target_docs / src.name
+            sources[f"docs/{src.name}"] = src
         elif src.name == "constants.py" and src.parent == DEV_ROOT:
             # constants.py goes to scripts directory
-            dst = target_scripts / FileNames.CONSTANTS_PY
+            sources[f"{Paths.SCRIPTS_SUBDIR}/{FileNames.CONSTANTS_PY}"] = src
         elif src.name == FileNames.VARIABLES_PY and src.parent == DEV_ROOT:
             # variables.py goes to scripts directory
-            dst = target_scripts / FileNames.VARIABLES_PY
+            sources[f"{Paths.SCRIPTS_SUBDIR}/{FileNames.VARIABLES_PY}"] = src
         else:
             # Scripts go to .smartdrive/scripts/
-            dst = target_scripts / src.name
+            sources[f"{Paths.SCRIPTS_SUBDIR}/{src.name}"] = src
+
+    # core/ (SSOT modules), static/ (icons, MANDATORY for tray/window) and
+    # tests/ (BUG-20251221-032: post-deployment verification) are mirrored
+    for tree in MIRRORED_TREES:
+        tree_src = DEV_ROOT / Paths.SMARTDRIVE_DIR_NAME / tree
+        if not tree_src.exists():
+            _log_update(f"update.{tree}.notfound", source=str(tree_src))
+            continue
+        for item in tree_src.rglob("*"):
+            if item.is_file() and not should_exclude_from_deployment(item, tree_src):
+                sources[f"{tree}/{item.relative_to(tree_src).as_posix()}"] = item
+
+    # GUI executable (to .smartdrive/scripts)
+    exe_src = DEV_ROOT / FileNames.DISTRIBUTION_DIR / FileNames.GUI_EXE
+    if exe_src.exists():
+        sources[f"{Paths.SCRIPTS_SUBDIR}/{FileNames.GUI_EXE}"] = exe_src
+
+    return sources
 
-        action = "COPY"
-        if dst.exists():
-            # Determine if content differs (mtime alone is unreliable across drives)
-            try:
-                same = filecmp.cmp(src, dst, shallow=False)
-                action = "SKIP (same)" if same else "UPDATE"
-            except Exception:
-                action = "UPDATE"
 
-        changes.append((src, dst, action))
+def preview_update(target_drive: str, dry_run: bool = True) -> "SyncPlan":
+    """
+    Plan and preview what will be updated.
+
+    CHG-20261016-011: Compares against the drive's sync manifest instead of
+    reading every target file; the returned plan is what perform_update applies.
+    """
+    target_path = Path(f"{target_drive}:\\")
+    plan = plan_sync(
+        get_update_sources(),
+        target_path / Paths.SMARTDRIVE_DIR_NAME,
+        prune=[f"{tree}/" for tree in MIRRORED_TREES],
+        protected=PROTECTED,
+    )
+    _log_update(
+        "update.plan",
+        copy=plan.count(ACTION_COPY),
+        update=plan.count(ACTION_UPDATE),
+        delete=plan.count(ACTION_DELETE),
+        skip=plan.count(ACTION_SKIP),
+        target_hashed=plan.target_hashed,
+    )
 
     if dry_run:
         print(f"\n{'─' * 70}")
         print(f"  UPDATE PREVIEW: {target_drive}:\\")
         print(f"{'─' * 70}\n")
 
-        for src, dst, action in changes:
-            if action != "SKIP (same)":
-                print(f"  {action}: {dst}")
+        for action in plan.pending:
+            print(f"  {action.action}: {action.dst}")
 
-        skipped = sum(1 for _, _, a in changes if a == "SKIP (same)")
+        skipped = plan.count(ACTION_SKIP)
         if skipped:
             print(f"  SKIP: {skipped} files unchanged")
 
         print(f"\n  Protected (never overwritten): {', '.join(PROTECTED)}")
         print(f"  Note: config.json version will be updated to {CURRENT_VERSION}")
 
-    return changes
+    return plan
 
 
 def perform_update(target_drive: str, dry_run: bool = False, yes: bool = False) -> bool:
@@ -591,10 +627,10 @@ def perform_update(target_drive: str, dry_run: bool = False, yes: bool = False)
                 return False
 
     # Preview
-    changes = preview_update(target_drive, dry_run=True)
+    plan = preview_update(target_drive, dry_run=True)
 
     if dry_run:
-        _log_update("update.dry_run.complete", change_count=len(changes))
+        _log_update("update.dry_run.complete", change_count=len(plan.pending))
         return True
 
     # Confirm
@@ -613,22 +649,34 @@ def perform_update(target_drive: str, dry_run: bool = False, yes: bool = False)
 
     target_scripts = target_path / Paths.SMARTDRIVE_DIR_NAME / Paths.SCRIPTS_SUBDIR
     target_scripts.mkdir(parents=True, exist_ok=True)
-    (target_path / Paths.SMARTDRIVE_DIR_NAME / "docs").mkdir(parents=True, exist_ok=True)
 
-    success_count = 0
-    error_count = 0
-
-    for src, dst, action in changes:
-        if action == "SKIP (same)":
-            continue
+    # CHG-20261016-011: Copy only changed files, remove orphans of mirrored trees
+    # CHG-20261016-012: Parallel copies, one sync barrier per directory batch
+    def _report(action, stats):
+        if stats is None:
+            print(f"  ✗ {action.rel}")
+            _log_update("update.sync.deleted", file=action.rel)
+            return
+        print(f"  ✓ {action.rel}")
+        _log_update("update.sync.file", file=action.rel, bytes=stats.bytes, mb_s=f"{stats.mb_per_s:.2f}")
+
+    sync_result = apply_sync(plan, on_action=_report)
+    for rel, message in sync_result.errors.items():
+        error(f"Failed to sync {rel}: {message}")
+    success_count = len(sync_result.copied)
+    error_count = len(sync_result.errors)
+    _log_update(
+        "update.sync.complete",
+        copied=len(sync_result.copied),
+        deleted=len(sync_result.deleted),
+        skipped=sync_result.skipped,
+        errors=error_count,
+        bytes=sync_result.bytes_copied,
+        mb_s=f"{sync_result.mb_per_s:.2f}",
+    )
 
-        try:
-            shutil.copy2(src, dst)
-            print(f"  ✓ {dst.name}")
-            success_count += 1
-        except Exception as e:
-            error(f"Failed to copy {src.name}: {e}")
-            error_count += 1
+    # CHG-20261016-016: Rebuild bytecode bundles (only changed sources are compiled)
+    _build_bytecode(target_path / Paths.SMARTDRIVE_DIR_NAME)
 
     # Update config.json version (only if version actually changed)
     # IMPORTANT: config.json user data is PRESERVED - only version/last_updated are updated
@@ -664,101 +712,15 @@ def perform_update(target_drive: str, dry_run: bool = False, yes: bool = False)
             _log_update("update.config.error", error=str(e))
             error_count += 1
 
-    # Copy core folder (SSOT modules)
-    core_src = DEV_ROOT / Paths.SMARTDRIVE_DIR_NAME / "core"
-    if core_src.exists():
-        core_dst = target_path / Paths.SMARTDRIVE_DIR_NAME / "core"
+    # Remove legacy ROOT/static/ folder if it exists (migration from old structure)
+    legacy_static = target_path / Paths.STATIC_SUBDIR
+    if legacy_static.exists() and legacy_static.is_dir():
         try:
-            # Ensure destination exists
-            core_dst.mkdir(parents=True, exist_ok=True)
-
-            # Copy each file individually to ensure updates
-            for item in core_src.rglob("*"):
-                if item.is_file():
-                    rel_path = item.relative_to(core_src)
-                    dst_file = core_dst / rel_path
-                    dst_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, dst_file)
-
-            print("  ✓ Core modules")
-            _log_update("update.core.copied")
-            success_count += 1
+            shutil.rmtree(legacy_static)
+            print("  ✓ Removed legacy static/ folder (migrated to .smartdrive/static/)")
+            _log_update("update.static.legacy_removed", path=str(legacy_static))
         except Exception as e:
-            error(f"Failed to copy core modules: {e}")
-            _log_update("update.core.error", error=str(e))
-            error_count += 1
-
-    # Copy static folder to .smartdrive/static/ (deployed structure)
-    # MANDATORY: Icons must be present for tray/window functionality
-
-    # BUG-INSTANT: Fix FileNames.STATIC_DIR reference error
-    # Use canonical Paths.STATIC_SUBDIR ("static") for both source and destination
-    static_src = DEV_ROOT / Paths.SMARTDRIVE_DIR_NAME / Paths.STATIC_SUBDIR
-    if static_src.exists():
-        # Primary destination: .smartdrive/static/
-        static_dst = target_path / Paths.SMARTDRIVE_DIR_NAME / Paths.STATIC_SUBDIR
-        try:
-            static_dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(static_src, static_dst, dirs_exist_ok=True)
-            # Count files for logging
-            static_files = list(static_dst.rglob("*"))
-            file_count = sum(1 for f in static_files if f.is_file())
-            print(f"  ✓ Static folder (.smartdrive/static/) - {file_count} files")
-            _log_update("update.static.copied", path=str(static_dst), file_count=file_count)
-            success_count += 1
-
-            # Remove legacy ROOT/static/ folder if it exists (migration from old structure)
-            legacy_static = target_path / Paths.STATIC_SUBDIR
-            if legacy_static.exists() and legacy_static.is_dir():
-                try:
-                    shutil.rmtree(legacy_static)
-                    print("  ✓ Removed legacy static/ folder (migrated to .smartdrive/static/)")
-                    _log_update("update.static.legacy_removed", path=str(legacy_static))
-                except Exception as e:
-                    print(f"  ⚠ Could not remove legacy static/ folder: {e}")
-
-        except Exception as e:
-            error(f"Failed to copy static folder: {e}")
-            _log_update("update.static.error", error=str(e))
-            error_count += 1
-    else:
-        _log_update("update.static.notfound", source=str(static_src))
-
-    # BUG-20251221-032: Copy tests directory for post-deployment verification
-    # Tests MUST be deployed to target so verification runs against deployed code
-    tests_src = DEV_ROOT / Paths.SMARTDRIVE_DIR_NAME / "tests"
-    if tests_src.exists():
-        tests_dst = target_path / Paths.SMARTDRIVE_DIR_NAME / "tests"
-        try:
-            tests_dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(tests_src, tests_dst, dirs_exist_ok=True)
-            # Count test files for logging
-            test_files = list(tests_dst.rglob("*.py"))
-            file_count = len(test_files)
-            print(f"  ✓ Tests folder (.smartdrive/tests/) - {file_count} test files")
-            _log_update("update.tests.copied", path=str(tests_dst), file_count=file_count)
-            success_count += 1
-        except Exception as e:
-            error(f"Failed to copy tests folder: {e}")
-            _log_update("update.tests.error", error=str(e))
-            error_count += 1
-    else:
-        _log_update("update.tests.notfound", source=str(tests_src))
-
-    # Copy GUI executable if it exists (to .smartdrive/scripts)
-    exe_src = DEV_ROOT / FileNames.DISTRIBUTION_DIR / FileNames.GUI_EXE
-    if exe_src.exists():
-        exe_dst = target_scripts / FileNames.GUI_EXE
-        try:
-            # Use copy instead of copy2 to avoid potential metadata issues
-            shutil.copy(exe_src, exe_dst)
-            print(f"  ✓ {FileNames.GUI_EXE}")
-            _log_update("update.executable.copied", file=FileNames.GUI_EXE)
-            success_count += 1
-        except Exception as e:
-            error(f"Failed to copy {FileNames.GUI_EXE}: {e}")
-            _log_update("update.executable.error", error=str(e))
-            error_count += 1
+            print(f"  ⚠ Could not remove legacy static/ folder: {e}")
 
     # Enforce clean root entrypoints and remove legacy artifacts
     _cleanup_root_legacy_artifacts(target_path)
@@ -804,6 +766,152 @@ def perform_update(target_drive: str, dry_run: bool = False, yes: bool = False)
     return error_count == 0
 
 
+def _fetch_server_payload(url: str, download_dir: Path, payload_dir: Path, deploy_root: Path, stream: bool = False):
+    """
+    Download and extract the update package into payload_dir.
+
+    CHG-20261016-010: Asks the server for a delta from CURRENT_VERSION first.
+    A delta is only used if every file it relies on is unchanged on this drive
+    and every file it carries matches the manifest; otherwise the full package
+    is downloaded instead.
+
+    CHG-20261016-013: Members rejected by the deployment filter are skipped
+    during extraction (never written). With stream=True the zip is extracted
+    straight from the HTTP response without a temporary archive.
+
+    Returns:
+        (delta metadata or None for a full package, ExtractResult)
+    """
+    from core.download import download_resumable, stream_extract
+    from core.update_delta import (
+        DELTA_META_NAME,
+        PACKAGE_TYPE_DELTA,
+        PACKAGE_TYPE_FULL,
+        load_delta_meta,
+        select_package,
+        verify_delta,
+    )
+    from core.zipstream import extract_archive
+
+    def _exclude(name: str) -> bool:
+        return should_exclude_from_deployment(payload_dir / name, payload_dir)
+
+    package = select_package(url, CURRENT_VERSION)
+    while True:
+        _log_update("update.download.start", url=package["url"], package_type=package["type"], stream=stream)
+        if stream:
+            result, archive_sha512 = stream_extract(
+                package["url"], payload_dir, _exclude, expected_sha512=package["sha512"]
+            )
+            _log_update("update.download.verified", sha512=archive_sha512[:16])
+        else:
+            archive_path = download_dir / f"update-{package['type']}.zip"
+            archive_sha512 = download_resumable(package["url"], archive_path, expected_sha512=package["sha512"])
+            _log_update("update.download.verified", sha512=archive_sha512[:16])
+            result = extract_archive(archive_path, payload_dir, _exclude)
+        _log_update(
+            "update.download.complete",
+            files=result.files,
+            excluded=result.excluded,
+            bytes=result.bytes_written,
+        )
+
+        if package["type"] != PACKAGE_TYPE_DELTA:
+            return None, result
+
+        try:
+            meta = load_delta_meta(payload_dir)
+            problems = verify_delta(meta, payload_dir, deploy_root, result.digests, result.excluded_names)
+        except ValueError as e:
+            problems = [str(e)]
+
+        if not problems:
+            (payload_dir / DELTA_META_NAME).unlink()
+            result.files -= 1
+            log(f"Applying delta update {meta['from_version']} -> {meta['to_version']} ({len(meta['files'])} files)")
+            return meta, result
+
+        warn(f"Delta update not applicable ({problems[0]}); downloading full package")
+        _log_update("update.delta.rejected", problems=len(problems), first=problems[0])
+        shutil.rmtree(payload_dir, ignore_errors=True)
+        payload_dir.mkdir(parents=True, exist_ok=True)
+        package = {"type": PACKAGE_TYPE_FULL, "url": url, "sha512": None}
+
+
+def _build_bytecode(deploy_root: Path) -> None:
+    """Rebuild precompiled bytecode bundles after files changed (never fails the update)."""
+    from core.bytecode import build_bundles
+
+    for bundle in build_bundles(deploy_root):
+        _log_update("update.bytecode.built", bundle=bundle.name)
+
+
+def _snapshot_before_update(deploy_root: Path):
+    """
+    Snapshot the installed tree so a failed update can be rolled back.
+
+    CHG-20261016-014: A snapshot failure never blocks the update.
+
+    Returns:
+        Snapshot id, or None if no snapshot was taken
+    """
+    from core.snapshot import SnapshotStore
+
+    try:
+        snap = SnapshotStore(deploy_root).create(CURRENT_VERSION, label="pre-update")
+    except Exception as e:
+        warn(f"Could not snapshot current installation (no rollback available): {e}")
+        _log_update("update.snapshot.failed", error=str(e))
+        return None
+    _log_update("update.snapshot.created", id=snap.id, files=len(snap.files))
+    return snap.id
+
+
+def rollback_update(deploy_root: Path, snapshot_id: str = None) -> bool:
+    """
+    Restore deploy_root to a snapshot (default: newest).
+
+    Returns:
+        True if successful
+    """
+    from core.snapshot import SnapshotError, SnapshotStore
+
+    try:
+        result = SnapshotStore(deploy_root).rollback(snapshot_id)
+    except (SnapshotError, OSError) as e:
+        error(f"Rollback failed: {e}")
+        _log_update("update.rollback.failed", error=str(e))
+        return False
+    log(
+        f"Rolled back to {result.snapshot_id}: {len(result.restored)} restored, "
+        f"{len(result.deleted)} removed in {result.seconds:.2f}s"
+    )
+    _log_update(
+        "update.rollback.complete",
+        id=result.snapshot_id,
+        restored=len(result.restored),
+        deleted=len(result.deleted),
+        seconds=round(result.seconds, 3),
+    )
+    return True
+
+
+def list_snapshots(deploy_root: Path) -> None:
+    """Print the rollback snapshots of deploy_root."""
+    from core.snapshot import SnapshotStore
+
+    store = SnapshotStore(deploy_root)
+    snapshots = store.list()
+    if not snapshots:
+        print("No snapshots.")
+        return
+    head = store.head()
+    for snap in reversed(snapshots):
+        marker = "*" if snap.id == head else " "
+        print(f" {marker} {snap.id}  v{snap.version}  {len(snap.files)} files  {snap.label}")
+    print(f"Store usage: {store.usage() / (1024 * 1024):.1f} MB")
+
+
 def update_deployment_drive(target_drive: str = None, dry_run: bool = False, yes: bool = False) -> bool:
     """
     Update a deployment drive with latest SmartDrive files.
@@ -835,12 +943,34 @@ if __name__ == "__main__":
     parser.add_argument("--mode", choices=["external_drive"], help="Run in external drive mode")
     parser.add_argument("--source", choices=["server", "local"], help="Update source type")
     parser.add_argument("--url", help="Server URL for update payload")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Extract while downloading (no temporary archive; interrupted downloads restart)",
+    )
     parser.add_argument("--root", help="Local directory for update payload")
+    # CHG-20261016-014: Snapshot rollback of the drive this script runs from
+    parser.add_argument("--list-snapshots", action="store_true", help="List rollback snapshots")
+    parser.add_argument(
+        "--rollback",
+        nargs="?",
+        const="",
+        metavar="SNAPSHOT",
+        help="Restore a snapshot (default: the one taken before the last update)",
+    )
 
     args = parser.parse_args()
 
+    if args.list_snapshots or args.rollback is not None:
+        deploy_root = Path(__file__).resolve().parent.parent
+        if args.list_snapshots:
+            list_snapshots(deploy_root)
+            sys.exit(0)
+        sys.exit(0 if rollback_update(deploy_root, args.rollback or None) else 1)
+
     # External drive GUI mode path
     if args.mode == "external_drive" and args.source:
+        snapshot_id = None
         try:
             # CANONICAL PATH COMPUTATION (per AGENT_ARCHITECTURE.md):
             # Script is at: DRIVE:\.smartdrive\scripts\update.py
@@ -881,32 +1011,19 @@ if __name__ == "__main__":
                 payload_dir = temp_dir / "payload"
                 payload_dir.mkdir(parents=True, exist_ok=True)
 
+                delta_meta = None
                 if args.source == "server" and args.url:
                     # Download archive from server URL
-                    import urllib.request
-
-                    archive_path = temp_dir / "update.zip"
-                    _log_update("update.download.start", url=args.url)
-                    urllib.request.urlretrieve(args.url, archive_path)
-                    # Extract zip
-                    import zipfile
-
-                    with zipfile.ZipFile(archive_path, "r") as zf:
-                        zf.extractall(payload_dir)
-                    _log_update("update.download.complete", archive=str(archive_path))
-
-                    # CHG-20251221-004: Filter extracted files
-                    excluded_count = 0
-                    for item in list(payload_dir.rglob("*")):
-                        if item.is_file() and should_exclude_from_deployment(item, payload_dir):
-                            item.unlink()
-                            excluded_count += 1
-                        elif item.is_dir() and should_exclude_from_deployment(item, payload_dir):
-                            shutil.rmtree(item, ignore_errors=True)
-                            excluded_count += 1
-
-                    copied_files = sum(1 for _ in payload_dir.rglob("*") if _.is_file())
-                    _log_update("update.server.filtered", copied=copied_files, excluded=excluded_count)
+                    # CHG-20261016-009: Resumable + SHA-512 verified while streaming.
+                    # Partial downloads live outside _update_tmp so they survive a
+                    # failed run and resume on the next one.
+                    download_dir = deploy_root / "_update_download"
+                    # CHG-20251221-004 / CHG-20261016-013: Filtered during extraction
+                    delta_meta, extracted = _fetch_server_payload(
+                        args.url, download_dir, payload_dir, deploy_root, stream=args.stream
+                    )
+                    shutil.rmtree(download_dir, ignore_errors=True)
+                    _log_update("update.server.filtered", copied=extracted.files, excluded=extracted.excluded)
                 elif args.source == "local" and args.root:
                     # Copy from local directory
                     src_root = Path(args.root)
@@ -946,6 +1063,9 @@ if __name__ == "__main__":
                 # This eliminates redundant full directory tree copies
                 _log_update("update.overlay.start", target=str(deploy_root))
 
+                # CHG-20261016-014: Pre-update snapshot (rolled back below if the overlay fails)
+                snapshot_id = _snapshot_before_update(deploy_root)
+
                 # BUG-20251225-003 FIX: Backup config.json before overlay
                 cfg_path = deploy_root / Paths.SCRIPTS_SUBDIR / FileNames.CONFIG_JSON
                 cfg_backup_path = None
@@ -965,6 +1085,8 @@ if __name__ == "__main__":
                 # BUG-20251225-003 FIX: Add explicit filename check for config.json
                 # BUG-20260102-025 FIX: Skip venv directories (handled separately to avoid ETXTBSY)
                 VENV_DIRS = {".venv", ".venv-win", ".venv-linux", ".venv-mac"}
+                from core.update_delta import apply_deletions, deploy_path
+
                 skipped_protected = 0
                 for item in payload_dir.rglob("*"):
                     if item.is_file():
@@ -1004,7 +1126,8 @@ if __name__ == "__main__":
                             skipped_protected += 1
                             continue  # NEVER overwrite user data
 
-                        dst = deploy_root / rel_path
+                        # CHG-20261016-010: Package arcnames carry the .smartdrive/ prefix
+                        dst = deploy_path(deploy_root, rel_path.as_posix())
 
                         # Ensure parent directory exists
                         dst.parent.mkdir(parents=True, exist_ok=True)
@@ -1014,6 +1137,14 @@ if __name__ == "__main__":
 
                 _log_update("update.overlay.complete", skipped_protected=skipped_protected)
 
+                # CHG-20261016-016: Rebuild bytecode bundles for the new sources
+                _build_bytecode(deploy_root)
+
+                # CHG-20261016-010: Files dropped in the target release
+                if delta_meta is not None:
+                    removed = apply_deletions(delta_meta, deploy_root, PROTECTED | VENV_DIRS)
+                    _log_update("update.delta.deleted", removed=removed)
+
                 # BUG-20251225-003 FIX: Update config.json metadata with validation and restore
                 if cfg_path.exists():
                     try:
@@ -1094,6 +1225,9 @@ if __name__ == "__main__":
         except Exception as e:
             error(str(e))
             _log_update("update.external_drive.failed", error=str(e))
+            if snapshot_id:
+                warn("Restoring the previous installation...")
+                rollback_update(deploy_root, snapshot_id)
             sys.exit(1)
 
     # Default interactive/drive mode
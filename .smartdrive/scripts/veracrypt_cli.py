@@ -40,10 +40,13 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 try:
+    from core.card_presence import get_card_presence
     from core.constants import UserInputs
     from core.limits import Limits
+    from core.mount_inventory import get_mount_inventory
     from core.paths import Paths
     from core.platform import is_windows, veracrypt_flag_prefix
+    from core.tool_cache import get_tool_cache
 
     TIMEOUT_MOUNT = Limits.VERACRYPT_MOUNT_TIMEOUT
     TIMEOUT_LONG = Limits.TIMEOUT_LONG
@@ -52,6 +55,9 @@ except ImportError:
     TIMEOUT_MOUNT = 30
     TIMEOUT_LONG = 60
     UserInputs = None
+    get_card_presence = None
+    get_mount_inventory = None
+    get_tool_cache = None
     # No Paths fallback - if core is missing, VeraCrypt path resolution will fail
     # This is intentional per AGENT_ARCHITECTURE.md - SSOT must be authoritative
     Paths = None
@@ -255,27 +261,16 @@ def _check_yubikey_presence_for_cpw() -> tuple:
     Check if a YubiKey with GPG capability is present.
     BUG-20251218-006: HARD GATE - must verify hardware key before any CPW operation.
     BUG-20251218-007 FIX: Add --no-tty to prevent hanging on repeated CPW calls.
+    CHG-20261016-022: Uses the shared card presence cache, so repeated CPW
+    commands no longer each pay a `gpg --card-status` round trip.
 
     Returns:
         Tuple of (is_present: bool, error_message: str)
     """
-    try:
-        # Use Limits.GPG_DECRYPT_TIMEOUT from SSOT
-        gpg_timeout = Limits.GPG_DECRYPT_TIMEOUT if Limits else 30
-        result = subprocess.run(["gpg", "--no-tty", "--card-status"], capture_output=True, timeout=gpg_timeout)
-        if result.returncode == 0:
-            return True, ""
-        else:
-            stderr = result.stderr.decode("utf-8", errors="replace")
-            if "no card" in stderr.lower() or "card error" in stderr.lower():
-                return False, "No YubiKey/smartcard detected"
-            return False, f"GPG card status failed: {stderr[:100]}"
-    except FileNotFoundError:
-        return False, "GPG not installed or not in PATH"
-    except subprocess.TimeoutExpired:
-        return False, "GPG card status timed out (YubiKey may be unresponsive)"
-    except Exception as e:
-        return False, f"Error checking YubiKey: {e}"
+    if get_card_presence is None:
+        # HARD GATE: never pass without a real check
+        return False, "Card presence check unavailable (core modules missing)"
+    return get_card_presence().is_present()
 
 
 class OnDemandSecretsHandler:
@@ -705,6 +700,15 @@ def check_cli_capabilities(vc_exe: Optional[Path] = None) -> dict:
         _cli_capabilities_cache = capabilities
         return capabilities
 
+    # CHG-20261016-023: Reuse capabilities parsed by an earlier process for
+    # this exact binary (validated by size + mtime)
+    tool_cache = get_tool_cache() if get_tool_cache is not None else None
+    if tool_cache is not None:
+        cached = tool_cache.get_data(vc_exe, "capabilities")
+        if cached is not None:
+            _cli_capabilities_cache = cached
+            return cached
+
     # Non-Windows: Try to get help output
     prefix = veracrypt_flag_prefix()
     help_flags = [f"{prefix}help", f"{prefix}h", "-h", "--help", "/?"]
@@ -755,6 +759,8 @@ def check_cli_capabilities(vc_exe: Optional[Path] = None) -> dict:
     capabilities["raw_help"] = raw_help[:500] if raw_help else "No help output"
 
     _cli_capabilities_cache = capabilities
+    if tool_cache is not None and capabilities["help_parsed"]:
+        tool_cache.set_data(vc_exe, "capabilities", capabilities)
     return capabilities
 
 
@@ -1072,42 +1078,41 @@ def render_header_export_gui_guide(
 
 def have_veracrypt() -> bool:
     """Check if VeraCrypt CLI is available."""
-    # First check PATH
-    if shutil.which("veracrypt"):
-        return True
+    return get_veracrypt_exe() is not None
 
-    # Fallback to SSOT standard installation paths
-    if Paths is not None:
-        try:
-            vc_path = Paths.veracrypt_exe()
-            if vc_path and vc_path.exists():
-                return True
-        except:
-            pass
 
-    return False
+def _veracrypt_install_locations() -> list:
+    """SSOT standard installation paths (fallback after PATH)."""
+    if Paths is None:
+        return []
+    try:
+        return [Paths.veracrypt_exe()]
+    except Exception:
+        return []
 
 
 def get_veracrypt_exe() -> Optional[Path]:
     """
     Get path to VeraCrypt executable using SSOT.
 
+    CHG-20261016-023: Resolved through the persistent tool cache; a cached
+    path costs one stat instead of a PATH search and install-path probes.
+
     Returns:
         Path to VeraCrypt executable, or None if not found
     """
+    if get_tool_cache is not None:
+        return get_tool_cache().which("veracrypt", fallbacks=_veracrypt_install_locations)
+
     # First check PATH
     vc_which = shutil.which("veracrypt")
     if vc_which:
         return Path(vc_which)
 
     # Fallback to SSOT standard installation paths
-    if Paths is not None:
-        try:
-            vc_path = Paths.veracrypt_exe()
-            if vc_path and vc_path.exists():
-                return vc_path
-        except:
-            pass
+    for vc_path in _veracrypt_install_locations():
+        if vc_path and vc_path.exists():
+            return vc_path
 
     return None
 
@@ -1552,6 +1557,9 @@ def try_mount(
             stdout, stderr = proc.communicate(input=password + "\n", timeout=TIMEOUT_LONG)
         returncode = proc.returncode
 
+    # CHG-20261016-024: The mount table may have changed; drop the shared snapshot
+    _invalidate_mount_inventory()
+
     if returncode == 0:
         return True, None
 
@@ -1637,6 +1645,7 @@ def unmount(mount_point: str, force: bool = False) -> bool:
         kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
 
     result = subprocess.run(cmd, **kwargs)
+    _invalidate_mount_inventory()  # CHG-20261016-024
 
     if result.returncode != 0:
         error_msg = result.stderr or result.stdout
@@ -1649,46 +1658,48 @@ def unmount(mount_point: str, force: bool = False) -> bool:
     return True
 
 
+def _invalidate_mount_inventory() -> None:
+    """Drop the shared mount snapshot after this process mounted or unmounted."""
+    if get_mount_inventory is not None:
+        get_mount_inventory().invalidate()
+
+
 def get_mount_status(mount_point: str) -> bool:
     """
     Check if volume is mounted at given mount point.
 
     BUG-20251223-067 FIX: Windows VeraCrypt CLI uses /flag syntax.
-    On Windows, use /l (list) instead of --list.
+
+    CHG-20261016-024: Answered from the shared MountInventory: one parsed
+    `veracrypt --text --list` is reused by every caller for a short TTL, and
+    mount points are compared as normalized paths instead of a substring of
+    stdout. Windows VeraCrypt cannot list volumes, so the drive letter is
+    checked there.
 
     Returns:
         True if mounted, False otherwise
     """
-    if not have_veracrypt():
+    if get_mount_inventory is None:
         return False
-
     try:
-        # BUG-20251223-058 FIX: Add CREATE_NO_WINDOW to prevent GUI popup
-        kwargs = {
-            "capture_output": True,
-            "text": True,
-            "timeout": Limits.GPG_CARD_STATUS_TIMEOUT,  # 10 second timeout
-        }
+        return get_mount_inventory().is_mounted(mount_point)
+    except Exception:
+        return False
 
-        # BUG-20251223-067: Use platform-specific flag syntax
-        is_windows = platform.system().lower() == "windows"
-        vc_exe = get_veracrypt_exe()
-        if not vc_exe:
-            return False
 
-        if is_windows:
-            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-            # Windows: VeraCrypt /l lists mounted volumes
-            result = subprocess.run([str(vc_exe), "/l"], **kwargs)
-        else:
-            # Unix: --text --list
-            result = subprocess.run([str(vc_exe), "--text", "--list"], **kwargs)
+def list_mounted_volumes() -> list:
+    """
+    List mounted VeraCrypt volumes.
 
-        if result.returncode == 0:
-            # Check if mount_point appears in output
-            return mount_point in result.stdout
+    CHG-20261016-024: Structured records from the shared MountInventory.
 
+    Returns:
+        List of dicts with slot, volume, mount_point, virtual_device, size,
+        type, read_only and fs_type (empty if VeraCrypt cannot be listed)
+    """
+    if get_mount_inventory is None:
+        return []
+    try:
+        return [slot.as_dict() for slot in get_mount_inventory().slots()]
     except Exception:
-        pass
-
-    return False
+        return []
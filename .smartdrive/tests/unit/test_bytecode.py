@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for precompiled bytecode bundles.
+
+Tests core/bytecode.py (CHG-20261016-016) including:
+- Bundled modules are imported without compiling, with the real __file__
+- A changed source falls back to normal compilation
+- Rebuilds compile only changed sources
+- An integrity manifest must list the bundle's hash for it to be used
+"""
+
+import builtins
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core import bytecode
+from core.bytecode import BundleFinder, _BundleLoader, build_bundle, bundle_path, load_bundle
+from core.integrity import Integrity
+
+_OLD_NS = 1_600_000_000 * 10**9  # Well outside the racy window
+
+
+def _write(path: Path, text: str, age: int = 0) -> Path:
+    """Write with an old mtime; a later 'age' gives edited files a new stat key."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    ns = _OLD_NS + age * 10**9
+    os.utime(path, ns=(ns, ns))
+    return path
+
+
+@pytest.fixture
+def deploy_root(tmp_path, monkeypatch):
+    root = tmp_path / ".smartdrive"
+    _write(root / "scripts" / "bc_probe_a.py", "VALUE = 'a'\n")
+    _write(root / "scripts" / "bc_probe_b.py", "VALUE = 'b'\n")
+    monkeypatch.syspath_prepend(str(root / "scripts"))
+    yield root
+    for name in ("bc_probe_a", "bc_probe_b"):
+        sys.modules.pop(name, None)
+
+
+def _import_with(bundle, name):
+    finder = BundleFinder(bundle)
+    sys.meta_path.insert(0, finder)
+    try:
+        return __import__(name)
+    finally:
+        sys.meta_path.remove(finder)
+
+
+class TestBytecode:
+    def test_bundled_import_skips_compile(self, deploy_root):
+        build_bundle(deploy_root)
+        bundle = load_bundle(deploy_root)
+        assert bundle is not None
+
+        with patch.object(builtins, "compile", side_effect=AssertionError("compiled")):
+            module = _import_with(bundle, "bc_probe_a")
+
+        assert module.VALUE == "a"
+        assert isinstance(module.__spec__.loader, _BundleLoader)
+        assert Path(module.__file__) == deploy_root / "scripts" / "bc_probe_a.py"
+
+    def test_changed_source_not_served(self, deploy_root):
+        build_bundle(deploy_root)
+        _write(deploy_root / "scripts" / "bc_probe_b.py", "VALUE = 'B'\n", age=1)
+
+        module = _import_with(load_bundle(deploy_root), "bc_probe_b")
+        assert module.VALUE == "B"
+        assert not isinstance(module.__spec__.loader, _BundleLoader)
+
+    def test_rebuild_compiles_only_changes(self, deploy_root):
+        build_bundle(deploy_root)
+        _write(deploy_root / "scripts" / "bc_probe_b.py", "VALUE = 'B'\n", age=1)
+
+        with patch.object(bytecode, "compile", wraps=compile, create=True) as spy:
+            build_bundle(deploy_root)
+        assert [call.args[1] for call in spy.call_args_list] == [str(deploy_root / "scripts" / "bc_probe_b.py")]
+
+    def test_integrity_manifest_must_cover_bundle(self, deploy_root):
+        launcher_root = deploy_root.parent
+        build_bundle(deploy_root)
+        integrity_dir = deploy_root / "integrity"
+        integrity_dir.mkdir()
+        (integrity_dir / Integrity.MANIFEST_FILE).write_text("abc  scripts\n", encoding="utf-8")
+        assert load_bundle(deploy_root) is None
+
+        Integrity.create_manifest(launcher_root)
+        assert load_bundle(deploy_root) is not None
+
+    def test_tampered_bundle_rejected(self, deploy_root):
+        build_bundle(deploy_root)
+        path = bundle_path(deploy_root)
+        path.write_bytes(path.read_bytes() + b"\0")
+        assert load_bundle(deploy_root) is None
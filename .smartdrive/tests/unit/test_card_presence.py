@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached smartcard presence service.
+
+CHG-20261016-022: One `gpg --card-status` probe is shared by all presence
+and identity checks until a USB hotplug event invalidates it.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+sys.path.insert(0, str(_smartdrive_root))
+
+from core import card_presence
+from core.card_presence import CardPresenceService, CardStatus, _is_usb_hotplug, parse_card_status_colons
+
+SIG = "A" * 40
+ENC = "B" * 40
+AUTH = "C" * 40
+
+
+class _Probe:
+    def __init__(self, present=True):
+        self.present = present
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.present:
+            return CardStatus(True, serial="34397658", enc_fpr=ENC, checked_at=time.monotonic())
+        return CardStatus(False, "No YubiKey/smartcard detected", checked_at=time.monotonic())
+
+
+class TestParsing:
+    def test_parse_card_status_colons(self):
+        output = (
+            "Reader:Yubico YubiKey OTP FIDO CCID:AID:D276000124010304:openpgp-card\n"
+            "serial:34397658:\n"
+            f"fpr:{SIG}:{ENC}:{AUTH}:\n"
+        )
+        assert parse_card_status_colons(output) == ("34397658", (SIG, ENC, AUTH))
+        assert parse_card_status_colons("") == (None, (None, None, None))
+
+    def test_usb_hotplug_filter(self):
+        add = b"add@/devices/pci0000:00/usb1/1-2\0ACTION=add\0SUBSYSTEM=usb\0DEVTYPE=usb_device\0"
+        block = b"change@/devices/virtual/block/loop0\0ACTION=change\0SUBSYSTEM=block\0"
+        assert _is_usb_hotplug(add)
+        assert _is_usb_hotplug(add.replace(b"=add", b"=remove"))
+        assert not _is_usb_hotplug(block)
+
+
+class TestCardPresenceService:
+    def test_present_card_is_probed_once(self):
+        probe = _Probe()
+        service = CardPresenceService(probe, use_netlink=False)
+        assert service.is_present() == (True, "")
+        assert service.status().serial == "34397658"
+        assert probe.calls == 1
+
+    def test_absent_card_is_reprobed(self):
+        probe = _Probe(present=False)
+        service = CardPresenceService(probe, use_netlink=False)
+        assert service.is_present() == (False, "No YubiKey/smartcard detected")
+        probe.present = True
+        assert service.is_present() == (True, "")
+        assert probe.calls == 2
+
+    def test_invalidate_and_refresh_probe_again(self):
+        probe = _Probe()
+        service = CardPresenceService(probe, use_netlink=False)
+        service.status()
+        service.invalidate()
+        service.status()
+        service.status(refresh=True)
+        assert probe.calls == 3
+
+    def test_poll_fallback_expires_present_card(self, monkeypatch):
+        probe = _Probe()
+        service = CardPresenceService(probe, use_netlink=False)
+        monkeypatch.setattr(card_presence.Limits, "CARD_PRESENCE_CACHE_TTL", 0.0)
+        service.status()
+        service.status()
+        assert service.backend == "poll"
+        assert probe.calls == 2
+
+    def test_hotplug_during_probe_is_not_cached(self):
+        service = None
+
+        def probe():
+            service.invalidate()  # USB event arrives while gpg runs
+            return CardStatus(True, checked_at=time.monotonic())
+
+        service = CardPresenceService(probe, use_netlink=False)
+        service.status()
+        assert service._status is None
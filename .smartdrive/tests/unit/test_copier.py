@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel copy pipeline.
+
+Tests core/copier.py (CHG-20261016-012) including:
+- Content and mtime preserved (shutil.copy2 semantics)
+- One sync barrier per destination directory, not per file
+- Per-file errors reported without aborting the batch
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core import copier
+from core.copier import CopyScheduler, copy_file
+
+
+def _jobs(tmp_path, layout):
+    src_root = tmp_path / "src"
+    dst_root = tmp_path / "dst"
+    jobs = []
+    for rel, data in layout.items():
+        src = src_root / rel
+        src.parent.mkdir(parents=True, exist_ok=True)
+        src.write_bytes(data)
+        dst = dst_root / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        jobs.append((rel, src, dst))
+    return jobs
+
+
+class TestCopier:
+    def test_copy_file_preserves_content_and_mtime(self, tmp_path):
+        src = tmp_path / "a.bin"
+        src.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        os.utime(src, ns=(1_600_000_000 * 10**9, 1_600_000_000 * 10**9))
+        dst = tmp_path / "b.bin"
+
+        assert copy_file(src, dst) == src.stat().st_size
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    def test_one_barrier_per_directory(self, tmp_path):
+        layout = {f"core/m{i}.py": b"x" * i for i in range(10)}
+        layout.update({f"static/i{i}.png": b"y" * i for i in range(5)})
+        jobs = _jobs(tmp_path, layout)
+        done = {}
+
+        with patch.object(copier, "sync_barrier") as barrier:
+            CopyScheduler(workers=4).run(jobs, on_done=lambda k, s, e: done.setdefault(k, (s, e)))
+
+        assert barrier.call_count == 2
+        flushed = {call.args[0].name: len(call.args[1]) for call in barrier.call_args_list}
+        assert flushed == {"core": 10, "static": 5}
+        assert all(e is None and s.bytes == len(layout[k]) for k, (s, e) in done.items())
+        for rel, data in layout.items():
+            assert (tmp_path / "dst" / rel).read_bytes() == data
+
+    def test_errors_reported_per_file(self, tmp_path):
+        jobs = _jobs(tmp_path, {"a.py": b"a", "b.py": b"b"})
+        jobs[0] = (jobs[0][0], tmp_path / "missing.py", jobs[0][2])
+        results = {}
+
+        with patch.object(copier, "sync_barrier"):
+            CopyScheduler(workers=2).run(jobs, on_done=lambda k, s, e: results.setdefault(k, e))
+
+        assert isinstance(results["a.py"], FileNotFoundError)
+        assert results["b.py"] is None
+
+    def test_barrier_fsyncs_batch_not_whole_system(self, tmp_path):
+        files = []
+        for i in range(3):
+            path = tmp_path / f"f{i}.py"
+            path.write_bytes(b"z" * i)
+            files.append(path)
+
+        with patch.object(copier.os, "fsync") as fsync, patch.object(copier.os, "sync", create=True) as sync:
+            copier.sync_barrier(tmp_path, files)
+
+        sync.assert_not_called()
+        expected = len(files) + (1 if os.name == "posix" else 0)  # + the directory on POSIX
+        assert fsync.call_count == expected
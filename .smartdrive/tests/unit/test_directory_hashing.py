@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared parallel directory hasher.
+
+Tests core/hashing.py (CHG-20261016-003) including:
+- Compat mode reproduces the legacy single-threaded digest byte for byte
+- Large files (streamed / mmap) hash identically
+- In-memory extra files hash as if they were on disk
+- Merkle leaves localize changes and are order/worker independent
+- PrecomputedTree salted digests match an on-disk salt file
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core import hashing
+from core.hashing import (
+    MODE_COMPAT,
+    MODE_MERKLE,
+    PrecomputedTree,
+    collect_files,
+    hash_directory,
+    hash_leaves,
+    tree_signature,
+)
+
+
+def _legacy_hash_directory(dir_path: Path, skip_hidden: bool = False) -> str:
+    """Reference copy of the pre-CHG-20261016-003 implementation."""
+    hash_obj = hashlib.sha256()
+    all_files = []
+    for root, dirs, files in os.walk(dir_path):
+        dirs[:] = [d for d in dirs if d not in ["__pycache__", ".git"]]
+        for file in files:
+            if not skip_hidden or not file.startswith(".") or file == ".challenge_salt":
+                all_files.append(str(Path(root) / file))
+    all_files.sort()
+    for file_path in all_files:
+        rel_path = os.path.relpath(file_path, dir_path)
+        hash_obj.update(rel_path.encode("utf-8"))
+        hash_obj.update(b"\x00")
+        with open(file_path, "rb") as f:
+            while True:
+                chunk = f.read(8192)
+                if not chunk:
+                    break
+                hash_obj.update(chunk)
+        hash_obj.update(b"\x00")
+    return hash_obj.hexdigest()
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Build a small tree with nested dirs, hidden files and skipped dirs."""
+    root = tmp_path / "scripts"
+    (root / "sub" / "deeper").mkdir(parents=True)
+    (root / "__pycache__").mkdir()
+    (root / "a.py").write_bytes(b"print('a')\n")
+    (root / "a.txt").write_bytes(b"text")
+    (root / "b.py").write_bytes(b"")
+    (root / ".hidden").write_bytes(b"secret")
+    (root / "sub" / "c.py").write_bytes(b"c" * 5000)
+    (root / "sub" / "deeper" / "d.bin").write_bytes(os.urandom(70_000))
+    (root / "__pycache__" / "a.cpython-311.pyc").write_bytes(b"junk")
+    return root
+
+
+class TestCompatMode:
+    """Compat mode must match the legacy digests exactly."""
+
+    def test_matches_server_legacy(self, tree):
+        assert hash_directory(tree) == _legacy_hash_directory(tree)
+
+    def test_matches_cli_legacy_with_filter(self, tree):
+        (tree / ".challenge_salt").write_text("salt")
+
+        def include(name):
+            return not name.startswith(".") or name == ".challenge_salt"
+
+        assert hash_directory(tree, file_filter=include) == _legacy_hash_directory(tree, skip_hidden=True)
+
+    @pytest.mark.parametrize("workers", [1, 2, 7])
+    def test_worker_count_does_not_change_digest(self, tree, workers):
+        assert hash_directory(tree, workers=workers) == _legacy_hash_directory(tree)
+
+    def test_streamed_and_mmapped_large_files(self, tree):
+        with (
+            patch.object(hashing.Limits, "HASH_PREFETCH_MAX_FILE_SIZE", 1024),
+            patch.object(hashing.Limits, "HASH_MMAP_THRESHOLD", 60_000),
+            patch.object(hashing.Limits, "HASH_READ_BUFFER_SIZE", 4096),
+        ):
+            hashing._buffers.__dict__.clear()
+            assert hash_directory(tree) == _legacy_hash_directory(tree)
+        hashing._buffers.__dict__.clear()
+
+    def test_extra_files_equal_on_disk(self, tree):
+        in_memory = hash_directory(tree, extra_files={".challenge_salt": b"abc123"})
+        (tree / ".challenge_salt").write_bytes(b"abc123")
+        assert in_memory == _legacy_hash_directory(tree)
+
+    def test_extra_files_not_written(self, tree):
+        hash_directory(tree, extra_files={".challenge_salt": b"abc123"})
+        assert not (tree / ".challenge_salt").exists()
+
+    def test_unknown_mode_rejected(self, tree):
+        with pytest.raises(ValueError):
+            hash_directory(tree, mode="nope")
+
+
+class TestMerkleMode:
+    """Merkle leaves and root."""
+
+    def test_leaves_localize_changes(self, tree):
+        before = hash_leaves(collect_files(tree))
+        (tree / "sub" / "c.py").write_bytes(b"changed")
+        after = hash_leaves(collect_files(tree))
+
+        changed = {rel for rel in before if before[rel] != after[rel]}
+        assert changed == {"sub/c.py"}
+
+    def test_root_stable_across_workers(self, tree):
+        r1 = hash_directory(tree, mode=MODE_MERKLE, workers=1)
+        r2 = hash_directory(tree, mode=MODE_MERKLE, workers=6)
+        assert r1 == r2
+
+    def test_root_differs_from_compat(self, tree):
+        assert hash_directory(tree, mode=MODE_MERKLE) != hash_directory(tree, mode=MODE_COMPAT)
+
+    def test_root_detects_rename(self, tree):
+        r1 = hash_directory(tree, mode=MODE_MERKLE)
+        (tree / "a.py").rename(tree / "z.py")
+        assert hash_directory(tree, mode=MODE_MERKLE) != r1
+
+
+class TestPrecomputedTree:
+    """Salted digests from the in-memory reference manifest."""
+
+    @pytest.mark.parametrize("salt_name", [".challenge_salt", "zz_last", "sub/inner_salt", "a.py"])
+    def test_salted_digest_matches_on_disk(self, tree, salt_name):
+        snapshot = PrecomputedTree(tree)
+        salt = b"0f" * 32
+        in_memory = snapshot.digest_with({salt_name: salt})
+
+        (tree / salt_name).write_bytes(salt)
+        assert in_memory == _legacy_hash_directory(tree)
+
+    def test_unsalted_digest_is_compat(self, tree):
+        assert PrecomputedTree(tree).digest == _legacy_hash_directory(tree)
+
+    def test_no_disk_writes(self, tree):
+        before = sorted(p.name for p in tree.rglob("*"))
+        PrecomputedTree(tree).digest_with({".challenge_salt": b"x"})
+        assert sorted(p.name for p in tree.rglob("*")) == before
+
+    def test_distinct_salts_distinct_digests(self, tree):
+        snapshot = PrecomputedTree(tree)
+        assert snapshot.digest_with({".challenge_salt": b"a"}) != snapshot.digest_with({".challenge_salt": b"b"})
+
+    def test_signature_tracks_changes(self, tree):
+        snapshot = PrecomputedTree(tree)
+        assert tree_signature(tree) == snapshot.signature
+        (tree / "new.py").write_bytes(b"new")
+        assert tree_signature(tree) != snapshot.signature
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for resumable, verifying update downloads.
+
+Tests core/download.py (CHG-20261016-009) including:
+- Full download verified against the SHA-512 ETag
+- Resume with Range/If-Range after a dropped connection
+- Restart from zero when the ETag changed
+- Hash mismatch discards the partial file
+- Streaming extraction verified against the ETag (CHG-20261016-013)
+"""
+
+import hashlib
+import http.server
+import io
+import os
+import sys
+import threading
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core import download
+from core.download import DownloadError, HashMismatchError, download_resumable, stream_extract
+
+PAYLOAD = os.urandom(300_000)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves server.payload with a strong SHA-512 ETag and single-range support."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        srv = self.server
+        srv.requests.append(dict(self.headers))
+        body = srv.payload
+        etag = srv.etag or f'"{hashlib.sha512(body).hexdigest()}"'
+
+        start = 0
+        rng = self.headers.get("Range")
+        if rng and self.headers.get("If-Range") == etag:
+            start = int(rng.split("=")[1].split("-")[0])
+
+        chunk = body[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(chunk)))
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+
+        if srv.drop_after is not None:
+            limit, srv.drop_after = srv.drop_after, None
+            self.wfile.write(chunk[:limit])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(chunk)
+
+
+@pytest.fixture
+def server():
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.payload = PAYLOAD
+    srv.etag = None
+    srv.drop_after = None
+    srv.requests = []
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _url(srv):
+    return f"http://127.0.0.1:{srv.server_address[1]}/update.zip"
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch.object(download.time, "sleep"):
+        yield
+
+
+class TestDownloadResumable:
+    def test_full_download_verified(self, server, tmp_path):
+        dest = tmp_path / "update.zip"
+        digest = download_resumable(_url(server), dest)
+        assert dest.read_bytes() == PAYLOAD
+        assert digest == hashlib.sha512(PAYLOAD).hexdigest()
+        assert not (tmp_path / "update.zip.part").exists()
+        assert not (tmp_path / "update.zip.part.json").exists()
+
+    def test_resumes_after_drop(self, server, tmp_path):
+        server.drop_after = 100_000
+        dest = tmp_path / "update.zip"
+
+        download_resumable(_url(server), dest)
+
+        assert dest.read_bytes() == PAYLOAD
+        assert len(server.requests) == 2
+        assert server.requests[1]["Range"] == "bytes=100000-"
+
+    def test_resume_across_runs(self, server, tmp_path):
+        server.drop_after = 50_000
+        dest = tmp_path / "update.zip"
+        with pytest.raises(DownloadError):
+            download_resumable(_url(server), dest, retries=0)
+        assert (tmp_path / "update.zip.part").stat().st_size == 50_000
+
+        download_resumable(_url(server), dest)
+        assert dest.read_bytes() == PAYLOAD
+        assert server.requests[-1]["Range"] == "bytes=50000-"
+
+    def test_changed_etag_restarts(self, server, tmp_path):
+        server.drop_after = 50_000
+        dest = tmp_path / "update.zip"
+        with pytest.raises(DownloadError):
+            download_resumable(_url(server), dest, retries=0)
+
+        # New package on the server: If-Range no longer matches -> full 200
+        server.payload = PAYLOAD[::-1]
+        download_resumable(_url(server), dest)
+        assert dest.read_bytes() == PAYLOAD[::-1]
+
+    def test_hash_mismatch_discards_partial(self, server, tmp_path):
+        server.etag = '"' + "0" * 128 + '"'
+        dest = tmp_path / "update.zip"
+        with pytest.raises(HashMismatchError):
+            download_resumable(_url(server), dest)
+        assert not dest.exists()
+        assert not (tmp_path / "update.zip.part").exists()
+
+    def test_explicit_expected_hash(self, server, tmp_path):
+        with pytest.raises(HashMismatchError):
+            download_resumable(_url(server), tmp_path / "u.zip", expected_sha512="ab" * 64)
+
+    def test_stream_extract_verified(self, server, tmp_path):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("scripts/gui.py", PAYLOAD)
+            zf.writestr("tests/test_x.py", b"excluded")
+        server.payload = buf.getvalue()
+
+        result, digest = stream_extract(_url(server), tmp_path / "payload", exclude=lambda n: n.startswith("tests"))
+        assert digest == hashlib.sha512(server.payload).hexdigest()
+        assert (tmp_path / "payload/scripts/gui.py").read_bytes() == PAYLOAD
+        assert result.excluded == 1
+
+        server.etag = '"' + "0" * 128 + '"'
+        with pytest.raises(HashMismatchError):
+            stream_extract(_url(server), tmp_path / "again")
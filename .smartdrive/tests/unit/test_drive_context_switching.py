@@ -21,10 +21,10 @@ def _read_gui() -> str:
 
 
 def _read_i18n() -> str:
-    """Read gui_i18n.py source for static analysis."""
+    """Read the GUI translation catalogs (locales/gui_<lang>.py) for static analysis."""
     smartdrive_root = Path(__file__).resolve().parent.parent.parent
-    i18n_path = smartdrive_root / "scripts" / "gui_i18n.py"
-    return i18n_path.read_text(encoding="utf-8")
+    catalogs = sorted((smartdrive_root / "locales").glob("gui_*.py"))
+    return "\n".join(path.read_text(encoding="utf-8") for path in catalogs)
 
 
 def _read_settings_schema() -> str:
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the background drive-health monitor.
+
+CHG-20261016-020: Remote-drive probes run off the GUI thread with per-probe
+timeouts, backoff and a cached status.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+sys.path.insert(0, str(_smartdrive_root))
+
+from core.drive_health import (
+    PROBE_ERROR,
+    PROBE_MISSING,
+    PROBE_OK,
+    PROBE_TIMEOUT,
+    DriveHealthMonitor,
+    probe_path,
+)
+
+
+class _FakeProbe:
+    """Probe whose per-path outcome is set by the test; "hang" blocks until released."""
+
+    def __init__(self, default=PROBE_OK):
+        self.outcomes = {}
+        self.default = default
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, path):
+        self.calls.append(path)
+        outcome = self.outcomes.get(path, self.default)
+        if outcome == "hang":
+            self.release.wait(5)
+            return PROBE_OK
+        return outcome
+
+
+def _monitor(probe, **kwargs):
+    kwargs.setdefault("probe_timeout", 0.05)
+    kwargs.setdefault("failure_threshold", 3)
+    return DriveHealthMonitor(["/drive", "/drive/config.json"], probe=probe, **kwargs)
+
+
+class TestProbePath:
+    def test_outcomes(self, tmp_path):
+        assert probe_path(str(tmp_path)) == PROBE_OK
+        assert probe_path(str(tmp_path / "gone")) == PROBE_MISSING
+
+
+class TestDriveHealthMonitor:
+    def test_first_healthy_check_is_not_a_transition(self):
+        events = []
+        monitor = _monitor(_FakeProbe())
+        monitor.add_listener(lambda connected, reason: events.append(connected))
+
+        assert monitor.is_connected() is None
+        assert monitor.check_now().connected is True
+        assert events == []
+
+    def test_missing_path_disconnects_immediately_and_reconnects(self):
+        events = []
+        probe = _FakeProbe()
+        monitor = _monitor(probe)
+        monitor.add_listener(lambda connected, reason: events.append((connected, reason)))
+        monitor.check_now()
+
+        probe.outcomes["/drive/config.json"] = PROBE_MISSING
+        assert monitor.check_now().connected is False
+        assert events == [(False, "/drive/config.json is missing")]
+
+        probe.outcomes.clear()
+        monitor.check_now()
+        assert events[-1] == (True, "")
+
+    def test_transient_failures_need_threshold(self):
+        events = []
+        probe = _FakeProbe()
+        monitor = _monitor(probe)
+        monitor.add_listener(lambda connected, reason: events.append(connected))
+        monitor.check_now()
+
+        probe.default = PROBE_ERROR
+        assert monitor.check_now().connected is True
+        assert monitor.check_now().connected is True
+        status = monitor.check_now()
+        assert status.connected is False and status.consecutive_failures == 3
+        assert events == [False]
+
+    def test_hung_probe_times_out_and_is_not_duplicated(self):
+        probe = _FakeProbe()
+        probe.outcomes["/drive"] = "hang"
+        monitor = _monitor(probe)
+
+        started = time.monotonic()
+        status = monitor.check_now()
+        assert time.monotonic() - started < 1.0
+        assert status.results["/drive"] == PROBE_TIMEOUT
+
+        monitor.check_now()
+        assert probe.calls.count("/drive") == 1  # Still waiting on the first probe
+        probe.release.set()
+
+    def test_status_is_cached(self):
+        probe = _FakeProbe()
+        monitor = _monitor(probe)
+        monitor.check_now()
+        calls = len(probe.calls)
+
+        assert monitor.status().connected is True
+        assert len(probe.calls) == calls
+
+    def test_background_thread_reports_disconnect_and_stop_does_not_block(self):
+        disconnected = threading.Event()
+        probe = _FakeProbe()
+        monitor = _monitor(probe, interval=0.01)
+        monitor.add_listener(lambda connected, reason: connected or disconnected.set())
+
+        monitor.start()
+        assert monitor.running
+        probe.outcomes["/drive"] = PROBE_MISSING
+        assert disconnected.wait(2)
+
+        probe.outcomes["/drive"] = "hang"
+        started = time.monotonic()
+        monitor.stop(timeout=0)
+        assert time.monotonic() - started < 0.5
+        probe.release.set()
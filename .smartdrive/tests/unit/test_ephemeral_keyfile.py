@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for ephemeral keyfiles.
+
+CHG-20261016-025: Decrypted keyfiles live in a sealed memfd on Linux (passed
+to VeraCrypt as /proc/<pid>/fd/<n>) and in a 0600 RAM temp file elsewhere.
+"""
+
+import os
+import stat
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+sys.path.insert(0, str(_smartdrive_root))
+
+from core import ephemeral_keyfile
+from core.ephemeral_keyfile import (
+    create_ephemeral_keyfile,
+    discard_ephemeral_keyfile,
+    is_memfd_keyfile,
+    memfd_supported,
+)
+
+KEY = os.urandom(64)
+
+needs_memfd = pytest.mark.skipif(not memfd_supported(), reason="memfd_create/procfs not available")
+
+
+@needs_memfd
+class TestMemfdKeyfile:
+    def test_other_processes_read_it_and_discard_closes_it(self):
+        path = create_ephemeral_keyfile(KEY)
+        try:
+            assert is_memfd_keyfile(path)
+            assert path.parent == Path(f"/proc/{os.getpid()}/fd")
+            # VeraCrypt runs in another process and opens the /proc path
+            result = subprocess.run(["cat", str(path)], capture_output=True, check=True)
+            assert result.stdout == KEY
+        finally:
+            discard_ephemeral_keyfile(path)
+        assert not is_memfd_keyfile(path)
+        assert not path.exists()
+
+    def test_contents_are_sealed(self):
+        path = create_ephemeral_keyfile(KEY)
+        try:
+            with pytest.raises(OSError):
+                with open(path, "r+b", buffering=0) as f:
+                    f.write(b"\x00")
+            assert path.read_bytes() == KEY
+        finally:
+            discard_ephemeral_keyfile(path)
+
+
+class TestTempFileFallback:
+    def test_owner_only_file_removed_on_discard(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ephemeral_keyfile, "_ram_temp_dir", lambda: tmp_path)
+        path = create_ephemeral_keyfile(KEY, prefix="sd_key_", use_memfd=False)
+        assert path.parent == tmp_path and path.name.startswith("sd_key_")
+        assert path.read_bytes() == KEY
+        if os.name != "nt":
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+        discard_ephemeral_keyfile(path)
+        assert not path.exists()
+
+    def test_memfd_failure_falls_back_to_file(self, tmp_path, monkeypatch):
+        def failing_memfd(data, name):
+            raise OSError("no memfd")
+
+        monkeypatch.setattr(ephemeral_keyfile, "_create_memfd", failing_memfd)
+        monkeypatch.setattr(ephemeral_keyfile, "_ram_temp_dir", lambda: tmp_path)
+        path = create_ephemeral_keyfile(KEY, use_memfd=True)
+        assert path.parent == tmp_path
+        discard_ephemeral_keyfile(path)
+
+    def test_discard_is_a_noop_for_missing_paths(self, tmp_path):
+        discard_ephemeral_keyfile(None)
+        discard_ephemeral_keyfile(tmp_path / "gone.key")
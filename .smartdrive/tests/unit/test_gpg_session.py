@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the gpg-agent/scdaemon warm-up session.
+
+CHG-20261016-021: Readiness is tracked as state; decrypts wait on the
+readiness event instead of sleeping and retrying.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+sys.path.insert(0, str(_smartdrive_root))
+
+from core import gpg_session
+from core.gpg_session import (
+    STATE_FAILED,
+    STATE_READY,
+    STATE_UNAVAILABLE,
+    GpgSession,
+    warm_up_for_mode,
+)
+
+
+class _FakeTools:
+    """Scripted replacement for _run_gpg_tool."""
+
+    def __init__(self, agent_failures=0, scdaemon_ok=True, missing=False):
+        self.agent_failures = agent_failures
+        self.scdaemon_ok = scdaemon_ok
+        self.missing = missing
+        self.calls = []
+
+    def __call__(self, args, timeout):
+        self.calls.append(args)
+        if self.missing:
+            raise FileNotFoundError(args[0])
+        if args[0] == "gpgconf":
+            return 0, ""
+        if args[1] == "GETINFO version":
+            if self.agent_failures:
+                self.agent_failures -= 1
+                return 1, "gpg-connect-agent: can't connect to the agent: IPC connect call failed"
+            return 0, "D 2.4.4\nOK\n"
+        if self.scdaemon_ok:
+            return 0, "D 2.4.4\nOK\n"
+        return 0, "ERR 67108881 No SmartCard daemon <GPG Agent>\n"
+
+
+@pytest.fixture
+def tools(monkeypatch):
+    fake = _FakeTools()
+    monkeypatch.setattr(gpg_session, "_run_gpg_tool", fake)
+    monkeypatch.setattr(gpg_session.Limits, "GPG_SESSION_RETRY_MIN_DELAY", 0.01)
+    return fake
+
+
+class TestGpgSession:
+    def test_warm_up_launches_agent_and_scdaemon(self, tools):
+        session = GpgSession()
+        assert session.wait_ready(5)
+        assert session.state == STATE_READY and session.scdaemon_ready
+        assert tools.calls[0] == ["gpgconf", "--launch", "gpg-agent"]
+        assert ["gpg-connect-agent", "SCD GETINFO version", "/bye"] in tools.calls
+
+    def test_agent_socket_is_polled_until_it_answers(self, tools):
+        tools.agent_failures = 2
+        session = GpgSession()
+        assert session.wait_ready(5)
+        assert tools.calls.count(["gpg-connect-agent", "GETINFO version", "/bye"]) == 3
+
+    def test_missing_scdaemon_does_not_block_agent_readiness(self, tools):
+        tools.scdaemon_ok = False
+        session = GpgSession()
+        assert session.wait_ready(5)
+        assert not session.scdaemon_ready
+
+    def test_ready_session_is_not_warmed_again(self, tools):
+        session = GpgSession()
+        session.wait_ready(5)
+        calls = len(tools.calls)
+
+        started = time.monotonic()
+        assert session.wait_ready(5)
+        assert time.monotonic() - started < 0.1
+        assert len(tools.calls) == calls
+
+    def test_restart_runs_a_new_round_trip(self, tools):
+        session = GpgSession()
+        session.wait_ready(5)
+        calls = len(tools.calls)
+
+        session.restart()
+        assert session.wait_ready(5)
+        assert len(tools.calls) > calls
+
+    def test_unavailable_and_failed_states(self, tools, monkeypatch):
+        tools.missing = True
+        session = GpgSession()
+        assert not session.wait_ready(5)
+        assert session.state == STATE_UNAVAILABLE
+
+        tools.missing = False
+        tools.agent_failures = 1000
+        monkeypatch.setattr(gpg_session.Limits, "GPG_SESSION_READY_TIMEOUT", 0.05)
+        session = GpgSession()
+        assert not session.wait_ready(5)
+        assert session.state == STATE_FAILED and "IPC connect" in session.error
+
+
+class TestWarmUpForMode:
+    def test_only_yubikey_modes_warm_up(self, monkeypatch):
+        warmed = []
+
+        class _Session:
+            def warm_up(self):
+                warmed.append(1)
+
+        monkeypatch.setattr(gpg_session, "get_gpg_session", _Session)
+
+        assert not warm_up_for_mode("pw_only")
+        assert not warm_up_for_mode("no_such_mode")
+        assert not warm_up_for_mode(None)
+        assert warm_up_for_mode("gpg_pw_only")
+        assert warm_up_for_mode("pw_gpg_keyfile")
+        assert warmed == [1, 1]
+
+
+class TestDecryptWaitsOnReadiness:
+    def test_startup_error_retries_without_sleeping(self, tools, monkeypatch, tmp_path):
+        from core import secrets
+
+        session = GpgSession()
+        monkeypatch.setattr(secrets, "get_gpg_session", lambda: session)
+        monkeypatch.setattr(secrets.time, "sleep", lambda s: pytest.fail("decrypt must not sleep"))
+
+        results = iter(
+            [
+                subprocess.CompletedProcess([], 2, b"", b"gpg: can't connect to the agent: IPC connect call failed"),
+                subprocess.CompletedProcess([], 0, b"secret", b""),
+            ]
+        )
+        monkeypatch.setattr(secrets.subprocess, "run", lambda *a, **k: next(results))
+
+        gpg_file = tmp_path / "seed.gpg"
+        gpg_file.write_bytes(b"x")
+        messages = []
+        assert secrets._decrypt_gpg_file_to_bytes(gpg_file, status_callback=messages.append) == b"secret"
+        assert "🔄 Retrying GPG decryption..." in messages
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the hash server challenge and hash-database stores.
+
+Tests hash_store.py (CHG-20261016-005) including:
+- Claim is single-use and reports missing / used / expired
+- TTL eviction and FIFO cap (memory backend)
+- Concurrent claims: exactly one winner (SQLite backend)
+- Legacy hash_database.json import
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from hash_store import (
+    CLAIM_EXPIRED,
+    CLAIM_MISSING,
+    CLAIM_OK,
+    CLAIM_USED,
+    MemoryChallengeStore,
+    SQLiteChallengeStore,
+    create_stores,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def challenge_store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryChallengeStore()
+    return SQLiteChallengeStore(tmp_path / "hash_server.db")
+
+
+class TestChallengeStore:
+    """Behaviour shared by both challenge backends."""
+
+    def test_claim_once(self, challenge_store):
+        challenge_store.put("c1", "salt1")
+        assert challenge_store.claim("c1") == (CLAIM_OK, "salt1")
+        assert challenge_store.claim("c1") == (CLAIM_USED, None)
+
+    def test_missing(self, challenge_store):
+        assert challenge_store.claim("nope") == (CLAIM_MISSING, None)
+
+    def test_expired(self, challenge_store):
+        challenge_store.put("c1", "salt1", ttl=-1)
+        assert challenge_store.claim("c1") == (CLAIM_EXPIRED, None)
+
+    def test_prune_removes_only_expired(self, challenge_store):
+        challenge_store.put("old", "s", ttl=-1)
+        challenge_store.put("new", "s")
+        challenge_store.prune()
+        assert challenge_store.claim("old") == (CLAIM_MISSING, None)
+        assert challenge_store.claim("new") == (CLAIM_OK, "s")
+
+
+class TestMemoryChallengeStore:
+    """FIFO + TTL specifics."""
+
+    def test_fifo_cap(self):
+        store = MemoryChallengeStore(max_entries=3)
+        for i in range(5):
+            store.put(f"c{i}", "s")
+        assert store.claim("c0")[0] == CLAIM_MISSING
+        assert store.claim("c4")[0] == CLAIM_OK
+
+    def test_expired_evicted_on_put(self):
+        store = MemoryChallengeStore()
+        store.put("old", "s", ttl=-1)
+        store.put("new", "s")
+        assert store.claim("old")[0] == CLAIM_MISSING
+
+
+class TestSQLiteChallengeStore:
+    """Cross-connection atomicity."""
+
+    def test_concurrent_claims_single_winner(self, tmp_path):
+        db = tmp_path / "hash_server.db"
+        SQLiteChallengeStore(db).put("c1", "salt")
+
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            store = SQLiteChallengeStore(db)  # separate connection per "worker"
+            barrier.wait()
+            results.append(store.claim("c1")[0])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results.count(CLAIM_OK) == 1
+        assert results.count(CLAIM_USED) == 7
+
+    def test_persists_across_instances(self, tmp_path):
+        db = tmp_path / "hash_server.db"
+        SQLiteChallengeStore(db).put("c1", "salt", ttl=3600)
+        assert SQLiteChallengeStore(db).claim("c1") == (CLAIM_OK, "salt")
+
+
+class TestHashStore:
+    """Hash database backends."""
+
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_imports_legacy_json(self, tmp_path, backend):
+        (tmp_path / "hash_database.json").write_text(json.dumps({"1.0": "aa", "1.1": "bb"}))
+        _, hashes = create_stores(tmp_path, backend=backend)
+        assert hashes.all() == {"1.0": "aa", "1.1": "bb"}
+
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_upsert(self, tmp_path, backend):
+        _, hashes = create_stores(tmp_path, backend=backend)
+        hashes.set("1.0", "aa")
+        hashes.set("1.0", "cc")
+        hashes.set("2.0", "dd")
+        assert hashes.all() == {"1.0": "cc", "2.0": "dd"}
+
+    def test_sqlite_import_only_once(self, tmp_path):
+        legacy = tmp_path / "hash_database.json"
+        legacy.write_text(json.dumps({"1.0": "aa"}))
+        _, hashes = create_stores(tmp_path, backend="sqlite")
+        hashes.set("2.0", "bb")
+        legacy.write_text(json.dumps({"9.9": "zz"}))
+        _, reopened = create_stores(tmp_path, backend="sqlite")
+        assert reopened.all() == {"1.0": "aa", "2.0": "bb"}
+
+    def test_sqlite_renames_legacy_json_after_import(self, tmp_path):
+        legacy = tmp_path / "hash_database.json"
+        legacy.write_text(json.dumps({"1.0": "aa"}))
+        create_stores(tmp_path, backend="sqlite")
+        assert not legacy.exists()
+        assert json.loads((tmp_path / "hash_database.json.migrated").read_text()) == {"1.0": "aa"}
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            create_stores(tmp_path, backend="redis")
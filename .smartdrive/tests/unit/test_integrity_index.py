@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental integrity digest index.
+
+Tests core/integrity.py (CHG-20261016-002) including:
+- Aggregate hash identical to a full read
+- Unchanged files are not re-read when the index is valid
+- Only changed files are re-read
+- Index entries keyed by relative POSIX path
+- Paranoid mode always re-reads
+- Mismatch reporting names the changed files
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core.integrity import Integrity
+
+
+def _full_hash(scripts_dir: Path, names=Integrity.HASHED_SCRIPTS) -> str:
+    """Reference implementation (full read, no index)."""
+    hasher = hashlib.sha256()
+    for name in sorted(names):
+        path = scripts_dir / name
+        if path.exists():
+            hasher.update(name.encode("utf-8") + b"\0" + hashlib.sha256(path.read_bytes()).digest())
+    return hasher.hexdigest()
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate mtime so entries are outside the racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def launcher_root(tmp_path):
+    """Create a minimal .smartdrive layout with a few hashed scripts."""
+    scripts = tmp_path / ".smartdrive" / "scripts"
+    scripts.mkdir(parents=True)
+    (tmp_path / ".smartdrive" / "integrity").mkdir()
+    for name in Integrity.HASHED_SCRIPTS[:4]:
+        (scripts / name).write_text(f"# {name}\nprint('x')\n", encoding="utf-8")
+        _age(scripts / name)
+    return tmp_path
+
+
+def _dirs(root: Path):
+    return root / ".smartdrive" / "scripts", root / ".smartdrive" / "integrity" / Integrity.INDEX_FILE
+
+
+class TestDigestIndex:
+    """Tests for Integrity.calculate_scripts_hash() with an index."""
+
+    def test_matches_full_read_digest(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        assert Integrity.calculate_scripts_hash(scripts) == _full_hash(scripts)
+        assert Integrity.calculate_scripts_hash(scripts, index_file=index) == _full_hash(scripts)
+        # Served from index
+        assert Integrity.calculate_scripts_hash(scripts, index_file=index) == _full_hash(scripts)
+
+    def test_index_written(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        Integrity.calculate_scripts_hash(scripts, index_file=index)
+        data = json.loads(index.read_text(encoding="utf-8"))
+        assert data["schema_version"] == Integrity.INDEX_SCHEMA_VERSION
+        name = Integrity.HASHED_SCRIPTS[0]
+        assert data["files"][name]["sha256"] == hashlib.sha256((scripts / name).read_bytes()).hexdigest()
+
+    def test_unchanged_files_not_reread(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        Integrity.calculate_scripts_hash(scripts, index_file=index)
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("file re-read")):
+            Integrity.calculate_scripts_hash(scripts, index_file=index)
+
+    def test_only_changed_file_reread(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        Integrity.calculate_scripts_hash(scripts, index_file=index)
+
+        target = scripts / Integrity.HASHED_SCRIPTS[1]
+        target.write_text("# tampered\n", encoding="utf-8")
+        _age(target)
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=lambda p: open(p, "rb").read()) as spy:
+            result = Integrity.calculate_scripts_hash(scripts, index_file=index)
+        assert [call.args[0] for call in spy.call_args_list] == [target]
+        assert result == _full_hash(scripts)
+
+    def test_entries_keyed_by_relative_posix_path(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        (scripts / "sub").mkdir()
+        (scripts / "sub" / "a.py").write_text("a\n", encoding="utf-8")
+        (scripts / "a.py").write_text("top\n", encoding="utf-8")
+        names = [str(Path("sub") / "a.py"), "a.py"]
+
+        result = Integrity.hash_files(scripts, names, index_file=index)
+        data = json.loads(index.read_text(encoding="utf-8"))
+        assert {"sub/a.py", "a.py"} <= set(data["files"])
+        assert data["files"]["sub/a.py"]["sha256"] == hashlib.sha256(b"a\n").hexdigest()
+        assert result == _full_hash(scripts, ["a.py", "sub/a.py"])
+
+    def test_change_invalidates(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        before = Integrity.calculate_scripts_hash(scripts, index_file=index)
+
+        target = scripts / Integrity.HASHED_SCRIPTS[1]
+        target.write_text("# tampered\n", encoding="utf-8")
+
+        after = Integrity.calculate_scripts_hash(scripts, index_file=index)
+        assert after != before
+        assert after == _full_hash(scripts)
+
+    def test_same_size_edit_with_restored_mtime_detected(self, launcher_root):
+        """Restoring mtime after an edit must not reuse the cached digest (ctime changes)."""
+        scripts, index = _dirs(launcher_root)
+        before = Integrity.calculate_scripts_hash(scripts, index_file=index)
+
+        target = scripts / Integrity.HASHED_SCRIPTS[3]
+        st = target.stat()
+        content = target.read_bytes()
+        time.sleep(0.05)  # step past coarse ctime granularity
+        target.write_bytes(content[::-1])
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert target.stat().st_size == st.st_size
+
+        after = Integrity.calculate_scripts_hash(scripts, index_file=index)
+        assert after != before
+        assert after == _full_hash(scripts)
+
+    def test_racy_entries_rehashed(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        target = scripts / Integrity.HASHED_SCRIPTS[0]
+        target.write_text("# fresh\n", encoding="utf-8")  # mtime ~ now
+        Integrity.calculate_scripts_hash(scripts, index_file=index)
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=lambda p: open(p, "rb").read()) as spy:
+            Integrity.calculate_scripts_hash(scripts, index_file=index)
+            assert spy.called
+
+    def test_paranoid_always_rereads(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        Integrity.calculate_scripts_hash(scripts, index_file=index)
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=lambda p: open(p, "rb").read()) as spy:
+            result = Integrity.calculate_scripts_hash(scripts, index_file=index, paranoid=True)
+            assert spy.called
+        assert result == _full_hash(scripts)
+
+    def test_corrupt_index_ignored(self, launcher_root):
+        scripts, index = _dirs(launcher_root)
+        index.write_text("{not json", encoding="utf-8")
+        assert Integrity.calculate_scripts_hash(scripts, index_file=index) == _full_hash(scripts)
+
+    def test_forged_aggregate_not_trusted_after_change(self, launcher_root):
+        """A stale aggregate must never be returned once a file's stat key changes."""
+        scripts, index = _dirs(launcher_root)
+        Integrity.calculate_scripts_hash(scripts, index_file=index)
+        (scripts / Integrity.HASHED_SCRIPTS[2]).write_text("# extra line\nmore\n", encoding="utf-8")
+        assert Integrity.calculate_scripts_hash(scripts, index_file=index) == _full_hash(scripts)
+
+
+class TestValidateWithIndex:
+    """Tests for validate_integrity() using the digest index."""
+
+    def test_mismatch_names_changed_file(self, launcher_root):
+        Integrity.create_manifest(launcher_root)
+        scripts, _ = _dirs(launcher_root)
+        changed = Integrity.HASHED_SCRIPTS[3]
+        (scripts / changed).write_text("# tampered\n", encoding="utf-8")
+
+        result = Integrity.validate_integrity(launcher_root, verify_signature=False)
+        assert not result.valid
+        assert result.mismatched_files == [changed]
+
+    def test_valid_after_manifest(self, launcher_root):
+        Integrity.create_manifest(launcher_root)
+        result = Integrity.validate_integrity(launcher_root, verify_signature=False)
+        assert result.valid
+        result = Integrity.validate_integrity(launcher_root, verify_signature=False, paranoid=True)
+        assert result.valid
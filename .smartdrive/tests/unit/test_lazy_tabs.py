@@ -0,0 +1,84 @@
+"""
+Tests for lazily built GUI tab pages.
+
+CHG-20261016-018: LazyTabWidget builds a page on first view and keeps it;
+SettingsDialog only builds the tab it opens on.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+if str(_smartdrive_root / "scripts") not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root / "scripts"))
+
+pytest.importorskip("PyQt6.QtWidgets", reason="PyQt6 not installed")
+
+from PyQt6.QtWidgets import QApplication, QLabel
+
+
+@pytest.fixture(scope="module")
+def app():
+    # The platform plugin is chosen when the QApplication is created
+    with pytest.MonkeyPatch.context() as mp:
+        if "QT_QPA_PLATFORM" not in os.environ:
+            mp.setenv("QT_QPA_PLATFORM", "offscreen")
+        yield QApplication.instance() or QApplication(sys.argv)
+
+
+@pytest.fixture
+def tabs(app):
+    from gui import LazyTabWidget
+
+    return LazyTabWidget()
+
+
+class TestLazyTabWidget:
+    def test_pages_build_on_first_view_only(self, tabs):
+        built = []
+
+        def builder(name):
+            built.append(name)
+            return QLabel(name)
+
+        tabs.addLazyTab(lambda: builder("one"), "One")
+        tabs.addLazyTab(lambda: builder("two"), "Two")
+        assert built == []  # Adding the first tab does not build it
+
+        tabs.materialize(tabs.currentIndex())
+        assert built == ["one"]
+        assert tabs.is_materialized(0) and not tabs.is_materialized(1)
+
+        tabs.setCurrentIndex(1)
+        tabs.setCurrentIndex(0)
+        tabs.setCurrentIndex(1)
+        assert built == ["one", "two"]  # Cached after the first view
+
+    def test_materialize_returns_cached_page_and_signals_once(self, tabs):
+        seen = []
+        tabs.page_materialized.connect(seen.append)
+        tabs.addLazyTab(lambda: QLabel("page"), "Page")
+
+        page = tabs.materialize(0)
+        assert isinstance(page, QLabel)
+        assert tabs.materialize(0) is page
+        assert seen == [0]
+        assert tabs.materialize(5) is None
+
+
+class TestSettingsDialogUsesLazyTabs:
+    def test_schema_tabs_are_added_lazily(self, app):
+        import inspect
+
+        from gui import SettingsDialog
+
+        source = inspect.getsource(SettingsDialog._build_ui)
+        assert "LazyTabWidget()" in source
+        assert "addLazyTab(" in source
+        assert "self._create_tab(tab_name)" not in source
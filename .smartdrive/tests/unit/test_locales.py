@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for per-language translation catalogs and widget bindings.
+
+CHG-20261016-019: Catalogs in locales/<domain>_<lang>.py load on first use;
+gui_i18n.TranslationBindings retranslates only bound widgets.
+"""
+
+import gc
+import sys
+from pathlib import Path
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+sys.path.insert(0, str(_smartdrive_root))
+sys.path.insert(0, str(_smartdrive_root / "scripts"))
+
+from gui_i18n import AVAILABLE_LANGUAGES, TranslationBindings, tr
+
+from locales import CatalogSet, load_catalog
+
+
+class _Label:
+    """Stand-in for a QLabel: records setText/setToolTip calls."""
+
+    def __init__(self):
+        self.text = None
+        self.tooltip = None
+
+    def setText(self, text):
+        self.text = text
+
+    def setToolTip(self, text):
+        self.tooltip = text
+
+
+class TestCatalogSet:
+    def test_languages_load_on_first_access_only(self):
+        catalogs = CatalogSet("gui", AVAILABLE_LANGUAGES)
+        assert "de" in catalogs and len(catalogs) == len(AVAILABLE_LANGUAGES)
+        assert catalogs.loaded() == []
+
+        assert catalogs["de"]["btn_mount"] == "🔓 Einbinden"
+        assert catalogs.loaded() == ["de"]
+        assert catalogs["de"] is catalogs["de"]  # Cached
+
+    def test_unknown_language_raises_key_error(self):
+        catalogs = CatalogSet("gui", ["en"])
+        assert "xx" not in catalogs
+        assert catalogs.get("xx") is None
+        with pytest.raises(KeyError):
+            load_catalog("gui", "xx")
+
+    def test_catalog_modules_are_not_kept_in_sys_modules(self):
+        CatalogSet("cli", ["fr"])["fr"]
+        assert "locales.cli_fr" not in sys.modules
+
+    def test_every_available_language_has_gui_and_cli_catalog(self):
+        for lang in AVAILABLE_LANGUAGES:
+            assert (_smartdrive_root / "locales" / f"gui_{lang}.py").exists()
+            assert (_smartdrive_root / "locales" / f"cli_{lang}.py").exists()
+
+
+class TestTranslate:
+    def test_placeholder_free_template_ignores_kwargs(self):
+        assert tr("btn_mount", lang="en", unused=1) == "🔓 Mount"
+
+    def test_placeholders_are_formatted(self):
+        assert tr("keyfile_selected_many", lang="en", count=3) == "3 keyfiles selected"
+
+    def test_unknown_language_falls_back_to_english(self):
+        assert tr("btn_mount", lang="xx") == "🔓 Mount"
+
+
+class TestTranslationBindings:
+    def test_retranslate_updates_bound_setters(self):
+        bindings = TranslationBindings()
+        label = _Label()
+        bindings.bind(label, "btn_save")
+        bindings.bind(label, "btn_cancel", setter="setToolTip")
+
+        assert bindings.retranslate("de") == 2
+        assert label.text == tr("btn_save", lang="de")
+        assert label.tooltip == tr("btn_cancel", lang="de")
+
+    def test_collected_widgets_are_dropped(self):
+        bindings = TranslationBindings()
+        bindings.bind(_Label(), "btn_save")
+        gc.collect()
+        assert len(bindings) == 0
+        assert bindings.retranslate("en") == 0
+
+    def test_deleted_qt_objects_are_dropped(self):
+        class _Deleted(_Label):
+            def setText(self, text):
+                raise RuntimeError("wrapped C/C++ object has been deleted")
+
+        bindings = TranslationBindings()
+        widget = _Deleted()
+        bindings.bind(widget, "btn_save")
+        assert bindings.retranslate("en") == 0
+        assert len(bindings) == 0
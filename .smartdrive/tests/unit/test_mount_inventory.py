@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared VeraCrypt mount inventory.
+
+CHG-20261016-024: One parsed `veracrypt --text --list` snapshot, merged with
+the OS mount table, answers every "is it mounted?" query for a short TTL.
+"""
+
+import sys
+from pathlib import Path
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+sys.path.insert(0, str(_smartdrive_root))
+
+from core import mount_inventory
+from core.mount_inventory import MountInventory, normalize_mount_point, parse_mountinfo_table, parse_veracrypt_list
+
+VERBOSE_LIST = """Slot: 1
+Volume: /dev/sdb2
+Virtual Device: /dev/mapper/veracrypt1
+Mount Directory: /home/user/veradrive
+Size: 29 GiB
+Type: Normal
+Read-Only: No
+Hidden Volume Protected: No
+Encryption Algorithm: AES
+
+Slot: 3
+Volume: /home/user/My Files/vault.hc
+Virtual Device: /dev/mapper/veracrypt3
+Mount Directory: /media/veracrypt3
+Size: 100 MiB
+Type: Hidden
+Read-Only: Yes
+"""
+
+MOUNTINFO = (
+    "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+    "98 22 253:1 / /home/user/veradrive rw,relatime shared:40 - ext4 /dev/mapper/veracrypt1 rw\n"
+    "99 22 0:50 / /mnt/with\\040space rw - fuse.sshfs host:/srv rw\n"
+)
+
+
+class _Lister:
+    def __init__(self, output=VERBOSE_LIST):
+        self.output = output
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.output
+
+
+def _table(raw=MOUNTINFO):
+    return lambda: (parse_mountinfo_table(raw), raw)
+
+
+class TestParsing:
+    def test_verbose_listing_becomes_slot_records(self):
+        first, second = parse_veracrypt_list(VERBOSE_LIST)
+        assert (first.slot, first.volume, first.mount_point) == (1, "/dev/sdb2", "/home/user/veradrive")
+        assert (first.size, first.volume_type, first.read_only) == ("29 GiB", "Normal", False)
+        assert second.volume == "/home/user/My Files/vault.hc"
+        assert (second.volume_type, second.read_only) == ("Hidden", True)
+
+    def test_short_listing_with_spaces(self):
+        output = "2: /home/user/My Files/vault.hc /dev/mapper/veracrypt2 /mnt/my vault\n"
+        (slot,) = parse_veracrypt_list(output)
+        assert slot.slot == 2
+        assert slot.volume == "/home/user/My Files/vault.hc"
+        assert slot.virtual_device == "/dev/mapper/veracrypt2"
+        assert slot.mount_point == "/mnt/my vault"
+
+    def test_mountinfo_table(self):
+        table = parse_mountinfo_table(MOUNTINFO)
+        assert table["/home/user/veradrive"] == ("/dev/mapper/veracrypt1", "ext4")
+        assert table["/mnt/with space"] == ("host:/srv", "fuse.sshfs")
+
+    def test_normalize_mount_point(self):
+        assert normalize_mount_point("v", "windows") == "V:"
+        assert normalize_mount_point("V:\\", "windows") == "V:"
+        assert normalize_mount_point("/mnt/x/", "linux") == "/mnt/x"
+
+
+class TestMountInventory:
+    def test_queries_share_one_listing_and_merge_os_data(self):
+        lister = _Lister()
+        inventory = MountInventory(lister, _table(), system="linux")
+        assert inventory.is_mounted("/home/user/veradrive/")
+        assert not inventory.is_mounted("/media/other")
+        assert inventory.find(volume="/dev/sdb2").fs_type == "ext4"
+        assert lister.calls == 1
+
+    def test_ttl_mount_table_change_and_invalidate_relist(self, monkeypatch):
+        lister = _Lister()
+        raw = {"text": MOUNTINFO}
+        inventory = MountInventory(lister, lambda: (parse_mountinfo_table(raw["text"]), raw["text"]), system="linux")
+        inventory.slots()
+        raw["text"] = MOUNTINFO + "100 22 0:51 / /mnt/new rw - tmpfs tmpfs rw\n"
+        inventory.slots()
+        assert lister.calls == 2
+
+        inventory.invalidate()
+        inventory.slots()
+        assert lister.calls == 3
+
+        monkeypatch.setattr(mount_inventory.Limits, "MOUNT_INVENTORY_TTL", 0.0)
+        inventory.slots()
+        assert lister.calls == 4
+
+    def test_nothing_mounted_is_not_a_fallback(self):
+        inventory = MountInventory(_Lister(""), _table(), system="linux")
+        assert inventory.slots() == ()
+        # Listing worked: a plain ext4 mount is not a VeraCrypt volume
+        assert not inventory.is_mounted("/home/user/veradrive")
+        assert inventory.os_mounted("/home/user/veradrive")
+
+    def test_unlistable_platform_uses_drive_letters(self):
+        letters = {"C:": ("", ""), "V:": ("", "")}
+        inventory = MountInventory(_Lister(None), lambda: (letters, None), system="windows")
+        assert inventory.is_mounted("V")
+        assert not inventory.is_mounted("W:")
+        assert inventory.slots() == ()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the event-driven mount monitor.
+
+Tests core/mount_monitor.py including:
+- Mount target resolution from config
+- /proc/self/mountinfo parsing
+- Config caching (no re-read unless mtime changes)
+- Listener notification on transitions only
+- Adaptive poller back-off and refresh()
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core import mount_monitor as mm
+from core.mount_monitor import (
+    MountMonitor,
+    MountTarget,
+    parse_mountinfo_table,
+    probe_mount_state,
+    resolve_mount_target,
+)
+
+MOUNTINFO_SAMPLE = (
+    "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+    "35 22 0:31 / /proc rw,nosuid shared:12 - proc proc rw\n"
+    "98 22 253:0 / /home/user/my\\040vault rw,relatime shared:40 - ext4 /dev/mapper/veracrypt1 rw\n"
+)
+
+
+def _write_config(path: Path, mount_point: str) -> None:
+    path.write_text(json.dumps({"unix": {"mount_point": mount_point}, "windows": {"mount_letter": "V"}}))
+
+
+class TestResolveMountTarget:
+    """Tests for resolve_mount_target()."""
+
+    def test_windows_letter_normalized(self):
+        target = resolve_mount_target({"windows": {"mount_letter": "x:"}}, system="windows")
+        assert target == MountTarget(system="windows", location="X")
+
+    def test_windows_default_letter(self):
+        target = resolve_mount_target({}, system="windows")
+        assert target.location == "V"
+
+    def test_unix_missing_mount_point(self):
+        assert resolve_mount_target({"unix": {}}, system="linux") is None
+
+    def test_unix_expands_user(self):
+        target = resolve_mount_target({"unix": {"mount_point": "~/veradrive"}}, system="linux")
+        assert target.location == os.path.realpath(os.path.expanduser("~/veradrive"))
+
+
+class TestMountinfoParsing:
+    """Tests for mountinfo parsing and probing."""
+
+    def test_parses_mount_points(self):
+        table = parse_mountinfo_table(MOUNTINFO_SAMPLE)
+        assert table["/"] == ("/dev/sda1", "ext4")
+        assert table["/proc"] == ("proc", "proc")
+
+    def test_unescapes_spaces(self):
+        table = parse_mountinfo_table(MOUNTINFO_SAMPLE)
+        assert table["/home/user/my vault"] == ("/dev/mapper/veracrypt1", "ext4")
+
+    def test_probe_linux_uses_mountinfo(self):
+        target = MountTarget(system="linux", location="/home/user/my vault")
+        assert probe_mount_state(target, MOUNTINFO_SAMPLE) is True
+        assert probe_mount_state(MountTarget("linux", "/mnt/other"), MOUNTINFO_SAMPLE) is False
+
+    def test_probe_none_target(self):
+        assert probe_mount_state(None) is False
+
+    def test_probe_never_spawns_subprocess(self):
+        target = MountTarget(system="linux", location="/mnt/none")
+        with patch("subprocess.run") as mock_run:
+            probe_mount_state(target, MOUNTINFO_SAMPLE)
+            mock_run.assert_not_called()
+
+
+class TestMountMonitor:
+    """Tests for MountMonitor state handling."""
+
+    def test_config_read_once_until_mtime_changes(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        _write_config(cfg, str(tmp_path / "mnt"))
+        monitor = MountMonitor(cfg, system="linux")
+
+        with patch.object(mm, "resolve_mount_target", wraps=mm.resolve_mount_target) as spy:
+            monitor.target()
+            monitor.target()
+            assert spy.call_count == 1
+
+            st = cfg.stat()
+            os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            monitor.target()
+            assert spy.call_count == 2
+
+    def test_missing_config_is_unmounted(self, tmp_path):
+        monitor = MountMonitor(tmp_path / "missing.json", system="linux")
+        assert monitor.is_mounted() is False
+
+    def test_listeners_fire_only_on_transition(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        _write_config(cfg, str(tmp_path / "mnt"))
+        monitor = MountMonitor(cfg, system="linux")
+        events = []
+        monitor.add_listener(events.append)
+
+        states = iter([False, False, True, True, False])
+        with patch.object(mm, "probe_mount_state", side_effect=lambda *a, **k: next(states)):
+            for _ in range(5):
+                monitor.check_now()
+
+        # First probe establishes the baseline without notifying
+        assert events == [True, False]
+
+    def test_failing_listener_does_not_break_others(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        _write_config(cfg, str(tmp_path / "mnt"))
+        monitor = MountMonitor(cfg, system="linux")
+        received = []
+
+        def bad(_):
+            raise RuntimeError("boom")
+
+        monitor.add_listener(bad)
+        monitor.add_listener(received.append)
+        states = iter([False, True])
+        with patch.object(mm, "probe_mount_state", side_effect=lambda *a, **k: next(states)):
+            monitor.check_now()
+            monitor.check_now()
+        assert received == [True]
+
+    def test_poller_refresh_wakes_immediately(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        _write_config(cfg, str(tmp_path / "mnt"))
+        monitor = MountMonitor(cfg, system="windows")
+        assert monitor.backend == "poll"
+
+        mounted = {"value": False}
+        events = []
+        monitor.add_listener(events.append)
+
+        with (
+            patch.object(mm, "probe_mount_state", side_effect=lambda *a, **k: mounted["value"]),
+            patch.object(mm.Limits, "MOUNT_MONITOR_MIN_INTERVAL", 30.0),
+        ):
+            monitor.start()
+            try:
+                mounted["value"] = True
+                monitor.refresh()
+                deadline = time.monotonic() + 5
+                while not events and time.monotonic() < deadline:
+                    time.sleep(0.01)
+            finally:
+                monitor.stop()
+
+        assert events == [True]
+        assert not monitor.running
+
+    @pytest.mark.skipif(not mm.PROC_MOUNTINFO.exists(), reason="Linux /proc/self/mountinfo required")
+    def test_mountinfo_backend_starts_and_stops(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        _write_config(cfg, "/")
+        monitor = MountMonitor(cfg, system="linux")
+        assert monitor.backend == "mountinfo"
+
+        monitor.start()
+        try:
+            assert monitor.running
+            assert monitor.is_mounted() is True  # "/" is always a mount point
+        finally:
+            monitor.stop()
+        assert not monitor.running
+
+
+class TestQtBridge:
+    """Tests for create_qt_mount_signal()."""
+
+    def test_bridge_listener_can_be_detached(self, tmp_path):
+        pytest.importorskip("PyQt6.QtCore")
+        from core.mount_monitor import create_qt_mount_signal
+
+        cfg = tmp_path / "config.json"
+        _write_config(cfg, "/")
+        monitor = MountMonitor(cfg, system="linux")
+        bridge = create_qt_mount_signal(monitor)
+        assert monitor._listeners == [bridge.listener]
+
+        # The GUI rebinds to another drive's monitor this way (remote mode)
+        monitor.remove_listener(bridge.listener)
+        assert monitor._listeners == []
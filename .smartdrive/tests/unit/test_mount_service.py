@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent mount service.
+
+Tests scripts/mount_service.py (CHG-20261016-015) including:
+- sys.exit() and exceptions inside mount.py end the request, not the process
+- Worker process is reused across requests
+- Password reaches mount.main() over the pipe, never on the worker's argv
+- Script and child-process output cannot corrupt the response channel
+- Worker restarts once the scripts it imported change on disk
+"""
+
+import sys
+import textwrap
+import types
+from pathlib import Path
+
+import pytest
+
+# Add .smartdrive/scripts to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root / "scripts") not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root / "scripts"))
+
+from mount_service import OP_MOUNT, OP_UNMOUNT, MountRequest, MountServiceClient, execute
+
+FAKE_MOUNT = textwrap.dedent("""
+    import os
+    import sys
+
+    def main(password=None, keyfile_paths=None, gui_mode=False, config_path=None):
+        print("mounting...")
+        os.system("echo child output")
+        if password != "s3cret":
+            raise RuntimeError("Wrong password")
+        with open(os.path.join(os.path.dirname(__file__), "argv.txt"), "w") as f:
+            f.write(" ".join(sys.argv) + "|" + str(os.getpid()))
+    """)
+
+FAKE_UNMOUNT = textwrap.dedent("""
+    import sys
+
+    def main():
+        sys.exit(0 if "--gui" in sys.argv else 3)
+    """)
+
+
+@pytest.fixture
+def scripts_dir(tmp_path):
+    (tmp_path / "mount.py").write_text(FAKE_MOUNT, encoding="utf-8")
+    (tmp_path / "unmount.py").write_text(FAKE_UNMOUNT, encoding="utf-8")
+    return tmp_path
+
+
+class TestExecute:
+    def test_sys_exit_becomes_exit_code(self, monkeypatch):
+        fake = types.SimpleNamespace(main=lambda **kw: sys.exit(1))
+        monkeypatch.setitem(sys.modules, "mount", fake)
+
+        response = execute(MountRequest(OP_MOUNT), capture=True)
+        assert not response.ok and response.exit_code == 1
+
+    def test_exception_reported_as_error_line(self, monkeypatch):
+        def main(**kw):
+            raise RuntimeError("Post-recovery rekey required before mount")
+
+        monkeypatch.setitem(sys.modules, "mount", types.SimpleNamespace(main=main))
+        response = execute(MountRequest(OP_MOUNT), capture=True)
+        assert response.error == "RuntimeError: Post-recovery rekey required before mount"
+
+    def test_missing_config(self, tmp_path):
+        response = execute(MountRequest(OP_MOUNT, config_path=str(tmp_path / "config.json")))
+        assert not response.ok and "Config file not found" in response.error
+
+    def test_password_not_in_repr(self):
+        assert "s3cret" not in repr(MountRequest(OP_MOUNT, password="s3cret"))
+
+
+class TestWorker:
+    def test_round_trip_and_reuse(self, scripts_dir):
+        client = MountServiceClient(scripts_dir)
+        try:
+            bad = client.call(MountRequest(OP_MOUNT, password="nope"), timeout=30)
+            assert not bad.ok and bad.error == "RuntimeError: Wrong password"
+            assert "mounting..." in bad.output
+            pid = client._proc.pid
+
+            ok = client.call(MountRequest(OP_MOUNT, password="s3cret"), timeout=30)
+            assert ok.ok
+            argv, worker_pid = (scripts_dir / "argv.txt").read_text(encoding="utf-8").split("|")
+            assert int(worker_pid) == pid
+            assert "s3cret" not in argv
+
+            assert client.call(MountRequest(OP_UNMOUNT), timeout=30).ok
+            assert client.call(MountRequest(OP_UNMOUNT, gui=False), timeout=30).exit_code == 3
+            assert client._proc.pid == pid
+        finally:
+            client.close()
+
+    def test_restarts_after_worker_exit(self, scripts_dir):
+        client = MountServiceClient(scripts_dir)
+        try:
+            assert client.call(MountRequest(OP_UNMOUNT), timeout=30).ok
+            client._proc.kill()
+            client._proc.wait()
+            assert client.call(MountRequest(OP_UNMOUNT), timeout=30).ok
+        finally:
+            client.close()
+
+    def test_restarts_after_scripts_updated(self, scripts_dir):
+        client = MountServiceClient(scripts_dir)
+        try:
+            assert client.call(MountRequest(OP_UNMOUNT, gui=False), timeout=30).exit_code == 3
+            pid = client._proc.pid
+
+            # What update.py does: overwrite the module in place
+            (scripts_dir / "unmount.py").write_text(FAKE_UNMOUNT.replace("else 3", "else 42"), encoding="utf-8")
+
+            assert client.call(MountRequest(OP_UNMOUNT, gui=False), timeout=30).exit_code == 42
+            assert client._proc.pid != pid
+        finally:
+            client.close()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for update rollback snapshots.
+
+Tests core/snapshot.py (CHG-20261016-014) including:
+- Rollback restores changed files and removes files added by the update
+- Unchanged files are deduplicated across snapshots and not re-read
+- User data and virtual environments are never captured or touched
+- Retention by count and size budget, with unreferenced objects removed
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core.snapshot import SnapshotError, SnapshotStore
+
+_OLD_NS = 1_600_000_000 * 10**9  # Well outside the racy window
+
+
+def _write(path: Path, data: str, age: int = 0) -> Path:
+    """Write with an old mtime; a later 'age' gives updated files a new stat key."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data, encoding="utf-8")
+    ns = _OLD_NS + age * 10**9
+    os.utime(path, ns=(ns, ns))
+    return path
+
+
+@pytest.fixture
+def deploy_root(tmp_path):
+    root = tmp_path / ".smartdrive"
+    _write(root / "core" / "a.py", "a1")
+    _write(root / "core" / "b.py", "b1")
+    _write(root / "scripts" / "gui.py", "gui1")
+    _write(root / "scripts" / "config.json", "{}")
+    _write(root / "keys" / "keyfile.vc.gpg", "secret")
+    _write(root / ".venv-linux" / "bin" / "python", "venv")
+    return root
+
+
+def _objects(store):
+    return [p for p in (store.root / "objects").rglob("*") if p.is_file()]
+
+
+class TestSnapshot:
+    def test_rollback_restores_tree(self, deploy_root):
+        store = SnapshotStore(deploy_root)
+        snap = store.create("1.0.0", label="pre-update")
+        assert set(snap.files) == {"core/a.py", "core/b.py", "scripts/gui.py"}
+
+        # Simulated update: changed, added and removed files, user data edited
+        _write(deploy_root / "core" / "a.py", "a2", age=1)
+        _write(deploy_root / "core" / "new.py", "new", age=1)
+        (deploy_root / "core" / "b.py").unlink()
+        _write(deploy_root / "scripts" / "config.json", '{"user": 1}')
+
+        result = store.rollback(snap.id)
+        assert sorted(result.restored) == ["core/a.py", "core/b.py"]
+        assert result.deleted == ["core/new.py"]
+        assert result.unchanged == 1
+        assert (deploy_root / "core" / "a.py").read_text(encoding="utf-8") == "a1"
+        assert (deploy_root / "core" / "b.py").read_text(encoding="utf-8") == "b1"
+        assert not (deploy_root / "core" / "new.py").exists()
+        assert (deploy_root / "scripts" / "config.json").read_text(encoding="utf-8") == '{"user": 1}'
+        assert (deploy_root / "keys" / "keyfile.vc.gpg").exists()
+        assert store.head() == snap.id
+
+    def test_unchanged_files_deduplicated_and_not_read(self, deploy_root):
+        store = SnapshotStore(deploy_root)
+        store.create("1.0.0")
+        assert len(_objects(store)) == 3
+
+        _write(deploy_root / "core" / "a.py", "a2", age=1)
+        real_store = store._store_object
+        read = []
+
+        def spy(path):
+            read.append(path)
+            return real_store(path)
+
+        with patch.object(store, "_store_object", side_effect=spy):
+            store.create("1.1.0")
+
+        assert read == [deploy_root / "core" / "a.py"]
+        assert len(_objects(store)) == 4
+
+    def test_retention_by_count_and_size(self, deploy_root):
+        store = SnapshotStore(deploy_root, keep=2)
+        for i in range(4):
+            _write(deploy_root / "core" / "a.py", f"a{i}", age=i)
+            store.create(f"1.0.{i}")
+
+        snapshots = store.list()
+        assert [s.version for s in snapshots] == ["1.0.2", "1.0.3"]
+        # Contents of pruned snapshots only are collected
+        assert len(_objects(store)) == 4
+
+        tight = SnapshotStore(deploy_root, max_bytes=1)
+        tight.prune()
+        assert [s.version for s in tight.list()] == ["1.0.3"]
+
+    def test_incomplete_snapshot_refused(self, deploy_root):
+        store = SnapshotStore(deploy_root)
+        snap = store.create("1.0.0")
+        _write(deploy_root / "core" / "a.py", "a2", age=1)
+        for obj in _objects(store):
+            obj.unlink()
+
+        with pytest.raises(SnapshotError):
+            store.rollback(snap.id)
+        assert (deploy_root / "core" / "a.py").read_text(encoding="utf-8") == "a2"
+
+    def test_unknown_snapshot(self, deploy_root):
+        with pytest.raises(SnapshotError):
+            SnapshotStore(deploy_root).rollback()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for startup profiling.
+
+Tests core/startup_profile.py (CHG-20261016-017) including:
+- --profile-startup is consumed before the entry point's argparse
+- First imports are timed (self vs cumulative), repeat imports are not
+- Milestones record their first occurrence and hooks are no-ops when off
+- Report is written once, and drive modules are charged the throttle
+- Benchmark harness flags regressions beyond tolerance only
+"""
+
+import builtins
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core import startup_profile
+from core.startup_profile import PROFILE_FLAG, enable_from_argv, finish, mark_once, parse_throttle
+
+
+@pytest.fixture
+def modules_dir(tmp_path, monkeypatch):
+    """Two throwaway modules, outer importing inner."""
+    pkg = tmp_path / "drive"
+    pkg.mkdir()
+    (pkg / "sp_inner.py").write_text("import time\ntime.sleep(0.02)\n", encoding="utf-8")
+    (pkg / "sp_outer.py").write_text("import sp_inner\nimport time\ntime.sleep(0.01)\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(pkg))
+    yield tmp_path
+    for name in ("sp_inner", "sp_outer"):
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture(autouse=True)
+def no_active_profiler(monkeypatch):
+    monkeypatch.delenv(startup_profile.ENV_THROTTLE, raising=False)
+    monkeypatch.delenv(startup_profile.ENV_EXIT, raising=False)
+    monkeypatch.delenv(startup_profile.ENV_REPORT, raising=False)
+    original = builtins.__import__
+    yield
+    if startup_profile._active is not None:
+        startup_profile._active.stop()
+        startup_profile._active = None
+    builtins.__import__ = original
+
+
+class TestProfiler:
+    def test_flag_consumed_and_disabled_by_default(self, tmp_path):
+        argv = ["gui_launcher.py", "--config", "x.json"]
+        assert enable_from_argv("gui", tmp_path, argv) is None
+        mark_once("first_tr")  # No-op
+        assert finish("first_window") is None
+
+        argv = ["gui_launcher.py", PROFILE_FLAG, "--config", "x.json"]
+        assert enable_from_argv("gui", tmp_path, argv) is not None
+        assert argv == ["gui_launcher.py", "--config", "x.json"]
+
+    def test_imports_and_milestones_reported(self, modules_dir, tmp_path):
+        profiler = enable_from_argv("mount", tmp_path, ["mount.py", PROFILE_FLAG])
+        import sp_outer  # noqa: F401
+
+        __import__("sp_inner")  # Already loaded by sp_outer: not timed again
+
+        mark_once("first_config_load")
+        first = profiler.milestones["first_config_load"]
+        mark_once("first_config_load")
+        assert profiler.milestones["first_config_load"] == first
+
+        path = finish("credentials_prompt")
+        assert finish("credentials_prompt") is None
+        assert path.parent == tmp_path / ".smartdrive" / "logs" and path.name.startswith("startup-mount-")
+
+        report = json.loads(path.read_text(encoding="utf-8"))
+        imports = {i["module"]: i for i in report["imports"]}
+        assert imports["sp_inner"]["self_ms"] >= 15
+        assert imports["sp_outer"]["cumulative_ms"] >= imports["sp_inner"]["cumulative_ms"] + 5
+        assert imports["sp_outer"]["self_ms"] < imports["sp_outer"]["cumulative_ms"] - 15
+        assert set(report["milestones"]) == {"first_config_load", "credentials_prompt"}
+        assert builtins.__import__ is profiler._original_import
+
+    def test_throttle_charges_drive_modules(self, modules_dir, monkeypatch):
+        monkeypatch.setenv(startup_profile.ENV_THROTTLE, "30,0")
+        profiler = startup_profile.enable("gui", modules_dir)
+        import json as _json  # noqa: F401  (not on the drive)
+
+        import sp_outer  # noqa: F401
+
+        profiler.stop()
+        assert 55 <= profiler.throttled_ms < 120  # Two drive modules at 30 ms each
+
+    def test_parse_throttle(self):
+        assert parse_throttle("4,20") == {"latency_ms": 4.0, "mb_per_s": 20.0}
+        assert parse_throttle("2") == {"latency_ms": 2.0, "mb_per_s": 0.0}
+        assert parse_throttle("fast") is None
+        assert parse_throttle("") is None
+
+
+class TestBenchHarness:
+    @pytest.fixture
+    def bench(self):
+        spec = importlib.util.spec_from_file_location("startup_bench", _smartdrive_root / "tools" / "startup_bench.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_compare_flags_only_real_regressions(self, bench):
+        baseline = {"wall_ms": 1000.0, "first_window": 600.0, "first_tr": 20.0}
+        current = {"wall_ms": 1100.0, "first_window": 800.0, "first_tr": 40.0, "new_metric": 5.0}
+        regressions = bench.compare(current, baseline, tolerance=0.15)
+        assert len(regressions) == 1 and regressions[0].startswith("first_window")
+
+    def test_baseline_round_trip(self, bench, tmp_path):
+        path = tmp_path / "logs" / "startup_baseline.json"
+        bench.save_baseline(path, {"cli@usb2": {"wall_ms": 250.0}})
+        assert bench.load_baseline(path) == {"cli@usb2": {"wall_ms": 250.0}}
+        path.write_text('{"schema_version": 99}', encoding="utf-8")
+        assert bench.load_baseline(path) == {}
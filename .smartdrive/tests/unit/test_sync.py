@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for manifest-driven incremental sync.
+
+Tests core/sync.py (CHG-20261016-011) including:
+- First sync copies everything and writes the manifest
+- Unchanged targets are trusted from the manifest without being read
+- Changed sources update, orphans are pruned, protected files survive
+- Targets edited behind the manifest's back are re-hashed
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core import sync
+from core.sync import (
+    ACTION_COPY,
+    ACTION_DELETE,
+    ACTION_SKIP,
+    ACTION_UPDATE,
+    apply_sync,
+    has_manifest,
+    plan_sync,
+)
+
+_OLD_NS = 1_600_000_000 * 10**9  # Well outside the racy window
+
+
+def _write(path: Path, data: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data, encoding="utf-8")
+    os.utime(path, ns=(_OLD_NS, _OLD_NS))
+    return path
+
+
+@pytest.fixture
+def src(tmp_path):
+    root = tmp_path / "src"
+    return {
+        "core/a.py": _write(root / "a.py", "a"),
+        "core/b.py": _write(root / "b.py", "b"),
+        "scripts/gui.py": _write(root / "gui.py", "gui"),
+    }
+
+
+def _actions(plan):
+    return {a.rel: a.action for a in plan.actions}
+
+
+class TestSync:
+    def test_first_sync_copies_all(self, src, tmp_path):
+        target = tmp_path / "drive"
+        plan = plan_sync(src, target)
+        assert set(_actions(plan).values()) == {ACTION_COPY}
+
+        result = apply_sync(plan)
+        assert sorted(result.copied) == sorted(src)
+        assert (target / "scripts/gui.py").read_text(encoding="utf-8") == "gui"
+        assert has_manifest(target)
+
+    def test_unchanged_targets_not_read(self, src, tmp_path):
+        target = tmp_path / "drive"
+        apply_sync(plan_sync(src, target))
+
+        real_sha = sync.sha256_file
+        read = []
+
+        def spy(path):
+            read.append(Path(path))
+            return real_sha(path)
+
+        with patch.object(sync, "sha256_file", side_effect=spy):
+            plan = plan_sync(src, target)
+
+        assert set(_actions(plan).values()) == {ACTION_SKIP}
+        assert plan.target_hashed == 0
+        assert not any(target in p.parents for p in read)
+
+    def test_update_and_prune(self, src, tmp_path):
+        target = tmp_path / "drive"
+        apply_sync(plan_sync(src, target))
+        _write(target / "keys" / "keyfile.vc.gpg", "user data")
+
+        _write(src["core/a.py"], "a2")
+        del src["core/b.py"]
+        plan = plan_sync(src, target, prune=["core/"])
+        assert _actions(plan) == {
+            "core/a.py": ACTION_UPDATE,
+            "core/b.py": ACTION_DELETE,
+            "scripts/gui.py": ACTION_SKIP,
+        }
+
+        apply_sync(plan)
+        assert (target / "core/a.py").read_text(encoding="utf-8") == "a2"
+        assert not (target / "core/b.py").exists()
+        assert (target / "keys" / "keyfile.vc.gpg").exists()
+
+    def test_prune_scope_limits_deletes(self, src, tmp_path):
+        target = tmp_path / "drive"
+        apply_sync(plan_sync(src, target))
+        del src["scripts/gui.py"]
+
+        plan = plan_sync(src, target, prune=["core/"])
+        assert "scripts/gui.py" not in _actions(plan)
+
+        # Entry outside the scope is kept, so a later full sync still prunes it
+        apply_sync(plan)
+        assert _actions(plan_sync(src, target))["scripts/gui.py"] == ACTION_DELETE
+
+    def test_target_edited_behind_manifest(self, src, tmp_path):
+        target = tmp_path / "drive"
+        apply_sync(plan_sync(src, target))
+
+        (target / "core/a.py").write_text("tampered", encoding="utf-8")
+        plan = plan_sync(src, target)
+        assert _actions(plan)["core/a.py"] == ACTION_UPDATE
+        assert plan.target_hashed == 1
+
+    def test_racy_entries_rehashed(self, src, tmp_path):
+        target = tmp_path / "drive"
+        # copyfile gives the targets a fresh mtime, inside the FAT window of the manifest write
+        apply_sync(plan_sync(src, target), copy=shutil.copyfile)
+
+        plan = plan_sync(src, target)
+        assert set(_actions(plan).values()) == {ACTION_SKIP}
+        assert plan.target_hashed == len(src)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent tool discovery cache.
+
+CHG-20261016-023: Tool paths and probe results persist across processes,
+keyed by host and validated by the executable's size and mtime.
+"""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+sys.path.insert(0, str(_smartdrive_root))
+
+from core import tool_cache
+from core.tool_cache import ToolCache
+
+
+@pytest.fixture
+def tool_dir(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    exe = bin_dir / "vctool"
+    exe.write_text("#!/bin/sh\n")
+    exe.chmod(exe.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    return bin_dir
+
+
+@pytest.fixture
+def which_calls(monkeypatch):
+    calls = []
+    real_which = tool_cache.shutil.which
+
+    def counting_which(name, *args, **kwargs):
+        calls.append(name)
+        return real_which(name, *args, **kwargs)
+
+    monkeypatch.setattr(tool_cache.shutil, "which", counting_which)
+    return calls
+
+
+class TestWhich:
+    def test_resolved_path_persists_across_instances(self, tmp_path, tool_dir, which_calls):
+        cache_file = tmp_path / "cache.json"
+        assert ToolCache(cache_file).which("vctool") == tool_dir / "vctool"
+        assert which_calls == ["vctool"]
+
+        # A fresh process (new instance) only stats the cached executable
+        assert ToolCache(cache_file).which("vctool") == tool_dir / "vctool"
+        assert which_calls == ["vctool"]
+
+    def test_missing_tools_are_not_cached(self, tmp_path, tool_dir, which_calls):
+        cache = ToolCache(tmp_path / "cache.json")
+        assert cache.which("nope") is None
+        assert cache.which("nope") is None
+        assert which_calls == ["nope", "nope"]
+
+    def test_fallback_locations_are_used_after_path(self, tmp_path, tool_dir):
+        installed = tmp_path / "VeraCrypt.exe"
+        installed.write_text("")
+        cache = ToolCache(tmp_path / "cache.json")
+        assert cache.which("veracrypt", fallbacks=lambda: [tmp_path / "missing", installed]) == installed
+
+    def test_entries_are_scoped_to_host_and_path(self, tmp_path, tool_dir, monkeypatch, which_calls):
+        cache_file = tmp_path / "cache.json"
+        ToolCache(cache_file).which("vctool")
+
+        monkeypatch.setenv("PATH", str(tool_dir) + os.pathsep + str(tmp_path))
+        ToolCache(cache_file).which("vctool")
+        assert which_calls == ["vctool", "vctool"]
+        assert len(json.loads(cache_file.read_text())["hosts"]) == 2
+
+
+class TestUntrustedCacheFile:
+    """The cache file lives on the drive; it must not be able to pick an executable."""
+
+    def _tamper(self, cache_file, path):
+        doc = json.loads(cache_file.read_text())
+        for host in doc["hosts"].values():
+            host["tools"]["vctool"] = str(path)
+        cache_file.write_text(json.dumps(doc))
+
+    def _evil(self, directory, name="vctool"):
+        directory.mkdir(parents=True, exist_ok=True)
+        evil = directory / name
+        evil.write_text("#!/bin/sh\n")
+        evil.chmod(evil.stat().st_mode | stat.S_IXUSR)
+        return evil
+
+    def test_path_outside_path_dirs_is_re_resolved(self, tmp_path, tool_dir):
+        cache_file = tmp_path / "cache.json"
+        ToolCache(cache_file).which("vctool")
+        self._tamper(cache_file, self._evil(tmp_path / "elsewhere"))
+        assert ToolCache(cache_file).which("vctool") == tool_dir / "vctool"
+
+    def test_other_binary_in_path_dir_is_rejected(self, tmp_path, tool_dir):
+        cache_file = tmp_path / "cache.json"
+        ToolCache(cache_file).which("vctool")
+        self._tamper(cache_file, self._evil(tool_dir, "other"))
+        assert ToolCache(cache_file).which("vctool") == tool_dir / "vctool"
+
+    def test_relative_and_on_drive_paths_are_rejected(self, tmp_path, tool_dir, monkeypatch):
+        cache_file = tmp_path / "cache.json"
+        ToolCache(cache_file).which("vctool")
+        self._tamper(cache_file, "bin/vctool")
+        assert ToolCache(cache_file).which("vctool") == tool_dir / "vctool"
+
+        # A PATH directory on the drive itself does not make a cached path trusted
+        monkeypatch.setattr(tool_cache, "_DRIVE_ROOT", tmp_path)
+        assert not ToolCache._trusted_location("vctool", str(tool_dir / "vctool"), [])
+
+
+class TestExecutableData:
+    def test_data_survives_until_executable_changes(self, tmp_path, tool_dir):
+        cache_file = tmp_path / "cache.json"
+        exe = ToolCache(cache_file).which("vctool")
+        ToolCache(cache_file).set_data(exe, "capabilities", {"mount": True})
+        assert ToolCache(cache_file).get_data(exe, "capabilities") == {"mount": True}
+
+        # Upgrading the binary changes size/mtime: the stored probe is stale
+        exe.write_text("#!/bin/sh\n# new version\n")
+        assert ToolCache(cache_file).get_data(exe, "capabilities") is None
+
+    def test_unknown_executable_has_no_data(self, tmp_path):
+        cache = ToolCache(tmp_path / "cache.json")
+        assert cache.get_data(None, "version") is None
+        assert cache.get_data(tmp_path / "absent", "version") is None
+
+    def test_corrupt_or_foreign_file_is_ignored(self, tmp_path, tool_dir):
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text("{not json")
+        assert ToolCache(cache_file).which("vctool") == tool_dir / "vctool"
+
+        cache_file.write_text(json.dumps({"version": 999, "hosts": {"x": {}}}))
+        ToolCache(cache_file).which("vctool")
+        assert json.loads(cache_file.read_text())["version"] == tool_cache.CACHE_FORMAT_VERSION
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for delta update packages.
+
+Tests core/update_delta.py (CHG-20261016-010) including:
+- Check URL derivation from the "latest" download URL
+- Metadata validation (schema, unsafe paths)
+- Base/payload verification before applying
+- Deletions honour protected paths
+- Package arcnames (".smartdrive/...") map onto the deployment root
+"""
+
+import hashlib
+import json
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core.update_delta import (
+    DELTA_META_NAME,
+    DELTA_SCHEMA_VERSION,
+    apply_deletions,
+    check_url_for,
+    deploy_path,
+    load_delta_meta,
+    verify_delta,
+)
+from core.zipstream import extract_archive
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write(root: Path, rel: str, data: bytes) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+@pytest.fixture
+def delta(tmp_path):
+    """Drive at 1.0.0 and an extracted 1.0.0 -> 1.0.1 delta."""
+    deploy_root = tmp_path / "drive"
+    payload_dir = tmp_path / "payload"
+    _write(deploy_root, "scripts/keep.py", b"keep")
+    _write(deploy_root, "scripts/change.py", b"old")
+    _write(deploy_root, "scripts/gone.py", b"gone")
+    _write(payload_dir, "scripts/change.py", b"new")
+
+    meta = {
+        "schema_version": DELTA_SCHEMA_VERSION,
+        "from_version": "1.0.0",
+        "to_version": "1.0.1",
+        "base": {"scripts/keep.py": _sha(b"keep")},
+        "files": {"scripts/change.py": _sha(b"new")},
+        "delete": ["scripts/gone.py", "keys/secret.bin"],
+    }
+    (payload_dir / DELTA_META_NAME).write_text(json.dumps(meta), encoding="utf-8")
+    return deploy_root, payload_dir
+
+
+class TestCheckUrl:
+    def test_derived_from_latest(self):
+        url = "https://example.com/api/update/download/latest"
+        assert check_url_for(url, "1.2.3") == "https://example.com/api/update/check/1.2.3"
+
+    def test_other_urls_not_derived(self):
+        assert check_url_for("https://example.com/files/update.zip", "1.2.3") is None
+
+
+class TestDeltaMeta:
+    def test_load_and_verify(self, delta):
+        deploy_root, payload_dir = delta
+        meta = load_delta_meta(payload_dir)
+        assert verify_delta(meta, payload_dir, deploy_root) == []
+
+    def test_modified_base_rejected(self, delta):
+        deploy_root, payload_dir = delta
+        _write(deploy_root, "scripts/keep.py", b"locally edited")
+        problems = verify_delta(load_delta_meta(payload_dir), payload_dir, deploy_root)
+        assert problems == ["base file differs: scripts/keep.py"]
+
+    def test_corrupt_payload_rejected(self, delta):
+        deploy_root, payload_dir = delta
+        _write(payload_dir, "scripts/change.py", b"truncated")
+        problems = verify_delta(load_delta_meta(payload_dir), payload_dir, deploy_root)
+        assert problems == ["payload file corrupt: scripts/change.py"]
+
+    def test_unsafe_path_rejected(self, delta):
+        _, payload_dir = delta
+        meta = json.loads((payload_dir / DELTA_META_NAME).read_text(encoding="utf-8"))
+        meta["delete"].append("../outside.txt")
+        (payload_dir / DELTA_META_NAME).write_text(json.dumps(meta), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_delta_meta(payload_dir)
+
+    def test_deletions_skip_protected(self, delta):
+        deploy_root, payload_dir = delta
+        _write(deploy_root, "keys/secret.bin", b"key")
+        removed = apply_deletions(load_delta_meta(payload_dir), deploy_root, {"keys"})
+        assert removed == 1
+        assert not (deploy_root / "scripts/gone.py").exists()
+        assert (deploy_root / "keys/secret.bin").exists()
+
+
+class TestPackageLayout:
+    """Deltas as built by .keydriveserver/tools/create_update_package.py."""
+
+    def test_package_arcnames_map_onto_deploy_root(self, tmp_path):
+        deploy_root = tmp_path / "DRIVE" / ".smartdrive"
+        assert deploy_path(deploy_root, ".smartdrive/scripts/gui.py") == deploy_root / "scripts/gui.py"
+        assert deploy_path(deploy_root, "scripts/gui.py") == deploy_root / "scripts/gui.py"
+        assert deploy_path(deploy_root, "README.md") == deploy_root / "README.md"
+
+    def test_real_package_verifies_and_deletes_on_drive(self, tmp_path):
+        deploy_root = tmp_path / "DRIVE" / ".smartdrive"
+        _write(deploy_root, "scripts/keep.py", b"keep")
+        _write(deploy_root, "scripts/change.py", b"old")
+        _write(deploy_root, "core/gone.py", b"gone")
+        _write(deploy_root, "README.md", b"readme")
+
+        archive = tmp_path / "keydrive-delta-1.0.0-to-1.0.1.zip"
+        meta = {
+            "schema_version": DELTA_SCHEMA_VERSION,
+            "from_version": "1.0.0",
+            "to_version": "1.0.1",
+            "base": {".smartdrive/scripts/keep.py": _sha(b"keep"), "README.md": _sha(b"readme")},
+            "files": {".smartdrive/scripts/change.py": _sha(b"new")},
+            "delete": [".smartdrive/core/gone.py"],
+        }
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr(".smartdrive/scripts/change.py", b"new")
+            zf.writestr(DELTA_META_NAME, json.dumps(meta))
+
+        payload_dir = tmp_path / "payload"
+        result = extract_archive(archive, payload_dir)
+        loaded = load_delta_meta(payload_dir)
+        assert verify_delta(loaded, payload_dir, deploy_root, result.digests) == []
+
+        _write(deploy_root, "scripts/keep.py", b"locally edited")
+        problems = verify_delta(loaded, payload_dir, deploy_root, result.digests)
+        assert problems == ["base file differs: .smartdrive/scripts/keep.py"]
+
+        assert apply_deletions(loaded, deploy_root) == 1
+        assert not (deploy_root / "core/gone.py").exists()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for filtering, verifying update archive extraction.
+
+Tests core/zipstream.py (CHG-20261016-013) including:
+- Excluded members are never written
+- Streaming extraction from a non-seekable source (with data descriptors)
+- CRC corruption and zip-slip paths are rejected
+"""
+
+import hashlib
+import io
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+# Add .smartdrive to path for imports
+_test_dir = Path(__file__).resolve().parent
+_smartdrive_root = _test_dir.parent.parent  # tests/unit -> tests -> .smartdrive
+
+if str(_smartdrive_root) not in sys.path:
+    sys.path.insert(0, str(_smartdrive_root))
+
+from core.zipstream import ZipStreamError, extract_archive, extract_stream
+
+MEMBERS = {
+    ".smartdrive/scripts/gui.py": b"print('gui')\n" * 500,
+    ".smartdrive/static/logo.bin": os.urandom(200_000),
+    ".smartdrive/core/__pycache__/x.pyc": b"bytecode",
+    "README.md": b"# readme\n",
+}
+
+
+def _exclude(name):
+    return "__pycache__" in name.split("/")
+
+
+class _Unseekable(io.RawIOBase):
+    """Write-only or read-only stream without seek/tell (forces data descriptors)."""
+
+    def __init__(self, data=b""):
+        self._buf = io.BytesIO(data)
+
+    def writable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def write(self, b):
+        return self._buf.write(b)
+
+    def read(self, n=-1):
+        return self._buf.read(n)
+
+    def getvalue(self):
+        return self._buf.getvalue()
+
+
+def _zip_bytes(members, seekable=True, compression=zipfile.ZIP_DEFLATED):
+    out = io.BytesIO() if seekable else _Unseekable()
+    with zipfile.ZipFile(out, "w", compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return out.getvalue()
+
+
+def _check_payload(result, dest):
+    assert result.files == 3
+    assert result.excluded == 1
+    assert not (dest / ".smartdrive/core/__pycache__").exists()
+    for name, data in MEMBERS.items():
+        if not _exclude(name):
+            assert (dest / name).read_bytes() == data
+            assert result.digests[name] == hashlib.sha256(data).hexdigest()
+
+
+class TestExtractArchive:
+    def test_filtered_extraction(self, tmp_path):
+        archive = tmp_path / "update.zip"
+        archive.write_bytes(_zip_bytes(MEMBERS))
+        result = extract_archive(archive, tmp_path / "payload", _exclude)
+        _check_payload(result, tmp_path / "payload")
+
+    def test_crc_mismatch_rejected(self, tmp_path):
+        data = bytearray(_zip_bytes({"a.txt": b"A" * 1000}, compression=zipfile.ZIP_STORED))
+        data[data.index(b"AAAA")] = ord("B")
+        archive = tmp_path / "update.zip"
+        archive.write_bytes(bytes(data))
+        with pytest.raises(ZipStreamError):
+            extract_archive(archive, tmp_path / "payload")
+
+    def test_zip_slip_rejected(self, tmp_path):
+        archive = tmp_path / "update.zip"
+        archive.write_bytes(_zip_bytes({"../evil.txt": b"x"}))
+        with pytest.raises(ZipStreamError):
+            extract_archive(archive, tmp_path / "payload")
+        assert not (tmp_path / "evil.txt").exists()
+
+
+class TestExtractStream:
+    @pytest.mark.parametrize("seekable", [True, False], ids=["sizes-in-header", "data-descriptors"])
+    def test_stream_matches_archive(self, tmp_path, seekable):
+        stream = _Unseekable(_zip_bytes(MEMBERS, seekable=seekable))
+        result = extract_stream(stream, tmp_path / "payload", _exclude)
+        _check_payload(result, tmp_path / "payload")
+
+    def test_stored_members(self, tmp_path):
+        stream = _Unseekable(_zip_bytes(MEMBERS, compression=zipfile.ZIP_STORED))
+        _check_payload(extract_stream(stream, tmp_path / "payload", _exclude), tmp_path / "payload")
+
+    def test_corrupt_stream_rejected(self, tmp_path):
+        data = bytearray(_zip_bytes({"a.txt": b"A" * 1000}, compression=zipfile.ZIP_STORED))
+        data[data.index(b"AAAA")] = ord("B")
+        with pytest.raises(ZipStreamError):
+            extract_stream(_Unseekable(bytes(data)), tmp_path / "payload")
+
+    def test_truncated_stream_rejected(self, tmp_path):
+        data = _zip_bytes(MEMBERS)
+        with pytest.raises(ZipStreamError):
+            extract_stream(_Unseekable(data[: len(data) // 2]), tmp_path / "payload")
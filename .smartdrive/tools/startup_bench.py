@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+SmartDrive startup benchmark (CHG-20261016-017).
+
+Runs the entry points with --profile-startup against a simulated slow drive
+and compares the medians with a stored baseline.
+
+Each run is a fresh interpreter: the entry point imports, loads its config
+and exits as soon as it reaches its ready milestone (first window, first
+menu, mount credentials prompt - nothing is mounted and no secret is read).
+Modules loaded from the drive are charged the throttle profile's latency and
+bandwidth (see core/startup_profile.py), which approximates a USB stick
+without needing one.
+
+Usage:
+    python tools/startup_bench.py                         # all entries, usb2 profile
+    python tools/startup_bench.py --entry gui --runs 7 --throttle usb3
+    python tools/startup_bench.py --throttle 8,12         # custom latency_ms,MB/s
+    python tools/startup_bench.py --update-baseline       # store the medians
+
+Exit code 1 if any entry regressed beyond --tolerance (or a run failed).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_DEPLOY_ROOT = Path(__file__).resolve().parent.parent  # tools/ -> .smartdrive/
+if str(_DEPLOY_ROOT) not in sys.path:
+    sys.path.insert(0, str(_DEPLOY_ROOT))
+
+from core.config import write_file_atomic
+from core.paths import Paths
+from core.startup_profile import ENV_EXIT, ENV_REPORT, ENV_THROTTLE, PROFILE_FLAG
+
+# entry -> (script relative to the deploy root, extra arguments)
+ENTRIES = {
+    "gui": ("scripts/gui_launcher.py", []),
+    "cli": ("scripts/smartdrive.py", []),
+    "mount": ("scripts/mount.py", ["--gui"]),
+}
+
+# Throttle profiles: "<latency_ms>,<MB/s>" per module file read from the drive
+THROTTLE_PROFILES = {
+    "none": "",
+    "usb3": "1,80",
+    "usb2": "4,20",
+    "slow": "12,6",
+}
+
+BASELINE_SCHEMA_VERSION = 1
+
+# Ignore differences below this many milliseconds (timer noise on fast entries)
+MIN_REGRESSION_MS = 25.0
+
+
+def run_once(deploy_root: Path, entry: str, throttle: str, timeout: float) -> dict:
+    """Run one entry point to its ready milestone and return its report (plus wall_ms)."""
+    script, extra = ENTRIES[entry]
+    with tempfile.TemporaryDirectory(prefix="smartdrive-bench-") as tmp:
+        report_path = Path(tmp) / "report.json"
+        env = dict(os.environ)
+        env[ENV_REPORT] = str(report_path)
+        env[ENV_EXIT] = "1"
+        env[ENV_THROTTLE] = throttle
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        env["PYTHONDONTWRITEBYTECODE"] = "1"  # Cold-start numbers, no __pycache__ on the drive
+
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, str(deploy_root / script), PROFILE_FLAG, *extra],
+            cwd=deploy_root / "scripts",
+            env=env,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+        if not report_path.exists():
+            tail = (result.stderr or result.stdout).strip()[-400:]
+            raise RuntimeError(f"{entry}: no startup report (exit code {result.returncode})\n{tail}")
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+    report["wall_ms"] = round(wall_ms, 3)
+    return report
+
+
+def summarize(reports: List[dict]) -> Dict[str, float]:
+    """Median wall time, profiled time and milestones over several runs."""
+    summary = {
+        "wall_ms": statistics.median(r["wall_ms"] for r in reports),
+        "total_ms": statistics.median(r["total_ms"] for r in reports),
+        "import_ms": statistics.median(r["import_ms"] for r in reports),
+    }
+    milestones = set().union(*(r["milestones"] for r in reports))
+    for name in sorted(milestones):
+        values = [r["milestones"][name] for r in reports if name in r["milestones"]]
+        summary[name] = statistics.median(values)
+    return {k: round(v, 1) for k, v in summary.items()}
+
+
+def compare(current: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Metrics that got slower than baseline * (1 + tolerance) by more than MIN_REGRESSION_MS."""
+    regressions = []
+    for metric, value in current.items():
+        base = baseline.get(metric)
+        if base is None:
+            continue
+        if value > base * (1 + tolerance) and value - base > MIN_REGRESSION_MS:
+            regressions.append(
+                f"{metric}: {base:.0f} -> {value:.0f} ms (+{(value / base - 1) * 100 if base else 0:.0f}%)"
+            )
+    return regressions
+
+
+def load_baseline(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("schema_version") != BASELINE_SCHEMA_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_baseline(path: Path, entries: dict) -> None:
+    data = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "python": sys.version.split()[0],
+        "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "entries": entries,
+    }
+    write_file_atomic(path, json.dumps(data, indent=1, sort_keys=True))
+
+
+def _top_imports(report: dict, count: int = 8) -> str:
+    return ", ".join(
+        f"{i['module']} {i['self_ms']:.0f}ms" for i in sorted(report["imports"], key=lambda i: -i["self_ms"])[:count]
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SmartDrive startup against stored baselines")
+    parser.add_argument(
+        "--entry", action="append", choices=sorted(ENTRIES), help="Entry point (repeatable; default all)"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Runs per entry (median is compared)")
+    parser.add_argument(
+        "--throttle", default="usb2", help=f"Profile ({', '.join(THROTTLE_PROFILES)}) or latency_ms,MB/s"
+    )
+    parser.add_argument("--root", type=Path, default=_DEPLOY_ROOT, help="Deploy root (.smartdrive) to benchmark")
+    parser.add_argument("--baseline", type=Path, help="Baseline file (default: logs/startup_baseline.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run's medians as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed slowdown (0.15 = 15%%)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds per run")
+    args = parser.parse_args(argv)
+
+    deploy_root = args.root.resolve()
+    throttle = THROTTLE_PROFILES.get(args.throttle, args.throttle)
+    baseline_path = args.baseline or Paths.logs_dir(deploy_root.parent) / "startup_baseline.json"
+    baseline = load_baseline(baseline_path)
+    entries = args.entry or sorted(ENTRIES)
+
+    failed = False
+    results = dict(baseline)
+    for entry in entries:
+        key = f"{entry}@{args.throttle}"
+        try:
+            reports = [run_once(deploy_root, entry, throttle, args.timeout) for _ in range(args.runs)]
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"[FAIL] {e}")
+            failed = True
+            continue
+
+        summary = summarize(reports)
+        results[key] = summary
+        print(f"\n{key}  ({args.runs} runs, bytecode bundle: {reports[-1]['bytecode_bundle']})")
+        for metric, value in summary.items():
+            base = baseline.get(key, {}).get(metric)
+            delta = f"  (baseline {base:.0f})" if base is not None else ""
+            print(f"  {metric:<22} {value:>9.1f} ms{delta}")
+        print(f"  slowest imports: {_top_imports(reports[-1])}")
+
+        if key in baseline and not args.update_baseline:
+            regressions = compare(summary, baseline[key], args.tolerance)
+            for line in regressions:
+                print(f"  [REGRESSION] {line}")
+            failed = failed or bool(regressions)
+
+    if args.update_baseline:
+        save_baseline(baseline_path, results)
+        print(f"\nBaseline written: {baseline_path}")
+    elif not baseline:
+        print(f"\nNo baseline at {baseline_path} (run with --update-baseline to store one)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())